@@ -0,0 +1,71 @@
+"""
+Endpoints de exportación masiva (ver app/core/export.py)
+
+    GET /export/invoices?format=ndjson|csv|parquet&from_date=&to_date=&status=&customer_id=
+    GET /export/orders?format=...   (pedidos con sus líneas)
+
+La respuesta se envía con transferencia por trozos (chunked) a medida que se
+leen las filas. La lectura usa el engine síncrono en el threadpool de
+Starlette, también con DATABASE_ASYNC: es un proceso por lotes y no debe
+ocupar el event loop.
+"""
+
+import importlib.util
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.core.database import engine
+from app.core.export import MEDIA_TYPES, export_chunks
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+FORMAT_PATTERN = "^(" + "|".join(MEDIA_TYPES) + ")$"
+
+
+def parse_date(value: Optional[str], name: str):
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Fecha inválida en {name}: {value}")
+
+
+def export_response(entity, file_format, from_date, to_date, status, customer_id):
+    if file_format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise HTTPException(status_code=501, detail="Exportación Parquet no disponible (falta pyarrow)")
+    chunks = export_chunks(
+        engine, entity, file_format,
+        from_date=parse_date(from_date, "from_date"), to_date=parse_date(to_date, "to_date"),
+        status=status, customer_id=customer_id,
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{file_format}"'},
+    )
+
+
+@router.get("/invoices")
+async def export_invoices(
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN),
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    status: Optional[str] = None,
+    customer_id: Optional[int] = None,
+):
+    """Exportar facturas (mismos filtros que la consulta invoices)"""
+    return export_response("invoices", format, from_date, to_date, status, customer_id)
+
+
+@router.get("/orders")
+async def export_orders(
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN),
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    status: Optional[str] = None,
+    customer_id: Optional[int] = None,
+):
+    """Exportar pedidos con sus líneas (mismos filtros que la consulta orders)"""
+    return export_response("orders", format, from_date, to_date, status, customer_id)
@@ -0,0 +1,444 @@
+"""
+Endpoint GraphQL con persisted queries automáticas (APQ) y cache de documentos
+
+Cada consulta se identifica por el SHA-256 de su texto. Los documentos ya
+parseados y validados se guardan en un LRU del proceso indexado por ese hash,
+así que una consulta repetida sólo se ejecuta.
+
+Con APQ el cliente envía únicamente el hash en
+``extensions.persistedQuery.sha256Hash``; si el servidor no lo conoce responde
+PersistedQueryNotFound y el cliente repite la petición con hash y texto, que
+se guarda en Redis para el resto de workers.
+
+Antes de ejecutar se calcula el coste de la operación (app/schemas/cost.py):
+las consultas demasiado profundas o caras se rechazan y el resto se descuenta
+del presupuesto del cliente (token bucket por API key en Redis). El coste se
+devuelve en ``extensions.cost`` de la respuesta.
+
+Con METRICS_ENABLED se mide la ejecución de cada operación y de los resolvers
+propios del schema (app/core/metrics.py).
+
+Las consultas (nunca las mutaciones) se aceptan también por GET, con los
+mismos campos en la query string (``variables`` y ``extensions`` en JSON),
+de modo que un CDN o un proxy inverso puede cachearlas. Si la operación
+tiene política de cache (app/schemas/cache_policy.py), la respuesta completa
+se guarda en Redis con las etiquetas de las entidades que toca, indexada por
+el documento normalizado, las variables y el ámbito del cliente (su API
+key), y se devuelve con ``ETag`` (304 si coincide con ``If-None-Match``) y
+``Cache-Control`` (el menor TTL de esas entidades). Los aciertos (y los 304)
+no ejecutan nada y descuentan del presupuesto un coste fijo,
+GRAPHQL_CACHED_RESPONSE_COST. Un GET sin consulta muestra el playground.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import time
+from inspect import isawaitable
+from typing import Any, Dict, Optional
+from graphql import GraphQLError, OperationType, execute, parse, print_ast, validate
+from graphql.utilities import get_operation_ast
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette_graphene3 import GraphQLApp
+from app.core.cache import LocalCache
+from app.core.config import settings
+from app.core.metrics import instrument_schema, observe_operation
+from app.schemas.cache_policy import cache_policy
+from app.schemas.cost import analyze_query
+
+logger = logging.getLogger(__name__)
+
+# Prefijo de las consultas persistidas en Redis
+APQ_PREFIX = "apq:"
+
+APQ_VERSION = 1
+
+# Prefijo de las respuestas completas de las consultas por GET
+RESPONSE_PREFIX = "graphql_response:"
+
+
+def query_hash(query: str) -> str:
+    """SHA-256 (hex) del texto de una consulta, como en APQ"""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def auth_scope(request: Request) -> Optional[str]:
+    """Hash de la API key del cliente, o None si la petición es anónima"""
+    api_key = request.headers.get(settings.api_key_header)
+    if api_key:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:32]
+    return None
+
+
+def client_key(request: Request) -> str:
+    """Identificador del cliente para su presupuesto (API key o, si no hay, IP)"""
+    scope = auth_scope(request)
+    if scope:
+        return "key:" + scope
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+async def operation_from_body(request: Request):
+    """Operación (o lista de operaciones) del cuerpo JSON de un POST"""
+    content_type = request.headers.get("Content-Type", "").split(";")[0].strip()
+    if content_type != "application/json":
+        raise ValueError("Content-type must be application/json")
+    try:
+        operation = await request.json()
+    except (TypeError, ValueError):
+        raise ValueError("Request body is not a valid JSON")
+    if not isinstance(operation, (dict, list)):
+        raise ValueError("Request body must be a JSON object")
+    return operation
+
+
+def operation_from_query_params(params) -> Dict[str, Any]:
+    """Operación de una petición GET (variables y extensions en JSON)"""
+    operation: Dict[str, Any] = {"query": params.get("query"), "operationName": params.get("operationName")}
+    for name in ("variables", "extensions"):
+        value = params.get(name)
+        if value:
+            try:
+                operation[name] = json.loads(value)
+            except ValueError:
+                raise ValueError(f"'{name}' must be a valid JSON")
+    return operation
+
+
+def response_key(document_hash: str, operation_name: Optional[str], variables, scope: Optional[str]) -> str:
+    """Clave de una respuesta: documento normalizado, operación, variables y ámbito"""
+    material = json.dumps([document_hash, operation_name, variables or {}, scope], sort_keys=True, separators=(",", ":"))
+    return RESPONSE_PREFIX + query_hash(material)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Si la cabecera If-None-Match incluye etag (comparación débil, RFC 9110)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class PersistedQueryError(Exception):
+    """Error del protocolo APQ (se devuelve al cliente con su código)"""
+
+    def __init__(self, message: str, code: str, status_code: int = 200):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.status_code = status_code
+
+    def response(self) -> JSONResponse:
+        return JSONResponse(
+            {"errors": [{"message": self.message, "extensions": {"code": self.code}}]},
+            status_code=self.status_code
+        )
+
+
+class UncachedResponse(Exception):
+    """Respuesta de una consulta por GET que no se guarda (errores o rechazo por coste)"""
+
+    def __init__(self, response: Response):
+        super().__init__()
+        self.response = response
+
+
+class CachedGraphQLApp(GraphQLApp):
+    """GraphQLApp que reutiliza documentos validados y admite APQ
+
+    ``schema`` puede ser el schema o una función que lo construye; en ese
+    caso se llama en el primer uso (p. ej. desde el lifespan de la aplicación).
+    """
+
+    def __init__(self, *args, document_cache_size: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        size = settings.graphql_document_cache_size if document_cache_size is None else document_cache_size
+        self.documents = LocalCache(max_items=size, ttl=settings.apq_ttl)
+        # (hash del documento normalizado, CachePolicy) de cada documento y operación
+        self.policies = LocalCache(max_items=size, ttl=settings.apq_ttl)
+
+    @property
+    def schema(self):
+        if callable(self._schema):
+            self._schema = self._schema()
+            instrument_schema(self._schema.graphql_schema)
+        return self._schema
+
+    @schema.setter
+    def schema(self, value):
+        if not callable(value):
+            instrument_schema(value.graphql_schema)
+        self._schema = value
+
+    def parse_and_validate(self, query: str):
+        """Devolver (documento, errores) de una consulta"""
+        try:
+            document = parse(query)
+        except GraphQLError as e:
+            return None, [e]
+        return document, validate(self.schema.graphql_schema, document)
+
+    @staticmethod
+    def _read_operation(operation: Dict[str, Any]):
+        """Obtener (hash, texto, es_apq) de la petición, comprobando el protocolo APQ"""
+        query = operation.get("query")
+        persisted = (operation.get("extensions") or {}).get("persistedQuery")
+
+        if not persisted:
+            if not isinstance(query, str):
+                raise PersistedQueryError("Must provide query string.", "BAD_REQUEST", 400)
+            return query_hash(query), query, False
+
+        if persisted.get("version") != APQ_VERSION:
+            raise PersistedQueryError("Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED", 400)
+        digest = persisted.get("sha256Hash")
+        if not isinstance(digest, str):
+            raise PersistedQueryError("Must provide sha256Hash", "BAD_REQUEST", 400)
+        if query is not None and query_hash(query) != digest:
+            raise PersistedQueryError("provided sha does not match query", "INVALID_SHA256", 400)
+        return digest, query, True
+
+    async def _load_query(self, digest: str, query: Optional[str], persisted: bool, cache_manager) -> str:
+        """Texto de una consulta que no está en el LRU (de Redis si sólo llegó el hash)"""
+        if query is None:
+            query = await cache_manager.get(f"{APQ_PREFIX}{digest}") if cache_manager else None
+            if query is None:
+                raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        elif persisted and cache_manager:
+            # Registro: el cliente envía el texto junto al hash
+            await cache_manager.set(f"{APQ_PREFIX}{digest}", query, ttl=settings.apq_ttl)
+        return query
+
+    def cache_policy(self, digest: str, document, operation_name: Optional[str]):
+        """(hash del documento normalizado, CachePolicy o None) de una operación"""
+        key = f"{digest}:{operation_name or ''}"
+        found, entry = self.policies.get(key)
+        if not found:
+            policy = cache_policy(self.schema.graphql_schema, document, operation_name)
+            entry = (query_hash(print_ast(document)), policy)
+            self.policies.set(key, entry)
+        return entry
+
+    async def _handle_http_request(self, request: Request) -> Response:
+        try:
+            operation = await operation_from_body(request)
+        except ValueError as e:
+            return JSONResponse({"errors": [e.args[0]]}, status_code=400)
+
+        if isinstance(operation, list):
+            return JSONResponse(
+                {"errors": ["This server does not support batching"]}, status_code=400
+            )
+
+        context_value = await self._get_context_value(request)
+        document, _, rejection = await self._get_document(operation, context_value)
+        if rejection is not None:
+            return rejection
+
+        outcome = await self._execute_operation(request, document, operation, context_value)
+        if isinstance(outcome, Response):
+            return outcome
+        result, extensions = outcome
+        return self._json_response(result.data, result.errors, context_value, extensions)
+
+    async def _get_on_get(self, request: Request) -> Optional[Response]:
+        if "query" in request.query_params or "extensions" in request.query_params:
+            return await self._handle_get_request(request)
+        return await super()._get_on_get(request)
+
+    async def _handle_get_request(self, request: Request) -> Response:
+        """Consulta por GET, servida desde el cache de respuestas si tiene política"""
+        try:
+            operation = operation_from_query_params(request.query_params)
+        except ValueError as e:
+            return JSONResponse({"errors": [e.args[0]]}, status_code=400)
+
+        context_value = await self._get_context_value(request)
+        document, digest, rejection = await self._get_document(operation, context_value)
+        if rejection is not None:
+            rejection.headers["Cache-Control"] = "no-store"
+            return rejection
+
+        operation_name = operation.get("operationName")
+        operation_ast = get_operation_ast(document, operation_name)
+        if operation_ast is not None and operation_ast.operation != OperationType.QUERY:
+            return JSONResponse(
+                {"errors": [{"message": "Sólo se pueden enviar consultas por GET; las mutaciones van por POST",
+                             "extensions": {"code": "METHOD_NOT_ALLOWED"}}]},
+                status_code=405,
+                headers={"Allow": "POST"},
+            )
+
+        document_hash, policy = self.cache_policy(digest, document, operation_name)
+        cache_manager = context_value.get("cache_manager")
+        if policy is None or cache_manager is None or not settings.graphql_http_cache_enabled:
+            outcome = await self._execute_operation(request, document, operation, context_value)
+            if not isinstance(outcome, Response):
+                result, extensions = outcome
+                outcome = self._json_response(result.data, result.errors, context_value, extensions)
+            outcome.headers["Cache-Control"] = "no-store"
+            return outcome
+
+        computed = False
+
+        async def compute():
+            nonlocal computed
+            computed = True
+            outcome = await self._execute_operation(request, document, operation, context_value)
+            if isinstance(outcome, Response):
+                raise UncachedResponse(outcome)
+            result, extensions = outcome
+            if result.errors:
+                raise UncachedResponse(self._json_response(result.data, result.errors, context_value, extensions))
+            if extensions:
+                # El presupuesto restante es del cliente que calculó la respuesta
+                extensions = {"cost": {name: value for name, value in extensions["cost"].items() if name != "remaining"}}
+            body = self._json_response(result.data, None, context_value, extensions).body
+            return {"b": body.decode("utf-8"), "e": f'"{hashlib.sha256(body).hexdigest()[:32]}"', "t": time.time()}
+
+        scope = auth_scope(request)
+        key = response_key(document_hash, operation_name, operation.get("variables"), scope)
+        try:
+            entry = await cache_manager.get_or_compute(key, compute, ttl=policy.max_age, tags=policy.tags)
+        except UncachedResponse as e:
+            e.response.headers["Cache-Control"] = "no-store"
+            return e.response
+        if not computed and settings.graphql_cached_response_cost > 0:
+            # Acierto: no se ejecuta nada, pero cuenta para el presupuesto del cliente
+            nominal = settings.graphql_cached_response_cost
+            rejection = await self._take_budget(request, nominal, {"requested": nominal, "cached": True}, cache_manager)
+            if rejection is not None:
+                rejection.headers["Cache-Control"] = "no-store"
+                return rejection
+
+        # Lo que le queda a la copia en Redis (puede venir de otro worker)
+        max_age = max(0, math.ceil(policy.max_age - (time.time() - entry["t"])))
+        headers = {
+            "ETag": entry["e"],
+            "Cache-Control": f"{'private' if scope else 'public'}, max-age={max_age}, "
+                             f"stale-while-revalidate={settings.cache_stale_ttl}",
+            "Vary": settings.api_key_header,
+        }
+        if etag_matches(request.headers.get("if-none-match"), entry["e"]):
+            return Response(status_code=304, headers=headers)
+        return Response(entry["b"], media_type="application/json", headers=headers)
+
+    async def _get_document(self, operation: Dict[str, Any], context_value):
+        """Documento validado de la operación: (documento, hash, None) o (None, None, respuesta de error)"""
+        try:
+            digest, query, persisted = self._read_operation(operation)
+            found, document = self.documents.get(digest)
+            if not found:
+                query = await self._load_query(digest, query, persisted, context_value.get("cache_manager"))
+        except PersistedQueryError as e:
+            return None, None, e.response()
+
+        if not found:
+            document, errors = self.parse_and_validate(query)
+            if errors:
+                return None, None, self._json_response(None, errors, context_value)
+            self.documents.set(digest, document)
+        return document, digest, None
+
+    async def _execute_operation(self, request: Request, document, operation: Dict[str, Any], context_value):
+        """Aplicar los límites de coste y ejecutar: respuesta de rechazo o (resultado, extensions)"""
+        variable_values = operation.get("variables")
+        operation_name = operation.get("operationName")
+        extensions = None
+        analysis = analyze_query(self.schema.graphql_schema, document, variable_values, operation_name)
+        if analysis is not None:
+            rejection, cost = await self._apply_cost_limits(request, analysis, context_value.get("cache_manager"))
+            if rejection is not None:
+                return rejection
+            extensions = {"cost": cost}
+
+        metrics_enabled = settings.metrics_enabled
+        started = time.perf_counter()
+        result = execute(
+            self.schema.graphql_schema,
+            document,
+            root_value=self.root_value,
+            context_value=context_value,
+            variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=self.middleware,
+            execution_context_class=self.execution_context_class,
+        )
+        if isawaitable(result):
+            result = await result
+        if metrics_enabled:
+            observe_operation(get_operation_ast(document, operation_name), time.perf_counter() - started, result.errors)
+        return result, extensions
+
+    async def _apply_cost_limits(self, request: Request, analysis, cache_manager):
+        """Comprobar los límites de coste y descontar la consulta del presupuesto
+
+        Devuelve (respuesta de rechazo o None, información de coste).
+        """
+        cost = {
+            "requested": analysis.cost,
+            "depth": analysis.depth,
+            "maxCost": settings.graphql_max_cost,
+            "maxDepth": settings.graphql_max_depth,
+        }
+        if analysis.depth > settings.graphql_max_depth:
+            message = f"Consulta demasiado profunda: {analysis.depth} niveles (máximo {settings.graphql_max_depth})"
+            return self._limit_response(message, "QUERY_TOO_DEEP", cost), cost
+        if analysis.cost > settings.graphql_max_cost:
+            message = f"Consulta demasiado costosa: coste {analysis.cost} (máximo {settings.graphql_max_cost})"
+            return self._limit_response(message, "QUERY_TOO_COMPLEX", cost), cost
+
+        if cache_manager:
+            return await self._take_budget(request, analysis.cost, cost, cache_manager), cost
+        return None, cost
+
+    async def _take_budget(self, request: Request, amount: int, cost, cache_manager) -> Optional[JSONResponse]:
+        """Descontar amount del presupuesto del cliente: respuesta 429 si no llega o None
+
+        Anota en cost lo que queda del presupuesto.
+        """
+        rate = settings.graphql_cost_refill_rate
+        allowed, remaining = await cache_manager.take_tokens(
+            client_key(request), amount, settings.graphql_cost_bucket_capacity, rate
+        )
+        if remaining is not None:
+            cost["remaining"] = int(remaining)
+        if allowed:
+            return None
+        retry_after = max(1, math.ceil((amount - remaining) / rate))
+        message = f"Presupuesto de consultas agotado, reintentar en {retry_after} segundos"
+        return self._limit_response(message, "BUDGET_EXCEEDED", cost, status_code=429,
+                                    headers={"Retry-After": str(retry_after)})
+
+    @staticmethod
+    def _limit_response(message, code, cost, status_code=200, headers=None) -> JSONResponse:
+        return JSONResponse(
+            {
+                "data": None,
+                "errors": [{"message": message, "extensions": {"code": code}}],
+                "extensions": {"cost": cost},
+            },
+            status_code=status_code,
+            headers=headers,
+        )
+
+    def _json_response(self, data, errors, context_value, extensions=None) -> JSONResponse:
+        response: Dict[str, Any] = {"data": data}
+        if errors:
+            for error in errors:
+                if error.original_error:
+                    self.logger.error(
+                        "An exception occurred in resolvers",
+                        exc_info=error.original_error,
+                    )
+            response["errors"] = [self.error_formatter(error) for error in errors]
+        if extensions:
+            response["extensions"] = extensions
+
+        return JSONResponse(
+            response,
+            status_code=200,
+            background=context_value.get("background"),
+        )
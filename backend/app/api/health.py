@@ -2,11 +2,10 @@
 Endpoints de salud y monitoreo para Render
 """
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter
 from sqlalchemy import text
-from app.core.database import get_db
-from app.core.cache import CacheManager
+from app.core.database import run_session
+from app.core.cache import cache_manager
 from app.core.config import settings
 import logging
 
@@ -14,19 +13,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check():
     """Health check para Render"""
     try:
-        # Verificar base de datos
-        db.execute(text("SELECT 1"))
+        # Verificar base de datos (engine asíncrono si DATABASE_ASYNC está activo)
+        await run_session(lambda session: session.execute(text("SELECT 1")))
         db_status = "healthy"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         db_status = "unhealthy"
     
     # Verificar cache
-    cache_manager = CacheManager()
-    cache_status = "healthy" if cache_manager.connected else "unhealthy"
+    cache_status = "healthy" if await cache_manager.ping() else "unhealthy"
     
     overall_status = "healthy" if db_status == "healthy" and cache_status == "healthy" else "unhealthy"
     
@@ -41,12 +39,12 @@ async def health_check(db: Session = Depends(get_db)):
     }
 
 @router.get("/ready")
-async def readiness_check(db: Session = Depends(get_db)):
+async def readiness_check():
     """Readiness check para Render"""
     try:
         # Verificar que las tablas existen
         from app.models.models import Customer
-        db.query(Customer).first()
+        await run_session(lambda session: session.query(Customer).first())
         
         return {
             "status": "ready",
@@ -0,0 +1 @@
+# Generación de código a partir del diccionario de datos heredado
@@ -0,0 +1,183 @@
+"""
+Lectura del diccionario de datos heredado (TablasGraphQL_comas_utf8.txt)
+
+El fichero es un CSV en UTF-16 con una fila por campo:
+Tabla BD, Descripcion Tabla, Tag Tabla GraphQL, Campo BD, Tag Campo GraphQL,
+Tipo Dato, Formato, Campo personalizado de usuario, Etiqueta, Ayuda.
+
+Algunas filas llegan envueltas enteras entre comillas (con las comillas
+internas duplicadas) porque el formato de Progress contiene comas, p. ej.
+``"atconav,...,decimal,""->>,>>>,>>9.999"",no,..."``; esas filas se vuelven a
+leer como CSV. Los campos entre comillas pueden ocupar varias líneas.
+"""
+
+import csv
+import io
+import keyword
+import re
+from collections import OrderedDict
+from typing import List, NamedTuple
+
+COLUMNS = 10
+
+# Nombres que no pueden usarse como atributo de un modelo declarativo
+RESERVED_ATTRIBUTES = {"metadata", "registry", "query"}
+
+# Caracteres de una máscara numérica de Progress que representan un dígito
+DIGIT_CHARACTERS = set("9>zZ<")
+
+# Enteros con más dígitos que éstos no caben en INTEGER
+INTEGER_MAX_DIGITS = 9
+
+LENGTH_FORMAT = re.compile(r"^x\((\d+)\)$", re.IGNORECASE)
+
+
+class FieldDefinition(NamedTuple):
+    """Un campo del diccionario, ya con su nombre de atributo y tipo de columna"""
+    db_name: str
+    attribute: str
+    data_type: str
+    display_format: str
+    column_type: str
+    label: str
+    help: str
+    user_defined: bool
+
+
+class TableDefinition(NamedTuple):
+    """Una tabla del diccionario"""
+    db_name: str
+    description: str
+    graphql_tag: str
+    class_name: str
+    fields: List[FieldDefinition]
+    primary_key: List[str]
+
+
+def read_rows(text: str):
+    """Filas de 10 columnas del CSV (deshaciendo las filas envueltas entre comillas)"""
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, None)
+    if header is None:
+        return
+    for line, row in enumerate(reader, start=2):
+        if len(row) == 1 and "," in row[0]:
+            inner = list(csv.reader(io.StringIO(row[0])))
+            if len(inner) == 1:
+                row = inner[0]
+        if not any(value.strip() for value in row):
+            continue
+        if len(row) != COLUMNS:
+            raise ValueError(f"Fila {line}: se esperaban {COLUMNS} columnas y hay {len(row)}: {row!r}")
+        yield [value.strip() for value in row]
+
+
+def count_digits(mask: str):
+    """Dígitos enteros y decimales de una máscara numérica de Progress"""
+    integer_part, _, decimal_part = mask.partition(".")
+    return (
+        sum(1 for char in integer_part if char in DIGIT_CHARACTERS),
+        sum(1 for char in decimal_part if char in DIGIT_CHARACTERS),
+    )
+
+
+def column_type(data_type: str, display_format: str) -> str:
+    """Tipo de columna de SQLAlchemy (como código) para un tipo y formato de Progress"""
+    data_type = data_type.lower()
+    if data_type == "character":
+        match = LENGTH_FORMAT.match(display_format)
+        if match:
+            return f"String({int(match.group(1))})"
+        if display_format.lower() == "x":
+            return "String(1)"
+        # Máscaras como 99:99 o xxx-xxx-xxx-x: su longitud es la del texto
+        return f"String({len(display_format)})" if display_format else "Text"
+    if data_type == "decimal":
+        integer_digits, scale = count_digits(display_format)
+        if not integer_digits and not scale:
+            return "Numeric"
+        return f"Numeric({integer_digits + scale}, {scale})"
+    if data_type == "integer":
+        integer_digits, _ = count_digits(display_format)
+        return "BigInteger" if integer_digits > INTEGER_MAX_DIGITS else "Integer"
+    if data_type == "int64":
+        return "BigInteger"
+    if data_type == "logical":
+        return "Boolean"
+    if data_type == "date":
+        return "Date"
+    if data_type == "datetime":
+        return "DateTime"
+    raise ValueError(f"Tipo de dato desconocido: {data_type}")
+
+
+def python_identifier(tag: str) -> str:
+    """Convertir un tag GraphQL en un identificador válido (p. ej. pre-invoiced -> pre_invoiced)"""
+    name = re.sub(r"_+", "_", re.sub(r"\W", "_", tag)).strip("_")
+    if not name or name[0].isdigit():
+        name = f"f_{name}"
+    if keyword.iskeyword(name) or name in RESERVED_ATTRIBUTES:
+        name = f"{name}_"
+    return name
+
+
+def class_name(tag: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in python_identifier(tag).split("_") if part)
+
+
+def primary_key(table_tag: str, fields: List[FieldDefinition]) -> List[str]:
+    """Clave del modelo: Id_unico, o <tabla>_id; si no hay ninguna, todas las columnas
+
+    El diccionario no indica claves primarias; en las tablas sin un
+    identificador reconocible el modelo es de sólo lectura y su identidad es
+    la fila completa.
+    """
+    for field in fields:
+        if field.db_name.lower() == "id_unico":
+            return [field.attribute]
+    for field in fields:
+        if field.attribute == f"{python_identifier(table_tag)}_id":
+            return [field.attribute]
+    return [field.attribute for field in fields]
+
+
+def parse_dictionary(text: str) -> List[TableDefinition]:
+    """Tablas del diccionario en el orden del fichero"""
+    tables = OrderedDict()
+    for db_table, description, table_tag, db_field, field_tag, data_type, display_format, user_defined, label, help_text in read_rows(text):
+        table = tables.setdefault(db_table, {"description": description, "tag": table_tag, "fields": [], "attributes": set()})
+        attribute = python_identifier(field_tag)
+        if attribute in table["attributes"]:
+            # Tags repetidos en la misma tabla: se distinguen por el campo de la base de datos
+            attribute = f"{attribute}_{python_identifier(db_field).lower()}"
+        table["attributes"].add(attribute)
+        table["fields"].append(FieldDefinition(
+            db_name=db_field,
+            attribute=attribute,
+            data_type=data_type.lower(),
+            display_format=display_format,
+            column_type=column_type(data_type, display_format),
+            label=label,
+            help=help_text,
+            user_defined=user_defined.lower() == "yes",
+        ))
+
+    return [
+        TableDefinition(
+            db_name=db_table,
+            description=table["description"],
+            graphql_tag=table["tag"],
+            class_name=class_name(table["tag"]),
+            fields=table["fields"],
+            primary_key=primary_key(table["tag"], table["fields"]),
+        )
+        for db_table, table in tables.items()
+    ]
+
+
+def read_dictionary(path: str) -> List[TableDefinition]:
+    """Leer el diccionario (UTF-16 con BOM, o UTF-8)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    encoding = "utf-16" if raw[:2] in (b"\xff\xfe", b"\xfe\xff") else "utf-8-sig"
+    return parse_dictionary(raw.decode(encoding))
@@ -0,0 +1,224 @@
+"""
+Generador de modelos SQLAlchemy y tipos Graphene del diccionario heredado
+
+Lee TablasGraphQL_comas_utf8.txt y escribe en app/generated/:
+
+- legacy_models.py: un modelo declarativo por tabla (sobre LegacyBase, que no
+  forma parte de Base.metadata) con columnas dimensionadas según el formato de
+  Progress.
+- legacy_schema.py: un tipo Graphene y un input de filtros por tabla, y
+  LegacyQuery con una lista por tabla.
+
+Los ficheros generados son un artefacto de build: se versionan junto al
+código, así que el arranque sólo los importa. Su cabecera guarda el hash del
+diccionario y la versión del generador, y sólo se reescriben si cambian.
+
+Uso (desde backend/):
+    python -m app.codegen.generate            # regenerar si hace falta
+    python -m app.codegen.generate --check    # fallar si están desactualizados
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from app.codegen.dictionary import python_identifier, read_dictionary
+
+GENERATOR_VERSION = 1
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DICTIONARY_PATH = os.path.join(os.path.dirname(BACKEND_DIR), "TablasGraphQL_comas_utf8.txt")
+OUTPUT_DIR = os.path.join(BACKEND_DIR, "app", "generated")
+OUTPUT_FILES = ("legacy_models.py", "legacy_schema.py")
+
+# Escalar Graphene de cada tipo de columna (igual que la conversión de graphene-sqlalchemy)
+GRAPHENE_SCALARS = {
+    "String": "String",
+    "Text": "String",
+    "Numeric": "Float",
+    "BigInteger": "Float",
+    "Integer": "Int",
+    "Boolean": "Boolean",
+    "Date": "Date",
+    "DateTime": "DateTime",
+}
+
+
+def quote(value):
+    """Literal de cadena de Python (entre comillas dobles)"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def docstring(value):
+    return '"""' + value.replace("\\", "\\\\").replace('"', '\\"') + '"""'
+
+
+def header(source_hash):
+    return [
+        "# Generado por app/codegen/generate.py a partir de TablasGraphQL_comas_utf8.txt. No editar.",
+        f"# generator: {GENERATOR_VERSION} source: {source_hash}",
+    ]
+
+
+def base_type(column_type):
+    return column_type.split("(")[0]
+
+
+def render_models(tables, source_hash):
+    lines = header(source_hash) + [
+        '"""',
+        "Modelos de las tablas del diccionario de datos heredado",
+        "",
+        "El diccionario no indica claves primarias: se usa Id_unico o <tabla>_id si",
+        "existen; las tablas sin identificador heredan de ReadOnlyRow y su identidad",
+        "es la fila completa.",
+        '"""',
+        "",
+        "from sqlalchemy import BigInteger, Boolean, Column, Date, DateTime, Integer, Numeric, String, Text",
+        "from sqlalchemy.orm import declarative_base, declared_attr",
+        "",
+        "LegacyBase = declarative_base()",
+        "",
+        "",
+        "class ReadOnlyRow:",
+        '    """Tabla sin clave conocida: la identidad del modelo es la fila completa"""',
+        "",
+        "    @declared_attr.directive",
+        "    def __mapper_args__(cls):",
+        '        return {"primary_key": list(cls.__table__.columns)}',
+    ]
+    for table in tables:
+        single_key = table.primary_key[0] if len(table.primary_key) == 1 else None
+        bases = "LegacyBase" if single_key else "ReadOnlyRow, LegacyBase"
+        lines += [
+            "",
+            "",
+            f"class {table.class_name}({bases}):",
+            f"    {docstring(table.description + ' (' + table.db_name + ')')}",
+            f"    __tablename__ = {quote(table.db_name)}",
+            "",
+        ]
+        for field in table.fields:
+            options = ", primary_key=True" if field.attribute == single_key else ""
+            doc = field.help or field.label
+            lines.append(
+                f"    {field.attribute} = Column({quote(field.db_name)}, {field.column_type}{options}, doc={quote(doc)})"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def render_schema(tables, source_hash):
+    lines = header(source_hash) + [
+        '"""',
+        "Tipos GraphQL y filtros de las tablas del diccionario de datos heredado",
+        '"""',
+        "",
+        "import graphene",
+        "from graphene import Boolean, Date, DateTime, Float, Int, String",
+        "from graphene_sqlalchemy import SQLAlchemyObjectType",
+        "from app.generated import legacy_models as models",
+        "from app.schemas.legacy import legacy_list_field",
+    ]
+    for table in tables:
+        lines += [
+            "",
+            "",
+            f"class {table.class_name}(SQLAlchemyObjectType):",
+            "    class Meta:",
+            f"        model = models.{table.class_name}",
+            f"        name = {quote('Legacy' + table.class_name)}",
+            f"        description = {quote(table.description)}",
+            "",
+            "",
+            f"class {table.class_name}Filter(graphene.InputObjectType):",
+            "    class Meta:",
+            f"        name = {quote('Legacy' + table.class_name + 'Filter')}",
+            "",
+        ]
+        for field in table.fields:
+            kind = base_type(field.column_type)
+            scalar = GRAPHENE_SCALARS[kind]
+            lines.append(f"    {field.attribute} = {scalar}()")
+            if scalar == "String":
+                lines.append(f"    {field.attribute}_contains = String()")
+            elif kind != "Boolean":
+                lines.append(f"    {field.attribute}_gte = {scalar}()")
+                lines.append(f"    {field.attribute}_lte = {scalar}()")
+
+    lines += [
+        "",
+        "",
+        "class LegacyQuery(graphene.ObjectType):",
+        '    """Consultas sobre las tablas heredadas"""',
+        "",
+    ]
+    for table in tables:
+        lines.append(f"    {python_identifier(table.graphql_tag)} = legacy_list_field({table.class_name}, {table.class_name}Filter)")
+    return "\n".join(lines) + "\n"
+
+
+def source_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def render(dictionary_path):
+    """Contenido de los ficheros generados {nombre: texto}"""
+    digest = source_hash(dictionary_path)
+    tables = read_dictionary(dictionary_path)
+    return {
+        "legacy_models.py": render_models(tables, digest),
+        "legacy_schema.py": render_schema(tables, digest),
+    }
+
+
+def is_current(dictionary_path, output_dir):
+    """Los ficheros generados corresponden a este diccionario y versión del generador"""
+    expected = header(source_hash(dictionary_path))[1]
+    for name in OUTPUT_FILES:
+        path = os.path.join(output_dir, name)
+        if not os.path.exists(path):
+            return False
+        with open(path, encoding="utf-8") as f:
+            f.readline()
+            if f.readline().rstrip("\r\n") != expected:
+                return False
+    return True
+
+
+def generate(dictionary_path=DICTIONARY_PATH, output_dir=OUTPUT_DIR, force=False):
+    """Regenerar los ficheros si el diccionario o el generador han cambiado"""
+    if not force and is_current(dictionary_path, output_dir):
+        return False
+    os.makedirs(output_dir, exist_ok=True)
+    for name, content in render(dictionary_path).items():
+        with open(os.path.join(output_dir, name), "w", encoding="utf-8", newline="\r\n") as f:
+            f.write(content)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generar modelos y tipos del diccionario heredado")
+    parser.add_argument("--dictionary", default=DICTIONARY_PATH, help="ruta de TablasGraphQL_comas_utf8.txt")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="directorio de salida")
+    parser.add_argument("--check", action="store_true", help="sólo comprobar que los ficheros están al día")
+    parser.add_argument("--force", action="store_true", help="regenerar aunque estén al día")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if is_current(args.dictionary, args.output):
+            print("✅ Ficheros generados al día")
+            return 0
+        print("❌ Ficheros generados desactualizados: ejecutar python -m app.codegen.generate")
+        return 1
+
+    if generate(args.dictionary, args.output, force=args.force):
+        print(f"✅ Generados {', '.join(OUTPUT_FILES)} en {args.output}")
+    else:
+        print("✅ Ficheros generados al día (sin cambios)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Carga masiva de datos
+
+En PostgreSQL las filas se envían en streaming con ``COPY ... FROM STDIN``,
+sin construir objetos del ORM; en el resto de bases de datos (SQLite en
+desarrollo y tests) se insertan por lotes con executemany. Si la tabla de
+destino está vacía sus índices secundarios se eliminan antes de cargar y se
+reconstruyen al final, que es mucho más rápido que mantenerlos fila a fila.
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from itertools import chain
+from sqlalchemy import Boolean, DateTime, Float, Integer, inspect, select, text
+from app.core.database import Base
+from app.models import models  # noqa: F401  (registra las tablas en Base.metadata)
+
+logger = logging.getLogger(__name__)
+
+# Tablas en orden de carga (las claves foráneas apuntan a tablas anteriores)
+TABLES = ["customers", "products", "orders", "order_items", "invoices", "notices"]
+
+# Filas por lote de executemany
+BATCH_SIZE = 5000
+
+# Bytes de CSV que se acumulan antes de entregarlos a COPY
+COPY_CHUNK_SIZE = 1 << 16
+
+TRUE_VALUES = ("1", "true", "t", "yes", "y", "si", "sí")
+
+
+def read_records(path):
+    """Leer registros (dicts) de un CSV con cabecera o de un JSONL, en streaming"""
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+
+
+def convert_value(value, column_type):
+    """Convertir un valor leído de CSV/JSONL al tipo de Python de la columna"""
+    if value is None or value == "":
+        return None
+    if isinstance(column_type, Boolean):
+        return value if isinstance(value, bool) else str(value).strip().lower() in TRUE_VALUES
+    if isinstance(column_type, Integer):
+        return int(value)
+    if isinstance(column_type, Float):
+        return float(value)
+    if isinstance(column_type, DateTime) and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def copy_value(value):
+    """Representación de un valor en el CSV de COPY (None es NULL)"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class CopyStream:
+    """Fichero de sólo lectura que genera bajo demanda el CSV para COPY"""
+
+    def __init__(self, records, columns):
+        self._rows = ([copy_value(record.get(column)) for column in columns] for record in records)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = b""
+        self.count = 0
+
+    def _fill(self, size):
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self.count += 1
+            if self._buffer.tell() >= COPY_CHUNK_SIZE:
+                self._flush()
+        self._flush()
+
+    def _flush(self):
+        self._pending += self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def read(self, size=-1):
+        self._fill(size)
+        if size < 0:
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+
+def _copy_rows(conn, table, columns, records):
+    """Cargar con COPY FROM STDIN usando la conexión psycopg2 subyacente"""
+    preparer = conn.dialect.identifier_preparer
+    statement = "COPY {} ({}) FROM STDIN WITH (FORMAT csv)".format(
+        preparer.format_table(table),
+        ", ".join(preparer.quote(column) for column in columns),
+    )
+    stream = CopyStream(records, columns)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(statement, stream, size=COPY_CHUNK_SIZE)
+    finally:
+        cursor.close()
+    return stream.count
+
+
+def _insert_rows(conn, table, columns, records, batch_size):
+    """Cargar por lotes con executemany (insert().values() con varias filas)"""
+    types = {column: table.c[column].type for column in columns}
+    insert = table.insert()
+    count = 0
+    batch = []
+    for record in records:
+        batch.append({column: convert_value(record.get(column), types[column]) for column in columns})
+        if len(batch) >= batch_size:
+            conn.execute(insert, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert, batch)
+        count += len(batch)
+    return count
+
+
+def _drop_indexes(conn, table):
+    """Eliminar los índices secundarios (no únicos) de la tabla; devuelve los eliminados"""
+    existing = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+    dropped = [index for index in table.indexes if not index.unique and index.name in existing]
+    for index in dropped:
+        index.drop(conn)
+    return dropped
+
+
+def _reset_sequences(conn, table):
+    """Ajustar las secuencias de PostgreSQL tras cargar claves primarias explícitas"""
+    if conn.dialect.name != "postgresql":
+        return
+    for column in table.primary_key.columns:
+        if isinstance(column.type, Integer) and column.autoincrement in (True, "auto"):
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence(:table, :column), "
+                    f"COALESCE((SELECT MAX({column.name}) FROM {table.name}), 0) + 1, false)"
+                ),
+                {"table": table.name, "column": column.name},
+            )
+
+
+def load_table(engine, name, records, batch_size=BATCH_SIZE, rebuild_indexes=True):
+    """Cargar registros en una tabla en una única transacción; devuelve las filas cargadas"""
+    table = Base.metadata.tables[name]
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0
+
+    columns = list(first)
+    unknown = [column for column in columns if column not in table.c]
+    if unknown:
+        raise ValueError(f"Columnas desconocidas en {name}: {', '.join(unknown)}")
+    records = chain([first], records)
+
+    with engine.begin() as conn:
+        empty = conn.execute(select(text("1")).select_from(table).limit(1)).first() is None
+        dropped = _drop_indexes(conn, table) if rebuild_indexes and empty else []
+
+        if conn.dialect.name == "postgresql":
+            count = _copy_rows(conn, table, columns, records)
+        else:
+            count = _insert_rows(conn, table, columns, records, batch_size)
+
+        for index in dropped:
+            index.create(conn)
+        _reset_sequences(conn, table)
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"ANALYZE {table.name}"))
+
+    logger.info(f"✅ {name}: {count} filas cargadas" + (f" ({len(dropped)} índices reconstruidos)" if dropped else ""))
+    return count
+
+
+def load_tables(engine, sources, batch_size=BATCH_SIZE, rebuild_indexes=True):
+    """Cargar varias tablas en orden de claves foráneas
+
+    sources: {tabla: iterable de registros}. Devuelve {tabla: filas cargadas}.
+    """
+    unknown = [name for name in sources if name not in TABLES]
+    if unknown:
+        raise ValueError(f"Tablas desconocidas: {', '.join(unknown)}")
+    return {
+        name: load_table(engine, name, sources[name], batch_size, rebuild_indexes)
+        for name in TABLES
+        if name in sources
+    }
@@ -1,94 +1,704 @@
 import os
-import redis
+import asyncio
 import json
 import logging
-from typing import Any, Optional
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 from dotenv import load_dotenv
+from sqlalchemy import Date, DateTime, inspect
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.core.rows import row_class
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Prefijo de los contadores de versión de cada etiqueta
+TAG_PREFIX = "tag:"
+
+# Prefijo de los locks de recálculo (un solo worker recalcula cada clave)
+LOCK_PREFIX = "lock:"
+
+# Cada cuánto mira un fallo completo si el worker del lock ya guardó el valor
+LOCK_POLL_INTERVAL = 0.05
+
+# Canal pub/sub por el que los workers se avisan de invalidaciones del L1
+INVALIDATION_CHANNEL = "cache:invalidations"
+
+# Prefijo de los token buckets de presupuesto por cliente
+BUDGET_PREFIX = "budget:"
+
+# Token bucket atómico: recarga según el tiempo transcurrido (reloj de Redis,
+# común a todos los workers) y descuenta el coste si hay saldo suficiente
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+# Errores de Redis que cuentan como fallo para el circuit breaker
+REDIS_ERRORS = (RedisError, OSError, asyncio.TimeoutError)
+
+class CircuitBreaker:
+    """Circuit breaker para dejar de llamar a Redis mientras no responde
+    
+    Tras failure_threshold fallos seguidos se abre y el cache se ignora
+    durante reset_timeout segundos; después deja pasar una única petición de
+    prueba (semiabierto) que lo vuelve a cerrar si tiene éxito.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probe_in_flight = False
+    
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+    
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info("✅ Redis recuperado, circuit breaker cerrado")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"⚠️ Circuit breaker abierto: cache desactivada {self.reset_timeout} segundos")
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+    
+    def stats(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "times_opened": self.times_opened
+        }
+
+class LocalCache:
+    """Cache LRU en memoria del proceso, limitada en tamaño y en TTL"""
+    
+    def __init__(self, max_items: int = 1000, ttl: int = 60):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str):
+        """Devolver (encontrado, valor)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def raise_to(self, key: str, value: int, ttl: Optional[int] = None):
+        """Guardar value salvo que ya haya uno mayor (versiones de etiquetas, que sólo crecen)"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic() and entry[1] > value:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def discard(self, key: str):
+        """Eliminar una clave y todas sus variantes (key#variant)"""
+        prefix = f"{key}#"
+        with self._lock:
+            self._entries.pop(key, None)
+            for stale in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[stale]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_items": self.max_items
+        }
+
 class CacheManager:
-    """Gestor de cache con Redis"""
+    """Gestor de cache con Redis (cliente asyncio con pool de conexiones)
+    
+    Las entradas pueden depender de etiquetas (p. ej. "entity:orders" o
+    "customer:42"). Cada etiqueta tiene un contador de versión en Redis que
+    forma parte de la clave real, así que invalidar una etiqueta es un INCR:
+    todas las entradas que dependen de ella dejan de encontrarse y caducan
+    solas por TTL.
+    
+    Opcionalmente (CACHE_L1_ENABLED) mantiene un LocalCache delante de Redis
+    (L1). Las invalidaciones se publican en INVALIDATION_CHANNEL para que el
+    resto de workers descarten también sus copias locales.
     
-    def __init__(self):
+    Todas las llamadas a Redis pasan por un CircuitBreaker: si Redis falla o
+    tarda más que los timeouts configurados, el cache se ignora y las
+    peticiones van directamente a la base de datos hasta que se recupere.
+    """
+    
+    def __init__(self, client=None, local_cache: Optional[LocalCache] = None):
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        self.client = None
-        self.connected = False
-        self._connect()
+        if client is None:
+            pool = aioredis.ConnectionPool.from_url(
+                self.redis_url,
+                decode_responses=True,
+                max_connections=settings.redis_max_connections,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_connect_timeout,
+                health_check_interval=30
+            )
+            client = aioredis.Redis(connection_pool=pool)
+        self.client = client
+        self.breaker = CircuitBreaker(settings.redis_breaker_failures, settings.redis_breaker_reset)
+        if local_cache is None and settings.cache_l1_enabled:
+            local_cache = LocalCache(settings.cache_l1_max_items, settings.cache_l1_ttl)
+        self.local = local_cache
+        self._l1_active = False
+        self._listener = None
+        self.instance_id = uuid.uuid4().hex
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self._inflight = {}
+    
+    @property
+    def connected(self) -> bool:
+        """Redis se considera disponible mientras el circuit breaker no esté abierto"""
+        return self.breaker.state != CircuitBreaker.OPEN
+    
+    @property
+    def _l1(self) -> Optional[LocalCache]:
+        # El L1 sólo se usa mientras la suscripción de invalidaciones está activa
+        return self.local if self._l1_active else None
+    
+    def _record_failure(self, action: str, error: Exception):
+        self.breaker.record_failure()
+        logger.error(f"❌ Error {action}: {error}")
+    
+    async def start(self):
+        """Arrancar la escucha de invalidaciones del L1 (al iniciar la aplicación)"""
+        if self.local is not None and self._listener is None:
+            ready = asyncio.Event()
+            self._listener = asyncio.create_task(self._listen_invalidations(ready))
+            # Esperar a la primera suscripción sin bloquear el arranque si Redis no responde
+            try:
+                await asyncio.wait_for(ready.wait(), settings.redis_connect_timeout)
+            except asyncio.TimeoutError:
+                pass
     
-    def _connect(self):
-        """Conectar a Redis"""
+    async def close(self):
+        """Parar la escucha de invalidaciones y cerrar el pool de conexiones"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.client.aclose()
+    
+    async def _listen_invalidations(self, ready: Optional[asyncio.Event] = None):
+        """Escuchar las invalidaciones publicadas por otros workers (con reconexión)"""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Lo cacheado mientras no había suscripción puede estar obsoleto
+                self.local.clear()
+                self._l1_active = True
+                logger.info("✅ Cache L1 activa con invalidación por pub/sub")
+                if ready is not None:
+                    ready.set()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        self._on_invalidation(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error en la suscripción de invalidaciones, L1 desactivada: {e}")
+                if ready is not None:
+                    ready.set()
+            finally:
+                self._l1_active = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(settings.redis_breaker_reset)
+    
+    def _on_invalidation(self, message):
+        """Aplicar en el L1 una invalidación publicada por otro worker"""
         try:
-            self.client = redis.from_url(self.redis_url, decode_responses=True)
-            # Test connection
-            self.client.ping()
-            self.connected = True
-            logger.info("✅ Conectado a Redis")
+            data = json.loads(message["data"])
+            if data.get("origin") == self.instance_id:
+                return
+            self._discard_local(data.get("tags", []), data.get("keys", []))
         except Exception as e:
-            logger.error(f"❌ Error conectando a Redis: {e}")
-            self.connected = False
+            logger.error(f"❌ Error procesando invalidación: {e}")
+    
+    def _discard_local(self, tags, keys):
+        if self.local is None:
+            return
+        for tag in tags:
+            self.local.discard(f"{TAG_PREFIX}{tag}")
+        for key in keys:
+            self.local.discard(key)
+    
+    async def _publish_invalidation(self, tags=(), keys=()):
+        if self.local is None:
+            return
+        message = json.dumps({"origin": self.instance_id, "tags": list(tags), "keys": list(keys)})
+        await self.client.publish(INVALIDATION_CHANNEL, message)
+    
+    def _local_versions(self, tags):
+        """Versiones de las etiquetas que ya están en el L1"""
+        local = self._l1
+        versions = {}
+        if local is not None:
+            for tag in tags:
+                found, version = local.get(f"{TAG_PREFIX}{tag}")
+                if found:
+                    versions[tag] = version
+        return versions
     
-    def get(self, key: str) -> Optional[Any]:
-        """Obtener valor del cache"""
-        if not self.connected:
+    async def _fetch_versions(self, tags, versions):
+        """Completar con Redis las versiones que faltan (y guardarlas en el L1)"""
+        missing = [tag for tag in tags if tag not in versions]
+        if missing:
+            local = self._l1
+            values = await self.client.mget([f"{TAG_PREFIX}{tag}" for tag in missing])
+            for tag, version in zip(missing, values):
+                versions[tag] = int(version or 0)
+                if local is not None:
+                    # Una lectura lenta no debe pisar la versión de una invalidación posterior
+                    local.raise_to(f"{TAG_PREFIX}{tag}", versions[tag])
+        return versions
+    
+    @staticmethod
+    def _compose_key(key: str, tags, versions) -> str:
+        """Clave real: la clave lógica más las versiones de sus etiquetas"""
+        if not tags:
+            return key
+        return key + "@" + ",".join(f"{tag}={versions[tag]}" for tag in tags)
+    
+    @staticmethod
+    def _local_key(key: str, variant: Optional[str]) -> str:
+        return key if variant is None else f"{key}#{variant}"
+    
+    async def _versioned_key(self, key: str, tags: Optional[Iterable[str]]) -> str:
+        """Componer la clave real con las versiones actuales de sus etiquetas"""
+        tags = sorted(tags) if tags else []
+        versions = await self._fetch_versions(tags, self._local_versions(tags))
+        return self._compose_key(key, tags, versions)
+    
+    async def ping(self) -> bool:
+        """Comprobar que Redis responde"""
+        if not self.breaker.allow_request():
+            return False
+        try:
+            await self.client.ping()
+            self.breaker.record_success()
+            return True
+        except REDIS_ERRORS as e:
+            self._record_failure("conectando a Redis", e)
+            return False
+    
+    async def get(self, key: str, variant: Optional[str] = None, tags: Optional[Iterable[str]] = None) -> Optional[Any]:
+        """Obtener valor del cache
+        
+        Con variant el valor se lee de un campo del hash guardado en key, de
+        modo que todas las variantes de una clave se borran juntas con delete.
+        """
+        tags = sorted(tags) if tags else []
+        versions = self._local_versions(tags)
+        local = self._l1
+        
+        # Acierto en L1 sin ninguna llamada a Redis
+        if local is not None and len(versions) == len(tags):
+            found, value = local.get(self._local_key(self._compose_key(key, tags, versions), variant))
+            if found:
+                record_cache(key, "l1_hit")
+                return value
+        
+        if not self.breaker.allow_request():
+            record_cache(key, "error")
             return None
         
         try:
-            value = self.client.get(key)
+            versions = await self._fetch_versions(tags, versions)
+            real_key = self._compose_key(key, tags, versions)
+            if variant is None:
+                value = await self.client.get(real_key)
+            else:
+                value = await self.client.hget(real_key, variant)
+            self.breaker.record_success()
             if value:
-                return json.loads(value)
+                self.l2_hits += 1
+                record_cache(key, "l2_hit")
+                value = json.loads(value)
+                if local is not None:
+                    local.set(self._local_key(real_key, variant), value)
+                return value
+            self.l2_misses += 1
+            record_cache(key, "miss")
+            return None
+        except REDIS_ERRORS as e:
+            self._record_failure("obteniendo del cache", e)
+            record_cache(key, "error")
             return None
         except Exception as e:
             logger.error(f"❌ Error obteniendo del cache: {e}")
+            record_cache(key, "error")
             return None
     
-    def set(self, key: str, value: Any, ttl: int = 3600):
+    async def set(self, key: str, value: Any, ttl: int = 3600, variant: Optional[str] = None, tags: Optional[Iterable[str]] = None):
         """Guardar valor en cache"""
-        if not self.connected:
+        if not self.breaker.allow_request():
             return False
         
         try:
+            key = await self._versioned_key(key, tags)
             serialized = json.dumps(value, default=str)
-            self.client.setex(key, ttl, serialized)
+            if variant is None:
+                await self.client.setex(key, ttl, serialized)
+            else:
+                pipe = self.client.pipeline()
+                pipe.hset(key, variant, serialized)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+            self.breaker.record_success()
+            local = self._l1
+            if local is not None:
+                local.set(self._local_key(key, variant), value, ttl)
             return True
+        except REDIS_ERRORS as e:
+            self._record_failure("guardando en cache", e)
+            return False
         except Exception as e:
             logger.error(f"❌ Error guardando en cache: {e}")
             return False
     
-    def delete(self, key: str):
+    async def delete(self, key: str):
         """Eliminar del cache"""
-        if not self.connected:
+        if not self.breaker.allow_request():
             return False
         
         try:
-            self.client.delete(key)
+            await self.client.delete(key)
+            self._discard_local([], [key])
+            await self._publish_invalidation(keys=[key])
+            self.breaker.record_success()
             return True
-        except Exception as e:
-            logger.error(f"❌ Error eliminando del cache: {e}")
+        except REDIS_ERRORS as e:
+            self._record_failure("eliminando del cache", e)
             return False
     
-    def get_stats(self):
+    async def invalidate_tags(self, *tags: str):
+        """Invalidar todas las entradas que dependen de alguna de las etiquetas"""
+        if not tags:
+            return False
+        # El L1 local se limpia aunque Redis no esté disponible
+        self._discard_local(tags, [])
+        if not self.breaker.allow_request():
+            return False
+        
+        try:
+            pipe = self.client.pipeline()
+            for tag in tags:
+                pipe.incr(f"{TAG_PREFIX}{tag}")
+            versions = await pipe.execute()
+            # Mientras se esperaba al INCR, otra petición de este worker ha
+            # podido volver a guardar en el L1 la versión anterior (y los
+            # mensajes propios no se aplican): se guardan las nuevas
+            local = self._l1
+            if local is not None:
+                for tag, version in zip(tags, versions):
+                    local.raise_to(f"{TAG_PREFIX}{tag}", int(version))
+            await self._publish_invalidation(tags=tags)
+            self.breaker.record_success()
+            return True
+        except REDIS_ERRORS as e:
+            self._record_failure(f"invalidando etiquetas {tags}", e)
+            return False
+    
+    async def take_tokens(self, bucket: str, tokens: float, capacity: float, refill_rate: float):
+        """Descontar tokens del bucket de un cliente
+        
+        Devuelve (permitido, saldo restante). Si Redis no está disponible se
+        permite la petición y el saldo es None.
+        """
+        if not self.breaker.allow_request():
+            return True, None
+        try:
+            allowed, remaining = await self.client.eval(
+                TOKEN_BUCKET_SCRIPT, 1, f"{BUDGET_PREFIX}{bucket}", capacity, refill_rate, tokens
+            )
+            self.breaker.record_success()
+            return bool(int(allowed)), float(remaining)
+        except REDIS_ERRORS as e:
+            self._record_failure(f"descontando presupuesto de {bucket}", e)
+            return True, None
+    
+    async def _acquire_lock(self, lock_key: str) -> bool:
+        """Lock de recálculo entre workers (SET NX con caducidad)"""
+        if not self.breaker.allow_request():
+            return True
+        try:
+            acquired = await self.client.set(lock_key, self.instance_id, nx=True, ex=settings.cache_lock_ttl)
+            self.breaker.record_success()
+            return bool(acquired)
+        except REDIS_ERRORS as e:
+            self._record_failure(f"obteniendo lock {lock_key}", e)
+            return True
+    
+    async def _release_lock(self, lock_key: str):
+        if not self.breaker.allow_request():
+            return
+        try:
+            if await self.client.get(lock_key) == self.instance_id:
+                await self.client.delete(lock_key)
+            self.breaker.record_success()
+        except REDIS_ERRORS as e:
+            self._record_failure(f"liberando lock {lock_key}", e)
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int = 3600,
+        variant: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        stale_ttl: Optional[int] = None,
+        beta: Optional[float] = None
+    ) -> Any:
+        """Obtener un valor del cache o calcularlo, protegiendo contra estampidas
+        
+        - Los valores se guardan con su caducidad lógica y el tiempo que costó
+          calcularlos; Redis los conserva stale_ttl segundos más.
+        - Expiración anticipada probabilística: cuanto más cerca de caducar y
+          más caro sea el cálculo, más probable es recalcular antes de tiempo.
+        - Single-flight: dentro del proceso, las peticiones concurrentes de la
+          misma clave esperan al mismo cálculo; entre workers, sólo quien
+          obtiene el lock (SET NX) recalcula.
+        - Stale-while-revalidate: mientras otro recalcula se sirve el valor
+          anterior si todavía está dentro de la ventana stale_ttl.
+        """
+        stale_ttl = settings.cache_stale_ttl if stale_ttl is None else stale_ttl
+        beta = settings.cache_early_expiration_beta if beta is None else beta
+        tags = sorted(tags) if tags else None
+        flight_key = (key, variant, tuple(tags or ()))
+        
+        envelope = await self.get(key, variant=variant, tags=tags)
+        if envelope is not None:
+            early = envelope["d"] * beta * -math.log(max(random.random(), 1e-12))
+            if time.time() + early < envelope["x"]:
+                return envelope["v"]
+            if flight_key in self._inflight:
+                return envelope["v"]
+        elif flight_key in self._inflight:
+            return await asyncio.shield(self._inflight[flight_key])
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            value = await self._compute_flight(key, compute, ttl, variant, tags, stale_ttl, envelope)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # evitar el aviso si nadie más esperaba
+            raise
+        finally:
+            del self._inflight[flight_key]
+    
+    async def _compute_flight(self, key, compute, ttl, variant, tags, stale_ttl, envelope):
+        lock_key = f"{LOCK_PREFIX}{key}#{variant or ''}"
+        if not await self._acquire_lock(lock_key):
+            if envelope is not None:
+                # Otro worker está recalculando: servir el valor anterior
+                return envelope["v"]
+            
+            # Fallo completo: esperar al valor mientras el otro worker tenga el
+            # lock, aunque el origen sea lento. Sólo se calcula aquí si lo suelta
+            # sin guardar nada (su cálculo falló) o si caduca (cache_lock_ttl)
+            deadline = time.monotonic() + settings.cache_lock_ttl
+            while True:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                waited = await self.get(key, variant=variant, tags=tags)
+                if waited is not None:
+                    return waited["v"]
+                if await self._acquire_lock(lock_key):
+                    # Pudo guardarlo y soltar el lock entre las dos llamadas
+                    waited = await self.get(key, variant=variant, tags=tags)
+                    if waited is not None:
+                        await self._release_lock(lock_key)
+                        return waited["v"]
+                    break
+                if time.monotonic() >= deadline:
+                    break
+        
+        try:
+            started = time.time()
+            value = await compute()
+            finished = time.time()
+            await self.set(
+                key,
+                {"v": value, "x": finished + ttl, "d": finished - started},
+                ttl=ttl + stale_ttl,
+                variant=variant,
+                tags=tags
+            )
+            return value
+        finally:
+            await self._release_lock(lock_key)
+    
+    async def get_stats(self):
         """Obtener estadísticas del cache"""
-        if not self.connected:
+        tiers = {
+            "l1": self.local.stats() if self.local is not None else None,
+            "l2": {"hits": self.l2_hits, "misses": self.l2_misses},
+            "circuit_breaker": self.breaker.stats()
+        }
+        if not self.breaker.allow_request():
             return {
                 "type": "Redis",
                 "connected": False,
-                "error": "No conectado"
+                "error": "Circuit breaker abierto",
+                **tiers
             }
         
         try:
-            info = self.client.info()
+            info = await self.client.info()
+            keys = await self.client.dbsize()
+            self.breaker.record_success()
             return {
                 "type": "Redis",
                 "connected": True,
-                "keys": self.client.dbsize(),
+                "keys": keys,
                 "memory_usage": f"{info.get('used_memory_human', 'N/A')}",
-                "uptime": f"{info.get('uptime_in_seconds', 0)} segundos"
+                "uptime": f"{info.get('uptime_in_seconds', 0)} segundos",
+                **tiers
             }
-        except Exception as e:
+        except REDIS_ERRORS as e:
+            self.breaker.record_failure()
             return {
                 "type": "Redis",
                 "connected": False,
-                "error": str(e)
-            }
\ No newline at end of file
+                "error": str(e),
+                **tiers
+            }
+
+# Instancia compartida por la aplicación (GraphQL, /health, /stats)
+cache_manager = CacheManager()
+
+# Serialización de resultados de consultas
+#
+# Las filas se guardan como {"c": [columnas], "r": [[valores], ...]} con sólo
+# las columnas pedidas, y en un acierto se reconstruyen como filas de sólo
+# lectura (app/core/rows.py), que los tipos GraphQL resuelven igual que las
+# instancias cargadas de la base de datos.
+
+def dump_rows(rows, columns):
+    """Convertir filas o instancias del modelo en un payload compacto para el cache"""
+    payload_rows = []
+    for row in rows:
+        values = []
+        for column in columns:
+            value = getattr(row, column)
+            # date incluye datetime
+            values.append(value.isoformat() if isinstance(value, date) else value)
+        payload_rows.append(values)
+    return {"c": list(columns), "r": payload_rows}
+
+def load_rows(model, payload):
+    """Reconstruir las filas de sólo lectura de un payload de dump_rows"""
+    column_types = {attr.key: attr.columns[0].type for attr in inspect(model).column_attrs}
+    columns = tuple(payload["c"])
+    row = row_class(model, columns)
+    parsers = []
+    for i, column in enumerate(columns):
+        if isinstance(column_types.get(column), DateTime):
+            parsers.append((i, datetime.fromisoformat))
+        elif isinstance(column_types.get(column), Date):
+            parsers.append((i, date.fromisoformat))
+    if not parsers:
+        return [row._make(values) for values in payload["r"]]
+
+    rows = []
+    for values in payload["r"]:
+        # Copia: el payload puede ser el del nivel en memoria, compartido entre peticiones
+        values = list(values)
+        for i, parse in parsers:
+            if values[i] is not None:
+                values[i] = parse(values[i])
+        rows.append(row._make(values))
+    return rows
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Exportación en streaming de facturas y pedidos (NDJSON, CSV y Parquet)
+
+Las filas se leen con un cursor de servidor (``stream_results`` +
+``yield_per``: un cursor con nombre en psycopg2) por lotes de YIELD_PER y se
+serializan a trozos de CHUNK_SIZE bytes a medida que llegan, sin construir
+objetos del ORM ni listas completas: la memoria es constante sea cual sea el
+número de filas.
+
+Los pedidos se exportan con sus líneas: en NDJSON cada pedido lleva la lista
+``items``; en CSV y Parquet hay una fila por línea de pedido (las columnas del
+pedido se repiten y un pedido sin líneas ocupa una fila con las de la línea
+vacías).
+"""
+
+import csv
+import io
+import json
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, func, select
+from app.core.bulk import copy_value
+from app.models.models import Invoice, Order, OrderItem
+
+# Filas por lote leídas del cursor de servidor
+YIELD_PER = 2000
+
+# Bytes acumulados antes de enviar un trozo de la respuesta
+CHUNK_SIZE = 1 << 16
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+INVOICE_COLUMNS = [column for column in Invoice.__table__.columns]
+ORDER_COLUMNS = [column for column in Order.__table__.columns]
+ITEM_COLUMNS = [column for column in OrderItem.__table__.columns if column.name != "order_id"]
+
+
+def invoice_query(from_date=None, to_date=None, status=None, customer_id=None):
+    """Facturas filtradas como en el resolver invoices, por fecha e id"""
+    query = select(*INVOICE_COLUMNS)
+    if from_date is not None:
+        query = query.where(Invoice.date >= from_date)
+    if to_date is not None:
+        query = query.where(Invoice.date < to_date)
+    if status:
+        query = query.where(Invoice.status == status)
+    if customer_id:
+        query = query.where(Invoice.customer_id == customer_id)
+    return query.order_by(Invoice.date, Invoice.invoice_id)
+
+
+def order_query(from_date=None, to_date=None, status=None, customer_id=None):
+    """Pedidos con sus líneas (LEFT JOIN), filtrados como en el resolver orders"""
+
+    query = select(
+        *ORDER_COLUMNS, *[column.label(f"item_{column.name}") for column in ITEM_COLUMNS]
+    ).outerjoin(OrderItem, OrderItem.order_id == Order.order_id)
+    # Los pedidos de createOrder no tienen order_date: cuenta su created_at (como en stats.order_stats)
+    order_date = func.coalesce(Order.order_date, Order.created_at)
+    if from_date is not None:
+        query = query.where(order_date >= from_date)
+    if to_date is not None:
+        query = query.where(order_date < to_date)
+    if status:
+        query = query.where(Order.status == status)
+    if customer_id:
+        query = query.where(Order.customer_id == customer_id)
+    return query.order_by(Order.order_id, OrderItem.item_id)
+
+
+def stream_batches(engine, statement):
+    """Lotes de filas (dicts) leídos con un cursor de servidor"""
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=YIELD_PER).execute(statement)
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+
+def nest_items(batches):
+    """Agrupar las filas de order_query en pedidos con su lista items
+
+    Las filas llegan ordenadas por pedido, así que basta con el pedido en curso.
+    """
+    current = None
+    for batch in batches:
+        records = []
+        for row in batch:
+            if current is None or current["order_id"] != row["order_id"]:
+                if current is not None:
+                    records.append(current)
+                current = {column.name: row[column.name] for column in ORDER_COLUMNS}
+                current["items"] = []
+            if row["item_item_id"] is not None:
+                current["items"].append({column.name: row[f"item_{column.name}"] for column in ITEM_COLUMNS})
+        if records:
+            yield records
+    if current is not None:
+        yield [current]
+
+
+def _json_value(value):
+    value = copy_value(value)
+    if isinstance(value, list):
+        return [{key: _json_value(item) for key, item in entry.items()} for entry in value]
+    return value
+
+
+def ndjson_chunks(batches):
+    buffer = []
+    size = 0
+    for batch in batches:
+        for record in batch:
+            line = json.dumps({key: _json_value(value) for key, value in record.items()}, ensure_ascii=False) + "\n"
+            buffer.append(line)
+            size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def csv_chunks(batches, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows([copy_value(row[column]) for column in columns] for row in batch)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def arrow_type(column_type):
+    """Tipo de Arrow de una columna de SQLAlchemy"""
+    import pyarrow as pa
+
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC") if column_type.timezone else pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Destino de escritura del que se recogen los bytes ya escritos"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def take(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def parquet_chunks(batches, columns):
+    """Parquet con un row group por lote; cada row group se envía al cerrarlo"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, arrow_type(column_type)) for name, column_type in columns])
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="snappy") as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            data = sink.take()
+            if data:
+                yield data
+    yield sink.take()
+
+
+def export_chunks(engine, entity, file_format, **filters):
+    """Trozos de bytes de la exportación de invoices u orders en file_format"""
+    if entity == "invoices":
+        batches = stream_batches(engine, invoice_query(**filters))
+        columns = [(column.name, column.type) for column in INVOICE_COLUMNS]
+    else:
+        batches = stream_batches(engine, order_query(**filters))
+        columns = [(column.name, column.type) for column in ORDER_COLUMNS]
+        columns += [(f"item_{column.name}", column.type) for column in ITEM_COLUMNS]
+        if file_format == "ndjson":
+            batches = nest_items(batches)
+
+    if file_format == "ndjson":
+        return ndjson_chunks(batches)
+    if file_format == "csv":
+        return csv_chunks(batches, [name for name, _ in columns])
+    return parquet_chunks(batches, columns)
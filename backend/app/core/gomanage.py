@@ -0,0 +1,110 @@
+"""
+Cliente HTTP asíncrono de la API de GoManage
+
+Sólo lo usa la sincronización (app/core/sync.py): las consultas GraphQL leen
+las tablas locales y nunca llaman a GoManage. Un único httpx.AsyncClient con
+pool de conexiones (keep-alive) sirve todas las páginas.
+
+Contrato de los listados: ``GET /{entidad}?modified_since=<ISO 8601>&page=N&page_size=M``
+devuelve ``{"items": [...], "page": N, "pages": P, "total": T}`` con los
+registros ordenados por ``modified_at`` (fecha de última modificación, que
+tiene cada registro). Sin modified_since se devuelven todos.
+
+Los repositorios (app/repositories/gomanage.py) usan además estos filtros,
+que la API aplica antes de paginar:
+
+- ``campo=valor``, ``campo_in=v1,v2`` y ``campo_gte=valor``;
+- ``search=texto``: texto contenido en los campos de búsqueda de la entidad;
+- ``sort=campo,-campo``: orden (``-`` descendente) en lugar de modified_at;
+- ``fields=campo,campo``: devolver sólo esos campos de cada registro;
+- ``after=[v1, v2]``: JSON con los valores de sort de la última fila vista
+  (paginación keyset, las filas estrictamente posteriores en ese orden).
+"""
+
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Respuestas que se reintentan (además de los errores de red y timeouts)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Espera base (segundos) del backoff exponencial entre reintentos
+RETRY_BACKOFF = 0.5
+
+
+class GoManageError(Exception):
+    """Error de la API de GoManage tras agotar los reintentos"""
+
+
+class GoManageClient:
+    """Cliente de GoManage con pool de conexiones y reintentos
+
+    transport permite apuntar el cliente a un servidor falso en los tests
+    (httpx.ASGITransport) sin abrir sockets.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 max_connections: Optional[int] = None, timeout: Optional[float] = None,
+                 retries: Optional[int] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        api_key = settings.gomanage_api_key if api_key is None else api_key
+        max_connections = max_connections or settings.gomanage_max_connections
+        self.retries = settings.gomanage_retries if retries is None else retries
+        self.requests = 0
+        self._client = httpx.AsyncClient(
+            base_url=base_url or settings.gomanage_url,
+            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
+            timeout=timeout or settings.gomanage_timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def get(self, path: str, params: Dict[str, Any]) -> Any:
+        """GET con reintentos (backoff exponencial con jitter); devuelve el JSON"""
+        for attempt in range(self.retries + 1):
+            self.requests += 1
+            try:
+                response = await self._client.get(path, params=params)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.json()
+                error = f"HTTP {response.status_code}"
+            except httpx.HTTPStatusError as e:
+                raise GoManageError(f"GoManage {path}: HTTP {e.response.status_code}") from e
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.retries:
+                raise GoManageError(f"GoManage {path}: {error} tras {self.retries + 1} intentos")
+            delay = RETRY_BACKOFF * 2 ** attempt * (0.5 + random.random())
+            logger.warning(f"⚠️ GoManage {path}: {error}, reintento en {delay:.1f} s")
+            await asyncio.sleep(delay)
+
+    async def fetch_page(self, path: str, page_size: int, modified_since: Optional[datetime] = None,
+                         sort: Sequence[str] = ("modified_at",), after: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """Página keyset del listado de una entidad, modificada desde modified_since
+
+        Los registros van ordenados por sort; after son los valores de sort
+        del último registro de la página anterior (None para la primera).
+        """
+        params = {"sort": ",".join(sort), "page": 1, "page_size": page_size}
+        if modified_since is not None:
+            params["modified_since"] = modified_since.isoformat()
+        if after is not None:
+            params["after"] = json.dumps(after)
+        return await self.get(path, params)
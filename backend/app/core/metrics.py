@@ -0,0 +1,469 @@
+"""
+Métricas de rendimiento en formato de texto de Prometheus
+
+Contadores e histogramas en memoria del proceso (cada worker expone los
+suyos en /metrics y Prometheus los agrega):
+
+- Latencia de cada petición HTTP por ruta, y sentencias SQL y tiempo en la
+  base de datos por petición (eventos de cursor del engine, acumulados en una
+  ContextVar que abre el middleware ASGI).
+- Latencia de cada operación GraphQL y de cada resolver propio; los campos
+  que sólo leen un atributo no se miden, son la mayoría y no aportan nada.
+- Aciertos y fallos del cache por prefijo de clave y nivel (L1/L2).
+- Retraso y rendimiento de la sincronización con GoManage, de la última
+  lectura de sync_state (SyncStatusGauges): el scrape no consulta la base de
+  datos.
+
+Las etiquetas de una métrica se limitan a MAX_LABEL_SETS combinaciones para
+que nombres de operación arbitrarios no hagan crecer la memoria sin límite.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import Optional, Sequence
+from graphql import GraphQLObjectType, GraphQLSchema
+from sqlalchemy import event
+from app.core.config import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites superiores (segundos) de los buckets de latencia
+LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+# Los resolvers y las sentencias SQL suelen durar bastante menos
+FAST_LATENCY_BUCKETS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1]
+
+# Sentencias SQL por petición
+SQL_COUNT_BUCKETS = [0, 1, 2, 3, 5, 10, 20, 50, 100, 250]
+
+# Máximo de combinaciones de etiquetas por métrica; el resto se agrupa en OVERFLOW_LABEL
+MAX_LABEL_SETS = 500
+OVERFLOW_LABEL = "other"
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value)
+    return str(value)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """Base de contadores e histogramas: series por combinación de etiquetas"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _key(self, values):
+        # Llamar con el lock tomado
+        if values in self._series or len(self._series) < MAX_LABEL_SETS:
+            return values
+        return (OVERFLOW_LABEL,) * len(self.labels)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = [(values, self._copy(data)) for values, data in self._series.items()]
+        for values, data in sorted(series, key=lambda item: item[0]):
+            lines.extend(self._samples(values, data))
+        return lines
+
+
+class Counter(Metric):
+    """Contador monótono"""
+
+    kind = "counter"
+
+    def inc(self, *values, amount=1):
+        with self._lock:
+            key = self._key(values)
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, *values):
+        with self._lock:
+            return self._series.get(values, 0)
+
+    @staticmethod
+    def _copy(data):
+        return data
+
+    def _samples(self, values, data):
+        yield f"{self.name}{format_labels(self.labels, values)} {format_value(data)}"
+
+
+class Histogram(Metric):
+    """Histograma con buckets fijos (se exponen acumulados, como pide Prometheus)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = list(buckets)
+
+    def observe(self, amount, *values):
+        index = bisect_left(self.buckets, amount)
+        with self._lock:
+            key = self._key(values)
+            data = self._series.get(key)
+            if data is None:
+                data = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            data[0][index] += 1
+            data[1] += amount
+            data[2] += 1
+
+    def count(self, *values):
+        with self._lock:
+            data = self._series.get(values)
+            return data[2] if data else 0
+
+    @staticmethod
+    def _copy(data):
+        return [list(data[0]), data[1], data[2]]
+
+    def _samples(self, values, data):
+        counts, total, count = data
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + [float("inf")], counts):
+            cumulative += bucket_count
+            labels = format_labels(self.labels + ("le",), values + (format_value(float(bound)),))
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = format_labels(self.labels, values)
+        yield f"{self.name}_sum{labels} {format_value(float(total))}"
+        yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Conjunto de métricas que se exponen juntas"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labels=()):
+        return self.register(Counter(name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def clear(self):
+        for metric in self.metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "Peticiones HTTP por ruta y código de estado", ("method", "route", "status"))
+HTTP_DURATION = registry.histogram(
+    "http_request_duration_seconds", "Latencia de las peticiones HTTP", ("method", "route"))
+REQUEST_SQL_STATEMENTS = registry.histogram(
+    "http_request_sql_statements", "Sentencias SQL ejecutadas por petición", ("route",), SQL_COUNT_BUCKETS)
+REQUEST_SQL_DURATION = registry.histogram(
+    "http_request_sql_duration_seconds", "Tiempo en la base de datos por petición", ("route",))
+SQL_DURATION = registry.histogram(
+    "sql_statement_duration_seconds", "Latencia de cada sentencia SQL por tipo", ("statement",), FAST_LATENCY_BUCKETS)
+GRAPHQL_OPERATIONS = registry.histogram(
+    "graphql_operation_duration_seconds", "Latencia de ejecución de las operaciones GraphQL", ("type", "operation"))
+GRAPHQL_ERRORS = registry.counter(
+    "graphql_operation_errors_total", "Operaciones GraphQL que devolvieron errores", ("type", "operation"))
+GRAPHQL_RESOLVERS = registry.histogram(
+    "graphql_resolver_duration_seconds", "Latencia de los resolvers propios por campo", ("field",), FAST_LATENCY_BUCKETS)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Lecturas del cache por prefijo de clave y resultado (l1_hit, l2_hit, miss, error)",
+    ("prefix", "result"))
+
+
+# --- Métricas por petición -------------------------------------------------
+
+class RequestMetrics:
+    """Acumulado de SQL de la petición en curso"""
+
+    __slots__ = ("sql_statements", "sql_seconds")
+
+    def __init__(self):
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+
+
+current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+def route_label(scope) -> str:
+    """Plantilla de la ruta (p. ej. /export/orders) o prefijo del montaje (/graphql)"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    return scope.get("root_path") or "unmatched"
+
+
+class MetricsMiddleware:
+    """Middleware ASGI: latencia, código de estado y SQL de cada petición HTTP"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestMetrics()
+        token = current_request.set(request)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            route = route_label(scope)
+            HTTP_REQUESTS.inc(scope["method"], route, str(status))
+            HTTP_DURATION.observe(elapsed, scope["method"], route)
+            REQUEST_SQL_STATEMENTS.observe(request.sql_statements, route)
+            REQUEST_SQL_DURATION.observe(request.sql_seconds, route)
+
+
+# --- SQL -------------------------------------------------------------------
+
+def statement_kind(statement: str) -> str:
+    """Primera palabra de la sentencia en mayúsculas (SELECT, INSERT, ...)"""
+    words = statement.lstrip(" \t\r\n(").split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if settings.metrics_enabled:
+        conn.info.setdefault("metrics_started", []).append((context, time.perf_counter()))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("metrics_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()[1]
+    SQL_DURATION.observe(elapsed, statement_kind(statement))
+    request = current_request.get()
+    if request is not None:
+        request.sql_statements += 1
+        request.sql_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    """Descartar el inicio de una sentencia que falló (no llega a after_cursor_execute)
+
+    Sin esto cada error deja una entrada en conn.info, que vive lo que la
+    conexión del pool, y la siguiente sentencia mediría desde ese inicio.
+    Sólo se saca si es la de la ejecución que falló: los errores al leer el
+    resultado llegan aquí después de after_cursor_execute.
+    """
+    connection, context = exception_context.connection, exception_context.execution_context
+    started = connection.info.get("metrics_started") if connection is not None else None
+    if started and context is not None and started[-1][0] is context:
+        started.pop()
+
+
+def instrument_engine(engine):
+    """Medir las sentencias de un engine (síncrono o el sync_engine de uno asíncrono)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+# --- GraphQL ---------------------------------------------------------------
+
+def operation_labels(operation):
+    """(tipo, nombre) de una operación GraphQL para las etiquetas"""
+    if operation is None:
+        return "unknown", "anonymous"
+    name = operation.name.value if operation.name else "anonymous"
+    return operation.operation.value, name
+
+
+def observe_operation(operation, elapsed, errors):
+    labels = operation_labels(operation)
+    GRAPHQL_OPERATIONS.observe(elapsed, *labels)
+    if errors:
+        GRAPHQL_ERRORS.inc(*labels)
+
+
+def is_attribute_resolver(resolve) -> bool:
+    """Resolver por defecto de graphene o de graphene-sqlalchemy (lee un atributo)"""
+    if resolve is None:
+        return True
+    if isinstance(resolve, functools.partial):
+        return resolve.func.__name__ in ("dict_or_attr_resolver", "attr_resolver", "dict_resolver")
+    return getattr(resolve, "__qualname__", "").startswith("get_attr_resolver.")
+
+
+def timed_resolver(label: str, resolve):
+    """Envolver un resolver para registrar su latencia en GRAPHQL_RESOLVERS"""
+
+    @functools.wraps(resolve)
+    def resolver(root, info, **args):
+        if not settings.metrics_enabled:
+            return resolve(root, info, **args)
+        started = time.perf_counter()
+        result = resolve(root, info, **args)
+        if isinstance(result, asyncio.Future):
+            # DataLoader: un callback cuesta menos que envolver el futuro en una corrutina
+            result.add_done_callback(lambda _: GRAPHQL_RESOLVERS.observe(time.perf_counter() - started, label))
+            return result
+        if isawaitable(result):
+            return _observe_awaitable(result, started, label)
+        GRAPHQL_RESOLVERS.observe(time.perf_counter() - started, label)
+        return result
+
+    resolver.metrics_label = label
+    return resolver
+
+
+async def _observe_awaitable(result, started, label):
+    try:
+        return await result
+    finally:
+        GRAPHQL_RESOLVERS.observe(time.perf_counter() - started, label)
+
+
+def instrument_schema(schema: GraphQLSchema):
+    """Medir los resolvers propios de un schema de graphql-core
+
+    Se envuelven una sola vez al construir el schema en lugar de usar un
+    middleware de ejecución: graphql-core consulta el middleware en cada campo
+    de cada fila, también en los que sólo leen un atributo, y eso cuesta más
+    que lo que se mide.
+    """
+    for type_ in schema.type_map.values():
+        if not isinstance(type_, GraphQLObjectType) or type_.name.startswith("__"):
+            continue
+        for name, field in type_.fields.items():
+            if is_attribute_resolver(field.resolve) or hasattr(field.resolve, "metrics_label"):
+                continue
+            field.resolve = timed_resolver(f"{type_.name}.{name}", field.resolve)
+    return schema
+
+
+# --- Cache -----------------------------------------------------------------
+
+def key_prefix(key: str) -> str:
+    """Prefijo de una clave de cache: hasta el primer ':' o, si no hay, el primer '_'"""
+    separator = ":" if ":" in key else "_"
+    return key.split(separator, 1)[0]
+
+
+def record_cache(key: str, result: str):
+    if settings.metrics_enabled:
+        CACHE_REQUESTS.inc(key_prefix(key), result)
+
+
+# --- Pool de conexiones ----------------------------------------------------
+
+def render_pool_stats(pool_stats) -> str:
+    """Gauges y contadores de los pools (get_pool_stats) en formato Prometheus"""
+    gauges = {
+        "db_pool_checked_out": ("Conexiones en uso", "checked_out", "gauge"),
+        "db_pool_overflow": ("Conexiones por encima de pool_size", "overflow", "gauge"),
+        "db_pool_waiting": ("Peticiones esperando una conexión", "waiting", "gauge"),
+        "db_pool_checkouts_total": ("Conexiones entregadas", "checkouts", "counter"),
+        "db_pool_timeouts_total": ("Esperas que agotaron pool_timeout", "timeouts", "counter"),
+    }
+    lines = []
+    for name, (help, field, kind) in gauges.items():
+        samples = [
+            f'{name}{{pool="{pool}"}} {status[field]}'
+            for pool, status in sorted(pool_stats.items()) if field in status
+        ]
+        if samples:
+            lines.extend([f"# HELP {name} {help}", f"# TYPE {name} {kind}", *samples])
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class SyncStatusGauges:
+    """Última lectura de sync_state para /metrics
+
+    La actualizan el trabajo de sincronización al guardar su marca de agua
+    (si corre en este proceso) y, cada METRICS_SYNC_REFRESH segundos, una
+    tarea de fondo de la aplicación (el cron de sync_gomanage.py es otro
+    proceso). El lag se adelanta al exponerlo con el tiempo transcurrido
+    desde la lectura.
+    """
+
+    def __init__(self):
+        self.status = []
+        self.read_at = None
+
+    def update(self, status, read_at: Optional[float] = None):
+        self.status = status
+        self.read_at = time.time() if read_at is None else read_at
+
+    def render(self) -> str:
+        elapsed = time.time() - self.read_at if self.read_at is not None else 0.0
+        return render_sync_status([
+            dict(status, lag_seconds=round(status["lag_seconds"] + elapsed, 3))
+            if status["lag_seconds"] is not None else status
+            for status in self.status
+        ])
+
+
+sync_status_gauges = SyncStatusGauges()
+
+
+def render_sync_status(sync_status) -> str:
+    """Gauges de la sincronización con GoManage (app.core.sync.sync_status)"""
+    gauges = {
+        "gomanage_sync_lag_seconds": ("Segundos desde la última sincronización completa", "lag_seconds"),
+        "gomanage_sync_last_rows": ("Filas copiadas en la última sincronización", "last_rows"),
+        "gomanage_sync_last_duration_seconds": ("Duración de la última sincronización", "last_duration"),
+        "gomanage_sync_rows_per_second": ("Filas por segundo de la última sincronización", "rows_per_second"),
+    }
+    lines = []
+    for name, (help, field) in gauges.items():
+        samples = [
+            f'{name}{{entity="{status["entity"]}"}} {status[field]}'
+            for status in sync_status if status[field] is not None
+        ]
+        if samples:
+            lines.extend([f"# HELP {name} {help}", f"# TYPE {name} gauge", *samples])
+    return "\n".join(lines) + "\n" if lines else ""
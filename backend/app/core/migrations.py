@@ -0,0 +1,52 @@
+"""
+Migraciones de la base de datos (Alembic)
+
+Se aplican fuera del proceso web, antes de arrancarlo (start.py,
+bulk_import.py o ``python -m app.core.migrations`` en el contenedor);
+importar la aplicación no crea ni modifica tablas.
+"""
+
+import os
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from app.core.database import engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(BACKEND_DIR, "alembic.ini")
+
+# Revisión con las tablas que antes creaba Base.metadata.create_all
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection=None) -> Config:
+    """Configuración de Alembic independiente del directorio actual"""
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    # El logging ya lo configura la aplicación
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_database(bind=None, revision: str = "head"):
+    """Aplicar las migraciones pendientes
+
+    Las bases creadas con create_all tienen las tablas pero no
+    alembic_version: se marcan con la revisión inicial antes de actualizar.
+    """
+    bind = bind if bind is not None else engine
+    with bind.begin() as connection:
+        config = alembic_config(connection)
+        tables = inspect(connection).get_table_names()
+        if "alembic_version" not in tables and "customers" in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+    upgrade_database()
@@ -0,0 +1,108 @@
+"""
+Pool de conexiones instrumentado
+
+Subclases de los pools de SQLAlchemy que miden la latencia de cada checkout
+(el tiempo que una petición espera por una conexión), cuántas peticiones están
+esperando en cada momento y cuántas agotaron pool_timeout.
+"""
+
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Límites superiores (ms) de los buckets del histograma de latencia de checkout
+CHECKOUT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class PoolMetrics:
+    """Contadores de uso del pool de conexiones"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waiting = 0
+        self.max_waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.latency_sum_ms = 0.0
+        self.bucket_counts = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+
+    def start_checkout(self):
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+        return time.perf_counter()
+
+    def end_checkout(self, started, timed_out=False, failed=False):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        index = len(CHECKOUT_BUCKETS_MS)
+        for i, bound in enumerate(CHECKOUT_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+            elif not failed:
+                self.checkouts += 1
+                self.latency_sum_ms += elapsed_ms
+                self.bucket_counts[index] += 1
+
+    def snapshot(self):
+        """Copia de los contadores con el histograma acumulado (estilo Prometheus)"""
+        with self._lock:
+            cumulative = 0
+            histogram = []
+            for bound, count in zip(CHECKOUT_BUCKETS_MS + ["+Inf"], self.bucket_counts):
+                cumulative += count
+                histogram.append({"le": str(bound), "count": cumulative})
+
+            return {
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "checkout_latency_avg_ms": round(self.latency_sum_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "checkout_latency_ms": histogram,
+            }
+
+
+def instrumented_pool_class(base_class, metrics):
+    """Crear una subclase de base_class que registra sus checkouts en metrics"""
+
+    class InstrumentedPool(base_class):
+        def _do_get(self):
+            started = metrics.start_checkout()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.end_checkout(started, timed_out=True)
+                raise
+            except BaseException:
+                metrics.end_checkout(started, failed=True)
+                raise
+            metrics.end_checkout(started)
+            return connection
+
+    InstrumentedPool.__name__ = InstrumentedPool.__qualname__ = f"Instrumented{base_class.__name__}"
+    InstrumentedPool.metrics = metrics
+    return InstrumentedPool
+
+
+def pool_status(pool):
+    """Estado actual de un pool (conexiones en uso, libres y overflow)"""
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    metrics = getattr(type(pool), "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
+
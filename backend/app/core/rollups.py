@@ -0,0 +1,229 @@
+"""
+Tablas resumen (rollups) de ventas y facturas por cliente
+
+- customer_daily_sales: pedidos y total por (cliente, día, estado).
+- customer_stats: una fila por cliente con sus pedidos, su total y sus
+  facturas abiertas, de modo que ``Customer.stats`` se lee por clave.
+
+Se actualizan de forma incremental en la misma transacción que los cambios
+del ORM (evento after_flush): cada pedido o factura insertado, modificado o
+borrado suma o resta su contribución con un upsert. Lo que no pasa por el
+ORM (COPY de bulk_import.py, SQL manual) y las facturas que vencen con el
+paso del tiempo se corrigen con reconcile(), que recalcula las dos tablas
+desde las tablas base (reconcile_rollups.py, periódicamente).
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import delete, event, func, insert, inspect, literal, select, update
+from sqlalchemy.orm import Session
+from app.models.models import Customer, CustomerDailySales, CustomerStats, Invoice, Order
+
+logger = logging.getLogger(__name__)
+
+# Facturas que ya no forman parte del saldo pendiente
+CLOSED_INVOICE_STATUSES = ("paid", "cancelled")
+
+STATS_COLUMNS = ["order_count", "order_total", "open_invoice_count", "open_invoice_balance", "overdue_invoice_count"]
+
+ORDER_ATTRS = ["customer_id", "order_date", "status", "total_amount", "created_at"]
+INVOICE_ATTRS = ["customer_id", "status", "amount", "due_date"]
+
+
+def utcnow():
+    return datetime.now(timezone.utc)
+
+
+def _values(obj, attrs, previous=False):
+    """Valores actuales (o anteriores al flush) de los atributos de obj"""
+    state = inspect(obj)
+    values = []
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if previous and history.deleted:
+            values.append(history.deleted[0])
+        elif previous and history.added:
+            # Valor anterior no cargado: la reconciliación corrige la diferencia
+            values.append(None)
+        else:
+            values.append(getattr(obj, attr))
+    return values
+
+
+def _as_utc(value):
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class RollupDelta:
+    """Contribuciones acumuladas de un flush, agrupadas por fila resumen"""
+
+    def __init__(self):
+        self.daily = defaultdict(lambda: [0, 0.0])
+        self.stats = defaultdict(lambda: dict.fromkeys(STATS_COLUMNS, 0))
+
+    def add_order(self, customer_id, order_date, status, amount, created_at, sign):
+        if customer_id is None:
+            return
+        # Sin fecha de pedido cuenta la de creación, como en reconcile(); sólo
+        # si todavía no se conoce (default now() de la base) se toma la actual
+        day = (order_date or created_at or utcnow()).date()
+        amount = (amount or 0.0) * sign
+        daily = self.daily[(customer_id, day, status or "pending")]
+        daily[0] += sign
+        daily[1] += amount
+        stats = self.stats[customer_id]
+        stats["order_count"] += sign
+        stats["order_total"] += amount
+
+    def add_invoice(self, customer_id, status, amount, due_date, sign):
+        if customer_id is None or status in CLOSED_INVOICE_STATUSES:
+            return
+        stats = self.stats[customer_id]
+        stats["open_invoice_count"] += sign
+        stats["open_invoice_balance"] += (amount or 0.0) * sign
+        if due_date is not None and _as_utc(due_date) < utcnow():
+            stats["overdue_invoice_count"] += sign
+
+    def collect(self, session):
+        """Sumar las contribuciones de los objetos pendientes del flush"""
+        for obj in session.new:
+            if isinstance(obj, Order):
+                self.add_order(*_values(obj, ORDER_ATTRS), 1)
+            elif isinstance(obj, Invoice):
+                self.add_invoice(*_values(obj, INVOICE_ATTRS), 1)
+        for obj in session.deleted:
+            if isinstance(obj, Order):
+                self.add_order(*_values(obj, ORDER_ATTRS, previous=True), -1)
+            elif isinstance(obj, Invoice):
+                self.add_invoice(*_values(obj, INVOICE_ATTRS, previous=True), -1)
+        for obj in session.dirty:
+            if isinstance(obj, Order) and session.is_modified(obj):
+                self.add_order(*_values(obj, ORDER_ATTRS, previous=True), -1)
+                self.add_order(*_values(obj, ORDER_ATTRS), 1)
+            elif isinstance(obj, Invoice) and session.is_modified(obj):
+                self.add_invoice(*_values(obj, INVOICE_ATTRS, previous=True), -1)
+                self.add_invoice(*_values(obj, INVOICE_ATTRS), 1)
+
+    def __bool__(self):
+        return bool(self.daily or self.stats)
+
+
+def _upsert(connection, model, keys, increments, rows):
+    """Sumar las columnas increments de cada fila de rows, creándola si no existe
+
+    En PostgreSQL y SQLite es un único INSERT ... ON CONFLICT DO UPDATE
+    ejecutado con executemany para todas las filas.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={name: table.c[name] + statement.excluded[name] for name in increments}
+        )
+        connection.execute(statement, rows)
+        return
+
+    for row in rows:
+        where = [table.c[name] == row[name] for name in keys]
+        result = connection.execute(
+            update(table).where(*where).values({name: table.c[name] + row[name] for name in increments})
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(**row))
+
+
+def apply_delta(connection, delta: RollupDelta):
+    """Escribir las contribuciones en las tablas resumen"""
+    _upsert(connection, CustomerDailySales, ["customer_id", "day", "status"], ["order_count", "total_amount"], [
+        {"customer_id": customer_id, "day": day, "status": status, "order_count": count, "total_amount": amount}
+        for (customer_id, day, status), (count, amount) in delta.daily.items() if count or amount
+    ])
+    _upsert(connection, CustomerStats, ["customer_id"], STATS_COLUMNS, [
+        dict(increments, customer_id=customer_id)
+        for customer_id, increments in delta.stats.items() if any(increments.values())
+    ])
+
+
+def _load_previous_value(target, value, oldvalue, initiator):
+    pass
+
+
+# Con active_history el ORM carga el valor anterior al asignar un atributo
+# (tras un commit los objetos están expirados y el historial estaría vacío)
+for _model, _attrs in ((Order, ORDER_ATTRS), (Invoice, INVOICE_ATTRS)):
+    for _attr in _attrs:
+        event.listen(getattr(_model, _attr), "set", _load_previous_value, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def update_rollups(session, flush_context):
+    """Mantener los rollups en la transacción de cada flush con pedidos o facturas"""
+    delta = RollupDelta()
+    delta.collect(session)
+    if delta:
+        apply_delta(session.connection(), delta)
+
+
+def reconcile(connection, now=None):
+    """Recalcular las tablas resumen desde pedidos y facturas
+
+    Borra y vuelve a insertar las dos tablas con ``INSERT ... SELECT ...
+    GROUP BY`` dentro de la transacción de connection. Devuelve el número de
+    filas escritas en cada tabla.
+    """
+    now = now or utcnow()
+    order_day = func.date(func.coalesce(Order.order_date, Order.created_at))
+
+    connection.execute(delete(CustomerDailySales))
+    daily = select(
+        Order.customer_id, order_day, func.coalesce(Order.status, "pending"),
+        func.count(), func.coalesce(func.sum(Order.total_amount), 0.0),
+    ).where(Order.customer_id.is_not(None)).group_by(Order.customer_id, order_day, func.coalesce(Order.status, "pending"))
+    daily_rows = connection.execute(
+        insert(CustomerDailySales).from_select(
+            ["customer_id", "day", "status", "order_count", "total_amount"], daily
+        )
+    ).rowcount
+
+    orders = select(
+        Order.customer_id.label("customer_id"),
+        func.count().label("order_count"),
+        func.coalesce(func.sum(Order.total_amount), 0.0).label("order_total"),
+    ).group_by(Order.customer_id).subquery()
+    is_open = Invoice.status.is_(None) | Invoice.status.not_in(CLOSED_INVOICE_STATUSES)
+    invoices = select(
+        Invoice.customer_id.label("customer_id"),
+        func.count().label("open_invoice_count"),
+        func.coalesce(func.sum(Invoice.amount), 0.0).label("open_invoice_balance"),
+        func.count(Invoice.due_date).filter(Invoice.due_date < now).label("overdue_invoice_count"),
+    ).where(is_open).group_by(Invoice.customer_id).subquery()
+
+    connection.execute(delete(CustomerStats))
+    stats = select(
+        Customer.customer_id,
+        func.coalesce(orders.c.order_count, 0),
+        func.coalesce(orders.c.order_total, 0.0),
+        func.coalesce(invoices.c.open_invoice_count, 0),
+        func.coalesce(invoices.c.open_invoice_balance, 0.0),
+        func.coalesce(invoices.c.overdue_invoice_count, 0),
+        literal(now, CustomerStats.reconciled_at.type),
+    ).outerjoin(orders, orders.c.customer_id == Customer.customer_id).outerjoin(
+        invoices, invoices.c.customer_id == Customer.customer_id
+    )
+    stats_rows = connection.execute(
+        insert(CustomerStats).from_select(["customer_id"] + STATS_COLUMNS + ["reconciled_at"], stats)
+    ).rowcount
+
+    logger.info(f"📊 Rollups reconciliados: {daily_rows} filas diarias, {stats_rows} clientes")
+    return {"customer_daily_sales": daily_rows, "customer_stats": stats_rows}
@@ -0,0 +1,34 @@
+"""
+Filas de sólo lectura para las lecturas de los resolvers
+
+Los repositorios SQL ejecutan select() de Core sobre las columnas pedidas y
+devuelven cada fila como una tupla con nombre (``__slots__`` vacío): sin
+identity map ni estado del ORM, crear 1.000 filas cuesta una fracción de lo
+que cuesta hidratar 1.000 instancias, y no hay atributos diferidos que
+puedan lanzar DetachedInstanceError después de cerrar la sesión. Los tipos
+GraphQL las aceptan igual que las instancias del modelo (ver ModelType en
+app/schemas/graphql_schema.py).
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Tuple
+from sqlalchemy import inspect
+
+
+@lru_cache(maxsize=None)
+def row_class(model, columns: Tuple[str, ...]) -> type:
+    """Clase de fila de model con los atributos columns (una por selección)"""
+    base = namedtuple(f"{model.__name__}Row", columns)
+    return type(base.__name__, (base,), {"__slots__": (), "__model__": model})
+
+
+@lru_cache(maxsize=None)
+def model_columns(model) -> Tuple[str, ...]:
+    """Atributos de columna del modelo, en orden de definición"""
+    return tuple(attr.key for attr in inspect(model).column_attrs)
+
+
+def row_model(row):
+    """Modelo de una fila de row_class (None si row no es una de ellas)"""
+    return getattr(type(row), "__model__", None)
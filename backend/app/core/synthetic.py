@@ -0,0 +1,155 @@
+"""
+Generador determinista de datos sintéticos para pruebas de carga
+
+Cada tabla se genera en streaming con su propio random.Random derivado de la
+semilla, así que la misma semilla produce siempre los mismos registros (y se
+pueden volver a recorrer, p. ej. los pedidos para generar sus facturas) sin
+guardar millones de filas en memoria.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+ORDER_STATUSES = ["pending", "confirmed", "shipped", "delivered", "cancelled"]
+INVOICE_STATUSES = ["pending", "paid", "overdue"]
+NOTICE_PRIORITIES = ["low", "medium", "high", "urgent"]
+NOTICE_STATUSES = ["open", "in_progress", "resolved", "closed"]
+CITIES = ["Madrid", "Barcelona", "Sevilla", "Valencia", "Bilbao", "Zaragoza", "Málaga", "Murcia"]
+COMPANY_WORDS = ["SOLUCIONES", "DISTRIBUCIONES", "TECNOLOGÍA", "SUMINISTROS", "SERVICIOS", "INDUSTRIAS"]
+PRODUCT_WORDS = ["Licencia", "Módulo", "Servicio", "Mantenimiento", "Consultoría", "Formación"]
+
+
+class SyntheticDataset:
+    """Clientes, productos, pedidos, líneas, facturas y avisos sintéticos"""
+
+    def __init__(self, orders=1000, seed=42, customers=None, products=None, notices=None,
+                 start=datetime(2024, 1, 1)):
+        self.seed = seed
+        self.num_orders = orders
+        self.num_customers = customers or max(1, orders // 50)
+        self.num_products = products or min(max(5, orders // 100), 5000)
+        self.num_notices = notices if notices is not None else max(1, orders // 10)
+        self.start = start
+
+    def _rng(self, name):
+        return random.Random(f"{self.seed}:{name}")
+
+    @staticmethod
+    def business_name(customer_id):
+        return f"{COMPANY_WORDS[customer_id % len(COMPANY_WORDS)]} {customer_id:07d} SL"
+
+    def customers(self):
+        rng = self._rng("customers")
+        for customer_id in range(1, self.num_customers + 1):
+            yield {
+                "customer_id": customer_id,
+                "business_name": self.business_name(customer_id),
+                "name": f"Contacto {customer_id}",
+                "email": f"cliente{customer_id}@ejemplo.es",
+                "vat_number": f"B{customer_id:08d}",
+                "street_name": f"Calle {rng.randint(1, 300)}",
+                "postal_code": rng.randint(1000, 52999),
+                "city": rng.choice(CITIES),
+                "country_id": "ES",
+                "phone": f"9{rng.randint(10000000, 99999999)}",
+                "created_at": self.start + timedelta(minutes=customer_id),
+            }
+
+    def product_prices(self):
+        rng = self._rng("products")
+        return [round(rng.uniform(5, 2000), 2) for _ in range(self.num_products)]
+
+    def products(self):
+        rng = self._rng("product_details")
+        for index, price in enumerate(self.product_prices(), start=1):
+            yield {
+                "product_id": f"PROD{index:06d}",
+                "reference": f"REF-{index:06d}",
+                "description": f"{rng.choice(PRODUCT_WORDS)} {index}",
+                "price": price,
+                "stock": rng.randint(0, 500),
+                "active": rng.random() > 0.05,
+            }
+
+    def orders(self):
+        rng = self._rng("orders")
+        for order_id in range(1, self.num_orders + 1):
+            # Pedidos repartidos en el tiempo en orden de creación, como en producción
+            created_at = self.start + timedelta(seconds=order_id * 30 + rng.randint(0, 29))
+            yield {
+                "order_id": order_id,
+                "reference": f"ORD-{order_id:08d}",
+                "customer_id": rng.randint(1, self.num_customers),
+                "order_date": created_at,
+                "delivery_date": created_at + timedelta(days=rng.randint(3, 15)),
+                "total_amount": round(rng.uniform(20, 5000), 2),
+                "status": rng.choice(ORDER_STATUSES),
+                "notes": None,
+                "created_at": created_at,
+            }
+
+    def order_items(self):
+        rng = self._rng("order_items")
+        prices = self.product_prices()
+        item_id = 0
+        for order_id in range(1, self.num_orders + 1):
+            for product_index in rng.sample(range(self.num_products), min(rng.randint(1, 4), self.num_products)):
+                item_id += 1
+                quantity = rng.randint(1, 10)
+                unit_price = prices[product_index]
+                yield {
+                    "item_id": item_id,
+                    "order_id": order_id,
+                    "product_id": f"PROD{product_index + 1:06d}",
+                    "quantity": quantity,
+                    "unit_price": unit_price,
+                    "total_price": round(quantity * unit_price, 2),
+                }
+
+    def invoices(self):
+        rng = self._rng("invoices")
+        invoice_id = 0
+        for order in self.orders():
+            if order["status"] not in ("shipped", "delivered"):
+                continue
+            invoice_id += 1
+            invoice_date = order["delivery_date"] + timedelta(days=1)
+            yield {
+                "invoice_id": invoice_id,
+                "reference": f"FAC-{invoice_id:08d}",
+                "customer_id": order["customer_id"],
+                "customer_name": self.business_name(order["customer_id"]),
+                "amount": order["total_amount"],
+                "date": invoice_date,
+                "due_date": invoice_date + timedelta(days=30),
+                "status": rng.choice(INVOICE_STATUSES),
+                "created_at": invoice_date,
+            }
+
+    def notices(self):
+        rng = self._rng("notices")
+        for notice_id in range(1, self.num_notices + 1):
+            customer_id = rng.randint(1, self.num_customers)
+            created_date = self.start + timedelta(minutes=notice_id * 7)
+            yield {
+                "notice_id": notice_id,
+                "customer_id": customer_id,
+                "title": f"Aviso #{notice_id} - {self.business_name(customer_id)}",
+                "description": "Aviso generado para pruebas de carga",
+                "priority": rng.choice(NOTICE_PRIORITIES),
+                "status": rng.choice(NOTICE_STATUSES),
+                "assigned_to": f"empleado{rng.randint(1, 20)}",
+                "created_date": created_date,
+                "due_date": created_date + timedelta(days=rng.randint(1, 14)),
+            }
+
+    def tables(self):
+        """{tabla: generador de registros} en orden de carga"""
+        return {
+            "customers": self.customers(),
+            "products": self.products(),
+            "orders": self.orders(),
+            "order_items": self.order_items(),
+            "invoices": self.invoices(),
+            "notices": self.notices(),
+        }
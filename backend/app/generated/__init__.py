@@ -0,0 +1 @@
+# Código generado por app/codegen/generate.py
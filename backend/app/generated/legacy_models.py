@@ -0,0 +1,8428 @@
+# Generado por app/codegen/generate.py a partir de TablasGraphQL_comas_utf8.txt. No editar.
+# generator: 1 source: 7f1069ea19b1c2c6d5bb272b627a073181aaeead300732bae0b38b7c925d76a8
+"""
+Modelos de las tablas del diccionario de datos heredado
+
+El diccionario no indica claves primarias: se usa Id_unico o <tabla>_id si
+existen; las tablas sin identificador heredan de ReadOnlyRow y su identidad
+es la fila completa.
+"""
+
+from sqlalchemy import BigInteger, Boolean, Column, Date, DateTime, Integer, Numeric, String, Text
+from sqlalchemy.orm import declarative_base, declared_attr
+
+LegacyBase = declarative_base()
+
+
+class ReadOnlyRow:
+    """Tabla sin clave conocida: la identidad del modelo es la fila completa"""
+
+    @declared_attr.directive
+    def __mapper_args__(cls):
+        return {"primary_key": list(cls.__table__.columns)}
+
+
+class Notes(LegacyBase):
+    """Control de Avisos (atconav)"""
+    __tablename__ = "atconav"
+
+    activity = Column("act_tmt", Numeric(11, 3), doc="Actividad")
+    attachments = Column("adj_avis", Boolean, doc="Documentos Adjuntos asociados")
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    item = Column("art_aso", String(24), doc="Introduzca el Código de artículo")
+    assigned = Column("asi_avis", Boolean, doc="Asignado")
+    charge = Column("car_avis", Boolean, doc="Cargo")
+    code = Column("cce_avis", Integer, doc="Introduzca el código del Cliente o Entidad")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_atconav", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_atconav", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_atconav", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_atconav", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    closing_date = Column("cie_avis", Date, doc="Fecha de Cierre")
+    tax_identification_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. del Cliente")
+    scope_r_833 = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    activity_r_502 = Column("cod_acto", Integer, doc="Actividad")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    notification = Column("cod_avis", Integer, doc="Aviso")
+    original_notice = Column("Cod_aviso", Integer, doc="Aviso Original")
+    shipping_code = Column("cod_ceen", Integer, doc="Código de la dirección de Envio")
+    shipping_address = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Envío")
+    customer = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    contract = Column("cod_ctr", Integer, doc="Introduzca Código de Contrato")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    potential_customer = Column("cod_dir", Integer, doc="Introduzca el Código de Cliente Potencial")
+    employee = Column("cod_empl", Integer, doc="Código de Empleado que Posee el Aviso en este Estado")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    status = Column("cod_nest", Integer, doc="Código de Estado del Aviso")
+    service_number = Column("cod_nse", Integer, doc="Introduzca nº de servicio")
+    project = Column("cod_obr", Integer, doc="Introduzca el Código de Obra/Proyecto")
+    country = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    priority = Column("cod_prio", String(2), doc="Prioridad")
+    origin = Column("cod_proc", String(3), doc="Introduzca la Procedencia del Aviso")
+    code_r_210 = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    representative_code = Column("cod_rep", Integer, doc="Ag.Comercial")
+    subactivity = Column("cod_sac", Integer, doc="Subactividad")
+    series = Column("cod_ser", String(14), doc="Nº de Serie del Artículo")
+    code_r_699 = Column("cod_szon", Integer, doc="Introduzca Código Subzona")
+    notification_type = Column("cod_tipa", String(4), doc="Introduzca Tipo de Aviso")
+    user = Column("cod_usu", String(8), doc="Usuario")
+    address_line = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    area = Column("cod_zon", Integer, doc="Introduzca el Código de Zona")
+    customer_potential_customer = Column("coe_avis", Boolean, doc="Introduzca si es un Cliente o un cliente potencial")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia del Cliente")
+    comment = Column("com_avis", String(800), doc="Introduzca Comentario del Aviso")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_atconav", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_atconav", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_atconav", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_138 = Column("dec4_atconav", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("desa_avis", String(40), doc="Introduzca la Descripción del Artículo")
+    description_r_791 = Column("des_avis", String(80), doc="Introduzca Descripción del Aviso")
+    address = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    destination_employee = Column("ede_avis", Integer, doc="Introduzca Empleado Destino del Aviso")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    sent_email_associated_employee = Column("eee_avis", Boolean, doc="Enviado por e-mail a los empleados Asociados")
+    email = Column("ema_cli", String(60), doc="Introduzca el e-mail del Cliente")
+    origin_employee = Column("eor_avis", Integer, doc="Introduzca Empleado Origen del Aviso")
+    sent_employee_associated_sms = Column("ese_avis", Boolean, doc="Enviado por sms a los Empleados Asociados")
+    est_avis = Column("est_avis", Boolean, doc="Abierto")
+    notification_status = Column("evo_avis", String(1), doc="Estado en el que se encuentra el aviso")
+    fax = Column("fax_cli", String(18), doc="Introduzca el Fax del Cliente")
+    response_date = Column("fcon_avis", Date, doc="Introduzca la Fecha de Contestación.")
+    customer_system_creation_date = Column("fcsc_avis", Date, doc="Fecha Creación Sistema Cliente")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_atconav", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_atconav", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_atconav", Date, doc="fecha3Tlmp")
+    date = Column("fec_avis", Date, doc="Introduzca Fecha del Aviso")
+    allocation_date = Column("fec_imp", Date, doc="Fecha Imputación")
+    expected_date = Column("fep_avis", Date, doc="Introduzca Fecha del Aviso")
+    request_date = Column("fpet_avis", Date, doc="Fecha Petición")
+    notification_reception_date = Column("frec_avis", Date, doc="Fecha Recepción Aviso")
+    actual_resolution_end_date = Column("fref_avis", Date, doc="Fecha Real Final Resolución")
+    actual_resolution_start_date = Column("frer_avis", Date, doc="Fecha Real Inicio Resolución")
+    customer_system_creation_time = Column("hcsc_avis", String(5), doc="Hora Creación Sistema Cliente")
+    estimated_resolution_start_time = Column("hep_avis", String(5), doc="Hora Prevista Inicio Resolución")
+    time = Column("Hor_avis", String(5), doc="Introduzca Hora del aviso")
+    request_time = Column("hpet_avis", String(5), doc="Hora Petición")
+    notification_reception_time = Column("hrec_avis", String(5), doc="Hora Recepción Aviso")
+    actual_resolution_end_time = Column("href_avis", String(5), doc="Hora Real Final Resolución")
+    actual_resolution_start_time = Column("hrer_avis", String(5), doc="Hora Real Inicio Resolución")
+    actual_resolution_hours = Column("hrr_avis", String(6), doc="Horas Reales Resolución")
+    theoretical_resolution_hours = Column("hter_avis", String(6), doc="Horas Teóricas Resolución")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    requester_person = Column("per_avis", String(200), doc="Persona Petición")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    published = Column("pub_avis", Boolean, doc="Publicado para Distrinet")
+    customer_r_395 = Column("p_cod_cli", Integer, doc="Cliente")
+    destination = Column("p_cod_des", String(3), doc="Introduzca el Destino del Aviso")
+    potential_customer_r_468 = Column("p_cod_dir", Integer, doc="Cliente Potencial")
+    origin_r_892 = Column("p_cod_ori", String(3), doc="Introduzca el Origen del Aviso")
+    origin_r_834 = Column("p_cod_proc", String(9), doc="Introduzca la Procedencia del Aviso")
+    p_ver_avis = Column("p_ver_avis", Boolean, doc="ver avisos no asignados")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    reference = Column("ref_avis", String(20), doc="Referencia")
+    resolution = Column("res_avis", String(800), doc="Resolución")
+    subactivity_r_912 = Column("sact_tmt", Numeric(11, 3), doc="Subactividad")
+    show_load_by = Column("sel_param", String(2), doc="Mostrar Carga planificador Mensual")
+    phone_number = Column("tel_cli", String(18), doc="Introduzca el Teléfono del Cliente")
+    document = Column("xdoc_avis", String(80), doc="Introduzca Documento Asociado al Aviso")
+
+
+class NoticeDrafts(LegacyBase):
+    """Borradores de Avisos (atconavb)"""
+    __tablename__ = "atconavb"
+
+    has_attachments = Column("adj_avis", Boolean, doc="Documentos Adjuntos asociados")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    product_id = Column("art_aso", String(24), doc="Introduzca el Código de artículo")
+    assigned = Column("asi_avis", Boolean, doc="Asignado")
+    charge = Column("car_avis", Boolean, doc="Cargo")
+    customer_or_potencial_id = Column("cce_avis", Integer, doc="Introduzca el código del Cliente o Entidad")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    characteristic1_code = Column("char1_atconavb", String(8), doc="character1Tlmp")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    characteristics_2d_temp = Column("char2_atconavb", String(8), doc="character2Tlmp")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    characteristics_3pl_mapping = Column("char3_atconavb", String(100), doc="character3Tlmp")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    characteristics_4tlmp = Column("char4_atconavb", String(100), doc="character4Tlmp")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    closing_date = Column("cie_avis", Date, doc="Fecha de Cierre")
+    customer_vat_id = Column("cif_cli", String(18), doc="Introduzca el C.I.F. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    activity_id = Column("cod_acto", Integer, doc="Actividad")
+    service_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    notice_id = Column("cod_avis", Integer, doc="Aviso")
+    draft_id = Column("cod_avisb", Integer, doc="Borrador Aviso")
+    original_notice = Column("Cod_aviso", Integer, doc="Aviso Original")
+    shipping_address_id = Column("cod_ceen", Integer, doc="Código de la dirección de Envio")
+    shipping_address_id_cod_cen = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Envío")
+    contract_id = Column("cod_ctr", Integer, doc="Introduzca Código de Contrato")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    worker_id = Column("cod_empl", Integer, doc="Código de Empleado que Posee el Aviso en este Estado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    notice_status = Column("cod_nest", Integer, doc="Código de Estado del Aviso")
+    service_number = Column("cod_nse", Integer, doc="Introduzca nº de servicio")
+    work_id = Column("cod_obr", Integer, doc="Introduzca el Código de Obra/Proyecto")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    priority_id = Column("cod_prio", String(2), doc="Prioridad")
+    origin_id = Column("cod_proc", String(3), doc="Introduzca la Procedencia del Aviso")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    sales_representative_id = Column("cod_rep", Integer, doc="Cod.Representante")
+    subactivity_id = Column("cod_sac", Integer, doc="Subactividad")
+    serial_number = Column("cod_ser", String(14), doc="Nº de Serie del Artículo")
+    notice_type = Column("cod_tipa", String(4), doc="Introduzca Tipo de Aviso")
+    user_id = Column("cod_usu", String(8), doc="Usuario")
+    draft_user_id = Column("Cod_usub", String(8), doc="Usuario que ha creado el Borrador")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    customer_or_potential = Column("coe_avis", Boolean, doc="Introduzca si es un Cliente o un cliente potencial")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia del Cliente")
+    comments = Column("com_avis", String(800), doc="Introduzca Comentario del Aviso")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_atconavb", Numeric(7, 2), doc="decimal1Tlmp")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_atconavb", Numeric(7, 2), doc="decimal2Tlmp")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_atconavb", Numeric(11, 3), doc="decimal3Tlmp")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_atconavb", Numeric(11, 3), doc="decimal4Tlmp")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    product_description = Column("desa_avis", String(40), doc="Introduzca la Descripción del Artículo")
+    notice_description = Column("des_avis", String(80), doc="Introduzca Descripción del Aviso")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    target_worker = Column("ede_avis", Integer, doc="Introduzca Empleado Destino del Aviso")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    sent_e_mail = Column("eee_avis", Boolean, doc="Enviado por e-mail a los empleados Asociados")
+    customer_mail = Column("ema_cli", String(60), doc="Introduzca el e-mail del Cliente")
+    origin_worker = Column("eor_avis", Integer, doc="Introduzca Empleado Origen del Aviso")
+    draft_errors = Column("Err_avisb", String(800), doc="Lista de Campos con Errores")
+    sent_sms = Column("ese_avis", Boolean, doc="Enviado por sms a los Empleados Asociados")
+    open_closed_notice = Column("est_avis", Boolean, doc="Estado")
+    draft_status = Column("Est_avisb", String(2), doc="Estado Borrador")
+    notice_status_evo_avis = Column("evo_avis", String(1), doc="Estado en el que se encuentra el aviso")
+    fax = Column("fax_cli", String(18), doc="Introduzca el Fax del Cliente")
+    reply_date = Column("fcon_avis", Date, doc="Introduzca la Fecha de Contestación.")
+    creation_date = Column("fcsc_avis", Date, doc="Fecha Creación Sistema Cliente")
+    user_date1 = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_atconavb", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date_2nd_half_temp = Column("fec2_atconavb", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_temp = Column("fec3_atconavb", Date, doc="fecha3Tlmp")
+    notice_date = Column("fec_avis", Date, doc="Introduzca Fecha del Aviso")
+    draft_date = Column("Fec_avisb", Date, doc="Fecha en la que se ha creado el Borrador")
+    planned_date = Column("fep_avis", Date, doc="Introduzca Fecha del Aviso")
+    request_date = Column("fpet_avis", Date, doc="Fecha Petición")
+    receipt_date = Column("frec_avis", Date, doc="Fecha Recepción Aviso")
+    resolution_final_date = Column("fref_avis", Date, doc="Fecha Real Final Resolución")
+    resolution_start_date = Column("frer_avis", Date, doc="Fecha Real Inicio Resolución")
+    creation_time = Column("hcsc_avis", String(5), doc="Hora Creación Sistema Cliente")
+    resolution_start_time = Column("hep_avis", String(5), doc="Hora Prevista Inicio Resolución")
+    notice_time = Column("Hor_avis", String(5), doc="Introduzca Hora del aviso")
+    draft_time = Column("Hor_avisb", String(5), doc="Hora en la que se ha creado el Borrador")
+    request_time = Column("hpet_avis", String(5), doc="Hora Petición")
+    receipt_time = Column("hrec_avis", String(5), doc="Hora Recepción Aviso")
+    resolution_final_time = Column("href_avis", String(5), doc="Hora Real Final Resolución")
+    resolution_start_time_hrer_avis = Column("hrer_avis", String(5), doc="Hora Real Inicio Resolución")
+    actual_hours_resolution = Column("hrr_avis", String(6), doc="Horas Reales Resolución")
+    theoretical_hours_resolution = Column("hter_avis", String(6), doc="Horas Teóricas Resolución")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    draft_comments = Column("obs_avisb", String(800), doc="Observaciones Borrador")
+    request_person = Column("per_avis", String(200), doc="Persona Petición")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    published_notice = Column("pub_avis", Boolean, doc="Publicado para Distrinet")
+    customer = Column("p_cod_cli", Integer, doc="Cliente")
+    potential_customer_r_939 = Column("p_cod_dir", Integer, doc="Cliente Potencial")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    notice_reference = Column("ref_avis", String(20), doc="Referencia")
+    resolution = Column("res_avis", String(800), doc="Resolución")
+    revised_dtraft = Column("rev_avisb", Boolean, doc="Borrador Revisado")
+    phone = Column("tel_cli", String(18), doc="Introduzca el Teléfono del Cliente")
+
+
+class NoticeStatus(ReadOnlyRow, LegacyBase):
+    """Maestro de Estados de la gestión de Aviso (atconest)"""
+    __tablename__ = "atconest"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    characteristic1_code = Column("char1_atconest", String(8), doc="character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="character2Usr")
+    characteristics_mapping = Column("char2_atconest", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    characteristics_3pl_mapping = Column("char3_atconest", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    characteristics_4tlmp = Column("char4_atconest", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    closure = Column("cie_nest", Boolean, doc="Indique si el estado permite el cierre del aviso")
+    status = Column("cod_nest", Integer, doc="Código del Estado")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_atconest", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_atconest", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_atconest", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_atconest", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    custom_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_nest", String(40), doc="Descripción del Estado")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="editor2Usr")
+    send_email = Column("ema_nest", Boolean, doc="Desea enviar E-mail al Cliente")
+    date1_user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_atconest", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_atconest", Date, doc="fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3qtr_tmp = Column("fec3_atconest", Date, doc="fecha3Tlmp")
+    create_notification_movement = Column("mov_nest", Boolean, doc="¿ Desea Generar movimiento en el Aviso ?")
+    porsic = Column("porsic", String(8), doc="TlmpPorsic_atconest")
+    porsil = Column("porsil", Boolean, doc="TlmpPorsil_atconest")
+    porsin = Column("porsin", Integer, doc="TlmpPorsin_atconest")
+    publish = Column("pub_nest", Boolean, doc="¿ Desea Publicar en Distrinet ?")
+    responsible_person = Column("res_nest", Boolean, doc="Indica si tiene control de un Responsable de Aviso")
+    customer_text = Column("txtc_nest", String(1000), doc="Texto Cliente")
+    employee_text = Column("txte_nest", String(1000), doc="Texto Empleado")
+    information_text = Column("txt_nest", String(800), doc="Introduzca Texto Informativo")
+
+
+class CommercialAction(LegacyBase):
+    """Movimientos del Seguimiento Comercial (atmovseg)"""
+    __tablename__ = "atmovseg"
+
+    quote_annex = Column("ane_pre", Integer, doc="Anexo")
+    cancellation_reason = Column("anu_mos", String(800), doc="Motivo de Anulación")
+    has_technical_support = Column("apo_mos", Boolean, doc="¿ Apoyo Técnico ?")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    document_text = Column("char1_atmovseg", String(8), doc="character1Tlmp")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    offer_description = Column("char2_atmovseg", String(8), doc="character2Tlmp")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    competition = Column("char3_atmovseg", String(100), doc="character3Tlmp")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    incidents = Column("char4_atmovseg", String(100), doc="character4Tlmp")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    commercial_id = Column("cod_com", String(8), doc="Introduzca Código de Comercial")
+    customer_or_potential_id = Column("cod_cop", Integer, doc="Introduzca Código de Cliente o Cliente Potencial")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    worker_id = Column("cod_empl", Integer, doc="Código del Empleado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    stage_id = Column("cod_ests", Integer, doc="Introduzca Estado de Seguimiento")
+    quote_id = Column("cod_pre", Integer, doc="Presupuesto")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante")
+    tracking_id = Column("cod_seg", String(10), doc="Seguimiento")
+    default_contact_id = Column("cod_telc", Integer, doc="Persona de Contacto")
+    customer_or_potential = Column("cop_mos", Boolean, doc="Introduzca Cliente o Cliente Potencial")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_mos", String(40), doc="Introduzca Descripción de la Acción Comercial")
+    related_document_id = Column("doc_mos", Integer, doc="Introduzca número de documento")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    bill_id = Column("efc_ppg", Integer, doc="Introduzca Número de Efecto")
+    status = Column("est_mos", String(1), doc="Introduzca Estado: (P)endiente,(R)ealizado,(A)nulado")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_mos", Date, doc="Introduzca Fecha del Movimiento")
+    time = Column("hor_mos", String(5), doc="Introduzca hora del seguimiento")
+    commercial_action_id = Column("id_atmovseg", Numeric(8, 0), primary_key=True, doc="id_atmovseg")
+    notes = Column("obs_mos", String(800), doc="Introduzca Observaciones del Seguimiento")
+    is_published = Column("pub_mos", Boolean, doc="Publicable")
+    is_pending_revision = Column("rev_mos", Boolean, doc="Pendiente Revisión")
+    related_document_type = Column("tdo_mos", String(1), doc="Introduzca Tipo de Documento")
+    time_estimate = Column("tes_mos", String(5), doc="Tiempo Estimado")
+    quote_version = Column("ver_pre", Integer, doc="Versión")
+
+
+class NoticeTypes(ReadOnlyRow, LegacyBase):
+    """Tipos de Avisos (attipav)"""
+    __tablename__ = "attipav"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    characteristic1_code = Column("char1_attipav", String(8), doc="character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="character2Usr")
+    characteristics_mapping2 = Column("char2_attipav", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    characteristics_temperature = Column("char3_attipav", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    characteristics_4plm = Column("char4_attipav", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    notification_type = Column("cod_tipa", String(4), doc="Introduzca Tipo de Aviso")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_attipav", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_attipav", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_attipav", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_attipav", Numeric(11, 3), doc="decimal4Tlmp")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tipa", String(60), doc="Introduzca Descripción Tipo de Aviso")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1_user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_attipav", Date, doc="fecha1Tlmp")
+    date_to_user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_attipav", Date, doc="fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3qtmp = Column("fec3_attipav", Date, doc="fecha3Tlmp")
+    portal_publishable = Column("pub_tipa", Boolean, doc="Publicable Portal")
+
+
+class Confirming(LegacyBase):
+    """Gestión Confirming (gaconf)"""
+    __tablename__ = "gaconf"
+
+    discounted = Column("acud_conf", Numeric(12, 2), doc="Introduzca el Importe del descontado en el Confirming")
+    has_attachments = Column("adj_conf", Boolean, doc="Doc. Adj.")
+    accounting_entry_id = Column("asi_conf", Integer, doc="Introduzca el Número del Asiento del Confirming")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    branch_id = Column("cod_defp", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    confirming_id = Column("cod_nco", Integer, doc="Introduzca el Número de Confirming")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    accounting_account = Column("cta_conf", String(2), doc="Cuenta de Contabilización del Confirming")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_conf", String(40), doc="Introduzca descripción del Confirming")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    state = Column("est_conf", String(1), doc="Estado del Confirming: (C)reado, (L)iquidado, (D)escontado")
+    user_date1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_conf", Date, doc="Introduzca Fecha del Confirming")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    amount = Column("imp_conf", Numeric(12, 2), doc="Introduzca el Importe de confirming.")
+    is_printed = Column("ipr_conf", Boolean, doc="¿ Impreso el Confirming ?")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    confirming_type = Column("tip_conf", String(1), doc="Tipo: (C)onfirming, (R)elación de Pagos")
+    currency_value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+
+
+class ProductBarcode(ReadOnlyRow, LegacyBase):
+    """Diferentes Códigos de Barra para cada Artículo (galarcb)"""
+    __tablename__ = "galarcb"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    barcode = Column("cod_cba", String(28), doc="Introduzca Código de Barras")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    code_type = Column("cod_tcb", Integer, doc="Introduzca Tipo Código de Barras")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    is_favorite = Column("hab_cba", Boolean, doc="Código de Barras Habitual")
+
+
+class ProductBranch(ReadOnlyRow, LegacyBase):
+    """Propiedades de los Artículos en cada Empresa/Delegación (galardel)"""
+    __tablename__ = "galardel"
+
+    abc_class = Column("abc_art", String(1), doc="Introduzca el ABC del Artículo")
+    manufacturing_warehouse_id = Column("alm_fab", Integer, doc="Introduzca el Almacén de entrada del Producto Fabricado")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    replaced_by = Column("asu_art", String(24), doc="Substituido por")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    receipt_batch_counter = Column("clote_art", Integer, doc="Introduzca Contador lote de Entrada")
+    minimum_quantity_second_discount = Column("cmi_art", Integer, doc="Introduzca Cantidad Mínima del Segundo Descuento Marca/Familia")
+    receipts_warehouse_id = Column("cod_alm_e", Integer, doc="Introduzca el Almacén de entrada")
+    issues_warehouse_id = Column("cod_alm_s", Integer, doc="Introduzca el Almacén de Salida")
+    tariff_code = Column("cod_aran", Integer, doc="Código Arancelario")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_Ent", Integer, doc="Intoduzca la Entidad")
+    product_range_id = Column("cod_gam", Integer, doc="Código de Gama de Productos")
+    vat_id = Column("cod_iva", Integer, doc="Introduzca el Código de IVA")
+    canary_vat_id = Column("cod_ivc", Integer, doc="Introduzca el Código de IVA Canarios")
+    housing_vat_id = Column("cod_ivp", Integer, doc="Introduzca el Código de IVA de promotoras")
+    origin_country_id = Column("cod_pai", String(2), doc="Código de País Origen")
+    vendor_id = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    status_id = Column("cod_sit", Integer, doc="Situación")
+    receipts_location_id = Column("cod_ubi_e", String(13), doc="Introduzca la Ubicación de Entrada")
+    issues_location_id = Column("cod_ubi_s", String(13), doc="Introduzca la Ubicación de Salida")
+    packing_unit_base = Column("cod_uea_b", String(2), doc="Introduzca la Unidad de Embalaje Base de Actualiz. Automática")
+    packing_unit_purchases = Column("cod_uea_c", String(2), doc="Introduzca la Unidad de Embalaje en Compras")
+    packing_unit_manufacturing = Column("cod_uea_pr", String(2), doc="Introduzca la Unidad de Embalaje de Producción")
+    packing_unit_stock = Column("cod_uea_st", String(2), doc="Introduzca la Unidad de Embalaje de Stock")
+    packing_unit_sales = Column("cod_uea_v", String(2), doc="Introduzca la Unidad de Embalaje en Ventas")
+    receipts_zone_id = Column("cod_zona_e", String(1), doc="Introduzca la Zona de Entrada")
+    issues_zone_id = Column("cod_zona_s", String(1), doc="Introduzca la Zona de Salida")
+    consumption_average = Column("con_art", Numeric(8, 2), doc="Consumo Medio")
+    initial_cost = Column("cosi_art", Numeric(12, 5), doc="Introduzca el Coste Inicial")
+    weighted_average_cost = Column("cos_art", Numeric(12, 5), doc="Introduzca el Coste Medio Ponderado del Artículo")
+    is_tradable = Column("cov_art", Boolean, doc="¿Es Articulo de Compra/Venta?")
+    stock_reserved = Column("crs_art", Numeric(9, 2), doc="Introduzca la Cantidad Reservada")
+    serial_number_counter = Column("cser_art", Integer, doc="Introduzca Contador Números de Serie")
+    account_purchases = Column("ctc_art", String(25), doc="Introduzca la Cta. de Compras")
+    account_passed_returns_tax = Column("ctdr_art", String(25), doc="Cta. para RAEE Dev. Repercutido")
+    account_supported_returns_tax = Column("ctds_art", String(25), doc="Cta. para RAEE Dev Soportado")
+    account_sales_returns = Column("ctdv_art", String(25), doc="Introduzca la Cta. de Devoluciones de Ventas")
+    has_vendor_control = Column("ctrp_art", Boolean, doc="Indica si se realiza Control de Proveedores para este Artículo")
+    account_passed_tax = Column("cttr_art", String(25), doc="Cta. para RAEE Repercutido")
+    account_supported_tax = Column("ctts_art", String(25), doc="Cta. para RAEE Soportado")
+    account_sales = Column("ctv_art", String(25), doc="Introduzca la Cta. de Ventas")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    group_discount = Column("dgs_art", Boolean, doc="¿ Utiliza Descuentos por Grupo/Subgrupo ?")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    is_manufactured = Column("fab_art", Boolean, doc="¿Es Articulo de Fabricación?")
+    last_deleted_date = Column("feb_art", Date, doc="Introduzca la Fecha del Ultimo Borrado")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    kit_increment = Column("kca_art", Numeric(9, 2), doc="Introduzca el Precio de Incremento en el Kit")
+    kit_currency_id = Column("kdi_art", String(3), doc="Introduzca las Divisas del Precio del Kit")
+    kit_increment_percent = Column("kin_art", Numeric(4, 2), doc="Introduzca el % de Incremento en el Precio")
+    has_batch_number_control = Column("lote_art", Boolean, doc="¿Tiene Control de Lotes?")
+    purchase_batch = Column("lot_com", Numeric(9, 2), doc="Lote Compra")
+    minimum_stock_criteria_months = Column("mca_art", Integer, doc="Nº Meses Consumo Anual")
+    shows_message = Column("mms_art", Boolean, doc="Mostrar Mensaje")
+    message = Column("msg_art", String(1600), doc="Mensaje")
+    service_level = Column("nser_art", Numeric(5, 2), doc="% Nivel de Servicio")
+    has_serial_number_control = Column("nse_art", Boolean, doc="¿Utiliza Números de Serie?")
+    cost_origin = Column("ocos_art", String(1), doc="Origen Coste")
+    receipt_batch_prefix = Column("plote_art", String(3), doc="Introduzca Prefijo Lote Entrada")
+    vendor_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    serial_number_prefix = Column("pser_art", String(3), doc="Introduzca Prefijo Números de Serie")
+    stock_assigned = Column("sas_art", Numeric(9, 2), doc="Introduzca la Cantidad Asignada")
+    maximum_stock_criteria_weeks = Column("sem_art", Integer, doc="Nº Semanas")
+    stock_minimum = Column("smi_art", Numeric(8, 2), doc="Introduzca el Stock Mínimo del Artículo")
+    stock_maximum = Column("smx_art", Numeric(9, 2), doc="Introduzca el Stock Máximo del Artículo")
+    allows_negative_stock = Column("sne_art", Boolean, doc="Control de Stock Negativo")
+    stock_pending_manufacture = Column("spf_art", Numeric(9, 2), doc="Introduzca la Cantidad Pdte. Fabricar")
+    stock_pending_receive = Column("spr_art", Numeric(11, 2), doc="Introduzca el Stock Pendiente de Recibir")
+    stock_pending_issue = Column("sps_art", Numeric(8, 2), doc="Introduzca el Stock Pendiente de Servir del Artículo")
+    stock_real = Column("sre_art", Numeric(9, 2), doc="Introduzca el Stock Real del Artículo")
+    stock_reserved_at_location = Column("srr_art", Numeric(9, 2), doc="Stock que se encuentra en Ubicaciones Reservadas")
+    stock_transit_send = Column("ste_art", Numeric(9, 2), doc="Stock en Tránsito Enviados entre Delegaciones")
+    stock_initial = Column("sti_art", Numeric(9, 2), doc="Introduzca el Stock Inicial del Artículo")
+    stock_transit_receive = Column("str_art", Numeric(9, 2), doc="Stock en Tránsito de Recepción entre Delegaciones")
+    installation_time_lower = Column("tiin_art", Numeric(6, 0), doc="Introduzca el tiempo de Instalación Inferior")
+    installation_time = Column("tins_art", Numeric(6, 0), doc="Introduzca el tiempo de Instalación")
+    installation_time_upper = Column("tisu_art", Numeric(6, 0), doc="Introduzca el tiempo de Instalación Superior.")
+    minimum_stock_criteria_service_time = Column("trs_art", Numeric(4, 2), doc="Tiempo Reaprovisionamiento + Tiempo Seguridad")
+    location = Column("ubi_art", String(13), doc="Introduzca la Ubicación más Habitual del Artículo")
+    manufacturing_location_id = Column("ubi_fab", String(13), doc="Introduzca la Ubicación de Entrada del Producto Fabricado")
+    last_work_item_price = Column("uppa_art", Numeric(14, 5), doc="Último Precio de Partida-Obra")
+    manufacturing_zone_id = Column("zon_fab", String(1), doc="Introduzca la Zona de Entrada del Producto Fabricado")
+
+
+class ProductDescription(ReadOnlyRow, LegacyBase):
+    """Descripciones Alternativas del cada Articulo (galardes)"""
+    __tablename__ = "galardes"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    language_id = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    alt_description = Column("des_dalt", String(800), doc="Introduzca la Descripción del Articulo Expresada en el Idioma")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+
+
+class ProductSerialNumber(ReadOnlyRow, LegacyBase):
+    """Maestro de Números de Serie de los Artículos con Tratamiento de Número d (galarser)"""
+    __tablename__ = "galarser"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    is_locked = Column("blq_ser", Boolean, doc="Bloqueado")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    serial_number = Column("cod_ser", String(40), doc="nº de Serie")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    origin_document = Column("doc_ser", String(18), doc="Introduzca N.Documento de Origen")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    creation_date = Column("fec_ser", Date, doc="Introduzca la Fecha de Registro")
+    origin = Column("ori_ser", String(2), doc="Introduzca Origen")
+
+
+class Product(LegacyBase):
+    """Maestro de las Propiedades Generales de los Artículos (galartic)"""
+    __tablename__ = "galartic"
+
+    has_attachments = Column("adj_art", Boolean, doc="Documentos Adjuntos")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    auxiliar_code = Column("aux_art", String(24), doc="Introduzca Código Auxiliar Asociado al Artículo")
+    is_deregistered = Column("baj_art", Boolean, doc="¿Baja?")
+    container_type = Column("bob_art", String(1), doc="(E)mbalaje, (C)ontenido, (N)o Contenedor")
+    ecommerce_commercial_description_criteria = Column("cdec_art", String(3), doc="Criterio Des. Comercial")
+    ecommerce_description_criteria = Column("cdes_art", String(3), doc="Criterio Descripción")
+    has_expiry_control = Column("cfc_art", Boolean, doc="Control F. Caducidad")
+    fluorinated_gas_quantity = Column("cgf_art", Numeric(8, 2), doc="Cantidad de Gas Fluorado")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    ecommerce_image_criteria = Column("cim_art", String(3), doc="Criterio Imágenes")
+    cfdi_sat_code = Column("cla_sat", String(8), doc="Clave SAT")
+    default_attachment_id = Column("cod_agd", Integer, doc="Contador Documento")
+    equivalency = Column("cod_are", String(8), doc="Introduzca Equivalencia")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    classification1_id = Column("cod_fam1", Integer, doc="Introduzca el Primer Nivel de Familia")
+    classification2_id = Column("cod_fam2", Integer, doc="Introduzca el Segundo Nivel de Familia")
+    classification3_id = Column("cod_fam3", Integer, doc="Introduzca el Tercer Nivel de Familia")
+    classification4_id = Column("cod_fam4", Integer, doc="Introduzca el Cuarto Nivel de Familia")
+    discount_classification = Column("cod_fdto", Integer, doc="Introduzca la familia descuento")
+    group_id = Column("cod_grc", String(4), doc="Introduzca el Código de Grupo del Artículos")
+    subgroup_id = Column("cod_gru", String(4), doc="Introduzca el Código de Subgrupo del Artículo")
+    measurement_unit_base = Column("cod_um", String(2), doc="Introduzca la Unidad de Medida base (UM Alt = UM Base * FConv)")
+    telematel_code = Column("ctl_art", String(20), doc="Introduzca el Código Coorp/Tel")
+    is_discontinued = Column("dcat_art", Boolean, doc="Producto vinculado descatalogado")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description_long = Column("dell_art", String(800), doc="Desc. Ampliada")
+    description_short = Column("dep_art", String(800), doc="Introduzca la Descripción Propia del Artículo")
+    is_compounded = Column("desc_art", Boolean, doc="Indica si el Artículo es un descompuesto")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    creation_date = Column("fec_art", Date, doc="Fecha de Creación del Artículo")
+    is_expenses = Column("gas_art", Boolean, doc="Artículo de Gastos")
+    has_fluorinated_gas = Column("gfl_art", Boolean, doc="Contiene Gas Fluorado")
+    is_tool = Column("her_art", Boolean, doc="Artículo de tipo Herramienta")
+    id_art = Column("id_art", String(20), doc="Introduzca el código del artículo del banco de datos")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    is_kit = Column("kit_art", Boolean, doc="Introduzca (S/N) Es un Kit")
+    is_ancilliary = Column("mac_art", Boolean, doc="Indica si el Artículo es un Material Accesorio")
+    brand_id = Column("mar_art", Integer, doc="Introduzca el Código de la Marca a la que pertenece el Articulo")
+    is_assembled = Column("mon_art", Boolean, doc="Artículo de Montaje")
+    notes = Column("obs_art", String(1600), doc="Introduzca Observaciones del Articulo")
+    is_work_item = Column("pao_art", Boolean, doc="Partida de Obras")
+    is_on_request = Column("precio_cero", Boolean, doc="Bajo Consulta")
+    is_published = Column("pub_art", Boolean, doc="Indica si el Art?culo es Publicable en Web")
+    reference = Column("ref_art", String(24), doc="Introduzca Referencia del Fabricante para el Artículo")
+    has_freight_retention = Column("ret_fle", Boolean, doc="Efectuar Retención de Fletes")
+    is_service = Column("ser_art", Boolean, doc="¿Es un Artrículo de Servicios?")
+    has_recycling_tax = Column("tas_art", Boolean, doc="¿Artículo con Tasa de Reciclaje?")
+    equivalency_mode = Column("teq_art", String(1), doc="Introduzca tipo de Agrupación")
+    fluorinated_gas_type = Column("tgf_art", String(20), doc="Tipo de Gas")
+
+
+class ProductClassificationLanguages(ReadOnlyRow, LegacyBase):
+    """Descripción Multi-idioma de los Tipos de Clasificaciones (galclaii)"""
+    __tablename__ = "galclaii"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Código de Tipo de Clasificación")
+    language_id = Column("cod_idi", String(3), doc="Código de Idioma")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cli", String(50), doc="Descripción de Tipo de Clasificación")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+
+
+class ProductByClassification(ReadOnlyRow, LegacyBase):
+    """Diferentes Clasificaciones a las que Pertenece cada Artículo (galclart)"""
+    __tablename__ = "galclart"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    product_classification_level_6 = Column("niv_cl6", Integer, doc="Nivel 6")
+    product_classification_level_7 = Column("niv_cl7", Integer, doc="Nivel 7")
+    product_classification_level_8 = Column("niv_cl8", Integer, doc="Nivel 8")
+    product_classification_level_9 = Column("niv_cl9", Integer, doc="Nivel 9")
+
+
+class ProductClassification(LegacyBase):
+    """Maestro de Tipos de Clasificaciones en los que se Puede Agrupar los Arti (galclasi)"""
+    __tablename__ = "galclasi"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, primary_key=True, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_clf", String(50), doc="Descripción del Tipo de Clasificación")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+
+
+class ProductClassificationLevel1(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 1 (galcla_1)"""
+    __tablename__ = "galcla_1"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl1", String(75), doc="Descripción del Nivel 1")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    order = Column("ord_cl1", Integer, doc="Orden del Nivel 1")
+
+
+class ProductClassificationLevel2(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 2 (galcla_2)"""
+    __tablename__ = "galcla_2"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl2", String(75), doc="Descripción Nivel 2")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    order = Column("ord_cl2", Integer, doc="Orden")
+
+
+class ProductClassificationLevel3(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 3 (galcla_3)"""
+    __tablename__ = "galcla_3"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl3", String(75), doc="Descripción Nivel 3")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    order = Column("ord_cl3", Integer, doc="Orden Nivel 3")
+
+
+class ProductClassificationLevel4(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 4 (galcla_4)"""
+    __tablename__ = "galcla_4"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl4", String(75), doc="Descripción Nivel 4")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    order = Column("ord_cl4", Integer, doc="Orden Nivel 4")
+
+
+class ProductClassificationLevel5(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 5 (galcla_5)"""
+    __tablename__ = "galcla_5"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl5", String(75), doc="Descripción Nivel 5")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    order = Column("ord_cl5", Integer, doc="Orden Nivel 5")
+
+
+class ProductClassificationLevel6(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 6 (galcla_6)"""
+    __tablename__ = "galcla_6"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl6", String(75), doc="Descripción Nivel 6")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    product_classification_level_6 = Column("niv_cl6", Integer, doc="Nivel 6")
+    order = Column("ord_cl6", Integer, doc="Orden Nivel 6")
+
+
+class ProductClassificationLevel7(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 7 (galcla_7)"""
+    __tablename__ = "galcla_7"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl7", String(75), doc="Descripción Nivel  7")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    product_classification_level_6 = Column("niv_cl6", Integer, doc="Nivel 6")
+    product_classification_level_7 = Column("niv_cl7", Integer, doc="Nivel 7")
+    order = Column("ord_cl7", Integer, doc="Orden Nivel 7")
+
+
+class ProductClassificationLevel8(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 8 (galcla_8)"""
+    __tablename__ = "galcla_8"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl8", String(75), doc="Descripción Nivel  8")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    product_classification_level_6 = Column("niv_cl6", Integer, doc="Nivel 6")
+    product_classification_level_7 = Column("niv_cl7", Integer, doc="Nivel 7")
+    product_classification_level_8 = Column("niv_cl8", Integer, doc="Nivel 8")
+    order = Column("ord_cl8", Integer, doc="Orden Nivel 8")
+
+
+class ProductClassificationLevel9(ReadOnlyRow, LegacyBase):
+    """Clasificaciones de Articulos de Nivel 9 (galcla_9)"""
+    __tablename__ = "galcla_9"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_classification_id = Column("cod_clf", Integer, doc="Tipo de Clasificación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cl9", String(75), doc="Descripción Nivel  9")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    product_classification_level_1 = Column("niv_cl1", Integer, doc="Nivel 1")
+    product_classification_level_2 = Column("niv_cl2", Integer, doc="Nivel 2")
+    product_classification_level_3 = Column("niv_cl3", Integer, doc="Nivel 3")
+    product_classification_level_4 = Column("niv_cl4", Integer, doc="Nivel 4")
+    product_classification_level_5 = Column("niv_cl5", Integer, doc="Nivel 5")
+    product_classification_level_6 = Column("niv_cl6", Integer, doc="Nivel 6")
+    product_classification_level_7 = Column("niv_cl7", Integer, doc="Nivel 7")
+    product_classification_level_8 = Column("niv_cl8", Integer, doc="Nivel 8")
+    product_classification_level_9 = Column("niv_cl9", Integer, doc="Nivel 9")
+    order = Column("ord_cl9", Integer, doc="Orden Nivel 9")
+
+
+class ProductBrand(LegacyBase):
+    """Maestro de las Diferentes Marcas a las que Pueden Pertenecer los Artícul (galmarca)"""
+    __tablename__ = "galmarca"
+
+    has_attachments = Column("adj_mar", Boolean, doc="Documentos Adjuntos")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    brand_name = Column("nom_mar", String(40), doc="Introduzca el Nombre de la Marca")
+    vendor_id = Column("num_fab", Integer, doc="Código del Fabricante")
+    web = Column("web_mar", String(45), doc="Web de la Marca")
+
+
+class AccountingMovements(LegacyBase):
+    """Movimientos contables (gamovim)"""
+    __tablename__ = "gamovim"
+
+    movement_accumulated = Column("acu_mov", Boolean, doc="Campo interno, distingue si el asiento está acumulado o no.")
+    movement_note = Column("apu_mov", Integer, doc="Introduzca el Número del Apunte dentro del Asiento")
+    movement_entry_id = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    charged_structural_cost = Column("ces_mov", Boolean, doc="C.Estr.Reperc.")
+    account_id = Column("cod_cue", String(25), doc="Introduzca el Código de la Cuenta en el Plan de Cuentas")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    financial_year = Column("cod_eje", Integer, doc="Introduzca el Ejercicio Contable")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    movement_period = Column("cod_per", Integer, doc="Introduzca el Código del Periodo Contable")
+    user_id = Column("cod_usu", String(8), doc="Introduzca el Codigo del Usuario que Dió de Alta el Asiento")
+    movement_comments = Column("com_mov", String(50), doc="Introduzca el Comentario del Apunte")
+    distributed_accounting = Column("das_mov", Boolean, doc="Asiento Distribuido")
+    movement_document = Column("doc_mov", String(25), doc="Introduzca el Documento.")
+    movement_date = Column("fec_mov", Date, doc="Introduzca la Fecha en que se Efectua el Asiento Contable")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    movement_amount = Column("imp_mov", Numeric(13, 2), doc="Introduzca el Importe del Movimiento Contable")
+    movement_book = Column("lib_mov", Integer, doc="Introduzca el Código del Libro Contable")
+    movement_dotted = Column("pun_mov", String(1), doc="Movimiento Punteado.")
+    movement_section = Column("sec_mov", Integer, doc="Introduzca el Código de la Sección")
+    movement_document_type = Column("tdoc_mov", String(2), doc="Introduzca el Tipo de Documento")
+    third_party_ambit = Column("ter_amb", Integer, doc="Ambito del Tercero")
+    third_party_movement = Column("ter_mov", String(5), doc="Introduzca el Código del Tercero")
+    account_debit_or_credit = Column("tip_cue", String(1), doc="Introduzca si la Cuenta en el Asiento es de Debe o Haber")
+
+
+class PromissoryNotes(LegacyBase):
+    """Gestión Pagarés (gapagare)"""
+    __tablename__ = "gapagare"
+
+    has_attachments = Column("adj_pag", Boolean, doc="Doc. Adj.")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    branch_id = Column("cod_defp", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    supplier_id = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_pag", String(40), doc="Introduzca descripción del Pagare")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    state = Column("est_pag", String(1), doc="Estado del Pagare: (C)reado, (E)mitido, (L)iquidado")
+    user_date1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    creation_date = Column("fec_pag", Date, doc="Introduzca la Fecha de Creación del Pagaré")
+    issue_date = Column("fee_pag", Date, doc="Introduzca Fecha de Emisión del Pagaré")
+    settlement_date = Column("fel_pag", Date, doc="Fecha Liquidación")
+    due_date = Column("fev_pag", Date, doc="Introduzca la Fecha de Vencimiento del Pagaré")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    amount = Column("imp_pag", Numeric(12, 2), doc="Introduzca el Importe")
+    is_printed = Column("ipr_pag", Boolean, doc="Pagaré Impreso")
+    promissory_note_id = Column("num_pag", Integer, doc="Introduzca el Número de Pagaré")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    check_number = Column("tal_pag", String(12), doc="Introduzca Número de Talón")
+    currency_value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+
+
+class Remittances(LegacyBase):
+    """Gestión Remesas (gareme)"""
+    __tablename__ = "gareme"
+
+    has_attachments = Column("adj_rem", Boolean, doc="Doc. Adj")
+    accounting_entry_id = Column("asi_rem", Integer, doc="Introduzca el Número del Asiento de la Remesa")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código del Banco")
+    branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    remittance_id = Column("cod_rem", Integer, doc="Introduzca el Número de la Remesa")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_rem", String(50), doc="Introduzca la Descripción de la Remesa")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    state = Column("est_rem", String(1), doc="Creada o Liquidada.")
+    user_date1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_rem", Date, doc="Intoduzca Fecha de creación de la Remesa")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    accumulated_amount = Column("ima_rem", Numeric(12, 2), doc="Introduzca el Importe")
+    amount = Column("imp_rem", Numeric(12, 2), doc="Introduzca el Importe")
+    is_printed = Column("ipr_rem", Boolean, doc="¿ Remesa Impresa ?")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    remittance_type = Column("tip_rem", String(1), doc="Tipo de Remesa: Al descuento o al Cobro.")
+    currency_value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+
+
+class Priorities(ReadOnlyRow, LegacyBase):
+    """Prioridades (gatprior)"""
+    __tablename__ = "gatprior"
+
+    days_quantity = Column("cand_prio", Integer, doc="Cantidad Días")
+    hours_quantity = Column("canh_prio", Integer, doc="Cantidad Horas")
+    user_character1 = Column("char1_al", String(100), doc="Character1Usr")
+    characteristic1_code = Column("char1_gatprior", String(100), doc="Character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="Character2Usr")
+    characteristics_to_materials_planning = Column("char2_gatprior", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="Character3Usr")
+    characteristic_3d_temp = Column("char3_gatprior", String(100), doc="Character3Tlmp")
+    user_character_r_91 = Column("char4_al", String(100), doc="Character4Usr")
+    characteristics_for_template = Column("char4_gatprior", String(100), doc="Character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="Character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="Character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="Character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="Character8Usr")
+    priority = Column("cod_prio", String(2), doc="Prioridad")
+    decimal1_user = Column("dec1_al", Numeric(11, 3), doc="Decimal1Usr")
+    decimal1_currency = Column("dec1_gatprior", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="Decimal2Usr")
+    decimal2_rounding = Column("dec2_gatprior", Numeric(11, 3), doc="Decimal2Tlmp")
+    decimal3_user = Column("dec3_al", Numeric(11, 3), doc="Decimal3Usr")
+    decimal3_temp = Column("dec3_gatprior", Numeric(11, 3), doc="Decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="Decimal4Usr")
+    decimal4tlmp = Column("dec4_gatprior", Numeric(11, 3), doc="Decimal4Tlmp")
+    decimal5_user = Column("dec5_al", Numeric(11, 3), doc="Decimal5Usr")
+    decimal6_user = Column("dec6_al", Numeric(11, 3), doc="Decimal6Usr")
+    description = Column("des_prio", String(80), doc="Descripción")
+    editor_user1 = Column("edi1_al", String(1000), doc="Editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="Editor2Usr")
+    date1_user = Column("fec1_al", Date, doc="Fecha1Usr")
+    date1_tmp = Column("fec1_gatprior", Date, doc="Fecha1Tlmp")
+    date_to_user = Column("fec2_al", Date, doc="Fecha2Usr")
+    date_2nd_temp = Column("fec2_gatprior", Date, doc="Fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="Fecha3Usr")
+    date_3rd_quarter_temp = Column("fec3_gatprior", Date, doc="Fecha3Tlmp")
+
+
+class Invoicenotification(LegacyBase):
+    """Cabecera Notificación de Facturas (gcnfcab)"""
+    __tablename__ = "gcnfcab"
+
+    has_attachments = Column("adj_nof", Boolean, doc="Documentos adjuntos asociados")
+    mean_payment = Column("cmp_nof", String(2), doc="Introduzca el medio pago")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    notification_id = Column("cod_nof", Integer, doc="Introduzca el número de notificación")
+    supplier_id = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor de la Factura")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    user_id = Column("cod_usu", String(8), doc="Introduzca el usuario")
+    payment_description = Column("dmp_nof", String(50), doc="Introduzca el medio pago")
+    invoice_type_description = Column("dtip_nof", String(50), doc="Introduzca la descripción del tipo factura")
+    date = Column("fec_nof", Date, doc="Introduzca la fecha")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id. Unico")
+    printed = Column("ipr_nof", Boolean, doc="Introduzca el impreso")
+    notes = Column("obs_nof", String(800), doc="Introduzca las observaciones")
+    origin = Column("ori_nof", String(1), doc="Introduzca el origen")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    sale_point = Column("pto_nof", String(20), doc="Introduzca el punto de venta")
+    reference = Column("ref_nof", String(20), doc="Introduzca la referencia")
+    status = Column("sit_nof", String(1), doc="Introduzca la Situación")
+    applicant = Column("sol_nof", String(20), doc="Introduzca el solicitante")
+    invoice_type = Column("tip_nof", String(2), doc="Introdruzca el Tipo Factura")
+
+
+class InvoicenotificationLines(ReadOnlyRow, LegacyBase):
+    """Líneas de Notificaciones de Facturas (gcnflin)"""
+    __tablename__ = "gcnflin"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    quantity = Column("can_lnf", Numeric(9, 3), doc="Introduzca la cantidad")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca la marca")
+    notification_id = Column("cod_nof", Integer, doc="Introduzca el número de notificación")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca el embalaje")
+    sales_order_id = Column("cpv_lnf", String(20), doc="Introduzca el Pedido Venta")
+    product_code_corporative = Column("ctl_art", String(20), doc="Introduzca el código telematel")
+    price_quantity = Column("cuea_lnf", Numeric(8, 2), doc="Introduzca la cantidad de precio")
+    description = Column("det_art", String(800), doc="introduzca la descripción")
+    discount_1 = Column("dt1_lnf", Numeric(4, 2), doc="Introduzca el dto1")
+    discount_2 = Column("dto2_lnf", Numeric(4, 2), doc="Introduzca el dto2")
+    discount_3 = Column("dto3_lnf", Numeric(4, 2), doc="Introduzca el dto3")
+    ean = Column("ean_lnf", String(20), doc="Introduzca el ean")
+    notification_line_number = Column("lin_lnf", Integer, doc="Introduzca la línea")
+    purchaseorder_line_number = Column("lin_lpp", Integer, doc="Introduzca el Num.LíneaPed.Compra")
+    sales_order_line_number = Column("lpv_lnf", String(6), doc="Introduzca el Núm.Línea Ped. Venta")
+    purchase_order_id = Column("num_cpp", Integer, doc="Introduzca el pedido de compra")
+    notes = Column("obs_lnf", String(800), doc="Introduzca las observaciones")
+    line_order = Column("ord_lnf", Integer, doc="Introduzca el orden")
+    supplier_delivery_note_id = Column("pal_noe", String(20), doc="Introduzca el número albarán proveedor")
+    price = Column("pre_lnf", Numeric(10, 3), doc="Introduzca el precio")
+    product_reference = Column("ref_art", String(24), doc="Introduzca la referencia")
+    status = Column("sit_lnf", String(1), doc="Introducción la situación")
+    origin_line = Column("tbd_lnf", String(1), doc="Introduzca el origen de la línea")
+
+
+class DeliverynotificationLines(LegacyBase):
+    """Líneas de Notificaciones de Entrega (gcnolin)"""
+    __tablename__ = "gcnolin"
+
+    unique_id_pc = Column("Id_unico_pc", String(20), primary_key=True, doc="Id único Pedido Compra")
+
+
+class PurchaseDeliveryNotes(LegacyBase):
+    """Cabecera del Documento de Albaranes de Compra (gcpacab)"""
+    __tablename__ = "gcpacab"
+
+    billed = Column("act_alc", Boolean, doc="Introduzca Si/No Albarán Facturado")
+    attachments = Column("adj_alc", Boolean, doc="Documentos adjuntos asociados")
+    advance_payment = Column("ant_alc", Numeric(11, 2), doc="Introduzca Importe del Anticipo")
+    purchase_delivery_note_entry = Column("asi_alc", Integer, doc="Introduzca el Número del Asiento")
+    taxable_base = Column("bas_alc", Numeric(10, 2), doc="Base IMponible")
+    taxable_base_1 = Column("bas_alc1", Numeric(10, 2), doc="Base IMponible [1]")
+    taxable_base_2 = Column("bas_alc2", Numeric(10, 2), doc="Base IMponible [2]")
+    taxable_base_3 = Column("bas_alc3", Numeric(10, 2), doc="Base IMponible [3]")
+    blocked = Column("blq_alc", Boolean, doc="Bloqueado")
+    gross = Column("bru_alc", Numeric(11, 2), doc="Importe Bruto")
+    frequency = Column("cad_fpg", Integer, doc="Introduzca la Cadencia de Días entre Vencimientos")
+    quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    delivery_note_type = Column("car_alc", Boolean, doc="Introduzca el Tipo de Albarán (C)argo ó (D)evolución")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    characteristic1tlmp = Column("char1_gcpacab", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    characteristics_mapping = Column("char2_gcpacab", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    characteristics_3pl = Column("char3_gcpacab", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    characteristics_4plm = Column("char4_gcpacab", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    delivery_terms = Column("cod_coe", String(3), doc="Introduzca Condición de Entrega")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    warehouse_in_out_number = Column("cod_depc", Integer, doc="Introduzca Nº de E/S Depósito")
+    employee = Column("cod_empl", Integer, doc="Empleado que ha realizado la Compra")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method = Column("cod_fpg", Integer, doc="Introduzca la Forma de Pago para este Albarán")
+    country = Column("cod_pai_m", String(2), doc="Código de País")
+    supplier_code = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor del Albarán")
+    province = Column("cod_provi_m", Integer, doc="Código de la Provincia de la entrega")
+    code = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    contact = Column("cod_telp", Integer, doc="Contacto")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Transportista en este Albarán")
+    user = Column("cod_usu", String(8), doc="Código del Usuario que Genera el Albarán")
+    way = Column("cod_via_m", String(2), doc="Código de Vía")
+    neighborhood = Column("col_mer", String(60), doc="Colonia de la entrega")
+    cost = Column("cos_alc", Boolean, doc="Introduzca (S/N) El Albarán Actualizó el Coste")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_gcpacab", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_rounded_two_decimal_places = Column("dec2_gcpacab", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_gcpacab", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_gcpacab", Numeric(11, 3), doc="decimal4Tlmp")
+    custom_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    deductible = Column("ded_alc", Boolean, doc="Introduzca Si/No Remisión Deducible")
+    travel_days = Column("des_fpg", Integer, doc="Introduzca el Número de Dias Hasta el Primer Vencimiento")
+    address = Column("dir_mer", String(55), doc="Dirección de Entrega del Pedido")
+    postal_district = Column("dpo_mer", Integer, doc="Distrito Postal de la entrega")
+    pp_discount = Column("dtp_alc", Numeric(4, 2), doc="Introduzca +/- % Descuento Pronto Pago del Albarán")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_alc", String(3), doc="CRE - Creación, WRI - Modificación, \"\" - Finalización")
+    edi_communication = Column("edi_com", Boolean, doc="Introduzca (S/N) Comunicaciones ELECTROEDI")
+    sent_by_email = Column("ema_alc", Boolean, doc="Enviado por E-mail")
+    email = Column("ema_mer", String(60), doc="E-mail")
+    packaging_cost = Column("emb_alc", Numeric(8, 2), doc="Introduzca el Coste del Embalaje")
+    sent_by_fax = Column("fax_alc", Boolean, doc="Enviado por Fax")
+    fax = Column("fax_mer", String(18), doc="Fax de la dirección de entrega")
+    date1_user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_gcpacab", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date_2nd_half_temp = Column("fec2_gcpacab", Date, doc="fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_temp = Column("fec3_gcpacab", Date, doc="fecha3Tlmp")
+    delivery_date = Column("fec_alc", Date, doc="Introduzca la Fecha del Albarán")
+    last_modified_date = Column("fum_alc", Date, doc="Última Fecha Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    income_tax_withholding = Column("ifp_alc", Numeric(4, 2), doc="Introduzca IRPF")
+    vat_amount = Column("iiv_alc", Numeric(9, 2), doc="Importe IVA")
+    vat_amount_1 = Column("iiv_alc1", Numeric(9, 2), doc="Importe IVA [1]")
+    vat_amount_2 = Column("iiv_alc2", Numeric(9, 2), doc="Importe IVA [2]")
+    vat_amount_3 = Column("iiv_alc3", Numeric(9, 2), doc="Importe IVA [3]")
+    logistics_amount = Column("ilo_alc", Numeric(14, 5), doc="Coste importación o logístico soportado")
+    intracommunity = Column("intr_alc", Boolean, doc="Intracomunitario")
+    irpf_base = Column("ipb_alc", Numeric(11, 2), doc="Base IRPF")
+    income_tax_withholding_percentage = Column("ipf_alc", Numeric(4, 2), doc="% IRPF")
+    income_tax_amount = Column("ipi_alc", Numeric(9, 2), doc="Importe IRPF")
+    printed = Column("ipr_alc", Boolean, doc="Impreso")
+    amount_with_equivalence_surcharge = Column("irq_alc", Numeric(9, 2), doc="Importe R.E.")
+    amount_with_equivalence_surcharge_1 = Column("irq_alc1", Numeric(9, 2), doc="Importe R.E. [1]")
+    amount_with_equivalence_surcharge_2 = Column("irq_alc2", Numeric(9, 2), doc="Importe R.E. [2]")
+    amount_with_equivalence_surcharge_3 = Column("irq_alc3", Numeric(9, 2), doc="Importe R.E. [3]")
+    vat_percentage = Column("iva_alc", Numeric(4, 2), doc="Porcentaje de IVA")
+    vat_percentage_1 = Column("iva_alc1", Numeric(4, 2), doc="Porcentaje de IVA [1]")
+    vat_percentage_2 = Column("iva_alc2", Numeric(4, 2), doc="Porcentaje de IVA [2]")
+    vat_percentage_3 = Column("iva_alc3", Numeric(4, 2), doc="Porcentaje de IVA [3]")
+    delivery_note_number = Column("num_alc", Integer, doc="Introduzca el Número de Albarán")
+    supplier_delivery = Column("num_dpr", Integer, doc="Introduzca el Código de la Delegación de Proveedor")
+    number = Column("num_mer", String(4), doc="Número de la via de la entrega")
+    due_dates = Column("nvt_fpg", Integer, doc="Introduzca el Número de Vencimientos a Generar")
+    notes = Column("obs_alc", String(800), doc="Introduzca Observaciones")
+    supplier_delivery_note_number = Column("pal_alc", String(20), doc="Introduzca el Número de Albarán Dado por el Proveedor")
+    population = Column("pob_mer", String(30), doc="Población de la entrega")
+    porsic = Column("porsic", String(8), doc="TlmpPorsic_gcpacab")
+    porsil = Column("porsil", Boolean, doc="TlmpPorsil_gcpacab")
+    porsin = Column("porsin", Numeric(7, 2), doc="TlmpPorsin_gcpacab")
+    shipping_costs = Column("por_alc", Numeric(8, 2), doc="Introduzca Importe de Portes")
+    scope = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    notification_number = Column("p_cod_nof", Integer, doc="Introduzca el número de notificación")
+    business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social de la Entrega")
+    reference = Column("ref_alc", String(20), doc="Introduzca la Referencia Interna del Albarán")
+    replicated = Column("repl_alb", Boolean, doc="Replicado")
+    equivalence_surcharge_percentage = Column("req_alc", Numeric(4, 2), doc="% Recargo de Equivalencia")
+    equivalence_surcharge_percentage_1 = Column("req_alc1", Numeric(4, 2), doc="% Recargo de Equivalencia [1]")
+    equivalence_surcharge_percentage_2 = Column("req_alc2", Numeric(4, 2), doc="% Recargo de Equivalencia [2]")
+    equivalence_surcharge_percentage_3 = Column("req_alc3", Numeric(4, 2), doc="% Recargo de Equivalencia [3]")
+    isr_withholding = Column("ret_isr", Numeric(4, 2), doc="Retención ISR")
+    vat_withholding = Column("ret_iva", Numeric(4, 2), doc="Retención IVA")
+    tax_identification_number = Column("rfc_dest", String(18), doc="R.F.C. del destajista")
+    financial_receipt = Column("rfi_alc", Numeric(4, 2), doc="Recargo Financiero")
+    phone_number = Column("tel_mer", String(18), doc="Teléfono  de la dirección de entrega")
+    delivery_type = Column("ten_alc", String(1), doc="Introduzca Tipo de entrega")
+    invoice_type = Column("tfa_alc", String(1), doc="Tipo Factura")
+    total_delivery_note = Column("tot_alc", Numeric(11, 2), doc="Total Albarán")
+    delivery_note_number_r_81 = Column("tra_alc", Integer, doc="Introduzca el Número de Albarán")
+    branch_office = Column("tra_del", Integer, doc="Intoduzca la delegación Origen del Traspaso")
+    last_modified_user = Column("usum_alc", String(8), doc="Usuario Última Modificación")
+    value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+    show_last_item_prices = Column("ver_pre", Boolean, doc="Mostrar Últimos Precios del Artículo para el proveedor")
+
+
+class PurchaseOrders(LegacyBase):
+    """Cabecera de los Documentos de Pedidos de Compra (gcppcab)"""
+    __tablename__ = "gcppcab"
+
+    attachments = Column("adj_cpp", Boolean, doc="Documentos adjuntos asociados")
+    advance_payment = Column("ant_cpp", Numeric(11, 2), doc="Introduzca importe del anticipo")
+    is_cancelled = Column("anu_cpp", Boolean, doc="Anulado")
+    is_locked = Column("blq_cpp", Boolean, doc="¿Bloqueado?")
+    gross_amount = Column("bru_cpp", Numeric(11, 2), doc="Importe Bruto")
+    campaign = Column("cam_cpp", String(20), doc="Campaña")
+    quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gcppcab", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gcppcab", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gcppcab", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gcppcab", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    notification = Column("Cod_avis", Integer, doc="Aviso")
+    delivery_conditions = Column("cod_coe", String(3), doc="Introduzca Condición de Entrega")
+    company = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    origin_branch = Column("cod_del_o", Integer, doc="Intoduzca la delegación Origen")
+    receiving_delivery = Column("cod_del_r", Integer, doc="Intoduzca la delegación de Recepción")
+    employee = Column("cod_empl", Integer, doc="Empleado")
+    requester = Column("cod_empl_p", Integer, doc="Introduzca Código de Empleado Peticionario")
+    company_r_403 = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    status = Column("cod_est", Integer, doc="Introduzca Estado")
+    payment_method = Column("cod_fpg", Integer, doc="Introduzca la Forma de Pago para este Pedido")
+    requirement_number = Column("cod_nec", Integer, doc="Número de Necesidad")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    country = Column("cod_pai_m", String(2), doc="Código de País")
+    proposal = Column("cod_prc", Integer, doc="Propuesta de Compra")
+    supplier_code = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    origin = Column("cod_proc", String(3), doc="Introduzca la Procedencia del Pedido")
+    province = Column("cod_provi_m", Integer, doc="Código de la Provincia de la entrega")
+    responsible_person = Column("cod_remp", Integer, doc="Introduzca el Código del Empleado Responsable")
+    code = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    contact = Column("cod_telp", Integer, doc="Persona de Contacto")
+    type = Column("cod_tid", String(2), doc="Introduzca Tipo Documento")
+    code_r_703 = Column("cod_tra", Integer, doc="Introduzca el Transportista a Utilizar en este Pedido")
+    user = Column("cod_usu", String(8), doc="Código del Usuario que Genera el Pedido de Compra")
+    address = Column("cod_via_m", String(2), doc="Código de Vía")
+    neighborhood = Column("col_mer", String(60), doc="Colonia de la entrega")
+    shipment = Column("cont_prot", Integer, doc="Introduzca nº de Envío")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gcppcab", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gcppcab", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gcppcab", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gcppcab", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    branch = Column("del_ned", Integer, doc="Delegación")
+    origin_delivery = Column("deo_cpp", String(2), doc="Del. Origen")
+    description = Column("des_prc", String(60), doc="Descripción de la Propueta")
+    address_r_7 = Column("dir_mer", String(55), doc="Dirección de Entrega del Pedido")
+    distrinet = Column("dis_cpp", Boolean, doc="Distrinet")
+    postal_code = Column("dpo_mer", Integer, doc="Distrito Postal de la entrega")
+    special_discount = Column("dtp_cpp", Numeric(4, 2), doc="Introduzca +/- % Descuento Pronto Pago del Pedido")
+    complete_delivery = Column("eco_cpp", Boolean, doc="Entrega Completa")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_cpp", String(3), doc="CRE - Creación, WRI - Modificación, \"\" - Finalización")
+    edi_communication = Column("edi_com", Boolean, doc="Introduzca (S/N) Comunicaciones ELECTROEDI")
+    sent_by_email = Column("ema_cpp", Boolean, doc="Enviado por Email")
+    email = Column("ema_mer", String(60), doc="E-mail")
+    packaging_cost = Column("emb_cpp", Numeric(8, 2), doc="Introduzca el Coste del Embalaje")
+    sender_email = Column("eme_cpp", String(60), doc="E-mail Emisor")
+    shipment_status = Column("env_cpp", String(12), doc="Estado Envío")
+    status_r_957 = Column("esta_cpp", String(2), doc="Introduzca el Estado del Pedido")
+    status_r_606 = Column("est_cpp", String(12), doc="Introduzca el Estado del Pedido (A-bierto,C-onfirmado,R-ecepcio")
+    sent_by_fax = Column("fax_cpp", Boolean, doc="Enviado por Fax")
+    fax = Column("fax_mer", String(18), doc="Fax de la dirección de entrega")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gcppcab", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gcppcab", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gcppcab", Date, doc="fecha3Tlmp")
+    confirmation_date = Column("fec_cpp", Date, doc="Introduzca la Fecha de Confirmación del Pedido de Compras")
+    shipping_date = Column("fen_cpp", Date, doc="Fecha Envío")
+    order_date = Column("fep_cpp", Date, doc="Introduzca la Fecha del Pedido a Proveedor")
+    company_entity = Column("fos_cpp", Boolean, doc="Fab / Soc")
+    last_modified_date = Column("fum_cpp", Date, doc="Última Fecha Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    income_tax_withholding = Column("ifp_cpp", Numeric(4, 2), doc="Introduzca IRPF")
+    printed = Column("imp_cpp", Boolean, doc="¿ Impreso ?")
+    intracommunity = Column("intr_cpp", Boolean, doc="Intracomunitario")
+    freight_costs = Column("ipor_cpp", Numeric(8, 2), doc="Introduzca Importe de Portes")
+    delivery_location = Column("lug_cpp", String(40), doc="Introduzca el Lugar de Entrega")
+    name = Column("nom_mer", String(55), doc="Introduzca el Nombre de la Entrega")
+    order_number = Column("num_cpp", Integer, doc="Introduzca el Número del Pedido de Compra")
+    branch_r_847 = Column("num_dpr", Integer, doc="Introduzca el Código de la Delegación")
+    number = Column("num_mer", String(4), doc="Número de la via de la entrega")
+    b2b_notes = Column("ob2_cpp", String(400), doc="Observaciones B2B")
+    notes = Column("obs_cpp", String(800), doc="Introduzca Observaciones del Pedido")
+    pending_authorization = Column("pau_cpp", Boolean, doc="Introduzca (SI/NO) el Pedido está Pendiente de Autorizar")
+    clc_order = Column("ped_clc", String(8), doc="Pedido CLC")
+    city = Column("pob_mer", String(30), doc="Población de la entrega")
+    freight_costs_r_401 = Column("por_cpp", Boolean, doc="Introduzca Portes Pagados / Debidos")
+    scope = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    previously_advanced_order = Column("pst_cpp", String(1), doc="(F)ax  (T)eléfono (N)o Avanzado")
+    recipient = Column("qfe_cpp", String(1), doc="Destinatario")
+    weee_from_article_in_linkages = Column("raev_cpp", Boolean, doc="RAEE a partir de Artículo en Vinculaciones")
+    business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social de la Entrega")
+    withholding_tax = Column("refg_cpp", Numeric(4, 2), doc="% Retención Fondo Garantía")
+    supplier_reference = Column("refp_cpp", String(20), doc="Introduzca la Referencia del Proveedor")
+    reference = Column("ref_cpp", String(20), doc="Introduzca la Referencia del Pedido a Proveedor")
+    retry_attempts_number = Column("renv_cpp", Integer, doc="Introduza el Número  Reintentos")
+    replicated = Column("repl_ped", Boolean, doc="Replicado")
+    responsible_person_r_177 = Column("res_cpp", String(60), doc="Introduzca Responsable")
+    advance_withholding_tax_percentage = Column("reta_cpp", Numeric(4, 2), doc="% Retención Anticipo")
+    income_tax_withholding_r_98 = Column("ret_isr", Numeric(4, 2), doc="Retención ISR")
+    vat_withholding = Column("ret_iva", Numeric(4, 2), doc="Retención IVA")
+    tax_identification_number = Column("rfc_dest", String(18), doc="R.F.C. del destajista")
+    financial_receipt = Column("rfi_cpp", Numeric(4, 2), doc="Recargo Financiero")
+    phone_number = Column("tel_mer", String(18), doc="Teléfono  de la dirección de entrega")
+    delivery_type = Column("ten_cpp", String(1), doc="Introduzca Tipo de entrega")
+    invoice_type = Column("tfa_cpp", String(1), doc="Tipo de Factura")
+    subcontracting_type = Column("tipb_cpp", String(3), doc="Tipo Subcontratación")
+    type_r_249 = Column("tip_cpp", String(1), doc="Tipo")
+    total_order = Column("tot_cpp", Numeric(11, 2), doc="Importe Total Pedido")
+    order_type = Column("tpe_cpp", String(2), doc="Tipo Pedido")
+    rate_type = Column("tta_cpp", String(2), doc="Tipo Tarifa")
+    urgent = Column("urg_cpp", Boolean, doc="Urgente")
+    last_modified_user = Column("usum_cpp", String(8), doc="Usuario Última Modificación")
+    fax_confirmation_date = Column("utef_cpp", Date, doc="Introduzca la Fecha de Confirmación del Fax")
+    original_confirmation_date = Column("uteo_cpp", Date, doc="Introduzca la Fecha de Confirmación Original")
+    value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+    show_recent_article_prices = Column("ver_pre", Boolean, doc="Mostrar Últimos Precios del Artículo para el proveedor")
+
+
+class PurchaseOrderTaxes(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos de los Pedidos de Compra (gcppimp)"""
+    __tablename__ = "gcppimp"
+
+    base_amount = Column("bas_imd", Numeric(11, 2), doc="Introduzca la Base")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gcppimp", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gcppimp", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gcppimp", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gcppimp", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    tax_type_code = Column("cod_imd", Integer, doc="Introduzca el Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Introduzca el Tipo de Impuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gcppimp", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gcppimp", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gcppimp", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gcppimp", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gcppimp", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gcppimp", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gcppimp", Date, doc="fecha3Tlmp")
+    amount = Column("imp_imd", Numeric(11, 2), doc="Introduzca el Importe")
+    order_number = Column("num_cpp", Integer, doc="Introduzca el Número de la pedido de Compra")
+    percentage = Column("por_imd", Numeric(8, 6), doc="Introduzca el Porcentaje")
+
+
+class PurchaseOrderLines(ReadOnlyRow, LegacyBase):
+    """Lineas de Detalle del Documento de Pedidos de Compra (gcpplin)"""
+    __tablename__ = "gcpplin"
+
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    atypical_operation = Column("ati_lpp", Boolean, doc="Introduzca (S/N) Es Operación Atípica")
+    campaign = Column("cam_lpp", String(20), doc="Campaña")
+    barcode = Column("cba_lpp", String(26), doc="Código de Barras de Artículos Genéricos")
+    delivered = Column("cer_lpp", Boolean, doc="Introduzca (S/N) Está Servida la Línea")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gcpplin", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gcpplin", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gcpplin", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gcpplin", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    company = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    item_purchase_group = Column("cod_gco", String(28), doc="Artículo Grupo Compra")
+    code = Column("cod_iva", Integer, doc="Introduzca el Código de IVA")
+    brand_code = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    requirement_number = Column("cod_nec", Integer, doc="Número de Necesidad")
+    detail_code = Column("cod_part", Integer, doc="Código Detalle")
+    purchase_proposal = Column("cod_prc", Integer, doc="Propuesta de Compra")
+    packaging_unit = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    unit_of_measure_weight = Column("cod_um_p", String(2), doc="Unidad de Medida del Peso")
+    volume_unit = Column("cod_um_v", String(2), doc="Unidad de Medida del Volumen")
+    ordered_quantity = Column("cpe_lpp", Numeric(9, 2), doc="Introduzca la Cantidad a Pedir")
+    quantity_delivered = Column("cse_lpp", Numeric(9, 2), doc="Introduzca la Cantidad Servida")
+    company_phone = Column("ctl_lpp", String(20), doc="Introduzca el Código Coorp/Tel")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gcpplin", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gcpplin", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gcpplin", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gcpplin", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    extended_description = Column("dell_lpp", String(800), doc="Descripción Ampliada")
+    branch = Column("del_ned", Integer, doc="Delegación")
+    description = Column("dep_lpp", String(800), doc="Introduzca la Descripción")
+    first_discount = Column("dt1_lpp", Numeric(4, 2), doc="Introduzca el % de Dtos. de Compra")
+    second_discount = Column("dt2_lpp", Numeric(4, 2), doc="Introduzca el % de Dtos. de Compra")
+    third_party_discount = Column("dt3_lpp", Numeric(4, 2), doc="Introduzca el % de Dtos. de Compra")
+    complete_delivery = Column("eco_lpp", Boolean, doc="Entrega Completa")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    comments = Column("edi_lpp", String(1000), doc="Comentarios")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gcpplin", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gcpplin", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gcpplin", Date, doc="fecha3Tlmp")
+    delivery_date = Column("fee_lpp", Date, doc="Introduzca la Fecha de Entrega de la Linea del Pedido Compra")
+    delivery_start_date = Column("fei_lpp", Date, doc="Fecha Inicial de Entrega")
+    tax_amount = Column("itas_lpp", Numeric(10, 3), doc="Importe Tasa")
+    line_number = Column("lin_lpp", Integer, doc="Introduzca el Numero de la Linea del Pedido de Compra")
+    order_number = Column("num_cpp", Integer, doc="Introduzca el Número del Pedido de Compra")
+    purchase_group_notes = Column("obs_lpp", String(200), doc="Observacines Grupo Compra")
+    discount_origin = Column("odt_lpp", String(8), doc="Introduzca Origen de los dtos.")
+    line_number_r_650 = Column("ord_lpp", Integer, doc="Introduzca el Numero de orden del Pedido de Compra")
+    origin = Column("ori_lpp", String(8), doc="Introduzca el Origen de la linea.")
+    weight = Column("pes_lpp", Numeric(18, 2), doc="Peso")
+    purchase_price = Column("pre_lpp", Numeric(10, 3), doc="Introduzca el Precio de Compra")
+    manufacturer_reference = Column("ref_lpp", String(24), doc="Introduzca Referencia del Fabricante para el Artículo")
+    subcontracted_item = Column("sub_part", Boolean, doc="Partida Subcontratada")
+    rate = Column("tas_lpp", Boolean, doc="Tasa de Reciclaje")
+    line_type = Column("tbd_lpp", String(1), doc="Tipo de Linea A-> Artículo E->B.D. T->Texto S->Servicio")
+
+
+class Links(ReadOnlyRow, LegacyBase):
+    """Detalle de Vinculaciones de las Líneas de Pedidos de Compra con otros Do (gcvincul)"""
+    __tablename__ = "gcvincul"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gcvincul", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gcvincul", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gcvincul", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gcvincul", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_scope = Column("cli_amb", Integer, doc="Ambito Cliente")
+    identifier = Column("codh_obe", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    activity = Column("cod_acto", Integer, doc="Actividad")
+    notification_number = Column("cod_avis", Integer, doc="Número de Aviso")
+    customer = Column("cod_cli", Integer, doc="Cliente")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    project = Column("cod_obr", Integer, doc="Obra")
+    work_order = Column("cod_oot", Integer, doc="OT")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="SubActividad")
+    packaging_unit = Column("cod_uea", String(2), doc="Unidad de Embalaje")
+    quantity_delivered = Column("cser_vin", Numeric(9, 2), doc="Cantidad Vinculada Servida")
+    linked_quantity = Column("cuea_vin", Numeric(9, 2), doc="Cantidad Vinculada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gcvincul", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gcvincul", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gcvincul", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gcvincul", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gcvincul", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gcvincul", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gcvincul", Date, doc="fecha3Tlmp")
+    line_number = Column("lin_lpp", Integer, doc="Nº Linea Pedido de Compra")
+    document_line_number_incoming = Column("lin_vin", Integer, doc="Nº Linea Documento Vinculado")
+    editable = Column("mod_vin", Boolean, doc="Modificable")
+    order = Column("num_cpp", Integer, doc="Nº Pedido de Compra")
+    linked_document_number = Column("num_vin", Integer, doc="Nº Documento Vinculado")
+    order_r_891 = Column("ord_vin", Integer, doc="Orden")
+    linking_type = Column("tip_vin", String(1), doc="Tipo Vinculación")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class AttachedFile(LegacyBase):
+    """Gestión Documental (gesdoc)"""
+    __tablename__ = "gesdoc"
+
+    document_class = Column("Cod_doc", String(3), doc="Documento")
+    database_type = Column("cod_mpt", String(1), doc="Base de Datos")
+    document_id = Column("Cod_pgd", Integer, doc="Contador")
+    user_id = Column("Cod_usu", String(8), doc="Usuario")
+    description = Column("des_pgd", String(200), doc="Descripción")
+    date = Column("fec_pgd", Date, doc="Fecha Creación")
+    file_name = Column("File_pgd", String(200), doc="Archivo")
+    file_path = Column("fser_pgd", String(200), doc="Archivo Servidor")
+    last_modified_date = Column("Fum_pgd", Date, doc="Fecha Últ. Modif.")
+    email_message_id = Column("id_email", String(200), doc="Id. E-mail")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id. Único")
+    third_party_unique_id = Column("Id_uni_ter", BigInteger, doc="Id. Único Tercero")
+    image = Column("image", String(1200), doc="image")
+    notes = Column("obs_pgd", String(1200), doc="Observaciones")
+    tags = Column("tags_pgd", String(200), doc="Tags")
+    document_type = Column("Tip_doc", String(3), doc="Tipo Documento")
+    third_party_type = Column("tip_ter", String(3), doc="Tipo Tercero")
+    url_image = Column("url_image", String(400), doc="url_image")
+    last_modification_user_id = Column("usu_mod", String(8), doc="Usuario Modificación")
+
+
+class Calendars(ReadOnlyRow, LegacyBase):
+    """Cabecera de Calendarios de Personas y Máquinas (gfcalent)"""
+    __tablename__ = "gfcalent"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    char1_gfcalent = Column("char1_gfcalent", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gfcalent", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gfcalent", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gfcalent", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    calendar = Column("cod_cal", String(4), doc="Calendario")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gfcalent", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gfcalent", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gfcalent", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gfcalent", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_cal", String(40), doc="Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gfcalent", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gfcalent", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gfcalent", Date, doc="fecha3Tlmp")
+    type = Column("tip_cal", String(1), doc="Tipo de Caledario")
+
+
+class Employees(LegacyBase):
+    """Maestro de Empleados de cada Empresa (gfemple)"""
+    __tablename__ = "gfemple"
+
+    attached_documents = Column("adj_empl", Boolean, doc="Documentos Adjuntos")
+    deactivation = Column("baj_empl", Boolean, doc="¿Baja?")
+    locked = Column("blq_empl", Boolean, doc="¿Bloqueado?")
+    location = Column("cag_ban", Integer, doc="Introduzca el Código de la Agencia")
+    bank = Column("cba_ban", Integer, doc="Introduzca la Entidad Bancaria")
+    barcode = Column("cba_tra", Numeric(13, 0), doc="Introduzca Cod. Barras")
+    account_number = Column("cct_ban", String(11), doc="Introduzca la Cuenta Bancaria")
+    distribution_center = Column("cdc_ban", Integer, doc="Introduzca el D?gito de Control")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gfemple", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gfemple", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gfemple", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gfemple", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_empl", String(18), doc="Introduzca el R.F.C.  del Cliente")
+    bank_r_92 = Column("cod_ban", Integer, doc="Código de Banco")
+    calendar = Column("cod_cal", String(4), doc="Calendario")
+    owner_branch = Column("cod_delp", Integer, doc="Intoduzca la delegación propietaria")
+    department = Column("cod_dep", String(8), doc="Informe el departamento al que está asignado el empleado.")
+    accountant = Column("cod_egd", Integer, doc="Contador")
+    employee = Column("cod_empl", Integer, doc="Código del Empleado")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    owner_company = Column("cod_entp", Integer, doc="Intoduzca la empresa propietaria")
+    fax_account = Column("cod_fax", String(8), doc="Cuenta de FAX que utiliza el Empleado")
+    code = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago")
+    schedule = Column("cod_hor", String(4), doc="Código de Horario")
+    working = Column("cod_jor", Integer, doc="Jornada Vacaciones")
+    country = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    frequency = Column("cod_perf", Integer, doc="Introduzca C?digo Periodicidad.")
+    code_r_258 = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    code_r_416 = Column("cod_rep", Integer, doc="Introduzca el Código de Vendedor")
+    job_risk = Column("cod_rip", Integer, doc="Riesgo del Puesto")
+    regular_payroll = Column("cod_rno", Integer, doc="Recibo Nómina Habitual")
+    currency = Column("cod_sas", String(3), doc="C?digo de la Divisa")
+    subzone = Column("cod_szon", Integer, doc="Introduzca la Subzona Comercial")
+    employee_contract_type = Column("cod_tce", Integer, doc="Tipo Contrato Empleado")
+    holiday_type = Column("cod_tfi", Integer, doc="Tipo Fichaje Vacaciones")
+    carrier_code = Column("cod_tra", Integer, doc="Introduzca el Código de Transportista")
+    regime_type = Column("cod_tre", Integer, doc="Tipo Régimen")
+    user_code = Column("cod_usu", String(8), doc="Introduzca el Login (identificación) del Usuario")
+    address_line = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    area = Column("cod_zon", Integer, doc="Introduzca la Zona Comercial")
+    neighborhood = Column("col_tra", String(60), doc="Introduzca la Colonia del Empleado.")
+    cost = Column("cos_empl", Numeric(13, 5), doc="Introduzca el coste del Empleado")
+    default_imap_folder = Column("cpd_imap", String(100), doc="Carpeta por defecto IMAP")
+    advance_account = Column("ctaa_empl", String(25), doc="Cuenta de Anticipos")
+    additional_employee_account = Column("ctac_empl", String(25), doc="Cuenta Empleado Complementaria")
+    employee_account_in_foreign_currency = Column("ctad_empl", String(25), doc="Cuenta Empleado en Divisa")
+    payroll_payable_account = Column("ctae_empl", String(25), doc="Cuenta de Sueldos a Pagar")
+    accounting_account = Column("cta_empl", String(25), doc="Introduzca una Cuenta Contable")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gfemple", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_material_price = Column("dec2_gfemple", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gfemple", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gfemple", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    standard_deduction = Column("dedh_empl", Numeric(9, 2), doc="Deducción Habitual")
+    contractor = Column("dest_empl", Boolean, doc="Destajista")
+    address = Column("dir_tra", String(55), doc="Introduzca la dirección del empleado.")
+    id_card = Column("dni_tra", String(18), doc="Informe el DNI del empleado.")
+    paid_days = Column("dpa_empl", Numeric(9, 3), doc="Nº Días Pagados")
+    postal_code = Column("dpo_tra", Integer, doc="Introduzca el distrito postal del empleado.")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    external = Column("eex_empl", Boolean, doc="Empleado Externo")
+    email = Column("ema_pers", String(60), doc="Introduzca E-mail")
+    send_payroll = Column("eno_empl", Boolean, doc="Enviar Nómina")
+    foreign_resident = Column("ext_empl", Boolean, doc="Indicador lógico si el empleado es extranjero y residente")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gfemple", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gfemple", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gfemple", Date, doc="fecha3Tlmp")
+    contract_end_date = Column("ffc_empl", Date, doc="Fecha Final del Contrato")
+    contract_start_date = Column("fic_empl", Date, doc="Fecha de Inicio del Contrato")
+    birth_date = Column("fna_tra", Date, doc="Introduzca la fecha nacimiento del empleado.")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    mobile_1 = Column("mov1_empl", String(12), doc="Introduzca el Móvil 1")
+    mobile_2 = Column("mov2_empl", String(12), doc="Introduzca el Móvil 2")
+    payment_method = Column("mpa_empl", String(80), doc="Método Pago")
+    account_number_r_541 = Column("nca_empl", String(20), doc="Nº Cuenta")
+    notify_error_email_sent = Column("ner_ema", Boolean, doc="Notificar error mail enviado")
+    email_notification_sent_successfully = Column("nok_ema", Boolean, doc="Notificar mail enviado correcto")
+    your_name = Column("nom_ema", String(60), doc="Su nombre")
+    name = Column("nom_tra", String(55), doc="Informe el nombre del empleado.")
+    notify_email_receipt = Column("nre_ema", Boolean, doc="Notificar recepción mail")
+    social_security_number = Column("nss_tra", String(20), doc="Introduzca el número de la Seguridad Social.")
+    standard_perception = Column("perh_empl", Numeric(9, 2), doc="Percepción Habitual")
+    authorization_pin = Column("pin_empl", String(16), doc="PIN Autorización")
+    city = Column("pob_tra", String(30), doc="Introduzca la población del empleado.")
+    imap_password = Column("psw_imap", String(40), doc="Contraseña IMAP")
+    smtp_password = Column("psw_smtp", String(40), doc="Contraseña SMTP")
+    imap_port = Column("pue_imap", Integer, doc="Puerto IMAP")
+    smtp_port = Column("pue_smtp", Integer, doc="Puerto SMTP")
+    area_department_manager = Column("res_dep", Boolean, doc="Indique si el empleado es responsable de area o departamento")
+    employee_rotation = Column("rot_tra", Boolean, doc="¿Empleado de Rotación?")
+    daily_salary = Column("sald_empl", Numeric(14, 5), doc="Introduzca el Salario Diario del Empleado")
+    salary = Column("sal_empl", Numeric(15, 5), doc="Introduzca el Salario del Empleado")
+    cfdi_series = Column("scfdi_empl", String(25), doc="Serie CFDI")
+    imap_security = Column("seg_imap", String(3), doc="Seguridad IMAP")
+    smtp_security = Column("seg_smtp", String(3), doc="Seguridad SMTP")
+    imap_server = Column("ser_imap", String(200), doc="Servidor IMAP")
+    smtp_server = Column("ser_smtp", String(200), doc="Servidor SMTP")
+    encrypted_vat_number = Column("tba_tra", String(14), doc="Introduzca C.B.Encriptado")
+    email_account_type = Column("tcu_empl", String(10), doc="Tipo cuenta e-mail")
+    imap_refresh_time = Column("tdr_imap", Integer, doc="Tiempo de refresco IMAP en minutos")
+    phone_number = Column("tel_tra", String(18), doc="Informe el teléfono del empleado.")
+    employee_type = Column("tipo_op", Integer, doc="Introduzca Código de Categoría")
+    email_account_token = Column("tok_empl", String(8000), doc="Token cuenta e-mail")
+    imap_user = Column("usu_imap", String(120), doc="Usuario IMAP")
+    smtp_user = Column("usu_smtp", String(120), doc="Usuario SMTP")
+    photo = Column("xfot_empl", String(40), doc="Foto")
+
+
+class WorkingDays(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Jornada Laborales que pueden ser definidos en un Cal (gfjorna)"""
+    __tablename__ = "gfjorna"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gfjorna", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gfjorna", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gfjorna", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gfjorna", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    work_shift = Column("cod_jor", Integer, doc="Jornada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gfjorna", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gfjorna", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gfjorna", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gfjorna", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_jor", String(40), doc="Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gfjorna", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gfjorna", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gfjorna", Date, doc="fecha3Tlmp")
+
+
+class LinesWorkingDays(ReadOnlyRow, LegacyBase):
+    """Detalle del Tipos de Hora Incluidas dentro de cada Tipo de Jornada (gfjornl)"""
+    __tablename__ = "gfjornl"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gfjornl", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gfjornl", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gfjornl", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gfjornl", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    time_hour = Column("cod_hora", Integer, doc="Introduzca Código de Tipo de Hora")
+    work_shift = Column("cod_jor", Integer, doc="Jornada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gfjornl", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gfjornl", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gfjornl", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gfjornl", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gfjornl", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gfjornl", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gfjornl", Date, doc="fecha3Tlmp")
+    end_time = Column("hfi_jol", String(5), doc="Hora Fin")
+    start_time = Column("hin_jol", String(5), doc="Hora Inicio")
+
+
+class Activity(ReadOnlyRow, LegacyBase):
+    """Maestro de Actividades Comerciales de Clientes y Proveedores (gmactic)"""
+    __tablename__ = "gmactic"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmactic", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmactic", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmactic", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmactic", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    activity_code = Column("cod_acc", String(4), doc="Introduzca el Código de la Actividad")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmactic", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmactic", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gmactic", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_178 = Column("dec4_gmactic", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    potential_customer_activity = Column("dir_acc", String(4), doc="Actividad Cliente Potencial")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmactic", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmactic", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gmactic", Date, doc="fecha3Tlmp")
+    description = Column("nom_acc", String(25), doc="Introduzca la Descripción de la Actividad")
+
+
+class Subactivity(ReadOnlyRow, LegacyBase):
+    """Maestro de Subactividades Comerciales de Clientes y Proveedores (gmactiv)"""
+    __tablename__ = "gmactiv"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmactiv", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmactiv", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmactiv", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmactiv", String(100), doc="character4Tlmp")
+    char5_al = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    activity_code = Column("cod_acc", String(4), doc="Introduzca el Código de la Actividad")
+    subactivity_code = Column("cod_act", String(4), doc="Introduzca el Código de la Subactividad")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmactiv", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmactiv", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmactiv", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmactiv", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    potential_customer_activity = Column("dir_acc", String(4), doc="Actividad Cliente Potencial")
+    potential_customer_subactivity = Column("dir_act", String(4), doc="Subactiv. Cliente Potencial")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmactiv", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmactiv", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmactiv", Date, doc="fecha3Tlmp")
+    description = Column("nom_act", String(25), doc="Introduzca la Descripción de la Subactividad")
+
+
+class Banks(LegacyBase):
+    """Maestro de Cuentas Bancarias Utilizada por las Empresas (gmbanco)"""
+    __tablename__ = "gmbanco"
+
+    attached_documents = Column("adj_ban", Boolean, doc="Documentos Adjuntos")
+    send_note_by_operation = Column("apu_ban", Boolean, doc="Enviar Apunte por Operación")
+    deactivate = Column("baj_ban", Boolean, doc="¿Baja?")
+    locked = Column("blq_ban", Boolean, doc="¿Bloqueado?")
+    agency_code = Column("cag_ban", Integer, doc="Introduzca el Código de la Agencia")
+    bank_code = Column("cba_ban", Integer, doc="Introduzca la Entidad Bancaria")
+    bank_account = Column("cct_ban", String(11), doc="Introduzca la Cuenta Bancaria")
+    distribution_center = Column("cdc_ban", Integer, doc="Introduzca el Dígito de Control")
+    assignor = Column("ced_ban", String(15), doc="Introduzca el Cedente")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmbanco", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmbanco", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmbanco", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmbanco", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_ban", String(18), doc="Introduzca el R.F.C. del Banco")
+    bank_code_r_690 = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    cod_pai = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    code = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    code_r_579 = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    code_r_145 = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa del Banco")
+    address_line = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    neighborhood = Column("col_ban", String(60), doc="Introduzca la Colonia del Banco")
+    commission = Column("com_ban", Numeric(4, 2), doc="Introduzca la Comisión del Banco")
+    accountant = Column("conp_ban", Integer, doc="Contador de Pagares")
+    item = Column("con_ban", String(3), doc="Concepto")
+    email = Column("cor_ban", Numeric(9, 2), doc="Introduzca los Gastos de Correo")
+    tax_withholding_account = Column("cret_ban", String(12), doc="Introduzca la Cuenta de Retenciones")
+    secondary_bank_account = Column("ctac_ban", String(25), doc="Introduzca la Cuenta Banco Complementaria")
+    bank_account_currency = Column("ctad_ban", String(25), doc="Introduzca la Cuenta Banco Divisa")
+    account_code = Column("cta_ban", String(25), doc="Introduzca el Código de Cuenta del Banco en el Plan Contable")
+    account_contract_confirmation = Column("ctc_ban", String(25), doc="Introduzca la Cuenta Contable de Confirming")
+    identification_code = Column("dcc_ban", Integer, doc="Dígito de Contro del Código de Identificación")
+    dc_iban = Column("dci_ban", Integer, doc="Dígito de Control del IBAN")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmbanco", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmbanco", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmbanco", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmbanco", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    risk_days = Column("dia_ban", Integer, doc="Introduzca el Número de Días a Cubrir el Riesgo")
+    address = Column("dir_ban", String(55), doc="Introduzca la Dirección del Banco")
+    postal_code = Column("dpo_ban", Integer, doc="Introduzca el Distrito Postal del Banco")
+    payment_cash_account = Column("ecob_ban", String(12), doc="Introduzca la Cuenta de Efectos al Cobro")
+    cash_account_description = Column("edes_ban", String(25), doc="Introduzca la Cuenta de Efectos Descontados")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email_r_575 = Column("ema_ban", String(60), doc="Introduzca E-Mail")
+    fax = Column("fax_ban", String(18), doc="Introduza Fax")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmbanco", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmbanco", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmbanco", Date, doc="fecha3Tlmp")
+    flat_rate = Column("for_ban", Numeric(4, 2), doc="Introduzca el % de Forfait")
+    payment_method = Column("fpg_ban", String(1), doc="Forma de Pago")
+    remittance_format = Column("frm_ban", Integer, doc="Formato Remesa")
+    expenses = Column("gas_ban", Numeric(9, 2), doc="Importe de los Gastos")
+    iban = Column("iban_ban", String(35), doc="Identificador IBAN")
+    identification_code_r_795 = Column("ide_ban", Integer, doc="Código Identificación del Pagare")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    iip_ban = Column("iip_ban", Numeric(10, 2), doc="Introduzca el Importe de Impagados")
+    subcontractor = Column("inti_ban", Integer, doc="Intervalo inferior del contador de Pagarés")
+    superior_intervention = Column("ints_ban", Integer, doc="Intervalo Superior del contador de pagares")
+    shipment_import_duty = Column("ire_ban", Numeric(11, 2), doc="Introduzca el Importe de las Remesas")
+    min_commission = Column("min_ban", Numeric(9, 2), doc="Introduzca el % Mínimo de Comisión")
+    unpaid_count = Column("nip_ban", Integer, doc="Introduzca el Número de Impagados")
+    name = Column("nom_ban", String(55), doc="Introduzca el Nombre del Banco")
+    remittance_number = Column("nre_ban", Integer, doc="Introduzca el Número de Remesas")
+    number = Column("num_ban", String(4), doc="Introduzca número de la vía pública")
+    notes = Column("obs_ban", String(400), doc="Introduzca las Observaciones a Cerca del Banco")
+    city = Column("pob_ban", String(30), doc="Introduzca la Población del Banco")
+    scope = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    risk_granted = Column("ric_ban", Numeric(11, 2), doc="Introduzca el Riesgo Concedido por el Banco")
+    live_risk = Column("riv_ban", Numeric(10, 2), doc="Introduzca el Riesgo Vivo")
+    series = Column("ser_ban", String(2), doc="Serie Contador de Pagares")
+    sfj_ban = Column("sfj_ban", String(3), doc="Sufijo norma 34.14")
+    suffix = Column("suf_ban", Integer, doc="Introduzca el Sufijo para la Remesa por Diskette")
+    phone_number = Column("tel_ban", String(18), doc="Introduzca el Teléfono del Banco")
+    price_ranges = Column("tra_ban", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias")
+    price_ranges_r_444 = Column("tra_ban1", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias [1]")
+    price_ranges_2 = Column("tra_ban2", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias [2]")
+    price_ranges_r_529 = Column("tra_ban3", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias [3]")
+    price_ranges_r_848 = Column("tra_ban4", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias [4]")
+    price_ranges_5 = Column("tra_ban5", Numeric(4, 2), doc="Introduzca % de Tramos para 30/60/90/120/o más dias [5]")
+    website = Column("web_ban", String(45), doc="Web del Banco")
+
+
+class BankMovementsLines(ReadOnlyRow, LegacyBase):
+    """Detalle de Movimientos Bancarios (gmbanmol)"""
+    __tablename__ = "gmbanmol"
+
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    cash_register_id = Column("cod_caj", Integer, doc="Código de Caja")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    cash_movement_branch_id = Column("del_mca", Integer, doc="Delegación del Movimiento de Caja")
+    document_id = Column("doc_mov", Integer, doc="Nº de documento")
+    bill_id = Column("efc_ppg", Integer, doc="Introduzca el Nº de Efecto")
+    line_number = Column("lin_mol", Integer, doc="Nº Línea")
+    invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de Factura")
+    cash_movement_id = Column("num_mca", Integer, doc="Número de Movimiento de Caja")
+    bank_movement_id = Column("num_mov", Integer, doc="Introduzca el Número del Movimiento")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    movement_type = Column("tip_mov", String(1), doc="Tipo Mov.")
+
+
+class BankMovements(LegacyBase):
+    """Movimientos Bancarios (gmbanmov)"""
+    __tablename__ = "gmbanmov"
+
+    accounting_entry_id = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    statement_concept = Column("cex_mov", String(100), doc="Introduzca el Concepto del Extracto")
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method = Column("cod_mpag", Integer, doc="Modo de Pago")
+    vendor_id = Column("cod_pro", Integer, doc="Introduzca el Código de Acreedor")
+    user_id = Column("cod_usu", String(8), doc="Código del Usuario")
+    comments = Column("com_mov", String(100), doc="Introduzca el Comentario")
+    accounted = Column("ctb_mov", Boolean, doc="Contabilizado")
+    counterpart = Column("ctr_mov", String(12), doc="Introduzca la Contrapartida")
+    movement_description = Column("des_mov", String(100), doc="Descripción del Movimiento")
+    document_id = Column("doc_mov", Integer, doc="Nº de documento")
+    bill_id = Column("efc_ppg", Integer, doc="Introduzca el Nº de Efecto")
+    movement_state = Column("est_mov", String(1), doc="Estado del movimiento")
+    creation_date = Column("fea_mov", DateTime, doc="Fecha de Alta del Movimiento")
+    movement_date = Column("fec_mov", Date, doc="Introduzca la Fecha del Movimiento")
+    generate_expense_invoice = Column("fga_mov", Boolean, doc="Generar Factura de Gastos")
+    value_date = Column("fva_mov", Date, doc="Fecha de Valor del Movimiento")
+    due_date = Column("fvt_ppg", Date, doc="Introduzca la Fecha de Vencimiento")
+    expenses_amount = Column("gas_mov", Numeric(10, 2), doc="Introduzca el Importe de los Gastos")
+    unpaid_expenses = Column("gim_mov", String(1), doc="Gastos Impagados")
+    expenses_included = Column("gin_mov", Boolean, doc="Gastos Incluidos en el Movimiento")
+    other_movement_expenses = Column("gom_mov", Boolean, doc="Gasto de otro movimiento")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    statement_amount = Column("iex_mov", Numeric(11, 2), doc="Introduzca el Importe del Extracto")
+    expense_invoice_amount = Column("imp_fac", Numeric(11, 2), doc="Introduzca Importe Factura")
+    movement_amount = Column("imp_mov", Numeric(11, 2), doc="Introduzca el Importe del Movimiento")
+    name = Column("nom_fis", String(100), doc="Introduzca el Nombre Fiscal")
+    related_movement_id = Column("numr_mov", Integer, doc="Nº de movimiento relacionado")
+    invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de Factura")
+    movement_id = Column("num_mov", Integer, doc="Introduzca el Número del Movimiento")
+    vendor_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    reference_2 = Column("ref2_mov", String(40), doc="Referencia 2 del Movimiento")
+    reference = Column("ref_mov", String(40), doc="Referencia del Movimiento")
+    movement_type = Column("tip_mov", String(1), doc="Tipo Mov.")
+
+
+class CustomerBranch(ReadOnlyRow, LegacyBase):
+    """Datos Clientes por Delegación (gmclidel)"""
+    __tablename__ = "gmclidel"
+
+    abc = Column("abc_cli", String(1), doc="ABC")
+    group_delivery_notes = Column("aga_cli", String(1), doc="Introduzca (S/N/R) Agrupar Albaranes ó (R) por Referencia")
+    single_delivery_note = Column("albu_cli", Boolean, doc="Crear Albarán de Venta único en Asignación Pedido")
+    is_deregistered = Column("baj_cli", Boolean, doc="¿Baja de Cliente?")
+    is_locked_branch = Column("blq_cli", Boolean, doc="¿Cliente Bloqueado en Emp./Dg.?")
+    caf = Column("caf_cde", String(8), doc="CAF del Cliente")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    activity_id = Column("cod_acc", String(4), doc="Introduzca el Código de la Actividad")
+    subactivity_id = Column("cod_act", String(4), doc="Introduzca el Código de la Subactividad")
+    cod_ban = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    calendar_id = Column("cod_cal", String(4), doc="Calendario")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    delivery_type_id = Column("cod_coe", String(3), doc="Introduzca Condiciones de Entrega")
+    branch_id = Column("cod_del", Integer, doc="Delegación")
+    worker_id = Column("cod_empl", Integer, doc="Gestor de Cobro")
+    company_id = Column("cod_ent", Integer, doc="Empresa")
+    report_work_invoice = Column("cod_fob", Integer, doc="Introduzca el Código del Formulario de Facturas de Obras")
+    report_work_invoice_b = Column("cod_fob_b", Integer, doc="Formulario Facturas Obras para Training")
+    report_cash_delivery_note = Column("cod_foc", Integer, doc="Introduzca el Código del Formulario de Albaranes de Contado")
+    report_cash_delivery_note_b = Column("cod_foc_b", Integer, doc="Formulario Albaranes Contado para Training")
+    report_quote = Column("cod_foe", Integer, doc="Introduzca Formulario de Presupuestos")
+    report_quote_b = Column("cod_foe_b", Integer, doc="Formulario Presupuestos para Training")
+    report_sales_invoice = Column("cod_fof", Integer, doc="Introduzca el Código del Formulario de Facturas de Venta")
+    report_sales_invoice_b = Column("cod_fof_b", Integer, doc="Formulario Facturas Ventas para Training")
+    report_offer = Column("cod_foo", Integer, doc="Introduzca el Código del Formulario de Ofertas")
+    report_offer_b = Column("cod_foo_b", Integer, doc="Introduzca el Cód. Formulario Ofertas para Training")
+    report_order = Column("cod_fop", Integer, doc="Introduzca el Código del Formulario de Pedidos")
+    report_order_d = Column("cod_fop_b", Integer, doc="Formulario Pedidos para Training")
+    report_credit_delivery_note = Column("cod_for", Integer, doc="Introduzca el Código del Formulario de Albaranes")
+    report_credit_delivery_note_b = Column("cod_for_b", Integer, doc="Formulario de Albaranes de Crédito para Training")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago del Cliente")
+    alternate_payment_method_id = Column("cod_fpg_a", Integer, doc="Forma de Pago Alternativa")
+    language_id = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    transport_type_id = Column("cod_mtra", Integer, doc="Modo de Transporte")
+    transactional_nature = Column("cod_natran", Integer, doc="Naturaleza Transaccional")
+    periodicity_id = Column("cod_perf", Integer, doc="Introduzca Periodicidad de la Facturación")
+    port_airport = Column("cod_puae", Integer, doc="Puerto/Aeropuerto")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante Asociado a este Cliente")
+    transfer_regime = Column("cod_retran", Integer, doc="Régimen de Transferencia")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa del Cliente")
+    subzone_id = Column("cod_szon", Integer, doc="Introduzca Código Subzona")
+    sales_tariff_id = Column("cod_tav", Integer, doc="Introduzca el código de la tartifa de venta")
+    default_contact_id = Column("cod_telc", Integer, doc="Introduzca Teléfono Activo.")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Código de Transportista")
+    zone_id = Column("cod_zon", Integer, doc="Introduzca el Código de Zona Comercial del Cliente")
+    invoice_copies = Column("cpf_cli", Integer, doc="Introduzca el Número de Copias de Factura a Realizar")
+    sales_ambit = Column("cve_amb", Integer, doc="Introduzca el Ambito de la Venta")
+    payment_day_1 = Column("d1p_cli", Integer, doc="Introduzca el Primer Día de Pago del Cliente")
+    payment_day_2 = Column("d2p_cli", Integer, doc="Introduzca el Segundo Día de Pago del Cliente")
+    payment_day_3 = Column("d3p_cli", Integer, doc="Introduzca el Tercer Día de Pago del Cliente")
+    due_bills_allowed_days = Column("daf_cli", Integer, doc="Días Autorizados Efectos Vencidos")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    no_payment_day_previous_2 = Column("dfa2_cli", String(5), doc="Introduzca el Posible Desplazamiento del Pago")
+    no_payment_day_previous_1 = Column("dfa_cli", String(5), doc="Introduzca el Posible Desplazamiento del Pago")
+    no_payment_day_next_2 = Column("dfp2_cli", String(5), doc="Introduzca el Posible Desplazamiento del Pago")
+    no_payment_day_next_1 = Column("dfp_cli", String(5), doc="Introduzca el Posible Desplazamiento del Pago")
+    ecommerce_discount = Column("dte_cli", Numeric(4, 2), doc="Descuento e-commerce")
+    promp_payment_discount = Column("dtf_cli", Numeric(4, 2), doc="Introduzca Descuento Pronto Pago (+/-) Aplicado a sus Facturas")
+    general_discount_1 = Column("dtg_cli1", Numeric(4, 2), doc="Introduzca el Descuento General Aplicado a este Cliente [1]")
+    general_discount_2 = Column("dtg_cli2", Numeric(4, 2), doc="Introduzca el Descuento General Aplicado a este Cliente [2]")
+    general_discount_3 = Column("dtg_cli3", Numeric(4, 2), doc="Introduzca el Descuento General Aplicado a este Cliente [3]")
+    financial_surcharge = Column("dtr_cli", Numeric(4, 2), doc="Introduzca el Recargo Financiero (+/-) Aplicable a sus Facturas")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    edi_id = Column("edi_cli", String(40), doc="Introduzca identificador EDI")
+    has_edi = Column("edi_com", Boolean, doc="¿Comunicaciones ELECTROEDI?")
+    send_electronic_invoices = Column("efa_cli", Boolean, doc="Indica si al Cliente se le enviará la e-factura o no")
+    send_email = Column("env_ema", Boolean, doc="Envio por E-mail de Facturas de Venta")
+    send_fax = Column("env_fax", Boolean, doc="Envío por Fax de Factura de Venta")
+    has_discount_scale = Column("esc_cli", Boolean, doc="Escalado Descuentos de Venta para este Cliente")
+    is_vat_exempt = Column("exe_cli", Boolean, doc="El Cliente está exento de IVA")
+    invoice_returns = Column("fab_cli", Boolean, doc="Facturar Abonos")
+    deregistered_date = Column("fba_cli", Date, doc="Fecha de baja")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    no_payment_day_end_2 = Column("fnf2_cli", String(5), doc="Introduzca el Día/Mes de Fin de No Pago 2 del Cliente")
+    no_payment_day_end_1 = Column("fnf_cli", String(5), doc="Introduzca el Día/Mes de Fin de No Pago del Cliente")
+    no_payment_day_start_2 = Column("fni2_cli", String(5), doc="Introduzca el Día/Mes de Inicio de No Pago 2 del Cliente")
+    no_payment_day_start_1 = Column("fni_cli", String(5), doc="Introduzca el Día/Mes de Inicio de No Pago del Cliente")
+    has_conditional_payment_type = Column("fpc_cli", Boolean, doc="Activar Forma de Pago Condicionada")
+    apply_glourinated_gas_tax = Column("gflu_cli", String(8), doc="Aplicar Tasa Gas Fluorado")
+    has_cmms = Column("gmao_cli", Boolean, doc="Cliente con GMAO")
+    default_payment_type_minimum_amount = Column("ifph_cli", Numeric(9, 2), doc="Importe Mínimo para Aplicar la Forma Pago Habitual")
+    minimum_amount = Column("imf_cli", Numeric(7, 2), doc="Introduzca el Importe Mínimo a Facturar para este Cliente")
+    prepais_shipping_minimum_amount = Column("ipp_pro", Numeric(8, 2), doc="Introduzca el Importe Mínimo para Portes Pagados")
+    apply_personal_income_tax = Column("irp_cli", Boolean, doc="¿ IRPF ?")
+    has_erp_exchange = Column("isg_cli", Boolean, doc="Intercambio Sitelec-Gedilec")
+    apply_foreign_vat = Column("ivae_cli", Boolean, doc="Aplicar IVA a Cliente Extranjero")
+    vat_type = Column("ivai_cli", String(1), doc="(C)omunitario,  (N)o Comunitario, C(a)nario, (P)romotora")
+    apply_insolvency_law = Column("lmo_cli", Boolean, doc="Aplica Ley de Morosidad")
+    has_margin_control = Column("marv_cli", Boolean, doc="Control Márgenes de Venta")
+    order_minimum_amount = Column("mip_pro", Numeric(8, 2), doc="Introduzca el Importe Mínimo que ha Tener el Pedido")
+    billing_address_id = Column("num_cco", Integer, doc="Introduzca el Código de la Dirección de Cobro del Cliente")
+    shipping_address_delivery_notes_id = Column("num_cen", Integer, doc="Introduzca el Código de la Dirección de Envio del Albarán")
+    shipping_address_quotes_id = Column("num_cene", Integer, doc="Introduzca el Cód. de la Dirección de Envio de los Presupuestos")
+    shipping_address_invoices_id = Column("num_cenf", Integer, doc="Introduzca el Código de la Dirección de Envio de las Facturas")
+    shipping_address_goods_id = Column("num_cenm", Integer, doc="Introduzca el Código de la Dirección de Envio de la mercadería")
+    shipping_address_orders_id = Column("num_cenp", Integer, doc="Introduzca el Código de la Dirección de Envio de los Pedidos")
+    shipping_address_bills_id = Column("num_cenr", Integer, doc="Introduzca el Código de la Dirección de Envio de los Recibos")
+    lock_reason = Column("oba_cli", String(800), doc="Motivo")
+    notes = Column("obs_cli", String(1200), doc="Introduzca las Observaciones a cerca del Cliente")
+    is_mandatory_buyer_id = Column("oco_cli", Boolean, doc="Indicar si es Obligatorio informar el Comprador")
+    has_partially_priced_delivery_notes = Column("par_cli", Boolean, doc="¿Albaranes Valorados Parcialmente?")
+    unpaid_cash_bills_amount = Column("pcc_cde", Numeric(11, 2), doc="Pendiente Cobro en Contados")
+    issue_full_orders = Column("pec_cli", Boolean, doc="¿Los Pedidos se han de Servir Completos?")
+    risk_coverage = Column("pol_cli", String(12), doc="Introduzca el Nº de Póliza de Riesgo")
+    include_shipping_in_prompt_payment = Column("ppp_cli", Boolean, doc="¿ Incluir los Portes en Dto. P.Pago ?")
+    apply_promotions = Column("prom_cli", Boolean, doc="Indicar si está sujeto a Promociones de Venta por Puntos")
+    sales_forecast_amount = Column("prv_cli", Numeric(12, 2), doc="Introduzca la Previsión de Ventas del Cliente")
+    pending_amount_to_invoice = Column("ptf_cde", Numeric(11, 2), doc="Pendiente de Facturar Total")
+    apply_recycling_tax = Column("raee_cli", Boolean, doc="Indicar si se aplica RAEE en el Cliente")
+    has_rappel_aggregated_by_group = Column("rap_acu", Boolean, doc="¿Rappel Acumulativo?")
+    risk_amount_pending_invoice = Column("rcpf_cde", Numeric(11, 2), doc="Riesgo Cliente Pendiente de Facturar")
+    is_mandatory_reference_2 = Column("ref_aux", Boolean, doc="Ref. Auxiliar Obligatoria en Pedidos y Albaranes Venta")
+    is_mandatory_reference = Column("ref_vta", Boolean, doc="Referencia Obligatoria en Documentos Venta")
+    apply_sales_equalization_tax = Column("req_cli", Boolean, doc="¿ Posee Recargo de Equivalencia ?")
+    insured_risk_amount = Column("ria_cli", Numeric(12, 2), doc="Introduzca el Riesgo Concedido / Asegurado para este Cliente")
+    granted_risk_amount = Column("ric_cli", Numeric(12, 2), doc="Introduzca el Riesgo Concedido / Asegurado para este Cliente")
+    invoice_series = Column("sfa_cli", Integer, doc="Introduzca la Serie de Facturación que utilizará el Cliente")
+    catalog_type = Column("tcat_cli", String(1), doc="(T)odos los Artículos, Artículos (C)liente")
+    uses_tickets = Column("tic_cli", Boolean, doc="¿ Venta con Ticket ?")
+    discount_type = Column("tip_cli", Integer, doc="Introduzca el Tipo de Descuento de Ventas (1-8)")
+    promotion_type = Column("tli_cli", Boolean, doc="(R)egalo  (A)bono")
+    final_price_tariff = Column("tpf_cli", Boolean, doc="Tarifa Precio Final")
+    priced_delivery_notes = Column("vab_cli", Boolean, doc="¿Albaranes de Clientes Valorados?")
+
+
+class Customer(LegacyBase):
+    """Maestro de Clientes (gmclien)"""
+    __tablename__ = "gmclien"
+
+    has_attachments = Column("adj_cli", Boolean, doc="Documento Adjunto")
+    is_public_administration = Column("adm_cli", Boolean, doc="Identifica si es: Administración Pública/Empresa privada")
+    has_self_invoicing = Column("aut_cli", Boolean, doc="Autofactura")
+    is_locked = Column("blqg_cli", String(1), doc="¿Cliente Bloqueado General?")
+    account_advance_payment = Column("cant_cli", String(25), doc="Cta Anticipo del Cliente")
+    has_shared_contacts_by_zone = Column("cczs_cli", Boolean, doc="Contactos comunes de las direcciones de envío  por Zona/Subzona")
+    account_doubtful_receivables = Column("cdc_cli", String(12), doc="Cta. Dudoso Cobro")
+    account_trade_receivables = Column("cec_cli", String(25), doc="Introduzca el Código de Cuenta de Efectos Comerc. en Cartera")
+    account_unpaid_bills = Column("cei_cli", String(25), doc="Introduzca la Cta. de Efectos Impagados.")
+    account_trade_receivables_in_management = Column("cgc_cli", String(25), doc="Introduzca la Cta. de Efectos Comerc. en Gestión de Cobro")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. / D.N.I. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    purchasing_group_commission = Column("coc_cli", Numeric(5, 2), doc="Comisión Grupo de Compra")
+    default_attachment_id = Column("cod_cgd", Integer, doc="Contador Documento")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    group_id = Column("cod_ggc", Integer, doc="Introduzca Código de Grupo de Gestión de Cliente")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código de País del Cliente")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    subgroup_id = Column("cod_sgc", Integer, doc="Introduzca Código Subgrupo de Gestión de Clientes")
+    treatment_id = Column("cod_tto", String(4), doc="Introduzca el tratamiento")
+    user_id = Column("cod_usu", String(8), doc="Introduzca el Login (identificación) del Usuario")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    account_insolvency_provision = Column("cpi_cli", String(12), doc="Cta. Prev. Insolvencias")
+    account_tax_retention = Column("cre_cli", String(25), doc="Introduzca la Cta. Contable para Retenciones")
+    account_auxiliar = Column("ctac_cli", String(25), doc="Introduzca Cuenta Cliente")
+    account_customer_currency = Column("ctad_cli", String(25), doc="Introduzca la Cuenta Cliente Divisa")
+    account_accounting = Column("cta_cli", String(25), doc="Introduzca el Código de Cuenta Contable del Cliente")
+    account_deducted_bills = Column("cte_cli", String(25), doc="Introduzca Cta, de efectos descontados")
+    account_cash = Column("ctl_cli", String(25), doc="Introduzca la Cuenta Contado Utilizada por el Cliente")
+    account_sales_returns = Column("cxdv_cli", String(25), doc="Introduzca la Cuenta de Devolución Ventas")
+    account_customer_tax = Column("cxi_cli", String(25), doc="Introduzca la Cta. de Iva del Cliente")
+    account_prompt_payment = Column("cxpp_cli", String(25), doc="Introduzca la Cta. Contable para Pronto Pago")
+    account_shipping_costs = Column("cxp_cli", String(25), doc="Introduzca la Cta. de Portes")
+    account_financial_surcharge = Column("cxrf_cli", String(25), doc="Introduzca Cta. Recargo Financiero.")
+    account_sales_equalization_tax = Column("cxrq_cli", String(25), doc="Introduzca Cta. para el Req.")
+    account_rappel = Column("cxr_cli", String(25), doc="Introduzca la Cta. Contable de Rappel")
+    account_sales = Column("cxv_cli", String(25), doc="Introduzca la Cta. Contable de Ventas")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    send_newsletter = Column("ebo_cli", Boolean, doc="Emitir Boletines")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    send_invoices = Column("envf_cli", Boolean, doc="Enviar Factura")
+    is_foreign = Column("ext_cli", Boolean, doc="Cliente Extranjero")
+    creation_date = Column("fea_cli", Date, doc="Introduzca la Fecha de Alta del Cliente")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    last_modified_date = Column("fmo_cli", Date, doc="Fecha última modif.")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    request_print_fluorinated_gas = Column("igf_cli", Boolean, doc="Pedir Impresión Doc. Gas Fluorado")
+    is_invoiced_at_central = Column("mdel_cli", Boolean, doc="¿ Es un cliente con Facturación Multidelegación en Central ?")
+    control_level = Column("niv_cli", Integer, doc="Introduzca el Nivel de Control del Cliente")
+    is_not_regular_customer = Column("noh_cli", Boolean, doc="¿ Cliente Habitual ?")
+    name = Column("nom_cli", String(55), doc="Introduzca el Nombre Fiscal del Cliente")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    is_resident = Column("resi_cli", Boolean, doc="¿ El cliente es Extranjero Residente ?")
+    vendor_reference = Column("rpr_cli", String(15), doc="Referencia que Este Cliente nos Asigna como Proveedor")
+    cfdi_series = Column("scfdi_fac", String(25), doc="Serie CFDI")
+    seek = Column("seek_cli", String(1600), doc="Introduzca valores de busqueda")
+    amortisation_type = Column("taf_cli", String(2), doc="Tipo de Amortización en Facturas")
+    cfdi_use = Column("uso_cli", String(3), doc="Uso CFDI")
+    web = Column("web_cli", String(45), doc="Web del Cliente")
+
+
+class DeliveryConditions(ReadOnlyRow, LegacyBase):
+    """Condiciones de Entrega (gmconden)"""
+    __tablename__ = "gmconden"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmconden", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmconden", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmconden", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmconden", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    delivery_conditions = Column("cod_coe", String(3), doc="Introduzca Condiciones de Entrega")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmconden", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmconden", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmconden", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmconden", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    e_commerce_description = Column("dese_coe", String(80), doc="Descripción e-commerce")
+    description = Column("des_coe", String(40), doc="Introduzca Descripción")
+    days = Column("dias_coe", Integer, doc="Días desplazamiento fecha entrega")
+    additional_days = Column("dia_adi", Integer, doc="Días adicionales")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmconden", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmconden", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gmconden", Date, doc="fecha3Tlmp")
+    deadline_time = Column("hor_lim", String(5), doc="Hora límite")
+    include_in_prep = Column("inc_pre", Boolean, doc="Incluir en Preparaciones")
+    iso = Column("iso_coe", String(3), doc="Introduzca ISO")
+    ecommerce_notes = Column("obse_coe", String(800), doc="Observaciones e-commerce")
+    sga_delivery = Column("sga_coe", String(20), doc="Estado de la Obra")
+    linked_order_action_type_complete_customer_orders = Column("tpc_coe", String(2), doc="Tipo acción vinculaciones con Ped. Cli. a servir Completos")
+    action_type_linkages_with_purchase_orders = Column("tpd_coe", String(2), doc="Tipo de acción en vinculaciones con Pedidos delegación")
+    incomplete_customer_order_linkage_action_type = Column("tpnc_coe", String(2), doc="Tipo acción vinculaciones con Ped. Cli. a servir No Completos")
+    action_type_linked_to_delivery_order = Column("tpr_coe", String(2), doc="Tipo de acción en vinculaciones con Pedidos reparto")
+
+
+class Timekeeping(LegacyBase):
+    """Control de Presencia (Fichajes) (gmconpre)"""
+    __tablename__ = "gmconpre"
+
+    attached_document = Column("adj_fic", Boolean, doc="Documento Adjunto")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    employee = Column("cod_empl", Integer, doc="Código del Empleado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_fic", String(800), doc="Descripción")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    end_date = Column("fef_fic", Date, doc="Fecha Fin Fichaje")
+    start_date = Column("fei_fic", Date, doc="Fecha Inicio Fichaje")
+    missing = Column("ffs_fic", Boolean, doc="Falta Salida")
+    end_hour = Column("hof_fic", Integer, doc="Hora Fin Fichaje")
+    start_hour = Column("hoi_fic", Integer, doc="Hora Inicio Fichaje")
+    worked_hours = Column("hot_fic", Numeric(7, 2), doc="Horas Trabajadas")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id unico")
+    entry_latitude = Column("lae_fic", String(30), doc="Latitud Fichaje Entrada")
+    exit_latitude = Column("las_fic", String(30), doc="Latitud Fichaje Salida")
+    entry_longitude = Column("loe_fic", String(30), doc="Longitud Fichaje Entrada")
+    exit_longitude = Column("los_fic", String(30), doc="Longitud Fichaje Salida")
+    notes = Column("obs_fic", String(1200), doc="Observaciones del Fichaje")
+
+
+class Contact(LegacyBase):
+    """Contactos de clientes, proveedores y potenciales (gmcontactos)"""
+    __tablename__ = "gmcontactos"
+
+    notify_birthday = Column("aan_cto", Boolean, doc="Aviso de Cumpleaños")
+    is_active_buyer = Column("act_cto", Boolean, doc="Indicar si está activo como comprador")
+    birthday = Column("ani_cto", Date, doc="Aniversario")
+    surname_1 = Column("ap1_cto", String(20), doc="Apellido 1")
+    surname_2 = Column("ap2_cto", String(20), doc="Apellido 2")
+    barcode = Column("bar_cto", String(30), doc="Código de Barras identificador del Comprador.")
+    user_char1 = Column("char1_al", String(100), doc="Character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="Character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="Character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="Character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="Character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="Character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="Character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="Character8Usr")
+    vat_number = Column("cif_cto", String(18), doc="Introduzca el C.I.F. / D.N.I.")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    contact_id = Column("cod_cto", Integer, doc="Introduzca Contacto")
+    related_contact_id = Column("cod_ctor", Integer, doc="Contacto Relacionado")
+    department_id = Column("cod_dep", String(40), doc="Departamento")
+    potential_customer_id = Column("cod_dir", Integer, doc="Cliente Potencial")
+    vendor_id = Column("cod_pro", Integer, doc="Proveedor")
+    treatment_id = Column("cod_tto", String(4), doc="Tratamiento")
+    buyer_id = Column("c_cod_cto", String(10), doc="Código Comprador")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="Decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="Decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="Decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="Decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="Decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="Decimal6Usr")
+    email_cc = Column("ecc_cto", String(200), doc="E-mail (CC)")
+    user_edi1 = Column("edi1_al", String(1000), doc="Editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="Editor2Usr")
+    email = Column("ema_cto", String(60), doc="Introduzca E-mail")
+    phone_extension_1 = Column("ex1_cto", String(6), doc="Extensión 1")
+    phone_extension_2 = Column("ex2_cto", String(6), doc="Extensión 2")
+    creation_date = Column("fal_cto", Date, doc="Fecha Alta")
+    sent_by_fax = Column("fax_cto", String(18), doc="Introduzca el Fax")
+    activation_date = Column("fea_cto", Date, doc="Introduzca Fecha de Activación")
+    user_fec1 = Column("fec1_al", Date, doc="Fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="Fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="Fecha3Usr")
+    due_date = Column("fec_cto", Date, doc="Introduzca Fecha de Caducidad")
+    modification_date = Column("fmo_cto", Date, doc="Fecha Modif.")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    related_unique_id = Column("Id_unicor", BigInteger, doc="Id Contacto Relacionado")
+    parent_unique_id = Column("Id_uni_pa", BigInteger, doc="Id único del padre")
+    name = Column("nom_cto", String(20), doc="Nombre")
+    notes = Column("obs_cto", String(800), doc="Observaciones")
+    contact_person = Column("per_cto", String(55), doc="Introduzca el Nombre de la Persona de Contacto")
+    is_default_for_payments = Column("ppp_cto", Boolean, doc="Predefinido para Pagos")
+    has_promotion = Column("prom_cto", Boolean, doc="Indicar si está sujeto a Promociones de Venta por Puntos")
+    vendor_ambit = Column("pro_amb", Integer, doc="Introduzca el ambito del proveedor")
+    is_pending_review = Column("rev_cto", Boolean, doc="Pendiente de Revisión")
+    phone_2 = Column("tel2_cto", String(18), doc="Teléfono 2")
+    phone_1 = Column("tel_cto", String(18), doc="Introduzca Teléfono")
+    worker_type = Column("tipo-op", Integer, doc="Código de Perfil del Contacto")
+    contact_type = Column("tip_cto", String(3), doc="Tipo Contacto")
+    mobile_phone = Column("tmo_cto", String(18), doc="Móvil")
+    web = Column("web_cto", String(40), doc="Introduzca pagina Web")
+
+
+class Gmdepartments(ReadOnlyRow, LegacyBase):
+    """Maestro de Departamentos a los que Pueden Pertenecer los Empleados (gmdepar)"""
+    __tablename__ = "gmdepar"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmdepar", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmdepar", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmdepar", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmdepar", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    code = Column("cod_dep", String(8), doc="Introduzca Departamento")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmdepar", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmdepar", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gmdepar", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_206 = Column("dec4_gmdepar", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_dep", String(35), doc="Introduzca Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmdepar", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmdepar", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gmdepar", Date, doc="fecha3Tlmp")
+
+
+class CustomerAddress(LegacyBase):
+    """Posibles Direcciones Físicas de cada Cliente. Serán Utilizadas para Enví (gmdirenv)"""
+    __tablename__ = "gmdirenv"
+
+    has_attachments = Column("adj_cen", Boolean, doc="Documento Adjunto")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_ambit = Column("cli_amb", Integer, doc="Ambito Cliente")
+    address_id = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Envío")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente de la Dirección de Envío")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    subzone_id = Column("cod_szon", Integer, doc="Introduzca Código Subzona")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    zone_id = Column("cod_zon", Integer, doc="Introduzca el Código de Zona Comercial del Cliente")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    street_name = Column("dir_cen", String(55), doc="Introduzca la Dirección de Envío")
+    postal_code = Column("dpo_cen", Integer, doc="Introduzca el Distrito Postal de la Dirección de Envío")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_cen", String(60), doc="Introduzca E-mail")
+    creation_date = Column("fal_cen", Date, doc="Fecha Alta")
+    fax = Column("fax_cen", String(18), doc="Introduzca el Fax de esta dirección")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    modification_date = Column("fmo_cen", Date, doc="Fecha Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    name = Column("nom_cen", String(55), doc="Introduzca el Nombre de la Dirección de Envío")
+    street_number = Column("num_cen", String(4), doc="Introduzca número de la vía pública")
+    notes = Column("obs_cen", String(800), doc="Observaciones")
+    contact_person = Column("per_cen", String(55), doc="Introduzca el Nombre de la Persona de Contacto")
+    city = Column("pob_cen", String(30), doc="Introduzca la Población de la Dirección de Envío")
+    phone_1 = Column("tel_cen1", String(18), doc="Introduzca el Teléfono de esta dirección [1]")
+    phone_2 = Column("tel_cen2", String(18), doc="Introduzca el Teléfono de esta dirección [2]")
+
+
+class Currencies(LegacyBase):
+    """Maestro de Divisas en las que se Expresan los Importes y Precios (gmdisas)"""
+    __tablename__ = "gmdisas"
+
+    abbreviation = Column("abr_sas", String(4), doc="Introduzca la Abreviatura de la Divisa")
+    automated_quote = Column("aut_sas", Boolean, doc="Cotizaci?n Autom?tica.")
+    construction_equipment_management = Column("cem_sas", Boolean, doc="¿Pertenece a la Comunidad Económica Monetaria?")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmdisas", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmdisas", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmdisas", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmdisas", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    currency = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmdisas", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmdisas", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gmdisas", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_362 = Column("dec4_gmdisas", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmdisas", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmdisas", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmdisas", Date, doc="fecha3Tlmp")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id único")
+    iso = Column("iso_sas", String(3), doc="Introduzca ISO")
+    description = Column("nom_sas", String(20), doc="Introduzca la Descripción de la Divisa")
+    decimal_places = Column("rou_sas", Integer, doc="Intorduza el Nº de decimales que posee la divisa")
+    sales_currency = Column("ven_sas", Boolean, doc="¿Divisa de Ventas?")
+
+
+class CompanyBranch(ReadOnlyRow, LegacyBase):
+    """Empresas (gmempr)"""
+    __tablename__ = "gmempr"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    purchases_ambit = Column("cco_amb", Integer, doc="Ambito C.Compra")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_emp", String(18), doc="Introduzca el C.I.F. de la Empresa")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el Ambito del cliente")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    sales_ambit = Column("cve_amb", Integer, doc="Ambito C.Venta")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    name = Column("nom_emp", String(30), doc="Introduzca el Nombre Fiscal de la Empresa")
+    vendor_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    business_name = Column("raz_emp", String(100), doc="Introduzca la Razón Social de la Empresa")
+
+
+class PaymentMethod(LegacyBase):
+    """Maestro de Formas de Pago (gmfopag)"""
+    __tablename__ = "gmfopag"
+
+    due_date_cadence = Column("cad_fpg", Integer, doc="Introduzca la Cadencia de Días entre Vencimientos")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    payment_document_id = Column("cod_dcc", String(10), doc="Tipo de Documento")
+    payment_method_id = Column("cod_fpg", Integer, primary_key=True, doc="Introduzca el Código de Forma de Pago")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    due_date_displacement = Column("des_fpg", Integer, doc="Introduzca el Número de Dias Hasta el Primer Vencimiento")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    payment_method_iso_code = Column("iso_fpg", String(5), doc="Introduzca ISO")
+    description = Column("nom_fpg", String(20), doc="Introduzca la Descripción de la Forma de Pago")
+    due_dates_number = Column("nvt_fpg", Integer, doc="Introduzca el Número de Vencimientos a Generar")
+    is_replenishment_type = Column("rep_fpg", Boolean, doc="Contado Reposición")
+    type = Column("tip_fpg", String(1), doc="Introduzca Tipo de Forma de Pago")
+
+
+class ManagementGroup(ReadOnlyRow, LegacyBase):
+    """Maestro de Subgrupos de Gestión de Proveedores (gmggpro)"""
+    __tablename__ = "gmggpro"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmggpro", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmggpro", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmggpro", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmggpro", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    code = Column("cod_ggp", Integer, doc="Grupo de Gestión de Proveedor")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmggpro", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmggpro", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmggpro", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmggpro", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmggpro", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmggpro", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmggpro", Date, doc="fecha3Tlmp")
+    name = Column("nom_ggp", String(30), doc="Introduzca Nombre del Grupo de Gestión de Proveedores")
+
+
+class Languages(LegacyBase):
+    """Maestro de Idiomas Utilizables por los Diferentes Interlocutores (gmidioma)"""
+    __tablename__ = "gmidioma"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmidioma", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmidioma", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmidioma", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmidioma", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    code = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmidioma", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmidioma", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gmidioma", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_720 = Column("dec4_gmidioma", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_idi", String(25), doc="Descripción la descripción del idioma")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmidioma", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmidioma", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmidioma", Date, doc="fecha3Tlmp")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id único")
+    iso = Column("iso_idi", String(2), doc="Introduzca ISO")
+
+
+class Country(LegacyBase):
+    """Maestro de Paises (gmpais)"""
+    __tablename__ = "gmpais"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id único")
+    intrastat_code = Column("intr_pai", String(2), doc="Código Intrastat")
+    iso_code = Column("iso_pai", String(3), doc="Código ISO del País")
+    name = Column("nom_pai", String(20), doc="Introduzca el Nombre del País")
+
+
+class Suppliers(LegacyBase):
+    """Maestro de Proveedores (gmprove)"""
+    __tablename__ = "gmprove"
+
+    attached_document = Column("adj_pro", Boolean, doc="Documento Adjunto")
+    apply_irpf_to_all_items = Column("airp_pro", Boolean, doc="Aplicar IRPF a todos los Artículos")
+    accepts_early_payment = Column("app_pro", Boolean, doc="Admite Pronto Pago")
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    b2b_purchase_order = Column("b2bpc_pro", Boolean, doc="¿Comunicaciones B2B para Ped. Compra?")
+    folder = Column("b2b_pro", String(60), doc="Introduzca Carpeta para Recep. y Envíos")
+    deactivation = Column("baj_pro", Boolean, doc="¿Baja?")
+    block = Column("blq_pro", Boolean, doc="Introduzca (S/N) Proveedor Bloqueado")
+    agency_code = Column("cag_pro", Integer, doc="Código de la Agencia para Transferencias Bancarias")
+    bank_code = Column("cba_pro", Integer, doc="Código Bancario para Transferencias Bancarias")
+    bank_account = Column("cct_pro", String(11), doc="Cuenta Bancaria para Transferencias Bancarias")
+    distribution_center = Column("cdc_pro", Integer, doc="Dígito de Control para Transferencias Bancarias")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmprove", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmprove", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmprove", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmprove", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_pro", String(18), doc="Introduzca el C.I.F. del Proveedor")
+    activity_code = Column("cod_acc", String(4), doc="Introduzca el Código de la Actividad")
+    subactivity = Column("cod_act", String(4), doc="Introduzca el Código de la Subactividad del Proveedor")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    bank_code_r_313 = Column("cod_ban", Integer, doc="Introduzca el Código de Banco por el que se Paga al Proveedor")
+    calendar_code = Column("cod_cal", String(4), doc="Calendario")
+    delivery_conditions = Column("cod_coe", String(3), doc="Introduzca Condiciones de Entrega")
+    income_tax_account = Column("cod_cta_irpf", String(12), doc="Cuenta Contable de IRPF para el Proveedor")
+    payment_method = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago del Proveedor")
+    management_group = Column("cod_ggp", Integer, doc="Introduzca Código Grupo de Gestión de Proveedores")
+    language = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    brand_code = Column("cod_mar", Integer, doc="Introduzca el Cód. de Marca a la que hace referencia la familia")
+    transport_mode = Column("cod_mtra", Integer, doc="Modo Transporte")
+    transactional_nature = Column("cod_natran", Integer, doc="Naturaleza Transaccional")
+    country = Column("cod_pai", String(2), doc="Introduzca el Código del País del Proveedor")
+    accountant = Column("cod_pgd", Integer, doc="Contador Documento")
+    financial_provider = Column("cod_prf", Integer, doc="Introduzca el Código de Proveedor Financiero")
+    code = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    protocol = Column("cod_prot", String(4), doc="Introduzca protocolo de comunicaciones B2B")
+    province = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    port_airport = Column("cod_puae", Integer, doc="Puerto/Aeropuerto")
+    transfer_regime = Column("cod_retran", Integer, doc="Régimen de Transferencia")
+    currency = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa del Proveedor")
+    management_group_r_339 = Column("cod_sgp", Integer, doc="Introduzca Código Subgrupo de Gestión de Proveedores")
+    purchase_rate = Column("cod_tac", Integer, doc="Introduzca la Tarifa de Compra")
+    active_phone = Column("cod_telp", Integer, doc="Introduzca Teléfono Activo.")
+    operation_type = Column("cod_tpo", Integer, doc="Introducir el Tipo de Operación")
+    transportation = Column("cod_tra", Integer, doc="Introduzca el Código de Transportista Habitual")
+    title_prefix = Column("cod_tto", String(4), doc="Tratamiento")
+    user_code = Column("cod_usu", String(8), doc="Introduzca el Login (identificación) del Usuario")
+    address_line = Column("cod_via", String(2), doc="Introduzca Sigla de la Vía Pública")
+    neighborhood = Column("col_pro", String(60), doc="Introduzca la Colonia del Proveedor")
+    confirming_account = Column("ctaco_pro", String(25), doc="Introduzca Cuenta Contable de Confirming")
+    supplier_account_payable = Column("ctac_pro", String(25), doc="Cuenta Proveedor Complementari")
+    supplier_account_in_currency = Column("ctad_pro", String(25), doc="Cuenta Proveedor en Divisa")
+    accounting_account = Column("ctaec_pro", String(25), doc="Introduzca una Cuenta Contable de Efectos Comerciales")
+    unreceived_invoice_account = Column("ctafn_pro", String(25), doc="Cta.Facturas no recibidas")
+    advance_account = Column("cta_ant", String(25), doc="Cuenta de Anticipos")
+    freight_account = Column("cta_fle", String(25), doc="Cuenta Contable de Fletes")
+    paid_freight = Column("cta_flp", String(25), doc="Cuenta Contable de Fletes efectivamente pagados")
+    accounting_account_r_239 = Column("cta_pro", String(25), doc="Introduzca una Cuenta Contable")
+    accounts_payable = Column("cte_pro", String(25), doc="Introduzca Cta, de efectos a Pagar")
+    accounting_account_r_551 = Column("ctp_sgp", String(12), doc="Introduzca la Cuenta Contable de Proveedot/Acreedor")
+    payment_day_1 = Column("d1p_pro", Integer, doc="Introduzca el Primer Día de Cobro del Proveedor")
+    payment_day_2 = Column("d2p_pro", Integer, doc="Introduzca el Segundo Día de Cobro del Proveedor")
+    payment_day_3 = Column("d3p_pro", Integer, doc="Introduzca el Tercer Día de Cobro del Proveedor")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmprove", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmprove", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmprove", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmprove", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    address = Column("dir_pro", String(55), doc="Introduzca la Dirección del Proveedor")
+    postal_code = Column("dpo_pro", Integer, doc="Introduzca el Distrito Postal del Proveedor")
+    discount_percentage = Column("dpp_pro", Numeric(4, 2), doc="Introduzca +/- % Dto. P.Pago para el Proveedor")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    edi_communication = Column("edi_com", Boolean, doc="Introduzca (S/N) Comunicaciones ELECTROEDI")
+    edi_identifier = Column("edi_pro", String(40), doc="Introduzca identificador EDI")
+    enlace_basura_rb = Column("enlace_basura_rb", Integer, doc="enlace_basura_rb")
+    supplier_vat = Column("exe_pro", Boolean, doc="Exento de IVA")
+    foreign = Column("ext_pro", Boolean, doc="Proveedor Extranjero")
+    registration_date = Column("fea_pro", Date, doc="Fecha de Alta del Proveedor")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmprove", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmprove", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gmprove", Date, doc="fecha3Tlmp")
+    freight_withholding = Column("fle_pro", Boolean, doc="Aplicar Retención en Fletes")
+    go_connect = Column("g2g_pro", Boolean, doc="GO!Connect")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    shipping_cost = Column("ipp_pro", Numeric(8, 2), doc="Introduzca Importe Mínimo para Portes Pagados")
+    income_tax_withholding = Column("irpf_pro", Numeric(4, 2), doc="Introduzca porcentaje de IRPF del Proveedor")
+    income_tax_irpf_modules = Column("irpm_pro", Numeric(4, 2), doc="Introduzca porcentaje de IRPF de Módulos")
+    vat_type = Column("ivai_pro", String(1), doc="Tipo (C)omunitario,  (N)o Comunitario, C(a)nario (P)romotora")
+    minimum_order_amount = Column("mip_pro", Numeric(8, 2), doc="Introduzca Importe Mínimo Pedido Proveedor")
+    regular_supplier = Column("noh_pro", Boolean, doc="¿ Proveedor Habitual ?")
+    name = Column("nom_pro", String(55), doc="Introduzca el Nombre del Proveedor")
+    number = Column("num_pro", String(4), doc="Introduzca número de la Vía Pública")
+    notes = Column("obs_pro", String(400), doc="Introduzca las Observaciones del Proveedor")
+    delivery_time = Column("pla_pro", Integer, doc="Plazo de Entrega")
+    city = Column("pob_pro", String(30), doc="Introduzca la Población del Proveedor")
+    porsic = Column("porsic", String(8), doc="TlmpPorsic_gmprove")
+    porsil = Column("porsil", Boolean, doc="TlmpPorsil_gmprove")
+    porsin = Column("porsin", Numeric(7, 2), doc="TlmpPorsin_gmprove")
+    freight_costs = Column("por_pro", String(1), doc="Introduzca Portes (P)agados  (D)ebidos")
+    freight_on_payment = Column("ppp_pro", Boolean, doc="¿ Incluir los Portes en Dto. P.Pago ?")
+    scope_r_324 = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    apply_weee = Column("raee_pro", String(1), doc="Indicar si se aplica RAEE en el Proveedor")
+    weee_from_article_in_linkages = Column("raev_pro", Boolean, doc="RAEE a partir de Artículo en Vinculaciones")
+    business_name = Column("raz_pro", String(100), doc="Razón Social del Proveedor")
+    customer_reference = Column("rcl_pro", String(15), doc="Referencia que este Proveedor nos Asigna como Cliente")
+    vat_id = Column("req_pro", Boolean, doc="Introduzca si el proveedor le aplica el Recargo de Equiv.")
+    resident_supplier = Column("resi_pro", Boolean, doc="¿ El Proveedor es Extranjero Residente ?")
+    vat_withholding = Column("ret_iva", Numeric(4, 2), doc="Retención IVA")
+    financial_surcharge = Column("rfi_pro", Numeric(4, 2), doc="Introduzca el Recargo Financiero para el Proveedor")
+    search = Column("seek_pro", String(1600), doc="Introduzca valores de busqueda")
+    invoice_series = Column("sfa_pro", Integer, doc="Introduzca la Serie de Facturación que utilizará el Proveedor")
+    invoice_type = Column("tfa_pro", String(1), doc="Tipo Factura")
+    inspection_time = Column("tins_pro", Integer, doc="Tiempo de Inspección (en Días)")
+    supplier_type = Column("tip_pro", Boolean, doc="Introduzca el Tipo de Proveedor (Proveedor/Acreedor)")
+    website = Column("web_pro", String(45), doc="Web del Proveedor")
+
+
+class Province(LegacyBase):
+    """Maestro de Provincias de cada uno de los Paises (gmprovi)"""
+    __tablename__ = "gmprovi"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    name = Column("des_provi", String(30), doc="Introduzca la Provincia")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id único")
+    intrastat_code = Column("intr_provi", Integer, doc="Código Intrastat")
+    iso_code = Column("iso_pro", String(5), doc="Introduzca ISO")
+
+
+class Gmrefcli(ReadOnlyRow, LegacyBase):
+    """Relación de Referencias Abiertas para cada Cliente. Son Utilizadas para (gmrefcli)"""
+    __tablename__ = "gmrefcli"
+
+    is_blocked = Column("blq_rcli", Boolean, doc="Bloqueada")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el Código de la Empresa.")
+    goods_address = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Mercaderías")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    branch_id = Column("cod_del", Integer, doc="Introduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Introduzca la empresa")
+    payment_method = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago")
+    country_id = Column("cod_pai_m", String(2), doc="Introduzca el Código del País")
+    periodicity_id = Column("cod_perf", Integer, doc="Introduzca la Periodicidad")
+    province_id = Column("cod_provi_m", Integer, doc="Introduzca el Código de la Provincia")
+    sales_agent_id = Column("cod_rep", Integer, doc="Introduzca el Código de Agente Comercial")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Código de Transportista")
+    street_type = Column("cod_via_m", String(2), doc="Introduzca Sigla de la vía pública")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("desr_cli", String(40), doc="Introduzca la Descripción.")
+    address = Column("dir_mer", String(55), doc="Introduzca la Dirección")
+    address_to_assign = Column("dme_rcli", Boolean, doc="Dirección a Asignar")
+    postal_code = Column("dpo_mer", Integer, doc="Introduzca el Distrito Postal de la Dirección de Mercaderías")
+    promp_payment_discount = Column("dtf_cli", Numeric(4, 2), doc="Introduzca el Descuento Pronto Pago")
+    data_to_assign = Column("dve_rcli", Boolean, doc="Datos a Asignar")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_editor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_mer", String(60), doc="Introduzca E-mail")
+    fax = Column("fax_mer", String(18), doc="Introduzca el Fax de esta dirección")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    shipping_street_number = Column("num_mer", String(4), doc="Introduzca número de la vía pública")
+    contact_person = Column("per_cen", String(55), doc="Introduzca el Nombre de la Persona de Contacto")
+    city = Column("pob_mer", String(30), doc="Introduzca la Población de la Dirección de Mercaderías")
+    business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social")
+    customer_reference = Column("ref_cli", String(20), doc="Introduzca Referencia del Cliente")
+    phone = Column("tel_mer", String(18), doc="Introduzca el Teléfono de esta dirección")
+
+
+class Representative(LegacyBase):
+    """Maestro de Agentes Comerciales (gmrepre)"""
+    __tablename__ = "gmrepre"
+
+    attached_document = Column("adj_rep", Boolean, doc="Documento Adjunto")
+    last_name = Column("ap1_rep", String(40), doc="Apellido 1")
+    last_name2 = Column("ap2_rep", String(40), doc="Apellido 2")
+    is_deregistered = Column("baj_rep", Boolean, doc="¿Baja?")
+    blocked = Column("blq_rep", Boolean, doc="¿Bloqueado?")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    char_1tlmp = Column("char1_gmrepre", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    char_2tlmp = Column("char2_gmrepre", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    char_3tlmp = Column("char3_gmrepre", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    char_4tlmp = Column("char4_gmrepre", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    salesman_id = Column("cod_com", String(8), doc="Introduzca Código de Comercial")
+    language_id = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante")
+    counter = Column("cod_rgd", Integer, doc="Contador Documento")
+    currency = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa del Representante")
+    subarea = Column("cod_szon", Integer, doc="Introduzca Código Subzona")
+    title = Column("cod_tto", String(4), doc="Tratamiento")
+    user_id = Column("cod_usu", String(8), doc="Introduzca el Login (identificación) del Usuario")
+    road_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    zone = Column("cod_zon", Integer, doc="Introduzca el Código de Zona Comercial")
+    neighborhood = Column("col_rep", String(60), doc="Introduzca la Colonia del Representante")
+    direct_commission = Column("com_rep", Numeric(4, 2), doc="Introduzca la Comisión Directa del Representante")
+    accounting_account = Column("cta_rep", String(12), doc="Introduzca el Código de Cuenta Contable del Representante")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_gmrepre", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal2user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_gmrepre", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_gmrepre", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_gmrepre", Numeric(11, 3), doc="decimal4Tlmp")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    address = Column("dir_rep", String(55), doc="Introduzca la Dirección del Representante")
+    id_card = Column("dni_rep", String(18), doc="Introduzca el D.N.I. del Representante")
+    postal_code = Column("dpo_rep", Integer, doc="Introduzca el Distrito Postal del Representante")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_user2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_rep", String(60), doc="Introduzca E-Mail")
+    registration_date = Column("fal_rep", Date, doc="Fecha de alta")
+    fax = Column("fax_rep", String(18), doc="Introduzca el Número de Fax del Representante")
+    date1_user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmrepre", Date, doc="fecha1Tlmp")
+    date2_user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmrepre", Date, doc="fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="fecha3Usr")
+    date3tlmp = Column("fec3_gmrepre", Date, doc="fecha3Tlmp")
+    last_modified_date = Column("fmo_rep", Date, doc="Fecha última modif.")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    minimum_order_amount = Column("imi_rep", Integer, doc="Introduzca el Importe Mínimo de Comisión")
+    name = Column("nom_rep", String(55), doc="Introduzca el Nombre del Representante")
+    number = Column("num_rep", String(4), doc="Introduzca número de la vía pública")
+    notes = Column("obs_rep", String(400), doc="Introduzca las Observaciones del Representante")
+    pda_id = Column("pda_rep", String(50), doc="Ident. PDA")
+    population = Column("pob_rep", String(30), doc="Introduzca la Población del Representante")
+    porsic = Column("porsic", String(8), doc="TlmpPorsic_gmrepre")
+    porsic2 = Column("porsic2", String(8), doc="TlmpPorsic2_gmrepre")
+    porsin = Column("porsin", Numeric(7, 2), doc="TlmpPorsin_gmrepre")
+    porsin2 = Column("porsin2", Numeric(7, 2), doc="TlmpPorsin2_gmrepre")
+    potential_customer_series = Column("ser_pot", Integer, doc="Series Cli. Poten. (PDA)")
+    commission_type = Column("tcm_rep", Boolean, doc="Tipo de Comisión a Aplicar (L) Por Línea (D) Por Documento")
+    phone = Column("tel_rep", String(18), doc="Introduzca el Teléfono del Representante")
+    commercial_agent_type = Column("tip_rep", String(1), doc="Tipo Agente Comercial")
+    mobile_phone = Column("tmo_rep", String(18), doc="Móvil")
+
+
+class ManagementSubgroup(ReadOnlyRow, LegacyBase):
+    """Descripciones Multi-idioma del Maestro de Subgrupos de Gestión de Provee (gmsgpro)"""
+    __tablename__ = "gmsgpro"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmsgpro", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmsgpro", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmsgpro", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmsgpro", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    code = Column("cod_ggp", Integer, doc="Grupo de Gestión de Proveed")
+    code_r_115 = Column("cod_sgp", Integer, doc="Introduzca Código Subgrupo de Gestión de Proveedores")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmsgpro", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmsgpro", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gmsgpro", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gmsgpro", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmsgpro", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmsgpro", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gmsgpro", Date, doc="fecha3Tlmp")
+    name = Column("nom_sgp", String(30), doc="Introduzca Nombre Subgrupo de Gestión de Proveedores")
+
+
+class BillReceivable(LegacyBase):
+    """Fichero de Tesorería (gmtesoc)"""
+    __tablename__ = "gmtesoc"
+
+    acceptance_state = Column("acp_fpg", String(1), doc="Introduzca Situación (E)-Enviar (V)-Enviada (A)-Aceptada")
+    has_attachments = Column("adj_ppg", Boolean, doc="Doc. Adj.")
+    quote_annex = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    is_advance_payment = Column("ant_ppg", Boolean, doc="Indicador de Efecto de Anticipo")
+    accounting_entry_id = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    is_locked = Column("blq_ppg", Boolean, doc="¿ El Documento de Pago Está Bloqueado ?")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_fis", String(18), doc="Introduzca el C.I.F. / D.N.I.")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el Ambito del Cliente")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    sales_order_id = Column("cod_cpc", Integer, doc="Código de Pedido de Venta")
+    payment_document_id = Column("cod_dcc", String(10), doc="Código de Tipo de Documento")
+    invoicing_branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    billing_branch_id = Column("cod_delo", Integer, doc="Introduzca Delegación Origen de Factura que Genera este Efecto")
+    worker_id = Column("cod_empl", Integer, doc="Gestor de Cobros")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago del Efecto")
+    work_project_id = Column("cod_obr", Integer, doc="Introduzca el código de Obra")
+    origin_country_id = Column("cod_pai", String(2), doc="Introduzca el Código de País del Cliente")
+    quote_id = Column("cod_pre", Integer, doc="Introduzca Código del Presupuesto")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    remittance_id = Column("cod_rem", Integer, doc="Introduzca el Número de Remesa")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Representante que Gestiona el Cobro")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa del Efecto")
+    user_id = Column("cod_usu", String(8), doc="Logín (identificación) del usuario.")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    street_name = Column("dir_fis", String(55), doc="Introduzca la Dirección del Cliente")
+    postal_code = Column("dpo_fis", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    bill_id = Column("efc_ppg", Integer, doc="Introduzca el Nº de Efecto")
+    bill_state = Column("est_ppg", String(1), doc="Estado")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_fac", Date, doc="Introduzca la Fecha de la Factura")
+    due_date = Column("fvt_ppg", Date, doc="Introduzca la Fecha de Vencimiento del Efecto")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    is_unpaid = Column("imp_ppg", Boolean, doc="¿ Indique si está Impagado ?")
+    printed = Column("ipr_ppg", Boolean, doc="¿ El Efecto está Impreso ?")
+    amount = Column("ivt_ppg", Numeric(12, 2), doc="Introduzca el Importe del Efecto")
+    name = Column("nom_fis", String(100), doc="Introduzca el Nombre Fiscal del Cliente")
+    sales_delivery_note_id = Column("num_alb", Integer, doc="Introduzca el código de albarán")
+    billing_address_id = Column("num_cco", Integer, doc="Introduzca el Código de la Dirección de Cobro del Cliente")
+    sale_invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de Factura de Venta")
+    street_number = Column("num_fis", String(4), doc="Introduzca número de la vía pública")
+    notes = Column("obs_ppg", String(1200), doc="Observaciones del Efecto")
+    city = Column("pob_fis", String(30), doc="Introduzca la Población del Cliente")
+    reference = Column("ref_ppg", String(20), doc="Introduzca la Referencia del Efecto")
+    phone = Column("tel_fis", String(18), doc="Introduzca Teléfono")
+    delivery_note_type = Column("tip_alb", String(1), doc="Tipo Albarán (C)ontado C(R)édito (T)icket (P)resupuesto (O)bra")
+    invoice_type = Column("tip_ppg", String(1), doc="Introduzca el Tipo de Documento (F)actura (A)bono")
+    currency_value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+    quote_version = Column("ver_pre", Integer, doc="Código de Versión del Presupuesto")
+
+
+class BillPayment(LegacyBase):
+    """Efectos Pago (gmtesop)"""
+    __tablename__ = "gmtesop"
+
+    has_attachments = Column("adj_ppg", Boolean, doc="Doc Adj.")
+    is_advance_payment = Column("ant_ppg", Boolean, doc="Indicador de Efecto de Anticipo")
+    accounting_entry_id = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    is_locked = Column("blq_ppg", Boolean, doc="¿ El Documento de Pago Está Bloqueado ?")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_fis", String(18), doc="Introduzca el C.I.F. / D.N.I.")
+    bank_id = Column("cod_ban", Integer, doc="Introduzca el Código de Banco")
+    petty_cash = Column("cod_chi", Integer, doc="Caja Chica")
+    payment_document_id = Column("cod_dcc", String(10), doc="Código de Tipo de Documento")
+    invoicing_branch_id = Column("cod_defp", Integer, doc="Intoduzca la delegación")
+    billing_branch_id = Column("cod_delp", Integer, doc="Introduzca Delegación Origen de Factura que Genera este Efecto")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago del Proveedor")
+    confirming_id = Column("cod_nco", Integer, doc="Introduzca el Número de Confirming")
+    promissory_note_id = Column("cod_npa", Integer, doc="Introduzca el Número de Pagare")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código de País del Cliente")
+    supplier_id = Column("cod_pro", Integer, doc="Introduzca el Código de Proveedor")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    payroll_receipt = Column("cod_rno", Integer, doc="Recibo Nómina")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    user_id = Column("cod_usu", String(8), doc="Logín (identificación) del usuario.")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    offset_in_advance = Column("coma_ppg", Boolean, doc="Indica que es un efecto Amortizado por anticipo")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    street_name = Column("dir_fis", String(55), doc="Introduzca la Dirección del Cliente")
+    endowment = Column("dot_ppg", Boolean, doc="Dotación")
+    postal_code = Column("dpo_fis", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    bill_id = Column("efp_ppg", Integer, doc="Introduzca el Nº de Efecto")
+    bill_state = Column("est_ppg", String(1), doc="Estado del Efecto")
+    user_date1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_ppg", Date, doc="Introduzca la Fecha de la Factura")
+    payment_date = Column("fep_ppg", Date, doc="Fecha Pago")
+    due_date = Column("fvt_ppg", Date, doc="Introduzca la Fecha de Vencimiento")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    printed = Column("ipr_ppg", Boolean, doc="¿ El Efecto está Impreso ?")
+    amount = Column("ivt_ppg", Numeric(12, 2), doc="Introduzca el Importe")
+    name = Column("nom_fis", String(100), doc="Introduzca el Nombre Fiscal del Cliente")
+    stub_number = Column("npg_ppg", String(15), doc="Introduzca el Nº de Talón / Pagaré")
+    delivery_note_id = Column("num_alc", Integer, doc="Número del Albarán de Compra")
+    order_id = Column("num_cpp", Integer, doc="Número del Pedido de Compra")
+    contract_number = Column("num_csu", Integer, doc="Introduzca el Número del Subcontrato de Compra")
+    street_number = Column("num_fis", String(4), doc="Introduzca número de la vía pública")
+    invoice_number = Column("num_ppg", Integer, doc="Introduzca el Número de Factura de Compra")
+    notes = Column("obs_ppg", String(1200), doc="Observaciones del efecto")
+    city = Column("pob_fis", String(30), doc="Introduzca la Población del Cliente")
+    forecast = Column("pre_ppg", Boolean, doc="¿ Es una previsión de pago?")
+    supplier_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    reference = Column("ref_ppg", String(20), doc="Introduzca la Referencia")
+    retention = Column("ret_ppg", Boolean, doc="Indica si el Efecto es una Retencion")
+    request_for_comments = Column("rfc_dest", String(18), doc="R.F.C. del destajista")
+    advanced_document_type = Column("tco_ppg", String(2), doc="Tipo Documento Ancitipo")
+    phone = Column("tel_fis", String(18), doc="Introduzca Teléfono")
+    invoice_type = Column("tip_ppg", Boolean, doc="Introduzca Cargo o Abono")
+    currency_value = Column("val_cot", Numeric(16, 8), doc="Introduzca valor de la divisa")
+
+
+class TimekeepingType(ReadOnlyRow, LegacyBase):
+    """Tipos de Fichaje (gmtipfic)"""
+    __tablename__ = "gmtipfic"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    timekeeping_type = Column("cod_tfi", Integer, doc="Tipo de Fichaje")
+    color = Column("col_tfi", String(8), doc="Color")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tfi", String(100), doc="Descripción")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1_user = Column("fec1_al", Date, doc="fecha1Usr")
+    date_to_use = Column("fec2_al", Date, doc="fecha2Usr")
+    date3_user = Column("fec3_al", Date, doc="fecha3Usr")
+    justified = Column("jus_tfi", Boolean, doc="Justificado")
+    holidays = Column("vac_tfi", Boolean, doc="Vacaciones")
+
+
+class Vat(LegacyBase):
+    """Maestro de Tipos de IVA (gmtiva)"""
+    __tablename__ = "gmtiva"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    char1_gmtiva = Column("char1_gmtiva", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    char2_gmtiva = Column("char2_gmtiva", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    char3_gmtiva = Column("char3_gmtiva", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    char4_gmtiva = Column("char4_gmtiva", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_id = Column("cod_iva", Integer, primary_key=True, doc="Introduzca el Código de IVA")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_gmtiva", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal2user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_gmtiva", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_gmtiva", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_gmtiva", Numeric(11, 3), doc="decimal4Tlmp")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_user2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_gmtiva", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2_temp = Column("fec2_gmtiva", Date, doc="fecha2Tlmp")
+    date3user = Column("fec3_al", Date, doc="fecha3Usr")
+    date3_temp = Column("fec3_gmtiva", Date, doc="fecha3Tlmp")
+    vat_percentage = Column("iva_iva", Numeric(4, 2), doc="Introduzca el Porcentaje de IVA")
+    vat_description = Column("nom_iva", String(20), doc="Introduzca la Descripción del Tipo de IVA")
+    tax_payer = Column("pas_iva", Boolean, doc="Inversión Sujeto Pasivo")
+    equivalence_balance_percentage = Column("req_iva", Numeric(4, 2), doc="Introduzca el Porcentaje de Recargo de Equivalencia")
+
+
+class Carrier(LegacyBase):
+    """Maestro de Transportistas (gmtran)"""
+    __tablename__ = "gmtran"
+
+    is_deregistered = Column("baj_tra", Boolean, doc="¿Baja?")
+    is_locked = Column("blq_tra", Boolean, doc="¿Bloqueado?")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    language_id = Column("cod_idi", String(3), doc="Introduzca el código del idioma")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Código de Transportista")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    street_name = Column("dir_tra", String(55), doc="Introduzca la Dirección del Transportista")
+    postal_code = Column("dpo_tra", Integer, doc="Introduzca el Distrito Postal del Transportista")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_tra", String(60), doc="Introduzca el Email del Transportista")
+    fax = Column("fax_tra", String(18), doc="Introduzca Fax del Transportista")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    name = Column("nom_tra", String(55), doc="Introduzca la Descripción Transportista")
+    street_number = Column("num_tra", String(4), doc="Introduzca número de la vía pública")
+    max_weight = Column("pes_tra", Numeric(9, 2), doc="Peso Máximo en kilos")
+    city = Column("pob_tra", String(30), doc="Introduzca la Población del Transportista")
+    has_tax = Column("tas_tra", Numeric(10, 3), doc="Introduzca la Tasa del Transportista")
+    load_time = Column("tcar_tra", Integer, doc="Introduzca el Tiempo de Carga en dias")
+    unload_time = Column("tdes_tra", Integer, doc="Tiempo de Descarga en dias")
+    phone = Column("tel_tra", String(18), doc="Introducir el Teléfono del Transportista")
+    phone_1 = Column("tel_tra1", String(18), doc="Introducir el Teléfono del Transportista [1]")
+    phone_2 = Column("tel_tra2", String(18), doc="Introducir el Teléfono del Transportista [2]")
+    delivery_time = Column("tent_tra", Integer, doc="Introduzca el Tiempo de Entrega en dias")
+    tax_type = Column("tiptas_tra", String(20), doc="Introduzca el Tipo de Tasa")
+    carrier_type = Column("tip_tra", String(18), doc="Introduzca Tipo Transportista")
+    max_volume = Column("vol_tra", Numeric(9, 2), doc="Volumen Máximo en metros cúbicos")
+    web = Column("web_tra", String(45), doc="Web del Transportista")
+
+
+class Addresses(ReadOnlyRow, LegacyBase):
+    """Maestro de los Diferentes Tipos de Vías Públicas (gmvia)"""
+    __tablename__ = "gmvia"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gmvia", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gmvia", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gmvia", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gmvia", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    address_line = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gmvia", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gmvia", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gmvia", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_853 = Column("dec4_gmvia", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gmvia", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gmvia", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gmvia", Date, doc="fecha3Tlmp")
+    description = Column("nom_via", String(30), doc="Introduza descripción de la vía pública")
+
+
+class WorkActivities(ReadOnlyRow, LegacyBase):
+    """Maestro de Posibles Actividades a Asignar en Presupuestos y Obras (gobact)"""
+    __tablename__ = "gobact"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gobact", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gobact", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gobact", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gobact", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad de Obra")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gobact", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gobact", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gobact", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_404 = Column("dec4_gobact", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_act", String(30), doc="Descripción de la Actividad")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gobact", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gobact", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gobact", Date, doc="fecha3Tlmp")
+
+
+class WorkSubactivities(ReadOnlyRow, LegacyBase):
+    """Maestro de Posibles Subactividades a Asignar en Presupuestos y Obras (gobactl)"""
+    __tablename__ = "gobactl"
+
+    employee_control = Column("cac_sac", Boolean, doc="Subactividad Limitada para Ciertos Empleados")
+    user_character1_r_729 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gobactl", String(8), doc="character1Tlmp")
+    user_character2_r_72 = Column("char2_al", String(100), doc="character2Usr")
+    characteristics_2d_temp_r_731 = Column("char2_gobactl", String(8), doc="character2Tlmp")
+    user_character3_r_399 = Column("char3_al", String(100), doc="character3Usr")
+    characteristics_3plm = Column("char3_gobactl", String(100), doc="character3Tlmp")
+    user_character4_r_190 = Column("char4_al", String(100), doc="character4Usr")
+    characteristics_4plm_r_442 = Column("char4_gobactl", String(100), doc="character4Tlmp")
+    user_character5_r_768 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6_r_15 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7_r_32 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8_r_924 = Column("char8_al", String(100), doc="character8Usr")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad de Obra")
+    cost_center = Column("cod_cco", Integer, doc="Centro de Coste")
+    subactivity = Column("cod_sac", Integer, doc="Código de Subactividad de Obra")
+    cost_subcenter = Column("cod_sco", Integer, doc="Subcentro de Coste")
+    decimal1user_r_959 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp_r_692 = Column("dec1_gobactl", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user_r_434 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_temp = Column("dec2_gobactl", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user_r_36 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp_r_875 = Column("dec3_gobactl", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user_r_58 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp_r_703 = Column("dec4_gobactl", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user_r_98 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_sac", String(30), doc="Descripción de la SubActividad")
+    editor_user1_r_4 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_to_user_r_26 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1_user_r_274 = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp_r_39 = Column("fec1_gobactl", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date_2nd_quarter_temp_r_75 = Column("fec2_gobactl", Date, doc="fecha2Tlmp")
+    date3_user_r_312 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_temp = Column("fec3_gobactl", Date, doc="fecha3Tlmp")
+
+
+class StructureCosts(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Repartos de Costes de Estructura (gocetipo)"""
+    __tablename__ = "gocetipo"
+
+    calculation_base = Column("bca_tce", String(2), doc="Base de Cálculo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gocetipo", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gocetipo", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gocetipo", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gocetipo", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    modification_user = Column("cod_musu", String(8), doc="Usuario que modifica el Registro")
+    distribution_type = Column("cod_otce", Integer, doc="Tipo de Reparto")
+    creation_user = Column("cod_usu", String(8), doc="Usuario que crea el Registro")
+    distribution_criteria = Column("cre_tce", String(2), doc="Criterio de Reparto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gocetipo", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gocetipo", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gocetipo", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_475 = Column("dec4_gocetipo", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_otce", String(60), doc="Descripción Tipo de Reparto")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gocetipo", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gocetipo", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gocetipo", Date, doc="fecha3Tlmp")
+    modification_date = Column("fec_mtce", Date, doc="Fecha Modificación Registro")
+    creation_date = Column("fec_tce", Date, doc="Fecha Creación Registro")
+
+
+class CostConcepts(ReadOnlyRow, LegacyBase):
+    """Maestro de los Diferentes Tipos de Conceptos de Coste (goconcos)"""
+    __tablename__ = "goconcos"
+
+    article_scope = Column("art_amb", Integer, doc="Ámbito de Artículo")
+    automatic_creation = Column("aut_ccs", Boolean, doc="Indica si el Concepto de Coste se crea en la primera línea")
+    calculation_base = Column("bcal_ccs", String(2), doc="Introduzca la Base de Cálculo")
+    calculation_base_filter_field = Column("camc_ccs", String(1), doc="Inrtoduzca el Campo a considerar para la Base de Cálculo")
+    distribution_scope_filter_field = Column("camr_ccs", String(1), doc="Introduzca Campo a considerar para el  Ámbito de Reparto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goconcos", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goconcos", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goconcos", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goconcos", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    item_planning = Column("cod_art", String(24), doc="Código de Artículo de Planificación")
+    cost_concept = Column("cod_ccs", Integer, doc="Concepto de Coste")
+    branch_id = Column("cod_del", Integer, doc="Delegación")
+    company_id = Column("cod_ent", Integer, doc="Empresa")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goconcos", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goconcos", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goconcos", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_794 = Column("dec4_goconcos", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    cost_concept_description = Column("des_ccs", String(40), doc="Descripción del Concepto de Coste")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goconcos", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goconcos", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goconcos", Date, doc="fecha3Tlmp")
+    filter_by = Column("filc_ccs", String(14), doc="Filtrar por")
+    filter_by_r_64 = Column("filr_ccs", String(14), doc="Filtrar por")
+    amount = Column("impc_ccs", Numeric(10, 2), doc="Importe")
+    installed = Column("ins_ccs", Boolean, doc="Instalado")
+    item_percentage = Column("par_ccs", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Artículos")
+    cost_concept_percentage = Column("pcc_ccs", Numeric(5, 2), doc="% Aplicable como Concepto a Líneas de Concepto de Coste")
+    labor_percentage = Column("pmo_ccs", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las líneas de Mano de Obra")
+    service_percentage = Column("pse_ccs", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Servicios")
+    items = Column("rar_ccs", Boolean, doc="Reparto Líneas de Artículos")
+    reference = Column("ref_art", String(24), doc="Referencia Artículo")
+    distribution_scope = Column("rep_ccs", String(2), doc="Ámbito de Reparto")
+    labor = Column("rmo_ccs", Boolean, doc="Reparto Líneas de Mano de Obra")
+    services = Column("rse_ccs", Boolean, doc="Reparto Líneas Servicios")
+    type = Column("tip_ccs", String(2), doc="Tipo Concepto de Coste")
+    transfer_to_project = Column("tobr_ccs", Boolean, doc="Indica si se Traspasa a Obra")
+
+
+class Gofalind(ReadOnlyRow, LegacyBase):
+    """Detalle de cada uno de los Resúmenes de la Factura de Obra. Se Utiliza para Incluir el Detalle de Partes Facturados y Certificaciones de Presupuestos (gofalind)"""
+    __tablename__ = "gofalind"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    purchase_order_purchase_agreement = Column("aoo_oprt", String(1), doc="Parte de Obra o de Administración")
+    scope = Column("art_amb", Integer, doc="Ámbito Artículo")
+    budget_quantity = Column("canp_fde", Numeric(8, 3), doc="Cantidad Presupuestada")
+    certification_quantity = Column("ccer_fde", Numeric(10, 3), doc="Cantidad de la Certificación")
+    concept_quantity = Column("cco_fde", Numeric(10, 3), doc="Cantidad Concepto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gofalind", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gofalind", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gofalind", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gofalind", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    identifier = Column("codh_fde", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    company1 = Column("cod_ab1", String(1), doc="Empresa1")
+    activity = Column("cod_acto", Integer, doc="Actividad")
+    item = Column("cod_art", String(24), doc="Código de Artículo")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    phase = Column("cod_fas", Integer, doc="Fase de la Obra")
+    group_code = Column("cod_fde", String(35), doc="Código Agrupación")
+    delivery_part = Column("cod_opec", Integer, doc="Parte de Entrega")
+    part_line_id = Column("cod_oprl", Integer, doc="Identificador Línea del Parte")
+    part = Column("cod_oprt", Integer, doc="Número de Parte")
+    task = Column("cod_otar", Integer, doc="Tarea de la Obra")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="Subactividad")
+    pre_invoiced_quantity = Column("cpre_fde", Numeric(10, 3), doc="Cantidad Prefacturada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gofalind", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gofalind", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gofalind", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_448 = Column("dec4_gofalind", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_fde", String(800), doc="Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gofalind", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gofalind", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gofalind", Date, doc="fecha3Tlmp")
+    certification_amount = Column("icer_fde", Numeric(9, 2), doc="Importe Certificación")
+    caregiver_id = Column("id_gofalind", Integer, doc="id_gofalind")
+    part_line_id_r_288 = Column("id_gopaend", Integer, doc="Identificador Línea de Parte")
+    id_gvallin = Column("id_gvallin", Integer, doc="id de líneas de albaranes y facturas")
+    measured_amount = Column("imed_fde", Numeric(9, 2), doc="Importe Medido")
+    budget_amount = Column("impo_fde", Numeric(9, 2), doc="Importe de Venta Presupuestado")
+    pre_invoiced_amount = Column("ipre_fde", Numeric(9, 2), doc="Importe Prefacturado")
+    line_number = Column("lin_fde", Integer, doc="Número de Línea")
+    certification_percentage = Column("pcer_fde", Numeric(5, 2), doc="Porcentaje Certificación")
+    percentage_concept = Column("pco_fde", Numeric(5, 2), doc="Porcentaje Concepto")
+    reference = Column("ref_art", String(24), doc="Referencia")
+    version = Column("ver_pre", Integer, doc="Código de Versión del Presupuesto")
+
+
+class ReasonRefusals(ReadOnlyRow, LegacyBase):
+    """Maestro de Motivos de Rechazo de Presupuestos (gomotrec)"""
+    __tablename__ = "gomotrec"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gomotrec", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gomotrec", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gomotrec", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gomotrec", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    rejection_reason = Column("cod_mor", Integer, doc="Código del Motivo de Rechazo de Presupuestos")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gomotrec", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gomotrec", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gomotrec", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_309 = Column("dec4_gomotrec", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_mor", String(60), doc="Descripción del Motivo de Rechazo")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gomotrec", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gomotrec", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gomotrec", Date, doc="fecha3Tlmp")
+
+
+class WorkHeads(LegacyBase):
+    """Cabecera del Documento de Obras (goobrac)"""
+    __tablename__ = "goobrac"
+
+    attachments = Column("adj_obr", Boolean, doc="Documentos adjuntos asociados")
+    administration = Column("adm_obr", Boolean, doc="Indica si la Obra es Sólo de Administración")
+    estimation_group = Column("agr_obr", String(3), doc="Agrupación de la Estimación")
+    total_advances = Column("ant_obr", Numeric(11, 2), doc="Total Importe Anticipos")
+    health_and_safety_author = Column("ass_obr", String(55), doc="Centro Autor del Estudio de Seguridad Salud")
+    request_activity_subactivity = Column("cac_obr", Boolean, doc="Indica si la Obra tendrá Control por Actividad/Subactividad")
+    contracted_applied_invoiced = Column("caf_obr", Numeric(14, 5), doc="Contratado Aplicado Facturado de la Obra")
+    request_chapter_in_parts = Column("cag_obr", Boolean, doc="Indica si la Obra Tiene Control por Agrupación")
+    contract_applied_purchase_order = Column("cap_obr", Numeric(14, 5), doc="Importe Contratado Aplicado P.O")
+    activity_control_subactivity_control = Column("cas_obr", Boolean, doc="Control de Actividad/Subactividad")
+    hired_confirmed = Column("cco_obr", Numeric(14, 5), doc="Contratado Confirmado de la Obra")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrac", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrac", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrac", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrac", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_cli", String(18), doc="CIF del Cliente")
+    tax_identification_number_r_485 = Column("cif_cli2", String(18), doc="CIF del Cliente Titular")
+    customer_scope = Column("cli_amb", Integer, doc="Ámbito de Cliente")
+    committed_cost = Column("coc_obr", Numeric(14, 5), doc="Coste Comprometido de la Obra")
+    warehouse = Column("cod_alm", Integer, doc="Código de Almacén de la Obra")
+    cost_center = Column("cod_cco", Integer, doc="C?digo del Centro de Coste")
+    shipping_address = Column("cod_cen", Integer, doc="Código de Dirección de Envío del Cliente")
+    customer = Column("cod_cli", Integer, doc="Código del Cliente Titular de la Obra")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    responsible_person = Column("cod_empl", Integer, doc="Código de Empleado Responsable de la Obra")
+    company = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    administration_payment_method = Column("cod_fpg", Integer, doc="Código de la Forma de Pago")
+    project = Column("cod_obr", Integer, doc="Código de Obra donde esta incluido el Presupuesto")
+    origin_work = Column("cod_obro", Integer, doc="Obra Origen de la copia")
+    country = Column("cod_pai", String(2), doc="Código de País de la Dirección del Cliente")
+    country_r_666 = Column("cod_pai2", String(2), doc="Código de País de la Dirección del Cliente Titular")
+    purchase_proposal = Column("cod_prc", Integer, doc="Propuesta para Compra")
+    subcontracting_proposal = Column("cod_prcs", Integer, doc="Propuesta para Subcontratación")
+    province = Column("cod_provi", Integer, doc="Código de Provincia de la Dirección del Cliente")
+    province_r_756 = Column("cod_provi2", Integer, doc="Código de Provincia de la Dirección del Cliente Titular")
+    sales_agent = Column("cod_rep", Integer, doc="Código del Agente Comercial")
+    cost_center_r_435 = Column("cod_sco", Integer, doc="C?digo del Subcentro de Coste")
+    customer_contact = Column("cod_telc", Integer, doc="Código del Contacto del Cliente Titular de la Obra")
+    project_type = Column("cod_tobr", Integer, doc="Tipo de Obra")
+    user = Column("cod_usu", String(8), doc="Código de Usuario que ha generado el Presupuesto")
+    address = Column("cod_via", String(2), doc="Tipo de Via de la dirección del cliente")
+    address_r_664 = Column("cod_via2", String(2), doc="Tipo de Via de la dirección del cliente Titular")
+    area = Column("cod_zona", String(1), doc="Código de Zona de la Obra")
+    allocated_cost = Column("coi_obr", Numeric(14, 5), doc="Importe Acumulado del Coste Incurrido")
+    neighborhood = Column("col_cli", String(60), doc="Colonia de la Direcci?n del Cliente")
+    neighborhood_r_648 = Column("col_cli2", String(60), doc="Colonia de la Direcci?n del Cliente Titular")
+    registered_neighborhood = Column("col_reg", String(60), doc="Colonia del Registro")
+    commission_percentage = Column("com_obr", Numeric(4, 2), doc="Porcentaje de Comisión")
+    request_work_order_in_parts = Column("cot_obr", Boolean, doc="Indica si la Obra tiene control de OT")
+    measured_cost = Column("coz_obr", Numeric(14, 5), doc="Importe Acumulado Valoración a Coste Realizada según Mediciones")
+    invoiced_administrative_parts_cost = Column("cpaf_obr", Numeric(14, 5), doc="Importe Acumulado de Costes de los P.A. Facturados")
+    pre_invoiced_administration_parts_cost = Column("cpap_obr", Numeric(14, 5), doc="Importe Acumulado de Coste de los P. Administración Prefacturad")
+    administration_parts_cost = Column("cpa_obr", Numeric(14, 5), doc="Importe Acumulado de Coste de los Partes de Administración")
+    invoiced_delivery_parts_cost = Column("cpef_obr", Numeric(14, 5), doc="Importe Acumulado de Costes de los P.E. Facturados")
+    pre_invoiced_delivery_parts_cost = Column("cpep_obr", Numeric(14, 5), doc="Importe Acumulado de Coste de los P. Entrega Prefacturad")
+    delivery_cost = Column("cpe_obr", Numeric(14, 5), doc="Coste Parte de Entrega")
+    request_quote_in_parts = Column("cpr_obr", Boolean, doc="Indica si la Obra Tiene Control por Presupuesto")
+    control_requested_by_item = Column("crpa_obr", Boolean, doc="Control Requisiciones por Partida")
+    assistance_center = Column("css_obr", String(55), doc="Centro Asistencial")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrac", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrac", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrac", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_606 = Column("dec4_goobrac", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("desc_obr", String(200), doc="Descripción Corta de la Obra")
+    detailed_description = Column("desd_obr", String(1200), doc="Descripción Extensa de la Obra")
+    address_r_326 = Column("dir_cli", String(55), doc="Dirección del Cliente")
+    address_r_736 = Column("dir_cli2", String(55), doc="Dirección del Cliente Titular")
+    postal_code = Column("dpo_cli", Integer, doc="Código Postal de la Dirección del Cliente")
+    postal_code_r_798 = Column("dpo_cli2", Integer, doc="Código Postal de la Dirección del Cliente Titular")
+    discount_percentage = Column("dpp_obr", Numeric(4, 2), doc="Descuento Pronto Pago")
+    differentiate_property_subcontracting_order = Column("dps_obr", Boolean, doc="Diferenciar Prop./Ped. Subcontratación")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_obr", String(3), doc="Estado de Edición")
+    work_progress = Column("epav_obr", String(2), doc="Tipo de estimación de avance de obra TO - TOTAL  PA - Parcial")
+    status = Column("est_obr", String(2), doc="Estado de la Obra")
+    award_date = Column("fadj_obr", Date, doc="Fecha de Adjudicación de la Obra")
+    closed_date = Column("fcer_obr", Date, doc="Fecha Estado Cerrada")
+    contract_date = Column("fcon_obr", Date, doc="Fecha de Contrato de la Obra")
+    in_progress_date = Column("fcur_obr", Date, doc="Fecha Estado en Curso")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrac", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrac", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrac", Date, doc="fecha3Tlmp")
+    date = Column("fec_obr", Date, doc="Fecha de Creación de la Obra")
+    completed_date = Column("ffin_obr", Date, doc="Fecha Estado Finalizada")
+    warranty_end_date = Column("fgaf_obr", Date, doc="Fecha Finalización  de Garantía")
+    warranty_start_date = Column("fgai_obr", Date, doc="Fecha Inicio de Garantía")
+    property = Column("finc_obr", String(18), doc="Finca Registro")
+    license_expiry_date = Column("flia_obr", Date, doc="Fecha de Licencia de la Obra")
+    bid_submission = Column("flic_obr", Date, doc="Fecha de Licitación de la Obra")
+    primary_occupation_date = Column("flpa_obr", Date, doc="Fecha de Licencia de Primera Ocupación")
+    folio = Column("fol_obr", String(18), doc="Folio Registro")
+    estimated_closure_date = Column("fpc_obr", Date, doc="Fecha Prevista de Cierre")
+    final_delivery_date = Column("fpf_obr", Date, doc="Fecha  Prevista de Finalización")
+    planned_start_date = Column("fpi_obr", Date, doc="Fecha Prevista de Inicio")
+    planned_date = Column("fpla_obr", Date, doc="Fecha Estado Planificada")
+    certified_articles_amount = Column("icera_obr", Numeric(11, 2), doc="Importe Certificado Total de la Obra (Artículos)")
+    certified_labor_cost_amount = Column("icerm_obr", Numeric(11, 2), doc="Importe Certificado Total de la Obra (Mano de Obra)")
+    certified_services_amount = Column("icers_obr", Numeric(11, 2), doc="Importe Certificado Total de la Obra (Servicios)")
+    certified_amount = Column("icer_obr", Numeric(11, 2), doc="Importe Certificado Total de la Obra")
+    contracted_import = Column("icon_obr", Numeric(11, 2), doc="Importe de la Obra Contratado")
+    increase_expenses = Column("icrc_obr", Numeric(5, 2), doc="Valor Inicial para Gastos")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    billed_amount_low_coefficient = Column("ifab_obr", Numeric(11, 2), doc="Importe Facturado Coeficiente Baja")
+    gross_invoice_amount = Column("ifac_obr", Numeric(11, 2), doc="Importe Facturado Bruto Total de la Obra")
+    administrative_part_invoice_amount_increase_decrease = Column("ifaia_obr", Numeric(11, 2), doc="Importe Facturado Incremento/Decremento Parte Administración")
+    billed_amount_increase_decrease = Column("ifaid_obr", Numeric(11, 2), doc="Importe Facturado Incremento/Decremento")
+    unexpected_expenses_invoiced_amount = Column("ifai_obr", Numeric(11, 2), doc="Importe Facturado de Imprevistos")
+    tax_id = Column("ifis_obr", String(18), doc="Identificación Fiscal")
+    estimated_amount = Column("impz_obr", Numeric(11, 2), doc="Importe Estimado")
+    induced_times = Column("ind_obr", Boolean, doc="Informar si se utilizan Tiempos Inducidos")
+    approx_total_tax = Column("ipar_obr", Numeric(11, 2), doc="Importe Total Aproximado de la Obra")
+    pre_certified_item_amount = Column("ipcea_obr", Numeric(11, 2), doc="Importe Precertificado de la Obra (Artículos)")
+    pre_certified_labor_cost = Column("ipcem_obr", Numeric(11, 2), doc="Importe Precertificado de la Obra (Mano de Obra)")
+    pre_certified_expenses_amount = Column("ipcep_obr", Numeric(11, 2), doc="Importe Precertificado de la Obra (Gasto)")
+    pre_certified_services_amount = Column("ipces_obr", Numeric(11, 2), doc="Importe Precertificado de la Obra (Servicios)")
+    pre_certified_amount_gross = Column("ipce_obr", Numeric(11, 2), doc="Importe Precertificado Bruto Total de la Obra.")
+    invoiced_delivery_parts_amount = Column("ipef_obr", Numeric(11, 2), doc="Importe de Venta Acumulado de los P. E. Facturados")
+    pre_invoiced_delivery_parts_amount = Column("ipep_obr", Numeric(11, 2), doc="Importe de Venta Acumulado de los P.E. Prefacturados")
+    amount_due = Column("ipe_obr", Numeric(11, 2), doc="Importe Partes de Entrega")
+    pre_invoiced_amount_low_coefficient = Column("iprb_obr", Numeric(11, 2), doc="Importe Prefacturado Coeficiente Baja")
+    pre_invoiced_unexpected_expenses_amount = Column("iprei_obr", Numeric(11, 2), doc="Importe Prefacturado de Imprevistos")
+    pre_invoiced_amount = Column("ipre_obr", Numeric(11, 2), doc="Importe Prefacturado Total de la Obra")
+    administrative_part_increase_decrease_amount = Column("ipria_obr", Numeric(11, 2), doc="Importe Prefacturado Incremento/Decremento Parte Administración")
+    pre_invoiced_amount_increase_decrease = Column("iprid_obr", Numeric(11, 2), doc="Importe Prefacturado Incremento/Decremento")
+    health_and_safety_budget = Column("iss_obr", Numeric(11, 2), doc="Presupuesto del Seguridad Salud")
+    billed_amount = Column("i_fac_obr", Numeric(11, 2), doc="Importe Facturado")
+    book = Column("lib_obr", String(18), doc="Libro Registro")
+    number_of_floors = Column("npis_obr", Integer, doc="Número Total de Pisos")
+    number = Column("num_cli", String(4), doc="Número de la via de la dirección del cliente")
+    number_r_50 = Column("num_cli2", String(4), doc="Número de la via de la dirección del cliente Titular")
+    cost_origin = Column("ocos_obr", String(1), doc="Origen Coste")
+    health_and_safety_coordinator = Column("oss_obr", String(55), doc="Coordinador Seguridad Salud")
+    planned_project = Column("pla_obr", Boolean, doc="Obra Planificada")
+    city = Column("pob_cli", String(30), doc="Población de la dirección del cliente")
+    city_r_534 = Column("pob_cli2", String(30), doc="Población de la dirección del cliente Titular")
+    item_location = Column("ppp_obr", Boolean, doc="Indica si se Utiliza la Ubicación de los Artículos en Partes")
+    registered_city = Column("preg_obr", String(55), doc="Población del Registro")
+    business_name = Column("raz_cli", String(100), doc="Razón Social del Cliente")
+    business_name_r_406 = Column("raz_cli2", String(100), doc="Razón Social del Cliente Titular")
+    cadastral_reference = Column("rcas_obr", String(18), doc="Referencia Catastral")
+    customer_reference = Column("refc_obr", String(20), doc="Referencia Cliente")
+    internal_reference = Column("refi_obr", String(20), doc="Referencia Interna")
+    retention_percentage = Column("ret_obr", Numeric(4, 2), doc="Porcentaje de Retención")
+    financial_receipt = Column("rfi_obr", Numeric(4, 2), doc="Recargo Financiero")
+    floor_occupancy_support = Column("socp_obr", Numeric(10, 2), doc="Superficie Ocupada en Planta (m2)")
+    solar_supplier = Column("ssol_obr", Numeric(10, 2), doc="Superficie del Solar (m2)")
+    total_construction_supplies = Column("stco_obr", Numeric(10, 2), doc="Superficie Total Construida (m2)")
+    total_construction_reasons_support = Column("stcr_obr", Numeric(10, 2), doc="Superficie Total Construida Sobre Rasante (m2)")
+    construction_stock_control = Column("stobr_obr", Boolean, doc="Indica si la Obra Tendrá Control de Stock en Obras")
+    accumulated_parts_cost = Column("tcap_obr", Numeric(14, 5), doc="Total Coste Acumulado de Partes Contabilizados")
+    administrative_structure_cost = Column("tcea_obr", Numeric(14, 5), doc="Total Coste Estructura Administración")
+    structure_cost_type = Column("tce_obr", Numeric(14, 5), doc="Total Coste Estructura")
+    conditions = Column("tcon_obr", String(1200), doc="Texto de Condiciones")
+    total_cost = Column("tco_obr", Numeric(14, 5), doc="Total Coste")
+    phone_number = Column("tel_obr", String(18), doc="Teléfono del Cliente")
+    billing_type = Column("tfa_obr", String(2), doc="Tipo de Facturación")
+    total_imported_hours = Column("tih_obr", Numeric(11, 3), doc="Total Horas Imputadas")
+    induced_mo_manufacturing_order = Column("tind_obr", Boolean, doc="Informar si se utilizarán MO inducidad en las Partidas")
+    discount_type = Column("tip_cli", Integer, doc="Tipo de Descuento a aplicar al cliente")
+    typology = Column("tlog_obr", String(18), doc="Tipología del Edificio")
+    project_type_r_218 = Column("tobr_obr", String(1), doc="Tipo de Obra para Revisión")
+    total_estimated_cost = Column("toc_obr", Numeric(14, 5), doc="Total Coste Presupuestado")
+    volume = Column("tomo_obr", String(18), doc="Tomo Registro")
+    coordinator_degree = Column("toss_obr", String(55), doc="Titulación del Coordinador Seguridad Salud")
+    total_projected_sales = Column("tov_obr", Numeric(11, 2), doc="Total Venta Presupuestado")
+    article_cost_type_plan = Column("tpca_obr", Numeric(14, 5), doc="Total Coste Planificado de Artículos")
+    subcontracting_cost_type_plan = Column("tpcb_obr", Numeric(14, 5), doc="Total Coste Planificado de Subcontratado")
+    labor_cost_plan = Column("tpcm_obr", Numeric(14, 5), doc="Total Coste Planificado de Mano de Obra")
+    gas_cost_type_plan = Column("tpcp_obr", Numeric(14, 5), doc="Total Coste Planificado de Gastos")
+    service_plan_cost_type = Column("tpcs_obr", Numeric(14, 5), doc="Total Coste Planificado de Servicios")
+    cost_budget = Column("tpc_obr", Numeric(14, 5), doc="Total Coste Planificado")
+    total_planned_hours = Column("tph_obr", Numeric(9, 3), doc="Total Horas Planificadas")
+    retention_type = Column("tre_obr", String(1), doc="Tipo Retención Aplicable en la Obra")
+    health_and_safety_certification = Column("tss_obr", String(55), doc="Titulación del Autor del Estudio de Seguridad Salud")
+    location = Column("ubi_art", String(13), doc="Código de Ubicación de la Obra")
+    sales_parts_administration_invoiced = Column("vpaf_obr", Numeric(11, 2), doc="Importe de Venta Acumulado de los P. A. Facturados")
+    administration_parts_sales_pre_invoiced = Column("vpap_obr", Numeric(11, 2), doc="Importe de Venta Acumulado de los P.A. Prefacturados")
+    sales_parts_administration = Column("vpa_obr", Numeric(11, 2), doc="Importe de Vta. Acumulado de los Partes de Administración")
+
+
+class WorkLines(ReadOnlyRow, LegacyBase):
+    """Líneas de Detalle de la Estructura de Capítulos y Partidas del Documento (goobrad)"""
+    __tablename__ = "goobrad"
+
+    accumulate_cost = Column("acuc_obd", Boolean, doc="Acumular Coste de la Línea")
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    article_scope = Column("art_amb", Integer, doc="Ámbito del Artículo")
+    calculation_base = Column("bcal_obd", String(2), doc="Introduzca la Base de Cálculo")
+    request_quote_before_purchase_project = Column("cac_obd", Boolean, doc="¿Solicitar Cotización antes de Comprar (Obra)?")
+    formula_quantity = Column("caf_obd", Numeric(9, 3), doc="Cantidad de Unidad de Medida de la Fórmula")
+    allocated_quantity = Column("cai_obd", Numeric(10, 3), doc="Cantidad  Incurrida en la Línea")
+    calculation_base_field = Column("camc_obd", String(1), doc="Identifica campo a considerar para la base del concepto coste")
+    purchase_quantity = Column("canc_obd", Numeric(9, 3), doc="Cantidad de Compra de la Línea de Detalle")
+    quantity = Column("can_obd", Numeric(12, 6), doc="Cantidad de la Línea del Detalle")
+    certified_quantity = Column("car_obd", Numeric(10, 3), doc="Cantidad Certificada")
+    encoded = Column("cdf_obd", Boolean, doc="Indica si la línea está Correctamente Codificada")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrad", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrad", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrad", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrad", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    induced_cost = Column("cind_obd", Numeric(11, 2), doc="Coste Inducido de la Mano de Obra")
+    line_item_classification = Column("cll_obd", String(2), doc="Clasificador Particular de Líneas")
+    requisition_list_quantity = Column("clr_obd", Numeric(12, 3), doc="Introduzca la Cantidad de la Lista de Requisiciones")
+    decomposed_identifier = Column("codhd_obd", Integer, doc="Identificador único del Registro Partida del Descompuesto")
+    composite_identifier = Column("codh_obc", Integer, doc="Identificador Compuesto")
+    identifier = Column("codh_obe", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    chapter_id = Column("codh_pes", Integer, doc="Identificador del Capítulo del Presupuesto")
+    item = Column("cod_art", String(24), doc="Código de Artículo de la Línea del Detalle de la Partida")
+    cost_concept = Column("cod_ccs", Integer, doc="Concepto de Coste")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    hour_type = Column("cod_hora", Integer, doc="Tipo de Hora de la Mano de Obra")
+    committed_cost = Column("cod_obd", Numeric(14, 5), doc="Importe de la Valoración Pedido Vinculados Pdtes. Recibir")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    source_library = Column("cod_olb", Integer, doc="Código del Origen de Librería")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    supplier = Column("cod_pro", Integer, doc="Código del Proveedor de la Condición de Compra")
+    currency = Column("cod_sas", String(3), doc="Código de Divisa de la Condición de Compra")
+    sales_packaging = Column("cod_uea", String(2), doc="Código de la Unidad de Embalaje de Venta")
+    purchase_packaging = Column("cod_ueac", String(2), doc="Código de la Unidad de Embalaje de Compra")
+    unit_of_measurement = Column("cod_um", String(2), doc="Código de la Unidad de Medida de la Fórmula")
+    allocated_cost = Column("coi_obd", Numeric(14, 5), doc="Coste Incurrido en la línea")
+    cost = Column("cos_obd", Numeric(14, 5), doc="Coste de la Línea del Detalle de la Partida")
+    purchase_property_quantity = Column("cpc_obd", Numeric(12, 3), doc="Cantidad en propuestas de compra")
+    quantity_u_e_c = Column("cueac_obd", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Compra")
+    extended_description = Column("dea_obd", String(800), doc="Descripción Ampliada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrad", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrad", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrad", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_654 = Column("dec4_goobrad", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_obd", String(800), doc="Descripción de la Línea del Detalle de la Partida")
+    discount_c1 = Column("dtc1_obd", Numeric(4, 2), doc="Descuento 1 de la Condición de Compra")
+    discount_c2 = Column("dtc2_obd", Numeric(4, 2), doc="Descuento 2 de la Condición de Compra")
+    c3_discount = Column("dtc3_obd", Numeric(4, 2), doc="Descuento 3 de la Condición de Compra")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    fiedbc_factor = Column("fac_obd", Numeric(5, 2), doc="Factor FIEDBC")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrad", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrad", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrad", Date, doc="fecha3Tlmp")
+    filter_by = Column("filc_obd", String(24), doc="Filtrar por")
+    tool = Column("her_obd", Boolean, doc="Herramienta")
+    automatic_allocation = Column("iau_obd", Boolean, doc="Imputación automática")
+    certified_amount = Column("icer_obd", Numeric(11, 2), doc="Importe Certificado")
+    copy_or_import = Column("ioc_obd", Boolean, doc="Copia o Importación")
+    pre_certified_amount = Column("Ipce_obd", Numeric(11, 2), doc="Importe Precertificado")
+    subcontracted_line = Column("lins_obd", Integer, doc="Número de la Línea del Detalle dentro de la Partida que está su")
+    line = Column("lin_obd", Integer, doc="Número de la Línea del Detalle dentro de la Partida")
+    budget_line = Column("lin_ped", Integer, doc="Número de Línea del Presupuesto")
+    line_to_replace = Column("lis_obd", Integer, doc="Línea a la que Sustituye Total o Parcialmente")
+    reason_for_non_allocation = Column("mnim_obd", String(3), doc="Motivo de la No Imputacion")
+    non_chargeable_line = Column("nim_obd", Boolean, doc="Linea No Imputable")
+    name = Column("nom_mar", String(40), doc="Nombre de la Marca")
+    unplanned = Column("npl_obd", Boolean, doc="Línea No Planificada")
+    cost_origin = Column("ocos_obd", String(1), doc="Origen del Coste")
+    order = Column("ord_obc", Integer, doc="Orden de la L?nea del Detalle dentro del Compuesto")
+    order_r_23 = Column("ord_obd", Integer, doc="Orden de la Línea del Detalle dentro de la Partida")
+    item_percentage = Column("par_obd", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Artículo")
+    cost_percentage_concept = Column("pcc_obd", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Cpto.Coste")
+    labor_percentage = Column("pmo_obd", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Mano de Obra")
+    purchase_price = Column("prec_obd", Numeric(12, 3), doc="Precio de Compra por Unidad de Embalaje de Compra")
+    supplier_scope = Column("pro_amb", Integer, doc="Ámbito del Proveedor")
+    service_percentage = Column("pse_obd", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Servicios")
+    recalculable = Column("rec_obd", Boolean, doc="Indica si la Línea será Recalculable")
+    external_reference = Column("refe_obd", String(20), doc="Refrencia Externa de la Librería")
+    manufacturer_reference = Column("ref_art", String(24), doc="Referencia Fabricante del Artículo")
+    unreceived_order_stocks = Column("sppc_obd", Numeric(11, 2), doc="Stocks Pedidos no recepcionados")
+    subcontractor = Column("sub_obd", Boolean, doc="Indica si la Línea está Subcontratada")
+    substitute = Column("sus_obd", Boolean, doc="Informa si la Línea es Sutituta de Otra")
+    total_line_quantity = Column("tcan_obd", Numeric(15, 6), doc="Cantidad Total por Línea")
+    budgeted_quantity = Column("tcan_ped", Numeric(15, 6), doc="Cantidad Total Presupuestada")
+    budgeted_cost = Column("tcos_ped", Numeric(15, 5), doc="Coste Total Presupuestado")
+    budgeted_amount = Column("timp_ped", Numeric(12, 2), doc="Total Importe Presupuestado")
+    induced_mo_manufacturing_order = Column("tind_obd", Boolean, doc="Si Linea de M.O es generada autom. para los T.Inducidos de Arti")
+    installation_time = Column("tins_obd", Numeric(9, 3), doc="Tiempo de Instalación")
+    category = Column("tipo_op", Integer, doc="Categoría de la Mano de Obra")
+    item_type_cost_concept = Column("tip_obd", String(2), doc="Tipo Artículo Concepto de Coste")
+    line_type = Column("tli_obd", String(1), doc="Tipo de Línea del Detalle de la Partida")
+    subcontracting_type = Column("tsub_obd", String(3), doc="Tipo Subcontratación")
+    version = Column("ver_pre", Integer, doc="Código de Versión del Presupuesto")
+
+
+class WorkStructures(LegacyBase):
+    """Estructura de Capítulos y Partidas del Documento de  Obra (goobrae)"""
+    __tablename__ = "goobrae"
+
+    attachments = Column("adj_obe", Boolean, doc="Documentos adjuntos asociados")
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    item_scope = Column("art_amb", Integer, doc="Ámbito de Artículos")
+    budget_quantity = Column("canp_obe", Numeric(8, 3), doc="Cantidad Capitulo en el Presupuesto")
+    quantity = Column("can_obe", Numeric(9, 3), doc="Cantidad de Capítulo")
+    total_quantity = Column("cat_obe", Numeric(10, 3), doc="Cantidad Total del Capítulo")
+    estimated_quantity = Column("caz_obe", Numeric(10, 3), doc="Cantidad Estimada")
+    delivered_quantity = Column("cepe_obe", Numeric(9, 3), doc="Cantidad Entregada por Partes de Entrega")
+    certified_expenses_amount = Column("cerp_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Gastos")
+    certify = Column("cert_obe", Boolean, doc="Capítulo a certificar")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrae", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrae", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrae", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrae", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    work_chapter = Column("cla_obe", String(35), doc="Clave del Capítulo y Orden")
+    item_classification_item_lines = Column("cll_obe", String(2), doc="Clasificador Particular de Líneas")
+    identifier = Column("codh_obe", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    chapter_id = Column("codh_pes", Integer, doc="Identificador del Capítulo del Presupuesto")
+    parent_id = Column("codp_obe", Integer, doc="Id. del Cap. Padre dentro de la estructura recursiva de la Obra")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad")
+    subcontracted_service = Column("cod_art", String(24), doc="Servicio de Subcontratacion relacionado con la partida")
+    notification = Column("cod_avis", Integer, doc="Código de Aviso")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    quality_document = Column("cod_docm", String(10), doc="Código de Documento de Calidad")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    bookstore = Column("cod_lib", String(24), doc="Código de Librería/Unidad de Obra")
+    material_list = Column("cod_lic", Integer, doc="Código de Lista de Material")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    work_order = Column("cod_oot", Integer, doc="Introduzca la Orden de Trabajo")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="Código de SubActividad")
+    item_code = Column("Cod_tpa", String(2), doc="Código de Tipo de Partida")
+    unit_of_measure = Column("cod_um", String(2), doc="Código de Unidad de Medida")
+    allocated_article_cost = Column("coia_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de Artículos")
+    subcontracted_cost_incurred = Column("coib_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de Subcon")
+    labor_cost_incurred = Column("coim_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de MO")
+    allocated_expense_cost = Column("coip_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de Gastos")
+    machine_cost_allocation = Column("coiq_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de Maquinaria")
+    service_cost_imputed = Column("cois_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido de Servicios")
+    allocated_cost = Column("coi_obe", Numeric(14, 5), doc="Importe Acumulado de Coste Incurrido")
+    contains_compound = Column("com_obe", Boolean, doc="Indica si la partida contiene un Compuesto")
+    presentation_cost = Column("coso_obe", Numeric(14, 5), doc="Coste Presupuestado")
+    actual_cost = Column("coz_obe", Numeric(14, 5), doc="Importe Acumulado de la Valoración de las Mediciones")
+    invoiced_delivery_parts_cost = Column("cpef_obe", Numeric(14, 5), doc="Coste de los Partes de Entrega Facturados")
+    pre_invoiced_delivery_parts_cost = Column("cpep_obe", Numeric(14, 5), doc="Coste Partes de Entrega Prefacturados")
+    equivalent_cost = Column("cpe_obe", Numeric(14, 5), doc="Coste Partes de Entrega")
+    extended_description = Column("dea_obe", String(800), doc="Descripción Ampliada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrae", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_material_price = Column("dec2_goobrae", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goobrae", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goobrae", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    breakdown = Column("desc_obe", Boolean, doc="Indica si la agrupación es un descompuesto")
+    description = Column("des_obe", String(200), doc="Descripción del Capítulo")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    exportable_fiebdc = Column("Exf_obe", Boolean, doc="Informa si la Partida seá exportable a Formato FIEBDC")
+    fiedbc_factor = Column("fac_obe", Numeric(5, 2), doc="Factor FIEDBC")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrae", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrae", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goobrae", Date, doc="fecha3Tlmp")
+    end_date = Column("fef_obe", Date, doc="Fecha de Finalización del Capítulo/Partida")
+    start_date = Column("fei_obe", Date, doc="Fecha de Inicio del Capítulo/Partida")
+    last_input_date = Column("feu_obe", Date, doc="Fecha Última Aplicación")
+    completed = Column("fin_obe", Boolean, doc="Finalizada")
+    certified_article_amount = Column("icera_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Artículos")
+    certified_subcontract_amount = Column("icerb_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Subcon.")
+    certified_labor_cost = Column("icerm_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de MO")
+    certified_expenses_amount_r_788 = Column("icerp_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Gastos")
+    certified_machine_amount = Column("icerq_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Maquinaria")
+    certified_service_amount = Column("icers_obe", Numeric(11, 2), doc="Importe Certificado Acumulado de Servicios")
+    certified_amount = Column("icer_obe", Numeric(11, 2), doc="Importe Certificado Acumulado")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    gross_invoice_amount = Column("ifac_obe", Numeric(11, 2), doc="Importe Facturado Bruto Acumulado")
+    maximum_amount = Column("impm_obe", Numeric(11, 2), doc="Importe Máximo Orientativo")
+    budget_amount = Column("impo_obe", Numeric(11, 2), doc="Importe de Venta Presupuestado")
+    estimated_amount = Column("impz_obe", Numeric(11, 2), doc="Importe Estimado")
+    induced_time = Column("ind_obe", Boolean, doc="Indica si se aplica Tiempo Inducido sobre las Partidas")
+    pre_certified_item_amount = Column("ipcea_obe", Numeric(11, 2), doc="Importe Precertificado de la Obra (Artículos)")
+    pre_certified_labor_cost = Column("ipcem_obe", Numeric(11, 2), doc="Importe Precertificado de la Obra (Mano de Obra)")
+    pre_certified_expenses_amount = Column("Ipcep_obe", Numeric(11, 2), doc="Importe Precertificado de la Obra (Gastos)")
+    pre_certified_services_amount = Column("ipces_obe", Numeric(11, 2), doc="Importe Precertificado de la Obra (Servicios)")
+    pre_certified_amount_gross = Column("ipce_obe", Numeric(11, 2), doc="Importe Precertificado Bruto Total")
+    invoiced_delivery_parts_amount = Column("ipef_obe", Numeric(11, 2), doc="Importe de los Partes de Entrega Facturados")
+    pre_invoiced_delivery_parts_amount = Column("ipep_obe", Numeric(11, 2), doc="Importe Partes de Entrega Prefacturados")
+    amount_due = Column("ipe_obe", Numeric(11, 2), doc="Importe Partes de Entrega")
+    pre_invoiced_amount = Column("ipre_obe", Numeric(11, 2), doc="Importe PreFacturado Acumulado")
+    target_margin = Column("maro_obe", Numeric(5, 2), doc="Margen Objetivo")
+    non_billable = Column("nim_obe", Boolean, doc="No Imputable")
+    level = Column("niv_obe", Integer, doc="Nivel del Capítulo")
+    unplanned = Column("npl_obe", Boolean, doc="Partida No Planificada")
+    cost_structure_origin = Column("oce_obe", String(2), doc="Origen del Coste de Estructura")
+    cost_origin = Column("ocos_obe", String(1), doc="Origen del Coste. Valor Inicializador")
+    item_number = Column("par_obe", Boolean, doc="Identifica si el Capítulo es una Partida con Detalle")
+    term = Column("pla_obe", Numeric(7, 2), doc="Plazo en Días")
+    yield_percentage = Column("rdto_obe", Numeric(5, 2), doc="% Rendimiento de la Agrupación")
+    recalculable = Column("rec_obe", Boolean, doc="Indica si la línea será recalculable. Valor Inicializador.")
+    external_reference = Column("refe_obe", String(20), doc="Referencia Externa del Capítulo")
+    internal_reference = Column("refi_obe", String(20), doc="Referencia Interna del Capítulo")
+    sub_obe = Column("sub_obe", Boolean, doc="Partida Subcontratada")
+    structure_cost_type = Column("Tce_obe", Numeric(14, 5), doc="T. Coste Estructura")
+    total_cost = Column("Tco_obe", Numeric(14, 5), doc="Total Coste")
+    total_imported_hours = Column("tih_obe", Numeric(9, 3), doc="Total Horas Imputadas")
+    induced_mo_manufacturing_overhead = Column("tind_obe", Boolean, doc="Informar si se utilizarán MO Inducida en la Partida")
+    presentation_cost_r_361 = Column("toc_obe", Numeric(14, 5), doc="Total Coste Presupuestado")
+    sales_quotation = Column("tov_obe", Numeric(11, 2), doc="Total Venta Presupuestado")
+    item_cost = Column("tpca_obe", Numeric(14, 5), doc="Total Coste Planificado de Artículos")
+    subcontracted_cost = Column("tpcb_obe", Numeric(14, 5), doc="Total Coste Planificado de Subcontratado")
+    labor_cost = Column("tpcm_obe", Numeric(14, 5), doc="Total Coste Planificado de Mano de Obra")
+    expense_cost = Column("tpcp_obe", Numeric(14, 5), doc="Total Coste Planificado de Gastos")
+    machine_cost_plan = Column("tpcq_obe", Numeric(14, 5), doc="Total Coste Planificado de Maquinaria")
+    service_cost = Column("tpcs_obe", Numeric(14, 5), doc="Total Coste Planificado de Servicios")
+    plan_cost = Column("tpc_obe", Numeric(14, 5), doc="Total Coste Planificado")
+    planned_hours = Column("tph_obe", Numeric(9, 3), doc="Total Horas Planificadas")
+    version = Column("ver_pre", Integer, doc="Código de Versión del Presupuesto")
+
+
+class CertificationLines(ReadOnlyRow, LegacyBase):
+    """Detalle de Líneas del Presupuesto Incluida en las Certificaciones de Pre (goobrced)"""
+    __tablename__ = "goobrced"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo del Presupuesto")
+    article_scope = Column("art_amb", Integer, doc="Ámbito del Artículo")
+    accumulated_certification_quantity = Column("ccacu_ced", Numeric(10, 3), doc="Cantidad Certificaciones Anteriores Acumulado")
+    certified_quantity = Column("ccer_ced", Numeric(10, 3), doc="Cantidad Certificada")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrced", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrced", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrced", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrced", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    identifier = Column("codh_cee", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    chapter_id = Column("codh_pes", Integer, doc="Identificador del Capítulo del Presupuesto")
+    item = Column("cod_art", String(24), doc="Artículo Servicio Certificación")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    certification = Column("cod_ocer", Integer, doc="Número de Certificación")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrced", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrced", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrced", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_252 = Column("dec4_goobrced", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrced", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrced", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrced", Date, doc="fecha3Tlmp")
+    accumulated_certification_amount = Column("icacu_ced", Numeric(9, 2), doc="Importe certificaciones Anteriores Acumulado")
+    redistributed_certified_amount = Column("icerr_ced", Numeric(9, 2), doc="Importe Certificado Redistribuido")
+    certified_amount = Column("icer_ced", Numeric(9, 2), doc="Importe Certificado")
+    line = Column("lin_ced", Integer, doc="Número de la Línea del Detalle dentro de la Partida")
+    budget_line = Column("lin_ped", Integer, doc="Número de Línea Presupuesto")
+    version = Column("ver_pre", Integer, doc="Versión del Presupuesto")
+
+
+class CertificationStructures(ReadOnlyRow, LegacyBase):
+    """Detalle de Estrucutura del Presupuesto Incluida en las Certificaciones d (goobrcee)"""
+    __tablename__ = "goobrcee"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo del Presupuesto")
+    accumulated_certification_quantity = Column("ccacu_cee", Numeric(10, 3), doc="Cantidad Certificaciones Anteriores Acumulado")
+    certified_quantity = Column("ccer_cee", Numeric(10, 3), doc="Cantidad Certificada")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrcee", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrcee", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrcee", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrcee", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    chapter = Column("cla_pes", String(27), doc="Clave del Capítulo del Presupuesto y Orden")
+    identifier = Column("codh_cee", Integer, doc="Identificador único del Capítulo dentro de la Obra")
+    chapter_id = Column("codh_pes", Integer, doc="Identificador del Capítulo del Presupuesto")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    certification = Column("cod_ocer", Integer, doc="Número de Certificación")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrcee", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrcee", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrcee", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_920 = Column("dec4_goobrcee", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrcee", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrcee", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrcee", Date, doc="fecha3Tlmp")
+    accumulated_certification_amount = Column("icacu_cee", Numeric(9, 2), doc="Importe Certificaciones Anteriores Acumulado")
+    certified_articles_amount = Column("icera_cee", Numeric(9, 2), doc="Importe Certificado Artículos")
+    certified_labor_cost_amount = Column("icerm_cee", Numeric(9, 2), doc="Importe Certificado Mano de Obra")
+    certified_redistributed_amount = Column("icerr_cee", Numeric(9, 2), doc="Importe Certificado Redistribuido")
+    certified_services_amount = Column("icers_cee", Numeric(9, 2), doc="Importe Certificado Servicios")
+    certified_amount = Column("icer_cee", Numeric(9, 2), doc="Importe Certificado Acumulado")
+    level = Column("niv_pes", Integer, doc="Nivel del Capítulo")
+    version = Column("ver_pre", Integer, doc="Versión del Presupuesto")
+
+
+class CertificationHeads(LegacyBase):
+    """Cabecera del Documento de Certificaciones de Presupuestos de Obra (goobrcer)"""
+    __tablename__ = "goobrcer"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    advance_payment = Column("ant_ocer", Boolean, doc="Certificaci?n de Anticipo")
+    a_or_b = Column("aob_ocer", String(1), doc="Empresa de Trabajo o Training")
+    low_coefficient_tax = Column("baj_ocer", Numeric(11, 2), doc="Importe Coeficiente a la Baja")
+    certification_criteria = Column("cce_ocer", String(2), doc="Criterio de la agrupación")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrcer", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrcer", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrcer", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrcer", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    customer_scope = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    final_activity = Column("cod_actof", Integer, doc="Actividad Final")
+    initial_activity = Column("cod_actoi", Integer, doc="Actividad Inicial")
+    customer = Column("cod_cli", Integer, doc="Código de Cliente")
+    billing_branch = Column("cod_def", Integer, doc="Delegación Facturación")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    final_phase = Column("cod_fasf", Integer, doc="Fase Final")
+    initial_phase = Column("cod_fasi", Integer, doc="Fases Inicial")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    certification = Column("cod_ocer", Integer, doc="Número de Certificación")
+    final_task = Column("cod_otarf", Integer, doc="Tarea Final")
+    initial_task = Column("cod_otari", Integer, doc="Tarea Inicial")
+    pre_invoice = Column("cod_pfa", Integer, doc="PreFactura")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    final_subactivity = Column("cod_sacf", Integer, doc="Subactividad Final")
+    initial_subactivity = Column("cod_saci", Integer, doc="Subactividad Inicial")
+    user = Column("cod_usu", String(8), doc="Código de Usuario que ha generado la Certificación")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrcer", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrcer", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrcer", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_222 = Column("dec4_goobrcer", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    detail = Column("det_ocer", String(2), doc="Detalle Certificación")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    status = Column("est_ocer", String(2), doc="Estado")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrcer", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrcer", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goobrcer", Date, doc="fecha3Tlmp")
+    certification_date = Column("fec_ocer", Date, doc="Fecha Certificación")
+    advance_amount = Column("ian_ocer", Numeric(12, 2), doc="Importe del Anticipo")
+    certified_articles_amount = Column("icera_ocer", Numeric(11, 2), doc="Importe Certificado Artículos")
+    labor_certification_amount = Column("icerm_ocer", Numeric(11, 2), doc="Importe Certificado Mano de Obra")
+    service_certification_amount = Column("icers_ocer", Numeric(11, 2), doc="Importe Certificado Servicios")
+    certification_amount = Column("icer_ocer", Numeric(11, 2), doc="Importe Certificado")
+    amortized_amount = Column("ico_ocer", Numeric(12, 2), doc="Importe Amortizado Anticipo")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    increase_decrease = Column("inc_ocer", Numeric(11, 2), doc="Incrementos/Decrementos")
+    weee_amount = Column("Iraee_cer", Numeric(11, 2), doc="Importe RAEE")
+    invoice_number = Column("num_fac", Integer, doc="Introduzca el Número de Factura de Venta")
+    notes = Column("obs_cer", String(1200), doc="Observaciones de la Certificación")
+    order = Column("ord_ocer", Integer, doc="Orden de creación")
+    redistributed = Column("red_ocer", Boolean, doc="Certificación Redistribuida")
+    version = Column("ver_pre", Integer, doc="Código de versión del presupuesto")
+
+
+class WorkStatus(ReadOnlyRow, LegacyBase):
+    """Trazabilidad de Cambios de Estado Realizados en la Obra (goobremo)"""
+    __tablename__ = "goobremo"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobremo", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobremo", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobremo", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobremo", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    project = Column("cod_obr", Integer, doc="Código de la Obra")
+    user = Column("cod_usu", String(8), doc="Usuario")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobremo", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobremo", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobremo", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_901 = Column("dec4_goobremo", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    status = Column("est_obr", String(2), doc="Situación de la Obra")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobremo", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobremo", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobremo", Date, doc="fecha3Tlmp")
+    date = Column("fec_emo", Date, doc="Fecha creación del registro")
+    end_date = Column("fef_emo", Date, doc="Fecha Fin del estado")
+    product_warranty = Column("gar_emo", Boolean, doc="Garantía en Artículos")
+    warranty_expenses = Column("gga_emo", Boolean, doc="Garantía en Gastos")
+    labor_warranty = Column("gmo_emo", Boolean, doc="Garantía en Mano de Obra")
+    service_warranty = Column("gse_emo", Boolean, doc="Garantía en Servicios")
+    order = Column("ord_emo", Integer, doc="Orden de Creación")
+
+
+class WorkTaxes(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos de cada Obra (goobrimp)"""
+    __tablename__ = "goobrimp"
+
+    base_amount_r_878 = Column("bas_imd", Numeric(11, 2), doc="Base sobre la que se aplica el Impuesto")
+    user_character1_r_648 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp_r_914 = Column("char1_goobrimp", String(100), doc="character1Tlmp")
+    user_character2_r_792 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp_r_214 = Column("char2_goobrimp", String(100), doc="character2Tlmp")
+    user_character3_r_107 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp_r_879 = Column("char3_goobrimp", String(100), doc="character3Tlmp")
+    user_character4_r_277 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp_r_354 = Column("char4_goobrimp", String(100), doc="character4Tlmp")
+    user_character5_r_181 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6_r_461 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7_r_719 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8_r_437 = Column("char8_al", String(100), doc="character8Usr")
+    branch_r_336 = Column("cod_del", Integer, doc="Código de Delegación")
+    company_r_771 = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    tax_code_r_43 = Column("cod_imd", Integer, doc="Código de Tipo de Impuesto")
+    tax_type_r_510 = Column("cod_imp", Integer, doc="Tipo Impuesto")
+    project_r_247 = Column("cod_obr", Integer, doc="Código de Obra")
+    user_decimal1_r_247 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1_r_62 = Column("dec1_goobrimp", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user_r_93 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price_r_299 = Column("dec2_goobrimp", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3_r_292 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3_r_316 = Column("dec3_goobrimp", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4_r_932 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_845 = Column("dec4_goobrimp", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5_r_847 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6_r_567 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user_r_915 = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2_r_209 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user_r_209 = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp_r_900 = Column("fec1_goobrimp", Date, doc="fecha1Tlmp")
+    user_date2_r_153 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp_r_184 = Column("fec2_goobrimp", Date, doc="fecha2Tlmp")
+    user_date3_r_819 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp_r_571 = Column("fec3_goobrimp", Date, doc="fecha3Tlmp")
+    amount_r_138 = Column("imp_imd", Numeric(11, 2), doc="Importe del Impuesto")
+    percentage_r_689 = Column("por_imd", Numeric(4, 2), doc="Porcentaje Aplicable")
+
+
+class Preinvoices(LegacyBase):
+    """Cabecera del Documento de Prefacturas de Obras (goobrpca)"""
+    __tablename__ = "goobrpca"
+
+    attachments = Column("adj_pfa", Boolean, doc="Documentos adjuntos asociados")
+    block = Column("blq_pfa", Boolean, doc="Bloqueo")
+    gross_amount = Column("bru_pfa", Numeric(11, 2), doc="Importe Bruto")
+    frequency = Column("cad_fpg", Integer, doc="Cadencia")
+    quantity = Column("can_sas", Integer, doc="Cantidad de la Divisa")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrpca", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrpca", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrpca", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrpca", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_cli", String(18), doc="CIF del Cliente")
+    customer_scope = Column("cli_amb", Integer, doc="Ambito de Cliente")
+    address = Column("coa_pfa", String(1), doc="Cargo o Abono")
+    customer = Column("cod_cli", Integer, doc="Código de Cliente")
+    invoice_delivery = Column("cod_def", Integer, doc="Delegación de la factura")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    payment_method = Column("cod_fpg", Integer, doc="Forma de Pago")
+    estimate = Column("cod_med", Integer, doc="Estimación")
+    rejection_reason = Column("cod_mor", Integer, doc="Motivo de Rechazo")
+    country = Column("cod_pai", String(2), doc="Código de País")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    province = Column("cod_provi", Integer, doc="Código de Provincia")
+    sales_agent = Column("cod_rep", Integer, doc="Agente Comercial")
+    withholding_tax = Column("cod_ret", Integer, doc="Código de Retención")
+    currency = Column("cod_sas", String(3), doc="Divisa")
+    contact = Column("cod_telc", Integer, doc="Contacto del Cliente")
+    carrier = Column("cod_tra", Integer, doc="Código de Transportista")
+    user = Column("cod_usu", String(8), doc="Usuario")
+    address_line = Column("cod_via", String(2), doc="Tipo de Vía")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia del Cliente")
+    commission_percentage = Column("com_pfa", Numeric(4, 2), doc="Porcentaje de Comisión")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrpca", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrpca", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrpca", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_651 = Column("dec4_goobrpca", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    travel_days = Column("des_fpg", Integer, doc="Días de Desplazamiento")
+    address_r_45 = Column("dir_cli", String(55), doc="Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Distrito Postal del Cliente")
+    payment_term = Column("dpp_pfa", Numeric(4, 2), doc="Descuento por Pronto Pago")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    retention_effect = Column("efc_ret", Boolean, doc="Generar Efecto de Retención")
+    email_delivery = Column("ema_pfa", Boolean, doc="Enviada por e-mail")
+    packaging = Column("emb_pfa", Numeric(8, 2), doc="Embalaje")
+    status = Column("est_pfa", String(2), doc="Estado")
+    fax_delivery = Column("fax_pfa", Boolean, doc="Enviada por Fax")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrpca", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrpca", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goobrpca", Date, doc="fecha3Tlmp")
+    creation_date = Column("fecc_pfa", Date, doc="Fecha Creación")
+    date = Column("fec_pfa", Date, doc="Fecha de Prefactura")
+    shipment_date = Column("fen_pfa", Date, doc="Fecha de envío de la Prefactura")
+    reception_date = Column("fre_pfa", Date, doc="Fecha de recepción de la Prefactura")
+    resolution_date = Column("frs_pfa", Date, doc="Fecha de resolución de la Prefactura")
+    modification_date = Column("fum_pfa", Date, doc="Fecha Modificación")
+    reduction_coefficient_amount = Column("icb_pfa", Numeric(11, 2), doc="Importe Coef. Baja")
+    certification_amount = Column("icer_pfa", Numeric(11, 2), doc="Importe Certif.")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    administrative_part_increase_decrease_amount = Column("iida_pfa", Numeric(11, 2), doc="Importe Incremento/Decremento Parte Administración")
+    amount_increase_decrease = Column("iid_pfa", Numeric(11, 2), doc="Importe Incr./Decr.")
+    unforeseen_expenses_amount = Column("iim_pfa", Numeric(11, 2), doc="Importe Imprevistos")
+    retention_amount = Column("imp_ret", Numeric(11, 2), doc="Importe de Retención")
+    administrative_expenses_amount = Column("ipa_pfa", Numeric(11, 2), doc="Importe Partes Admin.")
+    irpf_base = Column("ipb_pfa", Numeric(8, 2), doc="Importe de IRPF")
+    delivery_parts_amount = Column("ipe_pfa", Numeric(11, 2), doc="Importe Partes de Entrega")
+    income_tax_percentage = Column("ipf_pfa", Numeric(4, 2), doc="Porcentaje de IRPF a aplicar")
+    income_tax_amount = Column("ipi_pfa", Numeric(8, 2), doc="Importe de IRPF")
+    printed = Column("ipr_pfa", Boolean, doc="Impresa")
+    apply_irpf = Column("irp_pfa", Boolean, doc="Aplicar IRPF")
+    marked_as_invoiced = Column("mfa_pfa", Boolean, doc="Sólo Marcada como Facturada")
+    frequency_r_504 = Column("niv_pfa", Integer, doc="Periodicidad")
+    shipping_address = Column("num_cen", Integer, doc="Dirección de Envío de la Prefactura")
+    number = Column("num_cli", String(4), doc="Número de la vía pública")
+    invoice_number = Column("num_fac", Integer, doc="Nº Factura")
+    due_dates = Column("nvt_fpg", Integer, doc="Nº de Vencimientos")
+    notes = Column("obs_pfa", String(800), doc="Observaciones")
+    city = Column("pob_cli", String(30), doc="Población del Cliente")
+    freight_costs = Column("por_pfa", Numeric(8, 2), doc="Portes")
+    proforma_invoice = Column("pro_pfa", Boolean, doc="Pro Forma")
+    business_name = Column("raz_cli", String(100), doc="Razón Social del Cliente")
+    reference = Column("ref_pfa", String(20), doc="Referencia de Prefactura")
+    retention_percentage = Column("ret_pfa", Numeric(4, 2), doc="Porcentaje de Retención")
+    financial_statement = Column("rfi_pfa", Numeric(4, 2), doc="Recargo Financiero")
+    tel_pfa = Column("tel_pfa", String(12), doc="Teléfono del Cliente")
+    discount_type = Column("tip_cli", Integer, doc="Tipo de Descuento del Cliente")
+    total_amount = Column("tot_pfa", Numeric(11, 2), doc="Importe Total")
+    retention_type = Column("tre_pfa", String(1), doc="Tipo de Retención")
+    user_r_24 = Column("Usum_pfa", String(8), doc="Usuario Modificación")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Valor Divisa")
+
+
+class PreinvoiceLines(ReadOnlyRow, LegacyBase):
+    """Detalle de cada uno de los Resúmenes de la Prefactura de Obra.Se Utiliza (goobrpde)"""
+    __tablename__ = "goobrpde"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo")
+    purchase_order_purchase_agreement = Column("aoo_oprt", String(1), doc="Parte de Obra o de Administración")
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    budget_quantity = Column("canp_pde", Numeric(8, 3), doc="Cantidad Presupuestada")
+    certification_quantity = Column("ccer_pde", Numeric(10, 3), doc="Cantidad de Certificación")
+    quantity_concept = Column("cco_pde", Numeric(10, 3), doc="Cantidad de Concepto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrpde", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrpde", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrpde", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrpde", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    identifier = Column("codh_pde", Integer, doc="Identificador")
+    company1 = Column("cod_ab1", String(1), doc="Empresa1")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    phase = Column("cod_fas", Integer, doc="Fase de la Obra")
+    delivery_part = Column("cod_opec", Integer, doc="Parte de Entrega")
+    part_line_id = Column("cod_oprl", Integer, doc="Identificador Línea del Parte")
+    part = Column("cod_oprt", Integer, doc="Número de Parte")
+    task = Column("cod_otar", Integer, doc="Tarea de la Obra")
+    group_code = Column("cod_pde", String(35), doc="Código Agrupación")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    estimate = Column("cod_pre", Integer, doc="Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="Código de Subactividad")
+    pre_invoiced_quantity = Column("cpre_pde", Numeric(10, 3), doc="Cantidad Prefacturada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrpde", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrpde", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goobrpde", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_787 = Column("dec4_goobrpde", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_pde", String(200), doc="Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrpde", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrpde", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrpde", Date, doc="fecha3Tlmp")
+    certification_amount = Column("icer_pde", Numeric(9, 2), doc="Importe Certificación")
+    part_line_id_r_69 = Column("id_gopaend", Integer, doc="Identificador Línea de Parte")
+    measured_amount = Column("imed_pde", Numeric(9, 2), doc="Importe Medido")
+    budget_amount = Column("impo_pde", Numeric(9, 2), doc="Importe de Venta Presupuestado")
+    pre_invoiced_amount = Column("ipre_pde", Numeric(9, 2), doc="Importe Prefacturado")
+    line_number = Column("lin_pde", Integer, doc="Nº Linea")
+    line_number_detail = Column("num_pde", Integer, doc="Número de la línea de detalle de la Prefactura")
+    line_number_r_843 = Column("num_pre", Integer, doc="Nº Línea de resumen de Concepto")
+    certification_percentage = Column("pcer_pde", Numeric(5, 2), doc="Porcentaje de Certificación")
+    certification_percentage_r_312 = Column("pco_pde", Numeric(5, 2), doc="Porcentaje de Concepto de Certificación")
+    reference = Column("ref_art", String(24), doc="Referencia")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class Goobrpim(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos de cada Prefactura de Obras (goobrpim)"""
+    __tablename__ = "goobrpim"
+
+    base_amount = Column("bas_imd", Numeric(11, 2), doc="Base sobre la que se Aplica el Impuesto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrpim", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrpim", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrpim", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrpim", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    tax_code = Column("cod_imd", Integer, doc="Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Tipo de Impuesto")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrpim", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrpim", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goobrpim", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goobrpim", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrpim", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrpim", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrpim", Date, doc="fecha3Tlmp")
+    amount = Column("imp_imd", Numeric(11, 2), doc="Importe del Impuesto")
+    percentage = Column("por_imd", Numeric(4, 2), doc="Porcentaje Aplicable")
+
+
+class WorkAddresses(ReadOnlyRow, LegacyBase):
+    """Direcciones Asociadas con cada Obra (goobrtdr)"""
+    __tablename__ = "goobrtdr"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goobrtdr", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goobrtdr", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goobrtdr", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goobrtdr", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    country = Column("cod_pai", String(2), doc="Código del País de la Dirección")
+    province = Column("Cod_provi", Integer, doc="Código de Provincia de la Dirección de la Obra")
+    address = Column("cod_tdo", Integer, doc="Código de Dirección de la Obra")
+    address_type = Column("cod_tdr", Integer, doc="Código de Tipo de Dirección")
+    address_line = Column("cod_via", String(2), doc="Tipo de Vía de la Dirección de Obra")
+    neighborhood = Column("col_tdo", String(60), doc="Colonia de la Direcci?n de la Obra")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goobrtdr", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goobrtdr", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goobrtdr", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goobrtdr", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    address_r_810 = Column("dir_tdo", String(55), doc="Dirección de la Obra")
+    postal_code = Column("dpo_tdo", Integer, doc="Código Postal de la Dirección de la Obra")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_tdo", String(60), doc="E-mail de la Dirección de la Obra")
+    fax = Column("fax_tdo", String(18), doc="Fax de la Dirección de la Obra")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goobrtdr", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goobrtdr", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goobrtdr", Date, doc="fecha3Tlmp")
+    mobile_phone = Column("mov_tdo", String(12), doc="Teléfono móvil de la Dirección de la Obra")
+    name = Column("nom_tdo", String(55), doc="Nombre de la Dirección de la Obra")
+    number = Column("num_tdo", String(4), doc="Número de la Vía de la Dirección de la Obra")
+    contact_person = Column("pco_tdo", String(55), doc="Persona de Contacto de la Obra")
+    city = Column("pob_tdo", String(30), doc="Población de la Dirección de la Obra")
+    business_name = Column("raz_tdo", String(100), doc="Razón Social de la Dirección")
+    phone_number = Column("tel_tdo", String(18), doc="Teléfono de la Dirección de la Obra")
+
+
+class LibraryOrigins(ReadOnlyRow, LegacyBase):
+    """Maestro de los Diferentes Orígenes de Partidas (goorilib)"""
+    __tablename__ = "goorilib"
+
+    scope = Column("art_amb", Integer, doc="Ámbito del Artículo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goorilib", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goorilib", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goorilib", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goorilib", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    brand = Column("cod_mar", Integer, doc="Marca")
+    source_book = Column("cod_olb", Integer, doc="Código del Origen de Librería")
+    supplier = Column("cod_pro", Integer, doc="Proveedor")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goorilib", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goorilib", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goorilib", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_923 = Column("dec4_goorilib", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_olb", String(60), doc="Descripción del Origen de Librería")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goorilib", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goorilib", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goorilib", Date, doc="fecha3Tlmp")
+    supplier_scope = Column("pro_amb", Integer, doc="Ámbito de Proveedor")
+
+
+class DeliveriedPartTaxes(ReadOnlyRow, LegacyBase):
+    """Partes de Entrega - Impuestos (gopaeimp)"""
+    __tablename__ = "gopaeimp"
+
+    base_amount = Column("bas_imd", Numeric(11, 2), doc="Base sobre la que se Aplica el Impuesto")
+    user_character1 = Column("char1_al", String(100), doc="Character1Usr")
+    character1_temperature = Column("char1_gopaeimp", String(100), doc="Character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="Character2Usr")
+    character_to_temperature_mapping = Column("char2_gopaeimp", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="Character3Usr")
+    character_3_temperature_limit = Column("char3_gopaeimp", String(100), doc="Character3Tlmp")
+    user_character_r_934 = Column("char4_al", String(100), doc="Character4Usr")
+    character_4_tlmp = Column("char4_gopaeimp", String(100), doc="Character4Tlmp")
+    user_character_5 = Column("char5_al", String(100), doc="Character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="Character6Usr")
+    user_character_7 = Column("char7_al", String(100), doc="Character7Usr")
+    user_character_8 = Column("char8_al", String(100), doc="Character8Usr")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    tax_code = Column("cod_imd", Integer, doc="Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Tipo de Impuesto")
+    delivery_part = Column("cod_opec", Integer, doc="Parte de Entrega")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="Decimal1Usr")
+    decimal1_temp = Column("dec1_gopaeimp", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="Decimal2Usr")
+    decimal_to_templating = Column("dec2_gopaeimp", Numeric(11, 3), doc="Decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="Decimal3Usr")
+    decimal_3_temp = Column("dec3_gopaeimp", Numeric(11, 3), doc="Decimal3Tlmp")
+    decimal4_user = Column("dec4_al", Numeric(11, 3), doc="Decimal4Usr")
+    temperature_decimal4 = Column("dec4_gopaeimp", Numeric(11, 3), doc="Decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="Decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="Decimal6Usr")
+    editor1_user = Column("edi1_al", String(1000), doc="Editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="Editor2Usr")
+    date1_user = Column("fec1_al", Date, doc="Fecha1Usr")
+    date1_temp = Column("fec1_gopaeimp", Date, doc="Fecha1Tlmp")
+    date_to_user = Column("fec2_al", Date, doc="Fecha2Usr")
+    date2_temp = Column("fec2_gopaeimp", Date, doc="Fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="Fecha3Usr")
+    temporary_date_3rd_quarter = Column("fec3_gopaeimp", Date, doc="Fecha3Tlmp")
+    amount = Column("imp_imd", Numeric(11, 2), doc="Importe del Impuesto")
+    percentage = Column("por_imd", Numeric(4, 2), doc="Porcentaje Aplicable")
+
+
+class DeliveriedParts(LegacyBase):
+    """Partes de Entrega (gopaenc)"""
+    __tablename__ = "gopaenc"
+
+    attached_documents = Column("adj_opec", Boolean, doc="Documentos Adjuntos")
+    attachment = Column("ane_pre", Integer, doc="Anexo")
+    journal_entry = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    locked = Column("blq_opec", Boolean, doc="Bloqueado")
+    gross_amount = Column("bru_opec", Numeric(11, 2), doc="Bruto")
+    user_character1 = Column("char1_al", String(100), doc="Character1Usr")
+    character1_temperature = Column("char1_gopaenc", String(100), doc="Character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="Character2Usr")
+    character_to_temperature_mapping = Column("char2_gopaenc", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="Character3Usr")
+    character_3_temperature_limit = Column("char3_gopaenc", String(100), doc="Character3Tlmp")
+    user_character_r_646 = Column("char4_al", String(100), doc="Character4Usr")
+    character_4_tlmp = Column("char4_gopaenc", String(100), doc="Character4Tlmp")
+    user_character_5 = Column("char5_al", String(100), doc="Character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="Character6Usr")
+    user_character_7 = Column("char7_al", String(100), doc="Character7Usr")
+    user_character_8 = Column("char8_al", String(100), doc="Character8Usr")
+    company_code = Column("cli_amb", Integer, doc="Ámbito Cliente")
+    address = Column("coa_opec", String(1), doc="Cargo o Abono")
+    code = Column("cod_cli", Integer, doc="Introduzca Código de Cliente")
+    company = Column("cod_def", Integer, doc="Delegación de Facturación")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company_r_19 = Column("cod_ent", Integer, doc="Empresa")
+    project = Column("cod_obr", Integer, doc="Obra")
+    delivery_part = Column("cod_opec", Integer, doc="Parte de Entrega")
+    frequency = Column("cod_perf", Integer, doc="Periodicidad")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    estimate = Column("cod_pre", Integer, doc="Presupuesto")
+    user = Column("cod_usu", String(8), doc="Usuario")
+    cost = Column("cos_opec", Numeric(14, 5), doc="Coste")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="Decimal1Usr")
+    decimal1_temp = Column("dec1_gopaenc", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="Decimal2Usr")
+    decimal_to_tlm_price = Column("dec2_gopaenc", Numeric(11, 3), doc="Decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="Decimal3Usr")
+    decimal_3_temp = Column("dec3_gopaenc", Numeric(11, 3), doc="Decimal3Tlmp")
+    decimal_for_user = Column("dec4_al", Numeric(11, 3), doc="Decimal4Usr")
+    temperature_decimal4 = Column("dec4_gopaenc", Numeric(11, 3), doc="Decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="Decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="Decimal6Usr")
+    deductible = Column("ded_opc", Boolean, doc="Introduzca Si/No Parte Entrega Deducible")
+    editor1_user = Column("edi1_al", String(1000), doc="Editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="Editor2Usr")
+    editing_status = Column("edic_opec", String(3), doc="Estado de Edición")
+    sent_email = Column("ema_opec", Boolean, doc="E-mail Enviado")
+    billed = Column("fac_opec", Boolean, doc="Facturado")
+    sent_fax = Column("fax_opec", Boolean, doc="Fax Enviado")
+    date1_user = Column("fec1_al", Date, doc="Fecha1Usr")
+    date1_temp = Column("fec1_gopaenc", Date, doc="Fecha1Tlmp")
+    date_to_user = Column("fec2_al", Date, doc="Fecha2Usr")
+    date2_temp = Column("fec2_gopaenc", Date, doc="Fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="Fecha3Usr")
+    temporary_date_3rd_quarter = Column("fec3_gopaenc", Date, doc="Fecha3Tlmp")
+    date = Column("fec_opec", Date, doc="Fecha")
+    last_modified_date = Column("fum_opec", Date, doc="Fecha Última Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    total_amount = Column("imp_opec", Numeric(11, 2), doc="Importe")
+    printed = Column("ipr_opec", Boolean, doc="Impreso")
+    invoice_number = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    notes = Column("obs_opec", String(800), doc="Observaciones")
+    pre_invoiced = Column("pfa_opec", Boolean, doc="Prefacturado")
+    weee_amount = Column("rae_opec", Numeric(11, 2), doc="Importe Raee")
+    reference = Column("ref_opec", String(20), doc="Referencia")
+    total_work_order = Column("tot_opec", Numeric(11, 2), doc="Total Importe")
+    last_modified_user = Column("usum_opec", String(8), doc="Usuario Última Modificación")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class DeliveriedPartLines(ReadOnlyRow, LegacyBase):
+    """Parte de Entrega Detalle (gopaend)"""
+    __tablename__ = "gopaend"
+
+    scope = Column("art_amb", Integer, doc="Ambito del Articulo")
+    quantity = Column("can_oped", Numeric(10, 3), doc="Cantidad")
+    user_character1 = Column("char1_al", String(100), doc="Character1Usr")
+    character1_temperature = Column("char1_gopaend", String(100), doc="Character1Tlmp")
+    user_character = Column("char2_al", String(100), doc="Character2Usr")
+    character_to_temperature_mapping = Column("char2_gopaend", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="Character3Usr")
+    character_3_temperature_limit = Column("char3_gopaend", String(100), doc="Character3Tlmp")
+    user_character_r_138 = Column("char4_al", String(100), doc="Character4Usr")
+    character_4_tlmp = Column("char4_gopaend", String(100), doc="Character4Tlmp")
+    user_character_5 = Column("char5_al", String(100), doc="Character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="Character6Usr")
+    user_character_7 = Column("char7_al", String(100), doc="Character7Usr")
+    user_character_8 = Column("char8_al", String(100), doc="Character8Usr")
+    chapter_id = Column("codh_obe", Integer, doc="Identificador Capítulo Obra")
+    item = Column("cod_art", String(24), doc="Artículo")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    vat = Column("cod_iva", Integer, doc="IVA")
+    brand_code = Column("cod_mar", Integer, doc="Marca")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    delivery_part = Column("cod_opec", Integer, doc="Parte de Entrega")
+    cost = Column("cos_oped", Numeric(13, 5), doc="Coste")
+    pvp_quantity = Column("cuea_oped", Numeric(8, 2), doc="Cantidad PVP")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="Decimal1Usr")
+    decimal1_temp = Column("dec1_gopaend", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="Decimal2Usr")
+    decimal_to_templating = Column("dec2_gopaend", Numeric(11, 3), doc="Decimal2Tlmp")
+    decimal3_user = Column("dec3_al", Numeric(11, 3), doc="Decimal3Usr")
+    decimal_3_temp = Column("dec3_gopaend", Numeric(11, 3), doc="Decimal3Tlmp")
+    decimal_for_user = Column("dec4_al", Numeric(11, 3), doc="Decimal4Usr")
+    temperature_decimal4 = Column("dec4_gopaend", Numeric(11, 3), doc="Decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="Decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="Decimal6Usr")
+    description = Column("des_oped", String(800), doc="Descripción")
+    discount1 = Column("dt1_oped", Numeric(4, 2), doc="Primer Descuento")
+    discount_2 = Column("dt2_oped", Numeric(4, 2), doc="Segundo Descuento")
+    discount_3 = Column("dt3_oped", Numeric(4, 2), doc="Tercer Descuento")
+    editor1_user = Column("edi1_al", String(1000), doc="Editor1Usr")
+    editor_to_user = Column("edi2_al", String(1000), doc="Editor2Usr")
+    date1_user = Column("fec1_al", Date, doc="Fecha1Usr")
+    date1_temp = Column("fec1_gopaend", Date, doc="Fecha1Tlmp")
+    date_to_user = Column("fec2_al", Date, doc="Fecha2Usr")
+    date2_temp = Column("fec2_gopaend", Date, doc="Fecha2Tlmp")
+    date3_user = Column("fec3_al", Date, doc="Fecha3Usr")
+    temporary_date_3rd_quarter = Column("fec3_gopaend", Date, doc="Fecha3Tlmp")
+    date = Column("fec_oped", Date, doc="Fecha")
+    part_line_id = Column("id_gopaend", Integer, doc="Identificador Línea de Parte")
+    line_amount = Column("imp_oped", Numeric(11, 2), doc="Importe Línea")
+    weee_waste_electrical_and_electronic_equipment = Column("itas_oped", Numeric(10, 3), doc="Importe RAEE")
+    vat_percentage = Column("iva_iva", Numeric(4, 2), doc="Porcentaje de IVA")
+    brand_name = Column("nom_mar", String(14), doc="Nombre de la Marca")
+    order = Column("ord_oped", Integer, doc="Orden")
+    selling_price = Column("pvp_oped", Numeric(11, 3), doc="Precio de Venta")
+    manufacturer_reference = Column("ref_art", String(24), doc="Referencia Fabricante del Artículo")
+    equivalence_surcharge_percentage = Column("req_iva", Numeric(4, 2), doc="Porcentaje Recargo de Equivalencia")
+    recycling_rate = Column("tas_oped", Boolean, doc="Tasa de Reciclaje (Raee)")
+    line_type = Column("tli_oped", String(2), doc="Tipo de Línea")
+
+
+class WorkingpartTaxes(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos de cada Parte (goparimp)"""
+    __tablename__ = "goparimp"
+
+    administration_or_project = Column("aoo_oprt", String(1), doc="Parte de Administación u Obra")
+    base_amount = Column("bas_imd", Numeric(11, 2), doc="Base")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goparimp", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goparimp", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goparimp", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goparimp", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    company_a_or_b = Column("cod_ab1", String(1), doc="Empresa A")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    tax_code = Column("cod_imd", Integer, doc="Código de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Tipo de Impuesto")
+    part = Column("cod_oprt", Integer, doc="Parte de la Obra")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goparimp", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goparimp", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goparimp", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goparimp", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goparimp", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goparimp", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goparimp", Date, doc="fecha3Tlmp")
+    amount = Column("imp_imd", Numeric(11, 2), doc="Importe")
+    percentage = Column("por_imd", Numeric(4, 2), doc="Porcentaje")
+
+
+class WorkingdraftLines(ReadOnlyRow, LegacyBase):
+    """Líneas de los Borradores de Partes de Obra/Administración (goparlb)"""
+    __tablename__ = "goparlb"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo")
+    purchase_order_purchase_agreement = Column("Aoo_oprt", String(1), doc="Parte de Administración u Obra")
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    database = Column("bd_oprl", Boolean, doc="Banco de Datos")
+    purchase_quantity = Column("canc_oprl", Numeric(9, 3), doc="Cantidad de Compra de la Línea de Detalle")
+    quantity = Column("can_oprl", Numeric(10, 3), doc="Cantidad")
+    billable_hours = Column("cfa_oprl", Numeric(10, 3), doc="Horas Facturables")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1_temperature = Column("char1_goparlb", String(100), doc="Character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character_to_temperature_mapping = Column("char2_goparlb", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character_3_temperature_limit = Column("char3_goparlb", String(100), doc="Character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character_4tlmp = Column("char4_goparlb", String(100), doc="Character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    billable_hours_r_743 = Column("cin_oprl", Numeric(10, 3), doc="Horas Imputables")
+    project_id = Column("codh_obe", Integer, doc="Identificador único dentro de la Obra")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa A")
+    company_2 = Column("cod_ab2", String(1), doc="Empresa B")
+    activity = Column("cod_acto", Integer, doc="Actividad")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    notification = Column("cod_avis", Integer, doc="Código de Aviso")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    warehouse = Column("cod_depo", Integer, doc="Código de Depósito")
+    worker = Column("cod_empl", Integer, doc="Empleado")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    hour_type = Column("cod_hora", Integer, doc="Tipo de Hora")
+    vat = Column("cod_iva", Integer, doc="IVA")
+    brand = Column("cod_mar", Integer, doc="Marca")
+    work_order = Column("cod_oot", Integer, doc="Número de OT")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Línea de Parte a partir de secuencia")
+    draft_line_id = Column("cod_oprlb", Integer, doc="Id. Línea del Borrador")
+    part = Column("cod_oprt", Integer, doc="Parte de la Obra")
+    draft = Column("cod_oprtb", Integer, doc="Borrador del Parte")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    supplier = Column("cod_pro", Integer, doc="Código del Proveedor de la Condición de Compra")
+    subactivity = Column("cod_sac", Integer, doc="SubActividad")
+    currency = Column("cod_sasc", String(3), doc="Código de Divisa de la Condición de Compra")
+    packaging_unit = Column("cod_uea", String(2), doc="Unidad de Embalaje")
+    purchase_packaging = Column("cod_ueac", String(2), doc="Código de la Unidad de Embalaje de Compra")
+    cost = Column("cos_oprl", Numeric(14, 5), doc="Coste")
+    company_code_phone_number = Column("ctl_art", String(10), doc="Código Corp./Telematel")
+    work_hours = Column("ctr_oprl", Numeric(10, 3), doc="Horas Trabajadas")
+    quantity_u_e_c = Column("cueac_oprl", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Compra")
+    ue_quantity = Column("cuea_prl", Numeric(8, 2), doc="Cantidad de Unidad de Embalaje.")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1_temp = Column("dec1_goparlb", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_tlm_price = Column("dec2_goparlb", Numeric(11, 3), doc="Decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal_3_temp = Column("dec3_goparlb", Numeric(11, 3), doc="Decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_decimal_4 = Column("dec4_goparlb", Numeric(11, 3), doc="Decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    warehouse_r_661 = Column("dep_oprl", Boolean, doc="Depósito")
+    description = Column("des_oprl", String(800), doc="Descripción")
+    purchase_discount_1 = Column("dt1c_oprl", Numeric(4, 2), doc="Descuento 1 Compra")
+    discount_1 = Column("dt1_oprl", Numeric(4, 2), doc="Descuento 1")
+    purchase_discount_2 = Column("dt2c_oprl", Numeric(4, 2), doc="Descuento 2 Compra")
+    discount_2 = Column("dt2_oprl", Numeric(4, 2), doc="Descuento 2")
+    purchase_discount_3 = Column("dt3c_oprl", Numeric(4, 2), doc="Descuento 3 Compra")
+    discount_3 = Column("dt3_oprl", Numeric(4, 2), doc="Descuento 3")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    field_list = Column("err_oprlb", String(800), doc="Lista de Campos con Errores")
+    status = Column("est_oprlb", String(2), doc="Estado del Borrador")
+    billable = Column("fac_oprl", Boolean, doc="Linea Facturable")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_goparlb", Date, doc="Fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2_temp = Column("fec2_goparlb", Date, doc="Fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    temporary_date_3rd_quarter = Column("fec3_goparlb", Date, doc="Fecha3Tlmp")
+    allocation_date = Column("fec_oprl", Date, doc="Fecha de Imputación")
+    warranty = Column("gar_oprl", Boolean, doc="Línea del parte en Garantía")
+    end_time = Column("hof_oprl", String(5), doc="Hora Final")
+    start_time = Column("hoi_oprl", String(5), doc="Hora de Inicio")
+    line_amount = Column("imp_oprl", Numeric(11, 2), doc="Importe Línea")
+    import_or_copy = Column("ioc_oprl", Boolean, doc="Importación o Copia")
+    weee_waste_electrical_and_electronic_equipment = Column("itas_oprl", Numeric(10, 3), doc="Importe Tasa de Reciclaje")
+    vat_percentage = Column("iva_iva", Numeric(4, 2), doc="% IVA")
+    brand_name = Column("nom_mar", String(40), doc="Nombre de la Marca")
+    name = Column("nom_tra", String(55), doc="Informe el nombre del empleado.")
+    invoice_number = Column("num_fac", Integer, doc="Número de Factura")
+    draft_notes = Column("obs_oprlb", String(800), doc="Lista de Campos con Errores")
+    cost_origin = Column("ocos_oprl", String(1), doc="Origen del Coste")
+    discount_origin = Column("odt_oprl", String(2), doc="Origen Dtos.")
+    price_origin = Column("opr_oprl", String(2), doc="Origen Precio")
+    order = Column("ord_oprl", Integer, doc="Orden de la Línea")
+    supplier_scope = Column("pro_amb", Integer, doc="Ámbito del Proveedor")
+    purchase_price = Column("pvpc_oprl", Numeric(12, 3), doc="P.V.P. Compra")
+    retail_price = Column("pvp_oprl", Numeric(12, 3), doc="P.V.P.")
+    recalculate_cost = Column("rec_cos", String(1), doc="Indica si el coste se recalcula al traspasar borrador a parte")
+    manufacturer_reference = Column("ref_art", String(24), doc="Introduzca la Referencia del Fabricante")
+    equivalence_surcharge_percentage = Column("req_iva", Numeric(4, 2), doc="%R.EQ")
+    subcontractor = Column("sub_oprl", Boolean, doc="Indica si la Línea está Subcontratada")
+    recycling_rate = Column("tas_oprl", Boolean, doc="Tasa de Reciclaje")
+    category = Column("tipo_op", Integer, doc="Categoría")
+    line_type = Column("tli_oprl", String(2), doc="Tipo de Línea")
+    location = Column("ubi_oprl", Boolean, doc="Artículo Ubicado")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class WorkingpartBreakdowns(ReadOnlyRow, LegacyBase):
+    """Desglose de la Cantidad del Parte (goparlid)"""
+    __tablename__ = "goparlid"
+
+    quantity = Column("can_oprd", Numeric(10, 3), doc="Cantidad")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goparlid", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goparlid", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goparlid", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goparlid", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    group_identifier = Column("codh_obe", Integer, doc="Id. de Agrupación de la Obra")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    project = Column("cod_obr", Integer, doc="Obra")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Línea de Parte a Partir de Secuencia")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goparlid", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goparlid", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goparlid", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_390 = Column("dec4_goparlid", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goparlid", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goparlid", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goparlid", Date, doc="fecha3Tlmp")
+    line_identifier = Column("lin_obd", Integer, doc="Id. de la Línea del Detalle de la Obra")
+
+
+class WorkingpartHours(ReadOnlyRow, LegacyBase):
+    """Detalle de Horas y Tipos de Hora de cada Línea de Tipo Mano de Obra del (goparlih)"""
+    __tablename__ = "goparlih"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goparlih", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goparlih", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goparlih", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goparlih", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    hour_type = Column("cod_hora", Integer, doc="Código de Tipo de Hora")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Linea de Parte a Partir de Secuencia")
+    cost = Column("cos_oprh", Numeric(14, 5), doc="Coste")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goparlih", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goparlih", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goparlih", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_502 = Column("dec4_goparlih", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goparlih", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goparlih", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goparlih", Date, doc="fecha3Tlmp")
+    date = Column("fec_oprh", Date, doc="Fecha")
+    end_time = Column("hof_oprh", String(5), doc="Hora Final")
+    start_time = Column("hoi_oprh", String(5), doc="Hora de Inicio")
+
+
+class WorkingpartLines(ReadOnlyRow, LegacyBase):
+    """Líneas de Detalle de la Cabecera de Partes (goparlin)"""
+    __tablename__ = "goparlin"
+
+    attachment = Column("ane_pre", Integer, doc="Anexo")
+    purchase_order_purchase_agreement = Column("Aoo_oprt", String(1), doc="Parte de Administración u Obra")
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    database = Column("bd_oprl", Boolean, doc="Banco de Datos")
+    purchase_quantity = Column("canc_oprl", Numeric(9, 3), doc="Cantidad de Compra de la Línea de Detalle")
+    quantity = Column("can_oprl", Numeric(10, 3), doc="Cantidad")
+    billable_hours = Column("cfa_oprl", Numeric(10, 3), doc="Horas Facturables")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goparlin", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goparlin", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goparlin", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goparlin", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    billable_hours_r_743 = Column("cin_oprl", Numeric(10, 3), doc="Horas Imputables")
+    billable_hours_r_588 = Column("cla_obe", Numeric(10, 3), doc="Horas Facturables")
+    project_id = Column("codh_obe", Integer, doc="Identificador único dentro de la Obra")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa A")
+    company_2 = Column("cod_ab2", String(1), doc="Empresa B")
+    activity = Column("cod_acto", Integer, doc="Actividad")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    notification = Column("cod_avis", Integer, doc="Código de Aviso")
+    branch = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    warehouse = Column("cod_depo", Integer, doc="Código de Depósito")
+    worker = Column("cod_empl", Integer, doc="Empleado")
+    company = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    hour_type = Column("cod_hora", Integer, doc="Tipo de Hora")
+    vat = Column("cod_iva", Integer, doc="IVA")
+    brand = Column("cod_mar", Integer, doc="Marca")
+    work_order = Column("cod_oot", Integer, doc="Número de OT")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Línea de Parte a partir de secuencia")
+    part = Column("cod_oprt", Integer, doc="Parte de la Obra")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    supplier = Column("cod_pro", Integer, doc="Código del Proveedor de la Condición de Compra")
+    subactivity = Column("cod_sac", Integer, doc="SubActividad")
+    currency = Column("cod_sasc", String(3), doc="Código de Divisa de la Condición de Compra")
+    packaging_unit = Column("cod_uea", String(2), doc="Unidad de Embalaje")
+    purchase_packaging = Column("cod_ueac", String(2), doc="Código de la Unidad de Embalaje de Compra")
+    cost = Column("cos_oprl", Numeric(14, 5), doc="Coste")
+    company_code_phone_number = Column("ctl_art", String(20), doc="Código Corp./Telematel")
+    work_hours = Column("ctr_oprl", Numeric(10, 3), doc="Horas Trabajadas")
+    quantity_u_e_c = Column("cueac_oprl", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Compra")
+    cuea_prl = Column("cuea_prl", Numeric(8, 2), doc="Cantidad de Unidad de Embalaje.")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goparlin", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goparlin", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_goparlin", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_640 = Column("dec4_goparlin", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    warehouse_r_486 = Column("dep_oprl", Boolean, doc="Depósito")
+    description = Column("des_oprl", String(800), doc="Descripción")
+    purchase_discount_1 = Column("dt1c_oprl", Numeric(4, 2), doc="Descuento 1 Compra")
+    discount_1 = Column("dt1_oprl", Numeric(4, 2), doc="Descuento 1")
+    purchase_discount_2 = Column("dt2c_oprl", Numeric(4, 2), doc="Descuento 2 Compra")
+    discount_2 = Column("dt2_oprl", Numeric(4, 2), doc="Descuento 2")
+    purchase_discount_3 = Column("dt3c_oprl", Numeric(4, 2), doc="Descuento 3 Compra")
+    discount_3 = Column("dt3_oprl", Numeric(4, 2), doc="Descuento 3")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    billable = Column("fac_oprl", Boolean, doc="Linea Facturable")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goparlin", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goparlin", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goparlin", Date, doc="fecha3Tlmp")
+    allocation_date = Column("fec_oprl", Date, doc="Fecha de Imputación")
+    warranty = Column("gar_oprl", Boolean, doc="Línea del parte en Garantía")
+    end_time = Column("hof_oprl", String(5), doc="Hora Final")
+    start_time = Column("hoi_oprl", String(5), doc="Hora de Inicio")
+    line_amount = Column("imp_oprl", Numeric(11, 2), doc="Importe Línea")
+    import_or_copy = Column("ioc_oprl", Boolean, doc="Importación o Copia")
+    weee_waste_electrical_and_electronic_equipment = Column("itas_oprl", Numeric(12, 3), doc="Importe Tasa de Reciclaje")
+    vat_percentage = Column("iva_iva", Numeric(4, 2), doc="% IVA")
+    gocatalog_link = Column("lnk_oprl", String(200), doc="Link GoCatalog")
+    brand_name = Column("nom_mar", String(40), doc="Nombre de la Marca")
+    name = Column("nom_tra", String(55), doc="Informe el nombre del empleado.")
+    invoice_number = Column("num_fac", Integer, doc="Número de Factura")
+    cost_origin = Column("ocos_oprl", String(1), doc="Origen del Coste")
+    discount_origin = Column("odt_oprl", String(2), doc="Origen Dtos.")
+    price_origin = Column("opr_oprl", String(2), doc="Origen Precio")
+    order = Column("ord_oprl", Integer, doc="Orden de la Línea")
+    supplier_scope = Column("pro_amb", Integer, doc="Ámbito del Proveedor")
+    purchase_price = Column("pvpc_oprl", Numeric(12, 3), doc="P.V.P. Compra")
+    retail_price = Column("pvp_oprl", Numeric(12, 3), doc="P.V.P.")
+    manufacturer_reference = Column("ref_art", String(24), doc="Introduzca la Referencia del Fabricante")
+    equivalence_surcharge_percentage = Column("req_iva", Numeric(4, 2), doc="%R.EQ")
+    subcontractor = Column("sub_oprl", Boolean, doc="Indica si la Línea está Subcontratada")
+    recycling_rate = Column("tas_oprl", Boolean, doc="Tasa de Reciclaje")
+    category = Column("tipo_op", Integer, doc="Categoría")
+    line_type = Column("tli_oprl", String(2), doc="Tipo de Línea")
+    location = Column("ubi_oprl", Boolean, doc="Artículo Ubicado")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class WorkingpartLocations(ReadOnlyRow, LegacyBase):
+    """Detalle de Ubicación de donde se ha Extraido el Stock de cada Línea de D (goparliu)"""
+    __tablename__ = "goparliu"
+
+    article_scope = Column("art_amb", Integer, doc="Ámbito de Artículo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goparliu", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goparliu", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goparliu", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goparliu", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    warehouse = Column("cod_alm", Integer, doc="Almacén")
+    item = Column("cod_art", String(24), doc="Artículo")
+    sales_representative = Column("cod_com", String(24), doc="Código de Comercial")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Línea de Parte a Partir de Secuencia")
+    area = Column("cod_zona", String(1), doc="Zona")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goparliu", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goparliu", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goparliu", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goparliu", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goparliu", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goparliu", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goparliu", Date, doc="fecha3Tlmp")
+    registration_number = Column("mat_bob", String(20), doc="Matrícula")
+    warehouse_movement = Column("num_alm", Integer, doc="Mov. de Almacén")
+    cash_register = Column("num_caj", String(20), doc="Caja")
+    batch = Column("num_lot", String(20), doc="Lote")
+    pallet = Column("num_pal", String(20), doc="Palet")
+    series = Column("num_ser", String(40), doc="Nº de Serie")
+    current_stock = Column("str_opru", Numeric(8, 2), doc="Stock Actual")
+    location = Column("ubi_art", String(13), doc="Ubicación")
+    location_r_866 = Column("ubi_opru", Boolean, doc="Ubicado")
+
+
+class WorkingdraftHeads(LegacyBase):
+    """Cabecera de los Borradores de Partes de Obra/Administración (gopartb)"""
+    __tablename__ = "gopartb"
+
+    attachments = Column("adj_oprt", Boolean, doc="Documentos adjuntos asociados")
+    purchase_order_purchase_agreement = Column("Aoo_oprt", String(1), doc="Parte de Administración u Obra")
+    locked = Column("blq_oprt", Boolean, doc="Bloqueado")
+    gross_amount = Column("bru_oprt", Numeric(11, 2), doc="Total Parte")
+    frequency = Column("cad_fpg", Integer, doc="Cadencia de días entre vencimientos")
+    currency_amount = Column("can_sas", Integer, doc="Cantidad monetaria")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1_temperature = Column("char1_gopartb", String(100), doc="Character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character_to_temperature_mapping = Column("char2_gopartb", String(100), doc="Character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character_3_temperature_limit = Column("char3_gopartb", String(100), doc="Character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character_4_tlmp = Column("char4_gopartb", String(100), doc="Character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_cli", String(18), doc="CIF del Cliente")
+    customer_scope = Column("cli_amb", Integer, doc="Ámbito de Cliente")
+    address = Column("coa_oprt", String(1), doc="Cargo o Abono")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa A")
+    company_2 = Column("cod_ab2", String(1), doc="Empresa B")
+    notification_number = Column("cod_avis", Integer, doc="Número de Aviso")
+    goods_address = Column("cod_cen", Integer, doc="Dirección de Envío de Mercaderías")
+    shipping_address = Column("cod_cene", Integer, doc="Dirección de Envío")
+    customer = Column("cod_cli", Integer, doc="Código de Cliente")
+    sales_representative = Column("cod_def", Integer, doc="Delegación de facturación")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    warehouse = Column("cod_depo", Integer, doc="Número de Depósito")
+    responsible_person = Column("cod_empl", Integer, doc="Empleado Responsable")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    payment_method = Column("cod_fpg", Integer, doc="Forma de Pago")
+    message = Column("cod_msg", String(3), doc="Mensaje Asociado al Parte")
+    project = Column("cod_obr", Integer, doc="Obra")
+    part = Column("cod_oprt", Integer, doc="Parte")
+    draft = Column("cod_oprtb", Integer, doc="Borrador del Parte")
+    country = Column("cod_pai", String(2), doc="País del Cliente")
+    invoice_period = Column("cod_perf", Integer, doc="Periodicidad en la Facturación")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    cod_provi = Column("cod_provi", Integer, doc="Provincia del Cliente")
+    currency = Column("cod_sas", String(3), doc="Divisa de Venta")
+    user = Column("cod_usu", String(8), doc="Usuario que ha creado el parte")
+    draft_user = Column("cod_usub", String(8), doc="Usuario Borrador")
+    address_r_690 = Column("cod_via", String(2), doc="Sigla de la Vía Pública del Cliente")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia del Cliente")
+    item_cost = Column("cosa_oprt", Numeric(14, 5), doc="Total Coste Artículo")
+    expenses_cost = Column("cosg_oprt", Numeric(14, 5), doc="Total Coste Gastos")
+    labor_cost = Column("cosm_oprt", Numeric(14, 5), doc="Total Coste Mano de Obra")
+    service_cost = Column("coss_oprt", Numeric(14, 5), doc="Total Coste Servicios")
+    cost = Column("cos_oprt", Numeric(14, 5), doc="Total Coste")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1_temp = Column("dec1_gopartb", Numeric(11, 3), doc="Decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_templating = Column("dec2_gopartb", Numeric(11, 3), doc="Decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal_3_temp = Column("dec3_gopartb", Numeric(11, 3), doc="Decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_decimal4 = Column("dec4_gopartb", Numeric(11, 3), doc="Decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    warehouse_r_353 = Column("depo_oprt", Boolean, doc="Parte Destinado a Depósito")
+    travel_expenses = Column("des_fpg", Integer, doc="Días de desplazamiento")
+    address_r_416 = Column("dir_cli", String(55), doc="Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Distrito Postal del Cliente")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_oprt", Boolean, doc="Enviado por E-mail")
+    field_list = Column("err_oprtb", String(800), doc="Lista de Campos con Errores")
+    status = Column("est_oprtb", String(2), doc="Estado del Borrador")
+    billed = Column("fac_oprt", Boolean, doc="Parte Facturado")
+    billable = Column("fae_oprt", Boolean, doc="Parte de Administración Facturable")
+    fax = Column("fax_oprt", Boolean, doc="Enviado por Fax")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_gopartb", Date, doc="Fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2_temp = Column("fec2_gopartb", Date, doc="Fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    temporary_date_3rd_quarter = Column("fec3_gopartb", Date, doc="Fecha3Tlmp")
+    registration_date = Column("fec_oprt", Date, doc="Fecha registro")
+    draft_date = Column("fec_oprtb", Date, doc="Fecha Borrador")
+    system_date_and_time = Column("fes_oprt", DateTime, doc="Fecha y Hora")
+    last_modified_date = Column("fum_oprt", Date, doc="Fecha Última Modificación")
+    draft_time = Column("hor_oprtb", String(5), doc="Hora Borrador")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    total_items_amount = Column("impa_oprt", Numeric(11, 2), doc="Total Importe Artículos")
+    total_expense_amount = Column("impg_oprt", Numeric(11, 2), doc="Total Importe Gastos")
+    total_labor_cost = Column("impm_oprt", Numeric(11, 2), doc="Total Importe M.O")
+    total_service_amount = Column("imps_oprt", Numeric(11, 2), doc="Total Importe Servicios")
+    amount = Column("imp_oprt", Numeric(11, 2), doc="Total Importe")
+    printed = Column("ipr_oprt", Boolean, doc="Parte impreso")
+    delivery_note_number = Column("num_alc", Integer, doc="Introduzca número albarán")
+    number = Column("num_cli", String(4), doc="Número de la Vía Pública del Cliente")
+    order_number = Column("num_cpp", Integer, doc="Número de Pedido")
+    invoice_number = Column("num_fac", Integer, doc="Número de Factura")
+    invoice_number_r_33 = Column("num_fcc", Integer, doc="Introduzca el Número de Factura de Compra")
+    due_dates = Column("nvt_fpg", Integer, doc="Número de vencimientos")
+    notes = Column("obs_oprt", String(800), doc="Observaciones")
+    draft_notes = Column("obs_oprtb", String(800), doc="Observaciones Borrador")
+    part_origin = Column("ori_oprt", String(3), doc="Origen de la Creación del Parte")
+    pre_invoiced = Column("pfa_oprt", Boolean, doc="Parte Prefacturado")
+    city = Column("pob_cli", String(30), doc="Población del Cliente")
+    code = Column("rac_oprt", String(20), doc="Código")
+    business_name = Column("raz_cli", String(100), doc="Razón Social")
+    reference = Column("ref_oprt", String(20), doc="Referencia del Parte")
+    reviewed = Column("rev_oprtb", Boolean, doc="Borrador Revisado")
+    phone_number = Column("tel_cli", String(18), doc="Teléfono del Cliente")
+    delivery_type = Column("tex_oprt", String(40), doc="Introduzca Tipo de Entrega: Urgente, Inmediata, etc")
+    discount_type = Column("tip_cli", Integer, doc="Tipo de Descuento de Ventas del Cliente")
+    total_amount = Column("tot_oprt", Numeric(11, 2), doc="Total Parte")
+    total_raee_amount = Column("Trae_oprt", Numeric(11, 2), doc="Total Importe RAEE")
+    last_modified_user = Column("usum_oprt", String(8), doc="Usuario Última Modificación")
+    valued = Column("val_oprt", Boolean, doc="Parte Valorado")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Valor Actual de la Divisa")
+
+
+class Workingparts(LegacyBase):
+    """Cabecera del Documento de Partes (gopartes)"""
+    __tablename__ = "gopartes"
+
+    attachments = Column("adj_oprt", Boolean, doc="Documentos adjuntos asociados")
+    purchase_order_purchase_agreement = Column("Aoo_oprt", String(1), doc="Parte de Administración u Obra")
+    journal_entry = Column("asi_cer", Integer, doc="N?mero de Asiento de Certificaci?n")
+    journal_entry_r_115 = Column("asi_mov", Integer, doc="Número de Asiento")
+    locked = Column("blq_oprt", Boolean, doc="Bloqueado")
+    gross_amount = Column("bru_oprt", Numeric(11, 2), doc="Total Parte")
+    frequency = Column("cad_fpg", Integer, doc="Cadencia de días entre vencimientos")
+    currency_amount = Column("can_sas", Integer, doc="Cantidad monetaria")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopartes", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopartes", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopartes", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopartes", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_cli", String(18), doc="CIF del Cliente")
+    customer_scope = Column("cli_amb", Integer, doc="Ámbito de Cliente")
+    address = Column("coa_oprt", String(1), doc="Cargo o Abono")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa A")
+    company_2 = Column("cod_ab2", String(1), doc="Empresa B")
+    notification_number = Column("cod_avis", Integer, doc="Número de Aviso")
+    goods_address = Column("cod_cen", Integer, doc="Dirección de Envío de Mercaderías")
+    shipping_address = Column("cod_cene", Integer, doc="Dirección de Envío")
+    customer = Column("cod_cli", Integer, doc="Código de Cliente")
+    sales_representative = Column("cod_def", Integer, doc="Delegación de facturación")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    warehouse = Column("cod_depo", Integer, doc="Número de Depósito")
+    responsible_person = Column("cod_empl", Integer, doc="Empleado Responsable")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    payment_method = Column("cod_fpg", Integer, doc="Forma de Pago")
+    message = Column("cod_msg", String(3), doc="Mensaje Asociado al Parte")
+    project = Column("cod_obr", Integer, doc="Obra")
+    part = Column("cod_oprt", Integer, doc="Parte")
+    country = Column("cod_pai", String(2), doc="País del Cliente")
+    invoice_period = Column("cod_perf", Integer, doc="Periodicidad en la Facturación")
+    pre_invoice = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    province = Column("cod_provi", Integer, doc="Provincia del Cliente")
+    currency = Column("cod_sas", String(3), doc="Divisa de Venta")
+    user = Column("cod_usu", String(8), doc="Usuario que ha creado el parte")
+    address_r_608 = Column("cod_via", String(2), doc="Sigla de la Vía Pública del Cliente")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia del Cliente")
+    accounted = Column("con_oprt", Boolean, doc="Certificaci?n Contabilizada")
+    item_cost = Column("cosa_oprt", Numeric(14, 5), doc="Total Coste Artículo")
+    expenses_cost = Column("cosg_oprt", Numeric(14, 5), doc="Total Coste Gastos")
+    labor_cost = Column("cosm_oprt", Numeric(14, 5), doc="Total Coste Mano de Obra")
+    service_cost = Column("coss_oprt", Numeric(14, 5), doc="Total Coste Servicios")
+    cost = Column("cos_oprt", Numeric(14, 5), doc="Total Coste")
+    property_account = Column("cpre_oprt", String(20), doc="Cuenta Predial")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopartes", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopartes", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopartes", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopartes", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    deductible = Column("ded_oprt", Boolean, doc="Introduzca Si/No Parte Deducible")
+    warehouse_r_443 = Column("depo_oprt", Boolean, doc="Parte Destinado a Depósito")
+    travel_expenses = Column("des_fpg", Integer, doc="Días de desplazamiento")
+    address_r_563 = Column("dir_cli", String(55), doc="Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Distrito Postal del Cliente")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_oprt", String(3), doc="Estado de Edición")
+    email = Column("ema_oprt", Boolean, doc="Enviado por E-mail")
+    billed = Column("fac_oprt", Boolean, doc="Parte Facturado")
+    billable = Column("fae_oprt", Boolean, doc="Parte de Administración Facturable")
+    fax = Column("fax_oprt", Boolean, doc="Enviado por Fax")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopartes", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopartes", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gopartes", Date, doc="fecha3Tlmp")
+    registration_date = Column("fec_oprt", Date, doc="Fecha registro")
+    system_date_time = Column("fes_oprt", DateTime, doc="Fecha y Hora")
+    signed = Column("fir_oprt", Boolean, doc="Si/No el Parte tiene una Firma asociada")
+    last_modified_date = Column("fum_oprt", Date, doc="Fecha Última Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    total_items_amount = Column("impa_oprt", Numeric(11, 2), doc="Total Importe Artículos")
+    total_expense_amount = Column("impg_oprt", Numeric(11, 2), doc="Total Importe Gastos")
+    total_labor_cost = Column("impm_oprt", Numeric(11, 2), doc="Total Importe M.O")
+    total_service_amount = Column("imps_oprt", Numeric(11, 2), doc="Total Importe Servicios")
+    amount = Column("imp_oprt", Numeric(11, 2), doc="Total Importe")
+    printed = Column("ipr_oprt", Boolean, doc="Parte impreso")
+    delivery_note_number = Column("num_alc", Integer, doc="Introduzca número albarán")
+    number = Column("num_cli", String(4), doc="Número de la Vía Pública del Cliente")
+    order_number = Column("num_cpp", Integer, doc="Número de Pedido")
+    invoice_number = Column("num_fac", Integer, doc="Número de Factura")
+    invoice_number_r_764 = Column("num_fcc", Integer, doc="Introduzca el Número de Factura de Compra")
+    due_dates = Column("nvt_fpg", Integer, doc="Número de vencimientos")
+    notes = Column("obs_oprt", String(800), doc="Observaciones")
+    part_origin = Column("ori_oprt", String(3), doc="Origen de la Creación del Parte")
+    pending_authorization = Column("pau_oprt", Boolean, doc="Pdte. Autorizar")
+    pre_invoiced = Column("pfa_oprt", Boolean, doc="Parte Prefacturado")
+    city = Column("pob_cli", String(30), doc="Población del Cliente")
+    code = Column("rac_oprt", String(20), doc="Código")
+    business_name = Column("raz_cli", String(100), doc="Razón Social")
+    reference = Column("ref_oprt", String(20), doc="Referencia del Parte")
+    phone_number = Column("tel_cli", String(18), doc="Teléfono del Cliente")
+    delivery_type = Column("tex_oprt", String(40), doc="Introduzca Tipo de Entrega: Urgente, Inmediata, etc")
+    discount_type = Column("tip_cli", Integer, doc="Tipo de Descuento de Ventas del Cliente")
+    total_amount = Column("tot_oprt", Numeric(11, 2), doc="Total Parte")
+    total_raee_amount = Column("Trae_oprt", Numeric(11, 2), doc="Total Importe RAEE")
+    last_modified_user = Column("usum_oprt", String(8), doc="Usuario Última Modificación")
+    valued = Column("val_oprt", Boolean, doc="Parte Valorado")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Valor Actual de la Divisa")
+
+
+class WorkingpartTemplateHeads(ReadOnlyRow, LegacyBase):
+    """Plantillas de Imputación de Mano de Obra en Partes (goplaimc)"""
+    __tablename__ = "goplaimc"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goplaimc", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goplaimc", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goplaimc", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goplaimc", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    project_id = Column("codh_obe", Integer, doc="Identificador único dentro de la Obra")
+    activity = Column("cod_acto", Integer, doc="Actividad")
+    calendar = Column("cod_cal", String(4), doc="Calendario")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    project = Column("cod_obr", Integer, doc="Código de la Obra")
+    work_order = Column("cod_oot", Integer, doc="Código de OT")
+    template_code = Column("cod_pla", Integer, doc="Código de la Plantilla")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="Sub-Actividad")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goplaimc", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goplaimc", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goplaimc", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goplaimc", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_pla", String(60), doc="Descripción de la Plantilla")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goplaimc", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goplaimc", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_goplaimc", Date, doc="fecha3Tlmp")
+    version = Column("ver_pre", Integer, doc="Versión")
+
+
+class WorkingpartTemplateLines(ReadOnlyRow, LegacyBase):
+    """Detalle Plantillas de Imputación de Mano de Obra en Partes (goplaiml)"""
+    __tablename__ = "goplaiml"
+
+    quantity = Column("can_iml", Numeric(7, 2), doc="Cantidad de Horas a Imputar")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_goplaiml", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_goplaiml", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_goplaiml", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_goplaiml", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    hour_type = Column("cod-hora", Integer, doc="Tipo de Hora")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    employee = Column("cod_empl", Integer, doc="Código de Empleado")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    template = Column("cod_pla", Integer, doc="Código de la Plantilla")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_goplaiml", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_goplaiml", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_goplaiml", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_goplaiml", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_goplaiml", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_goplaiml", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_goplaiml", Date, doc="fecha3Tlmp")
+    date = Column("fec_iml", Date, doc="Fecha de imputación de la linea")
+    name = Column("nom_tra", String(55), doc="Informe el nombre del empleado.")
+    dedication_percentage = Column("por_iml", Numeric(5, 2), doc="Porcentaje de Dedicación")
+    category = Column("tipo_op", Integer, doc="Categoría")
+
+
+class Gopreimp(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos de los Presupuestos de Obras (gopreimp)"""
+    __tablename__ = "gopreimp"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    base_amount = Column("bas_imd", Numeric(11, 2), doc="Base sobre la que se aplica el Impuesto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopreimp", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopreimp", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopreimp", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopreimp", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    tax_code = Column("cod_imd", Integer, doc="Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Tipo Impuesto")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopreimp", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopreimp", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopreimp", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopreimp", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopreimp", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopreimp", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gopreimp", Date, doc="fecha3Tlmp")
+    amount = Column("imp_imd", Numeric(11, 2), doc="Importe del Impuesto")
+    percentage = Column("por_imd", Numeric(4, 2), doc="Porcentaje Aplicable")
+    version = Column("ver_pre", Integer, doc="Código de versión del presupuesto")
+
+
+class BudgetHeads(LegacyBase):
+    """Cabecera del Documento de Presupuestos de Obras (gopresuc)"""
+    __tablename__ = "gopresuc"
+
+    apply_predefined_discounts = Column("adec_pre", Boolean, doc="Aplicar Dtos. Predefinidos para Coste + Incremento")
+    discount_application = Column("ades_pre", String(1), doc="Forma de aplicar descuentos")
+    attachments = Column("adj_pre", Boolean, doc="Documentos adjuntos asociados")
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    origin_attachment = Column("ane_preo", Integer, doc="Anexo Origen de la Copia")
+    total_advances = Column("ant_pre", Numeric(11, 2), doc="Total Importe Anticipos")
+    health_and_safety_author = Column("ass_pre", String(55), doc="Centro Autor del Estudio de Seguridad Salud")
+    reduction_coefficient = Column("baj_pre", Numeric(11, 0), doc="Coeficiente de Baja")
+    gross_amount = Column("bru_pre", Numeric(11, 2), doc="Importe Bruto del Presupuesto")
+    quantity = Column("can_sas", Integer, doc="Cantidad de la Divisa")
+    activity_control_subactivity_control = Column("cas_pre", Boolean, doc="Control de Actividad/Subactividad")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopresuc", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopresuc", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopresuc", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopresuc", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_identification_number = Column("cif_cli", String(18), doc="CIF del Cliente")
+    customer_scope = Column("cli_amb", Integer, doc="Ámbito de Cliente")
+    notification = Column("cod_avis", Integer, doc="Aviso")
+    shipping_address = Column("cod_cen", Integer, doc="Código de Dirección de Envío del Cliente")
+    customer = Column("cod_cli", Integer, doc="Código del Cliente Titular del Presupuesto")
+    branch = Column("cod_def", Integer, doc="Delegación")
+    branch_r_595 = Column("cod_del", Integer, doc="Código de Delegación")
+    deviation_number = Column("cod_des", Integer, doc="Indique Nº Desviación")
+    potential_customer = Column("cod_dir", Integer, doc="Código del Cliente Potencial Titular del Presupuesto")
+    responsible_person = Column("cod_empl", Integer, doc="Código de Empleado Responsable del Presupuesto")
+    company = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    commercial_stadium = Column("cod_ests", Integer, doc="Código de Estadio de Seguimiento Comercial")
+    payment_method = Column("cod_fpg", Integer, doc="Código de la Forma de Pago")
+    language = Column("cod_idi", String(3), doc="Código de Idioma")
+    vat = Column("cod_iva", Integer, doc="Introduzca el código de IVA de la cabecera del presupuesto")
+    rejection_reason = Column("cod_mor", Integer, doc="Código del Motivo de Rechazo de Presupuesto")
+    project = Column("cod_obr", Integer, doc="Código de Obra donde esta incluido el Presupuesto")
+    country = Column("cod_pai", String(2), doc="Código de País de la Dirección del Cliente")
+    purchase_proposal = Column("cod_prc", Integer, doc="Propuesta para Compra")
+    subcontracting_proposal = Column("cod_prcs", Integer, doc="Propuesta para Subcontratación")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    source_budget = Column("cod_preo", Integer, doc="Presupuesto Origen de la Copia")
+    potential_customer_contact = Column("cod_prof", Integer, doc="Código del Contacto del Cliente Potencial Titular del Presup.")
+    province = Column("cod_provi", Integer, doc="Código de Provincia de la Dirección del Cliente")
+    sales_agent = Column("cod_rep", Integer, doc="Código del Agente Comercial")
+    currency = Column("cod_sas", String(3), doc="Código de Divisa")
+    sales_tracking = Column("cod_seg", String(10), doc="Código de Seguimiento Comercial")
+    sales_card = Column("cod_tav", Integer, doc="Código de Tarifa de Venta para Mano de Obra")
+    customer_contact = Column("cod_telc", Integer, doc="Código del Contacto del Cliente Titular del Presupuesto")
+    budget_type = Column("cod_tipp", Integer, doc="Tipo de Presupuesto")
+    project_type = Column("cod_tobr", Integer, doc="Tipo de Obra")
+    user = Column("cod_usu", String(8), doc="Código de Usuario que ha generado el Presupuesto")
+    address = Column("cod_via", String(2), doc="Tipo de Via de la dirección del cliente")
+    neighborhood = Column("col_cli", String(60), doc="Introduzca la Colonia de la Direcci?n del Cliente")
+    registered_colony = Column("col_reg", String(60), doc="Colonia del Registro")
+    commission_percentage = Column("com_pre", Numeric(4, 2), doc="Porcentaje de Comisión")
+    customer_potential_customer = Column("cop_pre", Boolean, doc="Cliente o Cliente Potencial")
+    correction_copy = Column("cpi_pre", Boolean, doc="Copia por Rectificación")
+    assistance_center = Column("css_pre", String(55), doc="Centro Asistencial")
+    sales_conditions_scope = Column("cve_amb", Integer, doc="Ámbito de Condiciones de Venta")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopresuc", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopresuc", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopresuc", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopresuc", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("desc_pre", String(200), doc="Descripción Corta del Presupuesto")
+    detailed_description = Column("desd_pre", String(1200), doc="Descripción Extensa del Presupuesto")
+    address_r_230 = Column("dir_cli", String(55), doc="Dirección del Cliente")
+    postal_code = Column("dpo_cli", Integer, doc="Código Postal de la Dirección del Cliente")
+    discount_percentage = Column("dpp_pre", Numeric(4, 2), doc="Descuento Pronto Pago")
+    item_discount_2 = Column("dpra2_pre", Numeric(4, 2), doc="Descuento 2 Predefinido para Artículos")
+    item_discount_3 = Column("dpra3_pre", Numeric(4, 2), doc="Descuento 3 Predefinido para Artículos")
+    item_discounts = Column("dpra_pre", Numeric(4, 2), doc="Descuento 1 Predefinido para Artículos")
+    subcontracting_discount_2 = Column("dprb2_pre", Numeric(4, 2), doc="Descuento 2 Predefinido para Subcontrataciones")
+    subcontracting_discount_3 = Column("dprb3_pre", Numeric(4, 2), doc="Descuento 3 Predefinido para Subcontrataciones")
+    subcontracting_discounts = Column("dprb_pre", Numeric(4, 2), doc="Descuento 1 Predefinido para Subcontratación")
+    tool_discounts = Column("dprh_pre", Numeric(4, 2), doc="Descuento 1 Predefinido para Herramientas")
+    labor_discount_2 = Column("dprm2_pre", Numeric(4, 2), doc="Descuento 2 Predefinido para Mano de Obra")
+    labor_discount_3 = Column("dprm3_pre", Numeric(4, 2), doc="Descuento 3 Predefinido para Mano de Obra")
+    labor_discounts = Column("dprm_pre", Numeric(4, 2), doc="Descuento 1 predefinido para Mano de Obra")
+    service_discount_2 = Column("dprs2_pre", Numeric(4, 2), doc="Descuento 2 Predefinido para Servicios")
+    service_discount_3 = Column("dprs3_pre", Numeric(4, 2), doc="Descuento 3 Predefinido para Servicios")
+    service_discounts = Column("dprs_pre", Numeric(4, 2), doc="Descuento 1 Predefinido para Servicios")
+    differentiate_subcontracting_proposals = Column("dps_pre", Boolean, doc="Diferenciar Propuestas Subcontratación")
+    deviation = Column("dsv_pre", Boolean, doc="Existe Desviación?")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_pre", String(3), doc="Estado de Edición")
+    delivery_status = Column("een_pre", String(2), doc="Estado Entregas")
+    accepted_date = Column("face_pre", Date, doc="Fecha Situación Presupuesto Aceptado")
+    award_date = Column("fadj_pre", Date, doc="Fecha de Adjudicación de la Obra")
+    approval_date = Column("fapr_pre", Date, doc="Fecha Situación Aprobación del Presupuesto")
+    favorite_version = Column("fav_pre", Boolean, doc="Versión Favoríta del Presupuesto/Anexo")
+    expiration_date = Column("fcad_pre", Date, doc="Fecha de Caducidad del Presupuesto")
+    contract_date = Column("fcon_pre", Date, doc="Fecha de Contrato de la Obra")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopresuc", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopresuc", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gopresuc", Date, doc="fecha3Tlmp")
+    date = Column("fec_pre", Date, doc="Fecha de Creación del Presupuesto")
+    edition_date = Column("fedi_pre", Date, doc="Fecha Situación Edición")
+    property = Column("finc_pre", String(18), doc="Finca Registro")
+    license_expiry_date = Column("flia_pre", Date, doc="Fecha de Licencia de la Obra")
+    bid_submission = Column("flic_pre", Date, doc="Fecha de Licitación de la Obra")
+    primary_occupation_date = Column("flpa_pre", Date, doc="Fecha de Licencia de Primera Ocupación")
+    folio = Column("fol_pre", String(18), doc="Folio Registro")
+    project_closure_forecast_date = Column("fpco_pre", Date, doc="Fecha Prevista Cierre de la Obra")
+    pending_response_date = Column("fpdt_pre", Date, doc="Fecha Situación Pendiente de Respuesta")
+    estimated_delivery_date = Column("fpe_pre", Date, doc="Fecha Prevista de Entrega")
+    final_project_completion_date = Column("Fpfo_pre", Date, doc="Fecha Prevista Finalización de la Obra")
+    start_date_forecast = Column("Fpio_pre", Date, doc="Fecha Prevista Inicio de la Obra")
+    planned_start_date = Column("fpi_pre", Date, doc="Fecha Prevista de Inicio")
+    rejected_date = Column("frec_pre", Date, doc="Fecha Situación Presupuesto Rechazado")
+    last_modified_date = Column("fum_pre", Date, doc="Última Fecha de Modificación del Presupuesto")
+    contracted_import = Column("icon_pre", Numeric(11, 2), doc="Importe del Presupuesto Contratado")
+    increase_items = Column("icra_pre", Numeric(5, 2), doc="Incremento Inicial para Artículos")
+    subcontracting_increment = Column("icrb_pre", Numeric(5, 2), doc="Incremento inicial para Subcontratación")
+    tool_increment = Column("icrh_pre", Numeric(5, 2), doc="Incremento inicial para Herramientas")
+    labor_cost_increase = Column("icrm_pre", Numeric(5, 2), doc="Incremento inicial para Mano de Obra")
+    service_increment = Column("icrs_pre", Numeric(5, 2), doc="Incremento inicial para servicios")
+    invoice_line = Column("id_gvallin", Integer, doc="Línea Factura")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    tax_id = Column("ifis_pre", String(18), doc="Identificación Fiscal")
+    induced_times = Column("ind_pre", Boolean, doc="Informar si se utilizan Tiempos Inducidos")
+    match_weee_object_from_planning = Column("Iopr_pre", Boolean, doc="Igualar RAEE Obj. a partir Planif.")
+    match_objective_cost_from_planning = Column("iop_pre", Boolean, doc="Igualar Coste Obj. a partir del Planif.")
+    approx_total_tax = Column("ipar_pre", Numeric(11, 2), doc="Importe Total Aproximado del Presupuesto")
+    taxable_base_for_income_tax = Column("ipb_pre", Numeric(11, 2), doc="Base a la que se aplica el % de IRPF")
+    income_tax_withholding = Column("ipf_pre", Numeric(4, 2), doc="% IRPF a aplicar en el presupuesto")
+    income_tax_amount = Column("ipi_pre", Numeric(11, 2), doc="Importe IRPF del Presupuesto")
+    health_and_safety_budget = Column("iss_pre", Numeric(11, 2), doc="Presupuesto del Seguridad Salud")
+    vat_percentage = Column("iva_pre", Numeric(4, 2), doc="% de IVA de la cabecera del presupuesto")
+    book = Column("lib_pre", String(18), doc="Libro Registro")
+    number_of_floors = Column("npis_pre", Integer, doc="Número Total de Pisos")
+    number = Column("num_cli", String(4), doc="Número de la via de la dirección del cliente")
+    invoice = Column("num_fac", Integer, doc="Factura")
+    cost_origin = Column("ocos_pre", String(1), doc="Origen del Coste. Valor Inicializador")
+    order_status = Column("ord_prst", Integer, doc="Orden dentro de las Situaciones del Presupuesto")
+    health_and_safety_coordinator = Column("oss_pre", String(55), doc="Coordinador Seguridad Salud")
+    city = Column("pob_cli", String(30), doc="Población de la dirección del cliente")
+    registered_city = Column("preg_pre", String(55), doc="Población del Registro")
+    apply_weee = Column("raee_pre", Boolean, doc="Informar si se aplicará el RAEE")
+    business_name = Column("raz_cli", String(100), doc="Razón Social del Cliente")
+    cadastral_reference = Column("rcas_pre", String(18), doc="Referencia Catastral")
+    internal_reference = Column("refi_pre", String(20), doc="Referencia Interna")
+    customer_reference = Column("ref_cli", String(20), doc="Referencia Cliente")
+    retention_type = Column("ret_pre", String(1), doc="Tipo Retención Aplicable al Presupuesto")
+    equivalence_surcharge_percentage = Column("re_pre", Numeric(4, 2), doc="% de RE de la cabecera del presupuesto")
+    financial_receipt = Column("rfi_pre", Numeric(4, 2), doc="Recargo Financiero")
+    item_sales_valuation = Column("scaa_pre", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    labor_sales_valuation = Column("scam_pre", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    service_sales_valuation = Column("scas_pre", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    create_subcategories_in_acceptance = Column("Sepa_pre", Boolean, doc="Crear subpartidas en la aceptación")
+    status = Column("sit_pre", String(1), doc="Situación del Presupuesto")
+    margin_valuation = Column("siv_pre", Boolean, doc="Sistema de Valoración Venta/Coste")
+    floor_occupancy_support = Column("socp_pre", Numeric(10, 2), doc="Superficie Ocupada en Planta (m2)")
+    solar_supplier = Column("ssol_pre", Numeric(10, 2), doc="Superficie del Solar (m2)")
+    construction_total_cost = Column("stco_pre", Numeric(10, 2), doc="Superficie Total Construida (m2)")
+    total_construction_reasons_support = Column("stcr_pre", Numeric(10, 2), doc="Superficie Total Construida Sobre Rasante (m2)")
+    header_text = Column("tcab_pre", String(1200), doc="Texto Cabecera de Presupuesto")
+    conditions = Column("tcon_pre", String(1200), doc="Texto de Condiciones")
+    phone_number = Column("tel_pre", String(18), doc="Teléfono del Cliente")
+    billing_type = Column("tfa_pre", String(2), doc="Tipo de Facturación")
+    mo_induced = Column("tind_pre", Boolean, doc="Informar si se utilizarán MO en las Partidas")
+    discount_type = Column("tip_cli", Integer, doc="Tipo de Descuento a aplicar al cliente")
+    typology = Column("tlog_pre", String(18), doc="Tipología del Edificio")
+    project_type_r_136 = Column("tobr_pre", String(1), doc="Tipo de Obra para Revisión")
+    volume = Column("tomo_pre", String(18), doc="Tomo Registro")
+    total_raee_target_amount = Column("torae_pre", Numeric(11, 2), doc="Total Importe Objetivo RAEE")
+    coordinator_degree = Column("toss_pre", String(55), doc="Titulación del Coordinador Seguridad Salud")
+    total_budget = Column("tot_pre", Numeric(12, 2), doc="Importe Total del Presupuesto")
+    article_cost_plan = Column("Tpca_pre", Numeric(14, 5), doc="Total Coste Planificado de Articulos")
+    subcontracting_cost_plan = Column("Tpcb_pre", Numeric(14, 5), doc="Total Coste Planificado Subcontratado")
+    labor_cost_budget = Column("Tpcm_pre", Numeric(14, 5), doc="Total Coste Planificado de Mano de Obra")
+    cost_center_concept_plan = Column("Tpcp_pre", Numeric(14, 5), doc="Total Coste Planificado de Concepto de Coste")
+    machine_planned_cost = Column("Tpcq_pre", Numeric(14, 5), doc="Total Coste Planificado de Maquinaria")
+    service_cost_plan = Column("Tpcs_pre", Numeric(14, 5), doc="Total Coste Planificado de Servicios")
+    cost_budget = Column("Tpc_pre", Numeric(14, 5), doc="Total Coste Planificado")
+    total_planned_hours = Column("Tph_pre", Numeric(9, 3), doc="Total Horas Planificadas")
+    footer_text = Column("tpie_pre", String(1200), doc="Texto de Pie de Presupuesto")
+    tv_sim_card_article_plan = Column("Tpsca_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada de Artículo")
+    subcontracting_plan = Column("Tpscb_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada  de Subcont")
+    tv_simc_mo_plan = Column("Tpscm_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada  de M.O.")
+    machine_planning = Column("Tpscq_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada Maquinaria")
+    tv_simc_service_plan = Column("Tpscs_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento")
+    tv_simc_plan = Column("Tpsc_pre", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada")
+    tv_simple_article_planning = Column("Tpspa_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificada de Artículos")
+    subcontracting_plan_r_88 = Column("Tpspb_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificada  de Subcontratación")
+    tv_simple_mobile_plan = Column("Tpspm_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificada  de Mano Obra")
+    tv_simple_machine_production_plan = Column("Tpspq_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificada  de Maquinaria")
+    tv_simple_service_plan = Column("Tpsps_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificada de Servicios")
+    tv_simple_plan = Column("Tpsp_pre", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados")
+    sales_item_plan = Column("Tpva_pre", Numeric(11, 2), doc="Total Venta Planificada de Articulos")
+    subcontracting_sales_order_plan = Column("Tpvb_pre", Numeric(11, 2), doc="Total Venta  Planificada  de Subcontratación")
+    sales_order_labor_cost = Column("Tpvm_pre", Numeric(11, 2), doc="Total Venta Planificada de Mano de Obra")
+    machine_rental_sales = Column("Tpvq_pre", Numeric(11, 2), doc="Total Venta  Planificada  de Maquinaria")
+    service_sales_plan = Column("Tpvs_pre", Numeric(11, 2), doc="Total Venta Planificada de Servicios")
+    sales_plan = Column("Tpv_pre", Numeric(11, 2), doc="Total Venta Planificada")
+    total_planned_raee_amount = Column("Trae_pre", Numeric(11, 2), doc="Total Importe Planificado RAEE")
+    retention_percentage = Column("tre_pre", Numeric(4, 2), doc="Porcentaje de Retención")
+    health_and_safety_certification = Column("tss_pre", String(55), doc="Titulación del Autor del Estudio de Seguridad Salud")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Valor de la Divisa")
+    version = Column("ver_pre", Integer, doc="Código de versión del presupuesto")
+    source_version = Column("ver_preo", Integer, doc="Versión Origen de la Copia")
+
+
+class BudgetLines(ReadOnlyRow, LegacyBase):
+    """Líneas de Detalle de la Estructura de Capítulos y Partidas del Documento (gopresud)"""
+    __tablename__ = "gopresud"
+
+    accepted = Column("ace_ped", Boolean, doc="Línea Aceptada")
+    accumulate_cost = Column("acuc_ped", Boolean, doc="Acumular Coste de la Línea")
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    article_scope = Column("art_amb", Integer, doc="Ámbito del Artículo")
+    calculation_base = Column("bcal_ped", String(2), doc="Introduzca la Base de Cálculo")
+    request_quote_before_purchase_project = Column("cac_ped", Boolean, doc="¿Solicitar Cotización antes de Comprar (Obra)?")
+    formula_quantity = Column("caf_ped", Numeric(9, 3), doc="Cantidad de Unidad de Medida de la Fórmula")
+    calculation_base_field = Column("camc_ped", String(1), doc="Identifica campo a considerar para la base del concepto coste")
+    distribution_filter_field = Column("camr_ped", String(1), doc="Campo a considerar para ámbito reparto del concepto coste")
+    purchase_quantity = Column("canc_ped", Numeric(9, 3), doc="Cantidad de Compra de la Línea del Detalle")
+    quantity = Column("can_ped", Numeric(12, 6), doc="Cantidad de la Línea del Detalle")
+    encoded = Column("cdf_ped", Boolean, doc="Indica si la línea está Correctamente Codificada")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopresud", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopresud", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopresud", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopresud", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    induced_cost = Column("cind_ped", Numeric(11, 2), doc="Coste Inducido de la Mano de Obra")
+    line_item_classification = Column("cll_ped", String(2), doc="Clasificador Particular de Líneas")
+    decomposed_identifier = Column("codhd_ped", Integer, doc="Identificador único del Registro Partida del Descompuesto")
+    composite_identifier = Column("codh_pec", Integer, doc="Identificador Compuesto")
+    identifier = Column("codh_pes", Integer, doc="Identificador único del Capítulo dentro del Presupuesto")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad")
+    item = Column("cod_art", String(24), doc="Código de Artículo de la Línea del Detalle de la Partida")
+    cost_concept = Column("cod_ccs", Integer, doc="Concepto de Coste")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    hour_type = Column("cod_hora", Integer, doc="Tipo de Hora de la Mano de Obra")
+    vat = Column("cod_iva", Integer, doc="Código del Tipo de IVA del Detalle de la Partida")
+    source_book = Column("cod_olb", Integer, doc="Código del Origen de Librería")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    supplier = Column("cod_pro", Integer, doc="Código del Proveedor de la Condición de Compra")
+    subactivity = Column("cod_sac", Integer, doc="Código de Subactividad")
+    currency = Column("cod_sas", String(3), doc="Código de Divisa de la Condición de Compra")
+    sales_packaging = Column("cod_uea", String(2), doc="Código de la Unidad de Embalaje de Venta")
+    purchase_packaging = Column("cod_ueac", String(2), doc="Código de la Unidad de Embalaje de Compra")
+    unit_of_measurement = Column("cod_um", String(2), doc="Código de la Unidad de Medida de la Fórmula")
+    copy_import = Column("coi_ped", Boolean, doc="Copia o Importación")
+    structure_cost = Column("cose_ped", Numeric(14, 5), doc="Coste de Estructura")
+    cost_cost_concept_cost_amount = Column("cosr_ped", Numeric(14, 5), doc="Coste Repercutido de la Línea del")
+    unit_cost = Column("cost_ped", Numeric(14, 5), doc="Coste Total de la Línea de la Partida")
+    base_cost = Column("cos_ped", Numeric(14, 5), doc="Coste de la Línea del Detalle de la Partida")
+    quantity_u_e_c = Column("cueac_ped", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Compra")
+    quantity_u_e_v = Column("cueav_ped", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Venta")
+    extended_description = Column("dea_ped", String(800), doc="Descripción Ampliada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopresud", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopresud", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopresud", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopresud", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_ped", String(800), doc="Descripción de la Línea del Detalle de la Partida")
+    discount_c1 = Column("dtc1_ped", Numeric(4, 2), doc="Descuento 1 de la Condición de Compra")
+    c2_discount = Column("dtc2_ped", Numeric(4, 2), doc="Descuento 2 de la Condición de Compra")
+    c3_discount = Column("dtc3_ped", Numeric(4, 2), doc="Descuento 3 de la Condición de Compra")
+    discount_v1 = Column("dtv1_ped", Numeric(4, 2), doc="Descuento 1 de la Condición de Venta")
+    discount_v2 = Column("dtv2_ped", Numeric(4, 2), doc="Descuento 2 de la Condición de Venta")
+    discount_v3 = Column("dtv3_ped", Numeric(4, 2), doc="Descuento 3 de la Condición de Venta")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    excluded_generic_coding = Column("exc_ped", Boolean, doc="Indica si línea excluida en codificación de artículos genéricos")
+    fiedbc_factor = Column("fac_ped", Numeric(5, 2), doc="Factor FIEDBC")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopresud", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopresud", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gopresud", Date, doc="fecha3Tlmp")
+    filter_by = Column("filc_ped", String(24), doc="Filtrar por")
+    filter_by_r_174 = Column("filr_ped", String(24), doc="Filtrar por")
+    tool = Column("her_ped", Boolean, doc="Herramienta")
+    induced_amount = Column("iind_ped", Numeric(11, 2), doc="Importe Inducido de la Mano de Obra")
+    line_amount = Column("imp_ped", Numeric(11, 2), doc="Importe de la Línea del Detalle de la Partida")
+    increase = Column("inc_ped", Numeric(5, 2), doc="Incremento aplicado en Condición de Venta")
+    generate_auto_part = Column("ins_ped", Boolean, doc="Generar Parte Automático")
+    copy_import_r_836 = Column("ioc_ped", Boolean, doc="Copia o Importación")
+    weee_amount = Column("iraee_ped", Numeric(12, 3), doc="Importe de RAEE de la Línea del Detalle de la Partida")
+    vat_percentage = Column("iva_ped", Integer, doc="% de IVA del Detalle de la Partida")
+    ivci_ped = Column("ivci_ped", Numeric(11, 2), doc="Importe Valoración Venta Simulación a Coste más Incremento")
+    sales_tax = Column("ivpd_ped", Numeric(11, 2), doc="Importe Valoración Venta Simulación con Precio menos Descuento")
+    subcontracted_line = Column("lins_ped", Integer, doc="Número de la Línea del Detalle dentro de la Partida que está su")
+    line = Column("lin_ped", Integer, doc="Número de la Línea del Detalle dentro de la Partida")
+    gocatalog_link = Column("lnk_ped", String(200), doc="Link GoCatalog")
+    reason_for_non_allocation = Column("mnim_ped", String(3), doc="Motivo de la No Imputación")
+    non_chargeable_line = Column("nim_ped", Boolean, doc="Línea No Imputable")
+    name = Column("nom_mar", String(40), doc="Nombre de la Marca")
+    cost_origin = Column("ocos_ped", String(1), doc="Origen del Coste")
+    order = Column("ord_pec", Integer, doc="Orden de la L?nea del Detalle dentro del Compuesto")
+    order_r_835 = Column("ord_ped", Integer, doc="Orden de la Línea del Detalle dentro de la Partida")
+    current_budget = Column("pac_ped", Boolean, doc="Capítulo Creado en el Presupuesto Actual")
+    item_percentage = Column("par_ped", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Artículo")
+    cost_concept_percentage = Column("pcc_ped", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Cpto. Coste")
+    structure_cost_percentage = Column("pce_ped", Numeric(4, 2), doc="Porcentaje de Coste de Estructura")
+    induced_price = Column("pind_ped", Numeric(12, 3), doc="Precio Inducido de la Mano de Obra")
+    labor_percentage = Column("pmo_ped", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a la Mano de Obra")
+    purchase_price = Column("prec_ped", Numeric(12, 3), doc="Precio de Compra por Unidad de Embalaje de Compra")
+    selling_price = Column("prev_ped", Numeric(12, 3), doc="Precio de Venta por Unidad de Emb. de Venta")
+    supplier_scope = Column("pro_amb", Integer, doc="Ámbito del Proveedor")
+    service_percentage = Column("pse_ped", Numeric(5, 2), doc="Porcentaje Aplicable como Concepto a las Líneas de Servicios")
+    weee_waste_electrical_and_electronic_equipment = Column("raee_ped", Boolean, doc="Indica si se Aplicará el RAEE en la Línea Detalle de la Partida")
+    product_representative = Column("rar_ped", Boolean, doc="Reparto Líneas de Artículo")
+    recalculable = Column("rec_ped", Boolean, doc="Indica si la Línea será Recalculable")
+    external_reference = Column("refe_ped", String(20), doc="Refrencia Externa de la Librería")
+    manufacturer_reference = Column("ref_art", String(24), doc="Referencia Fabricante del Artículo")
+    distribution_scope = Column("rep_ped", String(2), doc="Ámbito de Reparto")
+    equivalence_surcharge_percentage = Column("re_ped", Numeric(4, 2), doc="% de RE del Detalle de la Partida")
+    labor_representative = Column("rmo_ped", Boolean, doc="Reparto Líneas de Mano de Obra")
+    service_representative = Column("rse_ped", Boolean, doc="Reparto Líneas de Servicio")
+    sales_valuation = Column("scal_ped", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    subcontractor = Column("sub_ped", Boolean, doc="Indica si la Línea está Subcontratada")
+    total_line_quantity = Column("tcan_ped", Numeric(15, 6), doc="Cantidad Total por Línea")
+    induced_mo_manufacturing_order = Column("tind_ped", Boolean, doc="Si Linea de M.O es generada autom. para los T.Inducidos de Arti")
+    installation_time = Column("tins_ped", Numeric(9, 3), doc="Tiempo de Instalación")
+    category = Column("tipo_op", Integer, doc="Categoría de la Mano de Obra")
+    type = Column("tip_ped", String(2), doc="Tipo")
+    line_type = Column("tli_ped", String(1), doc="Tipo de Línea del Detalle de la Partida")
+    line_type_r_761 = Column("tli_ped2", String(1), doc="Tipo de Línea del Detalle de la Partida")
+    transfer_to_project = Column("tobr_ped", Boolean, doc="Traspasar a Obra")
+    subcontracting_type = Column("tsub_ped", String(3), doc="Tipo Subcontratación")
+    version = Column("ver_pre", Integer, doc="Código de Versión del Presupuesto")
+
+
+class BudgetStructures(LegacyBase):
+    """Estructura de Capítulos y Partidas del Documento de Presupuestos de Obra (gopresue)"""
+    __tablename__ = "gopresue"
+
+    accepted = Column("ace_pes", Boolean, doc="Estructura Aceptada")
+    apply_predefined_discounts = Column("adec_pes", Boolean, doc="Aplicar Dtos. Predefinidos para Coste + Incremento")
+    discount_application = Column("ades_pes", String(1), doc="Forma de Aplicar Descuentos.")
+    attachments = Column("adj_pes", Boolean, doc="Documentos adjuntos asociados")
+    attachment = Column("ane_pre", Integer, doc="Código del Anexo del Presupuesto")
+    item_scope = Column("art_amb", Integer, doc="Ámbito de Artículos")
+    quantity = Column("can_pes", Numeric(9, 3), doc="Cantidad de Capítulo")
+    total_quantity = Column("cat_pes", Numeric(10, 3), doc="Cantidad Total del Capítulo")
+    certify = Column("cert_pes", Boolean, doc="Certificar a este nivel")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopresue", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopresue", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopresue", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopresue", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    chapter = Column("cla_pes", String(27), doc="Clave del Capítulo y Orden")
+    item_classification_lines = Column("cll_pes", String(2), doc="Clasificador Particular de Líneas")
+    identifier = Column("codh_pes", Integer, doc="Identificador único del Capítulo dentro del Presupuesto")
+    parent_id = Column("codp_pes", Integer, doc="Id. del Cap. Padre dentro de la estructura recursiva del Presup")
+    activity = Column("cod_acto", Integer, doc="Código de Actividad")
+    subcontracted_service = Column("cod_art", String(24), doc="Servicio de Subcontratacion relacionado con la partida")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    quality_document = Column("cod_docm", String(10), doc="Código de Documento de Calidad")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    bookstore = Column("cod_lib", String(24), doc="Código de Librería/Unidad de Obra")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    subactivity = Column("cod_sac", Integer, doc="Código de SubActividad")
+    item_code = Column("Cod_tpa", String(2), doc="Código de Tipo de Partida")
+    unit_of_measure = Column("cod_um", String(2), doc="Código de Unidad de Medida")
+    contains_compound = Column("com_pes", Boolean, doc="Indica si la partida contiene un Compuesto")
+    objective_cost = Column("coso_pes", Numeric(14, 5), doc="Coste Objetivo")
+    extended_description = Column("dea_pes", String(800), doc="Descripción Ampliada")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopresue", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopresue", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopresue", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopresue", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    breakdown = Column("desc_pes", Boolean, doc="Indica si la agrupación es un descompuesto")
+    description = Column("des_pes", String(200), doc="Descripción del Capítulo")
+    item_discount_2 = Column("dpra2_pes", Numeric(4, 2), doc="Descuento 2 Predefinido para Artículos")
+    item_discount_3 = Column("dpra3_pes", Numeric(4, 2), doc="Descuento 3 Predefinido para Artículos")
+    item_discounts = Column("dpra_pes", Numeric(4, 2), doc="Descuento 1 Predefinido para Artículos")
+    subcontracting_discount_2 = Column("dprb2_pes", Numeric(4, 2), doc="Descuento 2 Predefinido para Subcontrataciones")
+    subcontracting_discount_3 = Column("dprb3_pes", Numeric(4, 2), doc="Descuento 3 Predefinido para Subcontrataciones")
+    subcontracting_discounts = Column("dprb_pes", Numeric(4, 2), doc="Descuento 1 Predefinido para Subcontratación")
+    tool_discounts = Column("dprh_pes", Numeric(4, 2), doc="Descuento 1 Predefinido para Herramientas")
+    labor_discount_second_hand = Column("dprm2_pes", Numeric(4, 2), doc="Descuento 2 Predefinido para Mano de Obra")
+    labor_discount_3 = Column("dprm3_pes", Numeric(4, 2), doc="Descuento 3 Predefinido para Mano de Obra")
+    labor_discounts = Column("dprm_pes", Numeric(4, 2), doc="Descuento 1 Predefinido para Mano de Obra")
+    service_discount_2 = Column("dprs2_pes", Numeric(4, 2), doc="Descuento 2 Predefinido para Servicios")
+    service_discount_3 = Column("dprs3_pes", Numeric(4, 2), doc="Descuento 3 Predefinido para Servicios")
+    service_discounts = Column("dprs_pes", Numeric(4, 2), doc="Descuento 1 Predefinido para Servicios")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_status = Column("edic_pes", String(3), doc="Estado de Edición")
+    exportable_fiebdc = Column("Exf_pes", Boolean, doc="Informa si la Partida seá exportable a Formato FIEBDC")
+    fiedbc_factor = Column("fac_pes", Numeric(5, 2), doc="Factor FIEDBC")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopresue", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopresue", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gopresue", Date, doc="fecha3Tlmp")
+    end_date = Column("fef_pes", Date, doc="Fecha de Finalización del Capítulo/Partida")
+    start_date = Column("fei_pes", Date, doc="Fecha de Inicio del Capítulo/Partida")
+    increase_items = Column("icra_pes", Numeric(5, 2), doc="Incremento Inicial para Artículos. Valor Inicializador.")
+    subcontracting_increment = Column("icrb_pes", Numeric(5, 2), doc="Incremento Predefinido para Subcontratación")
+    tool_increment = Column("icrh_pes", Numeric(5, 2), doc="Incremento Predefinido para Herramientas")
+    labor_cost_increase = Column("icrm_pes", Numeric(5, 2), doc="Incremento Inicial para Mano de Obra. Valor Inicializador")
+    service_increment = Column("icrs_pes", Numeric(5, 2), doc="Incremento Predefinido para Servicios")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    maximum_amount = Column("impm_pes", Numeric(11, 2), doc="Importe Máximo Orientativo")
+    target_amount = Column("impo_pes", Numeric(11, 2), doc="Importe de Venta Objetivo")
+    percentage_increase = Column("inc_pes", Numeric(5, 2), doc="% Incremento de la Agrupación")
+    induced_time = Column("ind_pes", Boolean, doc="Indica si se aplica Tiempo Inducido sobre las Partidas")
+    copy_import = Column("ioc_pes", Boolean, doc="Copia o Importación")
+    raee_target_amount = Column("Iorae_pes", Numeric(11, 2), doc="Importe Objetivo RAEE")
+    target_margin_percentage = Column("maro_pes", Numeric(5, 2), doc="% Margen Objetivo")
+    non_billable = Column("nim_pes", Boolean, doc="No Imputable")
+    level = Column("niv_pes", Integer, doc="Nivel del Capítulo")
+    cost_origin = Column("ocos_pes", String(1), doc="Origen del Coste. Valor Inicializador")
+    current_budget = Column("pac_pes", Boolean, doc="Capítulo Creado en el Presupuesto Actual")
+    item_number = Column("par_pes", Boolean, doc="Identifica si el Capítulo es una Partida con Detalle")
+    term = Column("pla_pes", Numeric(7, 2), doc="Plazo en Días")
+    apply_weee = Column("raee_pes", Boolean, doc="Informar si se aplicará RAEE. Valor Inicializador para Líneas")
+    yield_percentage = Column("rdto_pes", Numeric(5, 2), doc="% Rendimiento de la Agrupación")
+    recalculable = Column("rec_pes", Boolean, doc="Indica si la línea será recalculable. Valor Inicializador.")
+    external_reference = Column("refe_pes", String(20), doc="Referencia Externa del Capítulo")
+    internal_reference = Column("refi_pes", String(20), doc="Referencia Interna del Capítulo")
+    item_sales_valuation = Column("scaa_pes", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    sales_valuation = Column("scam_pes", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    service_sales_valuation = Column("scas_pes", String(1), doc="Sistema Inicial de Valoración de la Venta")
+    subcontracted = Column("sub_pes", Boolean, doc="Partida Subcontratada")
+    induced_mo_manufacturing_order = Column("tind_pes", Boolean, doc="Informar si se utilizarán MO Inducida en las Partidas")
+    objective_cost_r_901 = Column("toc_pes", Numeric(14, 5), doc="Total Coste Objetivo")
+    total_raee_target_amount = Column("Torae_pes", Numeric(11, 2), doc="Total Importe Objetivo RAEE")
+    sales_object = Column("tov_pes", Numeric(11, 2), doc="Total Venta Objetivo")
+    item_cost = Column("tpca_pes", Numeric(14, 5), doc="Total Coste Planificado de Artículos")
+    subcontracted_cost = Column("tpcb_pes", Numeric(14, 5), doc="Total Coste Planificado de Subcontratado")
+    labor_cost = Column("tpcm_pes", Numeric(14, 5), doc="Total Coste Planificado de Mano de Obra")
+    cost_center_expense = Column("tpcp_pes", Numeric(14, 5), doc="Total Coste Planificado de Conceptos de Coste")
+    machine_cost_plan = Column("tpcq_pes", Numeric(14, 5), doc="Total Coste Planificado de Maquinaria")
+    service_cost = Column("tpcs_pes", Numeric(14, 5), doc="Total Coste Planificado de Servicios")
+    plan_cost = Column("tpc_pes", Numeric(14, 5), doc="Total Coste Planificado")
+    planned_hours = Column("tph_pes", Numeric(9, 3), doc="Total Horas Planificadas")
+    sales_ci_items = Column("tpsca_pes", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada de Artículo")
+    subcontracted_sales_ci = Column("tpscb_pes", Numeric(11, 2), doc="Total Vta. Simulación Coste+Incremento Plan. de Subcontratación")
+    sales_labor_cost = Column("tpscm_pes", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada Mano Obra")
+    machine_planning = Column("tpscq_pes", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada Maquinaria")
+    sales_ci_services = Column("tpscs_pes", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada de Servicio")
+    sales_ci = Column("tpsc_pes", Numeric(11, 2), doc="Total Venta Simulación Coste+Incremento Planificada")
+    sales_product_delivery = Column("tpspa_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados Artículos")
+    subcontracted_sales_order = Column("tpspb_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados de Subcontratación")
+    labor_sales = Column("tpspm_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados Mano de Obra")
+    tv_simple_machine_production_plan = Column("tpspq_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados de Maquinaria")
+    service_sales = Column("tpsps_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados Servicios")
+    sales_order = Column("tpsp_pes", Numeric(11, 2), doc="Total Venta Simulación PVP-DTOS Planificados")
+    item_sales = Column("tpva_pes", Numeric(14, 5), doc="Total Venta Planificada de Artículos")
+    subcontracted_sale = Column("tpvb_pes", Numeric(11, 2), doc="Total Venta Planificada de Subcontratación")
+    labor_sale = Column("tpvm_pes", Numeric(11, 2), doc="Total Venta Planificada de Mano Obra")
+    machinery_sales = Column("tpvq_pes", Numeric(11, 2), doc="Total Venta Planificada de Maquinaria")
+    service_sale = Column("tpvs_pes", Numeric(11, 2), doc="Total Venta Planificada de Servicios")
+    sales_plan = Column("tpv_pes", Numeric(11, 2), doc="Total Venta Planificada")
+    total_planned_raee_amount = Column("trae_pes", Numeric(11, 2), doc="Total Importe Planificado RAEE")
+    version = Column("ver_pre", Integer, doc="Código de la Versión del Presupuesto")
+
+
+class BudgetActions(ReadOnlyRow, LegacyBase):
+    """Relación de Acciones Realizadas en un Presupuesto de Obras (gopretap)"""
+    __tablename__ = "gopretap"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopretap", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopretap", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopretap", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopretap", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    action_type = Column("cod_tap", Integer, doc="Código del Tipo de Acción en Presupuesto")
+    user = Column("cod_usu", String(8), doc="Usuario que realiza la Acción")
+    additional_data = Column("dat_tapp", String(40), doc="Dato Adicional Informativo de la Acción")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopretap", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopretap", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopretap", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopretap", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopretap", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopretap", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gopretap", Date, doc="fecha3Tlmp")
+    date_and_time = Column("fec_tapp", DateTime, doc="Fecha y Hora de Realización de la Acción")
+    number = Column("num_tapp", Integer, doc="Número de Acción Realizada sobre el Presupuesto")
+    version = Column("ver_pre", Integer, doc="Código de versión del presupuesto")
+
+
+class BudgetAddresses(ReadOnlyRow, LegacyBase):
+    """Direcciones Asociadas con cada Presupuesto de Obras (gopretdr)"""
+    __tablename__ = "gopretdr"
+
+    attachment = Column("ane_pre", Integer, doc="Código de Anexo del Presupuesto")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gopretdr", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gopretdr", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gopretdr", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gopretdr", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    company = Column("cod_ent", Integer, doc="Cógido de Empresa")
+    country = Column("cod_pai", String(2), doc="Código del País de la Dirección")
+    estimate = Column("cod_pre", Integer, doc="Código de Presupuesto")
+    province = Column("cod_provi", Integer, doc="Código de Provincia de la Dirección del Presupuesto")
+    address = Column("cod_tdp", Integer, doc="Código de Dirección del Presupuesto")
+    address_type = Column("cod_tdr", Integer, doc="Código del Tipo de Dirección")
+    address_line = Column("cod_via", String(2), doc="Tipo de Vía de la Dirección del Presupuesto")
+    neighborhood = Column("col_tdp", String(60), doc="Colonia de la Direcci?n del Presupuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gopretdr", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gopretdr", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gopretdr", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gopretdr", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    address_r_380 = Column("dir_tdp", String(55), doc="Dirección del Presupuesto")
+    postal_code = Column("dpo_tdp", Integer, doc="Código Postal de la Dirección del Presupuesto")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    email = Column("ema_tdp", String(60), doc="e-mail de la Dirección del Presupuesto")
+    fax = Column("fax_tdp", String(18), doc="Fax de la Dirección del Presupuesto")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gopretdr", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gopretdr", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gopretdr", Date, doc="fecha3Tlmp")
+    mobile_phone = Column("mov_tdp", String(12), doc="Teléfono móvil de la Dirección del Presupuesto")
+    name = Column("nom_tdp", String(55), doc="Nombre de la Dirección del Presupuesto")
+    number = Column("num_tdp", String(4), doc="Número de la Vías de la Dirección del Presupuesto")
+    contact_person = Column("pco_tdp", String(55), doc="Persona de Contacto del Presupuesto")
+    city = Column("pob_tdp", String(30), doc="Población de la Dirección del Presupuesto")
+    business_name = Column("raz_tdp", String(100), doc="Razón Social de la Dirección")
+    phone_number = Column("tel_tdp", String(18), doc="Teléfono de la Dirección del Presupuesto")
+    version = Column("ver_pre", Integer, doc="Código de versión del presupuesto")
+
+
+class TypeAddresses(ReadOnlyRow, LegacyBase):
+    """Maestro de los Diferentes Tipos de Direcciones que Pueden ser Utilizados (gotipdir)"""
+    __tablename__ = "gotipdir"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotipdir", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotipdir", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotipdir", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotipdir", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    address_type = Column("cod_tdr", Integer, doc="Código del Tipo de Dirección")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotipdir", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotipdir", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gotipdir", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_841 = Column("dec4_gotipdir", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tdr", String(40), doc="Descripción del Tipo de Dirección")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotipdir", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotipdir", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gotipdir", Date, doc="fecha3Tlmp")
+    create_automatically = Column("mkd_tdr", Boolean, doc="Indica si se Creará esta Dirección al Crear un Presupuesto")
+
+
+class WorkTypes(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Partidas (gotippar)"""
+    __tablename__ = "gotippar"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotippar", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotippar", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotippar", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotippar", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    item_type = Column("cod_tpa", String(2), doc="Código de Tipo de Partida")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotippar", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotippar", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gotippar", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_844 = Column("dec4_gotippar", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tpa", String(30), doc="Descripción del Tipo de Partida")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotippar", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotippar", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gotippar", Date, doc="fecha3Tlmp")
+
+
+class BudgetTypes(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Presupuestos (gotippre)"""
+    __tablename__ = "gotippre"
+
+    article_scope = Column("art_amb", Integer, doc="Ambito Artículo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotippre", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotippre", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotippre", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotippre", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    item = Column("cod_art", String(24), doc="Artículo")
+    budget_type = Column("cod_tipp", Integer, doc="Tipo de Presupuesto")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotippre", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotippre", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gotippre", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_918 = Column("dec4_gotippre", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tipp", String(60), doc="Descripción")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotippre", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotippre", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gotippre", Date, doc="fecha3Tlmp")
+    serial_number = Column("ser_tipp", Integer, doc="Nº Serie")
+
+
+class WorkingTypes(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Obras (gotobra)"""
+    __tablename__ = "gotobra"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotobra", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotobra", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotobra", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotobra", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    cost_center = Column("cod_cco", Integer, doc="Centro de Coste")
+    cost_center_r_943 = Column("cod_sco", Integer, doc="Subcentro de Coste")
+    project_type = Column("cod_tobr", Integer, doc="Código de Tipo de Obra")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotobra", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotobra", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gotobra", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gotobra", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_tobr", String(25), doc="Descripción del Tipo de Obra")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotobra", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotobra", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_gotobra", Date, doc="fecha3Tlmp")
+    serial_number = Column("ser_tobr", Integer, doc="Nº Serie")
+
+
+class WorkShipments(LegacyBase):
+    """Cabecera del Documento de Envío de Material a Obra (gotrasic)"""
+    __tablename__ = "gotrasic"
+
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotrasic", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotrasic", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotrasic", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotrasic", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    branch = Column("cod_del", Integer, doc="Código de Delegación")
+    employee = Column("cod_empl", Integer, doc="Código de Empleado Responsable del Transporte")
+    company = Column("cod_ent", Integer, doc="Código de Empresa")
+    document = Column("cod_moc", Integer, doc="Código de Documento")
+    project = Column("cod_obr", Integer, doc="Código de Obra")
+    carrier = Column("cod_tra", Integer, doc="Código de Transportista")
+    user = Column("cod_usu", String(8), doc="Código del Usuario que ha generado la Obra")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotrasic", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotrasic", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_gotrasic", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_gotrasic", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotrasic", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotrasic", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gotrasic", Date, doc="fecha3Tlmp")
+    date = Column("fec_moc", Date, doc="Fecha de Creación del Documento")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    printed = Column("imp_moc", Boolean, doc="Informa si el documento está impreso")
+    notes = Column("obs_moc", String(800), doc="Observaciones del Documento")
+    reference = Column("ref_moc", String(20), doc="Referencia del Documento")
+    movement_type = Column("tip_moc", String(1), doc="(T)rasiego, (D)evolución Obra, Destino (O)bra, (A)bono Obra")
+    transportation = Column("tra_moc", Boolean, doc="Tipo de Transporte: (E)mpleado ó (T)ransportista")
+    employee_r_761 = Column("xcod_emplt", Integer, doc="Código de Empleado")
+
+
+class WorkShipmentLines(ReadOnlyRow, LegacyBase):
+    """Detalle del Documento de Envío de Material a Obra (gotrasil)"""
+    __tablename__ = "gotrasil"
+
+    purchase_order_purchase_agreement = Column("aoo_oprt", String(1), doc="Parte de Administración u Obra")
+    article_scope = Column("art_amb", Integer, doc="Ámbito de Artículo")
+    quantity = Column("can_mol", Numeric(10, 3), doc="Cantidad")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gotrasil", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gotrasil", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gotrasil", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gotrasil", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa A")
+    warehouse = Column("cod_alm", Integer, doc="Código de Almacén")
+    warehouse_r_996 = Column("cod_almd", Integer, doc="Código de Almacén Destino del Artículo")
+    item = Column("cod_art", String(24), doc="Código de Artículo")
+    branch = Column("cod_defp", Integer, doc="Código de Delegación")
+    branch_r_542 = Column("cod_del", Integer, doc="Código de la delegación")
+    company = Column("cod_ent", Integer, doc="Código de la empresa a la que pertenece el documento")
+    brand_code = Column("cod_mar", Integer, doc="Código de Marca")
+    shipment = Column("cod_moc", Integer, doc="Código de documento de Envío")
+    part = Column("cod_oprt", Integer, doc="Parte de la Obra")
+    eu_european_union = Column("cod_uea", String(2), doc="Código de Unidad de Embalaje")
+    area = Column("cod_zon", String(1), doc="Código de Zona")
+    area_r_34 = Column("cod_zond", String(1), doc="Código de Zona Destino del Artículo")
+    cost = Column("cos_mol", Numeric(13, 5), doc="Coste de la Línea del Detalle")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gotrasil", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gotrasil", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gotrasil", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_791 = Column("dec4_gotrasil", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("det_art", String(800), doc="Descripción del Artículo")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gotrasil", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gotrasil", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gotrasil", Date, doc="fecha3Tlmp")
+    purchase_delivery_note_line = Column("lin_all", Integer, doc="Línea del Albarán de Compra")
+    line_number = Column("lin_mol", Integer, doc="Código de la línea")
+    license_plate = Column("mat_bob", String(20), doc="Matrícula del Artículo")
+    purchase_delivery_note = Column("num_alc", Integer, doc="Número de Albarán de Compra")
+    destination_warehouse_movement_number = Column("num_almd", Integer, doc="Número de movimiento de Almacén Destino")
+    origin_warehouse_movement_number = Column("num_almo", Integer, doc="Número de Movimiento de Almacén de Origen")
+    box_number = Column("num_caj", String(20), doc="Número de Caja del Artículo")
+    purchase_invoice = Column("num_fcc", Integer, doc="Número de Factura")
+    lot = Column("num_lot", String(20), doc="Número del Lote del Artículo")
+    pallet = Column("num_pal", String(20), doc="Número de Palet del Artículo")
+    serial_number = Column("num_ser", String(40), doc="Número de Serie del Artículo")
+    order = Column("ord_mol", Integer, doc="Orden de la línea")
+    reference = Column("ref_art", String(24), doc="Referencia de Fabricante del Artículo")
+    line_type = Column("tip_mol", String(1), doc="Tipo de Línea (A)rtículo (T)exto")
+    text = Column("txt_mol", String(800), doc="Texto de la Línea")
+    location = Column("ubi_art", String(13), doc="Ubicación del Artículo")
+    location_r_484 = Column("ubi_artd", String(13), doc="Ubicación Destino del Artículo")
+
+
+class WorkingpartsHours(ReadOnlyRow, LegacyBase):
+    """Imputación de horas (gpimphor)"""
+    __tablename__ = "gpimphor"
+
+    purchase_order_purchase_agreement = Column("aoo_oprt", String(1), doc="Parte de Obra o de Administración")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_gpimphor", String(100), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_gpimphor", String(100), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_gpimphor", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_gpimphor", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    company_1 = Column("cod_ab1", String(1), doc="Empresa 1")
+    branch = Column("cod_del", Integer, doc="Delegación")
+    employee = Column("cod_empl", Integer, doc="Empleado Responsable")
+    company = Column("cod_ent", Integer, doc="Empresa")
+    hour_type = Column("cod_hora", Integer, doc="Tipo de Hora")
+    work_order = Column("cod_oot", Integer, doc="Número de OT")
+    part_line_id = Column("cod_oprl", Integer, doc="Id. Linea de parte a partir de secuencia")
+    part = Column("cod_oprt", Integer, doc="Parte")
+    allocation_identifier = Column("cod_pimp", Integer, doc="Identificador único de la imputación")
+    user = Column("cod_usu", String(8), doc="Logín (identificación) del usuario.")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_gpimphor", Numeric(11, 3), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_gpimphor", Numeric(11, 3), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_gpimphor", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_554 = Column("dec4_gpimphor", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_pimp", String(40), doc="Descripción de la imputación")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_gpimphor", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_gpimphor", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_gpimphor", Date, doc="fecha3Tlmp")
+    date = Column("fec_oprh", Date, doc="Fecha")
+    end_date = Column("fef_pimp", Date, doc="Fecha Final")
+    start_date = Column("fei_pimp", Date, doc="Fecha de Inicio")
+    movement_date = Column("fmo_pimp", DateTime, doc="Fecha y Hora de la imputación")
+    end_time = Column("hof_pimp", String(8), doc="Hora Final")
+    start_time = Column("hoi_oprh", String(5), doc="Hora de Inicio")
+    start_time_r_848 = Column("hoi_pimp", String(8), doc="Hora de inicio")
+    origin = Column("ori_pimp", String(3), doc="Origen de la entrada de datos")
+    reviewed = Column("rev_pimp", Boolean, doc="Imputación revisada por el administrador")
+    total_hours = Column("toh_pimp", Numeric(11, 3), doc="Total horas")
+
+
+class SalesDeliveryNote(LegacyBase):
+    """Cabecera del Documento de  Albaranes de Venta (gvalcab)"""
+    __tablename__ = "gvalcab"
+
+    has_attachments = Column("adj_alb", Boolean, doc="Documentos adjuntos asociados")
+    group_delivery_notes = Column("aga_alb", String(1), doc="Introduzca (S/N/R) Agrupar Albaranes ó (R) por Referencia")
+    advance_payment_amount = Column("ant_alb", Numeric(11, 2), doc="Introduzca Importe del Anticipo")
+    tax_base_1 = Column("bas_imp1", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [1]")
+    tax_base_2 = Column("bas_imp2", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [2]")
+    tax_base_3 = Column("bas_imp3", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [3]")
+    individual_parcels = Column("bin_alb", Integer, doc="Bultos Individuales")
+    is_locked = Column("blq_alb", Boolean, doc="Introduzca (SI/NO) el Albarán Está Bloqueado")
+    gross_amount = Column("bru_alb", Numeric(11, 2), doc="Introduzca el Importe Bruto del Albarán")
+    parcels = Column("bul_alb", Integer, doc="Introduzca el nº de Bultos.")
+    due_date_cadence = Column("cad_fpg", Integer, doc="Introduzca la Cadencia de Días entre Vencimientos")
+    cash_register_id = Column("caj_alb", Integer, doc="Introduzca el Número de Caja que Realiza la Venta")
+    include_in_statistics = Column("cal_est", String(1), doc="Contabiliza Estadisitcas")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el Ambito de Cliente")
+    merchandise_address_id = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Envío de Mercaderías")
+    shipping_address_id = Column("cod_cene", Integer, doc="Introduzca el Código de la Dirección de Envío")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca Código de Cliente")
+    delivery_terms = Column("cod_coe", String(3), doc="Introduzca Condición de Entrega")
+    invoicing_branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    billing_branch_id = Column("cod_delo", Integer, doc="Introduzca la Delegación que Gestiona Cobros")
+    deposit_id = Column("cod_depo", Integer, doc="Introduzca Nº de Depósito")
+    worker_id = Column("cod_empl", Integer, doc="Código del Empleado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    expedition_id = Column("cod_exc", Integer, doc="Expedición")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca la Forma de Pago para este Albarán")
+    message_id = Column("cod_msg", String(3), doc="Introduzca el Código del Mensaje Asociado al Albaran")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    shipping_country_id = Column("cod_pai_m", String(2), doc="Código de País")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    shipping_province_id = Column("cod_provi_m", Integer, doc="Código de la Provincia de la entrega")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante Asignado al Albarán")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa para este Albarán")
+    customer_contact_id = Column("cod_telc", Integer, doc="Introduzca Teléfono Activo.")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Transportista a Utilizar para este Albarán")
+    user_id = Column("cod_usu", String(8), doc="Código del Usuario")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    shipping_street_type = Column("cod_via_m", String(2), doc="Código de Vía")
+    commision_percent = Column("com_alb", Numeric(4, 2), doc="Valide ó Introduzca el % de Comisión")
+    is_confirmed = Column("con_alb", Boolean, doc="Introduzca S/N Está Conformado el Albarán")
+    cost = Column("cos_alb", Numeric(14, 5), doc="Introduzca Coste")
+    buyer_id = Column("c_cod_telc", String(10), doc="Indentificador de Comprador")
+    invoiced_advance_payment_branch_id = Column("daf_alb", Integer, doc="Intoduzca la Delegación del Anticipo Facturado")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    is_deductible = Column("ded_alb", Boolean, doc="Introduzca Si/No Remisión Deducible")
+    is_deposit = Column("depo_alb", Boolean, doc="Introduzca (SI/NO) el Albarán está Destinado a Depósito")
+    due_date_displacement = Column("des_fpg", Integer, doc="Introduzca el Número de Dias Hasta el Primer Vencimiento")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    shipping_street_name = Column("dir_mer", String(55), doc="Dirección de Entrega del Pedido")
+    debit_or_credit = Column("doc_alb", String(1), doc="Introduzca el Tipo de Docuento (F)actura (A)bono")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    shipping_postal_code = Column("dpo_mer", Integer, doc="Distrito Postal de la entrega")
+    prompt_payment_discount = Column("dpp_alb", Numeric(4, 2), doc="Introduzca +/- % Dto. P.Pago para el Albarán")
+    invoiced_advance_payment_bill_number = Column("eaf_alb", Integer, doc="Introduzca el Nº del Efecto del Anticipo Facturado")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    expedition_state = Column("eex_alb", String(1), doc="Introduzca el estado de la expedición")
+    sent_by_email = Column("ema_alb", Boolean, doc="Enviado por Email")
+    email = Column("ema_mer", String(60), doc="E-mail")
+    packaging_cost = Column("emb_alb", Numeric(8, 2), doc="Introduzca el valor del embalaje")
+    state = Column("esta_alb", String(1), doc="Estado del Albarán")
+    document_state = Column("est_alb", String(1), doc="(A)ceptado (P)endiente (R)echazado")
+    sales_state = Column("evt_alb", String(1), doc="Estado Venta")
+    has_expedition = Column("exp_alb", Boolean, doc="Tiene albarán de Expedición")
+    invoiced_advance_payment_invoice_id = Column("faf_alb", Integer, doc="Introduzca el Número de la Factura del Anticipo Facturado")
+    sent_by_fax = Column("fax_alb", Boolean, doc="Enviado por Fax")
+    fax = Column("fax_mer", String(18), doc="Fax de la dirección de entrega")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_alb", Date, doc="Introduzca la Fecha del Albarán")
+    shipping_date = Column("fec_env", Date, doc="Introduzca la Fecha de Envio al Cliente")
+    fixed_payment_date = Column("ffc_alb", Date, doc="Introduzca la Fecha de Cobro del Albarán")
+    is_signed = Column("fir_alb", Boolean, doc="Si/No el albarán tiene una firma asociada")
+    last_modified_date = Column("fum_alb", Date, doc="Fecha Última Modificación")
+    registration_time = Column("hor_alb", String(8), doc="Hora en la que se generó el albarán")
+    last_modified_time = Column("hum_alb", String(5), doc="Hora Última Modificación")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    has_fixed_payment_date = Column("iffc_alb", Boolean, doc="Introduzca (SI/NO) el Albarán tiene Fecha Cobro Fija")
+    vat_amount_1 = Column("iiv_alb1", Numeric(11, 2), doc="Importe del IVA [1]")
+    vat_amount_2 = Column("iiv_alb2", Numeric(11, 2), doc="Importe del IVA [2]")
+    vat_amount_3 = Column("iiv_alb3", Numeric(11, 2), doc="Importe del IVA [3]")
+    retention_base = Column("ipb_alb", Numeric(11, 2), doc="Introduzca la Base a la que se Aplica el % de IRPF")
+    pending_payment_amount = Column("ipc_alb", Numeric(11, 2), doc="Importe Pendiente de Cobro")
+    retention_rate = Column("ipf_alb", Numeric(4, 2), doc="Introduzca el % de IRPF a Aplicar en el  Albarán")
+    retention_amount = Column("ipi_alb", Numeric(9, 2), doc="Valide ó Introduzca el Importe del IRPF")
+    printed = Column("ipr_alb", Boolean, doc="Introduzca (SI/NO) el Albarán Está Impreso")
+    sales_equalization_amount_1 = Column("irq_alb1", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [1]")
+    sales_equalization_amount_2 = Column("irq_alb2", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [2]")
+    sales_equalization_amount_3 = Column("irq_alb3", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [3]")
+    vat_rate_1 = Column("iva_alb1", Numeric(4, 2), doc="Introduzca el % de IVA [1]")
+    vat_rate_2 = Column("iva_alb2", Numeric(4, 2), doc="Introduzca el % de IVA [2]")
+    vat_rate_3 = Column("iva_alb3", Numeric(4, 2), doc="Introduzca el % de IVA [3]")
+    pending_authorizations = Column("lcod_aut", String(40), doc="Autorizaciones Pendientes")
+    has_authorized_margins = Column("mau_alb", Boolean, doc="Márgenes Autorizados")
+    periodicity = Column("niv_alb", Integer, doc="Periodicidad")
+    sales_delivery_note_id = Column("num_alb", Integer, doc="Introduzca el Número del Albarán de Cliente")
+    notification_id = Column("num_avi", Integer, doc="Número de Aviso de Reparación")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    branch_delivery_note_id = Column("num_dec", Integer, doc="Introduzca el Número del Albarán de Delegación")
+    sales_invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    shipping_street_number = Column("num_mer", String(4), doc="Número de la via de la entrega")
+    due_dates_number = Column("nvt_fpg", Integer, doc="Introduzca el Número de Vencimientos a Generar")
+    notes = Column("obs_alb", String(800), doc="Observaciones")
+    document_origin = Column("ori_alb", String(3), doc="Introduzca Origen del Albarán")
+    from_invoiced_advance_payment = Column("pac_alb", Boolean, doc="Indica si el albarán proviene de un anticipo facturado")
+    promotion_points_customer = Column("pcli_alb", Integer, doc="Ptos. Promoción Cliente")
+    promotion_points_buyer = Column("pcom_alb", Integer, doc="Ptos. Promoción Comprador")
+    is_pending_payment = Column("pco_alb", Boolean, doc="Pendiente de Cobro")
+    has_pending_return = Column("pdtv_abl", Boolean, doc="Pdte. Devolución")
+    weight = Column("pes_alb", Numeric(9, 2), doc="Peso Total")
+    promotion_settled_points_customer = Column("plcli_alb", Integer, doc="Ptos. Liquidados Promoción Cli")
+    promotion_settled_points_buyer = Column("plcom_alb", Integer, doc="Ptos. Liquidados Promoción Com")
+    settled_promotion = Column("pliq_alb", Boolean, doc="Promoción Liquidada")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    shipping_city = Column("pob_mer", String(30), doc="Población de la entrega")
+    shipping_cost = Column("por_alb", Numeric(8, 2), doc="Introduzca el valor de los portes")
+    is_recomputable_promotion = Column("prec_alb", Boolean, doc="Promoción Recalculable")
+    has_promotion = Column("prom_alb", Boolean, doc="Indicar si el albarán está sujeto a promoción")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    shipping_business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social de la Entrega")
+    reference_2 = Column("ref2_alb", String(20), doc="Segunda Referencia del Albarán")
+    reference = Column("ref_alb", String(20), doc="Introduzca una Referencia Interna del Albarán")
+    is_replicated = Column("repl_alb", Boolean, doc="Introduzca si el Albarán ha sido Replicado")
+    sales_equalization_rate_1 = Column("req_alb1", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [1]")
+    sales_equalization_rate_2 = Column("req_alb2", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [2]")
+    sales_equalization_rate_3 = Column("req_alb3", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [3]")
+    financial_surcharge_rate = Column("rfi_alb", Numeric(4, 2), doc="Introduzca +/- % de Recargo Financiero del Albarán")
+    pricing_reference = Column("rpr_alb", String(20), doc="Referencia de Precio")
+    shelved_sale_reference = Column("rva_alb", String(20), doc="Referencia Venta Aparcada")
+    phone = Column("tel_cli", String(18), doc="Introduzca el Teléfono del Cliente")
+    shipping_phone = Column("tel_mer", String(18), doc="Teléfono  de la dirección de entrega")
+    delivery_time = Column("ten_alb", String(1), doc="Introduzca Tipo de Entrega")
+    delivery_type = Column("tex_alb", String(40), doc="Introduzca tipo de entrega: urgente, inmediata, etc.")
+    sales_delivery_note_type = Column("tip_alb", String(1), doc="Tipo Albarán: Contado, Crédito o Ticket")
+    discount_type = Column("tip_cli", Integer, doc="Introduzca el Tipo de Descuento de Ventas (0-8)")
+    amount = Column("tot_alb", Numeric(11, 2), doc="Introduzca Importe Total")
+    last_modification_user_id = Column("usum_alb", String(8), doc="Usuario Última Modificación")
+    is_priced = Column("val_alb", Boolean, doc="Introduzca (S/N) el Albarán se Valora")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Introduzca el Valor Actual de la Divisa")
+    volume = Column("vol_alb", Numeric(9, 2), doc="Volumen Total")
+
+
+class BranchDeliveryNote(LegacyBase):
+    """Cabecera Albaranes de la Delegación (gvaldec)"""
+    __tablename__ = "gvaldec"
+
+    updated = Column("act_dec", Boolean, doc="Introduzca (S/N) el Albarán Está Actulizado")
+    individual_packages = Column("bin_dec", Integer, doc="Bultos Individuales")
+    blocking = Column("blq_dec", Boolean, doc="Introduzca (SI/NO) el Albarán Está Bloqueado")
+    packages = Column("bul_dec", Integer, doc="Bultos")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    char1_gvaldec = Column("char1_gvaldec", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    char2_gvaldec = Column("char2_gvaldec", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    char3_gvaldec = Column("char3_gvaldec", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    char4_gvaldec = Column("char4_gvaldec", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    delivery_terms = Column("cod_coe", String(3), doc="Introduzca Condición de Entrega")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    deposit_id = Column("cod_depo", Integer, doc="Introduzca Nº de Depósito")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Transportista a Utilizar para este Albarán")
+    user_id = Column("cod_usu", String(8), doc="Código del Usuario")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_gvaldec", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal2user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_gvaldec", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_gvaldec", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_gvaldec", Numeric(11, 3), doc="decimal4Tlmp")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    destination_branch = Column("del_dec", Integer, doc="Introduzca el Código de la Delegación Destino")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_user2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    shipment_status = Column("eex_dec", String(1), doc="Estado Expedición")
+    destination_company = Column("ent_dec", Integer, doc="Intoduzca la empresa destino")
+    shipped = Column("env_dec", Boolean, doc="Introduzca (S/N) el Albarán Está Enviado")
+    status = Column("estado", String(1), doc="Estado")
+    status_r_628 = Column("esta_dec", String(1), doc="Estado del Albarán")
+    dispatch = Column("exp_dec", Boolean, doc="Expedición")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_gvaldec", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2_temp = Column("fec2_gvaldec", Date, doc="fecha2Tlmp")
+    date3user = Column("fec3_al", Date, doc="fecha3Usr")
+    date3_temp = Column("fec3_gvaldec", Date, doc="fecha3Tlmp")
+    date = Column("fec_dec", Date, doc="Introduzca la Fecha del Albarán")
+    shipping_date = Column("fec_env", Date, doc="Fecha Envío")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="id único")
+    printed = Column("ipr_dec", Boolean, doc="Introduzca (SI/NO) el Albarán Está Impreso")
+    origin_delivery_note_number = Column("nume_dec", Integer, doc="Introduzca el Numero de Documento en la Delegacion Origen")
+    delivery_note_number = Column("num_dec", Integer, doc="Introduzca el Número del Albarán")
+    invoice_number = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    purchase_invoice_id = Column("num_fcc", Integer, doc="Introduzca el Número de Factura de Compra")
+    notes = Column("obs_dec", String(800), doc="Observaciones")
+    total_weight = Column("pes_dec", Numeric(9, 2), doc="Peso Total")
+    received = Column("rec_dec", Boolean, doc="Introduzca (S/N) el Albarán Está Recepcionado")
+    reference = Column("ref_dec", String(20), doc="Introduzca una Referencia Interna del Albarán")
+    delivery_type = Column("ten_dec", String(1), doc="Introduzca Tipo de Entrega")
+    document_type = Column("tip_dec", String(1), doc="Introduzca el Tipo de Documento (S)alida (E)ntrada")
+    total = Column("tot_dec", Numeric(11, 2), doc="Introduzca Importe Total")
+    total_volume = Column("vol_dec", Numeric(9, 2), doc="Volumen Total")
+
+
+class BranchDeliveryLine(ReadOnlyRow, LegacyBase):
+    """Lineas de Albaranes de la Delegación (gvaldel)"""
+    __tablename__ = "gvaldel"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    quantity = Column("can_del", Numeric(9, 2), doc="Introduzca +/- la Cantidad de Venta")
+    returned_quantity = Column("cdv_del", Numeric(9, 2), doc="Introduzca la Cantidad Devuelta")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    char1_gvaldel = Column("char1_gvaldel", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    char2_gvaldel = Column("char2_gvaldel", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    char3_gvaldel = Column("char3_gvaldel", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    char4_gvaldel = Column("char4_gvaldel", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    work_project_id = Column("cod_obr", Integer, doc="Introduzca el Código de Obra/Proyecto")
+    packaging_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    cost = Column("cos_del", Numeric(12, 5), doc="Introduzca el Coste de la Venta")
+    decimal1user = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    decimal1tlmp = Column("dec1_gvaldel", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal2user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal2tlmp = Column("dec2_gvaldel", Numeric(7, 2), doc="decimal2Tlmp")
+    decimal3user = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    decimal3tlmp = Column("dec3_gvaldel", Numeric(11, 3), doc="decimal3Tlmp")
+    decimal4user = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    decimal4tlmp = Column("dec4_gvaldel", Numeric(11, 3), doc="decimal4Tlmp")
+    decimal5user = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    decimal6user = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    extended_description = Column("dell_del", String(800), doc="Descripcion Ampliada del Artículo")
+    description_detail = Column("det_del", String(800), doc="Introduzca la Descripción")
+    editor_user1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    editor_user2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1_temp = Column("fec1_gvaldel", Date, doc="fecha1Tlmp")
+    date2user = Column("fec2_al", Date, doc="fecha2Usr")
+    date2_temp = Column("fec2_gvaldel", Date, doc="fecha2Tlmp")
+    date3user = Column("fec3_al", Date, doc="fecha3Usr")
+    date3_temp = Column("fec3_gvaldel", Date, doc="fecha3Tlmp")
+    id_gpeddell = Column("id_gpeddell", Integer, doc="id de línea")
+    gvaldel_id = Column("id_gvaldel", Integer, doc="id_gvaldel")
+    line_total = Column("imp_del", Numeric(11, 2), doc="Total linea")
+    purchase_delivery_note_line_number = Column("lin_all", Integer, doc="Linea del Albarán de Compra")
+    purchase_delivery_note = Column("num_alc", Integer, doc="Número del Albarán de Compra")
+    branch_delivery_note_id = Column("num_dec", Integer, doc="Introduzca el Número del Albarán")
+    branch_delivery_note_line_order = Column("ord_del", Integer, doc="Introduzca el Numero de la Linea del Albarán")
+    total_weight = Column("pes_del", Numeric(9, 2), doc="Peso Total")
+    product_reference = Column("ref_art", String(24), doc="Introduzca la Referencia del Fabricante")
+    line_type = Column("tbd_del", String(1), doc="Tipo de Linea/Articulo E->B.D.E  F->B.D.F   \"\"->Normal")
+    type = Column("tip_del", String(1), doc="Introduzca el Tipo de Linea")
+    text = Column("txt_del", String(800), doc="Introduzca Texto")
+    ubi_del = Column("ubi_del", Boolean, doc="¿ Ubicado ?")
+    total_volume = Column("vol_del", Numeric(9, 2), doc="Volumen Total")
+
+
+class SalesDeliverynoteTax(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos del Documento de  Albaranes de Venta (gvalimp)"""
+    __tablename__ = "gvalimp"
+
+    tax_base = Column("bas_imd", Numeric(11, 2), doc="Introduzca la Base")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_id = Column("cod_imd", Integer, doc="Introduzca el Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Introduzca el Tipo de Impuesto")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    tax_amount = Column("imp_imd", Numeric(11, 2), doc="Introduzca el Importe")
+    tax_rate = Column("por_imd", Numeric(4, 2), doc="Introduzca el Porcentaje")
+
+
+class SalesDocumentLine(ReadOnlyRow, LegacyBase):
+    """Líneas de Detalle de los Documentos de  Albaranes y Facturas de Venta (gvallin)"""
+    __tablename__ = "gvallin"
+
+    group = Column("agr_abl", String(2), doc="Agrupación")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    is_accounted = Column("ati_abl", Boolean, doc="Indica si la venta es atípica")
+    is_atypical_sale = Column("atp_abl", Boolean, doc="Venta Atípica")
+    purchase_quantity = Column("canc_abl", Numeric(9, 3), doc="Cantidad de Compra de la Línea de Detalle")
+    quantity = Column("can_abl", Numeric(10, 3), doc="Introduzca +/- la Cantidad de Venta")
+    returned_quantity = Column("cdv_abl", Numeric(9, 2), doc="Introduzca la Cantidad Devuelta")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    activity_id = Column("cod_acto", Integer, doc="Actividad de Presupuesto")
+    customs_id = Column("cod_adu", String(16), doc="Introduzca Aduana")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    sales_order_product_id = Column("cod_artp", String(24), doc="Introduzca el Código del Artículo del Pedido")
+    sales_order_id = Column("cod_cpc", Integer, doc="Introduzca el Número del Pedido")
+    sales_order_company = Column("cod_cpc_t", Integer, doc="Pedido de Venta en la empresa de Trabajo")
+    invoicing_branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    deposit_id = Column("cod_depo", Integer, doc="Introduzca Nº de Depósito")
+    worker_id = Column("cod_empl", Integer, doc="Introduzca Código de Operario")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    vat_id = Column("cod_iva", Integer, doc="Introduzca el Código de IVA")
+    sales_order_vat_id = Column("cod_ivap", Integer, doc="Introduzca el Código de IVA del Pedido")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    work_project_id = Column("cod_obr", Integer, doc="Código de Obra")
+    certification_id = Column("cod_ocer", Integer, doc="Certificación")
+    work_delivery_id = Column("cod_opec", Integer, doc="Parte de Entrega")
+    work_document_line_number = Column("cod_oprl", Integer, doc="Identificador de la línea de Parte en una Modif. de Línea Fact.")
+    work_document_id = Column("cod_oprt", Integer, doc="Parte")
+    sales_preinvoice_id = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    sales_preinvoice_item_number = Column("cod_pon", Integer, doc="Número de Concepto")
+    vendor_id = Column("cod_pro", Integer, doc="Código del Proveedor de la Condición de Compra")
+    origin_id = Column("cod_proc", String(3), doc="Introduzca la Procedencia")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante")
+    subactivity_id = Column("cod_sac", Integer, doc="SubActividad de Presupuesto")
+    purchase_currency_id = Column("cod_sasc", String(3), doc="Código de Divisa de la Condición de Compra")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    purchase_packing_unit = Column("cod_ueac", String(2), doc="Código de la Unidad de Embalaje de Compra")
+    sales_order_packing_unit = Column("cod_ueap", String(2), doc="Introduzca la Unidad de Embalaje del Pedido")
+    measurement_unit_weight = Column("cod_um_p", String(2), doc="Unidad de Medida del Peso")
+    measurement_unit_volume = Column("cod_um_v", String(2), doc="Unidad de Medida de Volumen")
+    direct_commission = Column("com_rep", Numeric(4, 2), doc="Introduzca la Comisión Directa del Representante")
+    zero_cost_lines = Column("coste_cero", Boolean, doc="Introduzca (SI/NO) Líneas con Coste Cero")
+    cost = Column("cos_abl", Numeric(14, 5), doc="Introduzca el Coste de la Venta")
+    sales_order_quantity = Column("cpe_lpc", Numeric(9, 2), doc="Introduzca la Cantidad Pedida del Artículo")
+    predial_tax_account = Column("cpre_abl", String(20), doc="Cuenta Predial")
+    product_code_corporative = Column("ctl_art", String(20), doc="Introduzca el Código Telematel")
+    purchase_packing_unit_quantity = Column("cueac_abl", Numeric(8, 2), doc="Cantidad de Precio de la Condición de Compra")
+    sales_order_packing_unit_quantity = Column("cuea_lpc", Numeric(8, 2), doc="Introduzca Cantidad de Unidad de Embalaje.")
+    price_quantity = Column("cuea_pres", Numeric(8, 2), doc="Introduzca Cantidad de Unidad de Embalaje.")
+    advance_payment_discount_amount = Column("dan_abl", Numeric(11, 2), doc="Introduzca el Importe Dto. Anticipos")
+    drp_branch = Column("ddel_cpc", Integer, doc="Intoduzca la delegación DRP")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description_long = Column("dell_abl", String(800), doc="Descripción Ampliada")
+    debit_delivery_note_branch_id = Column("del_car", Integer, doc="Del.Alb.Cargo")
+    target_branch_id = Column("del_des", String(2), doc="Delegación que Servirá el Pedido")
+    DRP_company = Column("dent_cpc", Integer, doc="Intoduzca la empresa DRP")
+    is_deposit = Column("depo_abl", Boolean, doc="Introduzca (SI/NO) la Línea está Destinado a Depósito")
+    has_printable_detail = Column("deti_abl", Boolean, doc="Posee detalle para impresión")
+    description = Column("det_art", String(800), doc="Introduzca la Descripción")
+    did_gvallin = Column("did_gvallin", Integer, doc="decimal4TlmpdTlmp")
+    drp_delivery_note_id = Column("dnum_alb", Integer, doc="Introduzca el Número del Albarán DRP")
+    purchase_discount_1 = Column("dt1c_abl", Numeric(4, 2), doc="Descuento 1 Compra")
+    discount_1 = Column("dt1_abl", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    sales_order_discount_1 = Column("dt1_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    purchase_discount_2 = Column("dt2c_abl", Numeric(4, 2), doc="Descuento 2 Compra")
+    discount_2 = Column("dt2_abl", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    sales_order_discount_2 = Column("dt2_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    purchase_discount_3 = Column("dt3c_abl", Numeric(4, 2), doc="Descuento 3 Compra")
+    discount_3 = Column("dt3_abl", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    sales_order_discount_3 = Column("dt3_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    customs_date_expedition = Column("fec_adu", Date, doc="Introduzca Fecha Expedición Aduana")
+    date = Column("fec_alb", Date, doc="Introduzca la Fecha del Albarán")
+    group_id = Column("idAg_abl", Integer, doc="Identificador Agrupación")
+    branch_delivery_note_line_id = Column("id_gvaldel", Integer, doc="id de líneas de albaranes delegación")
+    line_id = Column("id_gvallin", Integer, doc="id_gvallin")
+    work_document_invoice_amount = Column("impf_lin", Numeric(11, 2), doc="Importe de la Factura de Parte de Administración")
+    amount = Column("importe", Numeric(11, 2), doc="Importe Total linea")
+    sales_order_amount = Column("imp_lpc", Numeric(11, 2), doc="Intoduzca Importe del Pedido")
+    increment = Column("inc_abl", Numeric(4, 2), doc="Introduzca % Incremento Sobre el Coste")
+    include_in_invoice = Column("inc_fac", Boolean, doc="Incl.Factura")
+    is_intrastat = Column("intr_abl", Boolean, doc="Intrastat")
+    is_unscheduled = Column("ipv_fac", Boolean, doc="Informa si la línea es un Imprevisto")
+    tax_amount = Column("itas_abl", Numeric(10, 3), doc="Importe Tasa")
+    tax_rate = Column("iva_iva", Numeric(4, 2), doc="Introduzca el Porcentaje de IVA")
+    delivery_note_line_number = Column("lin_abl", Integer, doc="Introduzca el Numero de la Linea del Albarán")
+    purchase_delivery_note_line_number = Column("lin_all", Integer, doc="Introduzca el Numero de la Linea del Albarán")
+    debit_line_number = Column("lin_car", Integer, doc="Introduzca Línea de Cargo (Solo Abonos)")
+    sales_invoice_line_number = Column("lin_fac", Integer, doc="Introduzca el Numero de la Linea del Factura")
+    sales_order_line_number = Column("lin_lpc", Integer, doc="Introduzca el Numero de la Linea del Pedido")
+    sales_order_company_line = Column("lin_lpc_t", Integer, doc="Linea del Pedido de Venta en la empresa de trabajo")
+    plate_number = Column("mat_bob", String(20), doc="Introduzca la Matrícula de la Bobina")
+    is_editable = Column("mod_abl", String(1), doc="Modificable")
+    brand_name = Column("nom_mar", String(40), doc="Introduzca el Nombre de la Marca")
+    credit_invoice_id = Column("num_abo", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    customs_document = Column("num_adu", String(16), doc="Introduzca Número Documento Aduanero")
+    sales_delivery_note_id = Column("num_alb", Integer, doc="Introduzca el Número del Albarán")
+    purchase_delivery_note_id = Column("num_alc", Integer, doc="Introduzca el Número de Albarán")
+    debit_delivery_note_id = Column("num_car", Integer, doc="Introduzca el Número del Albarán de Cargo")
+    branch_delivery_note_id = Column("num_dec", Integer, doc="Introduzca el Número del Albarán")
+    sales_invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    sales_preinvoice_line_number = Column("num_pre", Integer, doc="Nº Línea de Resumen")
+    cost_origin = Column("ocos_abl", String(1), doc="Origen del Coste")
+    discount_origin = Column("odt_abl", String(1), doc="Introduzca el origen de los descuentos")
+    line_order = Column("ord_abl", Integer, doc="Introduzca el Numero de orden")
+    branch_delivery_note_line_order = Column("ord_del", Integer, doc="Introduzca el Numero de la Linea del Albarán")
+    document_origin = Column("ori_abl", String(1), doc="Introduzca el Origen de la linea.")
+    origin_invoice = Column("ori_fac", Integer, doc="Indica la Factura Origen")
+    customs_patent = Column("pat_adu", String(4), doc="Patente Aduanera")
+    customs_motion = Column("ped_adu", String(21), doc="Pedimento Aduanal")
+    weight = Column("pes_abl", Numeric(18, 2), doc="Peso")
+    sales_order_price = Column("pre_lpc", Numeric(10, 3), doc="Introduzca el Precio de Venta Unitario")
+    purchase_price = Column("pvpc_abl", Numeric(11, 3), doc="P.V.P. Compra")
+    price = Column("pvp_abl", Numeric(10, 3), doc="Introduzca el Precio de Venta Unitario en Pts")
+    account_in_settlement_by_product = Column("raa_abl", Boolean, doc="Desea considerar la línea en la liq. por Artículo")
+    rappel = Column("rap_abl", Numeric(4, 2), doc="Rappel")
+    account_in_settlement = Column("rav_abl", Boolean, doc="Desea considerar la línea en la liq.")
+    product_reference = Column("ref_art", String(24), doc="Introduzca la Referencia del Fabricante")
+    sales_order_product_reference = Column("ref_lpc", String(24), doc="Introduzca la Referencia del Fabricante del Pedido")
+    sales_equalization_rate = Column("req_iva", Numeric(4, 2), doc="Introduzca el Porcentaje de Recargo de Equivalencia")
+    has_tax = Column("tas_abl", Boolean, doc="Indica si se Aplicará el RAEE en la Línea Detalle")
+    text = Column("texto", String(800), doc="Introduzca Texto")
+    rappel_type = Column("tipr_abl", Boolean, doc="Tipo rappel")
+    sales_deliverty_note_type = Column("tip_alb", String(1), doc="Introduzca el Tipo de Albarán de Cliente (C)ontado C(R)édito")
+    line_type = Column("tip_lin", String(1), doc="Introduzca Tipo de linea")
+    is_located = Column("ubi_abl", Boolean, doc="¿ Ubicado ?")
+    volume = Column("vol_abl", Numeric(19, 3), doc="Volumen")
+
+
+class SalesDeliverynoteLocation(ReadOnlyRow, LegacyBase):
+    """Detalle de la Ubicación de Extracción del Stock de cada una de las Línea (gvallinu)"""
+    __tablename__ = "gvallinu"
+
+    is_updated = Column("act_alb", Boolean, doc="¿Actualizada?")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    warehouse_id = Column("cod_alm", Integer, doc="Introduzca Almacén")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    component_product_id = Column("cod_com", String(24), doc="Introduzca el Código del Artículo Componente")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    zone_id = Column("cod_zona", String(1), doc="Introduzca Zona")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    last_deletion_date = Column("feb_sta", Date, doc="Introduzca la Fecha del Ultimo Borrado")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    plate_number = Column("mat_bob", String(20), doc="Introduzca la Matrícula de la Bobina")
+    warehouse_movement_id = Column("num_alm", Integer, doc="Introduzca el Número de Movimiento de Almacén")
+    box_bumber = Column("num_caj", String(20), doc="Introduzca el Número de Caja")
+    invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    batch_number = Column("num_lot", String(20), doc="Introduzca Lote")
+    pallet_number = Column("num_pal", String(20), doc="Introduzca Palet.")
+    serial_number = Column("num_ser", String(40), doc="Introduzca el Número de Serie")
+    inial_quantity = Column("sti_sta", Numeric(8, 2), doc="Introduzca el Stock Inicial del Artículo")
+    quantity = Column("str_sta", Numeric(8, 2), doc="Introduzca el Stock Actual del Artículo")
+    delivery_note_type = Column("tip_alb", String(1), doc="Introduzca el Tipo de Albarán de Cliente (C)ontado C(R)édito")
+    location_id = Column("ubi_art", String(13), doc="Introduzca la Ubicación del Artículo")
+
+
+class SalesInvoice(LegacyBase):
+    """Cabecera del Documento de Facturas de Venta (gvfacab)"""
+    __tablename__ = "gvfacab"
+
+    is_updated = Column("act_fac", Boolean, doc="Introduzca (S/N) la Factura Está Actulizada")
+    has_attachments = Column("adj_fac", Boolean, doc="Documentos adjuntos asociados")
+    from_delivery_notes = Column("alb_fac", Boolean, doc="Indica si la Factura Procede de un Albarán")
+    vat_accounting_entry_id = Column("asiva_fac", Integer, doc="Introduzca el Número del Asiento de Provisión de IVA")
+    accounting_entry_id = Column("asi_mov", Integer, doc="Introduzca el Número del Asiento")
+    tax_base_1 = Column("bas_fac1", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [1]")
+    tax_base_2 = Column("bas_fac2", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [2]")
+    tax_base_3 = Column("bas_fac3", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [3]")
+    is_locked = Column("blq_fac", Boolean, doc="Introduzca (SI/NO) la Factura Está Bloqueada")
+    gross_amount = Column("bru_fac", Numeric(11, 2), doc="Introduzca el Importe Bruto de la Factura")
+    due_date_cadence = Column("cad_fpg", Integer, doc="Introduzca la Cadencia de Días entre Vencimientos")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el Código de la Empresa.")
+    purchasing_group_commission = Column("coc_fac", Numeric(5, 2), doc="Comisión Grupo Compra")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca Código de Cliente")
+    invoicing_branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    accounting_branch_id = Column("cod_delc", Integer, doc="Introduzca la Delegación que Gestiona Contabilizacion")
+    target_branch_id = Column("cod_deld", Integer, doc="Introduzca la delegación destino")
+    billing_branch_id = Column("cod_delo", Integer, doc="Introduzca la Delegación que Gestiona Cobros")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca la Forma de Pago para esta Factura")
+    vat_id_1 = Column("cod_iva1", Integer, doc="Introduzca el Código de IVA a Aplicar en la Factura [1]")
+    vat_id_2 = Column("cod_iva2", Integer, doc="Introduzca el Código de IVA a Aplicar en la Factura [2]")
+    vat_id_3 = Column("cod_iva3", Integer, doc="Introduzca el Código de IVA a Aplicar en la Factura [3]")
+    message_id = Column("cod_msg", String(3), doc="Introduzca el Código del Mensaje Asociado a la Factura")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código del País")
+    sales_preinvoice_id = Column("cod_pfa", Integer, doc="Número de Prefactura")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    sales_representative_id = Column("cod_rep", Integer, doc="Ag.Comercial")
+    retention_id = Column("cod_ret", Integer, doc="Código de Retención")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de Divisa para esta Factura")
+    invoice_type = Column("cod_tfv", Integer, doc="Introduzca el tipo de Factura de Venta")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Transportista a Utilizar para esta Factura")
+    user_id = Column("cod_usu", String(8), doc="Código del Usuario")
+    seller_id = Column("cod_ven", Integer, doc="Introduzca el Código del Vendedor")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    commision_percent = Column("com_fac", Numeric(4, 2), doc="Porcentaje Comisión")
+    cost = Column("cos_fac", Numeric(14, 5), doc="Introduzca Coste")
+    invoiced_advance_payment_branch_id = Column("daf_fac", Integer, doc="Intoduzca la Delegación Anticipo Facturado")
+    advance_payment_discount_amount = Column("dan_fac", Numeric(11, 2), doc="Introduzca el Importe Dto. Anticipos")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    is_deductible = Column("ded_fac", Boolean, doc="Introduzca Si/No Factura Deducible")
+    due_date_displacement = Column("des_fpg", Integer, doc="Introduzca el Número de Dias Hasta el Primer Vencimiento")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    invoicing_address_id = Column("dir_fac", Integer, doc="Introduzca el Código de la Dirección de Cobro de la Factura")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    prompt_payment_discount = Column("dpp_fac", Numeric(4, 2), doc="Introduzca +/- % Dto. P.Pago para la Factura")
+    invoiced_advance_payment_bill_number = Column("eaf_fac", Integer, doc="Introduzca el Nº de Efecto del Anticipo Facturado")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_state = Column("edic_fac", String(3), doc="CRE - Creación, WRI - Modificacion, \"\" - Finalizacion")
+    has_retention_bill = Column("efc_ret", Boolean, doc="Generar Efecto de Retención")
+    sent_by_email = Column("ema_fac", Boolean, doc="Enviado por Email")
+    packaging_cost = Column("emb_fac", Numeric(8, 2), doc="Introduzca el valor del embalaje")
+    shipment_status = Column("env_fac", String(20), doc="Estado Envío")
+    state = Column("estp_fac", Integer, doc="Estado")
+    e_billing_state = Column("est_efa", String(20), doc="Indica si la factura ha sido enviada o firmada")
+    has_statistics = Column("est_fac", Boolean, doc="Introduzca (S/N) la Factura Actualizará Estadísticas")
+    sii_state = Column("est_sii", String(2), doc="Estado SII")
+    invoiced_advance_payment_invoice_id = Column("faf_fac", Integer, doc="Introduzca el Número de Factura del Anticipo Facturado")
+    sent_by_fax = Column("fax_fac", Boolean, doc="Enviado por Fax")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_fac", Date, doc="Introduzca la Fecha de la Factura")
+    review_date = Column("fec_rev", Date, doc="Fecha Revisión")
+    fixed_payment_date = Column("ffc_fac", Date, doc="Introduzca la Fecha de Cobro de la Factura")
+    vat_settlement_date = Column("fiva_fac", Date, doc="Fecha de Liquidación del IVA")
+    last_modified_date = Column("fum_fac", Date, doc="Fecha Última Modificación")
+    invoicing_group = Column("gfr_fac", Integer, doc="Agrupación de Facturación")
+    is_in_m340 = Column("hac_fac", Boolean, doc="Incluida en M340")
+    certified_amount = Column("icer_fac", Numeric(11, 2), doc="Importe Certificado")
+    certified_percentage = Column("ice_fac", Numeric(8, 6), doc="Incremento o Dto Cerfificaciones")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    has_fixed_payment_date = Column("iffc_fac", Boolean, doc="Introduzca (SI/NO) la Factura tiene Fecha Cobro Fija")
+    work_document_increment_amount = Column("iida_fac", Numeric(11, 2), doc="Importe Incremento/Decremento Parte Administración")
+    increment_amount = Column("iid_fac", Numeric(11, 2), doc="Importe Incremento/Decremento")
+    unscheduled_amount = Column("iim_fac", Numeric(11, 2), doc="Importe de Imprevistos")
+    vat_amount_1 = Column("iiv_fac1", Numeric(11, 2), doc="Importe del IVA [1]")
+    vat_amount_2 = Column("iiv_fac2", Numeric(11, 2), doc="Importe del IVA [2]")
+    vat_amount_3 = Column("iiv_fac3", Numeric(11, 2), doc="Importe del IVA [3]")
+    retention_amount = Column("imp_ret", Numeric(11, 2), doc="Introduzca el Importe de Retención de la Factura")
+    work_document_amount = Column("ipa_fac", Numeric(11, 2), doc="Importe Partes de Administración")
+    retention_base = Column("ipb_fac", Numeric(11, 2), doc="Introduzca la Base a la que se Aplica el % de IRPF")
+    work_delivery_amount = Column("ipe_fac", Numeric(11, 2), doc="Importe Partes de Entrega")
+    income_tax_rate = Column("ipf_fac", Numeric(4, 2), doc="Introduzca el % de IRPF a Aplicar en Factura")
+    income_tax_amount = Column("ipi_fac", Numeric(9, 2), doc="Valide ó Introduzca el Importe del IRPF")
+    printed = Column("ipr_fac", Boolean, doc="Introduzca (SI/NO) la Factura Está Impresa")
+    apply_personal_income_tax = Column("irp_fac", Boolean, doc="IRPF")
+    sales_equalization_amount_1 = Column("irq_fac1", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [1]")
+    sales_equalization_amount_2 = Column("irq_fac2", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [2]")
+    sales_equalization_amount_3 = Column("irq_fac3", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [3]")
+    vat_rate_1 = Column("iva_fac1", Numeric(4, 2), doc="Introduzca el % de IVA [1]")
+    vat_rate_2 = Column("iva_fac2", Numeric(4, 2), doc="Introduzca el % de IVA [2]")
+    vat_rate_3 = Column("iva_fac3", Numeric(4, 2), doc="Introduzca el % de IVA [3]")
+    apply_vat_over_financial_surcharge = Column("iva_rfi", Boolean, doc="Introduzca (S/N) si se aplica IVA sobre el Recargo Financiero")
+    include_in_xml = Column("ixml_fac", Boolean, doc="Incluir en XML")
+    settled_commission = Column("liqc_fac", Boolean, doc="Indica si la Comisión está Liquidada")
+    settled_rappel = Column("liqr_fac", Boolean, doc="Rappel Liquidado")
+    has_authorized_margins = Column("mau_fac", Boolean, doc="Márgenes Autorizados")
+    periodicity = Column("niv_fac", Integer, doc="Valide ó Introduzca el Nivel de Control para la Factura")
+    debit_delivery_note_id = Column("num_car", Integer, doc="Introduzca el Número de la Factura de Cargo")
+    document_address_id = Column("num_cen", Integer, doc="Introduzca el Código de la Dirección de Envío del Cliente")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    sales_invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    purchase_invoice_id = Column("num_fcc", Integer, doc="Introduzca el Número de Factura de Compra")
+    due_dates_number = Column("nvt_fpg", Integer, doc="Introduzca el Número de Vencimientos a Generar")
+    notes = Column("obs_fac", String(800), doc="Observaciones")
+    origin_invoice_id = Column("ori_fac", Integer, doc="Indica la Factura Origen")
+    from_invoiced_advance_payment = Column("pac_fac", Boolean, doc="Indica si la factura proviene de un Anticipo")
+    has_pdf = Column("pdf_fac", Boolean, doc="PDF Generado")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    shipping_cost = Column("por_fac", Numeric(8, 2), doc="Introduzca el valor de los portes")
+    origin_type = Column("proc_fac", String(1), doc="Introduzca la Procedencia (0)-Obras (blancos)-Comercial")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    reference = Column("ref_fac", String(30), doc="Introduzca una Referencia Interna de la Factura")
+    sales_equalization_rate_1 = Column("req_fac1", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [1]")
+    sales_equalization_rate_2 = Column("req_fac2", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [2]")
+    sales_equalization_rate_3 = Column("req_fac3", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [3]")
+    retention_rate = Column("ret_fac", Numeric(4, 2), doc="Introduzca Retención Aplicada a la Factura")
+    is_reviewed = Column("rev_fac", Boolean, doc="Factura Revisada")
+    financial_surcharge_rate = Column("rfi_fac", Numeric(4, 2), doc="Introduzca +/- % de Recargo Financiero de la Factura")
+    pricing_reference = Column("rpr_fac", String(20), doc="Referencia de Precio")
+    phone = Column("tel_cli", String(18), doc="Introduzca el Teléfono del Cliente")
+    text = Column("texto", String(300), doc="Introduzca Texto")
+    discount_type = Column("tip_cli", Integer, doc="Introduzca el Tipo de Descuento de Ventas (0-8)")
+    charge_credit_invoice = Column("tip_fac", String(1), doc="Introduzca el Tipo de Documento (F)actura (A)bono")
+    work_invoice_type = Column("tip_fao", String(1), doc="Tipo de Factura de Obras P-Partes, C-Certif. , M-Manual , D-Des")
+    amount = Column("tot_imp", Numeric(11, 2), doc="Introduzca Importe Total")
+    last_modification_user_id = Column("usum_fac", String(8), doc="Usuario Última Modificación")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Introduzca el Valor Actual de la Divisa")
+
+
+class SalesInvoiceTax(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos del Documento de Facturas de Venta (gvfaimp)"""
+    __tablename__ = "gvfaimp"
+
+    tax_base = Column("bas_imd", Numeric(11, 2), doc="Introduzca la Base")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    branch_id = Column("cod_def", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    tax_id = Column("cod_imd", Integer, doc="Introduzca el Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Introduzca el Tipo de Impuesto")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    tax_amount = Column("imp_imd", Numeric(11, 2), doc="Introduzca el Importe")
+    sales_invoice_id = Column("num_fac", Integer, doc="Introduzca el Número de la Factura de Cliente")
+    tax_rate = Column("por_imd", Numeric(8, 6), doc="Introduzca el Porcentaje")
+
+
+class SalesOffer(LegacyBase):
+    """Cabecera del Documento de Ofertas de Venta (gvofcab)"""
+    __tablename__ = "gvofcab"
+
+    has_attachments = Column("adj_ofe", Boolean, doc="Documentos adjuntos asociados")
+    tax_base_1 = Column("bas_ofe1", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [1]")
+    tax_base_2 = Column("bas_ofe2", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [2]")
+    tax_base_3 = Column("bas_ofe3", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [3]")
+    is_invoice_locked = Column("blq_fac", Boolean, doc="Introduzca (SI/NO) la Factura Está Bloqueada")
+    is_locked = Column("blq_ofe", Boolean, doc="¿Oferta Bloqueada?")
+    gross_amount = Column("bru_ofe", Numeric(11, 2), doc="Introduzca el Importe Bruto de la Oferta")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. / D.N.I. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    notification_id = Column("cod_avis", Integer, doc="Código del Aviso")
+    document_address_id = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Envio de la Oferta")
+    shipping_address_id = Column("cod_cenm", Integer, doc="Introduzca el Código de la Dirección de Envio de Mercaderías")
+    closure_reason = Column("cod_cie", Integer, doc="Código del Motivo de Cierre de la Oferta")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    delivery_terms = Column("cod_coe", String(3), doc="Condición de Entrega")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    potential_customer_id = Column("cod_dir", Integer, doc="Introduzca el Código de Cliente Potencial")
+    worker_id = Column("cod_empl", Integer, doc="Empleado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca el Código de Forma de Pago")
+    sales_offer_id = Column("cod_ofe", Integer, doc="Oferta")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código de País del Cliente")
+    shipping_country_id = Column("cod_pai_m", String(2), doc="Código de País")
+    periodicity_id = Column("cod_perf", Integer, doc="Código de Periodicidad")
+    origin_id = Column("cod_proc", String(3), doc="Introduzca la Procedencia de la Oferta de Venta")
+    potential_customer_contact_id = Column("cod_prof", Integer, doc="Código del Contacto del Cliente Potencial")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    shipping_province_id = Column("cod_provi_m", Integer, doc="Código de la Provincia de la entrega")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Agente Comercial.")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    customer_contact_id = Column("cod_telc", Integer, doc="Introduzca Teléfono Activo.")
+    carrier_id = Column("cod_tra", Integer, doc="Transportista de la Oferta")
+    user_id = Column("cod_usu", String(8), doc="Introduzca el Login (identificación) del Usuario")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    shipping_street_type = Column("cod_via_m", String(2), doc="Código de Vía")
+    is_potential_customer = Column("cop_cli", Boolean, doc="Cliente o Cliente Potencial")
+    cost = Column("cos_ofe", Numeric(14, 5), doc="Introduzca Coste")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_ofe", String(40), doc="Introduzca descripción")
+    delivery_days = Column("die_ofe", Integer, doc="Días de Entrega a partir de la Aceptación de la Oferta")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    shipping_street_name = Column("dir_mer", String(55), doc="Dirección de Entrega del Pedido")
+    origin_document_id = Column("doc_ofe", String(12), doc="Código Solicitud de Precios Externa")
+    origin_type = Column("don_ofe", String(1), doc="Procedencia: (F)ax (M)ostrador (R)eprest. (T)eléfono (V)arios")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    shipping_postal_code = Column("dpo_mer", Integer, doc="Distrito Postal de la entrega")
+    prompt_payment_discount = Column("dpp_ofe", Numeric(4, 2), doc="Introduzca Dto. Pronto Pago.")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    editing_state = Column("edic_ofe", String(3), doc="CRE - Creación, WRI - Modificacion, \"\" - Finalizacion")
+    email = Column("ema_mer", String(60), doc="E-mail")
+    sent_by_email = Column("ema_ofe", Boolean, doc="Enviado por Email")
+    packaging_cost = Column("emb_ofe", Numeric(8, 2), doc="Introduzca el Coste del Embalaje")
+    fax = Column("fax_mer", String(18), doc="Fax de la dirección de entrega")
+    sent_by_fax = Column("fax_ofe", Boolean, doc="Enviado por Fax")
+    expiration_date = Column("fcad_ofe", Date, doc="Fecha de Caducidad de la Oferta")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_ofe", Date, doc="Fecha Oferta")
+    closure_date = Column("fer_ofe", Date, doc="Introduzca Fecha Resolución")
+    registration_date = Column("fre_ofe", Date, doc="Introduzca la Fecha de Registro")
+    last_modified_date = Column("fum_ofe", Date, doc="Última Fecha Modificación")
+    registration_time = Column("hre_ofe", String(5), doc="Hora Registro")
+    goconnect_id = Column("id_g2g", BigInteger, doc="Id único G2G")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    unique_id_pc = Column("Id_unico_pc", String(20), doc="Id único Pedido Compra")
+    vat_amount_1 = Column("Iiv_ofe1", Numeric(11, 2), doc="Introduzca Importe IVA [1]")
+    vat_amount_2 = Column("Iiv_ofe2", Numeric(11, 2), doc="Introduzca Importe IVA [2]")
+    vat_amount_3 = Column("Iiv_ofe3", Numeric(11, 2), doc="Introduzca Importe IVA [3]")
+    retention_base = Column("ipb_ofe", Numeric(11, 2), doc="Introduzca la Base a la que se Aplica el % de IRPF")
+    retention_rate = Column("ipf_ofe", Numeric(4, 2), doc="Introduzca el % de IRPF a Aplicar en Oferta")
+    retention_amount = Column("ipi_ofe", Numeric(9, 2), doc="Valide ó Introduzca el Importe del IRPF")
+    sales_equalization_amount_1 = Column("irq_ofe1", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [1]")
+    sales_equalization_amount_2 = Column("irq_ofe2", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [2]")
+    sales_equalization_amount_3 = Column("irq_ofe3", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [3]")
+    vat_rate_1 = Column("iva_ofe1", Numeric(4, 2), doc="Introduzca % de IVA [1]")
+    vat_rate_2 = Column("iva_ofe2", Numeric(4, 2), doc="Introduzca % de IVA [2]")
+    vat_rate_3 = Column("iva_ofe3", Numeric(4, 2), doc="Introduzca % de IVA [3]")
+    latitude_degrees = Column("la1_ofe", Integer, doc="Latitud (grados)")
+    latitude_minutes = Column("la2_ofe", Integer, doc="Latitud (minutos)")
+    latitude_seconds = Column("la3_ofe", Integer, doc="Latitud ( segundos )")
+    longitude_degrees = Column("lo1_ofe", Integer, doc="Longitud ( grados )")
+    longitude_minutes = Column("lo2_ofe", Integer, doc="Longitud ( minutos )")
+    longitude_seconds = Column("lo3_ofe", Integer, doc="Longitud  (segundos)")
+    has_authorized_margins = Column("mau_ofe", Boolean, doc="Márgenes Autorizados")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    shipping_street_number = Column("num_mer", String(4), doc="Número de la via de la entrega")
+    notes = Column("obs_ofe", String(400), doc="Introduzca las Observaciones a cerca del Cliente")
+    contact_person = Column("per_cen", String(55), doc="Nombre de la Persona de Contacto")
+    delivery_time = Column("pla_ofe", Integer, doc="Plazo de Entrega (en dias) del Pedido una vez Aceptada Oferta")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    shipping_city = Column("pob_mer", String(30), doc="Población de la entrega")
+    shipping_cost = Column("por_ofe", Numeric(8, 2), doc="Introduzca Importe de Portes")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    shipping_business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social de la Entrega")
+    reference_2 = Column("ref2_ofe", String(20), doc="Segunda Referencia de la Oferta")
+    reference = Column("ref_ofe", String(20), doc="Referencia")
+    is_replicated = Column("repl_ofe", Boolean, doc="Replicado")
+    sales_equalization_rate_1 = Column("req_ofe1", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [1]")
+    sales_equalization_rate_2 = Column("req_ofe2", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [2]")
+    sales_equalization_rate_3 = Column("req_ofe3", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [3]")
+    financial_surcharge_rate = Column("rfi_ofe", Numeric(4, 2), doc="Introduzca Recargo Financiero.")
+    pricing_reference = Column("rpr_ofe", String(20), doc="Referencia de Precio")
+    status = Column("sit_ofe", String(1), doc="Estado: (P)endiente de Aceptar, (A)ceptado, Par(c)ialmente, (R)")
+    shipping_phone = Column("tel_mer", String(18), doc="Teléfono  de la dirección de entrega")
+    phone = Column("tel_ofe", String(18), doc="Introduzca Teléfono")
+    discount_type = Column("tip_cli", Integer, doc="Introduzca el Tipo de Descuento de Ventas (0-8)")
+    amount = Column("tot_ofe", Numeric(11, 2), doc="Introduzca Importe Total")
+    last_modification_user_id = Column("usum_ofe", String(8), doc="Usuario Última Modificación")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Introduzca valor de la divisa")
+
+
+class SalesOfferTax(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos del Documento de Ofertas de Venta (gvofimp)"""
+    __tablename__ = "gvofimp"
+
+    tax_base = Column("bas_imd", Numeric(11, 2), doc="Introduzca la Base")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_id = Column("cod_imd", Integer, doc="Introduzca el Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Introduzca el Tipo de Impuesto")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    tax_amount = Column("imp_imd", Numeric(11, 2), doc="Introduzca el Importe")
+    tax_rate = Column("por_imd", Numeric(8, 6), doc="Introduzca el Porcentaje")
+
+
+class SalesOfferLine(ReadOnlyRow, LegacyBase):
+    """Detalle de Lineas del Documento de Ofertas de Venta (gvoflin)"""
+    __tablename__ = "gvoflin"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    assigned_quantity = Column("cana_lofe", Numeric(9, 2), doc="Introduzca Cantidad Asignada")
+    kit_quantity = Column("can_kit", Numeric(9, 2), doc="Introduzca la Cantidad Pedida del Artículo")
+    quantity = Column("can_lofe", Numeric(9, 2), doc="Introduzca la Cantidad")
+    is_closed = Column("cer_lofe", Boolean, doc="¿Cerrada?")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    vat_id = Column("cod_iva", Integer, doc="Introduzca el Código de IVA")
+    kit_product_id = Column("cod_kit", String(24), doc="Introduzca el Código del Artículo")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    work_project_id = Column("cod_obr", Integer, doc="Obra")
+    sales_offer_id = Column("cod_ofe", Integer, doc="Oferta")
+    vendor_id = Column("cod_pro", Integer, doc="Introduzca Código de Proveedor")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    packing_unit_purchase_id = Column("cod_uea_c", String(2), doc="Introduzca la Unidad de Embalaje")
+    measurement_unit_weight = Column("cod_um_p", String(2), doc="Unidad de Medida del Peso")
+    measurement_unit_volume = Column("cod_um_v", String(2), doc="Unidad de Medida del Volumen")
+    kit_cost = Column("cos_kit", Numeric(12, 5), doc="Introduzca Coste")
+    cost = Column("cos_lofe", Numeric(12, 5), doc="Introduzca Coste")
+    product_code_corporative = Column("ctl_lofe", String(20), doc="Introduzca el Código Corp/Tel")
+    purchase_packing_unit_quantity = Column("cueac_lofe", Numeric(8, 2), doc="Introduzca Cantidad de Unidad de Embalaje.")
+    packing_unit_quantity = Column("cuea_lofe", Numeric(8, 2), doc="Introduzca Cantidad de Unidad de Embalaje.")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    kit_description = Column("des_kit", String(800), doc="Introduzca la Descripción")
+    description = Column("det_lofe", String(800), doc="Introduzca la Descripción")
+    delivery_days = Column("die_lofe", Integer, doc="Días de Entrega a partir de la Aceptación de la Oferta")
+    purchase_discount_1 = Column("dt1c_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Compra")
+    discount_1 = Column("dt1_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Venta")
+    purchase_discount_2 = Column("dt2c_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Compra")
+    discount_2 = Column("dt2_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Venta")
+    purchase_discount_3 = Column("dt3c_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Compra")
+    discount_3 = Column("dt3_lofe", Numeric(4, 2), doc="Introduzca el % de Dtos de Venta")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    delivery_date = Column("fen_lofe", Date, doc="Fecha de Entrega del Material")
+    amount = Column("imp_lofe", Numeric(11, 2), doc="Intoduzca Importe")
+    kit_increment = Column("inc_kit", Numeric(4, 2), doc="Introduzca % Incremento Sobre el Coste")
+    increment = Column("inc_lofe", Numeric(4, 2), doc="Introduzca % Incremento Sobre el Coste")
+    tax_amount = Column("itas_lofe", Numeric(10, 3), doc="Importe Tasa")
+    origin_document_line = Column("ldoc_lofe", Integer, doc="Línea Documento Origen")
+    line_number = Column("lin_lofe", Integer, doc="Introduzca Línea de la oferta")
+    notes = Column("obs_lofe", String(800), doc="Introducir Observaciones")
+    line_order = Column("ord_lofe", Integer, doc="Introduzca el Numero de orden de la Línea de Oferta")
+    weight = Column("pes_lofe", Numeric(18, 2), doc="Peso")
+    purchase_price = Column("prec_lofe", Numeric(11, 3), doc="Introduzca Precio Compra")
+    kit_price = Column("pre_kit", Numeric(10, 3), doc="Introduzca el Precio de Venta Unitario en Pts")
+    price = Column("pre_lofe", Numeric(10, 3), doc="Introduzca Precio")
+    origin_type = Column("proc_lofe", String(2), doc="Procedencia de la línea")
+    vendor_ambit = Column("pro_amb", Integer, doc="Introduzca el Ambito del Proveedor")
+    is_reclaculable = Column("rec_lofe", Boolean, doc="Indica si la línea es recalculable.")
+    kit_reference = Column("ref_kit", String(24), doc="Introduzca la Referencia del Fabricante")
+    product_reference = Column("ref_lofe", String(24), doc="Introduzca la Referencia del Articulo")
+    has_tax = Column("tas_lofe", Boolean, doc="Tasa de Reciclaje")
+    delivery_time = Column("ten_lofe", Integer, doc="Plazo de Entrega")
+    line_type = Column("tlin_lofe", String(1), doc="Introduzca Tipo de Linea: Articulo o Texto")
+    kit_price_calculation_method = Column("val_kit", Boolean, doc="Introduzca Sistema de Valoración")
+    price_calculation_method = Column("val_lofe", Boolean, doc="Introduzca Sistema de Valoración")
+
+
+class SalesOrder(LegacyBase):
+    """Cabecera del Documento de Pedidos de Venta (gvpccab)"""
+    __tablename__ = "gvpccab"
+
+    has_attachments = Column("adj_cpc", Boolean, doc="Documentos adjuntos asociados")
+    group_delivery_notes = Column("agr_cpc", String(1), doc="Introduzca (S/N/R) Agrupar Albaranes ó (R) por Referencia")
+    single_delivery_note = Column("albu_cpc", Boolean, doc="Crear Albarán Único en Asignación Pedido")
+    advance_payment_amount = Column("ant_cpc", Numeric(11, 2), doc="Introduzca importe del anticipo")
+    tax_base_1 = Column("bas_cpc1", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [1]")
+    tax_base_2 = Column("bas_cpc2", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [2]")
+    tax_base_3 = Column("bas_cpc3", Numeric(12, 2), doc="Valide ó Introduzca Base Imponible [3]")
+    is_locked = Column("blq_cpc", Boolean, doc="Introduzca (SI/NO) el Pedido Está Bloqueado")
+    gross_amount = Column("bru_cpc", Numeric(11, 2), doc="Introduzca el Importe Bruto del pedido")
+    currency_quantity = Column("can_sas", Integer, doc="Introduza la cantidad monetaria")
+    is_closed = Column("cer_cpc", Boolean, doc="Introduzca (SI/NO) el Pedido Está Cerrado")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_cli", String(18), doc="Introduzca el C.I.F. / D.N.I. del Cliente")
+    customer_ambit = Column("cli_amb", Integer, doc="Ambito de Cliente")
+    notification_id = Column("Cod_avis", Integer, doc="Aviso")
+    shipping_address_id = Column("cod_cen", Integer, doc="Introduzca el Código de la Dirección de Mercaderías del Cliente")
+    document_address_id = Column("cod_cene", Integer, doc="Introduzca el Código de la Dirección de Envío del Cliente")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca Código de Cliente")
+    installation_customer_id = Column("cod_cli_ins", Integer, doc="Introduzca Código de Cliente Instalación")
+    delivery_terms = Column("cod_coe", String(3), doc="Introduzca Condición de Entrega")
+    sales_order_id = Column("cod_cpc", Integer, doc="Introduzca el Número del Pedido")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    worker_id = Column("cod_empl", Integer, doc="Empleado")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    payment_method_id = Column("cod_fpg", Integer, doc="Introduzca la Forma de Pago para este Pedido")
+    installation_id = Column("cod_ins", Integer, doc="Introduzca la Instalación")
+    sales_offer_id = Column("cod_ofe", Integer, doc="Oferta")
+    work_order_id = Column("cod_ot", Integer, doc="OT donde se vincula el Pedido")
+    country_id = Column("cod_pai", String(2), doc="Introduzca el Código de País del Cliente")
+    shipping_country_id = Column("cod_pai_m", String(2), doc="Código de País")
+    periodicity_id = Column("cod_perf", Integer, doc="Código de Periodicidad")
+    origin_id = Column("cod_proc", String(3), doc="Introduzca la Procedencia del Pedido")
+    province_id = Column("cod_provi", Integer, doc="Introduzca el Código de la Provincia")
+    shipping_province_id = Column("cod_provi_m", Integer, doc="Código de la Provincia de la entrega")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante Asignado al Pedido")
+    currency_id = Column("cod_sas", String(3), doc="Introduzca el Código de la Divisa")
+    subzone_id = Column("cod_szon", Integer, doc="Subzona")
+    customer_contact_id = Column("cod_telc", Integer, doc="Introduzca Teléfono Activo.")
+    carrier_id = Column("cod_tra", Integer, doc="Introduzca el Transportista a Utilizar para este Pedido")
+    user_id = Column("cod_usu", String(8), doc="Código del Usuario")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la vía pública")
+    shipping_street_type = Column("cod_via_m", String(2), doc="Código de Vía")
+    zone_id = Column("cod_zon", Integer, doc="Zona")
+    comission_percent = Column("com_cpc", Numeric(4, 2), doc="Valide ó Introduzca el % de Comisión")
+    cost = Column("cos_cpc", Numeric(14, 5), doc="Introduzca Coste")
+    buyer_id = Column("c_cod_telc", String(10), doc="Indentificador de Comprador")
+    distribution_branch_id = Column("ddel_cpc", Integer, doc="Intoduzca la delegación")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    distribution_company_id = Column("dent_cpc", Integer, doc="Intoduzca la empresa")
+    street_name = Column("dir_cli", String(55), doc="Introduzca la Dirección del Cliente")
+    shipping_street_name = Column("dir_mer", String(55), doc="Dirección de Entrega del Pedido")
+    distribution_purchase_order_id = Column("dpec_cpc", Integer, doc="Introduzca el Número del Pedido de Compra")
+    distribution_sale_order_id = Column("dpev_cpc", Integer, doc="Introduzca el Número del Pedido")
+    postal_code = Column("dpo_cli", Integer, doc="Introduzca el Distrito Postal del Cliente")
+    shipping_postal_code = Column("dpo_mer", Integer, doc="Distrito Postal de la entrega")
+    prompt_payment_discount = Column("dpp_cpc", Numeric(4, 2), doc="Introduzca +/- % Dto. P.Pago para el Pedido")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    sent_by_email = Column("ema_cpc", Boolean, doc="Enviado por Email")
+    email = Column("ema_mer", String(60), doc="E-mail")
+    packaging_cost = Column("emb_cpc", Numeric(8, 2), doc="Introduzca el Coste del Embalaje")
+    sent_by_fax = Column("fax_cpc", Boolean, doc="Enviado por Fax")
+    fax = Column("fax_mer", String(18), doc="Fax de la dirección de entrega")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date = Column("fec_cpc", Date, doc="Introduzca la Fecha del Pedido")
+    fixed_payment_date = Column("ffc_cpc", Date, doc="Introduzca la Fecha de Cobro del Pedido")
+    registration_date = Column("fre_cpc", Date, doc="Introduzca la Fecha de Registro")
+    last_modified_date = Column("fum_cpc", Date, doc="Última Fecha Modificación")
+    registration_time = Column("hre_cpc", String(5), doc="Hora Registro")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    has_fixed_payment_date = Column("iffc_cpc", Boolean, doc="Introduzca (SI/NO) el Pedido tiene Fecha Cobro Fija")
+    tax_amount_1 = Column("Iiv_cpc1", Numeric(11, 2), doc="Introduzca Importe IVA [1]")
+    tax_amount_2 = Column("Iiv_cpc2", Numeric(11, 2), doc="Introduzca Importe IVA [2]")
+    tax_amount_3 = Column("Iiv_cpc3", Numeric(11, 2), doc="Introduzca Importe IVA [3]")
+    retention_base = Column("ipb_cpc", Numeric(11, 2), doc="Introduzca la Base a la que se Aplica el % de IRPF")
+    retention_rate = Column("ipf_cpc", Numeric(4, 2), doc="Introduzca el % de IRPF a Aplicar en Oferta")
+    retention_amount = Column("ipi_cpc", Numeric(9, 2), doc="Valide ó Introduzca el Importe del IRPF")
+    printed = Column("ipr_cpc", Boolean, doc="Introduzca (SI/NO) el Pedido Está Impreso")
+    sales_equalization_amount_1 = Column("irq_cpc1", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [1]")
+    sales_equalization_amount_2 = Column("irq_cpc2", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [2]")
+    sales_equalization_amount_3 = Column("irq_cpc3", Numeric(11, 2), doc="Importe del Recargo de Equivalencia [3]")
+    vat_rate_1 = Column("iva_cpc1", Numeric(4, 2), doc="Introduzca % de IVA [1]")
+    vat_rate_2 = Column("iva_cpc2", Numeric(4, 2), doc="Introduzca % de IVA [2]")
+    vat_rate_3 = Column("iva_cpc3", Numeric(4, 2), doc="Introduzca % de IVA [3]")
+    latitude_degrees = Column("la1_cpc", Integer, doc="Latitud (grados)")
+    latitude_minutes = Column("la2_cpc", Integer, doc="Latitud (minutos)")
+    latitude_seconds = Column("la3_cpc", Integer, doc="Latitud ( segundos )")
+    pending_authorizations = Column("lcod_aut", String(40), doc="Autorizaciones Pendientes")
+    longitude_degrees = Column("lo1_cpc", Integer, doc="Longitud ( grados )")
+    longitude_minutes = Column("lo2_cpc", Integer, doc="Longitud ( minutos )")
+    longitude_seconds = Column("lo3_cpc", Integer, doc="Longitud  (segundos)")
+    has_authorized_margins = Column("mau_cpc", Boolean, doc="Márgenes Autorizados")
+    street_number = Column("num_cli", String(4), doc="Introduzca número de la vía pública")
+    shipping_street_number = Column("num_mer", String(4), doc="Número de la via de la entrega")
+    notes = Column("obs_cpc", String(400), doc="Introduzca las Observaciones a cerca del Cliente")
+    is_pending_authorization = Column("pau_cpc", Boolean, doc="Introduzca (SI/NO) el Pedido está Pendiente de Autorizar")
+    is_full_order = Column("pec_cpc", Boolean, doc="Ped.Completo SI/NO")
+    contact_person = Column("per_cen", String(55), doc="Introduzca el nombre de la Persona de Contacto")
+    city = Column("pob_cli", String(30), doc="Introduzca la Población del Cliente")
+    shipping_city = Column("pob_mer", String(30), doc="Población de la entrega")
+    shipping_cost = Column("por_cpc", Numeric(8, 2), doc="Introduzca Importe de Portes")
+    business_name = Column("raz_cli", String(100), doc="Introduzca la Razón Social del Cliente")
+    shipping_business_name = Column("raz_mer", String(100), doc="Introduzca la Razón Social de la Entrega")
+    reference_2 = Column("ref2_cpc", String(20), doc="Segunda Referencia del Pedido")
+    reference = Column("ref_cpc", String(20), doc="Introduzca una Referencia Interna del Pedido")
+    is_replicated = Column("repl_ped", Boolean, doc="Replicado")
+    sales_equalization_rate_1 = Column("req_cpc1", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [1]")
+    sales_equalization_rate_2 = Column("req_cpc2", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [2]")
+    sales_equalization_rate_3 = Column("req_cpc3", Numeric(4, 2), doc="Introduzca % Recargo de Equivalencia [3]")
+    financial_surcharge_rate = Column("rfi_cpc", Numeric(4, 2), doc="Introduzca +/- % de Recargo Financiero")
+    pricing_reference = Column("rpr_cpc", String(20), doc="Referencia de Precio")
+    phone = Column("tel_cli", String(18), doc="Introduzca el Teléfono del Cliente")
+    shipping_phone = Column("tel_mer", String(18), doc="Teléfono  de la dirección de entrega")
+    delivery_type = Column("ten_cpc", String(1), doc="Introduzca Tipo de Entrega")
+    discount_type = Column("tip_cli", Integer, doc="Introduzca el Tipo de Descuento de Ventas (0-8)")
+    amount = Column("tot_cpc", Numeric(11, 2), doc="Introduzca Importe Total")
+    last_modification_user_id = Column("usum_cpc", String(8), doc="Usuario Última Modificación")
+    currency_value = Column("val_sas", Numeric(16, 8), doc="Introduzca valor de la divisa")
+    is_linked_with_purchases = Column("vco_cpc", Boolean, doc="Vinculado con Compras")
+
+
+class SalesOrderTax(ReadOnlyRow, LegacyBase):
+    """Desglose de Impuestos del Documento de Pedidos de Venta (gvpcimp)"""
+    __tablename__ = "gvpcimp"
+
+    tax_base = Column("bas_imd", Numeric(11, 2), doc="Introduzca la Base")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    tax_id = Column("cod_imd", Integer, doc="Introduzca el Código de Tipo de Impuesto")
+    tax_type = Column("cod_imp", Integer, doc="Introduzca el Tipo de Impuesto")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    tax_amount = Column("imp_imd", Numeric(11, 2), doc="Introduzca el Importe")
+    tax_rate = Column("por_imd", Numeric(8, 6), doc="Introduzca el Porcentaje")
+
+
+class SalesOrderLine(ReadOnlyRow, LegacyBase):
+    """Detalle de Lineas del Documento de Pedidos de Venta (gvpclin)"""
+    __tablename__ = "gvpclin"
+
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    is_atypical_sale = Column("ati_lpc", Boolean, doc="Indica si la venta es atípica")
+    is_margin_authorized = Column("autoriza_mg", Boolean, doc="Autoriza Margen")
+    is_closed = Column("cer_lpc", Boolean, doc="Introduzca (S/N) Está Cerrada la Línea")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    warehouse_id = Column("cod_alm", Integer, doc="Código de Almacén de asignación del Pedido.")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    sales_order_id = Column("cod_cpc", Integer, doc="Introduzca el Número del Pedido")
+    branch_id = Column("cod_del", Integer, doc="Intoduzca la delegación")
+    company_id = Column("cod_ent", Integer, doc="Intoduzca la empresa")
+    vat_id = Column("cod_iva", Integer, doc="Introduzca el Código de IVA")
+    brand_id = Column("cod_mar", Integer, doc="Introduzca el Código de la Marca")
+    work_id = Column("cod_obr", Integer, doc="Obra")
+    sales_offer_id = Column("cod_ofe", Integer, doc="Oferta")
+    vendor_id = Column("cod_pro", Integer, doc="Proveedor al que se Comprará el Artículo")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca el Código de Representante")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    purchase_packing_unit_id = Column("cod_uea_c", String(2), doc="Embalaje de la compra del Artículo")
+    measurement_unit_weight = Column("cod_um_p", String(2), doc="Unidad de Medida del Peso")
+    measurement_unit_volume = Column("cod_um_v", String(2), doc="Unidad de Medida del VOlumen")
+    zone_id = Column("cod_zon", String(1), doc="Código de Zona de Asignación del Pedido")
+    direct_commission = Column("com_lpc", Numeric(4, 2), doc="Introduzca la Comisión Directa del Representante")
+    cost = Column("cos_lpc", Numeric(12, 5), doc="Introduzca el Coste de la Venta")
+    ordered_quantity = Column("cpe_lpc", Numeric(9, 2), doc="Introduzca la Cantidad Pedida del Artículo")
+    prepared_quantity = Column("cpr_lpc", Numeric(9, 2), doc="Cantidad Preparada")
+    reserved_quantity = Column("crs_lpc", Numeric(9, 2), doc="Introduzca la Cantidad Reservada")
+    served_quantity = Column("cse_lpc", Numeric(9, 2), doc="Introduzca la Cantidad Servida")
+    product_code_corporative = Column("ctl_lpc", String(20), doc="Introduzca el Código Telematel")
+    purchase_packing_unit_quantity = Column("cuea_lpc", Numeric(8, 2), doc="Introduzca Cantidad de Unidad de Embalaje.")
+    packing_unit_quantity = Column("cuea_lpp", Numeric(8, 2), doc="Cantidad Unidad Embalaje de la Compra del Artículo")
+    linked_quantity = Column("cvi_lpc", Numeric(9, 2), doc="Introduzca la Cantidad Vinculada con Compras")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description_long = Column("dell_lpc", String(800), doc="Descripción Ampliada")
+    destination_branch_id = Column("del_des", String(2), doc="Delegación que Servirá el Pedido")
+    description = Column("det_lpc", String(800), doc="Introduzca la Descripción")
+    discount_1 = Column("dt1_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    purchase_discount_1 = Column("dt1_lpp", Numeric(4, 2), doc="Dto. 1 de la Compra del Artículo")
+    discount_2 = Column("dt2_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    purchase_discount_2 = Column("dt2_lpp", Numeric(4, 2), doc="Dto.2 de la Compra del Artículo")
+    discount_3 = Column("dt3_lpc", Numeric(4, 2), doc="Introduzca los Dtos. de Venta para este Artículo")
+    purchase_discount_3 = Column("dt3_lpp", Numeric(4, 2), doc="Dto 3 de la Compra del Artículo")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    delivery_date = Column("fec_lpc", Date, doc="Introduzca Fecha Prevista de Entrega")
+    initial_delivery_date = Column("fei_lpc", Date, doc="Fecha Inicial de Entrega")
+    amount = Column("imp_lpc", Numeric(11, 2), doc="Intoduzca Importe")
+    tax_amount = Column("itas_lpc", Numeric(10, 3), doc="Importe Tasa")
+    sales_offer_line_number = Column("lin_lofe", Integer, doc="Introduzca Línea de la oferta")
+    line_number = Column("lin_lpc", Integer, doc="Introduzca el Numero de la Linea del Pedido")
+    line_order = Column("ord_lpc", Integer, doc="Introduzca el Numero de orden de la Línea de Oferta")
+    weight = Column("pes_lpc", Numeric(18, 2), doc="Peso")
+    price = Column("pre_lpc", Numeric(10, 3), doc="Introduzca el Precio de Venta Unitario en Pts")
+    purchase_price = Column("pre_lpp", Numeric(10, 3), doc="Precio de Compra del Artículo")
+    priority = Column("pri_lpc", Integer, doc="Prioridad")
+    vendor_ambit = Column("pro_amb", Integer, doc="Ámbito del Proveedor al que se Comprará el Artículo")
+    rappel = Column("rap_lpc", Numeric(4, 2), doc="Rappel")
+    account_in_settlement = Column("rav_lpc", Boolean, doc="Considerar Linea en la Liquidación de Rappel")
+    product_reference = Column("ref_lpc", String(24), doc="Introduzca la Referencia del Fabricante")
+    has_tax = Column("tas_lpc", Boolean, doc="Tasa de Reciclaje")
+    has_rappel = Column("tipr_lpc", Boolean, doc="Tipo rappel")
+    line_type = Column("tlin_lpc", String(1), doc="Introduzca Tipo de Linea: Articulo o Texto")
+    location_id = Column("ubi_art", String(13), doc="Ubicación de Agnación del Pedido")
+    volume = Column("vol_lpc", Numeric(19, 3), doc="Volumen")
+
+
+class Protocols(ReadOnlyRow, LegacyBase):
+    """Protocolos (g_proto)"""
+    __tablename__ = "g_proto"
+
+    active = Column("act_prot", Boolean, doc="Activo")
+    protocol = Column("cod_prot", String(4), doc="Introduzca Protocolo")
+    description = Column("des_prot", String(40), doc="Introduzca Descripción")
+
+
+class PackingUnit(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Embalajes (ltuemba)"""
+    __tablename__ = "ltuemba"
+
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+
+
+class ProductPackingUnit(ReadOnlyRow, LegacyBase):
+    """Diferentes Unidades de Embalajes de cada Artículo, así como su Conversió (luemba)"""
+    __tablename__ = "luemba"
+
+    height = Column("alt_uea", Integer, doc="Introduzca Altura en cm")
+    product_ambit = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    multiple_quantity = Column("cmm_uea", Integer, doc="Cantidad Multiple de Venta")
+    minimum_quantity = Column("cmv_uea", Numeric(11, 3), doc="Introduzca la Cantidad Mínima de Venta.")
+    product_id = Column("cod_art", String(24), doc="Introduzca el Artículo")
+    packing_unit_type = Column("cod_temb", Integer, doc="Introduzca Tipo de Embalaje")
+    packing_unit_id = Column("cod_uea", String(2), doc="Introduzca la Unidad de Embalaje")
+    conversion = Column("conv_uea", Integer, doc="Introduzca Conversion a Unidad de Stock")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    maximum_weight = Column("pes_uea", Numeric(7, 2), doc="Introduzca Peso Máximo")
+    net_weight = Column("pneto_uea", Numeric(15, 3), doc="Peso Neto")
+
+
+class WorkRatings(ReadOnlyRow, LegacyBase):
+    """Valoración para cada Combinación de Categoría y Tipo de Hora (ope-hora)"""
+    __tablename__ = "ope-hora"
+
+    scope = Column("art_amb", Integer, doc="Introduzca el Ambito del Articulo")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_ope-hora", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_ope-hora", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_ope-hora", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_ope-hora", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    item_code = Column("cod_art", String(24), doc="Introduzca el Código del Artículo")
+    time_hour = Column("cod_hora", Integer, doc="Introduzca Código de Tipo de Hora")
+    cost = Column("c_hora", Numeric(11, 5), doc="Introduzca Coste de la Hora Asociado a la Categoría")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_ope-hora", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_ope-hora", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temperature_in_celsius = Column("dec3_ope-hora", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius_r_912 = Column("dec4_ope-hora", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_ope-hora", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_ope-hora", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3tlmp = Column("fec3_ope-hora", Date, doc="fecha3Tlmp")
+    selling_price = Column("p_hora", Integer, doc="Introduzca PVP de la Hora Asociado a la Categoría")
+    operation_type = Column("tipo_op", Integer, doc="Introduzca Código de Categoria de Operario")
+
+
+class Pending(LegacyBase):
+    """Registros pendientes de integrar según capa de integración (pending)"""
+    __tablename__ = "pending"
+
+    branch_id = Column("cod_del", Integer, doc="Delegación")
+    company_id = Column("cod_ent", Integer, doc="Empresa")
+    table = Column("cod_file", Text, doc="Tabla")
+    action = Column("cud_capint", Text, doc="Acción")
+    document = Column("doc_capint", Text, doc="Documento")
+    last_modified = Column("fec_capint", DateTime, doc="Fecha Mod.")
+    from_date = Column("from_date", DateTime, doc="Desde fecha")
+    unique_id = Column("id_unico", BigInteger, primary_key=True, doc="Id único")
+
+
+class SalesPricing(ReadOnlyRow, LegacyBase):
+    """Precios de venta (sales_pricing)"""
+    __tablename__ = "sales_pricing"
+
+    product_id = Column("cod_art", Text, doc="Artículo")
+    customer_id = Column("cod_cli", Integer, doc="Cliente")
+    branch_id = Column("cod_del", Integer, doc="Delegación")
+    company_id = Column("cod_ent", Integer, doc="Empresa")
+    currency_id = Column("cod_sas", Text, doc="Divisa")
+    packing_unit_id = Column("cod_uea", Text, doc="Embalaje")
+    price_quantity = Column("cuea_lpc", Numeric, doc="Cantidad precio")
+    packing_unit_description = Column("des_uea", Text, doc="Descripción embalaje")
+    discount_1 = Column("dto1_lpc", Numeric, doc="Descuento 1")
+    discount_2 = Column("dto2_lpc", Numeric, doc="Descuento 2")
+    discount_3 = Column("dto3_lpc", Numeric, doc="Descuento 3")
+    equivalent_discount = Column("dto_equiv", Numeric, doc="Descuento equivalente")
+    tax = Column("imp_tas", Numeric, doc="Tasas")
+    margin = Column("margen", Numeric, doc="Margen")
+    currency_name = Column("nom_sas", Text, doc="Nombre divisa")
+    price = Column("pre_lpc", Numeric, doc="Precio")
+    net_price = Column("pre_net", Numeric, doc="Precio neto")
+    net_price_incl_vat = Column("pre_net_iva", Numeric, doc="Neto+IVA")
+    net_price_incl_vat_tax = Column("pre_net_iva_raee", Numeric, doc="Neto+IVA+RAEE")
+    quantity = Column("qty", Numeric, doc="Cantidad")
+
+
+class HourTypes(ReadOnlyRow, LegacyBase):
+    """Maestro de Tipos de Hora dentro de una Jornada (t-hora)"""
+    __tablename__ = "t-hora"
+
+    barcode = Column("cba_hora", Numeric(13, 0), doc="Introduzca Cod. Barras")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_t-hora", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_t-hora", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_t-hora", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_t-hora", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    time_hour = Column("cod_hora", Integer, doc="Introduzca Código de Tipo de Hora")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_t-hora", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_t-hora", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_t-hora", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_t-hora", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    description = Column("des_hora", String(20), doc="Introduzca la Descripción del Tipo de Hora")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_t-hora", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_t-hora", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_t-hora", Date, doc="fecha3Tlmp")
+    encrypted_vat_number = Column("tba_hora", String(14), doc="Introduzca C.B.Encriptado")
+    hour_type = Column("tip_hora", String(1), doc="T -> Trabajo / P -> Paro")
+
+
+class EmployeeTypes(ReadOnlyRow, LegacyBase):
+    """Maestro de Categorías Profesionales de los Empleados (tipo-op)"""
+    __tablename__ = "tipo-op"
+
+    category = Column("categoria", String(20), doc="Introduzca Descripción de la Categoría")
+    user_character1 = Column("char1_al", String(100), doc="character1Usr")
+    character1tlmp = Column("char1_tipo-op", String(8), doc="character1Tlmp")
+    user_character2 = Column("char2_al", String(100), doc="character2Usr")
+    character2tlmp = Column("char2_tipo-op", String(8), doc="character2Tlmp")
+    user_character3 = Column("char3_al", String(100), doc="character3Usr")
+    character3tlmp = Column("char3_tipo-op", String(100), doc="character3Tlmp")
+    user_character4 = Column("char4_al", String(100), doc="character4Usr")
+    character4tlmp = Column("char4_tipo-op", String(100), doc="character4Tlmp")
+    user_character5 = Column("char5_al", String(100), doc="character5Usr")
+    user_character6 = Column("char6_al", String(100), doc="character6Usr")
+    user_character7 = Column("char7_al", String(100), doc="character7Usr")
+    user_character8 = Column("char8_al", String(100), doc="character8Usr")
+    user_decimal1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    temporary_decimal1 = Column("dec1_tipo-op", Numeric(7, 2), doc="decimal1Tlmp")
+    decimal_to_user = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    decimal_to_ton_of_limestone_mixture_price = Column("dec2_tipo-op", Numeric(7, 2), doc="decimal2Tlmp")
+    user_decimal3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    temporary_decimal3 = Column("dec3_tipo-op", Numeric(11, 3), doc="decimal3Tlmp")
+    user_decimal4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    temperature_in_celsius = Column("dec4_tipo-op", Numeric(11, 3), doc="decimal4Tlmp")
+    user_decimal5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_decimal6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    editor1user = Column("edi1_al", String(1000), doc="editor1Usr")
+    usereditor2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    date1user = Column("fec1_al", Date, doc="fecha1Usr")
+    date1tlmp = Column("fec1_tipo-op", Date, doc="fecha1Tlmp")
+    user_date2 = Column("fec2_al", Date, doc="fecha2Usr")
+    date2tlmp = Column("fec2_tipo-op", Date, doc="fecha2Tlmp")
+    user_date3 = Column("fec3_al", Date, doc="fecha3Usr")
+    date_3rd_quarter_tlmp = Column("fec3_tipo-op", Date, doc="fecha3Tlmp")
+    employee_type = Column("tipo_op", Integer, doc="Introduzca Código de Categoría")
+
+
+class PotentialCustomer(LegacyBase):
+    """Clientes Potenciales (tl_dir)"""
+    __tablename__ = "tl_dir"
+
+    last_modified_date = Column("act_dir", Date, doc="Introduzca Fecha de Actualización")
+    has_attachments = Column("adj_dir", Boolean, doc="Documentos Adjuntos")
+    creation_date = Column("alt_dir", Date, doc="Introduzca la Fecha de Alta")
+    is_deregistered = Column("baj_dir", Boolean, doc="¿Baja?")
+    is_locked = Column("blq_dir", Boolean, doc="Bloqueado")
+    user_char1 = Column("char1_al", String(100), doc="character1Usr")
+    user_char2 = Column("char2_al", String(100), doc="character2Usr")
+    user_char3 = Column("char3_al", String(100), doc="character3Usr")
+    user_char4 = Column("char4_al", String(100), doc="character4Usr")
+    user_char5 = Column("char5_al", String(100), doc="character5Usr")
+    user_char6 = Column("char6_al", String(100), doc="character6Usr")
+    user_char7 = Column("char7_al", String(100), doc="character7Usr")
+    user_char8 = Column("char8_al", String(100), doc="character8Usr")
+    vat_number = Column("cif_dir", String(18), doc="Introduzca CIF")
+    customer_ambit = Column("cli_amb", Integer, doc="Introduzca el ambito del cliente")
+    association_id = Column("cod_asoc", Integer, doc="Introduzca Código Asociación")
+    customer_id = Column("cod_cli", Integer, doc="Introduzca el Código de Cliente")
+    potential_customer_id = Column("cod_dir", Integer, doc="Introduzca Código cliente potencial")
+    language_id = Column("cod_idi", String(3), doc="Introduzca Idioma")
+    legal_form_id = Column("cod_jur", Integer, doc="Introduzca Código Forma Jurídica")
+    country_id = Column("cod_pai", String(2), doc="Introduzca Código de Pais")
+    periodicity_id = Column("cod_perf", Integer, doc="Periodicidad. Visita")
+    potential_customer_contact_id = Column("cod_prof", Integer, doc="Introduzca Persona de Contacto")
+    province_id = Column("cod_provi", Integer, doc="Introduzca Código de Provincia")
+    sales_representative_id = Column("cod_rep", Integer, doc="Introduzca Agente Comercial")
+    subzone_id = Column("cod_szon", Integer, doc="Introduzca Código Subzona")
+    treatment_id = Column("cod_tto", String(4), doc="Tratamiento")
+    street_type = Column("cod_via", String(2), doc="Introduzca Sigla de la Vía Pública")
+    zone_id = Column("cod_zon", Integer, doc="Introduzca el Código de Zona Comercial")
+    user_dec1 = Column("dec1_al", Numeric(11, 3), doc="decimal1Usr")
+    user_dec2 = Column("dec2_al", Numeric(11, 3), doc="decimal2Usr")
+    user_dec3 = Column("dec3_al", Numeric(11, 3), doc="decimal3Usr")
+    user_dec4 = Column("dec4_al", Numeric(11, 3), doc="decimal4Usr")
+    user_dec5 = Column("dec5_al", Numeric(11, 3), doc="decimal5Usr")
+    user_dec6 = Column("dec6_al", Numeric(11, 3), doc="decimal6Usr")
+    street_name = Column("dom_dir", String(55), doc="Introduzca Domicilio")
+    send_newsletter = Column("ebo_dir", Boolean, doc="Emitir Boletines")
+    user_edi1 = Column("edi1_al", String(1000), doc="editor1Usr")
+    user_edi2 = Column("edi2_al", String(1000), doc="editor2Usr")
+    user_fec1 = Column("fec1_al", Date, doc="fecha1Usr")
+    user_fec2 = Column("fec2_al", Date, doc="fecha2Usr")
+    user_fec3 = Column("fec3_al", Date, doc="fecha3Usr")
+    unique_id = Column("Id_unico", BigInteger, primary_key=True, doc="Id único")
+    name = Column("nom_dir", String(55), doc="Introduzca Nombre Cliente Potencial")
+    street_number = Column("num_dir", String(4), doc="Introduzca número de la vía pública")
+    notes = Column("obs_dir", String(800), doc="Observaciones")
+    city = Column("pob_dir", String(35), doc="Introduzca Población")
+    postal_code = Column("pos_dir", Integer, doc="Introduzca Código Postal")
+    commercial_follow_up = Column("pres_dir", String(1), doc="Introduzca Situación Cliente Potencial")
+    business_name = Column("raz_dir", String(100), doc="Introduzca Razón Social")
+    is_resident = Column("resi_dir", Boolean, doc="Extranjero Residente")
+    is_pending_review = Column("rev_dir", Boolean, doc="Pendiente Revisión")
+    phone = Column("tel_prof", String(18), doc="Introduzca Teléfono")
+    web = Column("web_dir", String(45), doc="Introduzca URL")
@@ -0,0 +1,20779 @@
+# Generado por app/codegen/generate.py a partir de TablasGraphQL_comas_utf8.txt. No editar.
+# generator: 1 source: 7f1069ea19b1c2c6d5bb272b627a073181aaeead300732bae0b38b7c925d76a8
+"""
+Tipos GraphQL y filtros de las tablas del diccionario de datos heredado
+"""
+
+import graphene
+from graphene import Boolean, Date, DateTime, Float, Int, String
+from graphene_sqlalchemy import SQLAlchemyObjectType
+from app.generated import legacy_models as models
+from app.schemas.legacy import legacy_list_field
+
+
+class Notes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Notes
+        name = "LegacyNotes"
+        description = "Control de Avisos"
+
+
+class NotesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyNotesFilter"
+
+    activity = Float()
+    activity_gte = Float()
+    activity_lte = Float()
+    attachments = Boolean()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    item = String()
+    item_contains = String()
+    assigned = Boolean()
+    charge = Boolean()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    closing_date = Date()
+    closing_date_gte = Date()
+    closing_date_lte = Date()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    scope_r_833 = Int()
+    scope_r_833_gte = Int()
+    scope_r_833_lte = Int()
+    activity_r_502 = Int()
+    activity_r_502_gte = Int()
+    activity_r_502_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    original_notice = Int()
+    original_notice_gte = Int()
+    original_notice_lte = Int()
+    shipping_code = Int()
+    shipping_code_gte = Int()
+    shipping_code_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    contract = Int()
+    contract_gte = Int()
+    contract_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    potential_customer = Int()
+    potential_customer_gte = Int()
+    potential_customer_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    status = Int()
+    status_gte = Int()
+    status_lte = Int()
+    service_number = Int()
+    service_number_gte = Int()
+    service_number_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    country = String()
+    country_contains = String()
+    priority = String()
+    priority_contains = String()
+    origin = String()
+    origin_contains = String()
+    code_r_210 = Int()
+    code_r_210_gte = Int()
+    code_r_210_lte = Int()
+    representative_code = Int()
+    representative_code_gte = Int()
+    representative_code_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    series = String()
+    series_contains = String()
+    code_r_699 = Int()
+    code_r_699_gte = Int()
+    code_r_699_lte = Int()
+    notification_type = String()
+    notification_type_contains = String()
+    user = String()
+    user_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    area = Int()
+    area_gte = Int()
+    area_lte = Int()
+    customer_potential_customer = Boolean()
+    neighborhood = String()
+    neighborhood_contains = String()
+    comment = String()
+    comment_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_138 = Float()
+    temperature_in_celsius_r_138_gte = Float()
+    temperature_in_celsius_r_138_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    description_r_791 = String()
+    description_r_791_contains = String()
+    address = String()
+    address_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    destination_employee = Int()
+    destination_employee_gte = Int()
+    destination_employee_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    sent_email_associated_employee = Boolean()
+    email = String()
+    email_contains = String()
+    origin_employee = Int()
+    origin_employee_gte = Int()
+    origin_employee_lte = Int()
+    sent_employee_associated_sms = Boolean()
+    est_avis = Boolean()
+    notification_status = String()
+    notification_status_contains = String()
+    fax = String()
+    fax_contains = String()
+    response_date = Date()
+    response_date_gte = Date()
+    response_date_lte = Date()
+    customer_system_creation_date = Date()
+    customer_system_creation_date_gte = Date()
+    customer_system_creation_date_lte = Date()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    allocation_date = Date()
+    allocation_date_gte = Date()
+    allocation_date_lte = Date()
+    expected_date = Date()
+    expected_date_gte = Date()
+    expected_date_lte = Date()
+    request_date = Date()
+    request_date_gte = Date()
+    request_date_lte = Date()
+    notification_reception_date = Date()
+    notification_reception_date_gte = Date()
+    notification_reception_date_lte = Date()
+    actual_resolution_end_date = Date()
+    actual_resolution_end_date_gte = Date()
+    actual_resolution_end_date_lte = Date()
+    actual_resolution_start_date = Date()
+    actual_resolution_start_date_gte = Date()
+    actual_resolution_start_date_lte = Date()
+    customer_system_creation_time = String()
+    customer_system_creation_time_contains = String()
+    estimated_resolution_start_time = String()
+    estimated_resolution_start_time_contains = String()
+    time = String()
+    time_contains = String()
+    request_time = String()
+    request_time_contains = String()
+    notification_reception_time = String()
+    notification_reception_time_contains = String()
+    actual_resolution_end_time = String()
+    actual_resolution_end_time_contains = String()
+    actual_resolution_start_time = String()
+    actual_resolution_start_time_contains = String()
+    actual_resolution_hours = String()
+    actual_resolution_hours_contains = String()
+    theoretical_resolution_hours = String()
+    theoretical_resolution_hours_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    number = String()
+    number_contains = String()
+    requester_person = String()
+    requester_person_contains = String()
+    city = String()
+    city_contains = String()
+    published = Boolean()
+    customer_r_395 = Int()
+    customer_r_395_gte = Int()
+    customer_r_395_lte = Int()
+    destination = String()
+    destination_contains = String()
+    potential_customer_r_468 = Int()
+    potential_customer_r_468_gte = Int()
+    potential_customer_r_468_lte = Int()
+    origin_r_892 = String()
+    origin_r_892_contains = String()
+    origin_r_834 = String()
+    origin_r_834_contains = String()
+    p_ver_avis = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    resolution = String()
+    resolution_contains = String()
+    subactivity_r_912 = Float()
+    subactivity_r_912_gte = Float()
+    subactivity_r_912_lte = Float()
+    show_load_by = String()
+    show_load_by_contains = String()
+    phone_number = String()
+    phone_number_contains = String()
+    document = String()
+    document_contains = String()
+
+
+class NoticeDrafts(SQLAlchemyObjectType):
+    class Meta:
+        model = models.NoticeDrafts
+        name = "LegacyNoticeDrafts"
+        description = "Borradores de Avisos"
+
+
+class NoticeDraftsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyNoticeDraftsFilter"
+
+    has_attachments = Boolean()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    product_id = String()
+    product_id_contains = String()
+    assigned = Boolean()
+    charge = Boolean()
+    customer_or_potencial_id = Int()
+    customer_or_potencial_id_gte = Int()
+    customer_or_potencial_id_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    characteristic1_code = String()
+    characteristic1_code_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    characteristics_2d_temp = String()
+    characteristics_2d_temp_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    characteristics_3pl_mapping = String()
+    characteristics_3pl_mapping_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    characteristics_4tlmp = String()
+    characteristics_4tlmp_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    closing_date = Date()
+    closing_date_gte = Date()
+    closing_date_lte = Date()
+    customer_vat_id = String()
+    customer_vat_id_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    activity_id = Int()
+    activity_id_gte = Int()
+    activity_id_lte = Int()
+    service_id = String()
+    service_id_contains = String()
+    notice_id = Int()
+    notice_id_gte = Int()
+    notice_id_lte = Int()
+    draft_id = Int()
+    draft_id_gte = Int()
+    draft_id_lte = Int()
+    original_notice = Int()
+    original_notice_gte = Int()
+    original_notice_lte = Int()
+    shipping_address_id = Int()
+    shipping_address_id_gte = Int()
+    shipping_address_id_lte = Int()
+    shipping_address_id_cod_cen = Int()
+    shipping_address_id_cod_cen_gte = Int()
+    shipping_address_id_cod_cen_lte = Int()
+    contract_id = Int()
+    contract_id_gte = Int()
+    contract_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    notice_status = Int()
+    notice_status_gte = Int()
+    notice_status_lte = Int()
+    service_number = Int()
+    service_number_gte = Int()
+    service_number_lte = Int()
+    work_id = Int()
+    work_id_gte = Int()
+    work_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    priority_id = String()
+    priority_id_contains = String()
+    origin_id = String()
+    origin_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    subactivity_id = Int()
+    subactivity_id_gte = Int()
+    subactivity_id_lte = Int()
+    serial_number = String()
+    serial_number_contains = String()
+    notice_type = String()
+    notice_type_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    draft_user_id = String()
+    draft_user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    customer_or_potential = Boolean()
+    neighborhood = String()
+    neighborhood_contains = String()
+    comments = String()
+    comments_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    product_description = String()
+    product_description_contains = String()
+    notice_description = String()
+    notice_description_contains = String()
+    street_name = String()
+    street_name_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    target_worker = Int()
+    target_worker_gte = Int()
+    target_worker_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    sent_e_mail = Boolean()
+    customer_mail = String()
+    customer_mail_contains = String()
+    origin_worker = Int()
+    origin_worker_gte = Int()
+    origin_worker_lte = Int()
+    draft_errors = String()
+    draft_errors_contains = String()
+    sent_sms = Boolean()
+    open_closed_notice = Boolean()
+    draft_status = String()
+    draft_status_contains = String()
+    notice_status_evo_avis = String()
+    notice_status_evo_avis_contains = String()
+    fax = String()
+    fax_contains = String()
+    reply_date = Date()
+    reply_date_gte = Date()
+    reply_date_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    user_date1 = Date()
+    user_date1_gte = Date()
+    user_date1_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date_2nd_half_temp = Date()
+    date_2nd_half_temp_gte = Date()
+    date_2nd_half_temp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_temp = Date()
+    date_3rd_quarter_temp_gte = Date()
+    date_3rd_quarter_temp_lte = Date()
+    notice_date = Date()
+    notice_date_gte = Date()
+    notice_date_lte = Date()
+    draft_date = Date()
+    draft_date_gte = Date()
+    draft_date_lte = Date()
+    planned_date = Date()
+    planned_date_gte = Date()
+    planned_date_lte = Date()
+    request_date = Date()
+    request_date_gte = Date()
+    request_date_lte = Date()
+    receipt_date = Date()
+    receipt_date_gte = Date()
+    receipt_date_lte = Date()
+    resolution_final_date = Date()
+    resolution_final_date_gte = Date()
+    resolution_final_date_lte = Date()
+    resolution_start_date = Date()
+    resolution_start_date_gte = Date()
+    resolution_start_date_lte = Date()
+    creation_time = String()
+    creation_time_contains = String()
+    resolution_start_time = String()
+    resolution_start_time_contains = String()
+    notice_time = String()
+    notice_time_contains = String()
+    draft_time = String()
+    draft_time_contains = String()
+    request_time = String()
+    request_time_contains = String()
+    receipt_time = String()
+    receipt_time_contains = String()
+    resolution_final_time = String()
+    resolution_final_time_contains = String()
+    resolution_start_time_hrer_avis = String()
+    resolution_start_time_hrer_avis_contains = String()
+    actual_hours_resolution = String()
+    actual_hours_resolution_contains = String()
+    theoretical_hours_resolution = String()
+    theoretical_hours_resolution_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    street_number = String()
+    street_number_contains = String()
+    draft_comments = String()
+    draft_comments_contains = String()
+    request_person = String()
+    request_person_contains = String()
+    city = String()
+    city_contains = String()
+    published_notice = Boolean()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    potential_customer_r_939 = Int()
+    potential_customer_r_939_gte = Int()
+    potential_customer_r_939_lte = Int()
+    business_name = String()
+    business_name_contains = String()
+    notice_reference = String()
+    notice_reference_contains = String()
+    resolution = String()
+    resolution_contains = String()
+    revised_dtraft = Boolean()
+    phone = String()
+    phone_contains = String()
+
+
+class NoticeStatus(SQLAlchemyObjectType):
+    class Meta:
+        model = models.NoticeStatus
+        name = "LegacyNoticeStatus"
+        description = "Maestro de Estados de la gestión de Aviso"
+
+
+class NoticeStatusFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyNoticeStatusFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    characteristic1_code = String()
+    characteristic1_code_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    characteristics_mapping = String()
+    characteristics_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    characteristics_3pl_mapping = String()
+    characteristics_3pl_mapping_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    characteristics_4tlmp = String()
+    characteristics_4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    closure = Boolean()
+    status = Int()
+    status_gte = Int()
+    status_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    custom_decimal6 = Float()
+    custom_decimal6_gte = Float()
+    custom_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    send_email = Boolean()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    date_3qtr_tmp = Date()
+    date_3qtr_tmp_gte = Date()
+    date_3qtr_tmp_lte = Date()
+    create_notification_movement = Boolean()
+    porsic = String()
+    porsic_contains = String()
+    porsil = Boolean()
+    porsin = Int()
+    porsin_gte = Int()
+    porsin_lte = Int()
+    publish = Boolean()
+    responsible_person = Boolean()
+    customer_text = String()
+    customer_text_contains = String()
+    employee_text = String()
+    employee_text_contains = String()
+    information_text = String()
+    information_text_contains = String()
+
+
+class CommercialAction(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CommercialAction
+        name = "LegacyCommercialAction"
+        description = "Movimientos del Seguimiento Comercial"
+
+
+class CommercialActionFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCommercialActionFilter"
+
+    quote_annex = Int()
+    quote_annex_gte = Int()
+    quote_annex_lte = Int()
+    cancellation_reason = String()
+    cancellation_reason_contains = String()
+    has_technical_support = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    document_text = String()
+    document_text_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    offer_description = String()
+    offer_description_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    competition = String()
+    competition_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    incidents = String()
+    incidents_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    commercial_id = String()
+    commercial_id_contains = String()
+    customer_or_potential_id = Int()
+    customer_or_potential_id_gte = Int()
+    customer_or_potential_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    stage_id = Int()
+    stage_id_gte = Int()
+    stage_id_lte = Int()
+    quote_id = Int()
+    quote_id_gte = Int()
+    quote_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    tracking_id = String()
+    tracking_id_contains = String()
+    default_contact_id = Int()
+    default_contact_id_gte = Int()
+    default_contact_id_lte = Int()
+    customer_or_potential = Boolean()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    related_document_id = Int()
+    related_document_id_gte = Int()
+    related_document_id_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    bill_id = Int()
+    bill_id_gte = Int()
+    bill_id_lte = Int()
+    status = String()
+    status_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    time = String()
+    time_contains = String()
+    commercial_action_id = Float()
+    commercial_action_id_gte = Float()
+    commercial_action_id_lte = Float()
+    notes = String()
+    notes_contains = String()
+    is_published = Boolean()
+    is_pending_revision = Boolean()
+    related_document_type = String()
+    related_document_type_contains = String()
+    time_estimate = String()
+    time_estimate_contains = String()
+    quote_version = Int()
+    quote_version_gte = Int()
+    quote_version_lte = Int()
+
+
+class NoticeTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.NoticeTypes
+        name = "LegacyNoticeTypes"
+        description = "Tipos de Avisos"
+
+
+class NoticeTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyNoticeTypesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    characteristic1_code = String()
+    characteristic1_code_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    characteristics_mapping2 = String()
+    characteristics_mapping2_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    characteristics_temperature = String()
+    characteristics_temperature_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    characteristics_4plm = String()
+    characteristics_4plm_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    notification_type = String()
+    notification_type_contains = String()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    description = String()
+    description_contains = String()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date_to_user = Date()
+    date_to_user_gte = Date()
+    date_to_user_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    date_3qtmp = Date()
+    date_3qtmp_gte = Date()
+    date_3qtmp_lte = Date()
+    portal_publishable = Boolean()
+
+
+class Confirming(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Confirming
+        name = "LegacyConfirming"
+        description = "Gestión Confirming"
+
+
+class ConfirmingFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyConfirmingFilter"
+
+    discounted = Float()
+    discounted_gte = Float()
+    discounted_lte = Float()
+    has_attachments = Boolean()
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    confirming_id = Int()
+    confirming_id_gte = Int()
+    confirming_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    accounting_account = String()
+    accounting_account_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    state = String()
+    state_contains = String()
+    user_date1 = Date()
+    user_date1_gte = Date()
+    user_date1_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    is_printed = Boolean()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    confirming_type = String()
+    confirming_type_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class ProductBarcode(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductBarcode
+        name = "LegacyProductBarcode"
+        description = "Diferentes Códigos de Barra para cada Artículo"
+
+
+class ProductBarcodeFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductBarcodeFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    barcode = String()
+    barcode_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    code_type = Int()
+    code_type_gte = Int()
+    code_type_lte = Int()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    is_favorite = Boolean()
+
+
+class ProductBranch(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductBranch
+        name = "LegacyProductBranch"
+        description = "Propiedades de los Artículos en cada Empresa/Delegación"
+
+
+class ProductBranchFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductBranchFilter"
+
+    abc_class = String()
+    abc_class_contains = String()
+    manufacturing_warehouse_id = Int()
+    manufacturing_warehouse_id_gte = Int()
+    manufacturing_warehouse_id_lte = Int()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    replaced_by = String()
+    replaced_by_contains = String()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    receipt_batch_counter = Int()
+    receipt_batch_counter_gte = Int()
+    receipt_batch_counter_lte = Int()
+    minimum_quantity_second_discount = Int()
+    minimum_quantity_second_discount_gte = Int()
+    minimum_quantity_second_discount_lte = Int()
+    receipts_warehouse_id = Int()
+    receipts_warehouse_id_gte = Int()
+    receipts_warehouse_id_lte = Int()
+    issues_warehouse_id = Int()
+    issues_warehouse_id_gte = Int()
+    issues_warehouse_id_lte = Int()
+    tariff_code = Int()
+    tariff_code_gte = Int()
+    tariff_code_lte = Int()
+    product_id = String()
+    product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    product_range_id = Int()
+    product_range_id_gte = Int()
+    product_range_id_lte = Int()
+    vat_id = Int()
+    vat_id_gte = Int()
+    vat_id_lte = Int()
+    canary_vat_id = Int()
+    canary_vat_id_gte = Int()
+    canary_vat_id_lte = Int()
+    housing_vat_id = Int()
+    housing_vat_id_gte = Int()
+    housing_vat_id_lte = Int()
+    origin_country_id = String()
+    origin_country_id_contains = String()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    status_id = Int()
+    status_id_gte = Int()
+    status_id_lte = Int()
+    receipts_location_id = String()
+    receipts_location_id_contains = String()
+    issues_location_id = String()
+    issues_location_id_contains = String()
+    packing_unit_base = String()
+    packing_unit_base_contains = String()
+    packing_unit_purchases = String()
+    packing_unit_purchases_contains = String()
+    packing_unit_manufacturing = String()
+    packing_unit_manufacturing_contains = String()
+    packing_unit_stock = String()
+    packing_unit_stock_contains = String()
+    packing_unit_sales = String()
+    packing_unit_sales_contains = String()
+    receipts_zone_id = String()
+    receipts_zone_id_contains = String()
+    issues_zone_id = String()
+    issues_zone_id_contains = String()
+    consumption_average = Float()
+    consumption_average_gte = Float()
+    consumption_average_lte = Float()
+    initial_cost = Float()
+    initial_cost_gte = Float()
+    initial_cost_lte = Float()
+    weighted_average_cost = Float()
+    weighted_average_cost_gte = Float()
+    weighted_average_cost_lte = Float()
+    is_tradable = Boolean()
+    stock_reserved = Float()
+    stock_reserved_gte = Float()
+    stock_reserved_lte = Float()
+    serial_number_counter = Int()
+    serial_number_counter_gte = Int()
+    serial_number_counter_lte = Int()
+    account_purchases = String()
+    account_purchases_contains = String()
+    account_passed_returns_tax = String()
+    account_passed_returns_tax_contains = String()
+    account_supported_returns_tax = String()
+    account_supported_returns_tax_contains = String()
+    account_sales_returns = String()
+    account_sales_returns_contains = String()
+    has_vendor_control = Boolean()
+    account_passed_tax = String()
+    account_passed_tax_contains = String()
+    account_supported_tax = String()
+    account_supported_tax_contains = String()
+    account_sales = String()
+    account_sales_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    group_discount = Boolean()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    is_manufactured = Boolean()
+    last_deleted_date = Date()
+    last_deleted_date_gte = Date()
+    last_deleted_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    kit_increment = Float()
+    kit_increment_gte = Float()
+    kit_increment_lte = Float()
+    kit_currency_id = String()
+    kit_currency_id_contains = String()
+    kit_increment_percent = Float()
+    kit_increment_percent_gte = Float()
+    kit_increment_percent_lte = Float()
+    has_batch_number_control = Boolean()
+    purchase_batch = Float()
+    purchase_batch_gte = Float()
+    purchase_batch_lte = Float()
+    minimum_stock_criteria_months = Int()
+    minimum_stock_criteria_months_gte = Int()
+    minimum_stock_criteria_months_lte = Int()
+    shows_message = Boolean()
+    message = String()
+    message_contains = String()
+    service_level = Float()
+    service_level_gte = Float()
+    service_level_lte = Float()
+    has_serial_number_control = Boolean()
+    cost_origin = String()
+    cost_origin_contains = String()
+    receipt_batch_prefix = String()
+    receipt_batch_prefix_contains = String()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    serial_number_prefix = String()
+    serial_number_prefix_contains = String()
+    stock_assigned = Float()
+    stock_assigned_gte = Float()
+    stock_assigned_lte = Float()
+    maximum_stock_criteria_weeks = Int()
+    maximum_stock_criteria_weeks_gte = Int()
+    maximum_stock_criteria_weeks_lte = Int()
+    stock_minimum = Float()
+    stock_minimum_gte = Float()
+    stock_minimum_lte = Float()
+    stock_maximum = Float()
+    stock_maximum_gte = Float()
+    stock_maximum_lte = Float()
+    allows_negative_stock = Boolean()
+    stock_pending_manufacture = Float()
+    stock_pending_manufacture_gte = Float()
+    stock_pending_manufacture_lte = Float()
+    stock_pending_receive = Float()
+    stock_pending_receive_gte = Float()
+    stock_pending_receive_lte = Float()
+    stock_pending_issue = Float()
+    stock_pending_issue_gte = Float()
+    stock_pending_issue_lte = Float()
+    stock_real = Float()
+    stock_real_gte = Float()
+    stock_real_lte = Float()
+    stock_reserved_at_location = Float()
+    stock_reserved_at_location_gte = Float()
+    stock_reserved_at_location_lte = Float()
+    stock_transit_send = Float()
+    stock_transit_send_gte = Float()
+    stock_transit_send_lte = Float()
+    stock_initial = Float()
+    stock_initial_gte = Float()
+    stock_initial_lte = Float()
+    stock_transit_receive = Float()
+    stock_transit_receive_gte = Float()
+    stock_transit_receive_lte = Float()
+    installation_time_lower = Float()
+    installation_time_lower_gte = Float()
+    installation_time_lower_lte = Float()
+    installation_time = Float()
+    installation_time_gte = Float()
+    installation_time_lte = Float()
+    installation_time_upper = Float()
+    installation_time_upper_gte = Float()
+    installation_time_upper_lte = Float()
+    minimum_stock_criteria_service_time = Float()
+    minimum_stock_criteria_service_time_gte = Float()
+    minimum_stock_criteria_service_time_lte = Float()
+    location = String()
+    location_contains = String()
+    manufacturing_location_id = String()
+    manufacturing_location_id_contains = String()
+    last_work_item_price = Float()
+    last_work_item_price_gte = Float()
+    last_work_item_price_lte = Float()
+    manufacturing_zone_id = String()
+    manufacturing_zone_id_contains = String()
+
+
+class ProductDescription(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductDescription
+        name = "LegacyProductDescription"
+        description = "Descripciones Alternativas del cada Articulo"
+
+
+class ProductDescriptionFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductDescriptionFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    language_id = String()
+    language_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    alt_description = String()
+    alt_description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+
+
+class ProductSerialNumber(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductSerialNumber
+        name = "LegacyProductSerialNumber"
+        description = "Maestro de Números de Serie de los Artículos con Tratamiento de Número d"
+
+
+class ProductSerialNumberFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductSerialNumberFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    is_locked = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    serial_number = String()
+    serial_number_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    origin_document = String()
+    origin_document_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    origin = String()
+    origin_contains = String()
+
+
+class Product(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Product
+        name = "LegacyProduct"
+        description = "Maestro de las Propiedades Generales de los Artículos"
+
+
+class ProductFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductFilter"
+
+    has_attachments = Boolean()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    auxiliar_code = String()
+    auxiliar_code_contains = String()
+    is_deregistered = Boolean()
+    container_type = String()
+    container_type_contains = String()
+    ecommerce_commercial_description_criteria = String()
+    ecommerce_commercial_description_criteria_contains = String()
+    ecommerce_description_criteria = String()
+    ecommerce_description_criteria_contains = String()
+    has_expiry_control = Boolean()
+    fluorinated_gas_quantity = Float()
+    fluorinated_gas_quantity_gte = Float()
+    fluorinated_gas_quantity_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    ecommerce_image_criteria = String()
+    ecommerce_image_criteria_contains = String()
+    cfdi_sat_code = String()
+    cfdi_sat_code_contains = String()
+    default_attachment_id = Int()
+    default_attachment_id_gte = Int()
+    default_attachment_id_lte = Int()
+    equivalency = String()
+    equivalency_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    classification1_id = Int()
+    classification1_id_gte = Int()
+    classification1_id_lte = Int()
+    classification2_id = Int()
+    classification2_id_gte = Int()
+    classification2_id_lte = Int()
+    classification3_id = Int()
+    classification3_id_gte = Int()
+    classification3_id_lte = Int()
+    classification4_id = Int()
+    classification4_id_gte = Int()
+    classification4_id_lte = Int()
+    discount_classification = Int()
+    discount_classification_gte = Int()
+    discount_classification_lte = Int()
+    group_id = String()
+    group_id_contains = String()
+    subgroup_id = String()
+    subgroup_id_contains = String()
+    measurement_unit_base = String()
+    measurement_unit_base_contains = String()
+    telematel_code = String()
+    telematel_code_contains = String()
+    is_discontinued = Boolean()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description_long = String()
+    description_long_contains = String()
+    description_short = String()
+    description_short_contains = String()
+    is_compounded = Boolean()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    is_expenses = Boolean()
+    has_fluorinated_gas = Boolean()
+    is_tool = Boolean()
+    id_art = String()
+    id_art_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    is_kit = Boolean()
+    is_ancilliary = Boolean()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    is_assembled = Boolean()
+    notes = String()
+    notes_contains = String()
+    is_work_item = Boolean()
+    is_on_request = Boolean()
+    is_published = Boolean()
+    reference = String()
+    reference_contains = String()
+    has_freight_retention = Boolean()
+    is_service = Boolean()
+    has_recycling_tax = Boolean()
+    equivalency_mode = String()
+    equivalency_mode_contains = String()
+    fluorinated_gas_type = String()
+    fluorinated_gas_type_contains = String()
+
+
+class ProductClassificationLanguages(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLanguages
+        name = "LegacyProductClassificationLanguages"
+        description = "Descripción Multi-idioma de los Tipos de Clasificaciones"
+
+
+class ProductClassificationLanguagesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLanguagesFilter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    language_id = String()
+    language_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+
+
+class ProductByClassification(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductByClassification
+        name = "LegacyProductByClassification"
+        description = "Diferentes Clasificaciones a las que Pertenece cada Artículo"
+
+
+class ProductByClassificationFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductByClassificationFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    product_classification_level_6 = Int()
+    product_classification_level_6_gte = Int()
+    product_classification_level_6_lte = Int()
+    product_classification_level_7 = Int()
+    product_classification_level_7_gte = Int()
+    product_classification_level_7_lte = Int()
+    product_classification_level_8 = Int()
+    product_classification_level_8_gte = Int()
+    product_classification_level_8_lte = Int()
+    product_classification_level_9 = Int()
+    product_classification_level_9_gte = Int()
+    product_classification_level_9_lte = Int()
+
+
+class ProductClassification(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassification
+        name = "LegacyProductClassification"
+        description = "Maestro de Tipos de Clasificaciones en los que se Puede Agrupar los Arti"
+
+
+class ProductClassificationFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationFilter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+
+
+class ProductClassificationLevel1(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel1
+        name = "LegacyProductClassificationLevel1"
+        description = "Clasificaciones de Articulos de Nivel 1"
+
+
+class ProductClassificationLevel1Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel1Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel2(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel2
+        name = "LegacyProductClassificationLevel2"
+        description = "Clasificaciones de Articulos de Nivel 2"
+
+
+class ProductClassificationLevel2Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel2Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel3(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel3
+        name = "LegacyProductClassificationLevel3"
+        description = "Clasificaciones de Articulos de Nivel 3"
+
+
+class ProductClassificationLevel3Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel3Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel4(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel4
+        name = "LegacyProductClassificationLevel4"
+        description = "Clasificaciones de Articulos de Nivel 4"
+
+
+class ProductClassificationLevel4Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel4Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel5(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel5
+        name = "LegacyProductClassificationLevel5"
+        description = "Clasificaciones de Articulos de Nivel 5"
+
+
+class ProductClassificationLevel5Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel5Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel6(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel6
+        name = "LegacyProductClassificationLevel6"
+        description = "Clasificaciones de Articulos de Nivel 6"
+
+
+class ProductClassificationLevel6Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel6Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    product_classification_level_6 = Int()
+    product_classification_level_6_gte = Int()
+    product_classification_level_6_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel7(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel7
+        name = "LegacyProductClassificationLevel7"
+        description = "Clasificaciones de Articulos de Nivel 7"
+
+
+class ProductClassificationLevel7Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel7Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    product_classification_level_6 = Int()
+    product_classification_level_6_gte = Int()
+    product_classification_level_6_lte = Int()
+    product_classification_level_7 = Int()
+    product_classification_level_7_gte = Int()
+    product_classification_level_7_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel8(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel8
+        name = "LegacyProductClassificationLevel8"
+        description = "Clasificaciones de Articulos de Nivel 8"
+
+
+class ProductClassificationLevel8Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel8Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    product_classification_level_6 = Int()
+    product_classification_level_6_gte = Int()
+    product_classification_level_6_lte = Int()
+    product_classification_level_7 = Int()
+    product_classification_level_7_gte = Int()
+    product_classification_level_7_lte = Int()
+    product_classification_level_8 = Int()
+    product_classification_level_8_gte = Int()
+    product_classification_level_8_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductClassificationLevel9(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductClassificationLevel9
+        name = "LegacyProductClassificationLevel9"
+        description = "Clasificaciones de Articulos de Nivel 9"
+
+
+class ProductClassificationLevel9Filter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductClassificationLevel9Filter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_classification_id = Int()
+    product_classification_id_gte = Int()
+    product_classification_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    product_classification_level_1 = Int()
+    product_classification_level_1_gte = Int()
+    product_classification_level_1_lte = Int()
+    product_classification_level_2 = Int()
+    product_classification_level_2_gte = Int()
+    product_classification_level_2_lte = Int()
+    product_classification_level_3 = Int()
+    product_classification_level_3_gte = Int()
+    product_classification_level_3_lte = Int()
+    product_classification_level_4 = Int()
+    product_classification_level_4_gte = Int()
+    product_classification_level_4_lte = Int()
+    product_classification_level_5 = Int()
+    product_classification_level_5_gte = Int()
+    product_classification_level_5_lte = Int()
+    product_classification_level_6 = Int()
+    product_classification_level_6_gte = Int()
+    product_classification_level_6_lte = Int()
+    product_classification_level_7 = Int()
+    product_classification_level_7_gte = Int()
+    product_classification_level_7_lte = Int()
+    product_classification_level_8 = Int()
+    product_classification_level_8_gte = Int()
+    product_classification_level_8_lte = Int()
+    product_classification_level_9 = Int()
+    product_classification_level_9_gte = Int()
+    product_classification_level_9_lte = Int()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class ProductBrand(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductBrand
+        name = "LegacyProductBrand"
+        description = "Maestro de las Diferentes Marcas a las que Pueden Pertenecer los Artícul"
+
+
+class ProductBrandFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductBrandFilter"
+
+    has_attachments = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    brand_name = String()
+    brand_name_contains = String()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    web = String()
+    web_contains = String()
+
+
+class AccountingMovements(SQLAlchemyObjectType):
+    class Meta:
+        model = models.AccountingMovements
+        name = "LegacyAccountingMovements"
+        description = "Movimientos contables"
+
+
+class AccountingMovementsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyAccountingMovementsFilter"
+
+    movement_accumulated = Boolean()
+    movement_note = Int()
+    movement_note_gte = Int()
+    movement_note_lte = Int()
+    movement_entry_id = Int()
+    movement_entry_id_gte = Int()
+    movement_entry_id_lte = Int()
+    charged_structural_cost = Boolean()
+    account_id = String()
+    account_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    financial_year = Int()
+    financial_year_gte = Int()
+    financial_year_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    movement_period = Int()
+    movement_period_gte = Int()
+    movement_period_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    movement_comments = String()
+    movement_comments_contains = String()
+    distributed_accounting = Boolean()
+    movement_document = String()
+    movement_document_contains = String()
+    movement_date = Date()
+    movement_date_gte = Date()
+    movement_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    movement_amount = Float()
+    movement_amount_gte = Float()
+    movement_amount_lte = Float()
+    movement_book = Int()
+    movement_book_gte = Int()
+    movement_book_lte = Int()
+    movement_dotted = String()
+    movement_dotted_contains = String()
+    movement_section = Int()
+    movement_section_gte = Int()
+    movement_section_lte = Int()
+    movement_document_type = String()
+    movement_document_type_contains = String()
+    third_party_ambit = Int()
+    third_party_ambit_gte = Int()
+    third_party_ambit_lte = Int()
+    third_party_movement = String()
+    third_party_movement_contains = String()
+    account_debit_or_credit = String()
+    account_debit_or_credit_contains = String()
+
+
+class PromissoryNotes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PromissoryNotes
+        name = "LegacyPromissoryNotes"
+        description = "Gestión Pagarés"
+
+
+class PromissoryNotesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPromissoryNotesFilter"
+
+    has_attachments = Boolean()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    supplier_id = Int()
+    supplier_id_gte = Int()
+    supplier_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    state = String()
+    state_contains = String()
+    user_date1 = Date()
+    user_date1_gte = Date()
+    user_date1_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    issue_date = Date()
+    issue_date_gte = Date()
+    issue_date_lte = Date()
+    settlement_date = Date()
+    settlement_date_gte = Date()
+    settlement_date_lte = Date()
+    due_date = Date()
+    due_date_gte = Date()
+    due_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    is_printed = Boolean()
+    promissory_note_id = Int()
+    promissory_note_id_gte = Int()
+    promissory_note_id_lte = Int()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    check_number = String()
+    check_number_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class Remittances(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Remittances
+        name = "LegacyRemittances"
+        description = "Gestión Remesas"
+
+
+class RemittancesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyRemittancesFilter"
+
+    has_attachments = Boolean()
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    remittance_id = Int()
+    remittance_id_gte = Int()
+    remittance_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    state = String()
+    state_contains = String()
+    user_date1 = Date()
+    user_date1_gte = Date()
+    user_date1_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    accumulated_amount = Float()
+    accumulated_amount_gte = Float()
+    accumulated_amount_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    is_printed = Boolean()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    remittance_type = String()
+    remittance_type_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class Priorities(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Priorities
+        name = "LegacyPriorities"
+        description = "Prioridades"
+
+
+class PrioritiesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPrioritiesFilter"
+
+    days_quantity = Int()
+    days_quantity_gte = Int()
+    days_quantity_lte = Int()
+    hours_quantity = Int()
+    hours_quantity_gte = Int()
+    hours_quantity_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    characteristic1_code = String()
+    characteristic1_code_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    characteristics_to_materials_planning = String()
+    characteristics_to_materials_planning_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    characteristic_3d_temp = String()
+    characteristic_3d_temp_contains = String()
+    user_character_r_91 = String()
+    user_character_r_91_contains = String()
+    characteristics_for_template = String()
+    characteristics_for_template_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    priority = String()
+    priority_contains = String()
+    decimal1_user = Float()
+    decimal1_user_gte = Float()
+    decimal1_user_lte = Float()
+    decimal1_currency = Float()
+    decimal1_currency_gte = Float()
+    decimal1_currency_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal2_rounding = Float()
+    decimal2_rounding_gte = Float()
+    decimal2_rounding_lte = Float()
+    decimal3_user = Float()
+    decimal3_user_gte = Float()
+    decimal3_user_lte = Float()
+    decimal3_temp = Float()
+    decimal3_temp_gte = Float()
+    decimal3_temp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5_user = Float()
+    decimal5_user_gte = Float()
+    decimal5_user_lte = Float()
+    decimal6_user = Float()
+    decimal6_user_gte = Float()
+    decimal6_user_lte = Float()
+    description = String()
+    description_contains = String()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_tmp = Date()
+    date1_tmp_gte = Date()
+    date1_tmp_lte = Date()
+    date_to_user = Date()
+    date_to_user_gte = Date()
+    date_to_user_lte = Date()
+    date_2nd_temp = Date()
+    date_2nd_temp_gte = Date()
+    date_2nd_temp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    date_3rd_quarter_temp = Date()
+    date_3rd_quarter_temp_gte = Date()
+    date_3rd_quarter_temp_lte = Date()
+
+
+class Invoicenotification(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Invoicenotification
+        name = "LegacyInvoicenotification"
+        description = "Cabecera Notificación de Facturas"
+
+
+class InvoicenotificationFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyInvoicenotificationFilter"
+
+    has_attachments = Boolean()
+    mean_payment = String()
+    mean_payment_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    notification_id = Int()
+    notification_id_gte = Int()
+    notification_id_lte = Int()
+    supplier_id = Int()
+    supplier_id_gte = Int()
+    supplier_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    payment_description = String()
+    payment_description_contains = String()
+    invoice_type_description = String()
+    invoice_type_description_contains = String()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    printed = Boolean()
+    notes = String()
+    notes_contains = String()
+    origin = String()
+    origin_contains = String()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    sale_point = String()
+    sale_point_contains = String()
+    reference = String()
+    reference_contains = String()
+    status = String()
+    status_contains = String()
+    applicant = String()
+    applicant_contains = String()
+    invoice_type = String()
+    invoice_type_contains = String()
+
+
+class InvoicenotificationLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.InvoicenotificationLines
+        name = "LegacyInvoicenotificationLines"
+        description = "Líneas de Notificaciones de Facturas"
+
+
+class InvoicenotificationLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyInvoicenotificationLinesFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    product_id = String()
+    product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    notification_id = Int()
+    notification_id_gte = Int()
+    notification_id_lte = Int()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    sales_order_id = String()
+    sales_order_id_contains = String()
+    product_code_corporative = String()
+    product_code_corporative_contains = String()
+    price_quantity = Float()
+    price_quantity_gte = Float()
+    price_quantity_lte = Float()
+    description = String()
+    description_contains = String()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    ean = String()
+    ean_contains = String()
+    notification_line_number = Int()
+    notification_line_number_gte = Int()
+    notification_line_number_lte = Int()
+    purchaseorder_line_number = Int()
+    purchaseorder_line_number_gte = Int()
+    purchaseorder_line_number_lte = Int()
+    sales_order_line_number = String()
+    sales_order_line_number_contains = String()
+    purchase_order_id = Int()
+    purchase_order_id_gte = Int()
+    purchase_order_id_lte = Int()
+    notes = String()
+    notes_contains = String()
+    line_order = Int()
+    line_order_gte = Int()
+    line_order_lte = Int()
+    supplier_delivery_note_id = String()
+    supplier_delivery_note_id_contains = String()
+    price = Float()
+    price_gte = Float()
+    price_lte = Float()
+    product_reference = String()
+    product_reference_contains = String()
+    status = String()
+    status_contains = String()
+    origin_line = String()
+    origin_line_contains = String()
+
+
+class DeliverynotificationLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.DeliverynotificationLines
+        name = "LegacyDeliverynotificationLines"
+        description = "Líneas de Notificaciones de Entrega"
+
+
+class DeliverynotificationLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyDeliverynotificationLinesFilter"
+
+    unique_id_pc = String()
+    unique_id_pc_contains = String()
+
+
+class PurchaseDeliveryNotes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PurchaseDeliveryNotes
+        name = "LegacyPurchaseDeliveryNotes"
+        description = "Cabecera del Documento de Albaranes de Compra"
+
+
+class PurchaseDeliveryNotesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPurchaseDeliveryNotesFilter"
+
+    billed = Boolean()
+    attachments = Boolean()
+    advance_payment = Float()
+    advance_payment_gte = Float()
+    advance_payment_lte = Float()
+    purchase_delivery_note_entry = Int()
+    purchase_delivery_note_entry_gte = Int()
+    purchase_delivery_note_entry_lte = Int()
+    taxable_base = Float()
+    taxable_base_gte = Float()
+    taxable_base_lte = Float()
+    taxable_base_1 = Float()
+    taxable_base_1_gte = Float()
+    taxable_base_1_lte = Float()
+    taxable_base_2 = Float()
+    taxable_base_2_gte = Float()
+    taxable_base_2_lte = Float()
+    taxable_base_3 = Float()
+    taxable_base_3_gte = Float()
+    taxable_base_3_lte = Float()
+    blocked = Boolean()
+    gross = Float()
+    gross_gte = Float()
+    gross_lte = Float()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    quantity = Int()
+    quantity_gte = Int()
+    quantity_lte = Int()
+    delivery_note_type = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    characteristic1tlmp = String()
+    characteristic1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    characteristics_mapping = String()
+    characteristics_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    characteristics_3pl = String()
+    characteristics_3pl_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    characteristics_4plm = String()
+    characteristics_4plm_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    delivery_terms = String()
+    delivery_terms_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    warehouse_in_out_number = Int()
+    warehouse_in_out_number_gte = Int()
+    warehouse_in_out_number_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    country = String()
+    country_contains = String()
+    supplier_code = Int()
+    supplier_code_gte = Int()
+    supplier_code_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    code = String()
+    code_contains = String()
+    contact = Int()
+    contact_gte = Int()
+    contact_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user = String()
+    user_contains = String()
+    way = String()
+    way_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    cost = Boolean()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_rounded_two_decimal_places = Float()
+    decimal_to_rounded_two_decimal_places_gte = Float()
+    decimal_to_rounded_two_decimal_places_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    custom_decimal5 = Float()
+    custom_decimal5_gte = Float()
+    custom_decimal5_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    deductible = Boolean()
+    travel_days = Int()
+    travel_days_gte = Int()
+    travel_days_lte = Int()
+    address = String()
+    address_contains = String()
+    postal_district = Int()
+    postal_district_gte = Int()
+    postal_district_lte = Int()
+    pp_discount = Float()
+    pp_discount_gte = Float()
+    pp_discount_lte = Float()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    edi_communication = Boolean()
+    sent_by_email = Boolean()
+    email = String()
+    email_contains = String()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    sent_by_fax = Boolean()
+    fax = String()
+    fax_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date_2nd_half_temp = Date()
+    date_2nd_half_temp_gte = Date()
+    date_2nd_half_temp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    date_3rd_quarter_temp = Date()
+    date_3rd_quarter_temp_gte = Date()
+    date_3rd_quarter_temp_lte = Date()
+    delivery_date = Date()
+    delivery_date_gte = Date()
+    delivery_date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    income_tax_withholding = Float()
+    income_tax_withholding_gte = Float()
+    income_tax_withholding_lte = Float()
+    vat_amount = Float()
+    vat_amount_gte = Float()
+    vat_amount_lte = Float()
+    vat_amount_1 = Float()
+    vat_amount_1_gte = Float()
+    vat_amount_1_lte = Float()
+    vat_amount_2 = Float()
+    vat_amount_2_gte = Float()
+    vat_amount_2_lte = Float()
+    vat_amount_3 = Float()
+    vat_amount_3_gte = Float()
+    vat_amount_3_lte = Float()
+    logistics_amount = Float()
+    logistics_amount_gte = Float()
+    logistics_amount_lte = Float()
+    intracommunity = Boolean()
+    irpf_base = Float()
+    irpf_base_gte = Float()
+    irpf_base_lte = Float()
+    income_tax_withholding_percentage = Float()
+    income_tax_withholding_percentage_gte = Float()
+    income_tax_withholding_percentage_lte = Float()
+    income_tax_amount = Float()
+    income_tax_amount_gte = Float()
+    income_tax_amount_lte = Float()
+    printed = Boolean()
+    amount_with_equivalence_surcharge = Float()
+    amount_with_equivalence_surcharge_gte = Float()
+    amount_with_equivalence_surcharge_lte = Float()
+    amount_with_equivalence_surcharge_1 = Float()
+    amount_with_equivalence_surcharge_1_gte = Float()
+    amount_with_equivalence_surcharge_1_lte = Float()
+    amount_with_equivalence_surcharge_2 = Float()
+    amount_with_equivalence_surcharge_2_gte = Float()
+    amount_with_equivalence_surcharge_2_lte = Float()
+    amount_with_equivalence_surcharge_3 = Float()
+    amount_with_equivalence_surcharge_3_gte = Float()
+    amount_with_equivalence_surcharge_3_lte = Float()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    vat_percentage_1 = Float()
+    vat_percentage_1_gte = Float()
+    vat_percentage_1_lte = Float()
+    vat_percentage_2 = Float()
+    vat_percentage_2_gte = Float()
+    vat_percentage_2_lte = Float()
+    vat_percentage_3 = Float()
+    vat_percentage_3_gte = Float()
+    vat_percentage_3_lte = Float()
+    delivery_note_number = Int()
+    delivery_note_number_gte = Int()
+    delivery_note_number_lte = Int()
+    supplier_delivery = Int()
+    supplier_delivery_gte = Int()
+    supplier_delivery_lte = Int()
+    number = String()
+    number_contains = String()
+    due_dates = Int()
+    due_dates_gte = Int()
+    due_dates_lte = Int()
+    notes = String()
+    notes_contains = String()
+    supplier_delivery_note_number = String()
+    supplier_delivery_note_number_contains = String()
+    population = String()
+    population_contains = String()
+    porsic = String()
+    porsic_contains = String()
+    porsil = Boolean()
+    porsin = Float()
+    porsin_gte = Float()
+    porsin_lte = Float()
+    shipping_costs = Float()
+    shipping_costs_gte = Float()
+    shipping_costs_lte = Float()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    notification_number = Int()
+    notification_number_gte = Int()
+    notification_number_lte = Int()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    replicated = Boolean()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    equivalence_surcharge_percentage_1 = Float()
+    equivalence_surcharge_percentage_1_gte = Float()
+    equivalence_surcharge_percentage_1_lte = Float()
+    equivalence_surcharge_percentage_2 = Float()
+    equivalence_surcharge_percentage_2_gte = Float()
+    equivalence_surcharge_percentage_2_lte = Float()
+    equivalence_surcharge_percentage_3 = Float()
+    equivalence_surcharge_percentage_3_gte = Float()
+    equivalence_surcharge_percentage_3_lte = Float()
+    isr_withholding = Float()
+    isr_withholding_gte = Float()
+    isr_withholding_lte = Float()
+    vat_withholding = Float()
+    vat_withholding_gte = Float()
+    vat_withholding_lte = Float()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    financial_receipt = Float()
+    financial_receipt_gte = Float()
+    financial_receipt_lte = Float()
+    phone_number = String()
+    phone_number_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    invoice_type = String()
+    invoice_type_contains = String()
+    total_delivery_note = Float()
+    total_delivery_note_gte = Float()
+    total_delivery_note_lte = Float()
+    delivery_note_number_r_81 = Int()
+    delivery_note_number_r_81_gte = Int()
+    delivery_note_number_r_81_lte = Int()
+    branch_office = Int()
+    branch_office_gte = Int()
+    branch_office_lte = Int()
+    last_modified_user = String()
+    last_modified_user_contains = String()
+    value = Float()
+    value_gte = Float()
+    value_lte = Float()
+    show_last_item_prices = Boolean()
+
+
+class PurchaseOrders(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PurchaseOrders
+        name = "LegacyPurchaseOrders"
+        description = "Cabecera de los Documentos de Pedidos de Compra"
+
+
+class PurchaseOrdersFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPurchaseOrdersFilter"
+
+    attachments = Boolean()
+    advance_payment = Float()
+    advance_payment_gte = Float()
+    advance_payment_lte = Float()
+    is_cancelled = Boolean()
+    is_locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    campaign = String()
+    campaign_contains = String()
+    quantity = Int()
+    quantity_gte = Int()
+    quantity_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    delivery_conditions = String()
+    delivery_conditions_contains = String()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    origin_branch = Int()
+    origin_branch_gte = Int()
+    origin_branch_lte = Int()
+    receiving_delivery = Int()
+    receiving_delivery_gte = Int()
+    receiving_delivery_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    requester = Int()
+    requester_gte = Int()
+    requester_lte = Int()
+    company_r_403 = Int()
+    company_r_403_gte = Int()
+    company_r_403_lte = Int()
+    status = Int()
+    status_gte = Int()
+    status_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    requirement_number = Int()
+    requirement_number_gte = Int()
+    requirement_number_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    country = String()
+    country_contains = String()
+    proposal = Int()
+    proposal_gte = Int()
+    proposal_lte = Int()
+    supplier_code = Int()
+    supplier_code_gte = Int()
+    supplier_code_lte = Int()
+    origin = String()
+    origin_contains = String()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    responsible_person = Int()
+    responsible_person_gte = Int()
+    responsible_person_lte = Int()
+    code = String()
+    code_contains = String()
+    contact = Int()
+    contact_gte = Int()
+    contact_lte = Int()
+    type = String()
+    type_contains = String()
+    code_r_703 = Int()
+    code_r_703_gte = Int()
+    code_r_703_lte = Int()
+    user = String()
+    user_contains = String()
+    address = String()
+    address_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    shipment = Int()
+    shipment_gte = Int()
+    shipment_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    origin_delivery = String()
+    origin_delivery_contains = String()
+    description = String()
+    description_contains = String()
+    address_r_7 = String()
+    address_r_7_contains = String()
+    distrinet = Boolean()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    special_discount = Float()
+    special_discount_gte = Float()
+    special_discount_lte = Float()
+    complete_delivery = Boolean()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    edi_communication = Boolean()
+    sent_by_email = Boolean()
+    email = String()
+    email_contains = String()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    sender_email = String()
+    sender_email_contains = String()
+    shipment_status = String()
+    shipment_status_contains = String()
+    status_r_957 = String()
+    status_r_957_contains = String()
+    status_r_606 = String()
+    status_r_606_contains = String()
+    sent_by_fax = Boolean()
+    fax = String()
+    fax_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    confirmation_date = Date()
+    confirmation_date_gte = Date()
+    confirmation_date_lte = Date()
+    shipping_date = Date()
+    shipping_date_gte = Date()
+    shipping_date_lte = Date()
+    order_date = Date()
+    order_date_gte = Date()
+    order_date_lte = Date()
+    company_entity = Boolean()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    income_tax_withholding = Float()
+    income_tax_withholding_gte = Float()
+    income_tax_withholding_lte = Float()
+    printed = Boolean()
+    intracommunity = Boolean()
+    freight_costs = Float()
+    freight_costs_gte = Float()
+    freight_costs_lte = Float()
+    delivery_location = String()
+    delivery_location_contains = String()
+    name = String()
+    name_contains = String()
+    order_number = Int()
+    order_number_gte = Int()
+    order_number_lte = Int()
+    branch_r_847 = Int()
+    branch_r_847_gte = Int()
+    branch_r_847_lte = Int()
+    number = String()
+    number_contains = String()
+    b2b_notes = String()
+    b2b_notes_contains = String()
+    notes = String()
+    notes_contains = String()
+    pending_authorization = Boolean()
+    clc_order = String()
+    clc_order_contains = String()
+    city = String()
+    city_contains = String()
+    freight_costs_r_401 = Boolean()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    previously_advanced_order = String()
+    previously_advanced_order_contains = String()
+    recipient = String()
+    recipient_contains = String()
+    weee_from_article_in_linkages = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    withholding_tax = Float()
+    withholding_tax_gte = Float()
+    withholding_tax_lte = Float()
+    supplier_reference = String()
+    supplier_reference_contains = String()
+    reference = String()
+    reference_contains = String()
+    retry_attempts_number = Int()
+    retry_attempts_number_gte = Int()
+    retry_attempts_number_lte = Int()
+    replicated = Boolean()
+    responsible_person_r_177 = String()
+    responsible_person_r_177_contains = String()
+    advance_withholding_tax_percentage = Float()
+    advance_withholding_tax_percentage_gte = Float()
+    advance_withholding_tax_percentage_lte = Float()
+    income_tax_withholding_r_98 = Float()
+    income_tax_withholding_r_98_gte = Float()
+    income_tax_withholding_r_98_lte = Float()
+    vat_withholding = Float()
+    vat_withholding_gte = Float()
+    vat_withholding_lte = Float()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    financial_receipt = Float()
+    financial_receipt_gte = Float()
+    financial_receipt_lte = Float()
+    phone_number = String()
+    phone_number_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    invoice_type = String()
+    invoice_type_contains = String()
+    subcontracting_type = String()
+    subcontracting_type_contains = String()
+    type_r_249 = String()
+    type_r_249_contains = String()
+    total_order = Float()
+    total_order_gte = Float()
+    total_order_lte = Float()
+    order_type = String()
+    order_type_contains = String()
+    rate_type = String()
+    rate_type_contains = String()
+    urgent = Boolean()
+    last_modified_user = String()
+    last_modified_user_contains = String()
+    fax_confirmation_date = Date()
+    fax_confirmation_date_gte = Date()
+    fax_confirmation_date_lte = Date()
+    original_confirmation_date = Date()
+    original_confirmation_date_gte = Date()
+    original_confirmation_date_lte = Date()
+    value = Float()
+    value_gte = Float()
+    value_lte = Float()
+    show_recent_article_prices = Boolean()
+
+
+class PurchaseOrderTaxes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PurchaseOrderTaxes
+        name = "LegacyPurchaseOrderTaxes"
+        description = "Desglose de Impuestos de los Pedidos de Compra"
+
+
+class PurchaseOrderTaxesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPurchaseOrderTaxesFilter"
+
+    base_amount = Float()
+    base_amount_gte = Float()
+    base_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    tax_type_code = Int()
+    tax_type_code_gte = Int()
+    tax_type_code_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    order_number = Int()
+    order_number_gte = Int()
+    order_number_lte = Int()
+    percentage = Float()
+    percentage_gte = Float()
+    percentage_lte = Float()
+
+
+class PurchaseOrderLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PurchaseOrderLines
+        name = "LegacyPurchaseOrderLines"
+        description = "Lineas de Detalle del Documento de Pedidos de Compra"
+
+
+class PurchaseOrderLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPurchaseOrderLinesFilter"
+
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    atypical_operation = Boolean()
+    campaign = String()
+    campaign_contains = String()
+    barcode = String()
+    barcode_contains = String()
+    delivered = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    item_code = String()
+    item_code_contains = String()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    item_purchase_group = String()
+    item_purchase_group_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    brand_code = Int()
+    brand_code_gte = Int()
+    brand_code_lte = Int()
+    requirement_number = Int()
+    requirement_number_gte = Int()
+    requirement_number_lte = Int()
+    detail_code = Int()
+    detail_code_gte = Int()
+    detail_code_lte = Int()
+    purchase_proposal = Int()
+    purchase_proposal_gte = Int()
+    purchase_proposal_lte = Int()
+    packaging_unit = String()
+    packaging_unit_contains = String()
+    unit_of_measure_weight = String()
+    unit_of_measure_weight_contains = String()
+    volume_unit = String()
+    volume_unit_contains = String()
+    ordered_quantity = Float()
+    ordered_quantity_gte = Float()
+    ordered_quantity_lte = Float()
+    quantity_delivered = Float()
+    quantity_delivered_gte = Float()
+    quantity_delivered_lte = Float()
+    company_phone = String()
+    company_phone_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    description = String()
+    description_contains = String()
+    first_discount = Float()
+    first_discount_gte = Float()
+    first_discount_lte = Float()
+    second_discount = Float()
+    second_discount_gte = Float()
+    second_discount_lte = Float()
+    third_party_discount = Float()
+    third_party_discount_gte = Float()
+    third_party_discount_lte = Float()
+    complete_delivery = Boolean()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    comments = String()
+    comments_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    delivery_date = Date()
+    delivery_date_gte = Date()
+    delivery_date_lte = Date()
+    delivery_start_date = Date()
+    delivery_start_date_gte = Date()
+    delivery_start_date_lte = Date()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    order_number = Int()
+    order_number_gte = Int()
+    order_number_lte = Int()
+    purchase_group_notes = String()
+    purchase_group_notes_contains = String()
+    discount_origin = String()
+    discount_origin_contains = String()
+    line_number_r_650 = Int()
+    line_number_r_650_gte = Int()
+    line_number_r_650_lte = Int()
+    origin = String()
+    origin_contains = String()
+    weight = Float()
+    weight_gte = Float()
+    weight_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    subcontracted_item = Boolean()
+    rate = Boolean()
+    line_type = String()
+    line_type_contains = String()
+
+
+class Links(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Links
+        name = "LegacyLinks"
+        description = "Detalle de Vinculaciones de las Líneas de Pedidos de Compra con otros Do"
+
+
+class LinksFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyLinksFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    notification_number = Int()
+    notification_number_gte = Int()
+    notification_number_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    packaging_unit = String()
+    packaging_unit_contains = String()
+    quantity_delivered = Float()
+    quantity_delivered_gte = Float()
+    quantity_delivered_lte = Float()
+    linked_quantity = Float()
+    linked_quantity_gte = Float()
+    linked_quantity_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    document_line_number_incoming = Int()
+    document_line_number_incoming_gte = Int()
+    document_line_number_incoming_lte = Int()
+    editable = Boolean()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    linked_document_number = Int()
+    linked_document_number_gte = Int()
+    linked_document_number_lte = Int()
+    order_r_891 = Int()
+    order_r_891_gte = Int()
+    order_r_891_lte = Int()
+    linking_type = String()
+    linking_type_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class AttachedFile(SQLAlchemyObjectType):
+    class Meta:
+        model = models.AttachedFile
+        name = "LegacyAttachedFile"
+        description = "Gestión Documental"
+
+
+class AttachedFileFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyAttachedFileFilter"
+
+    document_class = String()
+    document_class_contains = String()
+    database_type = String()
+    database_type_contains = String()
+    document_id = Int()
+    document_id_gte = Int()
+    document_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    description = String()
+    description_contains = String()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    file_name = String()
+    file_name_contains = String()
+    file_path = String()
+    file_path_contains = String()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    email_message_id = String()
+    email_message_id_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    third_party_unique_id = Float()
+    third_party_unique_id_gte = Float()
+    third_party_unique_id_lte = Float()
+    image = String()
+    image_contains = String()
+    notes = String()
+    notes_contains = String()
+    tags = String()
+    tags_contains = String()
+    document_type = String()
+    document_type_contains = String()
+    third_party_type = String()
+    third_party_type_contains = String()
+    url_image = String()
+    url_image_contains = String()
+    last_modification_user_id = String()
+    last_modification_user_id_contains = String()
+
+
+class Calendars(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Calendars
+        name = "LegacyCalendars"
+        description = "Cabecera de Calendarios de Personas y Máquinas"
+
+
+class CalendarsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCalendarsFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    char1_gfcalent = String()
+    char1_gfcalent_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    calendar = String()
+    calendar_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    type = String()
+    type_contains = String()
+
+
+class Employees(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Employees
+        name = "LegacyEmployees"
+        description = "Maestro de Empleados de cada Empresa"
+
+
+class EmployeesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyEmployeesFilter"
+
+    attached_documents = Boolean()
+    deactivation = Boolean()
+    locked = Boolean()
+    location = Int()
+    location_gte = Int()
+    location_lte = Int()
+    bank = Int()
+    bank_gte = Int()
+    bank_lte = Int()
+    barcode = Float()
+    barcode_gte = Float()
+    barcode_lte = Float()
+    account_number = String()
+    account_number_contains = String()
+    distribution_center = Int()
+    distribution_center_gte = Int()
+    distribution_center_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    bank_r_92 = Int()
+    bank_r_92_gte = Int()
+    bank_r_92_lte = Int()
+    calendar = String()
+    calendar_contains = String()
+    owner_branch = Int()
+    owner_branch_gte = Int()
+    owner_branch_lte = Int()
+    department = String()
+    department_contains = String()
+    accountant = Int()
+    accountant_gte = Int()
+    accountant_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    owner_company = Int()
+    owner_company_gte = Int()
+    owner_company_lte = Int()
+    fax_account = String()
+    fax_account_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    schedule = String()
+    schedule_contains = String()
+    working = Int()
+    working_gte = Int()
+    working_lte = Int()
+    country = String()
+    country_contains = String()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    code_r_258 = Int()
+    code_r_258_gte = Int()
+    code_r_258_lte = Int()
+    code_r_416 = Int()
+    code_r_416_gte = Int()
+    code_r_416_lte = Int()
+    job_risk = Int()
+    job_risk_gte = Int()
+    job_risk_lte = Int()
+    regular_payroll = Int()
+    regular_payroll_gte = Int()
+    regular_payroll_lte = Int()
+    currency = String()
+    currency_contains = String()
+    subzone = Int()
+    subzone_gte = Int()
+    subzone_lte = Int()
+    employee_contract_type = Int()
+    employee_contract_type_gte = Int()
+    employee_contract_type_lte = Int()
+    holiday_type = Int()
+    holiday_type_gte = Int()
+    holiday_type_lte = Int()
+    carrier_code = Int()
+    carrier_code_gte = Int()
+    carrier_code_lte = Int()
+    regime_type = Int()
+    regime_type_gte = Int()
+    regime_type_lte = Int()
+    user_code = String()
+    user_code_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    area = Int()
+    area_gte = Int()
+    area_lte = Int()
+    neighborhood = String()
+    neighborhood_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    default_imap_folder = String()
+    default_imap_folder_contains = String()
+    advance_account = String()
+    advance_account_contains = String()
+    additional_employee_account = String()
+    additional_employee_account_contains = String()
+    employee_account_in_foreign_currency = String()
+    employee_account_in_foreign_currency_contains = String()
+    payroll_payable_account = String()
+    payroll_payable_account_contains = String()
+    accounting_account = String()
+    accounting_account_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_material_price = Float()
+    decimal_to_ton_of_limestone_material_price_gte = Float()
+    decimal_to_ton_of_limestone_material_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    standard_deduction = Float()
+    standard_deduction_gte = Float()
+    standard_deduction_lte = Float()
+    contractor = Boolean()
+    address = String()
+    address_contains = String()
+    id_card = String()
+    id_card_contains = String()
+    paid_days = Float()
+    paid_days_gte = Float()
+    paid_days_lte = Float()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    external = Boolean()
+    email = String()
+    email_contains = String()
+    send_payroll = Boolean()
+    foreign_resident = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    contract_end_date = Date()
+    contract_end_date_gte = Date()
+    contract_end_date_lte = Date()
+    contract_start_date = Date()
+    contract_start_date_gte = Date()
+    contract_start_date_lte = Date()
+    birth_date = Date()
+    birth_date_gte = Date()
+    birth_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    mobile_1 = String()
+    mobile_1_contains = String()
+    mobile_2 = String()
+    mobile_2_contains = String()
+    payment_method = String()
+    payment_method_contains = String()
+    account_number_r_541 = String()
+    account_number_r_541_contains = String()
+    notify_error_email_sent = Boolean()
+    email_notification_sent_successfully = Boolean()
+    your_name = String()
+    your_name_contains = String()
+    name = String()
+    name_contains = String()
+    notify_email_receipt = Boolean()
+    social_security_number = String()
+    social_security_number_contains = String()
+    standard_perception = Float()
+    standard_perception_gte = Float()
+    standard_perception_lte = Float()
+    authorization_pin = String()
+    authorization_pin_contains = String()
+    city = String()
+    city_contains = String()
+    imap_password = String()
+    imap_password_contains = String()
+    smtp_password = String()
+    smtp_password_contains = String()
+    imap_port = Int()
+    imap_port_gte = Int()
+    imap_port_lte = Int()
+    smtp_port = Int()
+    smtp_port_gte = Int()
+    smtp_port_lte = Int()
+    area_department_manager = Boolean()
+    employee_rotation = Boolean()
+    daily_salary = Float()
+    daily_salary_gte = Float()
+    daily_salary_lte = Float()
+    salary = Float()
+    salary_gte = Float()
+    salary_lte = Float()
+    cfdi_series = String()
+    cfdi_series_contains = String()
+    imap_security = String()
+    imap_security_contains = String()
+    smtp_security = String()
+    smtp_security_contains = String()
+    imap_server = String()
+    imap_server_contains = String()
+    smtp_server = String()
+    smtp_server_contains = String()
+    encrypted_vat_number = String()
+    encrypted_vat_number_contains = String()
+    email_account_type = String()
+    email_account_type_contains = String()
+    imap_refresh_time = Int()
+    imap_refresh_time_gte = Int()
+    imap_refresh_time_lte = Int()
+    phone_number = String()
+    phone_number_contains = String()
+    employee_type = Int()
+    employee_type_gte = Int()
+    employee_type_lte = Int()
+    email_account_token = String()
+    email_account_token_contains = String()
+    imap_user = String()
+    imap_user_contains = String()
+    smtp_user = String()
+    smtp_user_contains = String()
+    photo = String()
+    photo_contains = String()
+
+
+class WorkingDays(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingDays
+        name = "LegacyWorkingDays"
+        description = "Maestro de Tipos de Jornada Laborales que pueden ser definidos en un Cal"
+
+
+class WorkingDaysFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingDaysFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    work_shift = Int()
+    work_shift_gte = Int()
+    work_shift_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+
+
+class LinesWorkingDays(SQLAlchemyObjectType):
+    class Meta:
+        model = models.LinesWorkingDays
+        name = "LegacyLinesWorkingDays"
+        description = "Detalle del Tipos de Hora Incluidas dentro de cada Tipo de Jornada"
+
+
+class LinesWorkingDaysFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyLinesWorkingDaysFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    time_hour = Int()
+    time_hour_gte = Int()
+    time_hour_lte = Int()
+    work_shift = Int()
+    work_shift_gte = Int()
+    work_shift_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    end_time = String()
+    end_time_contains = String()
+    start_time = String()
+    start_time_contains = String()
+
+
+class Activity(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Activity
+        name = "LegacyActivity"
+        description = "Maestro de Actividades Comerciales de Clientes y Proveedores"
+
+
+class ActivityFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyActivityFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    activity_code = String()
+    activity_code_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_178 = Float()
+    temperature_in_celsius_r_178_gte = Float()
+    temperature_in_celsius_r_178_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    potential_customer_activity = String()
+    potential_customer_activity_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    description = String()
+    description_contains = String()
+
+
+class Subactivity(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Subactivity
+        name = "LegacySubactivity"
+        description = "Maestro de Subactividades Comerciales de Clientes y Proveedores"
+
+
+class SubactivityFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySubactivityFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    char5_al = String()
+    char5_al_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    activity_code = String()
+    activity_code_contains = String()
+    subactivity_code = String()
+    subactivity_code_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    potential_customer_activity = String()
+    potential_customer_activity_contains = String()
+    potential_customer_subactivity = String()
+    potential_customer_subactivity_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    description = String()
+    description_contains = String()
+
+
+class Banks(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Banks
+        name = "LegacyBanks"
+        description = "Maestro de Cuentas Bancarias Utilizada por las Empresas"
+
+
+class BanksFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBanksFilter"
+
+    attached_documents = Boolean()
+    send_note_by_operation = Boolean()
+    deactivate = Boolean()
+    locked = Boolean()
+    agency_code = Int()
+    agency_code_gte = Int()
+    agency_code_lte = Int()
+    bank_code = Int()
+    bank_code_gte = Int()
+    bank_code_lte = Int()
+    bank_account = String()
+    bank_account_contains = String()
+    distribution_center = Int()
+    distribution_center_gte = Int()
+    distribution_center_lte = Int()
+    assignor = String()
+    assignor_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    bank_code_r_690 = Int()
+    bank_code_r_690_gte = Int()
+    bank_code_r_690_lte = Int()
+    cod_pai = String()
+    cod_pai_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    code_r_579 = Int()
+    code_r_579_gte = Int()
+    code_r_579_lte = Int()
+    code_r_145 = String()
+    code_r_145_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    commission = Float()
+    commission_gte = Float()
+    commission_lte = Float()
+    accountant = Int()
+    accountant_gte = Int()
+    accountant_lte = Int()
+    item = String()
+    item_contains = String()
+    email = Float()
+    email_gte = Float()
+    email_lte = Float()
+    tax_withholding_account = String()
+    tax_withholding_account_contains = String()
+    secondary_bank_account = String()
+    secondary_bank_account_contains = String()
+    bank_account_currency = String()
+    bank_account_currency_contains = String()
+    account_code = String()
+    account_code_contains = String()
+    account_contract_confirmation = String()
+    account_contract_confirmation_contains = String()
+    identification_code = Int()
+    identification_code_gte = Int()
+    identification_code_lte = Int()
+    dc_iban = Int()
+    dc_iban_gte = Int()
+    dc_iban_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    risk_days = Int()
+    risk_days_gte = Int()
+    risk_days_lte = Int()
+    address = String()
+    address_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    payment_cash_account = String()
+    payment_cash_account_contains = String()
+    cash_account_description = String()
+    cash_account_description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    email_r_575 = String()
+    email_r_575_contains = String()
+    fax = String()
+    fax_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    flat_rate = Float()
+    flat_rate_gte = Float()
+    flat_rate_lte = Float()
+    payment_method = String()
+    payment_method_contains = String()
+    remittance_format = Int()
+    remittance_format_gte = Int()
+    remittance_format_lte = Int()
+    expenses = Float()
+    expenses_gte = Float()
+    expenses_lte = Float()
+    iban = String()
+    iban_contains = String()
+    identification_code_r_795 = Int()
+    identification_code_r_795_gte = Int()
+    identification_code_r_795_lte = Int()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    iip_ban = Float()
+    iip_ban_gte = Float()
+    iip_ban_lte = Float()
+    subcontractor = Int()
+    subcontractor_gte = Int()
+    subcontractor_lte = Int()
+    superior_intervention = Int()
+    superior_intervention_gte = Int()
+    superior_intervention_lte = Int()
+    shipment_import_duty = Float()
+    shipment_import_duty_gte = Float()
+    shipment_import_duty_lte = Float()
+    min_commission = Float()
+    min_commission_gte = Float()
+    min_commission_lte = Float()
+    unpaid_count = Int()
+    unpaid_count_gte = Int()
+    unpaid_count_lte = Int()
+    name = String()
+    name_contains = String()
+    remittance_number = Int()
+    remittance_number_gte = Int()
+    remittance_number_lte = Int()
+    number = String()
+    number_contains = String()
+    notes = String()
+    notes_contains = String()
+    city = String()
+    city_contains = String()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    risk_granted = Float()
+    risk_granted_gte = Float()
+    risk_granted_lte = Float()
+    live_risk = Float()
+    live_risk_gte = Float()
+    live_risk_lte = Float()
+    series = String()
+    series_contains = String()
+    sfj_ban = String()
+    sfj_ban_contains = String()
+    suffix = Int()
+    suffix_gte = Int()
+    suffix_lte = Int()
+    phone_number = String()
+    phone_number_contains = String()
+    price_ranges = Float()
+    price_ranges_gte = Float()
+    price_ranges_lte = Float()
+    price_ranges_r_444 = Float()
+    price_ranges_r_444_gte = Float()
+    price_ranges_r_444_lte = Float()
+    price_ranges_2 = Float()
+    price_ranges_2_gte = Float()
+    price_ranges_2_lte = Float()
+    price_ranges_r_529 = Float()
+    price_ranges_r_529_gte = Float()
+    price_ranges_r_529_lte = Float()
+    price_ranges_r_848 = Float()
+    price_ranges_r_848_gte = Float()
+    price_ranges_r_848_lte = Float()
+    price_ranges_5 = Float()
+    price_ranges_5_gte = Float()
+    price_ranges_5_lte = Float()
+    website = String()
+    website_contains = String()
+
+
+class BankMovementsLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BankMovementsLines
+        name = "LegacyBankMovementsLines"
+        description = "Detalle de Movimientos Bancarios"
+
+
+class BankMovementsLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBankMovementsLinesFilter"
+
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    cash_register_id = Int()
+    cash_register_id_gte = Int()
+    cash_register_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    cash_movement_branch_id = Int()
+    cash_movement_branch_id_gte = Int()
+    cash_movement_branch_id_lte = Int()
+    document_id = Int()
+    document_id_gte = Int()
+    document_id_lte = Int()
+    bill_id = Int()
+    bill_id_gte = Int()
+    bill_id_lte = Int()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    invoice_id = Int()
+    invoice_id_gte = Int()
+    invoice_id_lte = Int()
+    cash_movement_id = Int()
+    cash_movement_id_gte = Int()
+    cash_movement_id_lte = Int()
+    bank_movement_id = Int()
+    bank_movement_id_gte = Int()
+    bank_movement_id_lte = Int()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    movement_type = String()
+    movement_type_contains = String()
+
+
+class BankMovements(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BankMovements
+        name = "LegacyBankMovements"
+        description = "Movimientos Bancarios"
+
+
+class BankMovementsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBankMovementsFilter"
+
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    statement_concept = String()
+    statement_concept_contains = String()
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    comments = String()
+    comments_contains = String()
+    accounted = Boolean()
+    counterpart = String()
+    counterpart_contains = String()
+    movement_description = String()
+    movement_description_contains = String()
+    document_id = Int()
+    document_id_gte = Int()
+    document_id_lte = Int()
+    bill_id = Int()
+    bill_id_gte = Int()
+    bill_id_lte = Int()
+    movement_state = String()
+    movement_state_contains = String()
+    creation_date = DateTime()
+    creation_date_gte = DateTime()
+    creation_date_lte = DateTime()
+    movement_date = Date()
+    movement_date_gte = Date()
+    movement_date_lte = Date()
+    generate_expense_invoice = Boolean()
+    value_date = Date()
+    value_date_gte = Date()
+    value_date_lte = Date()
+    due_date = Date()
+    due_date_gte = Date()
+    due_date_lte = Date()
+    expenses_amount = Float()
+    expenses_amount_gte = Float()
+    expenses_amount_lte = Float()
+    unpaid_expenses = String()
+    unpaid_expenses_contains = String()
+    expenses_included = Boolean()
+    other_movement_expenses = Boolean()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    statement_amount = Float()
+    statement_amount_gte = Float()
+    statement_amount_lte = Float()
+    expense_invoice_amount = Float()
+    expense_invoice_amount_gte = Float()
+    expense_invoice_amount_lte = Float()
+    movement_amount = Float()
+    movement_amount_gte = Float()
+    movement_amount_lte = Float()
+    name = String()
+    name_contains = String()
+    related_movement_id = Int()
+    related_movement_id_gte = Int()
+    related_movement_id_lte = Int()
+    invoice_id = Int()
+    invoice_id_gte = Int()
+    invoice_id_lte = Int()
+    movement_id = Int()
+    movement_id_gte = Int()
+    movement_id_lte = Int()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    reference_2 = String()
+    reference_2_contains = String()
+    reference = String()
+    reference_contains = String()
+    movement_type = String()
+    movement_type_contains = String()
+
+
+class CustomerBranch(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CustomerBranch
+        name = "LegacyCustomerBranch"
+        description = "Datos Clientes por Delegación"
+
+
+class CustomerBranchFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCustomerBranchFilter"
+
+    abc = String()
+    abc_contains = String()
+    group_delivery_notes = String()
+    group_delivery_notes_contains = String()
+    single_delivery_note = Boolean()
+    is_deregistered = Boolean()
+    is_locked_branch = Boolean()
+    caf = String()
+    caf_contains = String()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    activity_id = String()
+    activity_id_contains = String()
+    subactivity_id = String()
+    subactivity_id_contains = String()
+    cod_ban = Int()
+    cod_ban_gte = Int()
+    cod_ban_lte = Int()
+    calendar_id = String()
+    calendar_id_contains = String()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    delivery_type_id = String()
+    delivery_type_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    report_work_invoice = Int()
+    report_work_invoice_gte = Int()
+    report_work_invoice_lte = Int()
+    report_work_invoice_b = Int()
+    report_work_invoice_b_gte = Int()
+    report_work_invoice_b_lte = Int()
+    report_cash_delivery_note = Int()
+    report_cash_delivery_note_gte = Int()
+    report_cash_delivery_note_lte = Int()
+    report_cash_delivery_note_b = Int()
+    report_cash_delivery_note_b_gte = Int()
+    report_cash_delivery_note_b_lte = Int()
+    report_quote = Int()
+    report_quote_gte = Int()
+    report_quote_lte = Int()
+    report_quote_b = Int()
+    report_quote_b_gte = Int()
+    report_quote_b_lte = Int()
+    report_sales_invoice = Int()
+    report_sales_invoice_gte = Int()
+    report_sales_invoice_lte = Int()
+    report_sales_invoice_b = Int()
+    report_sales_invoice_b_gte = Int()
+    report_sales_invoice_b_lte = Int()
+    report_offer = Int()
+    report_offer_gte = Int()
+    report_offer_lte = Int()
+    report_offer_b = Int()
+    report_offer_b_gte = Int()
+    report_offer_b_lte = Int()
+    report_order = Int()
+    report_order_gte = Int()
+    report_order_lte = Int()
+    report_order_d = Int()
+    report_order_d_gte = Int()
+    report_order_d_lte = Int()
+    report_credit_delivery_note = Int()
+    report_credit_delivery_note_gte = Int()
+    report_credit_delivery_note_lte = Int()
+    report_credit_delivery_note_b = Int()
+    report_credit_delivery_note_b_gte = Int()
+    report_credit_delivery_note_b_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    alternate_payment_method_id = Int()
+    alternate_payment_method_id_gte = Int()
+    alternate_payment_method_id_lte = Int()
+    language_id = String()
+    language_id_contains = String()
+    transport_type_id = Int()
+    transport_type_id_gte = Int()
+    transport_type_id_lte = Int()
+    transactional_nature = Int()
+    transactional_nature_gte = Int()
+    transactional_nature_lte = Int()
+    periodicity_id = Int()
+    periodicity_id_gte = Int()
+    periodicity_id_lte = Int()
+    port_airport = Int()
+    port_airport_gte = Int()
+    port_airport_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    transfer_regime = Int()
+    transfer_regime_gte = Int()
+    transfer_regime_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    subzone_id = Int()
+    subzone_id_gte = Int()
+    subzone_id_lte = Int()
+    sales_tariff_id = Int()
+    sales_tariff_id_gte = Int()
+    sales_tariff_id_lte = Int()
+    default_contact_id = Int()
+    default_contact_id_gte = Int()
+    default_contact_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    zone_id = Int()
+    zone_id_gte = Int()
+    zone_id_lte = Int()
+    invoice_copies = Int()
+    invoice_copies_gte = Int()
+    invoice_copies_lte = Int()
+    sales_ambit = Int()
+    sales_ambit_gte = Int()
+    sales_ambit_lte = Int()
+    payment_day_1 = Int()
+    payment_day_1_gte = Int()
+    payment_day_1_lte = Int()
+    payment_day_2 = Int()
+    payment_day_2_gte = Int()
+    payment_day_2_lte = Int()
+    payment_day_3 = Int()
+    payment_day_3_gte = Int()
+    payment_day_3_lte = Int()
+    due_bills_allowed_days = Int()
+    due_bills_allowed_days_gte = Int()
+    due_bills_allowed_days_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    no_payment_day_previous_2 = String()
+    no_payment_day_previous_2_contains = String()
+    no_payment_day_previous_1 = String()
+    no_payment_day_previous_1_contains = String()
+    no_payment_day_next_2 = String()
+    no_payment_day_next_2_contains = String()
+    no_payment_day_next_1 = String()
+    no_payment_day_next_1_contains = String()
+    ecommerce_discount = Float()
+    ecommerce_discount_gte = Float()
+    ecommerce_discount_lte = Float()
+    promp_payment_discount = Float()
+    promp_payment_discount_gte = Float()
+    promp_payment_discount_lte = Float()
+    general_discount_1 = Float()
+    general_discount_1_gte = Float()
+    general_discount_1_lte = Float()
+    general_discount_2 = Float()
+    general_discount_2_gte = Float()
+    general_discount_2_lte = Float()
+    general_discount_3 = Float()
+    general_discount_3_gte = Float()
+    general_discount_3_lte = Float()
+    financial_surcharge = Float()
+    financial_surcharge_gte = Float()
+    financial_surcharge_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    edi_id = String()
+    edi_id_contains = String()
+    has_edi = Boolean()
+    send_electronic_invoices = Boolean()
+    send_email = Boolean()
+    send_fax = Boolean()
+    has_discount_scale = Boolean()
+    is_vat_exempt = Boolean()
+    invoice_returns = Boolean()
+    deregistered_date = Date()
+    deregistered_date_gte = Date()
+    deregistered_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    no_payment_day_end_2 = String()
+    no_payment_day_end_2_contains = String()
+    no_payment_day_end_1 = String()
+    no_payment_day_end_1_contains = String()
+    no_payment_day_start_2 = String()
+    no_payment_day_start_2_contains = String()
+    no_payment_day_start_1 = String()
+    no_payment_day_start_1_contains = String()
+    has_conditional_payment_type = Boolean()
+    apply_glourinated_gas_tax = String()
+    apply_glourinated_gas_tax_contains = String()
+    has_cmms = Boolean()
+    default_payment_type_minimum_amount = Float()
+    default_payment_type_minimum_amount_gte = Float()
+    default_payment_type_minimum_amount_lte = Float()
+    minimum_amount = Float()
+    minimum_amount_gte = Float()
+    minimum_amount_lte = Float()
+    prepais_shipping_minimum_amount = Float()
+    prepais_shipping_minimum_amount_gte = Float()
+    prepais_shipping_minimum_amount_lte = Float()
+    apply_personal_income_tax = Boolean()
+    has_erp_exchange = Boolean()
+    apply_foreign_vat = Boolean()
+    vat_type = String()
+    vat_type_contains = String()
+    apply_insolvency_law = Boolean()
+    has_margin_control = Boolean()
+    order_minimum_amount = Float()
+    order_minimum_amount_gte = Float()
+    order_minimum_amount_lte = Float()
+    billing_address_id = Int()
+    billing_address_id_gte = Int()
+    billing_address_id_lte = Int()
+    shipping_address_delivery_notes_id = Int()
+    shipping_address_delivery_notes_id_gte = Int()
+    shipping_address_delivery_notes_id_lte = Int()
+    shipping_address_quotes_id = Int()
+    shipping_address_quotes_id_gte = Int()
+    shipping_address_quotes_id_lte = Int()
+    shipping_address_invoices_id = Int()
+    shipping_address_invoices_id_gte = Int()
+    shipping_address_invoices_id_lte = Int()
+    shipping_address_goods_id = Int()
+    shipping_address_goods_id_gte = Int()
+    shipping_address_goods_id_lte = Int()
+    shipping_address_orders_id = Int()
+    shipping_address_orders_id_gte = Int()
+    shipping_address_orders_id_lte = Int()
+    shipping_address_bills_id = Int()
+    shipping_address_bills_id_gte = Int()
+    shipping_address_bills_id_lte = Int()
+    lock_reason = String()
+    lock_reason_contains = String()
+    notes = String()
+    notes_contains = String()
+    is_mandatory_buyer_id = Boolean()
+    has_partially_priced_delivery_notes = Boolean()
+    unpaid_cash_bills_amount = Float()
+    unpaid_cash_bills_amount_gte = Float()
+    unpaid_cash_bills_amount_lte = Float()
+    issue_full_orders = Boolean()
+    risk_coverage = String()
+    risk_coverage_contains = String()
+    include_shipping_in_prompt_payment = Boolean()
+    apply_promotions = Boolean()
+    sales_forecast_amount = Float()
+    sales_forecast_amount_gte = Float()
+    sales_forecast_amount_lte = Float()
+    pending_amount_to_invoice = Float()
+    pending_amount_to_invoice_gte = Float()
+    pending_amount_to_invoice_lte = Float()
+    apply_recycling_tax = Boolean()
+    has_rappel_aggregated_by_group = Boolean()
+    risk_amount_pending_invoice = Float()
+    risk_amount_pending_invoice_gte = Float()
+    risk_amount_pending_invoice_lte = Float()
+    is_mandatory_reference_2 = Boolean()
+    is_mandatory_reference = Boolean()
+    apply_sales_equalization_tax = Boolean()
+    insured_risk_amount = Float()
+    insured_risk_amount_gte = Float()
+    insured_risk_amount_lte = Float()
+    granted_risk_amount = Float()
+    granted_risk_amount_gte = Float()
+    granted_risk_amount_lte = Float()
+    invoice_series = Int()
+    invoice_series_gte = Int()
+    invoice_series_lte = Int()
+    catalog_type = String()
+    catalog_type_contains = String()
+    uses_tickets = Boolean()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    promotion_type = Boolean()
+    final_price_tariff = Boolean()
+    priced_delivery_notes = Boolean()
+
+
+class Customer(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Customer
+        name = "LegacyCustomer"
+        description = "Maestro de Clientes"
+
+
+class CustomerFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCustomerFilter"
+
+    has_attachments = Boolean()
+    is_public_administration = Boolean()
+    has_self_invoicing = Boolean()
+    is_locked = String()
+    is_locked_contains = String()
+    account_advance_payment = String()
+    account_advance_payment_contains = String()
+    has_shared_contacts_by_zone = Boolean()
+    account_doubtful_receivables = String()
+    account_doubtful_receivables_contains = String()
+    account_trade_receivables = String()
+    account_trade_receivables_contains = String()
+    account_unpaid_bills = String()
+    account_unpaid_bills_contains = String()
+    account_trade_receivables_in_management = String()
+    account_trade_receivables_in_management_contains = String()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    purchasing_group_commission = Float()
+    purchasing_group_commission_gte = Float()
+    purchasing_group_commission_lte = Float()
+    default_attachment_id = Int()
+    default_attachment_id_gte = Int()
+    default_attachment_id_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    group_id = Int()
+    group_id_gte = Int()
+    group_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    subgroup_id = Int()
+    subgroup_id_gte = Int()
+    subgroup_id_lte = Int()
+    treatment_id = String()
+    treatment_id_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    account_insolvency_provision = String()
+    account_insolvency_provision_contains = String()
+    account_tax_retention = String()
+    account_tax_retention_contains = String()
+    account_auxiliar = String()
+    account_auxiliar_contains = String()
+    account_customer_currency = String()
+    account_customer_currency_contains = String()
+    account_accounting = String()
+    account_accounting_contains = String()
+    account_deducted_bills = String()
+    account_deducted_bills_contains = String()
+    account_cash = String()
+    account_cash_contains = String()
+    account_sales_returns = String()
+    account_sales_returns_contains = String()
+    account_customer_tax = String()
+    account_customer_tax_contains = String()
+    account_prompt_payment = String()
+    account_prompt_payment_contains = String()
+    account_shipping_costs = String()
+    account_shipping_costs_contains = String()
+    account_financial_surcharge = String()
+    account_financial_surcharge_contains = String()
+    account_sales_equalization_tax = String()
+    account_sales_equalization_tax_contains = String()
+    account_rappel = String()
+    account_rappel_contains = String()
+    account_sales = String()
+    account_sales_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    send_newsletter = Boolean()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    send_invoices = Boolean()
+    is_foreign = Boolean()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    request_print_fluorinated_gas = Boolean()
+    is_invoiced_at_central = Boolean()
+    control_level = Int()
+    control_level_gte = Int()
+    control_level_lte = Int()
+    is_not_regular_customer = Boolean()
+    name = String()
+    name_contains = String()
+    street_number = String()
+    street_number_contains = String()
+    city = String()
+    city_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    is_resident = Boolean()
+    vendor_reference = String()
+    vendor_reference_contains = String()
+    cfdi_series = String()
+    cfdi_series_contains = String()
+    seek = String()
+    seek_contains = String()
+    amortisation_type = String()
+    amortisation_type_contains = String()
+    cfdi_use = String()
+    cfdi_use_contains = String()
+    web = String()
+    web_contains = String()
+
+
+class DeliveryConditions(SQLAlchemyObjectType):
+    class Meta:
+        model = models.DeliveryConditions
+        name = "LegacyDeliveryConditions"
+        description = "Condiciones de Entrega"
+
+
+class DeliveryConditionsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyDeliveryConditionsFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    delivery_conditions = String()
+    delivery_conditions_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    e_commerce_description = String()
+    e_commerce_description_contains = String()
+    description = String()
+    description_contains = String()
+    days = Int()
+    days_gte = Int()
+    days_lte = Int()
+    additional_days = Int()
+    additional_days_gte = Int()
+    additional_days_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    deadline_time = String()
+    deadline_time_contains = String()
+    include_in_prep = Boolean()
+    iso = String()
+    iso_contains = String()
+    ecommerce_notes = String()
+    ecommerce_notes_contains = String()
+    sga_delivery = String()
+    sga_delivery_contains = String()
+    linked_order_action_type_complete_customer_orders = String()
+    linked_order_action_type_complete_customer_orders_contains = String()
+    action_type_linkages_with_purchase_orders = String()
+    action_type_linkages_with_purchase_orders_contains = String()
+    incomplete_customer_order_linkage_action_type = String()
+    incomplete_customer_order_linkage_action_type_contains = String()
+    action_type_linked_to_delivery_order = String()
+    action_type_linked_to_delivery_order_contains = String()
+
+
+class Timekeeping(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Timekeeping
+        name = "LegacyTimekeeping"
+        description = "Control de Presencia (Fichajes)"
+
+
+class TimekeepingFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyTimekeepingFilter"
+
+    attached_document = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    end_date = Date()
+    end_date_gte = Date()
+    end_date_lte = Date()
+    start_date = Date()
+    start_date_gte = Date()
+    start_date_lte = Date()
+    missing = Boolean()
+    end_hour = Int()
+    end_hour_gte = Int()
+    end_hour_lte = Int()
+    start_hour = Int()
+    start_hour_gte = Int()
+    start_hour_lte = Int()
+    worked_hours = Float()
+    worked_hours_gte = Float()
+    worked_hours_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    entry_latitude = String()
+    entry_latitude_contains = String()
+    exit_latitude = String()
+    exit_latitude_contains = String()
+    entry_longitude = String()
+    entry_longitude_contains = String()
+    exit_longitude = String()
+    exit_longitude_contains = String()
+    notes = String()
+    notes_contains = String()
+
+
+class Contact(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Contact
+        name = "LegacyContact"
+        description = "Contactos de clientes, proveedores y potenciales"
+
+
+class ContactFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyContactFilter"
+
+    notify_birthday = Boolean()
+    is_active_buyer = Boolean()
+    birthday = Date()
+    birthday_gte = Date()
+    birthday_lte = Date()
+    surname_1 = String()
+    surname_1_contains = String()
+    surname_2 = String()
+    surname_2_contains = String()
+    barcode = String()
+    barcode_contains = String()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    contact_id = Int()
+    contact_id_gte = Int()
+    contact_id_lte = Int()
+    related_contact_id = Int()
+    related_contact_id_gte = Int()
+    related_contact_id_lte = Int()
+    department_id = String()
+    department_id_contains = String()
+    potential_customer_id = Int()
+    potential_customer_id_gte = Int()
+    potential_customer_id_lte = Int()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    treatment_id = String()
+    treatment_id_contains = String()
+    buyer_id = String()
+    buyer_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    email_cc = String()
+    email_cc_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    email = String()
+    email_contains = String()
+    phone_extension_1 = String()
+    phone_extension_1_contains = String()
+    phone_extension_2 = String()
+    phone_extension_2_contains = String()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    sent_by_fax = String()
+    sent_by_fax_contains = String()
+    activation_date = Date()
+    activation_date_gte = Date()
+    activation_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    due_date = Date()
+    due_date_gte = Date()
+    due_date_lte = Date()
+    modification_date = Date()
+    modification_date_gte = Date()
+    modification_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    related_unique_id = Float()
+    related_unique_id_gte = Float()
+    related_unique_id_lte = Float()
+    parent_unique_id = Float()
+    parent_unique_id_gte = Float()
+    parent_unique_id_lte = Float()
+    name = String()
+    name_contains = String()
+    notes = String()
+    notes_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    is_default_for_payments = Boolean()
+    has_promotion = Boolean()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    is_pending_review = Boolean()
+    phone_2 = String()
+    phone_2_contains = String()
+    phone_1 = String()
+    phone_1_contains = String()
+    worker_type = Int()
+    worker_type_gte = Int()
+    worker_type_lte = Int()
+    contact_type = String()
+    contact_type_contains = String()
+    mobile_phone = String()
+    mobile_phone_contains = String()
+    web = String()
+    web_contains = String()
+
+
+class Gmdepartments(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Gmdepartments
+        name = "LegacyGmdepartments"
+        description = "Maestro de Departamentos a los que Pueden Pertenecer los Empleados"
+
+
+class GmdepartmentsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyGmdepartmentsFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    code = String()
+    code_contains = String()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_206 = Float()
+    temperature_in_celsius_r_206_gte = Float()
+    temperature_in_celsius_r_206_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+
+
+class CustomerAddress(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CustomerAddress
+        name = "LegacyCustomerAddress"
+        description = "Posibles Direcciones Físicas de cada Cliente. Serán Utilizadas para Enví"
+
+
+class CustomerAddressFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCustomerAddressFilter"
+
+    has_attachments = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    address_id = Int()
+    address_id_gte = Int()
+    address_id_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    subzone_id = Int()
+    subzone_id_gte = Int()
+    subzone_id_lte = Int()
+    street_type = String()
+    street_type_contains = String()
+    zone_id = Int()
+    zone_id_gte = Int()
+    zone_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    email = String()
+    email_contains = String()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    fax = String()
+    fax_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    modification_date = Date()
+    modification_date_gte = Date()
+    modification_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    name = String()
+    name_contains = String()
+    street_number = String()
+    street_number_contains = String()
+    notes = String()
+    notes_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    city = String()
+    city_contains = String()
+    phone_1 = String()
+    phone_1_contains = String()
+    phone_2 = String()
+    phone_2_contains = String()
+
+
+class Currencies(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Currencies
+        name = "LegacyCurrencies"
+        description = "Maestro de Divisas en las que se Expresan los Importes y Precios"
+
+
+class CurrenciesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCurrenciesFilter"
+
+    abbreviation = String()
+    abbreviation_contains = String()
+    automated_quote = Boolean()
+    construction_equipment_management = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    currency = String()
+    currency_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_362 = Float()
+    temperature_in_celsius_r_362_gte = Float()
+    temperature_in_celsius_r_362_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    iso = String()
+    iso_contains = String()
+    description = String()
+    description_contains = String()
+    decimal_places = Int()
+    decimal_places_gte = Int()
+    decimal_places_lte = Int()
+    sales_currency = Boolean()
+
+
+class CompanyBranch(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CompanyBranch
+        name = "LegacyCompanyBranch"
+        description = "Empresas"
+
+
+class CompanyBranchFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCompanyBranchFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    purchases_ambit = Int()
+    purchases_ambit_gte = Int()
+    purchases_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    sales_ambit = Int()
+    sales_ambit_gte = Int()
+    sales_ambit_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    name = String()
+    name_contains = String()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    business_name = String()
+    business_name_contains = String()
+
+
+class PaymentMethod(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PaymentMethod
+        name = "LegacyPaymentMethod"
+        description = "Maestro de Formas de Pago"
+
+
+class PaymentMethodFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPaymentMethodFilter"
+
+    due_date_cadence = Int()
+    due_date_cadence_gte = Int()
+    due_date_cadence_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    payment_document_id = String()
+    payment_document_id_contains = String()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    due_date_displacement = Int()
+    due_date_displacement_gte = Int()
+    due_date_displacement_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    payment_method_iso_code = String()
+    payment_method_iso_code_contains = String()
+    description = String()
+    description_contains = String()
+    due_dates_number = Int()
+    due_dates_number_gte = Int()
+    due_dates_number_lte = Int()
+    is_replenishment_type = Boolean()
+    type = String()
+    type_contains = String()
+
+
+class ManagementGroup(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ManagementGroup
+        name = "LegacyManagementGroup"
+        description = "Maestro de Subgrupos de Gestión de Proveedores"
+
+
+class ManagementGroupFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyManagementGroupFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    name = String()
+    name_contains = String()
+
+
+class Languages(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Languages
+        name = "LegacyLanguages"
+        description = "Maestro de Idiomas Utilizables por los Diferentes Interlocutores"
+
+
+class LanguagesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyLanguagesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    code = String()
+    code_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_720 = Float()
+    temperature_in_celsius_r_720_gte = Float()
+    temperature_in_celsius_r_720_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    iso = String()
+    iso_contains = String()
+
+
+class Country(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Country
+        name = "LegacyCountry"
+        description = "Maestro de Paises"
+
+
+class CountryFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCountryFilter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    intrastat_code = String()
+    intrastat_code_contains = String()
+    iso_code = String()
+    iso_code_contains = String()
+    name = String()
+    name_contains = String()
+
+
+class Suppliers(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Suppliers
+        name = "LegacySuppliers"
+        description = "Maestro de Proveedores"
+
+
+class SuppliersFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySuppliersFilter"
+
+    attached_document = Boolean()
+    apply_irpf_to_all_items = Boolean()
+    accepts_early_payment = Boolean()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    b2b_purchase_order = Boolean()
+    folder = String()
+    folder_contains = String()
+    deactivation = Boolean()
+    block = Boolean()
+    agency_code = Int()
+    agency_code_gte = Int()
+    agency_code_lte = Int()
+    bank_code = Int()
+    bank_code_gte = Int()
+    bank_code_lte = Int()
+    bank_account = String()
+    bank_account_contains = String()
+    distribution_center = Int()
+    distribution_center_gte = Int()
+    distribution_center_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    activity_code = String()
+    activity_code_contains = String()
+    subactivity = String()
+    subactivity_contains = String()
+    item_code = String()
+    item_code_contains = String()
+    bank_code_r_313 = Int()
+    bank_code_r_313_gte = Int()
+    bank_code_r_313_lte = Int()
+    calendar_code = String()
+    calendar_code_contains = String()
+    delivery_conditions = String()
+    delivery_conditions_contains = String()
+    income_tax_account = String()
+    income_tax_account_contains = String()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    management_group = Int()
+    management_group_gte = Int()
+    management_group_lte = Int()
+    language = String()
+    language_contains = String()
+    brand_code = Int()
+    brand_code_gte = Int()
+    brand_code_lte = Int()
+    transport_mode = Int()
+    transport_mode_gte = Int()
+    transport_mode_lte = Int()
+    transactional_nature = Int()
+    transactional_nature_gte = Int()
+    transactional_nature_lte = Int()
+    country = String()
+    country_contains = String()
+    accountant = Int()
+    accountant_gte = Int()
+    accountant_lte = Int()
+    financial_provider = Int()
+    financial_provider_gte = Int()
+    financial_provider_lte = Int()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    protocol = String()
+    protocol_contains = String()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    port_airport = Int()
+    port_airport_gte = Int()
+    port_airport_lte = Int()
+    transfer_regime = Int()
+    transfer_regime_gte = Int()
+    transfer_regime_lte = Int()
+    currency = String()
+    currency_contains = String()
+    management_group_r_339 = Int()
+    management_group_r_339_gte = Int()
+    management_group_r_339_lte = Int()
+    purchase_rate = Int()
+    purchase_rate_gte = Int()
+    purchase_rate_lte = Int()
+    active_phone = Int()
+    active_phone_gte = Int()
+    active_phone_lte = Int()
+    operation_type = Int()
+    operation_type_gte = Int()
+    operation_type_lte = Int()
+    transportation = Int()
+    transportation_gte = Int()
+    transportation_lte = Int()
+    title_prefix = String()
+    title_prefix_contains = String()
+    user_code = String()
+    user_code_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    confirming_account = String()
+    confirming_account_contains = String()
+    supplier_account_payable = String()
+    supplier_account_payable_contains = String()
+    supplier_account_in_currency = String()
+    supplier_account_in_currency_contains = String()
+    accounting_account = String()
+    accounting_account_contains = String()
+    unreceived_invoice_account = String()
+    unreceived_invoice_account_contains = String()
+    advance_account = String()
+    advance_account_contains = String()
+    freight_account = String()
+    freight_account_contains = String()
+    paid_freight = String()
+    paid_freight_contains = String()
+    accounting_account_r_239 = String()
+    accounting_account_r_239_contains = String()
+    accounts_payable = String()
+    accounts_payable_contains = String()
+    accounting_account_r_551 = String()
+    accounting_account_r_551_contains = String()
+    payment_day_1 = Int()
+    payment_day_1_gte = Int()
+    payment_day_1_lte = Int()
+    payment_day_2 = Int()
+    payment_day_2_gte = Int()
+    payment_day_2_lte = Int()
+    payment_day_3 = Int()
+    payment_day_3_gte = Int()
+    payment_day_3_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    address = String()
+    address_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    discount_percentage = Float()
+    discount_percentage_gte = Float()
+    discount_percentage_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    edi_communication = Boolean()
+    edi_identifier = String()
+    edi_identifier_contains = String()
+    enlace_basura_rb = Int()
+    enlace_basura_rb_gte = Int()
+    enlace_basura_rb_lte = Int()
+    supplier_vat = Boolean()
+    foreign = Boolean()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    freight_withholding = Boolean()
+    go_connect = Boolean()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    shipping_cost = Float()
+    shipping_cost_gte = Float()
+    shipping_cost_lte = Float()
+    income_tax_withholding = Float()
+    income_tax_withholding_gte = Float()
+    income_tax_withholding_lte = Float()
+    income_tax_irpf_modules = Float()
+    income_tax_irpf_modules_gte = Float()
+    income_tax_irpf_modules_lte = Float()
+    vat_type = String()
+    vat_type_contains = String()
+    minimum_order_amount = Float()
+    minimum_order_amount_gte = Float()
+    minimum_order_amount_lte = Float()
+    regular_supplier = Boolean()
+    name = String()
+    name_contains = String()
+    number = String()
+    number_contains = String()
+    notes = String()
+    notes_contains = String()
+    delivery_time = Int()
+    delivery_time_gte = Int()
+    delivery_time_lte = Int()
+    city = String()
+    city_contains = String()
+    porsic = String()
+    porsic_contains = String()
+    porsil = Boolean()
+    porsin = Float()
+    porsin_gte = Float()
+    porsin_lte = Float()
+    freight_costs = String()
+    freight_costs_contains = String()
+    freight_on_payment = Boolean()
+    scope_r_324 = Int()
+    scope_r_324_gte = Int()
+    scope_r_324_lte = Int()
+    apply_weee = String()
+    apply_weee_contains = String()
+    weee_from_article_in_linkages = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    customer_reference = String()
+    customer_reference_contains = String()
+    vat_id = Boolean()
+    resident_supplier = Boolean()
+    vat_withholding = Float()
+    vat_withholding_gte = Float()
+    vat_withholding_lte = Float()
+    financial_surcharge = Float()
+    financial_surcharge_gte = Float()
+    financial_surcharge_lte = Float()
+    search = String()
+    search_contains = String()
+    invoice_series = Int()
+    invoice_series_gte = Int()
+    invoice_series_lte = Int()
+    invoice_type = String()
+    invoice_type_contains = String()
+    inspection_time = Int()
+    inspection_time_gte = Int()
+    inspection_time_lte = Int()
+    supplier_type = Boolean()
+    website = String()
+    website_contains = String()
+
+
+class Province(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Province
+        name = "LegacyProvince"
+        description = "Maestro de Provincias de cada uno de los Paises"
+
+
+class ProvinceFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProvinceFilter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    name = String()
+    name_contains = String()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    intrastat_code = Int()
+    intrastat_code_gte = Int()
+    intrastat_code_lte = Int()
+    iso_code = String()
+    iso_code_contains = String()
+
+
+class Gmrefcli(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Gmrefcli
+        name = "LegacyGmrefcli"
+        description = "Relación de Referencias Abiertas para cada Cliente. Son Utilizadas para"
+
+
+class GmrefcliFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyGmrefcliFilter"
+
+    is_blocked = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    goods_address = Int()
+    goods_address_gte = Int()
+    goods_address_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    periodicity_id = Int()
+    periodicity_id_gte = Int()
+    periodicity_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    sales_agent_id = Int()
+    sales_agent_id_gte = Int()
+    sales_agent_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    street_type = String()
+    street_type_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    address = String()
+    address_contains = String()
+    address_to_assign = Boolean()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    promp_payment_discount = Float()
+    promp_payment_discount_gte = Float()
+    promp_payment_discount_lte = Float()
+    data_to_assign = Boolean()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    user_editor2 = String()
+    user_editor2_contains = String()
+    email = String()
+    email_contains = String()
+    fax = String()
+    fax_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    shipping_street_number = String()
+    shipping_street_number_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    city = String()
+    city_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    customer_reference = String()
+    customer_reference_contains = String()
+    phone = String()
+    phone_contains = String()
+
+
+class Representative(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Representative
+        name = "LegacyRepresentative"
+        description = "Maestro de Agentes Comerciales"
+
+
+class RepresentativeFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyRepresentativeFilter"
+
+    attached_document = Boolean()
+    last_name = String()
+    last_name_contains = String()
+    last_name2 = String()
+    last_name2_contains = String()
+    is_deregistered = Boolean()
+    blocked = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    char_1tlmp = String()
+    char_1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    char_2tlmp = String()
+    char_2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    char_3tlmp = String()
+    char_3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    char_4tlmp = String()
+    char_4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    salesman_id = String()
+    salesman_id_contains = String()
+    language_id = String()
+    language_id_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    representative_id = Int()
+    representative_id_gte = Int()
+    representative_id_lte = Int()
+    counter = Int()
+    counter_gte = Int()
+    counter_lte = Int()
+    currency = String()
+    currency_contains = String()
+    subarea = Int()
+    subarea_gte = Int()
+    subarea_lte = Int()
+    title = String()
+    title_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    road_type = String()
+    road_type_contains = String()
+    zone = Int()
+    zone_gte = Int()
+    zone_lte = Int()
+    neighborhood = String()
+    neighborhood_contains = String()
+    direct_commission = Float()
+    direct_commission_gte = Float()
+    direct_commission_lte = Float()
+    accounting_account = String()
+    accounting_account_contains = String()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal2user = Float()
+    decimal2user_gte = Float()
+    decimal2user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    address = String()
+    address_contains = String()
+    id_card = String()
+    id_card_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_user2 = String()
+    editor_user2_contains = String()
+    email = String()
+    email_contains = String()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    fax = String()
+    fax_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    date2_user = Date()
+    date2_user_gte = Date()
+    date2_user_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    date3tlmp = Date()
+    date3tlmp_gte = Date()
+    date3tlmp_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    minimum_order_amount = Int()
+    minimum_order_amount_gte = Int()
+    minimum_order_amount_lte = Int()
+    name = String()
+    name_contains = String()
+    number = String()
+    number_contains = String()
+    notes = String()
+    notes_contains = String()
+    pda_id = String()
+    pda_id_contains = String()
+    population = String()
+    population_contains = String()
+    porsic = String()
+    porsic_contains = String()
+    porsic2 = String()
+    porsic2_contains = String()
+    porsin = Float()
+    porsin_gte = Float()
+    porsin_lte = Float()
+    porsin2 = Float()
+    porsin2_gte = Float()
+    porsin2_lte = Float()
+    potential_customer_series = Int()
+    potential_customer_series_gte = Int()
+    potential_customer_series_lte = Int()
+    commission_type = Boolean()
+    phone = String()
+    phone_contains = String()
+    commercial_agent_type = String()
+    commercial_agent_type_contains = String()
+    mobile_phone = String()
+    mobile_phone_contains = String()
+
+
+class ManagementSubgroup(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ManagementSubgroup
+        name = "LegacyManagementSubgroup"
+        description = "Descripciones Multi-idioma del Maestro de Subgrupos de Gestión de Provee"
+
+
+class ManagementSubgroupFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyManagementSubgroupFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    code_r_115 = Int()
+    code_r_115_gte = Int()
+    code_r_115_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    name = String()
+    name_contains = String()
+
+
+class BillReceivable(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BillReceivable
+        name = "LegacyBillReceivable"
+        description = "Fichero de Tesorería"
+
+
+class BillReceivableFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBillReceivableFilter"
+
+    acceptance_state = String()
+    acceptance_state_contains = String()
+    has_attachments = Boolean()
+    quote_annex = Int()
+    quote_annex_gte = Int()
+    quote_annex_lte = Int()
+    is_advance_payment = Boolean()
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    is_locked = Boolean()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    sales_order_id = Int()
+    sales_order_id_gte = Int()
+    sales_order_id_lte = Int()
+    payment_document_id = String()
+    payment_document_id_contains = String()
+    invoicing_branch_id = Int()
+    invoicing_branch_id_gte = Int()
+    invoicing_branch_id_lte = Int()
+    billing_branch_id = Int()
+    billing_branch_id_gte = Int()
+    billing_branch_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    work_project_id = Int()
+    work_project_id_gte = Int()
+    work_project_id_lte = Int()
+    origin_country_id = String()
+    origin_country_id_contains = String()
+    quote_id = Int()
+    quote_id_gte = Int()
+    quote_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    remittance_id = Int()
+    remittance_id_gte = Int()
+    remittance_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    bill_id = Int()
+    bill_id_gte = Int()
+    bill_id_lte = Int()
+    bill_state = String()
+    bill_state_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    due_date = Date()
+    due_date_gte = Date()
+    due_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    is_unpaid = Boolean()
+    printed = Boolean()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    name = String()
+    name_contains = String()
+    sales_delivery_note_id = Int()
+    sales_delivery_note_id_gte = Int()
+    sales_delivery_note_id_lte = Int()
+    billing_address_id = Int()
+    billing_address_id_gte = Int()
+    billing_address_id_lte = Int()
+    sale_invoice_id = Int()
+    sale_invoice_id_gte = Int()
+    sale_invoice_id_lte = Int()
+    street_number = String()
+    street_number_contains = String()
+    notes = String()
+    notes_contains = String()
+    city = String()
+    city_contains = String()
+    reference = String()
+    reference_contains = String()
+    phone = String()
+    phone_contains = String()
+    delivery_note_type = String()
+    delivery_note_type_contains = String()
+    invoice_type = String()
+    invoice_type_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+    quote_version = Int()
+    quote_version_gte = Int()
+    quote_version_lte = Int()
+
+
+class BillPayment(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BillPayment
+        name = "LegacyBillPayment"
+        description = "Efectos Pago"
+
+
+class BillPaymentFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBillPaymentFilter"
+
+    has_attachments = Boolean()
+    is_advance_payment = Boolean()
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    is_locked = Boolean()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    bank_id = Int()
+    bank_id_gte = Int()
+    bank_id_lte = Int()
+    petty_cash = Int()
+    petty_cash_gte = Int()
+    petty_cash_lte = Int()
+    payment_document_id = String()
+    payment_document_id_contains = String()
+    invoicing_branch_id = Int()
+    invoicing_branch_id_gte = Int()
+    invoicing_branch_id_lte = Int()
+    billing_branch_id = Int()
+    billing_branch_id_gte = Int()
+    billing_branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    confirming_id = Int()
+    confirming_id_gte = Int()
+    confirming_id_lte = Int()
+    promissory_note_id = Int()
+    promissory_note_id_gte = Int()
+    promissory_note_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    supplier_id = Int()
+    supplier_id_gte = Int()
+    supplier_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    payroll_receipt = Int()
+    payroll_receipt_gte = Int()
+    payroll_receipt_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    offset_in_advance = Boolean()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    endowment = Boolean()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    bill_id = Int()
+    bill_id_gte = Int()
+    bill_id_lte = Int()
+    bill_state = String()
+    bill_state_contains = String()
+    user_date1 = Date()
+    user_date1_gte = Date()
+    user_date1_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    payment_date = Date()
+    payment_date_gte = Date()
+    payment_date_lte = Date()
+    due_date = Date()
+    due_date_gte = Date()
+    due_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    printed = Boolean()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    name = String()
+    name_contains = String()
+    stub_number = String()
+    stub_number_contains = String()
+    delivery_note_id = Int()
+    delivery_note_id_gte = Int()
+    delivery_note_id_lte = Int()
+    order_id = Int()
+    order_id_gte = Int()
+    order_id_lte = Int()
+    contract_number = Int()
+    contract_number_gte = Int()
+    contract_number_lte = Int()
+    street_number = String()
+    street_number_contains = String()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    city = String()
+    city_contains = String()
+    forecast = Boolean()
+    supplier_ambit = Int()
+    supplier_ambit_gte = Int()
+    supplier_ambit_lte = Int()
+    reference = String()
+    reference_contains = String()
+    retention = Boolean()
+    request_for_comments = String()
+    request_for_comments_contains = String()
+    advanced_document_type = String()
+    advanced_document_type_contains = String()
+    phone = String()
+    phone_contains = String()
+    invoice_type = Boolean()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class TimekeepingType(SQLAlchemyObjectType):
+    class Meta:
+        model = models.TimekeepingType
+        name = "LegacyTimekeepingType"
+        description = "Tipos de Fichaje"
+
+
+class TimekeepingTypeFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyTimekeepingTypeFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    timekeeping_type = Int()
+    timekeeping_type_gte = Int()
+    timekeeping_type_lte = Int()
+    color = String()
+    color_contains = String()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    description = String()
+    description_contains = String()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date_to_use = Date()
+    date_to_use_gte = Date()
+    date_to_use_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    justified = Boolean()
+    holidays = Boolean()
+
+
+class Vat(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Vat
+        name = "LegacyVat"
+        description = "Maestro de Tipos de IVA"
+
+
+class VatFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyVatFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    char1_gmtiva = String()
+    char1_gmtiva_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    char2_gmtiva = String()
+    char2_gmtiva_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    char3_gmtiva = String()
+    char3_gmtiva_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    char4_gmtiva = String()
+    char4_gmtiva_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    vat_id = Int()
+    vat_id_gte = Int()
+    vat_id_lte = Int()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal2user = Float()
+    decimal2user_gte = Float()
+    decimal2user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_user2 = String()
+    editor_user2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3user = Date()
+    date3user_gte = Date()
+    date3user_lte = Date()
+    date3_temp = Date()
+    date3_temp_gte = Date()
+    date3_temp_lte = Date()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    vat_description = String()
+    vat_description_contains = String()
+    tax_payer = Boolean()
+    equivalence_balance_percentage = Float()
+    equivalence_balance_percentage_gte = Float()
+    equivalence_balance_percentage_lte = Float()
+
+
+class Carrier(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Carrier
+        name = "LegacyCarrier"
+        description = "Maestro de Transportistas"
+
+
+class CarrierFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCarrierFilter"
+
+    is_deregistered = Boolean()
+    is_locked = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    language_id = String()
+    language_id_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    street_type = String()
+    street_type_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    email = String()
+    email_contains = String()
+    fax = String()
+    fax_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    name = String()
+    name_contains = String()
+    street_number = String()
+    street_number_contains = String()
+    max_weight = Float()
+    max_weight_gte = Float()
+    max_weight_lte = Float()
+    city = String()
+    city_contains = String()
+    has_tax = Float()
+    has_tax_gte = Float()
+    has_tax_lte = Float()
+    load_time = Int()
+    load_time_gte = Int()
+    load_time_lte = Int()
+    unload_time = Int()
+    unload_time_gte = Int()
+    unload_time_lte = Int()
+    phone = String()
+    phone_contains = String()
+    phone_1 = String()
+    phone_1_contains = String()
+    phone_2 = String()
+    phone_2_contains = String()
+    delivery_time = Int()
+    delivery_time_gte = Int()
+    delivery_time_lte = Int()
+    tax_type = String()
+    tax_type_contains = String()
+    carrier_type = String()
+    carrier_type_contains = String()
+    max_volume = Float()
+    max_volume_gte = Float()
+    max_volume_lte = Float()
+    web = String()
+    web_contains = String()
+
+
+class Addresses(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Addresses
+        name = "LegacyAddresses"
+        description = "Maestro de los Diferentes Tipos de Vías Públicas"
+
+
+class AddressesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyAddressesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_853 = Float()
+    temperature_in_celsius_r_853_gte = Float()
+    temperature_in_celsius_r_853_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    description = String()
+    description_contains = String()
+
+
+class WorkActivities(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkActivities
+        name = "LegacyWorkActivities"
+        description = "Maestro de Posibles Actividades a Asignar en Presupuestos y Obras"
+
+
+class WorkActivitiesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkActivitiesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_404 = Float()
+    temperature_in_celsius_r_404_gte = Float()
+    temperature_in_celsius_r_404_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+
+
+class WorkSubactivities(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkSubactivities
+        name = "LegacyWorkSubactivities"
+        description = "Maestro de Posibles Subactividades a Asignar en Presupuestos y Obras"
+
+
+class WorkSubactivitiesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkSubactivitiesFilter"
+
+    employee_control = Boolean()
+    user_character1_r_729 = String()
+    user_character1_r_729_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2_r_72 = String()
+    user_character2_r_72_contains = String()
+    characteristics_2d_temp_r_731 = String()
+    characteristics_2d_temp_r_731_contains = String()
+    user_character3_r_399 = String()
+    user_character3_r_399_contains = String()
+    characteristics_3plm = String()
+    characteristics_3plm_contains = String()
+    user_character4_r_190 = String()
+    user_character4_r_190_contains = String()
+    characteristics_4plm_r_442 = String()
+    characteristics_4plm_r_442_contains = String()
+    user_character5_r_768 = String()
+    user_character5_r_768_contains = String()
+    user_character6_r_15 = String()
+    user_character6_r_15_contains = String()
+    user_character7_r_32 = String()
+    user_character7_r_32_contains = String()
+    user_character8_r_924 = String()
+    user_character8_r_924_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    cost_center = Int()
+    cost_center_gte = Int()
+    cost_center_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    cost_subcenter = Int()
+    cost_subcenter_gte = Int()
+    cost_subcenter_lte = Int()
+    decimal1user_r_959 = Float()
+    decimal1user_r_959_gte = Float()
+    decimal1user_r_959_lte = Float()
+    decimal1tlmp_r_692 = Float()
+    decimal1tlmp_r_692_gte = Float()
+    decimal1tlmp_r_692_lte = Float()
+    decimal_to_user_r_434 = Float()
+    decimal_to_user_r_434_gte = Float()
+    decimal_to_user_r_434_lte = Float()
+    decimal_to_temp = Float()
+    decimal_to_temp_gte = Float()
+    decimal_to_temp_lte = Float()
+    decimal3user_r_36 = Float()
+    decimal3user_r_36_gte = Float()
+    decimal3user_r_36_lte = Float()
+    decimal3tlmp_r_875 = Float()
+    decimal3tlmp_r_875_gte = Float()
+    decimal3tlmp_r_875_lte = Float()
+    decimal4user_r_58 = Float()
+    decimal4user_r_58_gte = Float()
+    decimal4user_r_58_lte = Float()
+    decimal4tlmp_r_703 = Float()
+    decimal4tlmp_r_703_gte = Float()
+    decimal4tlmp_r_703_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    decimal6user_r_98 = Float()
+    decimal6user_r_98_gte = Float()
+    decimal6user_r_98_lte = Float()
+    description = String()
+    description_contains = String()
+    editor_user1_r_4 = String()
+    editor_user1_r_4_contains = String()
+    editor_to_user_r_26 = String()
+    editor_to_user_r_26_contains = String()
+    date1_user_r_274 = Date()
+    date1_user_r_274_gte = Date()
+    date1_user_r_274_lte = Date()
+    date1_temp_r_39 = Date()
+    date1_temp_r_39_gte = Date()
+    date1_temp_r_39_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date_2nd_quarter_temp_r_75 = Date()
+    date_2nd_quarter_temp_r_75_gte = Date()
+    date_2nd_quarter_temp_r_75_lte = Date()
+    date3_user_r_312 = Date()
+    date3_user_r_312_gte = Date()
+    date3_user_r_312_lte = Date()
+    date_3rd_quarter_temp = Date()
+    date_3rd_quarter_temp_gte = Date()
+    date_3rd_quarter_temp_lte = Date()
+
+
+class StructureCosts(SQLAlchemyObjectType):
+    class Meta:
+        model = models.StructureCosts
+        name = "LegacyStructureCosts"
+        description = "Maestro de Tipos de Repartos de Costes de Estructura"
+
+
+class StructureCostsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyStructureCostsFilter"
+
+    calculation_base = String()
+    calculation_base_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    modification_user = String()
+    modification_user_contains = String()
+    distribution_type = Int()
+    distribution_type_gte = Int()
+    distribution_type_lte = Int()
+    creation_user = String()
+    creation_user_contains = String()
+    distribution_criteria = String()
+    distribution_criteria_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_475 = Float()
+    temperature_in_celsius_r_475_gte = Float()
+    temperature_in_celsius_r_475_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    modification_date = Date()
+    modification_date_gte = Date()
+    modification_date_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+
+
+class CostConcepts(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CostConcepts
+        name = "LegacyCostConcepts"
+        description = "Maestro de los Diferentes Tipos de Conceptos de Coste"
+
+
+class CostConceptsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCostConceptsFilter"
+
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    automatic_creation = Boolean()
+    calculation_base = String()
+    calculation_base_contains = String()
+    calculation_base_filter_field = String()
+    calculation_base_filter_field_contains = String()
+    distribution_scope_filter_field = String()
+    distribution_scope_filter_field_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    item_planning = String()
+    item_planning_contains = String()
+    cost_concept = Int()
+    cost_concept_gte = Int()
+    cost_concept_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_794 = Float()
+    temperature_in_celsius_r_794_gte = Float()
+    temperature_in_celsius_r_794_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    cost_concept_description = String()
+    cost_concept_description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    filter_by = String()
+    filter_by_contains = String()
+    filter_by_r_64 = String()
+    filter_by_r_64_contains = String()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    installed = Boolean()
+    item_percentage = Float()
+    item_percentage_gte = Float()
+    item_percentage_lte = Float()
+    cost_concept_percentage = Float()
+    cost_concept_percentage_gte = Float()
+    cost_concept_percentage_lte = Float()
+    labor_percentage = Float()
+    labor_percentage_gte = Float()
+    labor_percentage_lte = Float()
+    service_percentage = Float()
+    service_percentage_gte = Float()
+    service_percentage_lte = Float()
+    items = Boolean()
+    reference = String()
+    reference_contains = String()
+    distribution_scope = String()
+    distribution_scope_contains = String()
+    labor = Boolean()
+    services = Boolean()
+    type = String()
+    type_contains = String()
+    transfer_to_project = Boolean()
+
+
+class Gofalind(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Gofalind
+        name = "LegacyGofalind"
+        description = "Detalle de cada uno de los Resúmenes de la Factura de Obra. Se Utiliza para Incluir el Detalle de Partes Facturados y Certificaciones de Presupuestos"
+
+
+class GofalindFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyGofalindFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    budget_quantity = Float()
+    budget_quantity_gte = Float()
+    budget_quantity_lte = Float()
+    certification_quantity = Float()
+    certification_quantity_gte = Float()
+    certification_quantity_lte = Float()
+    concept_quantity = Float()
+    concept_quantity_gte = Float()
+    concept_quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    company1 = String()
+    company1_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    item = String()
+    item_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    phase = Int()
+    phase_gte = Int()
+    phase_lte = Int()
+    group_code = String()
+    group_code_contains = String()
+    delivery_part = Int()
+    delivery_part_gte = Int()
+    delivery_part_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    task = Int()
+    task_gte = Int()
+    task_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    pre_invoiced_quantity = Float()
+    pre_invoiced_quantity_gte = Float()
+    pre_invoiced_quantity_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_448 = Float()
+    temperature_in_celsius_r_448_gte = Float()
+    temperature_in_celsius_r_448_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    certification_amount = Float()
+    certification_amount_gte = Float()
+    certification_amount_lte = Float()
+    caregiver_id = Int()
+    caregiver_id_gte = Int()
+    caregiver_id_lte = Int()
+    part_line_id_r_288 = Int()
+    part_line_id_r_288_gte = Int()
+    part_line_id_r_288_lte = Int()
+    id_gvallin = Int()
+    id_gvallin_gte = Int()
+    id_gvallin_lte = Int()
+    measured_amount = Float()
+    measured_amount_gte = Float()
+    measured_amount_lte = Float()
+    budget_amount = Float()
+    budget_amount_gte = Float()
+    budget_amount_lte = Float()
+    pre_invoiced_amount = Float()
+    pre_invoiced_amount_gte = Float()
+    pre_invoiced_amount_lte = Float()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    certification_percentage = Float()
+    certification_percentage_gte = Float()
+    certification_percentage_lte = Float()
+    percentage_concept = Float()
+    percentage_concept_gte = Float()
+    percentage_concept_lte = Float()
+    reference = String()
+    reference_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class ReasonRefusals(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ReasonRefusals
+        name = "LegacyReasonRefusals"
+        description = "Maestro de Motivos de Rechazo de Presupuestos"
+
+
+class ReasonRefusalsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyReasonRefusalsFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    rejection_reason = Int()
+    rejection_reason_gte = Int()
+    rejection_reason_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_309 = Float()
+    temperature_in_celsius_r_309_gte = Float()
+    temperature_in_celsius_r_309_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+
+
+class WorkHeads(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkHeads
+        name = "LegacyWorkHeads"
+        description = "Cabecera del Documento de Obras"
+
+
+class WorkHeadsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkHeadsFilter"
+
+    attachments = Boolean()
+    administration = Boolean()
+    estimation_group = String()
+    estimation_group_contains = String()
+    total_advances = Float()
+    total_advances_gte = Float()
+    total_advances_lte = Float()
+    health_and_safety_author = String()
+    health_and_safety_author_contains = String()
+    request_activity_subactivity = Boolean()
+    contracted_applied_invoiced = Float()
+    contracted_applied_invoiced_gte = Float()
+    contracted_applied_invoiced_lte = Float()
+    request_chapter_in_parts = Boolean()
+    contract_applied_purchase_order = Float()
+    contract_applied_purchase_order_gte = Float()
+    contract_applied_purchase_order_lte = Float()
+    activity_control_subactivity_control = Boolean()
+    hired_confirmed = Float()
+    hired_confirmed_gte = Float()
+    hired_confirmed_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    tax_identification_number_r_485 = String()
+    tax_identification_number_r_485_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    committed_cost = Float()
+    committed_cost_gte = Float()
+    committed_cost_lte = Float()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    cost_center = Int()
+    cost_center_gte = Int()
+    cost_center_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    responsible_person = Int()
+    responsible_person_gte = Int()
+    responsible_person_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    administration_payment_method = Int()
+    administration_payment_method_gte = Int()
+    administration_payment_method_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    origin_work = Int()
+    origin_work_gte = Int()
+    origin_work_lte = Int()
+    country = String()
+    country_contains = String()
+    country_r_666 = String()
+    country_r_666_contains = String()
+    purchase_proposal = Int()
+    purchase_proposal_gte = Int()
+    purchase_proposal_lte = Int()
+    subcontracting_proposal = Int()
+    subcontracting_proposal_gte = Int()
+    subcontracting_proposal_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    province_r_756 = Int()
+    province_r_756_gte = Int()
+    province_r_756_lte = Int()
+    sales_agent = Int()
+    sales_agent_gte = Int()
+    sales_agent_lte = Int()
+    cost_center_r_435 = Int()
+    cost_center_r_435_gte = Int()
+    cost_center_r_435_lte = Int()
+    customer_contact = Int()
+    customer_contact_gte = Int()
+    customer_contact_lte = Int()
+    project_type = Int()
+    project_type_gte = Int()
+    project_type_lte = Int()
+    user = String()
+    user_contains = String()
+    address = String()
+    address_contains = String()
+    address_r_664 = String()
+    address_r_664_contains = String()
+    area = String()
+    area_contains = String()
+    allocated_cost = Float()
+    allocated_cost_gte = Float()
+    allocated_cost_lte = Float()
+    neighborhood = String()
+    neighborhood_contains = String()
+    neighborhood_r_648 = String()
+    neighborhood_r_648_contains = String()
+    registered_neighborhood = String()
+    registered_neighborhood_contains = String()
+    commission_percentage = Float()
+    commission_percentage_gte = Float()
+    commission_percentage_lte = Float()
+    request_work_order_in_parts = Boolean()
+    measured_cost = Float()
+    measured_cost_gte = Float()
+    measured_cost_lte = Float()
+    invoiced_administrative_parts_cost = Float()
+    invoiced_administrative_parts_cost_gte = Float()
+    invoiced_administrative_parts_cost_lte = Float()
+    pre_invoiced_administration_parts_cost = Float()
+    pre_invoiced_administration_parts_cost_gte = Float()
+    pre_invoiced_administration_parts_cost_lte = Float()
+    administration_parts_cost = Float()
+    administration_parts_cost_gte = Float()
+    administration_parts_cost_lte = Float()
+    invoiced_delivery_parts_cost = Float()
+    invoiced_delivery_parts_cost_gte = Float()
+    invoiced_delivery_parts_cost_lte = Float()
+    pre_invoiced_delivery_parts_cost = Float()
+    pre_invoiced_delivery_parts_cost_gte = Float()
+    pre_invoiced_delivery_parts_cost_lte = Float()
+    delivery_cost = Float()
+    delivery_cost_gte = Float()
+    delivery_cost_lte = Float()
+    request_quote_in_parts = Boolean()
+    control_requested_by_item = Boolean()
+    assistance_center = String()
+    assistance_center_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_606 = Float()
+    temperature_in_celsius_r_606_gte = Float()
+    temperature_in_celsius_r_606_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    detailed_description = String()
+    detailed_description_contains = String()
+    address_r_326 = String()
+    address_r_326_contains = String()
+    address_r_736 = String()
+    address_r_736_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    postal_code_r_798 = Int()
+    postal_code_r_798_gte = Int()
+    postal_code_r_798_lte = Int()
+    discount_percentage = Float()
+    discount_percentage_gte = Float()
+    discount_percentage_lte = Float()
+    differentiate_property_subcontracting_order = Boolean()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    work_progress = String()
+    work_progress_contains = String()
+    status = String()
+    status_contains = String()
+    award_date = Date()
+    award_date_gte = Date()
+    award_date_lte = Date()
+    closed_date = Date()
+    closed_date_gte = Date()
+    closed_date_lte = Date()
+    contract_date = Date()
+    contract_date_gte = Date()
+    contract_date_lte = Date()
+    in_progress_date = Date()
+    in_progress_date_gte = Date()
+    in_progress_date_lte = Date()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    completed_date = Date()
+    completed_date_gte = Date()
+    completed_date_lte = Date()
+    warranty_end_date = Date()
+    warranty_end_date_gte = Date()
+    warranty_end_date_lte = Date()
+    warranty_start_date = Date()
+    warranty_start_date_gte = Date()
+    warranty_start_date_lte = Date()
+    property = String()
+    property_contains = String()
+    license_expiry_date = Date()
+    license_expiry_date_gte = Date()
+    license_expiry_date_lte = Date()
+    bid_submission = Date()
+    bid_submission_gte = Date()
+    bid_submission_lte = Date()
+    primary_occupation_date = Date()
+    primary_occupation_date_gte = Date()
+    primary_occupation_date_lte = Date()
+    folio = String()
+    folio_contains = String()
+    estimated_closure_date = Date()
+    estimated_closure_date_gte = Date()
+    estimated_closure_date_lte = Date()
+    final_delivery_date = Date()
+    final_delivery_date_gte = Date()
+    final_delivery_date_lte = Date()
+    planned_start_date = Date()
+    planned_start_date_gte = Date()
+    planned_start_date_lte = Date()
+    planned_date = Date()
+    planned_date_gte = Date()
+    planned_date_lte = Date()
+    certified_articles_amount = Float()
+    certified_articles_amount_gte = Float()
+    certified_articles_amount_lte = Float()
+    certified_labor_cost_amount = Float()
+    certified_labor_cost_amount_gte = Float()
+    certified_labor_cost_amount_lte = Float()
+    certified_services_amount = Float()
+    certified_services_amount_gte = Float()
+    certified_services_amount_lte = Float()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    contracted_import = Float()
+    contracted_import_gte = Float()
+    contracted_import_lte = Float()
+    increase_expenses = Float()
+    increase_expenses_gte = Float()
+    increase_expenses_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    billed_amount_low_coefficient = Float()
+    billed_amount_low_coefficient_gte = Float()
+    billed_amount_low_coefficient_lte = Float()
+    gross_invoice_amount = Float()
+    gross_invoice_amount_gte = Float()
+    gross_invoice_amount_lte = Float()
+    administrative_part_invoice_amount_increase_decrease = Float()
+    administrative_part_invoice_amount_increase_decrease_gte = Float()
+    administrative_part_invoice_amount_increase_decrease_lte = Float()
+    billed_amount_increase_decrease = Float()
+    billed_amount_increase_decrease_gte = Float()
+    billed_amount_increase_decrease_lte = Float()
+    unexpected_expenses_invoiced_amount = Float()
+    unexpected_expenses_invoiced_amount_gte = Float()
+    unexpected_expenses_invoiced_amount_lte = Float()
+    tax_id = String()
+    tax_id_contains = String()
+    estimated_amount = Float()
+    estimated_amount_gte = Float()
+    estimated_amount_lte = Float()
+    induced_times = Boolean()
+    approx_total_tax = Float()
+    approx_total_tax_gte = Float()
+    approx_total_tax_lte = Float()
+    pre_certified_item_amount = Float()
+    pre_certified_item_amount_gte = Float()
+    pre_certified_item_amount_lte = Float()
+    pre_certified_labor_cost = Float()
+    pre_certified_labor_cost_gte = Float()
+    pre_certified_labor_cost_lte = Float()
+    pre_certified_expenses_amount = Float()
+    pre_certified_expenses_amount_gte = Float()
+    pre_certified_expenses_amount_lte = Float()
+    pre_certified_services_amount = Float()
+    pre_certified_services_amount_gte = Float()
+    pre_certified_services_amount_lte = Float()
+    pre_certified_amount_gross = Float()
+    pre_certified_amount_gross_gte = Float()
+    pre_certified_amount_gross_lte = Float()
+    invoiced_delivery_parts_amount = Float()
+    invoiced_delivery_parts_amount_gte = Float()
+    invoiced_delivery_parts_amount_lte = Float()
+    pre_invoiced_delivery_parts_amount = Float()
+    pre_invoiced_delivery_parts_amount_gte = Float()
+    pre_invoiced_delivery_parts_amount_lte = Float()
+    amount_due = Float()
+    amount_due_gte = Float()
+    amount_due_lte = Float()
+    pre_invoiced_amount_low_coefficient = Float()
+    pre_invoiced_amount_low_coefficient_gte = Float()
+    pre_invoiced_amount_low_coefficient_lte = Float()
+    pre_invoiced_unexpected_expenses_amount = Float()
+    pre_invoiced_unexpected_expenses_amount_gte = Float()
+    pre_invoiced_unexpected_expenses_amount_lte = Float()
+    pre_invoiced_amount = Float()
+    pre_invoiced_amount_gte = Float()
+    pre_invoiced_amount_lte = Float()
+    administrative_part_increase_decrease_amount = Float()
+    administrative_part_increase_decrease_amount_gte = Float()
+    administrative_part_increase_decrease_amount_lte = Float()
+    pre_invoiced_amount_increase_decrease = Float()
+    pre_invoiced_amount_increase_decrease_gte = Float()
+    pre_invoiced_amount_increase_decrease_lte = Float()
+    health_and_safety_budget = Float()
+    health_and_safety_budget_gte = Float()
+    health_and_safety_budget_lte = Float()
+    billed_amount = Float()
+    billed_amount_gte = Float()
+    billed_amount_lte = Float()
+    book = String()
+    book_contains = String()
+    number_of_floors = Int()
+    number_of_floors_gte = Int()
+    number_of_floors_lte = Int()
+    number = String()
+    number_contains = String()
+    number_r_50 = String()
+    number_r_50_contains = String()
+    cost_origin = String()
+    cost_origin_contains = String()
+    health_and_safety_coordinator = String()
+    health_and_safety_coordinator_contains = String()
+    planned_project = Boolean()
+    city = String()
+    city_contains = String()
+    city_r_534 = String()
+    city_r_534_contains = String()
+    item_location = Boolean()
+    registered_city = String()
+    registered_city_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    business_name_r_406 = String()
+    business_name_r_406_contains = String()
+    cadastral_reference = String()
+    cadastral_reference_contains = String()
+    customer_reference = String()
+    customer_reference_contains = String()
+    internal_reference = String()
+    internal_reference_contains = String()
+    retention_percentage = Float()
+    retention_percentage_gte = Float()
+    retention_percentage_lte = Float()
+    financial_receipt = Float()
+    financial_receipt_gte = Float()
+    financial_receipt_lte = Float()
+    floor_occupancy_support = Float()
+    floor_occupancy_support_gte = Float()
+    floor_occupancy_support_lte = Float()
+    solar_supplier = Float()
+    solar_supplier_gte = Float()
+    solar_supplier_lte = Float()
+    total_construction_supplies = Float()
+    total_construction_supplies_gte = Float()
+    total_construction_supplies_lte = Float()
+    total_construction_reasons_support = Float()
+    total_construction_reasons_support_gte = Float()
+    total_construction_reasons_support_lte = Float()
+    construction_stock_control = Boolean()
+    accumulated_parts_cost = Float()
+    accumulated_parts_cost_gte = Float()
+    accumulated_parts_cost_lte = Float()
+    administrative_structure_cost = Float()
+    administrative_structure_cost_gte = Float()
+    administrative_structure_cost_lte = Float()
+    structure_cost_type = Float()
+    structure_cost_type_gte = Float()
+    structure_cost_type_lte = Float()
+    conditions = String()
+    conditions_contains = String()
+    total_cost = Float()
+    total_cost_gte = Float()
+    total_cost_lte = Float()
+    phone_number = String()
+    phone_number_contains = String()
+    billing_type = String()
+    billing_type_contains = String()
+    total_imported_hours = Float()
+    total_imported_hours_gte = Float()
+    total_imported_hours_lte = Float()
+    induced_mo_manufacturing_order = Boolean()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    typology = String()
+    typology_contains = String()
+    project_type_r_218 = String()
+    project_type_r_218_contains = String()
+    total_estimated_cost = Float()
+    total_estimated_cost_gte = Float()
+    total_estimated_cost_lte = Float()
+    volume = String()
+    volume_contains = String()
+    coordinator_degree = String()
+    coordinator_degree_contains = String()
+    total_projected_sales = Float()
+    total_projected_sales_gte = Float()
+    total_projected_sales_lte = Float()
+    article_cost_type_plan = Float()
+    article_cost_type_plan_gte = Float()
+    article_cost_type_plan_lte = Float()
+    subcontracting_cost_type_plan = Float()
+    subcontracting_cost_type_plan_gte = Float()
+    subcontracting_cost_type_plan_lte = Float()
+    labor_cost_plan = Float()
+    labor_cost_plan_gte = Float()
+    labor_cost_plan_lte = Float()
+    gas_cost_type_plan = Float()
+    gas_cost_type_plan_gte = Float()
+    gas_cost_type_plan_lte = Float()
+    service_plan_cost_type = Float()
+    service_plan_cost_type_gte = Float()
+    service_plan_cost_type_lte = Float()
+    cost_budget = Float()
+    cost_budget_gte = Float()
+    cost_budget_lte = Float()
+    total_planned_hours = Float()
+    total_planned_hours_gte = Float()
+    total_planned_hours_lte = Float()
+    retention_type = String()
+    retention_type_contains = String()
+    health_and_safety_certification = String()
+    health_and_safety_certification_contains = String()
+    location = String()
+    location_contains = String()
+    sales_parts_administration_invoiced = Float()
+    sales_parts_administration_invoiced_gte = Float()
+    sales_parts_administration_invoiced_lte = Float()
+    administration_parts_sales_pre_invoiced = Float()
+    administration_parts_sales_pre_invoiced_gte = Float()
+    administration_parts_sales_pre_invoiced_lte = Float()
+    sales_parts_administration = Float()
+    sales_parts_administration_gte = Float()
+    sales_parts_administration_lte = Float()
+
+
+class WorkLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkLines
+        name = "LegacyWorkLines"
+        description = "Líneas de Detalle de la Estructura de Capítulos y Partidas del Documento"
+
+
+class WorkLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkLinesFilter"
+
+    accumulate_cost = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    calculation_base = String()
+    calculation_base_contains = String()
+    request_quote_before_purchase_project = Boolean()
+    formula_quantity = Float()
+    formula_quantity_gte = Float()
+    formula_quantity_lte = Float()
+    allocated_quantity = Float()
+    allocated_quantity_gte = Float()
+    allocated_quantity_lte = Float()
+    calculation_base_field = String()
+    calculation_base_field_contains = String()
+    purchase_quantity = Float()
+    purchase_quantity_gte = Float()
+    purchase_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    certified_quantity = Float()
+    certified_quantity_gte = Float()
+    certified_quantity_lte = Float()
+    encoded = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    induced_cost = Float()
+    induced_cost_gte = Float()
+    induced_cost_lte = Float()
+    line_item_classification = String()
+    line_item_classification_contains = String()
+    requisition_list_quantity = Float()
+    requisition_list_quantity_gte = Float()
+    requisition_list_quantity_lte = Float()
+    decomposed_identifier = Int()
+    decomposed_identifier_gte = Int()
+    decomposed_identifier_lte = Int()
+    composite_identifier = Int()
+    composite_identifier_gte = Int()
+    composite_identifier_lte = Int()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    chapter_id = Int()
+    chapter_id_gte = Int()
+    chapter_id_lte = Int()
+    item = String()
+    item_contains = String()
+    cost_concept = Int()
+    cost_concept_gte = Int()
+    cost_concept_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    committed_cost = Float()
+    committed_cost_gte = Float()
+    committed_cost_lte = Float()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    source_library = Int()
+    source_library_gte = Int()
+    source_library_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    supplier = Int()
+    supplier_gte = Int()
+    supplier_lte = Int()
+    currency = String()
+    currency_contains = String()
+    sales_packaging = String()
+    sales_packaging_contains = String()
+    purchase_packaging = String()
+    purchase_packaging_contains = String()
+    unit_of_measurement = String()
+    unit_of_measurement_contains = String()
+    allocated_cost = Float()
+    allocated_cost_gte = Float()
+    allocated_cost_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    purchase_property_quantity = Float()
+    purchase_property_quantity_gte = Float()
+    purchase_property_quantity_lte = Float()
+    quantity_u_e_c = Float()
+    quantity_u_e_c_gte = Float()
+    quantity_u_e_c_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_654 = Float()
+    temperature_in_celsius_r_654_gte = Float()
+    temperature_in_celsius_r_654_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    discount_c1 = Float()
+    discount_c1_gte = Float()
+    discount_c1_lte = Float()
+    discount_c2 = Float()
+    discount_c2_gte = Float()
+    discount_c2_lte = Float()
+    c3_discount = Float()
+    c3_discount_gte = Float()
+    c3_discount_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    fiedbc_factor = Float()
+    fiedbc_factor_gte = Float()
+    fiedbc_factor_lte = Float()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    filter_by = String()
+    filter_by_contains = String()
+    tool = Boolean()
+    automatic_allocation = Boolean()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    copy_or_import = Boolean()
+    pre_certified_amount = Float()
+    pre_certified_amount_gte = Float()
+    pre_certified_amount_lte = Float()
+    subcontracted_line = Int()
+    subcontracted_line_gte = Int()
+    subcontracted_line_lte = Int()
+    line = Int()
+    line_gte = Int()
+    line_lte = Int()
+    budget_line = Int()
+    budget_line_gte = Int()
+    budget_line_lte = Int()
+    line_to_replace = Int()
+    line_to_replace_gte = Int()
+    line_to_replace_lte = Int()
+    reason_for_non_allocation = String()
+    reason_for_non_allocation_contains = String()
+    non_chargeable_line = Boolean()
+    name = String()
+    name_contains = String()
+    unplanned = Boolean()
+    cost_origin = String()
+    cost_origin_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    order_r_23 = Int()
+    order_r_23_gte = Int()
+    order_r_23_lte = Int()
+    item_percentage = Float()
+    item_percentage_gte = Float()
+    item_percentage_lte = Float()
+    cost_percentage_concept = Float()
+    cost_percentage_concept_gte = Float()
+    cost_percentage_concept_lte = Float()
+    labor_percentage = Float()
+    labor_percentage_gte = Float()
+    labor_percentage_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    supplier_scope = Int()
+    supplier_scope_gte = Int()
+    supplier_scope_lte = Int()
+    service_percentage = Float()
+    service_percentage_gte = Float()
+    service_percentage_lte = Float()
+    recalculable = Boolean()
+    external_reference = String()
+    external_reference_contains = String()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    unreceived_order_stocks = Float()
+    unreceived_order_stocks_gte = Float()
+    unreceived_order_stocks_lte = Float()
+    subcontractor = Boolean()
+    substitute = Boolean()
+    total_line_quantity = Float()
+    total_line_quantity_gte = Float()
+    total_line_quantity_lte = Float()
+    budgeted_quantity = Float()
+    budgeted_quantity_gte = Float()
+    budgeted_quantity_lte = Float()
+    budgeted_cost = Float()
+    budgeted_cost_gte = Float()
+    budgeted_cost_lte = Float()
+    budgeted_amount = Float()
+    budgeted_amount_gte = Float()
+    budgeted_amount_lte = Float()
+    induced_mo_manufacturing_order = Boolean()
+    installation_time = Float()
+    installation_time_gte = Float()
+    installation_time_lte = Float()
+    category = Int()
+    category_gte = Int()
+    category_lte = Int()
+    item_type_cost_concept = String()
+    item_type_cost_concept_contains = String()
+    line_type = String()
+    line_type_contains = String()
+    subcontracting_type = String()
+    subcontracting_type_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class WorkStructures(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkStructures
+        name = "LegacyWorkStructures"
+        description = "Estructura de Capítulos y Partidas del Documento de  Obra"
+
+
+class WorkStructuresFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkStructuresFilter"
+
+    attachments = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    item_scope = Int()
+    item_scope_gte = Int()
+    item_scope_lte = Int()
+    budget_quantity = Float()
+    budget_quantity_gte = Float()
+    budget_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    total_quantity = Float()
+    total_quantity_gte = Float()
+    total_quantity_lte = Float()
+    estimated_quantity = Float()
+    estimated_quantity_gte = Float()
+    estimated_quantity_lte = Float()
+    delivered_quantity = Float()
+    delivered_quantity_gte = Float()
+    delivered_quantity_lte = Float()
+    certified_expenses_amount = Float()
+    certified_expenses_amount_gte = Float()
+    certified_expenses_amount_lte = Float()
+    certify = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    work_chapter = String()
+    work_chapter_contains = String()
+    item_classification_item_lines = String()
+    item_classification_item_lines_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    chapter_id = Int()
+    chapter_id_gte = Int()
+    chapter_id_lte = Int()
+    parent_id = Int()
+    parent_id_gte = Int()
+    parent_id_lte = Int()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    subcontracted_service = String()
+    subcontracted_service_contains = String()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    quality_document = String()
+    quality_document_contains = String()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    bookstore = String()
+    bookstore_contains = String()
+    material_list = Int()
+    material_list_gte = Int()
+    material_list_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    unit_of_measure = String()
+    unit_of_measure_contains = String()
+    allocated_article_cost = Float()
+    allocated_article_cost_gte = Float()
+    allocated_article_cost_lte = Float()
+    subcontracted_cost_incurred = Float()
+    subcontracted_cost_incurred_gte = Float()
+    subcontracted_cost_incurred_lte = Float()
+    labor_cost_incurred = Float()
+    labor_cost_incurred_gte = Float()
+    labor_cost_incurred_lte = Float()
+    allocated_expense_cost = Float()
+    allocated_expense_cost_gte = Float()
+    allocated_expense_cost_lte = Float()
+    machine_cost_allocation = Float()
+    machine_cost_allocation_gte = Float()
+    machine_cost_allocation_lte = Float()
+    service_cost_imputed = Float()
+    service_cost_imputed_gte = Float()
+    service_cost_imputed_lte = Float()
+    allocated_cost = Float()
+    allocated_cost_gte = Float()
+    allocated_cost_lte = Float()
+    contains_compound = Boolean()
+    presentation_cost = Float()
+    presentation_cost_gte = Float()
+    presentation_cost_lte = Float()
+    actual_cost = Float()
+    actual_cost_gte = Float()
+    actual_cost_lte = Float()
+    invoiced_delivery_parts_cost = Float()
+    invoiced_delivery_parts_cost_gte = Float()
+    invoiced_delivery_parts_cost_lte = Float()
+    pre_invoiced_delivery_parts_cost = Float()
+    pre_invoiced_delivery_parts_cost_gte = Float()
+    pre_invoiced_delivery_parts_cost_lte = Float()
+    equivalent_cost = Float()
+    equivalent_cost_gte = Float()
+    equivalent_cost_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_material_price = Float()
+    decimal_to_ton_of_limestone_material_price_gte = Float()
+    decimal_to_ton_of_limestone_material_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    breakdown = Boolean()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    exportable_fiebdc = Boolean()
+    fiedbc_factor = Float()
+    fiedbc_factor_gte = Float()
+    fiedbc_factor_lte = Float()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    end_date = Date()
+    end_date_gte = Date()
+    end_date_lte = Date()
+    start_date = Date()
+    start_date_gte = Date()
+    start_date_lte = Date()
+    last_input_date = Date()
+    last_input_date_gte = Date()
+    last_input_date_lte = Date()
+    completed = Boolean()
+    certified_article_amount = Float()
+    certified_article_amount_gte = Float()
+    certified_article_amount_lte = Float()
+    certified_subcontract_amount = Float()
+    certified_subcontract_amount_gte = Float()
+    certified_subcontract_amount_lte = Float()
+    certified_labor_cost = Float()
+    certified_labor_cost_gte = Float()
+    certified_labor_cost_lte = Float()
+    certified_expenses_amount_r_788 = Float()
+    certified_expenses_amount_r_788_gte = Float()
+    certified_expenses_amount_r_788_lte = Float()
+    certified_machine_amount = Float()
+    certified_machine_amount_gte = Float()
+    certified_machine_amount_lte = Float()
+    certified_service_amount = Float()
+    certified_service_amount_gte = Float()
+    certified_service_amount_lte = Float()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    gross_invoice_amount = Float()
+    gross_invoice_amount_gte = Float()
+    gross_invoice_amount_lte = Float()
+    maximum_amount = Float()
+    maximum_amount_gte = Float()
+    maximum_amount_lte = Float()
+    budget_amount = Float()
+    budget_amount_gte = Float()
+    budget_amount_lte = Float()
+    estimated_amount = Float()
+    estimated_amount_gte = Float()
+    estimated_amount_lte = Float()
+    induced_time = Boolean()
+    pre_certified_item_amount = Float()
+    pre_certified_item_amount_gte = Float()
+    pre_certified_item_amount_lte = Float()
+    pre_certified_labor_cost = Float()
+    pre_certified_labor_cost_gte = Float()
+    pre_certified_labor_cost_lte = Float()
+    pre_certified_expenses_amount = Float()
+    pre_certified_expenses_amount_gte = Float()
+    pre_certified_expenses_amount_lte = Float()
+    pre_certified_services_amount = Float()
+    pre_certified_services_amount_gte = Float()
+    pre_certified_services_amount_lte = Float()
+    pre_certified_amount_gross = Float()
+    pre_certified_amount_gross_gte = Float()
+    pre_certified_amount_gross_lte = Float()
+    invoiced_delivery_parts_amount = Float()
+    invoiced_delivery_parts_amount_gte = Float()
+    invoiced_delivery_parts_amount_lte = Float()
+    pre_invoiced_delivery_parts_amount = Float()
+    pre_invoiced_delivery_parts_amount_gte = Float()
+    pre_invoiced_delivery_parts_amount_lte = Float()
+    amount_due = Float()
+    amount_due_gte = Float()
+    amount_due_lte = Float()
+    pre_invoiced_amount = Float()
+    pre_invoiced_amount_gte = Float()
+    pre_invoiced_amount_lte = Float()
+    target_margin = Float()
+    target_margin_gte = Float()
+    target_margin_lte = Float()
+    non_billable = Boolean()
+    level = Int()
+    level_gte = Int()
+    level_lte = Int()
+    unplanned = Boolean()
+    cost_structure_origin = String()
+    cost_structure_origin_contains = String()
+    cost_origin = String()
+    cost_origin_contains = String()
+    item_number = Boolean()
+    term = Float()
+    term_gte = Float()
+    term_lte = Float()
+    yield_percentage = Float()
+    yield_percentage_gte = Float()
+    yield_percentage_lte = Float()
+    recalculable = Boolean()
+    external_reference = String()
+    external_reference_contains = String()
+    internal_reference = String()
+    internal_reference_contains = String()
+    sub_obe = Boolean()
+    structure_cost_type = Float()
+    structure_cost_type_gte = Float()
+    structure_cost_type_lte = Float()
+    total_cost = Float()
+    total_cost_gte = Float()
+    total_cost_lte = Float()
+    total_imported_hours = Float()
+    total_imported_hours_gte = Float()
+    total_imported_hours_lte = Float()
+    induced_mo_manufacturing_overhead = Boolean()
+    presentation_cost_r_361 = Float()
+    presentation_cost_r_361_gte = Float()
+    presentation_cost_r_361_lte = Float()
+    sales_quotation = Float()
+    sales_quotation_gte = Float()
+    sales_quotation_lte = Float()
+    item_cost = Float()
+    item_cost_gte = Float()
+    item_cost_lte = Float()
+    subcontracted_cost = Float()
+    subcontracted_cost_gte = Float()
+    subcontracted_cost_lte = Float()
+    labor_cost = Float()
+    labor_cost_gte = Float()
+    labor_cost_lte = Float()
+    expense_cost = Float()
+    expense_cost_gte = Float()
+    expense_cost_lte = Float()
+    machine_cost_plan = Float()
+    machine_cost_plan_gte = Float()
+    machine_cost_plan_lte = Float()
+    service_cost = Float()
+    service_cost_gte = Float()
+    service_cost_lte = Float()
+    plan_cost = Float()
+    plan_cost_gte = Float()
+    plan_cost_lte = Float()
+    planned_hours = Float()
+    planned_hours_gte = Float()
+    planned_hours_lte = Float()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class CertificationLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CertificationLines
+        name = "LegacyCertificationLines"
+        description = "Detalle de Líneas del Presupuesto Incluida en las Certificaciones de Pre"
+
+
+class CertificationLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCertificationLinesFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    accumulated_certification_quantity = Float()
+    accumulated_certification_quantity_gte = Float()
+    accumulated_certification_quantity_lte = Float()
+    certified_quantity = Float()
+    certified_quantity_gte = Float()
+    certified_quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    chapter_id = Int()
+    chapter_id_gte = Int()
+    chapter_id_lte = Int()
+    item = String()
+    item_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    certification = Int()
+    certification_gte = Int()
+    certification_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_252 = Float()
+    temperature_in_celsius_r_252_gte = Float()
+    temperature_in_celsius_r_252_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    accumulated_certification_amount = Float()
+    accumulated_certification_amount_gte = Float()
+    accumulated_certification_amount_lte = Float()
+    redistributed_certified_amount = Float()
+    redistributed_certified_amount_gte = Float()
+    redistributed_certified_amount_lte = Float()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    line = Int()
+    line_gte = Int()
+    line_lte = Int()
+    budget_line = Int()
+    budget_line_gte = Int()
+    budget_line_lte = Int()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class CertificationStructures(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CertificationStructures
+        name = "LegacyCertificationStructures"
+        description = "Detalle de Estrucutura del Presupuesto Incluida en las Certificaciones d"
+
+
+class CertificationStructuresFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCertificationStructuresFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    accumulated_certification_quantity = Float()
+    accumulated_certification_quantity_gte = Float()
+    accumulated_certification_quantity_lte = Float()
+    certified_quantity = Float()
+    certified_quantity_gte = Float()
+    certified_quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    chapter = String()
+    chapter_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    chapter_id = Int()
+    chapter_id_gte = Int()
+    chapter_id_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    certification = Int()
+    certification_gte = Int()
+    certification_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_920 = Float()
+    temperature_in_celsius_r_920_gte = Float()
+    temperature_in_celsius_r_920_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    accumulated_certification_amount = Float()
+    accumulated_certification_amount_gte = Float()
+    accumulated_certification_amount_lte = Float()
+    certified_articles_amount = Float()
+    certified_articles_amount_gte = Float()
+    certified_articles_amount_lte = Float()
+    certified_labor_cost_amount = Float()
+    certified_labor_cost_amount_gte = Float()
+    certified_labor_cost_amount_lte = Float()
+    certified_redistributed_amount = Float()
+    certified_redistributed_amount_gte = Float()
+    certified_redistributed_amount_lte = Float()
+    certified_services_amount = Float()
+    certified_services_amount_gte = Float()
+    certified_services_amount_lte = Float()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    level = Int()
+    level_gte = Int()
+    level_lte = Int()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class CertificationHeads(SQLAlchemyObjectType):
+    class Meta:
+        model = models.CertificationHeads
+        name = "LegacyCertificationHeads"
+        description = "Cabecera del Documento de Certificaciones de Presupuestos de Obra"
+
+
+class CertificationHeadsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyCertificationHeadsFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    advance_payment = Boolean()
+    a_or_b = String()
+    a_or_b_contains = String()
+    low_coefficient_tax = Float()
+    low_coefficient_tax_gte = Float()
+    low_coefficient_tax_lte = Float()
+    certification_criteria = String()
+    certification_criteria_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    final_activity = Int()
+    final_activity_gte = Int()
+    final_activity_lte = Int()
+    initial_activity = Int()
+    initial_activity_gte = Int()
+    initial_activity_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    billing_branch = Int()
+    billing_branch_gte = Int()
+    billing_branch_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    final_phase = Int()
+    final_phase_gte = Int()
+    final_phase_lte = Int()
+    initial_phase = Int()
+    initial_phase_gte = Int()
+    initial_phase_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    certification = Int()
+    certification_gte = Int()
+    certification_lte = Int()
+    final_task = Int()
+    final_task_gte = Int()
+    final_task_lte = Int()
+    initial_task = Int()
+    initial_task_gte = Int()
+    initial_task_lte = Int()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    final_subactivity = Int()
+    final_subactivity_gte = Int()
+    final_subactivity_lte = Int()
+    initial_subactivity = Int()
+    initial_subactivity_gte = Int()
+    initial_subactivity_lte = Int()
+    user = String()
+    user_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_222 = Float()
+    temperature_in_celsius_r_222_gte = Float()
+    temperature_in_celsius_r_222_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    detail = String()
+    detail_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    status = String()
+    status_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    certification_date = Date()
+    certification_date_gte = Date()
+    certification_date_lte = Date()
+    advance_amount = Float()
+    advance_amount_gte = Float()
+    advance_amount_lte = Float()
+    certified_articles_amount = Float()
+    certified_articles_amount_gte = Float()
+    certified_articles_amount_lte = Float()
+    labor_certification_amount = Float()
+    labor_certification_amount_gte = Float()
+    labor_certification_amount_lte = Float()
+    service_certification_amount = Float()
+    service_certification_amount_gte = Float()
+    service_certification_amount_lte = Float()
+    certification_amount = Float()
+    certification_amount_gte = Float()
+    certification_amount_lte = Float()
+    amortized_amount = Float()
+    amortized_amount_gte = Float()
+    amortized_amount_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    increase_decrease = Float()
+    increase_decrease_gte = Float()
+    increase_decrease_lte = Float()
+    weee_amount = Float()
+    weee_amount_gte = Float()
+    weee_amount_lte = Float()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    redistributed = Boolean()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class WorkStatus(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkStatus
+        name = "LegacyWorkStatus"
+        description = "Trazabilidad de Cambios de Estado Realizados en la Obra"
+
+
+class WorkStatusFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkStatusFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    user = String()
+    user_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_901 = Float()
+    temperature_in_celsius_r_901_gte = Float()
+    temperature_in_celsius_r_901_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    status = String()
+    status_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    end_date = Date()
+    end_date_gte = Date()
+    end_date_lte = Date()
+    product_warranty = Boolean()
+    warranty_expenses = Boolean()
+    labor_warranty = Boolean()
+    service_warranty = Boolean()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+
+
+class WorkTaxes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkTaxes
+        name = "LegacyWorkTaxes"
+        description = "Desglose de Impuestos de cada Obra"
+
+
+class WorkTaxesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkTaxesFilter"
+
+    base_amount_r_878 = Float()
+    base_amount_r_878_gte = Float()
+    base_amount_r_878_lte = Float()
+    user_character1_r_648 = String()
+    user_character1_r_648_contains = String()
+    character1tlmp_r_914 = String()
+    character1tlmp_r_914_contains = String()
+    user_character2_r_792 = String()
+    user_character2_r_792_contains = String()
+    character2tlmp_r_214 = String()
+    character2tlmp_r_214_contains = String()
+    user_character3_r_107 = String()
+    user_character3_r_107_contains = String()
+    character3tlmp_r_879 = String()
+    character3tlmp_r_879_contains = String()
+    user_character4_r_277 = String()
+    user_character4_r_277_contains = String()
+    character4tlmp_r_354 = String()
+    character4tlmp_r_354_contains = String()
+    user_character5_r_181 = String()
+    user_character5_r_181_contains = String()
+    user_character6_r_461 = String()
+    user_character6_r_461_contains = String()
+    user_character7_r_719 = String()
+    user_character7_r_719_contains = String()
+    user_character8_r_437 = String()
+    user_character8_r_437_contains = String()
+    branch_r_336 = Int()
+    branch_r_336_gte = Int()
+    branch_r_336_lte = Int()
+    company_r_771 = Int()
+    company_r_771_gte = Int()
+    company_r_771_lte = Int()
+    tax_code_r_43 = Int()
+    tax_code_r_43_gte = Int()
+    tax_code_r_43_lte = Int()
+    tax_type_r_510 = Int()
+    tax_type_r_510_gte = Int()
+    tax_type_r_510_lte = Int()
+    project_r_247 = Int()
+    project_r_247_gte = Int()
+    project_r_247_lte = Int()
+    user_decimal1_r_247 = Float()
+    user_decimal1_r_247_gte = Float()
+    user_decimal1_r_247_lte = Float()
+    temporary_decimal1_r_62 = Float()
+    temporary_decimal1_r_62_gte = Float()
+    temporary_decimal1_r_62_lte = Float()
+    decimal_to_user_r_93 = Float()
+    decimal_to_user_r_93_gte = Float()
+    decimal_to_user_r_93_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price_r_299 = Float()
+    decimal_to_ton_of_limestone_mixture_price_r_299_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_r_299_lte = Float()
+    user_decimal3_r_292 = Float()
+    user_decimal3_r_292_gte = Float()
+    user_decimal3_r_292_lte = Float()
+    temporary_decimal3_r_316 = Float()
+    temporary_decimal3_r_316_gte = Float()
+    temporary_decimal3_r_316_lte = Float()
+    user_decimal4_r_932 = Float()
+    user_decimal4_r_932_gte = Float()
+    user_decimal4_r_932_lte = Float()
+    temperature_in_celsius_r_845 = Float()
+    temperature_in_celsius_r_845_gte = Float()
+    temperature_in_celsius_r_845_lte = Float()
+    user_decimal5_r_847 = Float()
+    user_decimal5_r_847_gte = Float()
+    user_decimal5_r_847_lte = Float()
+    user_decimal6_r_567 = Float()
+    user_decimal6_r_567_gte = Float()
+    user_decimal6_r_567_lte = Float()
+    editor1user_r_915 = String()
+    editor1user_r_915_contains = String()
+    usereditor2_r_209 = String()
+    usereditor2_r_209_contains = String()
+    date1user_r_209 = Date()
+    date1user_r_209_gte = Date()
+    date1user_r_209_lte = Date()
+    date1tlmp_r_900 = Date()
+    date1tlmp_r_900_gte = Date()
+    date1tlmp_r_900_lte = Date()
+    user_date2_r_153 = Date()
+    user_date2_r_153_gte = Date()
+    user_date2_r_153_lte = Date()
+    date2tlmp_r_184 = Date()
+    date2tlmp_r_184_gte = Date()
+    date2tlmp_r_184_lte = Date()
+    user_date3_r_819 = Date()
+    user_date3_r_819_gte = Date()
+    user_date3_r_819_lte = Date()
+    date_3rd_quarter_tlmp_r_571 = Date()
+    date_3rd_quarter_tlmp_r_571_gte = Date()
+    date_3rd_quarter_tlmp_r_571_lte = Date()
+    amount_r_138 = Float()
+    amount_r_138_gte = Float()
+    amount_r_138_lte = Float()
+    percentage_r_689 = Float()
+    percentage_r_689_gte = Float()
+    percentage_r_689_lte = Float()
+
+
+class Preinvoices(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Preinvoices
+        name = "LegacyPreinvoices"
+        description = "Cabecera del Documento de Prefacturas de Obras"
+
+
+class PreinvoicesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPreinvoicesFilter"
+
+    attachments = Boolean()
+    block = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    quantity = Int()
+    quantity_gte = Int()
+    quantity_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    address = String()
+    address_contains = String()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    invoice_delivery = Int()
+    invoice_delivery_gte = Int()
+    invoice_delivery_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    rejection_reason = Int()
+    rejection_reason_gte = Int()
+    rejection_reason_lte = Int()
+    country = String()
+    country_contains = String()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    sales_agent = Int()
+    sales_agent_gte = Int()
+    sales_agent_lte = Int()
+    withholding_tax = Int()
+    withholding_tax_gte = Int()
+    withholding_tax_lte = Int()
+    currency = String()
+    currency_contains = String()
+    contact = Int()
+    contact_gte = Int()
+    contact_lte = Int()
+    carrier = Int()
+    carrier_gte = Int()
+    carrier_lte = Int()
+    user = String()
+    user_contains = String()
+    address_line = String()
+    address_line_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    commission_percentage = Float()
+    commission_percentage_gte = Float()
+    commission_percentage_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_651 = Float()
+    temperature_in_celsius_r_651_gte = Float()
+    temperature_in_celsius_r_651_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    travel_days = Int()
+    travel_days_gte = Int()
+    travel_days_lte = Int()
+    address_r_45 = String()
+    address_r_45_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    payment_term = Float()
+    payment_term_gte = Float()
+    payment_term_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    retention_effect = Boolean()
+    email_delivery = Boolean()
+    packaging = Float()
+    packaging_gte = Float()
+    packaging_lte = Float()
+    status = String()
+    status_contains = String()
+    fax_delivery = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    shipment_date = Date()
+    shipment_date_gte = Date()
+    shipment_date_lte = Date()
+    reception_date = Date()
+    reception_date_gte = Date()
+    reception_date_lte = Date()
+    resolution_date = Date()
+    resolution_date_gte = Date()
+    resolution_date_lte = Date()
+    modification_date = Date()
+    modification_date_gte = Date()
+    modification_date_lte = Date()
+    reduction_coefficient_amount = Float()
+    reduction_coefficient_amount_gte = Float()
+    reduction_coefficient_amount_lte = Float()
+    certification_amount = Float()
+    certification_amount_gte = Float()
+    certification_amount_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    administrative_part_increase_decrease_amount = Float()
+    administrative_part_increase_decrease_amount_gte = Float()
+    administrative_part_increase_decrease_amount_lte = Float()
+    amount_increase_decrease = Float()
+    amount_increase_decrease_gte = Float()
+    amount_increase_decrease_lte = Float()
+    unforeseen_expenses_amount = Float()
+    unforeseen_expenses_amount_gte = Float()
+    unforeseen_expenses_amount_lte = Float()
+    retention_amount = Float()
+    retention_amount_gte = Float()
+    retention_amount_lte = Float()
+    administrative_expenses_amount = Float()
+    administrative_expenses_amount_gte = Float()
+    administrative_expenses_amount_lte = Float()
+    irpf_base = Float()
+    irpf_base_gte = Float()
+    irpf_base_lte = Float()
+    delivery_parts_amount = Float()
+    delivery_parts_amount_gte = Float()
+    delivery_parts_amount_lte = Float()
+    income_tax_percentage = Float()
+    income_tax_percentage_gte = Float()
+    income_tax_percentage_lte = Float()
+    income_tax_amount = Float()
+    income_tax_amount_gte = Float()
+    income_tax_amount_lte = Float()
+    printed = Boolean()
+    apply_irpf = Boolean()
+    marked_as_invoiced = Boolean()
+    frequency_r_504 = Int()
+    frequency_r_504_gte = Int()
+    frequency_r_504_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    number = String()
+    number_contains = String()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    due_dates = Int()
+    due_dates_gte = Int()
+    due_dates_lte = Int()
+    notes = String()
+    notes_contains = String()
+    city = String()
+    city_contains = String()
+    freight_costs = Float()
+    freight_costs_gte = Float()
+    freight_costs_lte = Float()
+    proforma_invoice = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    retention_percentage = Float()
+    retention_percentage_gte = Float()
+    retention_percentage_lte = Float()
+    financial_statement = Float()
+    financial_statement_gte = Float()
+    financial_statement_lte = Float()
+    tel_pfa = String()
+    tel_pfa_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    total_amount = Float()
+    total_amount_gte = Float()
+    total_amount_lte = Float()
+    retention_type = String()
+    retention_type_contains = String()
+    user_r_24 = String()
+    user_r_24_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class PreinvoiceLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PreinvoiceLines
+        name = "LegacyPreinvoiceLines"
+        description = "Detalle de cada uno de los Resúmenes de la Prefactura de Obra.Se Utiliza"
+
+
+class PreinvoiceLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPreinvoiceLinesFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    budget_quantity = Float()
+    budget_quantity_gte = Float()
+    budget_quantity_lte = Float()
+    certification_quantity = Float()
+    certification_quantity_gte = Float()
+    certification_quantity_lte = Float()
+    quantity_concept = Float()
+    quantity_concept_gte = Float()
+    quantity_concept_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    company1 = String()
+    company1_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    phase = Int()
+    phase_gte = Int()
+    phase_lte = Int()
+    delivery_part = Int()
+    delivery_part_gte = Int()
+    delivery_part_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    task = Int()
+    task_gte = Int()
+    task_lte = Int()
+    group_code = String()
+    group_code_contains = String()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    pre_invoiced_quantity = Float()
+    pre_invoiced_quantity_gte = Float()
+    pre_invoiced_quantity_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_787 = Float()
+    temperature_in_celsius_r_787_gte = Float()
+    temperature_in_celsius_r_787_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    certification_amount = Float()
+    certification_amount_gte = Float()
+    certification_amount_lte = Float()
+    part_line_id_r_69 = Int()
+    part_line_id_r_69_gte = Int()
+    part_line_id_r_69_lte = Int()
+    measured_amount = Float()
+    measured_amount_gte = Float()
+    measured_amount_lte = Float()
+    budget_amount = Float()
+    budget_amount_gte = Float()
+    budget_amount_lte = Float()
+    pre_invoiced_amount = Float()
+    pre_invoiced_amount_gte = Float()
+    pre_invoiced_amount_lte = Float()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    line_number_detail = Int()
+    line_number_detail_gte = Int()
+    line_number_detail_lte = Int()
+    line_number_r_843 = Int()
+    line_number_r_843_gte = Int()
+    line_number_r_843_lte = Int()
+    certification_percentage = Float()
+    certification_percentage_gte = Float()
+    certification_percentage_lte = Float()
+    certification_percentage_r_312 = Float()
+    certification_percentage_r_312_gte = Float()
+    certification_percentage_r_312_lte = Float()
+    reference = String()
+    reference_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class Goobrpim(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Goobrpim
+        name = "LegacyGoobrpim"
+        description = "Desglose de Impuestos de cada Prefactura de Obras"
+
+
+class GoobrpimFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyGoobrpimFilter"
+
+    base_amount = Float()
+    base_amount_gte = Float()
+    base_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    tax_code = Int()
+    tax_code_gte = Int()
+    tax_code_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    percentage = Float()
+    percentage_gte = Float()
+    percentage_lte = Float()
+
+
+class WorkAddresses(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkAddresses
+        name = "LegacyWorkAddresses"
+        description = "Direcciones Asociadas con cada Obra"
+
+
+class WorkAddressesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkAddressesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    country = String()
+    country_contains = String()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    address = Int()
+    address_gte = Int()
+    address_lte = Int()
+    address_type = Int()
+    address_type_gte = Int()
+    address_type_lte = Int()
+    address_line = String()
+    address_line_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    address_r_810 = String()
+    address_r_810_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    email = String()
+    email_contains = String()
+    fax = String()
+    fax_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    mobile_phone = String()
+    mobile_phone_contains = String()
+    name = String()
+    name_contains = String()
+    number = String()
+    number_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    city = String()
+    city_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    phone_number = String()
+    phone_number_contains = String()
+
+
+class LibraryOrigins(SQLAlchemyObjectType):
+    class Meta:
+        model = models.LibraryOrigins
+        name = "LegacyLibraryOrigins"
+        description = "Maestro de los Diferentes Orígenes de Partidas"
+
+
+class LibraryOriginsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyLibraryOriginsFilter"
+
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    brand = Int()
+    brand_gte = Int()
+    brand_lte = Int()
+    source_book = Int()
+    source_book_gte = Int()
+    source_book_lte = Int()
+    supplier = Int()
+    supplier_gte = Int()
+    supplier_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_923 = Float()
+    temperature_in_celsius_r_923_gte = Float()
+    temperature_in_celsius_r_923_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    supplier_scope = Int()
+    supplier_scope_gte = Int()
+    supplier_scope_lte = Int()
+
+
+class DeliveriedPartTaxes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.DeliveriedPartTaxes
+        name = "LegacyDeliveriedPartTaxes"
+        description = "Partes de Entrega - Impuestos"
+
+
+class DeliveriedPartTaxesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyDeliveriedPartTaxesFilter"
+
+    base_amount = Float()
+    base_amount_gte = Float()
+    base_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1_temperature = String()
+    character1_temperature_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    character_to_temperature_mapping = String()
+    character_to_temperature_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character_3_temperature_limit = String()
+    character_3_temperature_limit_contains = String()
+    user_character_r_934 = String()
+    user_character_r_934_contains = String()
+    character_4_tlmp = String()
+    character_4_tlmp_contains = String()
+    user_character_5 = String()
+    user_character_5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character_7 = String()
+    user_character_7_contains = String()
+    user_character_8 = String()
+    user_character_8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    tax_code = Int()
+    tax_code_gte = Int()
+    tax_code_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    delivery_part = Int()
+    delivery_part_gte = Int()
+    delivery_part_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1_temp = Float()
+    decimal1_temp_gte = Float()
+    decimal1_temp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_templating = Float()
+    decimal_to_templating_gte = Float()
+    decimal_to_templating_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    decimal_3_temp = Float()
+    decimal_3_temp_gte = Float()
+    decimal_3_temp_lte = Float()
+    decimal4_user = Float()
+    decimal4_user_gte = Float()
+    decimal4_user_lte = Float()
+    temperature_decimal4 = Float()
+    temperature_decimal4_gte = Float()
+    temperature_decimal4_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1_user = String()
+    editor1_user_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date_to_user = Date()
+    date_to_user_gte = Date()
+    date_to_user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    temporary_date_3rd_quarter = Date()
+    temporary_date_3rd_quarter_gte = Date()
+    temporary_date_3rd_quarter_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    percentage = Float()
+    percentage_gte = Float()
+    percentage_lte = Float()
+
+
+class DeliveriedParts(SQLAlchemyObjectType):
+    class Meta:
+        model = models.DeliveriedParts
+        name = "LegacyDeliveriedParts"
+        description = "Partes de Entrega"
+
+
+class DeliveriedPartsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyDeliveriedPartsFilter"
+
+    attached_documents = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    journal_entry = Int()
+    journal_entry_gte = Int()
+    journal_entry_lte = Int()
+    locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1_temperature = String()
+    character1_temperature_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    character_to_temperature_mapping = String()
+    character_to_temperature_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character_3_temperature_limit = String()
+    character_3_temperature_limit_contains = String()
+    user_character_r_646 = String()
+    user_character_r_646_contains = String()
+    character_4_tlmp = String()
+    character_4_tlmp_contains = String()
+    user_character_5 = String()
+    user_character_5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character_7 = String()
+    user_character_7_contains = String()
+    user_character_8 = String()
+    user_character_8_contains = String()
+    company_code = Int()
+    company_code_gte = Int()
+    company_code_lte = Int()
+    address = String()
+    address_contains = String()
+    code = Int()
+    code_gte = Int()
+    code_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company_r_19 = Int()
+    company_r_19_gte = Int()
+    company_r_19_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    delivery_part = Int()
+    delivery_part_gte = Int()
+    delivery_part_lte = Int()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    user = String()
+    user_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1_temp = Float()
+    decimal1_temp_gte = Float()
+    decimal1_temp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_tlm_price = Float()
+    decimal_to_tlm_price_gte = Float()
+    decimal_to_tlm_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    decimal_3_temp = Float()
+    decimal_3_temp_gte = Float()
+    decimal_3_temp_lte = Float()
+    decimal_for_user = Float()
+    decimal_for_user_gte = Float()
+    decimal_for_user_lte = Float()
+    temperature_decimal4 = Float()
+    temperature_decimal4_gte = Float()
+    temperature_decimal4_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    deductible = Boolean()
+    editor1_user = String()
+    editor1_user_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    sent_email = Boolean()
+    billed = Boolean()
+    sent_fax = Boolean()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date_to_user = Date()
+    date_to_user_gte = Date()
+    date_to_user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    temporary_date_3rd_quarter = Date()
+    temporary_date_3rd_quarter_gte = Date()
+    temporary_date_3rd_quarter_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    total_amount = Float()
+    total_amount_gte = Float()
+    total_amount_lte = Float()
+    printed = Boolean()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    pre_invoiced = Boolean()
+    weee_amount = Float()
+    weee_amount_gte = Float()
+    weee_amount_lte = Float()
+    reference = String()
+    reference_contains = String()
+    total_work_order = Float()
+    total_work_order_gte = Float()
+    total_work_order_lte = Float()
+    last_modified_user = String()
+    last_modified_user_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class DeliveriedPartLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.DeliveriedPartLines
+        name = "LegacyDeliveriedPartLines"
+        description = "Parte de Entrega Detalle"
+
+
+class DeliveriedPartLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyDeliveriedPartLinesFilter"
+
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1_temperature = String()
+    character1_temperature_contains = String()
+    user_character = String()
+    user_character_contains = String()
+    character_to_temperature_mapping = String()
+    character_to_temperature_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character_3_temperature_limit = String()
+    character_3_temperature_limit_contains = String()
+    user_character_r_138 = String()
+    user_character_r_138_contains = String()
+    character_4_tlmp = String()
+    character_4_tlmp_contains = String()
+    user_character_5 = String()
+    user_character_5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character_7 = String()
+    user_character_7_contains = String()
+    user_character_8 = String()
+    user_character_8_contains = String()
+    chapter_id = Int()
+    chapter_id_gte = Int()
+    chapter_id_lte = Int()
+    item = String()
+    item_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    vat = Int()
+    vat_gte = Int()
+    vat_lte = Int()
+    brand_code = Int()
+    brand_code_gte = Int()
+    brand_code_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    delivery_part = Int()
+    delivery_part_gte = Int()
+    delivery_part_lte = Int()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    pvp_quantity = Float()
+    pvp_quantity_gte = Float()
+    pvp_quantity_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1_temp = Float()
+    decimal1_temp_gte = Float()
+    decimal1_temp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_templating = Float()
+    decimal_to_templating_gte = Float()
+    decimal_to_templating_lte = Float()
+    decimal3_user = Float()
+    decimal3_user_gte = Float()
+    decimal3_user_lte = Float()
+    decimal_3_temp = Float()
+    decimal_3_temp_gte = Float()
+    decimal_3_temp_lte = Float()
+    decimal_for_user = Float()
+    decimal_for_user_gte = Float()
+    decimal_for_user_lte = Float()
+    temperature_decimal4 = Float()
+    temperature_decimal4_gte = Float()
+    temperature_decimal4_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    discount1 = Float()
+    discount1_gte = Float()
+    discount1_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    editor1_user = String()
+    editor1_user_contains = String()
+    editor_to_user = String()
+    editor_to_user_contains = String()
+    date1_user = Date()
+    date1_user_gte = Date()
+    date1_user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date_to_user = Date()
+    date_to_user_gte = Date()
+    date_to_user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3_user = Date()
+    date3_user_gte = Date()
+    date3_user_lte = Date()
+    temporary_date_3rd_quarter = Date()
+    temporary_date_3rd_quarter_gte = Date()
+    temporary_date_3rd_quarter_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    line_amount = Float()
+    line_amount_gte = Float()
+    line_amount_lte = Float()
+    weee_waste_electrical_and_electronic_equipment = Float()
+    weee_waste_electrical_and_electronic_equipment_gte = Float()
+    weee_waste_electrical_and_electronic_equipment_lte = Float()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    brand_name = String()
+    brand_name_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    selling_price = Float()
+    selling_price_gte = Float()
+    selling_price_lte = Float()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    recycling_rate = Boolean()
+    line_type = String()
+    line_type_contains = String()
+
+
+class WorkingpartTaxes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartTaxes
+        name = "LegacyWorkingpartTaxes"
+        description = "Desglose de Impuestos de cada Parte"
+
+
+class WorkingpartTaxesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartTaxesFilter"
+
+    administration_or_project = String()
+    administration_or_project_contains = String()
+    base_amount = Float()
+    base_amount_gte = Float()
+    base_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    company_a_or_b = String()
+    company_a_or_b_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    tax_code = Int()
+    tax_code_gte = Int()
+    tax_code_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    percentage = Float()
+    percentage_gte = Float()
+    percentage_lte = Float()
+
+
+class WorkingdraftLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingdraftLines
+        name = "LegacyWorkingdraftLines"
+        description = "Líneas de los Borradores de Partes de Obra/Administración"
+
+
+class WorkingdraftLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingdraftLinesFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    database = Boolean()
+    purchase_quantity = Float()
+    purchase_quantity_gte = Float()
+    purchase_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    billable_hours = Float()
+    billable_hours_gte = Float()
+    billable_hours_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1_temperature = String()
+    character1_temperature_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character_to_temperature_mapping = String()
+    character_to_temperature_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character_3_temperature_limit = String()
+    character_3_temperature_limit_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character_4tlmp = String()
+    character_4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    billable_hours_r_743 = Float()
+    billable_hours_r_743_gte = Float()
+    billable_hours_r_743_lte = Float()
+    project_id = Int()
+    project_id_gte = Int()
+    project_id_lte = Int()
+    company_1 = String()
+    company_1_contains = String()
+    company_2 = String()
+    company_2_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    worker = Int()
+    worker_gte = Int()
+    worker_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    vat = Int()
+    vat_gte = Int()
+    vat_lte = Int()
+    brand = Int()
+    brand_gte = Int()
+    brand_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    draft_line_id = Int()
+    draft_line_id_gte = Int()
+    draft_line_id_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    draft = Int()
+    draft_gte = Int()
+    draft_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    supplier = Int()
+    supplier_gte = Int()
+    supplier_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    currency = String()
+    currency_contains = String()
+    packaging_unit = String()
+    packaging_unit_contains = String()
+    purchase_packaging = String()
+    purchase_packaging_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    company_code_phone_number = String()
+    company_code_phone_number_contains = String()
+    work_hours = Float()
+    work_hours_gte = Float()
+    work_hours_lte = Float()
+    quantity_u_e_c = Float()
+    quantity_u_e_c_gte = Float()
+    quantity_u_e_c_lte = Float()
+    ue_quantity = Float()
+    ue_quantity_gte = Float()
+    ue_quantity_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1_temp = Float()
+    decimal1_temp_gte = Float()
+    decimal1_temp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_tlm_price = Float()
+    decimal_to_tlm_price_gte = Float()
+    decimal_to_tlm_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    decimal_3_temp = Float()
+    decimal_3_temp_gte = Float()
+    decimal_3_temp_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_decimal_4 = Float()
+    temperature_decimal_4_gte = Float()
+    temperature_decimal_4_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    warehouse_r_661 = Boolean()
+    description = String()
+    description_contains = String()
+    purchase_discount_1 = Float()
+    purchase_discount_1_gte = Float()
+    purchase_discount_1_lte = Float()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    purchase_discount_2 = Float()
+    purchase_discount_2_gte = Float()
+    purchase_discount_2_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    purchase_discount_3 = Float()
+    purchase_discount_3_gte = Float()
+    purchase_discount_3_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    field_list = String()
+    field_list_contains = String()
+    status = String()
+    status_contains = String()
+    billable = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    temporary_date_3rd_quarter = Date()
+    temporary_date_3rd_quarter_gte = Date()
+    temporary_date_3rd_quarter_lte = Date()
+    allocation_date = Date()
+    allocation_date_gte = Date()
+    allocation_date_lte = Date()
+    warranty = Boolean()
+    end_time = String()
+    end_time_contains = String()
+    start_time = String()
+    start_time_contains = String()
+    line_amount = Float()
+    line_amount_gte = Float()
+    line_amount_lte = Float()
+    import_or_copy = Boolean()
+    weee_waste_electrical_and_electronic_equipment = Float()
+    weee_waste_electrical_and_electronic_equipment_gte = Float()
+    weee_waste_electrical_and_electronic_equipment_lte = Float()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    brand_name = String()
+    brand_name_contains = String()
+    name = String()
+    name_contains = String()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    draft_notes = String()
+    draft_notes_contains = String()
+    cost_origin = String()
+    cost_origin_contains = String()
+    discount_origin = String()
+    discount_origin_contains = String()
+    price_origin = String()
+    price_origin_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    supplier_scope = Int()
+    supplier_scope_gte = Int()
+    supplier_scope_lte = Int()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    retail_price = Float()
+    retail_price_gte = Float()
+    retail_price_lte = Float()
+    recalculate_cost = String()
+    recalculate_cost_contains = String()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    subcontractor = Boolean()
+    recycling_rate = Boolean()
+    category = Int()
+    category_gte = Int()
+    category_lte = Int()
+    line_type = String()
+    line_type_contains = String()
+    location = Boolean()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class WorkingpartBreakdowns(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartBreakdowns
+        name = "LegacyWorkingpartBreakdowns"
+        description = "Desglose de la Cantidad del Parte"
+
+
+class WorkingpartBreakdownsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartBreakdownsFilter"
+
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    group_identifier = Int()
+    group_identifier_gte = Int()
+    group_identifier_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_390 = Float()
+    temperature_in_celsius_r_390_gte = Float()
+    temperature_in_celsius_r_390_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    line_identifier = Int()
+    line_identifier_gte = Int()
+    line_identifier_lte = Int()
+
+
+class WorkingpartHours(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartHours
+        name = "LegacyWorkingpartHours"
+        description = "Detalle de Horas y Tipos de Hora de cada Línea de Tipo Mano de Obra del"
+
+
+class WorkingpartHoursFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartHoursFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_502 = Float()
+    temperature_in_celsius_r_502_gte = Float()
+    temperature_in_celsius_r_502_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    end_time = String()
+    end_time_contains = String()
+    start_time = String()
+    start_time_contains = String()
+
+
+class WorkingpartLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartLines
+        name = "LegacyWorkingpartLines"
+        description = "Líneas de Detalle de la Cabecera de Partes"
+
+
+class WorkingpartLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartLinesFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    database = Boolean()
+    purchase_quantity = Float()
+    purchase_quantity_gte = Float()
+    purchase_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    billable_hours = Float()
+    billable_hours_gte = Float()
+    billable_hours_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    billable_hours_r_743 = Float()
+    billable_hours_r_743_gte = Float()
+    billable_hours_r_743_lte = Float()
+    billable_hours_r_588 = Float()
+    billable_hours_r_588_gte = Float()
+    billable_hours_r_588_lte = Float()
+    project_id = Int()
+    project_id_gte = Int()
+    project_id_lte = Int()
+    company_1 = String()
+    company_1_contains = String()
+    company_2 = String()
+    company_2_contains = String()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    worker = Int()
+    worker_gte = Int()
+    worker_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    vat = Int()
+    vat_gte = Int()
+    vat_lte = Int()
+    brand = Int()
+    brand_gte = Int()
+    brand_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    supplier = Int()
+    supplier_gte = Int()
+    supplier_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    currency = String()
+    currency_contains = String()
+    packaging_unit = String()
+    packaging_unit_contains = String()
+    purchase_packaging = String()
+    purchase_packaging_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    company_code_phone_number = String()
+    company_code_phone_number_contains = String()
+    work_hours = Float()
+    work_hours_gte = Float()
+    work_hours_lte = Float()
+    quantity_u_e_c = Float()
+    quantity_u_e_c_gte = Float()
+    quantity_u_e_c_lte = Float()
+    cuea_prl = Float()
+    cuea_prl_gte = Float()
+    cuea_prl_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_640 = Float()
+    temperature_in_celsius_r_640_gte = Float()
+    temperature_in_celsius_r_640_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    warehouse_r_486 = Boolean()
+    description = String()
+    description_contains = String()
+    purchase_discount_1 = Float()
+    purchase_discount_1_gte = Float()
+    purchase_discount_1_lte = Float()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    purchase_discount_2 = Float()
+    purchase_discount_2_gte = Float()
+    purchase_discount_2_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    purchase_discount_3 = Float()
+    purchase_discount_3_gte = Float()
+    purchase_discount_3_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    billable = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    allocation_date = Date()
+    allocation_date_gte = Date()
+    allocation_date_lte = Date()
+    warranty = Boolean()
+    end_time = String()
+    end_time_contains = String()
+    start_time = String()
+    start_time_contains = String()
+    line_amount = Float()
+    line_amount_gte = Float()
+    line_amount_lte = Float()
+    import_or_copy = Boolean()
+    weee_waste_electrical_and_electronic_equipment = Float()
+    weee_waste_electrical_and_electronic_equipment_gte = Float()
+    weee_waste_electrical_and_electronic_equipment_lte = Float()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    gocatalog_link = String()
+    gocatalog_link_contains = String()
+    brand_name = String()
+    brand_name_contains = String()
+    name = String()
+    name_contains = String()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    cost_origin = String()
+    cost_origin_contains = String()
+    discount_origin = String()
+    discount_origin_contains = String()
+    price_origin = String()
+    price_origin_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    supplier_scope = Int()
+    supplier_scope_gte = Int()
+    supplier_scope_lte = Int()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    retail_price = Float()
+    retail_price_gte = Float()
+    retail_price_lte = Float()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    subcontractor = Boolean()
+    recycling_rate = Boolean()
+    category = Int()
+    category_gte = Int()
+    category_lte = Int()
+    line_type = String()
+    line_type_contains = String()
+    location = Boolean()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class WorkingpartLocations(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartLocations
+        name = "LegacyWorkingpartLocations"
+        description = "Detalle de Ubicación de donde se ha Extraido el Stock de cada Línea de D"
+
+
+class WorkingpartLocationsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartLocationsFilter"
+
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    item = String()
+    item_contains = String()
+    sales_representative = String()
+    sales_representative_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    area = String()
+    area_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    registration_number = String()
+    registration_number_contains = String()
+    warehouse_movement = Int()
+    warehouse_movement_gte = Int()
+    warehouse_movement_lte = Int()
+    cash_register = String()
+    cash_register_contains = String()
+    batch = String()
+    batch_contains = String()
+    pallet = String()
+    pallet_contains = String()
+    series = String()
+    series_contains = String()
+    current_stock = Float()
+    current_stock_gte = Float()
+    current_stock_lte = Float()
+    location = String()
+    location_contains = String()
+    location_r_866 = Boolean()
+
+
+class WorkingdraftHeads(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingdraftHeads
+        name = "LegacyWorkingdraftHeads"
+        description = "Cabecera de los Borradores de Partes de Obra/Administración"
+
+
+class WorkingdraftHeadsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingdraftHeadsFilter"
+
+    attachments = Boolean()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    currency_amount = Int()
+    currency_amount_gte = Int()
+    currency_amount_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1_temperature = String()
+    character1_temperature_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character_to_temperature_mapping = String()
+    character_to_temperature_mapping_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character_3_temperature_limit = String()
+    character_3_temperature_limit_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character_4_tlmp = String()
+    character_4_tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    address = String()
+    address_contains = String()
+    company_1 = String()
+    company_1_contains = String()
+    company_2 = String()
+    company_2_contains = String()
+    notification_number = Int()
+    notification_number_gte = Int()
+    notification_number_lte = Int()
+    goods_address = Int()
+    goods_address_gte = Int()
+    goods_address_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    sales_representative = Int()
+    sales_representative_gte = Int()
+    sales_representative_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    responsible_person = Int()
+    responsible_person_gte = Int()
+    responsible_person_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    message = String()
+    message_contains = String()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    draft = Int()
+    draft_gte = Int()
+    draft_lte = Int()
+    country = String()
+    country_contains = String()
+    invoice_period = Int()
+    invoice_period_gte = Int()
+    invoice_period_lte = Int()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    cod_provi = Int()
+    cod_provi_gte = Int()
+    cod_provi_lte = Int()
+    currency = String()
+    currency_contains = String()
+    user = String()
+    user_contains = String()
+    draft_user = String()
+    draft_user_contains = String()
+    address_r_690 = String()
+    address_r_690_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    item_cost = Float()
+    item_cost_gte = Float()
+    item_cost_lte = Float()
+    expenses_cost = Float()
+    expenses_cost_gte = Float()
+    expenses_cost_lte = Float()
+    labor_cost = Float()
+    labor_cost_gte = Float()
+    labor_cost_lte = Float()
+    service_cost = Float()
+    service_cost_gte = Float()
+    service_cost_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    decimal1_temp = Float()
+    decimal1_temp_gte = Float()
+    decimal1_temp_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_templating = Float()
+    decimal_to_templating_gte = Float()
+    decimal_to_templating_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    decimal_3_temp = Float()
+    decimal_3_temp_gte = Float()
+    decimal_3_temp_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_decimal4 = Float()
+    temperature_decimal4_gte = Float()
+    temperature_decimal4_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    warehouse_r_353 = Boolean()
+    travel_expenses = Int()
+    travel_expenses_gte = Int()
+    travel_expenses_lte = Int()
+    address_r_416 = String()
+    address_r_416_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    email = Boolean()
+    field_list = String()
+    field_list_contains = String()
+    status = String()
+    status_contains = String()
+    billed = Boolean()
+    billable = Boolean()
+    fax = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    temporary_date_3rd_quarter = Date()
+    temporary_date_3rd_quarter_gte = Date()
+    temporary_date_3rd_quarter_lte = Date()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    draft_date = Date()
+    draft_date_gte = Date()
+    draft_date_lte = Date()
+    system_date_and_time = DateTime()
+    system_date_and_time_gte = DateTime()
+    system_date_and_time_lte = DateTime()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    draft_time = String()
+    draft_time_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    total_items_amount = Float()
+    total_items_amount_gte = Float()
+    total_items_amount_lte = Float()
+    total_expense_amount = Float()
+    total_expense_amount_gte = Float()
+    total_expense_amount_lte = Float()
+    total_labor_cost = Float()
+    total_labor_cost_gte = Float()
+    total_labor_cost_lte = Float()
+    total_service_amount = Float()
+    total_service_amount_gte = Float()
+    total_service_amount_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    printed = Boolean()
+    delivery_note_number = Int()
+    delivery_note_number_gte = Int()
+    delivery_note_number_lte = Int()
+    number = String()
+    number_contains = String()
+    order_number = Int()
+    order_number_gte = Int()
+    order_number_lte = Int()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    invoice_number_r_33 = Int()
+    invoice_number_r_33_gte = Int()
+    invoice_number_r_33_lte = Int()
+    due_dates = Int()
+    due_dates_gte = Int()
+    due_dates_lte = Int()
+    notes = String()
+    notes_contains = String()
+    draft_notes = String()
+    draft_notes_contains = String()
+    part_origin = String()
+    part_origin_contains = String()
+    pre_invoiced = Boolean()
+    city = String()
+    city_contains = String()
+    code = String()
+    code_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    reviewed = Boolean()
+    phone_number = String()
+    phone_number_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    total_amount = Float()
+    total_amount_gte = Float()
+    total_amount_lte = Float()
+    total_raee_amount = Float()
+    total_raee_amount_gte = Float()
+    total_raee_amount_lte = Float()
+    last_modified_user = String()
+    last_modified_user_contains = String()
+    valued = Boolean()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class Workingparts(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Workingparts
+        name = "LegacyWorkingparts"
+        description = "Cabecera del Documento de Partes"
+
+
+class WorkingpartsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartsFilter"
+
+    attachments = Boolean()
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    journal_entry = Int()
+    journal_entry_gte = Int()
+    journal_entry_lte = Int()
+    journal_entry_r_115 = Int()
+    journal_entry_r_115_gte = Int()
+    journal_entry_r_115_lte = Int()
+    locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    frequency = Int()
+    frequency_gte = Int()
+    frequency_lte = Int()
+    currency_amount = Int()
+    currency_amount_gte = Int()
+    currency_amount_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    address = String()
+    address_contains = String()
+    company_1 = String()
+    company_1_contains = String()
+    company_2 = String()
+    company_2_contains = String()
+    notification_number = Int()
+    notification_number_gte = Int()
+    notification_number_lte = Int()
+    goods_address = Int()
+    goods_address_gte = Int()
+    goods_address_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    sales_representative = Int()
+    sales_representative_gte = Int()
+    sales_representative_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    responsible_person = Int()
+    responsible_person_gte = Int()
+    responsible_person_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    message = String()
+    message_contains = String()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    country = String()
+    country_contains = String()
+    invoice_period = Int()
+    invoice_period_gte = Int()
+    invoice_period_lte = Int()
+    pre_invoice = Int()
+    pre_invoice_gte = Int()
+    pre_invoice_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    currency = String()
+    currency_contains = String()
+    user = String()
+    user_contains = String()
+    address_r_608 = String()
+    address_r_608_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    accounted = Boolean()
+    item_cost = Float()
+    item_cost_gte = Float()
+    item_cost_lte = Float()
+    expenses_cost = Float()
+    expenses_cost_gte = Float()
+    expenses_cost_lte = Float()
+    labor_cost = Float()
+    labor_cost_gte = Float()
+    labor_cost_lte = Float()
+    service_cost = Float()
+    service_cost_gte = Float()
+    service_cost_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    property_account = String()
+    property_account_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    deductible = Boolean()
+    warehouse_r_443 = Boolean()
+    travel_expenses = Int()
+    travel_expenses_gte = Int()
+    travel_expenses_lte = Int()
+    address_r_563 = String()
+    address_r_563_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    email = Boolean()
+    billed = Boolean()
+    billable = Boolean()
+    fax = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    system_date_time = DateTime()
+    system_date_time_gte = DateTime()
+    system_date_time_lte = DateTime()
+    signed = Boolean()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    total_items_amount = Float()
+    total_items_amount_gte = Float()
+    total_items_amount_lte = Float()
+    total_expense_amount = Float()
+    total_expense_amount_gte = Float()
+    total_expense_amount_lte = Float()
+    total_labor_cost = Float()
+    total_labor_cost_gte = Float()
+    total_labor_cost_lte = Float()
+    total_service_amount = Float()
+    total_service_amount_gte = Float()
+    total_service_amount_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    printed = Boolean()
+    delivery_note_number = Int()
+    delivery_note_number_gte = Int()
+    delivery_note_number_lte = Int()
+    number = String()
+    number_contains = String()
+    order_number = Int()
+    order_number_gte = Int()
+    order_number_lte = Int()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    invoice_number_r_764 = Int()
+    invoice_number_r_764_gte = Int()
+    invoice_number_r_764_lte = Int()
+    due_dates = Int()
+    due_dates_gte = Int()
+    due_dates_lte = Int()
+    notes = String()
+    notes_contains = String()
+    part_origin = String()
+    part_origin_contains = String()
+    pending_authorization = Boolean()
+    pre_invoiced = Boolean()
+    city = String()
+    city_contains = String()
+    code = String()
+    code_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    phone_number = String()
+    phone_number_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    total_amount = Float()
+    total_amount_gte = Float()
+    total_amount_lte = Float()
+    total_raee_amount = Float()
+    total_raee_amount_gte = Float()
+    total_raee_amount_lte = Float()
+    last_modified_user = String()
+    last_modified_user_contains = String()
+    valued = Boolean()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class WorkingpartTemplateHeads(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartTemplateHeads
+        name = "LegacyWorkingpartTemplateHeads"
+        description = "Plantillas de Imputación de Mano de Obra en Partes"
+
+
+class WorkingpartTemplateHeadsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartTemplateHeadsFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    project_id = Int()
+    project_id_gte = Int()
+    project_id_lte = Int()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    calendar = String()
+    calendar_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    template_code = Int()
+    template_code_gte = Int()
+    template_code_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class WorkingpartTemplateLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartTemplateLines
+        name = "LegacyWorkingpartTemplateLines"
+        description = "Detalle Plantillas de Imputación de Mano de Obra en Partes"
+
+
+class WorkingpartTemplateLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartTemplateLinesFilter"
+
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    template = Int()
+    template_gte = Int()
+    template_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    name = String()
+    name_contains = String()
+    dedication_percentage = Float()
+    dedication_percentage_gte = Float()
+    dedication_percentage_lte = Float()
+    category = Int()
+    category_gte = Int()
+    category_lte = Int()
+
+
+class Gopreimp(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Gopreimp
+        name = "LegacyGopreimp"
+        description = "Desglose de Impuestos de los Presupuestos de Obras"
+
+
+class GopreimpFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyGopreimpFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    base_amount = Float()
+    base_amount_gte = Float()
+    base_amount_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    tax_code = Int()
+    tax_code_gte = Int()
+    tax_code_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    percentage = Float()
+    percentage_gte = Float()
+    percentage_lte = Float()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class BudgetHeads(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetHeads
+        name = "LegacyBudgetHeads"
+        description = "Cabecera del Documento de Presupuestos de Obras"
+
+
+class BudgetHeadsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetHeadsFilter"
+
+    apply_predefined_discounts = Boolean()
+    discount_application = String()
+    discount_application_contains = String()
+    attachments = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    origin_attachment = Int()
+    origin_attachment_gte = Int()
+    origin_attachment_lte = Int()
+    total_advances = Float()
+    total_advances_gte = Float()
+    total_advances_lte = Float()
+    health_and_safety_author = String()
+    health_and_safety_author_contains = String()
+    reduction_coefficient = Float()
+    reduction_coefficient_gte = Float()
+    reduction_coefficient_lte = Float()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    quantity = Int()
+    quantity_gte = Int()
+    quantity_lte = Int()
+    activity_control_subactivity_control = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    tax_identification_number = String()
+    tax_identification_number_contains = String()
+    customer_scope = Int()
+    customer_scope_gte = Int()
+    customer_scope_lte = Int()
+    notification = Int()
+    notification_gte = Int()
+    notification_lte = Int()
+    shipping_address = Int()
+    shipping_address_gte = Int()
+    shipping_address_lte = Int()
+    customer = Int()
+    customer_gte = Int()
+    customer_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    branch_r_595 = Int()
+    branch_r_595_gte = Int()
+    branch_r_595_lte = Int()
+    deviation_number = Int()
+    deviation_number_gte = Int()
+    deviation_number_lte = Int()
+    potential_customer = Int()
+    potential_customer_gte = Int()
+    potential_customer_lte = Int()
+    responsible_person = Int()
+    responsible_person_gte = Int()
+    responsible_person_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    commercial_stadium = Int()
+    commercial_stadium_gte = Int()
+    commercial_stadium_lte = Int()
+    payment_method = Int()
+    payment_method_gte = Int()
+    payment_method_lte = Int()
+    language = String()
+    language_contains = String()
+    vat = Int()
+    vat_gte = Int()
+    vat_lte = Int()
+    rejection_reason = Int()
+    rejection_reason_gte = Int()
+    rejection_reason_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    country = String()
+    country_contains = String()
+    purchase_proposal = Int()
+    purchase_proposal_gte = Int()
+    purchase_proposal_lte = Int()
+    subcontracting_proposal = Int()
+    subcontracting_proposal_gte = Int()
+    subcontracting_proposal_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    source_budget = Int()
+    source_budget_gte = Int()
+    source_budget_lte = Int()
+    potential_customer_contact = Int()
+    potential_customer_contact_gte = Int()
+    potential_customer_contact_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    sales_agent = Int()
+    sales_agent_gte = Int()
+    sales_agent_lte = Int()
+    currency = String()
+    currency_contains = String()
+    sales_tracking = String()
+    sales_tracking_contains = String()
+    sales_card = Int()
+    sales_card_gte = Int()
+    sales_card_lte = Int()
+    customer_contact = Int()
+    customer_contact_gte = Int()
+    customer_contact_lte = Int()
+    budget_type = Int()
+    budget_type_gte = Int()
+    budget_type_lte = Int()
+    project_type = Int()
+    project_type_gte = Int()
+    project_type_lte = Int()
+    user = String()
+    user_contains = String()
+    address = String()
+    address_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    registered_colony = String()
+    registered_colony_contains = String()
+    commission_percentage = Float()
+    commission_percentage_gte = Float()
+    commission_percentage_lte = Float()
+    customer_potential_customer = Boolean()
+    correction_copy = Boolean()
+    assistance_center = String()
+    assistance_center_contains = String()
+    sales_conditions_scope = Int()
+    sales_conditions_scope_gte = Int()
+    sales_conditions_scope_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    detailed_description = String()
+    detailed_description_contains = String()
+    address_r_230 = String()
+    address_r_230_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    discount_percentage = Float()
+    discount_percentage_gte = Float()
+    discount_percentage_lte = Float()
+    item_discount_2 = Float()
+    item_discount_2_gte = Float()
+    item_discount_2_lte = Float()
+    item_discount_3 = Float()
+    item_discount_3_gte = Float()
+    item_discount_3_lte = Float()
+    item_discounts = Float()
+    item_discounts_gte = Float()
+    item_discounts_lte = Float()
+    subcontracting_discount_2 = Float()
+    subcontracting_discount_2_gte = Float()
+    subcontracting_discount_2_lte = Float()
+    subcontracting_discount_3 = Float()
+    subcontracting_discount_3_gte = Float()
+    subcontracting_discount_3_lte = Float()
+    subcontracting_discounts = Float()
+    subcontracting_discounts_gte = Float()
+    subcontracting_discounts_lte = Float()
+    tool_discounts = Float()
+    tool_discounts_gte = Float()
+    tool_discounts_lte = Float()
+    labor_discount_2 = Float()
+    labor_discount_2_gte = Float()
+    labor_discount_2_lte = Float()
+    labor_discount_3 = Float()
+    labor_discount_3_gte = Float()
+    labor_discount_3_lte = Float()
+    labor_discounts = Float()
+    labor_discounts_gte = Float()
+    labor_discounts_lte = Float()
+    service_discount_2 = Float()
+    service_discount_2_gte = Float()
+    service_discount_2_lte = Float()
+    service_discount_3 = Float()
+    service_discount_3_gte = Float()
+    service_discount_3_lte = Float()
+    service_discounts = Float()
+    service_discounts_gte = Float()
+    service_discounts_lte = Float()
+    differentiate_subcontracting_proposals = Boolean()
+    deviation = Boolean()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    delivery_status = String()
+    delivery_status_contains = String()
+    accepted_date = Date()
+    accepted_date_gte = Date()
+    accepted_date_lte = Date()
+    award_date = Date()
+    award_date_gte = Date()
+    award_date_lte = Date()
+    approval_date = Date()
+    approval_date_gte = Date()
+    approval_date_lte = Date()
+    favorite_version = Boolean()
+    expiration_date = Date()
+    expiration_date_gte = Date()
+    expiration_date_lte = Date()
+    contract_date = Date()
+    contract_date_gte = Date()
+    contract_date_lte = Date()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    edition_date = Date()
+    edition_date_gte = Date()
+    edition_date_lte = Date()
+    property = String()
+    property_contains = String()
+    license_expiry_date = Date()
+    license_expiry_date_gte = Date()
+    license_expiry_date_lte = Date()
+    bid_submission = Date()
+    bid_submission_gte = Date()
+    bid_submission_lte = Date()
+    primary_occupation_date = Date()
+    primary_occupation_date_gte = Date()
+    primary_occupation_date_lte = Date()
+    folio = String()
+    folio_contains = String()
+    project_closure_forecast_date = Date()
+    project_closure_forecast_date_gte = Date()
+    project_closure_forecast_date_lte = Date()
+    pending_response_date = Date()
+    pending_response_date_gte = Date()
+    pending_response_date_lte = Date()
+    estimated_delivery_date = Date()
+    estimated_delivery_date_gte = Date()
+    estimated_delivery_date_lte = Date()
+    final_project_completion_date = Date()
+    final_project_completion_date_gte = Date()
+    final_project_completion_date_lte = Date()
+    start_date_forecast = Date()
+    start_date_forecast_gte = Date()
+    start_date_forecast_lte = Date()
+    planned_start_date = Date()
+    planned_start_date_gte = Date()
+    planned_start_date_lte = Date()
+    rejected_date = Date()
+    rejected_date_gte = Date()
+    rejected_date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    contracted_import = Float()
+    contracted_import_gte = Float()
+    contracted_import_lte = Float()
+    increase_items = Float()
+    increase_items_gte = Float()
+    increase_items_lte = Float()
+    subcontracting_increment = Float()
+    subcontracting_increment_gte = Float()
+    subcontracting_increment_lte = Float()
+    tool_increment = Float()
+    tool_increment_gte = Float()
+    tool_increment_lte = Float()
+    labor_cost_increase = Float()
+    labor_cost_increase_gte = Float()
+    labor_cost_increase_lte = Float()
+    service_increment = Float()
+    service_increment_gte = Float()
+    service_increment_lte = Float()
+    invoice_line = Int()
+    invoice_line_gte = Int()
+    invoice_line_lte = Int()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    tax_id = String()
+    tax_id_contains = String()
+    induced_times = Boolean()
+    match_weee_object_from_planning = Boolean()
+    match_objective_cost_from_planning = Boolean()
+    approx_total_tax = Float()
+    approx_total_tax_gte = Float()
+    approx_total_tax_lte = Float()
+    taxable_base_for_income_tax = Float()
+    taxable_base_for_income_tax_gte = Float()
+    taxable_base_for_income_tax_lte = Float()
+    income_tax_withholding = Float()
+    income_tax_withholding_gte = Float()
+    income_tax_withholding_lte = Float()
+    income_tax_amount = Float()
+    income_tax_amount_gte = Float()
+    income_tax_amount_lte = Float()
+    health_and_safety_budget = Float()
+    health_and_safety_budget_gte = Float()
+    health_and_safety_budget_lte = Float()
+    vat_percentage = Float()
+    vat_percentage_gte = Float()
+    vat_percentage_lte = Float()
+    book = String()
+    book_contains = String()
+    number_of_floors = Int()
+    number_of_floors_gte = Int()
+    number_of_floors_lte = Int()
+    number = String()
+    number_contains = String()
+    invoice = Int()
+    invoice_gte = Int()
+    invoice_lte = Int()
+    cost_origin = String()
+    cost_origin_contains = String()
+    order_status = Int()
+    order_status_gte = Int()
+    order_status_lte = Int()
+    health_and_safety_coordinator = String()
+    health_and_safety_coordinator_contains = String()
+    city = String()
+    city_contains = String()
+    registered_city = String()
+    registered_city_contains = String()
+    apply_weee = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    cadastral_reference = String()
+    cadastral_reference_contains = String()
+    internal_reference = String()
+    internal_reference_contains = String()
+    customer_reference = String()
+    customer_reference_contains = String()
+    retention_type = String()
+    retention_type_contains = String()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    financial_receipt = Float()
+    financial_receipt_gte = Float()
+    financial_receipt_lte = Float()
+    item_sales_valuation = String()
+    item_sales_valuation_contains = String()
+    labor_sales_valuation = String()
+    labor_sales_valuation_contains = String()
+    service_sales_valuation = String()
+    service_sales_valuation_contains = String()
+    create_subcategories_in_acceptance = Boolean()
+    status = String()
+    status_contains = String()
+    margin_valuation = Boolean()
+    floor_occupancy_support = Float()
+    floor_occupancy_support_gte = Float()
+    floor_occupancy_support_lte = Float()
+    solar_supplier = Float()
+    solar_supplier_gte = Float()
+    solar_supplier_lte = Float()
+    construction_total_cost = Float()
+    construction_total_cost_gte = Float()
+    construction_total_cost_lte = Float()
+    total_construction_reasons_support = Float()
+    total_construction_reasons_support_gte = Float()
+    total_construction_reasons_support_lte = Float()
+    header_text = String()
+    header_text_contains = String()
+    conditions = String()
+    conditions_contains = String()
+    phone_number = String()
+    phone_number_contains = String()
+    billing_type = String()
+    billing_type_contains = String()
+    mo_induced = Boolean()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    typology = String()
+    typology_contains = String()
+    project_type_r_136 = String()
+    project_type_r_136_contains = String()
+    volume = String()
+    volume_contains = String()
+    total_raee_target_amount = Float()
+    total_raee_target_amount_gte = Float()
+    total_raee_target_amount_lte = Float()
+    coordinator_degree = String()
+    coordinator_degree_contains = String()
+    total_budget = Float()
+    total_budget_gte = Float()
+    total_budget_lte = Float()
+    article_cost_plan = Float()
+    article_cost_plan_gte = Float()
+    article_cost_plan_lte = Float()
+    subcontracting_cost_plan = Float()
+    subcontracting_cost_plan_gte = Float()
+    subcontracting_cost_plan_lte = Float()
+    labor_cost_budget = Float()
+    labor_cost_budget_gte = Float()
+    labor_cost_budget_lte = Float()
+    cost_center_concept_plan = Float()
+    cost_center_concept_plan_gte = Float()
+    cost_center_concept_plan_lte = Float()
+    machine_planned_cost = Float()
+    machine_planned_cost_gte = Float()
+    machine_planned_cost_lte = Float()
+    service_cost_plan = Float()
+    service_cost_plan_gte = Float()
+    service_cost_plan_lte = Float()
+    cost_budget = Float()
+    cost_budget_gte = Float()
+    cost_budget_lte = Float()
+    total_planned_hours = Float()
+    total_planned_hours_gte = Float()
+    total_planned_hours_lte = Float()
+    footer_text = String()
+    footer_text_contains = String()
+    tv_sim_card_article_plan = Float()
+    tv_sim_card_article_plan_gte = Float()
+    tv_sim_card_article_plan_lte = Float()
+    subcontracting_plan = Float()
+    subcontracting_plan_gte = Float()
+    subcontracting_plan_lte = Float()
+    tv_simc_mo_plan = Float()
+    tv_simc_mo_plan_gte = Float()
+    tv_simc_mo_plan_lte = Float()
+    machine_planning = Float()
+    machine_planning_gte = Float()
+    machine_planning_lte = Float()
+    tv_simc_service_plan = Float()
+    tv_simc_service_plan_gte = Float()
+    tv_simc_service_plan_lte = Float()
+    tv_simc_plan = Float()
+    tv_simc_plan_gte = Float()
+    tv_simc_plan_lte = Float()
+    tv_simple_article_planning = Float()
+    tv_simple_article_planning_gte = Float()
+    tv_simple_article_planning_lte = Float()
+    subcontracting_plan_r_88 = Float()
+    subcontracting_plan_r_88_gte = Float()
+    subcontracting_plan_r_88_lte = Float()
+    tv_simple_mobile_plan = Float()
+    tv_simple_mobile_plan_gte = Float()
+    tv_simple_mobile_plan_lte = Float()
+    tv_simple_machine_production_plan = Float()
+    tv_simple_machine_production_plan_gte = Float()
+    tv_simple_machine_production_plan_lte = Float()
+    tv_simple_service_plan = Float()
+    tv_simple_service_plan_gte = Float()
+    tv_simple_service_plan_lte = Float()
+    tv_simple_plan = Float()
+    tv_simple_plan_gte = Float()
+    tv_simple_plan_lte = Float()
+    sales_item_plan = Float()
+    sales_item_plan_gte = Float()
+    sales_item_plan_lte = Float()
+    subcontracting_sales_order_plan = Float()
+    subcontracting_sales_order_plan_gte = Float()
+    subcontracting_sales_order_plan_lte = Float()
+    sales_order_labor_cost = Float()
+    sales_order_labor_cost_gte = Float()
+    sales_order_labor_cost_lte = Float()
+    machine_rental_sales = Float()
+    machine_rental_sales_gte = Float()
+    machine_rental_sales_lte = Float()
+    service_sales_plan = Float()
+    service_sales_plan_gte = Float()
+    service_sales_plan_lte = Float()
+    sales_plan = Float()
+    sales_plan_gte = Float()
+    sales_plan_lte = Float()
+    total_planned_raee_amount = Float()
+    total_planned_raee_amount_gte = Float()
+    total_planned_raee_amount_lte = Float()
+    retention_percentage = Float()
+    retention_percentage_gte = Float()
+    retention_percentage_lte = Float()
+    health_and_safety_certification = String()
+    health_and_safety_certification_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+    source_version = Int()
+    source_version_gte = Int()
+    source_version_lte = Int()
+
+
+class BudgetLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetLines
+        name = "LegacyBudgetLines"
+        description = "Líneas de Detalle de la Estructura de Capítulos y Partidas del Documento"
+
+
+class BudgetLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetLinesFilter"
+
+    accepted = Boolean()
+    accumulate_cost = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    calculation_base = String()
+    calculation_base_contains = String()
+    request_quote_before_purchase_project = Boolean()
+    formula_quantity = Float()
+    formula_quantity_gte = Float()
+    formula_quantity_lte = Float()
+    calculation_base_field = String()
+    calculation_base_field_contains = String()
+    distribution_filter_field = String()
+    distribution_filter_field_contains = String()
+    purchase_quantity = Float()
+    purchase_quantity_gte = Float()
+    purchase_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    encoded = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    induced_cost = Float()
+    induced_cost_gte = Float()
+    induced_cost_lte = Float()
+    line_item_classification = String()
+    line_item_classification_contains = String()
+    decomposed_identifier = Int()
+    decomposed_identifier_gte = Int()
+    decomposed_identifier_lte = Int()
+    composite_identifier = Int()
+    composite_identifier_gte = Int()
+    composite_identifier_lte = Int()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    item = String()
+    item_contains = String()
+    cost_concept = Int()
+    cost_concept_gte = Int()
+    cost_concept_lte = Int()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    vat = Int()
+    vat_gte = Int()
+    vat_lte = Int()
+    source_book = Int()
+    source_book_gte = Int()
+    source_book_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    supplier = Int()
+    supplier_gte = Int()
+    supplier_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    currency = String()
+    currency_contains = String()
+    sales_packaging = String()
+    sales_packaging_contains = String()
+    purchase_packaging = String()
+    purchase_packaging_contains = String()
+    unit_of_measurement = String()
+    unit_of_measurement_contains = String()
+    copy_import = Boolean()
+    structure_cost = Float()
+    structure_cost_gte = Float()
+    structure_cost_lte = Float()
+    cost_cost_concept_cost_amount = Float()
+    cost_cost_concept_cost_amount_gte = Float()
+    cost_cost_concept_cost_amount_lte = Float()
+    unit_cost = Float()
+    unit_cost_gte = Float()
+    unit_cost_lte = Float()
+    base_cost = Float()
+    base_cost_gte = Float()
+    base_cost_lte = Float()
+    quantity_u_e_c = Float()
+    quantity_u_e_c_gte = Float()
+    quantity_u_e_c_lte = Float()
+    quantity_u_e_v = Float()
+    quantity_u_e_v_gte = Float()
+    quantity_u_e_v_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    discount_c1 = Float()
+    discount_c1_gte = Float()
+    discount_c1_lte = Float()
+    c2_discount = Float()
+    c2_discount_gte = Float()
+    c2_discount_lte = Float()
+    c3_discount = Float()
+    c3_discount_gte = Float()
+    c3_discount_lte = Float()
+    discount_v1 = Float()
+    discount_v1_gte = Float()
+    discount_v1_lte = Float()
+    discount_v2 = Float()
+    discount_v2_gte = Float()
+    discount_v2_lte = Float()
+    discount_v3 = Float()
+    discount_v3_gte = Float()
+    discount_v3_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    excluded_generic_coding = Boolean()
+    fiedbc_factor = Float()
+    fiedbc_factor_gte = Float()
+    fiedbc_factor_lte = Float()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    filter_by = String()
+    filter_by_contains = String()
+    filter_by_r_174 = String()
+    filter_by_r_174_contains = String()
+    tool = Boolean()
+    induced_amount = Float()
+    induced_amount_gte = Float()
+    induced_amount_lte = Float()
+    line_amount = Float()
+    line_amount_gte = Float()
+    line_amount_lte = Float()
+    increase = Float()
+    increase_gte = Float()
+    increase_lte = Float()
+    generate_auto_part = Boolean()
+    copy_import_r_836 = Boolean()
+    weee_amount = Float()
+    weee_amount_gte = Float()
+    weee_amount_lte = Float()
+    vat_percentage = Int()
+    vat_percentage_gte = Int()
+    vat_percentage_lte = Int()
+    ivci_ped = Float()
+    ivci_ped_gte = Float()
+    ivci_ped_lte = Float()
+    sales_tax = Float()
+    sales_tax_gte = Float()
+    sales_tax_lte = Float()
+    subcontracted_line = Int()
+    subcontracted_line_gte = Int()
+    subcontracted_line_lte = Int()
+    line = Int()
+    line_gte = Int()
+    line_lte = Int()
+    gocatalog_link = String()
+    gocatalog_link_contains = String()
+    reason_for_non_allocation = String()
+    reason_for_non_allocation_contains = String()
+    non_chargeable_line = Boolean()
+    name = String()
+    name_contains = String()
+    cost_origin = String()
+    cost_origin_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    order_r_835 = Int()
+    order_r_835_gte = Int()
+    order_r_835_lte = Int()
+    current_budget = Boolean()
+    item_percentage = Float()
+    item_percentage_gte = Float()
+    item_percentage_lte = Float()
+    cost_concept_percentage = Float()
+    cost_concept_percentage_gte = Float()
+    cost_concept_percentage_lte = Float()
+    structure_cost_percentage = Float()
+    structure_cost_percentage_gte = Float()
+    structure_cost_percentage_lte = Float()
+    induced_price = Float()
+    induced_price_gte = Float()
+    induced_price_lte = Float()
+    labor_percentage = Float()
+    labor_percentage_gte = Float()
+    labor_percentage_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    selling_price = Float()
+    selling_price_gte = Float()
+    selling_price_lte = Float()
+    supplier_scope = Int()
+    supplier_scope_gte = Int()
+    supplier_scope_lte = Int()
+    service_percentage = Float()
+    service_percentage_gte = Float()
+    service_percentage_lte = Float()
+    weee_waste_electrical_and_electronic_equipment = Boolean()
+    product_representative = Boolean()
+    recalculable = Boolean()
+    external_reference = String()
+    external_reference_contains = String()
+    manufacturer_reference = String()
+    manufacturer_reference_contains = String()
+    distribution_scope = String()
+    distribution_scope_contains = String()
+    equivalence_surcharge_percentage = Float()
+    equivalence_surcharge_percentage_gte = Float()
+    equivalence_surcharge_percentage_lte = Float()
+    labor_representative = Boolean()
+    service_representative = Boolean()
+    sales_valuation = String()
+    sales_valuation_contains = String()
+    subcontractor = Boolean()
+    total_line_quantity = Float()
+    total_line_quantity_gte = Float()
+    total_line_quantity_lte = Float()
+    induced_mo_manufacturing_order = Boolean()
+    installation_time = Float()
+    installation_time_gte = Float()
+    installation_time_lte = Float()
+    category = Int()
+    category_gte = Int()
+    category_lte = Int()
+    type = String()
+    type_contains = String()
+    line_type = String()
+    line_type_contains = String()
+    line_type_r_761 = String()
+    line_type_r_761_contains = String()
+    transfer_to_project = Boolean()
+    subcontracting_type = String()
+    subcontracting_type_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class BudgetStructures(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetStructures
+        name = "LegacyBudgetStructures"
+        description = "Estructura de Capítulos y Partidas del Documento de Presupuestos de Obra"
+
+
+class BudgetStructuresFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetStructuresFilter"
+
+    accepted = Boolean()
+    apply_predefined_discounts = Boolean()
+    discount_application = String()
+    discount_application_contains = String()
+    attachments = Boolean()
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    item_scope = Int()
+    item_scope_gte = Int()
+    item_scope_lte = Int()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    total_quantity = Float()
+    total_quantity_gte = Float()
+    total_quantity_lte = Float()
+    certify = Boolean()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    chapter = String()
+    chapter_contains = String()
+    item_classification_lines = String()
+    item_classification_lines_contains = String()
+    identifier = Int()
+    identifier_gte = Int()
+    identifier_lte = Int()
+    parent_id = Int()
+    parent_id_gte = Int()
+    parent_id_lte = Int()
+    activity = Int()
+    activity_gte = Int()
+    activity_lte = Int()
+    subcontracted_service = String()
+    subcontracted_service_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    quality_document = String()
+    quality_document_contains = String()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    bookstore = String()
+    bookstore_contains = String()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    subactivity = Int()
+    subactivity_gte = Int()
+    subactivity_lte = Int()
+    item_code = String()
+    item_code_contains = String()
+    unit_of_measure = String()
+    unit_of_measure_contains = String()
+    contains_compound = Boolean()
+    objective_cost = Float()
+    objective_cost_gte = Float()
+    objective_cost_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    breakdown = Boolean()
+    description = String()
+    description_contains = String()
+    item_discount_2 = Float()
+    item_discount_2_gte = Float()
+    item_discount_2_lte = Float()
+    item_discount_3 = Float()
+    item_discount_3_gte = Float()
+    item_discount_3_lte = Float()
+    item_discounts = Float()
+    item_discounts_gte = Float()
+    item_discounts_lte = Float()
+    subcontracting_discount_2 = Float()
+    subcontracting_discount_2_gte = Float()
+    subcontracting_discount_2_lte = Float()
+    subcontracting_discount_3 = Float()
+    subcontracting_discount_3_gte = Float()
+    subcontracting_discount_3_lte = Float()
+    subcontracting_discounts = Float()
+    subcontracting_discounts_gte = Float()
+    subcontracting_discounts_lte = Float()
+    tool_discounts = Float()
+    tool_discounts_gte = Float()
+    tool_discounts_lte = Float()
+    labor_discount_second_hand = Float()
+    labor_discount_second_hand_gte = Float()
+    labor_discount_second_hand_lte = Float()
+    labor_discount_3 = Float()
+    labor_discount_3_gte = Float()
+    labor_discount_3_lte = Float()
+    labor_discounts = Float()
+    labor_discounts_gte = Float()
+    labor_discounts_lte = Float()
+    service_discount_2 = Float()
+    service_discount_2_gte = Float()
+    service_discount_2_lte = Float()
+    service_discount_3 = Float()
+    service_discount_3_gte = Float()
+    service_discount_3_lte = Float()
+    service_discounts = Float()
+    service_discounts_gte = Float()
+    service_discounts_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    editing_status = String()
+    editing_status_contains = String()
+    exportable_fiebdc = Boolean()
+    fiedbc_factor = Float()
+    fiedbc_factor_gte = Float()
+    fiedbc_factor_lte = Float()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    end_date = Date()
+    end_date_gte = Date()
+    end_date_lte = Date()
+    start_date = Date()
+    start_date_gte = Date()
+    start_date_lte = Date()
+    increase_items = Float()
+    increase_items_gte = Float()
+    increase_items_lte = Float()
+    subcontracting_increment = Float()
+    subcontracting_increment_gte = Float()
+    subcontracting_increment_lte = Float()
+    tool_increment = Float()
+    tool_increment_gte = Float()
+    tool_increment_lte = Float()
+    labor_cost_increase = Float()
+    labor_cost_increase_gte = Float()
+    labor_cost_increase_lte = Float()
+    service_increment = Float()
+    service_increment_gte = Float()
+    service_increment_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    maximum_amount = Float()
+    maximum_amount_gte = Float()
+    maximum_amount_lte = Float()
+    target_amount = Float()
+    target_amount_gte = Float()
+    target_amount_lte = Float()
+    percentage_increase = Float()
+    percentage_increase_gte = Float()
+    percentage_increase_lte = Float()
+    induced_time = Boolean()
+    copy_import = Boolean()
+    raee_target_amount = Float()
+    raee_target_amount_gte = Float()
+    raee_target_amount_lte = Float()
+    target_margin_percentage = Float()
+    target_margin_percentage_gte = Float()
+    target_margin_percentage_lte = Float()
+    non_billable = Boolean()
+    level = Int()
+    level_gte = Int()
+    level_lte = Int()
+    cost_origin = String()
+    cost_origin_contains = String()
+    current_budget = Boolean()
+    item_number = Boolean()
+    term = Float()
+    term_gte = Float()
+    term_lte = Float()
+    apply_weee = Boolean()
+    yield_percentage = Float()
+    yield_percentage_gte = Float()
+    yield_percentage_lte = Float()
+    recalculable = Boolean()
+    external_reference = String()
+    external_reference_contains = String()
+    internal_reference = String()
+    internal_reference_contains = String()
+    item_sales_valuation = String()
+    item_sales_valuation_contains = String()
+    sales_valuation = String()
+    sales_valuation_contains = String()
+    service_sales_valuation = String()
+    service_sales_valuation_contains = String()
+    subcontracted = Boolean()
+    induced_mo_manufacturing_order = Boolean()
+    objective_cost_r_901 = Float()
+    objective_cost_r_901_gte = Float()
+    objective_cost_r_901_lte = Float()
+    total_raee_target_amount = Float()
+    total_raee_target_amount_gte = Float()
+    total_raee_target_amount_lte = Float()
+    sales_object = Float()
+    sales_object_gte = Float()
+    sales_object_lte = Float()
+    item_cost = Float()
+    item_cost_gte = Float()
+    item_cost_lte = Float()
+    subcontracted_cost = Float()
+    subcontracted_cost_gte = Float()
+    subcontracted_cost_lte = Float()
+    labor_cost = Float()
+    labor_cost_gte = Float()
+    labor_cost_lte = Float()
+    cost_center_expense = Float()
+    cost_center_expense_gte = Float()
+    cost_center_expense_lte = Float()
+    machine_cost_plan = Float()
+    machine_cost_plan_gte = Float()
+    machine_cost_plan_lte = Float()
+    service_cost = Float()
+    service_cost_gte = Float()
+    service_cost_lte = Float()
+    plan_cost = Float()
+    plan_cost_gte = Float()
+    plan_cost_lte = Float()
+    planned_hours = Float()
+    planned_hours_gte = Float()
+    planned_hours_lte = Float()
+    sales_ci_items = Float()
+    sales_ci_items_gte = Float()
+    sales_ci_items_lte = Float()
+    subcontracted_sales_ci = Float()
+    subcontracted_sales_ci_gte = Float()
+    subcontracted_sales_ci_lte = Float()
+    sales_labor_cost = Float()
+    sales_labor_cost_gte = Float()
+    sales_labor_cost_lte = Float()
+    machine_planning = Float()
+    machine_planning_gte = Float()
+    machine_planning_lte = Float()
+    sales_ci_services = Float()
+    sales_ci_services_gte = Float()
+    sales_ci_services_lte = Float()
+    sales_ci = Float()
+    sales_ci_gte = Float()
+    sales_ci_lte = Float()
+    sales_product_delivery = Float()
+    sales_product_delivery_gte = Float()
+    sales_product_delivery_lte = Float()
+    subcontracted_sales_order = Float()
+    subcontracted_sales_order_gte = Float()
+    subcontracted_sales_order_lte = Float()
+    labor_sales = Float()
+    labor_sales_gte = Float()
+    labor_sales_lte = Float()
+    tv_simple_machine_production_plan = Float()
+    tv_simple_machine_production_plan_gte = Float()
+    tv_simple_machine_production_plan_lte = Float()
+    service_sales = Float()
+    service_sales_gte = Float()
+    service_sales_lte = Float()
+    sales_order = Float()
+    sales_order_gte = Float()
+    sales_order_lte = Float()
+    item_sales = Float()
+    item_sales_gte = Float()
+    item_sales_lte = Float()
+    subcontracted_sale = Float()
+    subcontracted_sale_gte = Float()
+    subcontracted_sale_lte = Float()
+    labor_sale = Float()
+    labor_sale_gte = Float()
+    labor_sale_lte = Float()
+    machinery_sales = Float()
+    machinery_sales_gte = Float()
+    machinery_sales_lte = Float()
+    service_sale = Float()
+    service_sale_gte = Float()
+    service_sale_lte = Float()
+    sales_plan = Float()
+    sales_plan_gte = Float()
+    sales_plan_lte = Float()
+    total_planned_raee_amount = Float()
+    total_planned_raee_amount_gte = Float()
+    total_planned_raee_amount_lte = Float()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class BudgetActions(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetActions
+        name = "LegacyBudgetActions"
+        description = "Relación de Acciones Realizadas en un Presupuesto de Obras"
+
+
+class BudgetActionsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetActionsFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    action_type = Int()
+    action_type_gte = Int()
+    action_type_lte = Int()
+    user = String()
+    user_contains = String()
+    additional_data = String()
+    additional_data_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    date_and_time = DateTime()
+    date_and_time_gte = DateTime()
+    date_and_time_lte = DateTime()
+    number = Int()
+    number_gte = Int()
+    number_lte = Int()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class BudgetAddresses(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetAddresses
+        name = "LegacyBudgetAddresses"
+        description = "Direcciones Asociadas con cada Presupuesto de Obras"
+
+
+class BudgetAddressesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetAddressesFilter"
+
+    attachment = Int()
+    attachment_gte = Int()
+    attachment_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    country = String()
+    country_contains = String()
+    estimate = Int()
+    estimate_gte = Int()
+    estimate_lte = Int()
+    province = Int()
+    province_gte = Int()
+    province_lte = Int()
+    address = Int()
+    address_gte = Int()
+    address_lte = Int()
+    address_type = Int()
+    address_type_gte = Int()
+    address_type_lte = Int()
+    address_line = String()
+    address_line_contains = String()
+    neighborhood = String()
+    neighborhood_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    address_r_380 = String()
+    address_r_380_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    email = String()
+    email_contains = String()
+    fax = String()
+    fax_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    mobile_phone = String()
+    mobile_phone_contains = String()
+    name = String()
+    name_contains = String()
+    number = String()
+    number_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    city = String()
+    city_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    phone_number = String()
+    phone_number_contains = String()
+    version = Int()
+    version_gte = Int()
+    version_lte = Int()
+
+
+class TypeAddresses(SQLAlchemyObjectType):
+    class Meta:
+        model = models.TypeAddresses
+        name = "LegacyTypeAddresses"
+        description = "Maestro de los Diferentes Tipos de Direcciones que Pueden ser Utilizados"
+
+
+class TypeAddressesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyTypeAddressesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    address_type = Int()
+    address_type_gte = Int()
+    address_type_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_841 = Float()
+    temperature_in_celsius_r_841_gte = Float()
+    temperature_in_celsius_r_841_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    create_automatically = Boolean()
+
+
+class WorkTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkTypes
+        name = "LegacyWorkTypes"
+        description = "Maestro de Tipos de Partidas"
+
+
+class WorkTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkTypesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    item_type = String()
+    item_type_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_844 = Float()
+    temperature_in_celsius_r_844_gte = Float()
+    temperature_in_celsius_r_844_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+
+
+class BudgetTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BudgetTypes
+        name = "LegacyBudgetTypes"
+        description = "Maestro de Tipos de Presupuestos"
+
+
+class BudgetTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBudgetTypesFilter"
+
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    item = String()
+    item_contains = String()
+    budget_type = Int()
+    budget_type_gte = Int()
+    budget_type_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_918 = Float()
+    temperature_in_celsius_r_918_gte = Float()
+    temperature_in_celsius_r_918_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    serial_number = Int()
+    serial_number_gte = Int()
+    serial_number_lte = Int()
+
+
+class WorkingTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingTypes
+        name = "LegacyWorkingTypes"
+        description = "Maestro de Tipos de Obras"
+
+
+class WorkingTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingTypesFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    cost_center = Int()
+    cost_center_gte = Int()
+    cost_center_lte = Int()
+    cost_center_r_943 = Int()
+    cost_center_r_943_gte = Int()
+    cost_center_r_943_lte = Int()
+    project_type = Int()
+    project_type_gte = Int()
+    project_type_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    serial_number = Int()
+    serial_number_gte = Int()
+    serial_number_lte = Int()
+
+
+class WorkShipments(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkShipments
+        name = "LegacyWorkShipments"
+        description = "Cabecera del Documento de Envío de Material a Obra"
+
+
+class WorkShipmentsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkShipmentsFilter"
+
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    document = Int()
+    document_gte = Int()
+    document_lte = Int()
+    project = Int()
+    project_gte = Int()
+    project_lte = Int()
+    carrier = Int()
+    carrier_gte = Int()
+    carrier_lte = Int()
+    user = String()
+    user_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    printed = Boolean()
+    notes = String()
+    notes_contains = String()
+    reference = String()
+    reference_contains = String()
+    movement_type = String()
+    movement_type_contains = String()
+    transportation = Boolean()
+    employee_r_761 = Int()
+    employee_r_761_gte = Int()
+    employee_r_761_lte = Int()
+
+
+class WorkShipmentLines(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkShipmentLines
+        name = "LegacyWorkShipmentLines"
+        description = "Detalle del Documento de Envío de Material a Obra"
+
+
+class WorkShipmentLinesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkShipmentLinesFilter"
+
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    article_scope = Int()
+    article_scope_gte = Int()
+    article_scope_lte = Int()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    company_1 = String()
+    company_1_contains = String()
+    warehouse = Int()
+    warehouse_gte = Int()
+    warehouse_lte = Int()
+    warehouse_r_996 = Int()
+    warehouse_r_996_gte = Int()
+    warehouse_r_996_lte = Int()
+    item = String()
+    item_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    branch_r_542 = Int()
+    branch_r_542_gte = Int()
+    branch_r_542_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    brand_code = Int()
+    brand_code_gte = Int()
+    brand_code_lte = Int()
+    shipment = Int()
+    shipment_gte = Int()
+    shipment_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    eu_european_union = String()
+    eu_european_union_contains = String()
+    area = String()
+    area_contains = String()
+    area_r_34 = String()
+    area_r_34_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_791 = Float()
+    temperature_in_celsius_r_791_gte = Float()
+    temperature_in_celsius_r_791_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    purchase_delivery_note_line = Int()
+    purchase_delivery_note_line_gte = Int()
+    purchase_delivery_note_line_lte = Int()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    license_plate = String()
+    license_plate_contains = String()
+    purchase_delivery_note = Int()
+    purchase_delivery_note_gte = Int()
+    purchase_delivery_note_lte = Int()
+    destination_warehouse_movement_number = Int()
+    destination_warehouse_movement_number_gte = Int()
+    destination_warehouse_movement_number_lte = Int()
+    origin_warehouse_movement_number = Int()
+    origin_warehouse_movement_number_gte = Int()
+    origin_warehouse_movement_number_lte = Int()
+    box_number = String()
+    box_number_contains = String()
+    purchase_invoice = Int()
+    purchase_invoice_gte = Int()
+    purchase_invoice_lte = Int()
+    lot = String()
+    lot_contains = String()
+    pallet = String()
+    pallet_contains = String()
+    serial_number = String()
+    serial_number_contains = String()
+    order = Int()
+    order_gte = Int()
+    order_lte = Int()
+    reference = String()
+    reference_contains = String()
+    line_type = String()
+    line_type_contains = String()
+    text = String()
+    text_contains = String()
+    location = String()
+    location_contains = String()
+    location_r_484 = String()
+    location_r_484_contains = String()
+
+
+class WorkingpartsHours(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkingpartsHours
+        name = "LegacyWorkingpartsHours"
+        description = "Imputación de horas"
+
+
+class WorkingpartsHoursFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkingpartsHoursFilter"
+
+    purchase_order_purchase_agreement = String()
+    purchase_order_purchase_agreement_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    company_1 = String()
+    company_1_contains = String()
+    branch = Int()
+    branch_gte = Int()
+    branch_lte = Int()
+    employee = Int()
+    employee_gte = Int()
+    employee_lte = Int()
+    company = Int()
+    company_gte = Int()
+    company_lte = Int()
+    hour_type = Int()
+    hour_type_gte = Int()
+    hour_type_lte = Int()
+    work_order = Int()
+    work_order_gte = Int()
+    work_order_lte = Int()
+    part_line_id = Int()
+    part_line_id_gte = Int()
+    part_line_id_lte = Int()
+    part = Int()
+    part_gte = Int()
+    part_lte = Int()
+    allocation_identifier = Int()
+    allocation_identifier_gte = Int()
+    allocation_identifier_lte = Int()
+    user = String()
+    user_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_554 = Float()
+    temperature_in_celsius_r_554_gte = Float()
+    temperature_in_celsius_r_554_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    end_date = Date()
+    end_date_gte = Date()
+    end_date_lte = Date()
+    start_date = Date()
+    start_date_gte = Date()
+    start_date_lte = Date()
+    movement_date = DateTime()
+    movement_date_gte = DateTime()
+    movement_date_lte = DateTime()
+    end_time = String()
+    end_time_contains = String()
+    start_time = String()
+    start_time_contains = String()
+    start_time_r_848 = String()
+    start_time_r_848_contains = String()
+    origin = String()
+    origin_contains = String()
+    reviewed = Boolean()
+    total_hours = Float()
+    total_hours_gte = Float()
+    total_hours_lte = Float()
+
+
+class SalesDeliveryNote(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesDeliveryNote
+        name = "LegacySalesDeliveryNote"
+        description = "Cabecera del Documento de  Albaranes de Venta"
+
+
+class SalesDeliveryNoteFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesDeliveryNoteFilter"
+
+    has_attachments = Boolean()
+    group_delivery_notes = String()
+    group_delivery_notes_contains = String()
+    advance_payment_amount = Float()
+    advance_payment_amount_gte = Float()
+    advance_payment_amount_lte = Float()
+    tax_base_1 = Float()
+    tax_base_1_gte = Float()
+    tax_base_1_lte = Float()
+    tax_base_2 = Float()
+    tax_base_2_gte = Float()
+    tax_base_2_lte = Float()
+    tax_base_3 = Float()
+    tax_base_3_gte = Float()
+    tax_base_3_lte = Float()
+    individual_parcels = Int()
+    individual_parcels_gte = Int()
+    individual_parcels_lte = Int()
+    is_locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    parcels = Int()
+    parcels_gte = Int()
+    parcels_lte = Int()
+    due_date_cadence = Int()
+    due_date_cadence_gte = Int()
+    due_date_cadence_lte = Int()
+    cash_register_id = Int()
+    cash_register_id_gte = Int()
+    cash_register_id_lte = Int()
+    include_in_statistics = String()
+    include_in_statistics_contains = String()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    merchandise_address_id = Int()
+    merchandise_address_id_gte = Int()
+    merchandise_address_id_lte = Int()
+    shipping_address_id = Int()
+    shipping_address_id_gte = Int()
+    shipping_address_id_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    delivery_terms = String()
+    delivery_terms_contains = String()
+    invoicing_branch_id = Int()
+    invoicing_branch_id_gte = Int()
+    invoicing_branch_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    billing_branch_id = Int()
+    billing_branch_id_gte = Int()
+    billing_branch_id_lte = Int()
+    deposit_id = Int()
+    deposit_id_gte = Int()
+    deposit_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    expedition_id = Int()
+    expedition_id_gte = Int()
+    expedition_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    message_id = String()
+    message_id_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    shipping_country_id = String()
+    shipping_country_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    shipping_province_id = Int()
+    shipping_province_id_gte = Int()
+    shipping_province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    customer_contact_id = Int()
+    customer_contact_id_gte = Int()
+    customer_contact_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    shipping_street_type = String()
+    shipping_street_type_contains = String()
+    commision_percent = Float()
+    commision_percent_gte = Float()
+    commision_percent_lte = Float()
+    is_confirmed = Boolean()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    buyer_id = String()
+    buyer_id_contains = String()
+    invoiced_advance_payment_branch_id = Int()
+    invoiced_advance_payment_branch_id_gte = Int()
+    invoiced_advance_payment_branch_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    is_deductible = Boolean()
+    is_deposit = Boolean()
+    due_date_displacement = Int()
+    due_date_displacement_gte = Int()
+    due_date_displacement_lte = Int()
+    street_name = String()
+    street_name_contains = String()
+    shipping_street_name = String()
+    shipping_street_name_contains = String()
+    debit_or_credit = String()
+    debit_or_credit_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    shipping_postal_code = Int()
+    shipping_postal_code_gte = Int()
+    shipping_postal_code_lte = Int()
+    prompt_payment_discount = Float()
+    prompt_payment_discount_gte = Float()
+    prompt_payment_discount_lte = Float()
+    invoiced_advance_payment_bill_number = Int()
+    invoiced_advance_payment_bill_number_gte = Int()
+    invoiced_advance_payment_bill_number_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    expedition_state = String()
+    expedition_state_contains = String()
+    sent_by_email = Boolean()
+    email = String()
+    email_contains = String()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    state = String()
+    state_contains = String()
+    document_state = String()
+    document_state_contains = String()
+    sales_state = String()
+    sales_state_contains = String()
+    has_expedition = Boolean()
+    invoiced_advance_payment_invoice_id = Int()
+    invoiced_advance_payment_invoice_id_gte = Int()
+    invoiced_advance_payment_invoice_id_lte = Int()
+    sent_by_fax = Boolean()
+    fax = String()
+    fax_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    shipping_date = Date()
+    shipping_date_gte = Date()
+    shipping_date_lte = Date()
+    fixed_payment_date = Date()
+    fixed_payment_date_gte = Date()
+    fixed_payment_date_lte = Date()
+    is_signed = Boolean()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    registration_time = String()
+    registration_time_contains = String()
+    last_modified_time = String()
+    last_modified_time_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    has_fixed_payment_date = Boolean()
+    vat_amount_1 = Float()
+    vat_amount_1_gte = Float()
+    vat_amount_1_lte = Float()
+    vat_amount_2 = Float()
+    vat_amount_2_gte = Float()
+    vat_amount_2_lte = Float()
+    vat_amount_3 = Float()
+    vat_amount_3_gte = Float()
+    vat_amount_3_lte = Float()
+    retention_base = Float()
+    retention_base_gte = Float()
+    retention_base_lte = Float()
+    pending_payment_amount = Float()
+    pending_payment_amount_gte = Float()
+    pending_payment_amount_lte = Float()
+    retention_rate = Float()
+    retention_rate_gte = Float()
+    retention_rate_lte = Float()
+    retention_amount = Float()
+    retention_amount_gte = Float()
+    retention_amount_lte = Float()
+    printed = Boolean()
+    sales_equalization_amount_1 = Float()
+    sales_equalization_amount_1_gte = Float()
+    sales_equalization_amount_1_lte = Float()
+    sales_equalization_amount_2 = Float()
+    sales_equalization_amount_2_gte = Float()
+    sales_equalization_amount_2_lte = Float()
+    sales_equalization_amount_3 = Float()
+    sales_equalization_amount_3_gte = Float()
+    sales_equalization_amount_3_lte = Float()
+    vat_rate_1 = Float()
+    vat_rate_1_gte = Float()
+    vat_rate_1_lte = Float()
+    vat_rate_2 = Float()
+    vat_rate_2_gte = Float()
+    vat_rate_2_lte = Float()
+    vat_rate_3 = Float()
+    vat_rate_3_gte = Float()
+    vat_rate_3_lte = Float()
+    pending_authorizations = String()
+    pending_authorizations_contains = String()
+    has_authorized_margins = Boolean()
+    periodicity = Int()
+    periodicity_gte = Int()
+    periodicity_lte = Int()
+    sales_delivery_note_id = Int()
+    sales_delivery_note_id_gte = Int()
+    sales_delivery_note_id_lte = Int()
+    notification_id = Int()
+    notification_id_gte = Int()
+    notification_id_lte = Int()
+    street_number = String()
+    street_number_contains = String()
+    branch_delivery_note_id = Int()
+    branch_delivery_note_id_gte = Int()
+    branch_delivery_note_id_lte = Int()
+    sales_invoice_id = Int()
+    sales_invoice_id_gte = Int()
+    sales_invoice_id_lte = Int()
+    shipping_street_number = String()
+    shipping_street_number_contains = String()
+    due_dates_number = Int()
+    due_dates_number_gte = Int()
+    due_dates_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    document_origin = String()
+    document_origin_contains = String()
+    from_invoiced_advance_payment = Boolean()
+    promotion_points_customer = Int()
+    promotion_points_customer_gte = Int()
+    promotion_points_customer_lte = Int()
+    promotion_points_buyer = Int()
+    promotion_points_buyer_gte = Int()
+    promotion_points_buyer_lte = Int()
+    is_pending_payment = Boolean()
+    has_pending_return = Boolean()
+    weight = Float()
+    weight_gte = Float()
+    weight_lte = Float()
+    promotion_settled_points_customer = Int()
+    promotion_settled_points_customer_gte = Int()
+    promotion_settled_points_customer_lte = Int()
+    promotion_settled_points_buyer = Int()
+    promotion_settled_points_buyer_gte = Int()
+    promotion_settled_points_buyer_lte = Int()
+    settled_promotion = Boolean()
+    city = String()
+    city_contains = String()
+    shipping_city = String()
+    shipping_city_contains = String()
+    shipping_cost = Float()
+    shipping_cost_gte = Float()
+    shipping_cost_lte = Float()
+    is_recomputable_promotion = Boolean()
+    has_promotion = Boolean()
+    business_name = String()
+    business_name_contains = String()
+    shipping_business_name = String()
+    shipping_business_name_contains = String()
+    reference_2 = String()
+    reference_2_contains = String()
+    reference = String()
+    reference_contains = String()
+    is_replicated = Boolean()
+    sales_equalization_rate_1 = Float()
+    sales_equalization_rate_1_gte = Float()
+    sales_equalization_rate_1_lte = Float()
+    sales_equalization_rate_2 = Float()
+    sales_equalization_rate_2_gte = Float()
+    sales_equalization_rate_2_lte = Float()
+    sales_equalization_rate_3 = Float()
+    sales_equalization_rate_3_gte = Float()
+    sales_equalization_rate_3_lte = Float()
+    financial_surcharge_rate = Float()
+    financial_surcharge_rate_gte = Float()
+    financial_surcharge_rate_lte = Float()
+    pricing_reference = String()
+    pricing_reference_contains = String()
+    shelved_sale_reference = String()
+    shelved_sale_reference_contains = String()
+    phone = String()
+    phone_contains = String()
+    shipping_phone = String()
+    shipping_phone_contains = String()
+    delivery_time = String()
+    delivery_time_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    sales_delivery_note_type = String()
+    sales_delivery_note_type_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    last_modification_user_id = String()
+    last_modification_user_id_contains = String()
+    is_priced = Boolean()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+    volume = Float()
+    volume_gte = Float()
+    volume_lte = Float()
+
+
+class BranchDeliveryNote(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BranchDeliveryNote
+        name = "LegacyBranchDeliveryNote"
+        description = "Cabecera Albaranes de la Delegación"
+
+
+class BranchDeliveryNoteFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBranchDeliveryNoteFilter"
+
+    updated = Boolean()
+    individual_packages = Int()
+    individual_packages_gte = Int()
+    individual_packages_lte = Int()
+    blocking = Boolean()
+    packages = Int()
+    packages_gte = Int()
+    packages_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    char1_gvaldec = String()
+    char1_gvaldec_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    char2_gvaldec = String()
+    char2_gvaldec_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    char3_gvaldec = String()
+    char3_gvaldec_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    char4_gvaldec = String()
+    char4_gvaldec_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    delivery_terms = String()
+    delivery_terms_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    deposit_id = Int()
+    deposit_id_gte = Int()
+    deposit_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal2user = Float()
+    decimal2user_gte = Float()
+    decimal2user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    destination_branch = Int()
+    destination_branch_gte = Int()
+    destination_branch_lte = Int()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_user2 = String()
+    editor_user2_contains = String()
+    shipment_status = String()
+    shipment_status_contains = String()
+    destination_company = Int()
+    destination_company_gte = Int()
+    destination_company_lte = Int()
+    shipped = Boolean()
+    status = String()
+    status_contains = String()
+    status_r_628 = String()
+    status_r_628_contains = String()
+    dispatch = Boolean()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3user = Date()
+    date3user_gte = Date()
+    date3user_lte = Date()
+    date3_temp = Date()
+    date3_temp_gte = Date()
+    date3_temp_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    shipping_date = Date()
+    shipping_date_gte = Date()
+    shipping_date_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    printed = Boolean()
+    origin_delivery_note_number = Int()
+    origin_delivery_note_number_gte = Int()
+    origin_delivery_note_number_lte = Int()
+    delivery_note_number = Int()
+    delivery_note_number_gte = Int()
+    delivery_note_number_lte = Int()
+    invoice_number = Int()
+    invoice_number_gte = Int()
+    invoice_number_lte = Int()
+    purchase_invoice_id = Int()
+    purchase_invoice_id_gte = Int()
+    purchase_invoice_id_lte = Int()
+    notes = String()
+    notes_contains = String()
+    total_weight = Float()
+    total_weight_gte = Float()
+    total_weight_lte = Float()
+    received = Boolean()
+    reference = String()
+    reference_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    document_type = String()
+    document_type_contains = String()
+    total = Float()
+    total_gte = Float()
+    total_lte = Float()
+    total_volume = Float()
+    total_volume_gte = Float()
+    total_volume_lte = Float()
+
+
+class BranchDeliveryLine(SQLAlchemyObjectType):
+    class Meta:
+        model = models.BranchDeliveryLine
+        name = "LegacyBranchDeliveryLine"
+        description = "Lineas de Albaranes de la Delegación"
+
+
+class BranchDeliveryLineFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyBranchDeliveryLineFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    returned_quantity = Float()
+    returned_quantity_gte = Float()
+    returned_quantity_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    char1_gvaldel = String()
+    char1_gvaldel_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    char2_gvaldel = String()
+    char2_gvaldel_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    char3_gvaldel = String()
+    char3_gvaldel_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    char4_gvaldel = String()
+    char4_gvaldel_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    work_project_id = Int()
+    work_project_id_gte = Int()
+    work_project_id_lte = Int()
+    packaging_unit_id = String()
+    packaging_unit_id_contains = String()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    decimal1user = Float()
+    decimal1user_gte = Float()
+    decimal1user_lte = Float()
+    decimal1tlmp = Float()
+    decimal1tlmp_gte = Float()
+    decimal1tlmp_lte = Float()
+    decimal2user = Float()
+    decimal2user_gte = Float()
+    decimal2user_lte = Float()
+    decimal2tlmp = Float()
+    decimal2tlmp_gte = Float()
+    decimal2tlmp_lte = Float()
+    decimal3user = Float()
+    decimal3user_gte = Float()
+    decimal3user_lte = Float()
+    decimal3tlmp = Float()
+    decimal3tlmp_gte = Float()
+    decimal3tlmp_lte = Float()
+    decimal4user = Float()
+    decimal4user_gte = Float()
+    decimal4user_lte = Float()
+    decimal4tlmp = Float()
+    decimal4tlmp_gte = Float()
+    decimal4tlmp_lte = Float()
+    decimal5user = Float()
+    decimal5user_gte = Float()
+    decimal5user_lte = Float()
+    decimal6user = Float()
+    decimal6user_gte = Float()
+    decimal6user_lte = Float()
+    extended_description = String()
+    extended_description_contains = String()
+    description_detail = String()
+    description_detail_contains = String()
+    editor_user1 = String()
+    editor_user1_contains = String()
+    editor_user2 = String()
+    editor_user2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1_temp = Date()
+    date1_temp_gte = Date()
+    date1_temp_lte = Date()
+    date2user = Date()
+    date2user_gte = Date()
+    date2user_lte = Date()
+    date2_temp = Date()
+    date2_temp_gte = Date()
+    date2_temp_lte = Date()
+    date3user = Date()
+    date3user_gte = Date()
+    date3user_lte = Date()
+    date3_temp = Date()
+    date3_temp_gte = Date()
+    date3_temp_lte = Date()
+    id_gpeddell = Int()
+    id_gpeddell_gte = Int()
+    id_gpeddell_lte = Int()
+    gvaldel_id = Int()
+    gvaldel_id_gte = Int()
+    gvaldel_id_lte = Int()
+    line_total = Float()
+    line_total_gte = Float()
+    line_total_lte = Float()
+    purchase_delivery_note_line_number = Int()
+    purchase_delivery_note_line_number_gte = Int()
+    purchase_delivery_note_line_number_lte = Int()
+    purchase_delivery_note = Int()
+    purchase_delivery_note_gte = Int()
+    purchase_delivery_note_lte = Int()
+    branch_delivery_note_id = Int()
+    branch_delivery_note_id_gte = Int()
+    branch_delivery_note_id_lte = Int()
+    branch_delivery_note_line_order = Int()
+    branch_delivery_note_line_order_gte = Int()
+    branch_delivery_note_line_order_lte = Int()
+    total_weight = Float()
+    total_weight_gte = Float()
+    total_weight_lte = Float()
+    product_reference = String()
+    product_reference_contains = String()
+    line_type = String()
+    line_type_contains = String()
+    type = String()
+    type_contains = String()
+    text = String()
+    text_contains = String()
+    ubi_del = Boolean()
+    total_volume = Float()
+    total_volume_gte = Float()
+    total_volume_lte = Float()
+
+
+class SalesDeliverynoteTax(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesDeliverynoteTax
+        name = "LegacySalesDeliverynoteTax"
+        description = "Desglose de Impuestos del Documento de  Albaranes de Venta"
+
+
+class SalesDeliverynoteTaxFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesDeliverynoteTaxFilter"
+
+    tax_base = Float()
+    tax_base_gte = Float()
+    tax_base_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    tax_id = Int()
+    tax_id_gte = Int()
+    tax_id_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    tax_rate = Float()
+    tax_rate_gte = Float()
+    tax_rate_lte = Float()
+
+
+class SalesDocumentLine(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesDocumentLine
+        name = "LegacySalesDocumentLine"
+        description = "Líneas de Detalle de los Documentos de  Albaranes y Facturas de Venta"
+
+
+class SalesDocumentLineFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesDocumentLineFilter"
+
+    group = String()
+    group_contains = String()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    is_accounted = Boolean()
+    is_atypical_sale = Boolean()
+    purchase_quantity = Float()
+    purchase_quantity_gte = Float()
+    purchase_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    returned_quantity = Float()
+    returned_quantity_gte = Float()
+    returned_quantity_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    activity_id = Int()
+    activity_id_gte = Int()
+    activity_id_lte = Int()
+    customs_id = String()
+    customs_id_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    sales_order_product_id = String()
+    sales_order_product_id_contains = String()
+    sales_order_id = Int()
+    sales_order_id_gte = Int()
+    sales_order_id_lte = Int()
+    sales_order_company = Int()
+    sales_order_company_gte = Int()
+    sales_order_company_lte = Int()
+    invoicing_branch_id = Int()
+    invoicing_branch_id_gte = Int()
+    invoicing_branch_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    deposit_id = Int()
+    deposit_id_gte = Int()
+    deposit_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    vat_id = Int()
+    vat_id_gte = Int()
+    vat_id_lte = Int()
+    sales_order_vat_id = Int()
+    sales_order_vat_id_gte = Int()
+    sales_order_vat_id_lte = Int()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    work_project_id = Int()
+    work_project_id_gte = Int()
+    work_project_id_lte = Int()
+    certification_id = Int()
+    certification_id_gte = Int()
+    certification_id_lte = Int()
+    work_delivery_id = Int()
+    work_delivery_id_gte = Int()
+    work_delivery_id_lte = Int()
+    work_document_line_number = Int()
+    work_document_line_number_gte = Int()
+    work_document_line_number_lte = Int()
+    work_document_id = Int()
+    work_document_id_gte = Int()
+    work_document_id_lte = Int()
+    sales_preinvoice_id = Int()
+    sales_preinvoice_id_gte = Int()
+    sales_preinvoice_id_lte = Int()
+    sales_preinvoice_item_number = Int()
+    sales_preinvoice_item_number_gte = Int()
+    sales_preinvoice_item_number_lte = Int()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    origin_id = String()
+    origin_id_contains = String()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    subactivity_id = Int()
+    subactivity_id_gte = Int()
+    subactivity_id_lte = Int()
+    purchase_currency_id = String()
+    purchase_currency_id_contains = String()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    purchase_packing_unit = String()
+    purchase_packing_unit_contains = String()
+    sales_order_packing_unit = String()
+    sales_order_packing_unit_contains = String()
+    measurement_unit_weight = String()
+    measurement_unit_weight_contains = String()
+    measurement_unit_volume = String()
+    measurement_unit_volume_contains = String()
+    direct_commission = Float()
+    direct_commission_gte = Float()
+    direct_commission_lte = Float()
+    zero_cost_lines = Boolean()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    sales_order_quantity = Float()
+    sales_order_quantity_gte = Float()
+    sales_order_quantity_lte = Float()
+    predial_tax_account = String()
+    predial_tax_account_contains = String()
+    product_code_corporative = String()
+    product_code_corporative_contains = String()
+    purchase_packing_unit_quantity = Float()
+    purchase_packing_unit_quantity_gte = Float()
+    purchase_packing_unit_quantity_lte = Float()
+    sales_order_packing_unit_quantity = Float()
+    sales_order_packing_unit_quantity_gte = Float()
+    sales_order_packing_unit_quantity_lte = Float()
+    price_quantity = Float()
+    price_quantity_gte = Float()
+    price_quantity_lte = Float()
+    advance_payment_discount_amount = Float()
+    advance_payment_discount_amount_gte = Float()
+    advance_payment_discount_amount_lte = Float()
+    drp_branch = Int()
+    drp_branch_gte = Int()
+    drp_branch_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description_long = String()
+    description_long_contains = String()
+    debit_delivery_note_branch_id = Int()
+    debit_delivery_note_branch_id_gte = Int()
+    debit_delivery_note_branch_id_lte = Int()
+    target_branch_id = String()
+    target_branch_id_contains = String()
+    DRP_company = Int()
+    DRP_company_gte = Int()
+    DRP_company_lte = Int()
+    is_deposit = Boolean()
+    has_printable_detail = Boolean()
+    description = String()
+    description_contains = String()
+    did_gvallin = Int()
+    did_gvallin_gte = Int()
+    did_gvallin_lte = Int()
+    drp_delivery_note_id = Int()
+    drp_delivery_note_id_gte = Int()
+    drp_delivery_note_id_lte = Int()
+    purchase_discount_1 = Float()
+    purchase_discount_1_gte = Float()
+    purchase_discount_1_lte = Float()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    sales_order_discount_1 = Float()
+    sales_order_discount_1_gte = Float()
+    sales_order_discount_1_lte = Float()
+    purchase_discount_2 = Float()
+    purchase_discount_2_gte = Float()
+    purchase_discount_2_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    sales_order_discount_2 = Float()
+    sales_order_discount_2_gte = Float()
+    sales_order_discount_2_lte = Float()
+    purchase_discount_3 = Float()
+    purchase_discount_3_gte = Float()
+    purchase_discount_3_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    sales_order_discount_3 = Float()
+    sales_order_discount_3_gte = Float()
+    sales_order_discount_3_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    customs_date_expedition = Date()
+    customs_date_expedition_gte = Date()
+    customs_date_expedition_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    group_id = Int()
+    group_id_gte = Int()
+    group_id_lte = Int()
+    branch_delivery_note_line_id = Int()
+    branch_delivery_note_line_id_gte = Int()
+    branch_delivery_note_line_id_lte = Int()
+    line_id = Int()
+    line_id_gte = Int()
+    line_id_lte = Int()
+    work_document_invoice_amount = Float()
+    work_document_invoice_amount_gte = Float()
+    work_document_invoice_amount_lte = Float()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    sales_order_amount = Float()
+    sales_order_amount_gte = Float()
+    sales_order_amount_lte = Float()
+    increment = Float()
+    increment_gte = Float()
+    increment_lte = Float()
+    include_in_invoice = Boolean()
+    is_intrastat = Boolean()
+    is_unscheduled = Boolean()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    tax_rate = Float()
+    tax_rate_gte = Float()
+    tax_rate_lte = Float()
+    delivery_note_line_number = Int()
+    delivery_note_line_number_gte = Int()
+    delivery_note_line_number_lte = Int()
+    purchase_delivery_note_line_number = Int()
+    purchase_delivery_note_line_number_gte = Int()
+    purchase_delivery_note_line_number_lte = Int()
+    debit_line_number = Int()
+    debit_line_number_gte = Int()
+    debit_line_number_lte = Int()
+    sales_invoice_line_number = Int()
+    sales_invoice_line_number_gte = Int()
+    sales_invoice_line_number_lte = Int()
+    sales_order_line_number = Int()
+    sales_order_line_number_gte = Int()
+    sales_order_line_number_lte = Int()
+    sales_order_company_line = Int()
+    sales_order_company_line_gte = Int()
+    sales_order_company_line_lte = Int()
+    plate_number = String()
+    plate_number_contains = String()
+    is_editable = String()
+    is_editable_contains = String()
+    brand_name = String()
+    brand_name_contains = String()
+    credit_invoice_id = Int()
+    credit_invoice_id_gte = Int()
+    credit_invoice_id_lte = Int()
+    customs_document = String()
+    customs_document_contains = String()
+    sales_delivery_note_id = Int()
+    sales_delivery_note_id_gte = Int()
+    sales_delivery_note_id_lte = Int()
+    purchase_delivery_note_id = Int()
+    purchase_delivery_note_id_gte = Int()
+    purchase_delivery_note_id_lte = Int()
+    debit_delivery_note_id = Int()
+    debit_delivery_note_id_gte = Int()
+    debit_delivery_note_id_lte = Int()
+    branch_delivery_note_id = Int()
+    branch_delivery_note_id_gte = Int()
+    branch_delivery_note_id_lte = Int()
+    sales_invoice_id = Int()
+    sales_invoice_id_gte = Int()
+    sales_invoice_id_lte = Int()
+    sales_preinvoice_line_number = Int()
+    sales_preinvoice_line_number_gte = Int()
+    sales_preinvoice_line_number_lte = Int()
+    cost_origin = String()
+    cost_origin_contains = String()
+    discount_origin = String()
+    discount_origin_contains = String()
+    line_order = Int()
+    line_order_gte = Int()
+    line_order_lte = Int()
+    branch_delivery_note_line_order = Int()
+    branch_delivery_note_line_order_gte = Int()
+    branch_delivery_note_line_order_lte = Int()
+    document_origin = String()
+    document_origin_contains = String()
+    origin_invoice = Int()
+    origin_invoice_gte = Int()
+    origin_invoice_lte = Int()
+    customs_patent = String()
+    customs_patent_contains = String()
+    customs_motion = String()
+    customs_motion_contains = String()
+    weight = Float()
+    weight_gte = Float()
+    weight_lte = Float()
+    sales_order_price = Float()
+    sales_order_price_gte = Float()
+    sales_order_price_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    price = Float()
+    price_gte = Float()
+    price_lte = Float()
+    account_in_settlement_by_product = Boolean()
+    rappel = Float()
+    rappel_gte = Float()
+    rappel_lte = Float()
+    account_in_settlement = Boolean()
+    product_reference = String()
+    product_reference_contains = String()
+    sales_order_product_reference = String()
+    sales_order_product_reference_contains = String()
+    sales_equalization_rate = Float()
+    sales_equalization_rate_gte = Float()
+    sales_equalization_rate_lte = Float()
+    has_tax = Boolean()
+    text = String()
+    text_contains = String()
+    rappel_type = Boolean()
+    sales_deliverty_note_type = String()
+    sales_deliverty_note_type_contains = String()
+    line_type = String()
+    line_type_contains = String()
+    is_located = Boolean()
+    volume = Float()
+    volume_gte = Float()
+    volume_lte = Float()
+
+
+class SalesDeliverynoteLocation(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesDeliverynoteLocation
+        name = "LegacySalesDeliverynoteLocation"
+        description = "Detalle de la Ubicación de Extracción del Stock de cada una de las Línea"
+
+
+class SalesDeliverynoteLocationFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesDeliverynoteLocationFilter"
+
+    is_updated = Boolean()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    warehouse_id = Int()
+    warehouse_id_gte = Int()
+    warehouse_id_lte = Int()
+    product_id = String()
+    product_id_contains = String()
+    component_product_id = String()
+    component_product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    zone_id = String()
+    zone_id_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    last_deletion_date = Date()
+    last_deletion_date_gte = Date()
+    last_deletion_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    plate_number = String()
+    plate_number_contains = String()
+    warehouse_movement_id = Int()
+    warehouse_movement_id_gte = Int()
+    warehouse_movement_id_lte = Int()
+    box_bumber = String()
+    box_bumber_contains = String()
+    invoice_id = Int()
+    invoice_id_gte = Int()
+    invoice_id_lte = Int()
+    batch_number = String()
+    batch_number_contains = String()
+    pallet_number = String()
+    pallet_number_contains = String()
+    serial_number = String()
+    serial_number_contains = String()
+    inial_quantity = Float()
+    inial_quantity_gte = Float()
+    inial_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    delivery_note_type = String()
+    delivery_note_type_contains = String()
+    location_id = String()
+    location_id_contains = String()
+
+
+class SalesInvoice(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesInvoice
+        name = "LegacySalesInvoice"
+        description = "Cabecera del Documento de Facturas de Venta"
+
+
+class SalesInvoiceFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesInvoiceFilter"
+
+    is_updated = Boolean()
+    has_attachments = Boolean()
+    from_delivery_notes = Boolean()
+    vat_accounting_entry_id = Int()
+    vat_accounting_entry_id_gte = Int()
+    vat_accounting_entry_id_lte = Int()
+    accounting_entry_id = Int()
+    accounting_entry_id_gte = Int()
+    accounting_entry_id_lte = Int()
+    tax_base_1 = Float()
+    tax_base_1_gte = Float()
+    tax_base_1_lte = Float()
+    tax_base_2 = Float()
+    tax_base_2_gte = Float()
+    tax_base_2_lte = Float()
+    tax_base_3 = Float()
+    tax_base_3_gte = Float()
+    tax_base_3_lte = Float()
+    is_locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    due_date_cadence = Int()
+    due_date_cadence_gte = Int()
+    due_date_cadence_lte = Int()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    purchasing_group_commission = Float()
+    purchasing_group_commission_gte = Float()
+    purchasing_group_commission_lte = Float()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    invoicing_branch_id = Int()
+    invoicing_branch_id_gte = Int()
+    invoicing_branch_id_lte = Int()
+    accounting_branch_id = Int()
+    accounting_branch_id_gte = Int()
+    accounting_branch_id_lte = Int()
+    target_branch_id = Int()
+    target_branch_id_gte = Int()
+    target_branch_id_lte = Int()
+    billing_branch_id = Int()
+    billing_branch_id_gte = Int()
+    billing_branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    vat_id_1 = Int()
+    vat_id_1_gte = Int()
+    vat_id_1_lte = Int()
+    vat_id_2 = Int()
+    vat_id_2_gte = Int()
+    vat_id_2_lte = Int()
+    vat_id_3 = Int()
+    vat_id_3_gte = Int()
+    vat_id_3_lte = Int()
+    message_id = String()
+    message_id_contains = String()
+    country_id = String()
+    country_id_contains = String()
+    sales_preinvoice_id = Int()
+    sales_preinvoice_id_gte = Int()
+    sales_preinvoice_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    retention_id = Int()
+    retention_id_gte = Int()
+    retention_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    invoice_type = Int()
+    invoice_type_gte = Int()
+    invoice_type_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    seller_id = Int()
+    seller_id_gte = Int()
+    seller_id_lte = Int()
+    street_type = String()
+    street_type_contains = String()
+    commision_percent = Float()
+    commision_percent_gte = Float()
+    commision_percent_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    invoiced_advance_payment_branch_id = Int()
+    invoiced_advance_payment_branch_id_gte = Int()
+    invoiced_advance_payment_branch_id_lte = Int()
+    advance_payment_discount_amount = Float()
+    advance_payment_discount_amount_gte = Float()
+    advance_payment_discount_amount_lte = Float()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    is_deductible = Boolean()
+    due_date_displacement = Int()
+    due_date_displacement_gte = Int()
+    due_date_displacement_lte = Int()
+    street_name = String()
+    street_name_contains = String()
+    invoicing_address_id = Int()
+    invoicing_address_id_gte = Int()
+    invoicing_address_id_lte = Int()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    prompt_payment_discount = Float()
+    prompt_payment_discount_gte = Float()
+    prompt_payment_discount_lte = Float()
+    invoiced_advance_payment_bill_number = Int()
+    invoiced_advance_payment_bill_number_gte = Int()
+    invoiced_advance_payment_bill_number_lte = Int()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    editing_state = String()
+    editing_state_contains = String()
+    has_retention_bill = Boolean()
+    sent_by_email = Boolean()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    shipment_status = String()
+    shipment_status_contains = String()
+    state = Int()
+    state_gte = Int()
+    state_lte = Int()
+    e_billing_state = String()
+    e_billing_state_contains = String()
+    has_statistics = Boolean()
+    sii_state = String()
+    sii_state_contains = String()
+    invoiced_advance_payment_invoice_id = Int()
+    invoiced_advance_payment_invoice_id_gte = Int()
+    invoiced_advance_payment_invoice_id_lte = Int()
+    sent_by_fax = Boolean()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    review_date = Date()
+    review_date_gte = Date()
+    review_date_lte = Date()
+    fixed_payment_date = Date()
+    fixed_payment_date_gte = Date()
+    fixed_payment_date_lte = Date()
+    vat_settlement_date = Date()
+    vat_settlement_date_gte = Date()
+    vat_settlement_date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    invoicing_group = Int()
+    invoicing_group_gte = Int()
+    invoicing_group_lte = Int()
+    is_in_m340 = Boolean()
+    certified_amount = Float()
+    certified_amount_gte = Float()
+    certified_amount_lte = Float()
+    certified_percentage = Float()
+    certified_percentage_gte = Float()
+    certified_percentage_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    has_fixed_payment_date = Boolean()
+    work_document_increment_amount = Float()
+    work_document_increment_amount_gte = Float()
+    work_document_increment_amount_lte = Float()
+    increment_amount = Float()
+    increment_amount_gte = Float()
+    increment_amount_lte = Float()
+    unscheduled_amount = Float()
+    unscheduled_amount_gte = Float()
+    unscheduled_amount_lte = Float()
+    vat_amount_1 = Float()
+    vat_amount_1_gte = Float()
+    vat_amount_1_lte = Float()
+    vat_amount_2 = Float()
+    vat_amount_2_gte = Float()
+    vat_amount_2_lte = Float()
+    vat_amount_3 = Float()
+    vat_amount_3_gte = Float()
+    vat_amount_3_lte = Float()
+    retention_amount = Float()
+    retention_amount_gte = Float()
+    retention_amount_lte = Float()
+    work_document_amount = Float()
+    work_document_amount_gte = Float()
+    work_document_amount_lte = Float()
+    retention_base = Float()
+    retention_base_gte = Float()
+    retention_base_lte = Float()
+    work_delivery_amount = Float()
+    work_delivery_amount_gte = Float()
+    work_delivery_amount_lte = Float()
+    income_tax_rate = Float()
+    income_tax_rate_gte = Float()
+    income_tax_rate_lte = Float()
+    income_tax_amount = Float()
+    income_tax_amount_gte = Float()
+    income_tax_amount_lte = Float()
+    printed = Boolean()
+    apply_personal_income_tax = Boolean()
+    sales_equalization_amount_1 = Float()
+    sales_equalization_amount_1_gte = Float()
+    sales_equalization_amount_1_lte = Float()
+    sales_equalization_amount_2 = Float()
+    sales_equalization_amount_2_gte = Float()
+    sales_equalization_amount_2_lte = Float()
+    sales_equalization_amount_3 = Float()
+    sales_equalization_amount_3_gte = Float()
+    sales_equalization_amount_3_lte = Float()
+    vat_rate_1 = Float()
+    vat_rate_1_gte = Float()
+    vat_rate_1_lte = Float()
+    vat_rate_2 = Float()
+    vat_rate_2_gte = Float()
+    vat_rate_2_lte = Float()
+    vat_rate_3 = Float()
+    vat_rate_3_gte = Float()
+    vat_rate_3_lte = Float()
+    apply_vat_over_financial_surcharge = Boolean()
+    include_in_xml = Boolean()
+    settled_commission = Boolean()
+    settled_rappel = Boolean()
+    has_authorized_margins = Boolean()
+    periodicity = Int()
+    periodicity_gte = Int()
+    periodicity_lte = Int()
+    debit_delivery_note_id = Int()
+    debit_delivery_note_id_gte = Int()
+    debit_delivery_note_id_lte = Int()
+    document_address_id = Int()
+    document_address_id_gte = Int()
+    document_address_id_lte = Int()
+    street_number = String()
+    street_number_contains = String()
+    sales_invoice_id = Int()
+    sales_invoice_id_gte = Int()
+    sales_invoice_id_lte = Int()
+    purchase_invoice_id = Int()
+    purchase_invoice_id_gte = Int()
+    purchase_invoice_id_lte = Int()
+    due_dates_number = Int()
+    due_dates_number_gte = Int()
+    due_dates_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    origin_invoice_id = Int()
+    origin_invoice_id_gte = Int()
+    origin_invoice_id_lte = Int()
+    from_invoiced_advance_payment = Boolean()
+    has_pdf = Boolean()
+    city = String()
+    city_contains = String()
+    shipping_cost = Float()
+    shipping_cost_gte = Float()
+    shipping_cost_lte = Float()
+    origin_type = String()
+    origin_type_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    reference = String()
+    reference_contains = String()
+    sales_equalization_rate_1 = Float()
+    sales_equalization_rate_1_gte = Float()
+    sales_equalization_rate_1_lte = Float()
+    sales_equalization_rate_2 = Float()
+    sales_equalization_rate_2_gte = Float()
+    sales_equalization_rate_2_lte = Float()
+    sales_equalization_rate_3 = Float()
+    sales_equalization_rate_3_gte = Float()
+    sales_equalization_rate_3_lte = Float()
+    retention_rate = Float()
+    retention_rate_gte = Float()
+    retention_rate_lte = Float()
+    is_reviewed = Boolean()
+    financial_surcharge_rate = Float()
+    financial_surcharge_rate_gte = Float()
+    financial_surcharge_rate_lte = Float()
+    pricing_reference = String()
+    pricing_reference_contains = String()
+    phone = String()
+    phone_contains = String()
+    text = String()
+    text_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    charge_credit_invoice = String()
+    charge_credit_invoice_contains = String()
+    work_invoice_type = String()
+    work_invoice_type_contains = String()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    last_modification_user_id = String()
+    last_modification_user_id_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class SalesInvoiceTax(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesInvoiceTax
+        name = "LegacySalesInvoiceTax"
+        description = "Desglose de Impuestos del Documento de Facturas de Venta"
+
+
+class SalesInvoiceTaxFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesInvoiceTaxFilter"
+
+    tax_base = Float()
+    tax_base_gte = Float()
+    tax_base_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    tax_id = Int()
+    tax_id_gte = Int()
+    tax_id_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    sales_invoice_id = Int()
+    sales_invoice_id_gte = Int()
+    sales_invoice_id_lte = Int()
+    tax_rate = Float()
+    tax_rate_gte = Float()
+    tax_rate_lte = Float()
+
+
+class SalesOffer(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOffer
+        name = "LegacySalesOffer"
+        description = "Cabecera del Documento de Ofertas de Venta"
+
+
+class SalesOfferFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOfferFilter"
+
+    has_attachments = Boolean()
+    tax_base_1 = Float()
+    tax_base_1_gte = Float()
+    tax_base_1_lte = Float()
+    tax_base_2 = Float()
+    tax_base_2_gte = Float()
+    tax_base_2_lte = Float()
+    tax_base_3 = Float()
+    tax_base_3_gte = Float()
+    tax_base_3_lte = Float()
+    is_invoice_locked = Boolean()
+    is_locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    notification_id = Int()
+    notification_id_gte = Int()
+    notification_id_lte = Int()
+    document_address_id = Int()
+    document_address_id_gte = Int()
+    document_address_id_lte = Int()
+    shipping_address_id = Int()
+    shipping_address_id_gte = Int()
+    shipping_address_id_lte = Int()
+    closure_reason = Int()
+    closure_reason_gte = Int()
+    closure_reason_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    delivery_terms = String()
+    delivery_terms_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    potential_customer_id = Int()
+    potential_customer_id_gte = Int()
+    potential_customer_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    sales_offer_id = Int()
+    sales_offer_id_gte = Int()
+    sales_offer_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    shipping_country_id = String()
+    shipping_country_id_contains = String()
+    periodicity_id = Int()
+    periodicity_id_gte = Int()
+    periodicity_id_lte = Int()
+    origin_id = String()
+    origin_id_contains = String()
+    potential_customer_contact_id = Int()
+    potential_customer_contact_id_gte = Int()
+    potential_customer_contact_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    shipping_province_id = Int()
+    shipping_province_id_gte = Int()
+    shipping_province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    customer_contact_id = Int()
+    customer_contact_id_gte = Int()
+    customer_contact_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    shipping_street_type = String()
+    shipping_street_type_contains = String()
+    is_potential_customer = Boolean()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description = String()
+    description_contains = String()
+    delivery_days = Int()
+    delivery_days_gte = Int()
+    delivery_days_lte = Int()
+    street_name = String()
+    street_name_contains = String()
+    shipping_street_name = String()
+    shipping_street_name_contains = String()
+    origin_document_id = String()
+    origin_document_id_contains = String()
+    origin_type = String()
+    origin_type_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    shipping_postal_code = Int()
+    shipping_postal_code_gte = Int()
+    shipping_postal_code_lte = Int()
+    prompt_payment_discount = Float()
+    prompt_payment_discount_gte = Float()
+    prompt_payment_discount_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    editing_state = String()
+    editing_state_contains = String()
+    email = String()
+    email_contains = String()
+    sent_by_email = Boolean()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    fax = String()
+    fax_contains = String()
+    sent_by_fax = Boolean()
+    expiration_date = Date()
+    expiration_date_gte = Date()
+    expiration_date_lte = Date()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    closure_date = Date()
+    closure_date_gte = Date()
+    closure_date_lte = Date()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    registration_time = String()
+    registration_time_contains = String()
+    goconnect_id = Float()
+    goconnect_id_gte = Float()
+    goconnect_id_lte = Float()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    unique_id_pc = String()
+    unique_id_pc_contains = String()
+    vat_amount_1 = Float()
+    vat_amount_1_gte = Float()
+    vat_amount_1_lte = Float()
+    vat_amount_2 = Float()
+    vat_amount_2_gte = Float()
+    vat_amount_2_lte = Float()
+    vat_amount_3 = Float()
+    vat_amount_3_gte = Float()
+    vat_amount_3_lte = Float()
+    retention_base = Float()
+    retention_base_gte = Float()
+    retention_base_lte = Float()
+    retention_rate = Float()
+    retention_rate_gte = Float()
+    retention_rate_lte = Float()
+    retention_amount = Float()
+    retention_amount_gte = Float()
+    retention_amount_lte = Float()
+    sales_equalization_amount_1 = Float()
+    sales_equalization_amount_1_gte = Float()
+    sales_equalization_amount_1_lte = Float()
+    sales_equalization_amount_2 = Float()
+    sales_equalization_amount_2_gte = Float()
+    sales_equalization_amount_2_lte = Float()
+    sales_equalization_amount_3 = Float()
+    sales_equalization_amount_3_gte = Float()
+    sales_equalization_amount_3_lte = Float()
+    vat_rate_1 = Float()
+    vat_rate_1_gte = Float()
+    vat_rate_1_lte = Float()
+    vat_rate_2 = Float()
+    vat_rate_2_gte = Float()
+    vat_rate_2_lte = Float()
+    vat_rate_3 = Float()
+    vat_rate_3_gte = Float()
+    vat_rate_3_lte = Float()
+    latitude_degrees = Int()
+    latitude_degrees_gte = Int()
+    latitude_degrees_lte = Int()
+    latitude_minutes = Int()
+    latitude_minutes_gte = Int()
+    latitude_minutes_lte = Int()
+    latitude_seconds = Int()
+    latitude_seconds_gte = Int()
+    latitude_seconds_lte = Int()
+    longitude_degrees = Int()
+    longitude_degrees_gte = Int()
+    longitude_degrees_lte = Int()
+    longitude_minutes = Int()
+    longitude_minutes_gte = Int()
+    longitude_minutes_lte = Int()
+    longitude_seconds = Int()
+    longitude_seconds_gte = Int()
+    longitude_seconds_lte = Int()
+    has_authorized_margins = Boolean()
+    street_number = String()
+    street_number_contains = String()
+    shipping_street_number = String()
+    shipping_street_number_contains = String()
+    notes = String()
+    notes_contains = String()
+    contact_person = String()
+    contact_person_contains = String()
+    delivery_time = Int()
+    delivery_time_gte = Int()
+    delivery_time_lte = Int()
+    city = String()
+    city_contains = String()
+    shipping_city = String()
+    shipping_city_contains = String()
+    shipping_cost = Float()
+    shipping_cost_gte = Float()
+    shipping_cost_lte = Float()
+    business_name = String()
+    business_name_contains = String()
+    shipping_business_name = String()
+    shipping_business_name_contains = String()
+    reference_2 = String()
+    reference_2_contains = String()
+    reference = String()
+    reference_contains = String()
+    is_replicated = Boolean()
+    sales_equalization_rate_1 = Float()
+    sales_equalization_rate_1_gte = Float()
+    sales_equalization_rate_1_lte = Float()
+    sales_equalization_rate_2 = Float()
+    sales_equalization_rate_2_gte = Float()
+    sales_equalization_rate_2_lte = Float()
+    sales_equalization_rate_3 = Float()
+    sales_equalization_rate_3_gte = Float()
+    sales_equalization_rate_3_lte = Float()
+    financial_surcharge_rate = Float()
+    financial_surcharge_rate_gte = Float()
+    financial_surcharge_rate_lte = Float()
+    pricing_reference = String()
+    pricing_reference_contains = String()
+    status = String()
+    status_contains = String()
+    shipping_phone = String()
+    shipping_phone_contains = String()
+    phone = String()
+    phone_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    last_modification_user_id = String()
+    last_modification_user_id_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+
+
+class SalesOfferTax(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOfferTax
+        name = "LegacySalesOfferTax"
+        description = "Desglose de Impuestos del Documento de Ofertas de Venta"
+
+
+class SalesOfferTaxFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOfferTaxFilter"
+
+    tax_base = Float()
+    tax_base_gte = Float()
+    tax_base_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    tax_id = Int()
+    tax_id_gte = Int()
+    tax_id_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    tax_rate = Float()
+    tax_rate_gte = Float()
+    tax_rate_lte = Float()
+
+
+class SalesOfferLine(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOfferLine
+        name = "LegacySalesOfferLine"
+        description = "Detalle de Lineas del Documento de Ofertas de Venta"
+
+
+class SalesOfferLineFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOfferLineFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    assigned_quantity = Float()
+    assigned_quantity_gte = Float()
+    assigned_quantity_lte = Float()
+    kit_quantity = Float()
+    kit_quantity_gte = Float()
+    kit_quantity_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+    is_closed = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    product_id = String()
+    product_id_contains = String()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    vat_id = Int()
+    vat_id_gte = Int()
+    vat_id_lte = Int()
+    kit_product_id = String()
+    kit_product_id_contains = String()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    work_project_id = Int()
+    work_project_id_gte = Int()
+    work_project_id_lte = Int()
+    sales_offer_id = Int()
+    sales_offer_id_gte = Int()
+    sales_offer_id_lte = Int()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    packing_unit_purchase_id = String()
+    packing_unit_purchase_id_contains = String()
+    measurement_unit_weight = String()
+    measurement_unit_weight_contains = String()
+    measurement_unit_volume = String()
+    measurement_unit_volume_contains = String()
+    kit_cost = Float()
+    kit_cost_gte = Float()
+    kit_cost_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    product_code_corporative = String()
+    product_code_corporative_contains = String()
+    purchase_packing_unit_quantity = Float()
+    purchase_packing_unit_quantity_gte = Float()
+    purchase_packing_unit_quantity_lte = Float()
+    packing_unit_quantity = Float()
+    packing_unit_quantity_gte = Float()
+    packing_unit_quantity_lte = Float()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    kit_description = String()
+    kit_description_contains = String()
+    description = String()
+    description_contains = String()
+    delivery_days = Int()
+    delivery_days_gte = Int()
+    delivery_days_lte = Int()
+    purchase_discount_1 = Float()
+    purchase_discount_1_gte = Float()
+    purchase_discount_1_lte = Float()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    purchase_discount_2 = Float()
+    purchase_discount_2_gte = Float()
+    purchase_discount_2_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    purchase_discount_3 = Float()
+    purchase_discount_3_gte = Float()
+    purchase_discount_3_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    delivery_date = Date()
+    delivery_date_gte = Date()
+    delivery_date_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    kit_increment = Float()
+    kit_increment_gte = Float()
+    kit_increment_lte = Float()
+    increment = Float()
+    increment_gte = Float()
+    increment_lte = Float()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    origin_document_line = Int()
+    origin_document_line_gte = Int()
+    origin_document_line_lte = Int()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    notes = String()
+    notes_contains = String()
+    line_order = Int()
+    line_order_gte = Int()
+    line_order_lte = Int()
+    weight = Float()
+    weight_gte = Float()
+    weight_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    kit_price = Float()
+    kit_price_gte = Float()
+    kit_price_lte = Float()
+    price = Float()
+    price_gte = Float()
+    price_lte = Float()
+    origin_type = String()
+    origin_type_contains = String()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    is_reclaculable = Boolean()
+    kit_reference = String()
+    kit_reference_contains = String()
+    product_reference = String()
+    product_reference_contains = String()
+    has_tax = Boolean()
+    delivery_time = Int()
+    delivery_time_gte = Int()
+    delivery_time_lte = Int()
+    line_type = String()
+    line_type_contains = String()
+    kit_price_calculation_method = Boolean()
+    price_calculation_method = Boolean()
+
+
+class SalesOrder(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOrder
+        name = "LegacySalesOrder"
+        description = "Cabecera del Documento de Pedidos de Venta"
+
+
+class SalesOrderFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOrderFilter"
+
+    has_attachments = Boolean()
+    group_delivery_notes = String()
+    group_delivery_notes_contains = String()
+    single_delivery_note = Boolean()
+    advance_payment_amount = Float()
+    advance_payment_amount_gte = Float()
+    advance_payment_amount_lte = Float()
+    tax_base_1 = Float()
+    tax_base_1_gte = Float()
+    tax_base_1_lte = Float()
+    tax_base_2 = Float()
+    tax_base_2_gte = Float()
+    tax_base_2_lte = Float()
+    tax_base_3 = Float()
+    tax_base_3_gte = Float()
+    tax_base_3_lte = Float()
+    is_locked = Boolean()
+    gross_amount = Float()
+    gross_amount_gte = Float()
+    gross_amount_lte = Float()
+    currency_quantity = Int()
+    currency_quantity_gte = Int()
+    currency_quantity_lte = Int()
+    is_closed = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    notification_id = Int()
+    notification_id_gte = Int()
+    notification_id_lte = Int()
+    shipping_address_id = Int()
+    shipping_address_id_gte = Int()
+    shipping_address_id_lte = Int()
+    document_address_id = Int()
+    document_address_id_gte = Int()
+    document_address_id_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    installation_customer_id = Int()
+    installation_customer_id_gte = Int()
+    installation_customer_id_lte = Int()
+    delivery_terms = String()
+    delivery_terms_contains = String()
+    sales_order_id = Int()
+    sales_order_id_gte = Int()
+    sales_order_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    worker_id = Int()
+    worker_id_gte = Int()
+    worker_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    payment_method_id = Int()
+    payment_method_id_gte = Int()
+    payment_method_id_lte = Int()
+    installation_id = Int()
+    installation_id_gte = Int()
+    installation_id_lte = Int()
+    sales_offer_id = Int()
+    sales_offer_id_gte = Int()
+    sales_offer_id_lte = Int()
+    work_order_id = Int()
+    work_order_id_gte = Int()
+    work_order_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    shipping_country_id = String()
+    shipping_country_id_contains = String()
+    periodicity_id = Int()
+    periodicity_id_gte = Int()
+    periodicity_id_lte = Int()
+    origin_id = String()
+    origin_id_contains = String()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    shipping_province_id = Int()
+    shipping_province_id_gte = Int()
+    shipping_province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    subzone_id = Int()
+    subzone_id_gte = Int()
+    subzone_id_lte = Int()
+    customer_contact_id = Int()
+    customer_contact_id_gte = Int()
+    customer_contact_id_lte = Int()
+    carrier_id = Int()
+    carrier_id_gte = Int()
+    carrier_id_lte = Int()
+    user_id = String()
+    user_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    shipping_street_type = String()
+    shipping_street_type_contains = String()
+    zone_id = Int()
+    zone_id_gte = Int()
+    zone_id_lte = Int()
+    comission_percent = Float()
+    comission_percent_gte = Float()
+    comission_percent_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    buyer_id = String()
+    buyer_id_contains = String()
+    distribution_branch_id = Int()
+    distribution_branch_id_gte = Int()
+    distribution_branch_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    distribution_company_id = Int()
+    distribution_company_id_gte = Int()
+    distribution_company_id_lte = Int()
+    street_name = String()
+    street_name_contains = String()
+    shipping_street_name = String()
+    shipping_street_name_contains = String()
+    distribution_purchase_order_id = Int()
+    distribution_purchase_order_id_gte = Int()
+    distribution_purchase_order_id_lte = Int()
+    distribution_sale_order_id = Int()
+    distribution_sale_order_id_gte = Int()
+    distribution_sale_order_id_lte = Int()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    shipping_postal_code = Int()
+    shipping_postal_code_gte = Int()
+    shipping_postal_code_lte = Int()
+    prompt_payment_discount = Float()
+    prompt_payment_discount_gte = Float()
+    prompt_payment_discount_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    sent_by_email = Boolean()
+    email = String()
+    email_contains = String()
+    packaging_cost = Float()
+    packaging_cost_gte = Float()
+    packaging_cost_lte = Float()
+    sent_by_fax = Boolean()
+    fax = String()
+    fax_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    date = Date()
+    date_gte = Date()
+    date_lte = Date()
+    fixed_payment_date = Date()
+    fixed_payment_date_gte = Date()
+    fixed_payment_date_lte = Date()
+    registration_date = Date()
+    registration_date_gte = Date()
+    registration_date_lte = Date()
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    registration_time = String()
+    registration_time_contains = String()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    has_fixed_payment_date = Boolean()
+    tax_amount_1 = Float()
+    tax_amount_1_gte = Float()
+    tax_amount_1_lte = Float()
+    tax_amount_2 = Float()
+    tax_amount_2_gte = Float()
+    tax_amount_2_lte = Float()
+    tax_amount_3 = Float()
+    tax_amount_3_gte = Float()
+    tax_amount_3_lte = Float()
+    retention_base = Float()
+    retention_base_gte = Float()
+    retention_base_lte = Float()
+    retention_rate = Float()
+    retention_rate_gte = Float()
+    retention_rate_lte = Float()
+    retention_amount = Float()
+    retention_amount_gte = Float()
+    retention_amount_lte = Float()
+    printed = Boolean()
+    sales_equalization_amount_1 = Float()
+    sales_equalization_amount_1_gte = Float()
+    sales_equalization_amount_1_lte = Float()
+    sales_equalization_amount_2 = Float()
+    sales_equalization_amount_2_gte = Float()
+    sales_equalization_amount_2_lte = Float()
+    sales_equalization_amount_3 = Float()
+    sales_equalization_amount_3_gte = Float()
+    sales_equalization_amount_3_lte = Float()
+    vat_rate_1 = Float()
+    vat_rate_1_gte = Float()
+    vat_rate_1_lte = Float()
+    vat_rate_2 = Float()
+    vat_rate_2_gte = Float()
+    vat_rate_2_lte = Float()
+    vat_rate_3 = Float()
+    vat_rate_3_gte = Float()
+    vat_rate_3_lte = Float()
+    latitude_degrees = Int()
+    latitude_degrees_gte = Int()
+    latitude_degrees_lte = Int()
+    latitude_minutes = Int()
+    latitude_minutes_gte = Int()
+    latitude_minutes_lte = Int()
+    latitude_seconds = Int()
+    latitude_seconds_gte = Int()
+    latitude_seconds_lte = Int()
+    pending_authorizations = String()
+    pending_authorizations_contains = String()
+    longitude_degrees = Int()
+    longitude_degrees_gte = Int()
+    longitude_degrees_lte = Int()
+    longitude_minutes = Int()
+    longitude_minutes_gte = Int()
+    longitude_minutes_lte = Int()
+    longitude_seconds = Int()
+    longitude_seconds_gte = Int()
+    longitude_seconds_lte = Int()
+    has_authorized_margins = Boolean()
+    street_number = String()
+    street_number_contains = String()
+    shipping_street_number = String()
+    shipping_street_number_contains = String()
+    notes = String()
+    notes_contains = String()
+    is_pending_authorization = Boolean()
+    is_full_order = Boolean()
+    contact_person = String()
+    contact_person_contains = String()
+    city = String()
+    city_contains = String()
+    shipping_city = String()
+    shipping_city_contains = String()
+    shipping_cost = Float()
+    shipping_cost_gte = Float()
+    shipping_cost_lte = Float()
+    business_name = String()
+    business_name_contains = String()
+    shipping_business_name = String()
+    shipping_business_name_contains = String()
+    reference_2 = String()
+    reference_2_contains = String()
+    reference = String()
+    reference_contains = String()
+    is_replicated = Boolean()
+    sales_equalization_rate_1 = Float()
+    sales_equalization_rate_1_gte = Float()
+    sales_equalization_rate_1_lte = Float()
+    sales_equalization_rate_2 = Float()
+    sales_equalization_rate_2_gte = Float()
+    sales_equalization_rate_2_lte = Float()
+    sales_equalization_rate_3 = Float()
+    sales_equalization_rate_3_gte = Float()
+    sales_equalization_rate_3_lte = Float()
+    financial_surcharge_rate = Float()
+    financial_surcharge_rate_gte = Float()
+    financial_surcharge_rate_lte = Float()
+    pricing_reference = String()
+    pricing_reference_contains = String()
+    phone = String()
+    phone_contains = String()
+    shipping_phone = String()
+    shipping_phone_contains = String()
+    delivery_type = String()
+    delivery_type_contains = String()
+    discount_type = Int()
+    discount_type_gte = Int()
+    discount_type_lte = Int()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    last_modification_user_id = String()
+    last_modification_user_id_contains = String()
+    currency_value = Float()
+    currency_value_gte = Float()
+    currency_value_lte = Float()
+    is_linked_with_purchases = Boolean()
+
+
+class SalesOrderTax(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOrderTax
+        name = "LegacySalesOrderTax"
+        description = "Desglose de Impuestos del Documento de Pedidos de Venta"
+
+
+class SalesOrderTaxFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOrderTaxFilter"
+
+    tax_base = Float()
+    tax_base_gte = Float()
+    tax_base_lte = Float()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    tax_id = Int()
+    tax_id_gte = Int()
+    tax_id_lte = Int()
+    tax_type = Int()
+    tax_type_gte = Int()
+    tax_type_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    tax_rate = Float()
+    tax_rate_gte = Float()
+    tax_rate_lte = Float()
+
+
+class SalesOrderLine(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesOrderLine
+        name = "LegacySalesOrderLine"
+        description = "Detalle de Lineas del Documento de Pedidos de Venta"
+
+
+class SalesOrderLineFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesOrderLineFilter"
+
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    is_atypical_sale = Boolean()
+    is_margin_authorized = Boolean()
+    is_closed = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    warehouse_id = Int()
+    warehouse_id_gte = Int()
+    warehouse_id_lte = Int()
+    product_id = String()
+    product_id_contains = String()
+    sales_order_id = Int()
+    sales_order_id_gte = Int()
+    sales_order_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    vat_id = Int()
+    vat_id_gte = Int()
+    vat_id_lte = Int()
+    brand_id = Int()
+    brand_id_gte = Int()
+    brand_id_lte = Int()
+    work_id = Int()
+    work_id_gte = Int()
+    work_id_lte = Int()
+    sales_offer_id = Int()
+    sales_offer_id_gte = Int()
+    sales_offer_id_lte = Int()
+    vendor_id = Int()
+    vendor_id_gte = Int()
+    vendor_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    purchase_packing_unit_id = String()
+    purchase_packing_unit_id_contains = String()
+    measurement_unit_weight = String()
+    measurement_unit_weight_contains = String()
+    measurement_unit_volume = String()
+    measurement_unit_volume_contains = String()
+    zone_id = String()
+    zone_id_contains = String()
+    direct_commission = Float()
+    direct_commission_gte = Float()
+    direct_commission_lte = Float()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    ordered_quantity = Float()
+    ordered_quantity_gte = Float()
+    ordered_quantity_lte = Float()
+    prepared_quantity = Float()
+    prepared_quantity_gte = Float()
+    prepared_quantity_lte = Float()
+    reserved_quantity = Float()
+    reserved_quantity_gte = Float()
+    reserved_quantity_lte = Float()
+    served_quantity = Float()
+    served_quantity_gte = Float()
+    served_quantity_lte = Float()
+    product_code_corporative = String()
+    product_code_corporative_contains = String()
+    purchase_packing_unit_quantity = Float()
+    purchase_packing_unit_quantity_gte = Float()
+    purchase_packing_unit_quantity_lte = Float()
+    packing_unit_quantity = Float()
+    packing_unit_quantity_gte = Float()
+    packing_unit_quantity_lte = Float()
+    linked_quantity = Float()
+    linked_quantity_gte = Float()
+    linked_quantity_lte = Float()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    description_long = String()
+    description_long_contains = String()
+    destination_branch_id = String()
+    destination_branch_id_contains = String()
+    description = String()
+    description_contains = String()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    purchase_discount_1 = Float()
+    purchase_discount_1_gte = Float()
+    purchase_discount_1_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    purchase_discount_2 = Float()
+    purchase_discount_2_gte = Float()
+    purchase_discount_2_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    purchase_discount_3 = Float()
+    purchase_discount_3_gte = Float()
+    purchase_discount_3_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    delivery_date = Date()
+    delivery_date_gte = Date()
+    delivery_date_lte = Date()
+    initial_delivery_date = Date()
+    initial_delivery_date_gte = Date()
+    initial_delivery_date_lte = Date()
+    amount = Float()
+    amount_gte = Float()
+    amount_lte = Float()
+    tax_amount = Float()
+    tax_amount_gte = Float()
+    tax_amount_lte = Float()
+    sales_offer_line_number = Int()
+    sales_offer_line_number_gte = Int()
+    sales_offer_line_number_lte = Int()
+    line_number = Int()
+    line_number_gte = Int()
+    line_number_lte = Int()
+    line_order = Int()
+    line_order_gte = Int()
+    line_order_lte = Int()
+    weight = Float()
+    weight_gte = Float()
+    weight_lte = Float()
+    price = Float()
+    price_gte = Float()
+    price_lte = Float()
+    purchase_price = Float()
+    purchase_price_gte = Float()
+    purchase_price_lte = Float()
+    priority = Int()
+    priority_gte = Int()
+    priority_lte = Int()
+    vendor_ambit = Int()
+    vendor_ambit_gte = Int()
+    vendor_ambit_lte = Int()
+    rappel = Float()
+    rappel_gte = Float()
+    rappel_lte = Float()
+    account_in_settlement = Boolean()
+    product_reference = String()
+    product_reference_contains = String()
+    has_tax = Boolean()
+    has_rappel = Boolean()
+    line_type = String()
+    line_type_contains = String()
+    location_id = String()
+    location_id_contains = String()
+    volume = Float()
+    volume_gte = Float()
+    volume_lte = Float()
+
+
+class Protocols(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Protocols
+        name = "LegacyProtocols"
+        description = "Protocolos"
+
+
+class ProtocolsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProtocolsFilter"
+
+    active = Boolean()
+    protocol = String()
+    protocol_contains = String()
+    description = String()
+    description_contains = String()
+
+
+class PackingUnit(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PackingUnit
+        name = "LegacyPackingUnit"
+        description = "Maestro de Tipos de Embalajes"
+
+
+class PackingUnitFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPackingUnitFilter"
+
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+
+
+class ProductPackingUnit(SQLAlchemyObjectType):
+    class Meta:
+        model = models.ProductPackingUnit
+        name = "LegacyProductPackingUnit"
+        description = "Diferentes Unidades de Embalajes de cada Artículo, así como su Conversió"
+
+
+class ProductPackingUnitFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyProductPackingUnitFilter"
+
+    height = Int()
+    height_gte = Int()
+    height_lte = Int()
+    product_ambit = Int()
+    product_ambit_gte = Int()
+    product_ambit_lte = Int()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    multiple_quantity = Int()
+    multiple_quantity_gte = Int()
+    multiple_quantity_lte = Int()
+    minimum_quantity = Float()
+    minimum_quantity_gte = Float()
+    minimum_quantity_lte = Float()
+    product_id = String()
+    product_id_contains = String()
+    packing_unit_type = Int()
+    packing_unit_type_gte = Int()
+    packing_unit_type_lte = Int()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    conversion = Int()
+    conversion_gte = Int()
+    conversion_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    maximum_weight = Float()
+    maximum_weight_gte = Float()
+    maximum_weight_lte = Float()
+    net_weight = Float()
+    net_weight_gte = Float()
+    net_weight_lte = Float()
+
+
+class WorkRatings(SQLAlchemyObjectType):
+    class Meta:
+        model = models.WorkRatings
+        name = "LegacyWorkRatings"
+        description = "Valoración para cada Combinación de Categoría y Tipo de Hora"
+
+
+class WorkRatingsFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyWorkRatingsFilter"
+
+    scope = Int()
+    scope_gte = Int()
+    scope_lte = Int()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    item_code = String()
+    item_code_contains = String()
+    time_hour = Int()
+    time_hour_gte = Int()
+    time_hour_lte = Int()
+    cost = Float()
+    cost_gte = Float()
+    cost_lte = Float()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius_r_912 = Float()
+    temperature_in_celsius_r_912_gte = Float()
+    temperature_in_celsius_r_912_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3tlmp = Date()
+    date_3tlmp_gte = Date()
+    date_3tlmp_lte = Date()
+    selling_price = Int()
+    selling_price_gte = Int()
+    selling_price_lte = Int()
+    operation_type = Int()
+    operation_type_gte = Int()
+    operation_type_lte = Int()
+
+
+class Pending(SQLAlchemyObjectType):
+    class Meta:
+        model = models.Pending
+        name = "LegacyPending"
+        description = "Registros pendientes de integrar según capa de integración"
+
+
+class PendingFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPendingFilter"
+
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    table = String()
+    table_contains = String()
+    action = String()
+    action_contains = String()
+    document = String()
+    document_contains = String()
+    last_modified = DateTime()
+    last_modified_gte = DateTime()
+    last_modified_lte = DateTime()
+    from_date = DateTime()
+    from_date_gte = DateTime()
+    from_date_lte = DateTime()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+
+
+class SalesPricing(SQLAlchemyObjectType):
+    class Meta:
+        model = models.SalesPricing
+        name = "LegacySalesPricing"
+        description = "Precios de venta"
+
+
+class SalesPricingFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacySalesPricingFilter"
+
+    product_id = String()
+    product_id_contains = String()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    branch_id = Int()
+    branch_id_gte = Int()
+    branch_id_lte = Int()
+    company_id = Int()
+    company_id_gte = Int()
+    company_id_lte = Int()
+    currency_id = String()
+    currency_id_contains = String()
+    packing_unit_id = String()
+    packing_unit_id_contains = String()
+    price_quantity = Float()
+    price_quantity_gte = Float()
+    price_quantity_lte = Float()
+    packing_unit_description = String()
+    packing_unit_description_contains = String()
+    discount_1 = Float()
+    discount_1_gte = Float()
+    discount_1_lte = Float()
+    discount_2 = Float()
+    discount_2_gte = Float()
+    discount_2_lte = Float()
+    discount_3 = Float()
+    discount_3_gte = Float()
+    discount_3_lte = Float()
+    equivalent_discount = Float()
+    equivalent_discount_gte = Float()
+    equivalent_discount_lte = Float()
+    tax = Float()
+    tax_gte = Float()
+    tax_lte = Float()
+    margin = Float()
+    margin_gte = Float()
+    margin_lte = Float()
+    currency_name = String()
+    currency_name_contains = String()
+    price = Float()
+    price_gte = Float()
+    price_lte = Float()
+    net_price = Float()
+    net_price_gte = Float()
+    net_price_lte = Float()
+    net_price_incl_vat = Float()
+    net_price_incl_vat_gte = Float()
+    net_price_incl_vat_lte = Float()
+    net_price_incl_vat_tax = Float()
+    net_price_incl_vat_tax_gte = Float()
+    net_price_incl_vat_tax_lte = Float()
+    quantity = Float()
+    quantity_gte = Float()
+    quantity_lte = Float()
+
+
+class HourTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.HourTypes
+        name = "LegacyHourTypes"
+        description = "Maestro de Tipos de Hora dentro de una Jornada"
+
+
+class HourTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyHourTypesFilter"
+
+    barcode = Float()
+    barcode_gte = Float()
+    barcode_lte = Float()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    time_hour = Int()
+    time_hour_gte = Int()
+    time_hour_lte = Int()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    description = String()
+    description_contains = String()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    encrypted_vat_number = String()
+    encrypted_vat_number_contains = String()
+    hour_type = String()
+    hour_type_contains = String()
+
+
+class EmployeeTypes(SQLAlchemyObjectType):
+    class Meta:
+        model = models.EmployeeTypes
+        name = "LegacyEmployeeTypes"
+        description = "Maestro de Categorías Profesionales de los Empleados"
+
+
+class EmployeeTypesFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyEmployeeTypesFilter"
+
+    category = String()
+    category_contains = String()
+    user_character1 = String()
+    user_character1_contains = String()
+    character1tlmp = String()
+    character1tlmp_contains = String()
+    user_character2 = String()
+    user_character2_contains = String()
+    character2tlmp = String()
+    character2tlmp_contains = String()
+    user_character3 = String()
+    user_character3_contains = String()
+    character3tlmp = String()
+    character3tlmp_contains = String()
+    user_character4 = String()
+    user_character4_contains = String()
+    character4tlmp = String()
+    character4tlmp_contains = String()
+    user_character5 = String()
+    user_character5_contains = String()
+    user_character6 = String()
+    user_character6_contains = String()
+    user_character7 = String()
+    user_character7_contains = String()
+    user_character8 = String()
+    user_character8_contains = String()
+    user_decimal1 = Float()
+    user_decimal1_gte = Float()
+    user_decimal1_lte = Float()
+    temporary_decimal1 = Float()
+    temporary_decimal1_gte = Float()
+    temporary_decimal1_lte = Float()
+    decimal_to_user = Float()
+    decimal_to_user_gte = Float()
+    decimal_to_user_lte = Float()
+    decimal_to_ton_of_limestone_mixture_price = Float()
+    decimal_to_ton_of_limestone_mixture_price_gte = Float()
+    decimal_to_ton_of_limestone_mixture_price_lte = Float()
+    user_decimal3 = Float()
+    user_decimal3_gte = Float()
+    user_decimal3_lte = Float()
+    temporary_decimal3 = Float()
+    temporary_decimal3_gte = Float()
+    temporary_decimal3_lte = Float()
+    user_decimal4 = Float()
+    user_decimal4_gte = Float()
+    user_decimal4_lte = Float()
+    temperature_in_celsius = Float()
+    temperature_in_celsius_gte = Float()
+    temperature_in_celsius_lte = Float()
+    user_decimal5 = Float()
+    user_decimal5_gte = Float()
+    user_decimal5_lte = Float()
+    user_decimal6 = Float()
+    user_decimal6_gte = Float()
+    user_decimal6_lte = Float()
+    editor1user = String()
+    editor1user_contains = String()
+    usereditor2 = String()
+    usereditor2_contains = String()
+    date1user = Date()
+    date1user_gte = Date()
+    date1user_lte = Date()
+    date1tlmp = Date()
+    date1tlmp_gte = Date()
+    date1tlmp_lte = Date()
+    user_date2 = Date()
+    user_date2_gte = Date()
+    user_date2_lte = Date()
+    date2tlmp = Date()
+    date2tlmp_gte = Date()
+    date2tlmp_lte = Date()
+    user_date3 = Date()
+    user_date3_gte = Date()
+    user_date3_lte = Date()
+    date_3rd_quarter_tlmp = Date()
+    date_3rd_quarter_tlmp_gte = Date()
+    date_3rd_quarter_tlmp_lte = Date()
+    employee_type = Int()
+    employee_type_gte = Int()
+    employee_type_lte = Int()
+
+
+class PotentialCustomer(SQLAlchemyObjectType):
+    class Meta:
+        model = models.PotentialCustomer
+        name = "LegacyPotentialCustomer"
+        description = "Clientes Potenciales"
+
+
+class PotentialCustomerFilter(graphene.InputObjectType):
+    class Meta:
+        name = "LegacyPotentialCustomerFilter"
+
+    last_modified_date = Date()
+    last_modified_date_gte = Date()
+    last_modified_date_lte = Date()
+    has_attachments = Boolean()
+    creation_date = Date()
+    creation_date_gte = Date()
+    creation_date_lte = Date()
+    is_deregistered = Boolean()
+    is_locked = Boolean()
+    user_char1 = String()
+    user_char1_contains = String()
+    user_char2 = String()
+    user_char2_contains = String()
+    user_char3 = String()
+    user_char3_contains = String()
+    user_char4 = String()
+    user_char4_contains = String()
+    user_char5 = String()
+    user_char5_contains = String()
+    user_char6 = String()
+    user_char6_contains = String()
+    user_char7 = String()
+    user_char7_contains = String()
+    user_char8 = String()
+    user_char8_contains = String()
+    vat_number = String()
+    vat_number_contains = String()
+    customer_ambit = Int()
+    customer_ambit_gte = Int()
+    customer_ambit_lte = Int()
+    association_id = Int()
+    association_id_gte = Int()
+    association_id_lte = Int()
+    customer_id = Int()
+    customer_id_gte = Int()
+    customer_id_lte = Int()
+    potential_customer_id = Int()
+    potential_customer_id_gte = Int()
+    potential_customer_id_lte = Int()
+    language_id = String()
+    language_id_contains = String()
+    legal_form_id = Int()
+    legal_form_id_gte = Int()
+    legal_form_id_lte = Int()
+    country_id = String()
+    country_id_contains = String()
+    periodicity_id = Int()
+    periodicity_id_gte = Int()
+    periodicity_id_lte = Int()
+    potential_customer_contact_id = Int()
+    potential_customer_contact_id_gte = Int()
+    potential_customer_contact_id_lte = Int()
+    province_id = Int()
+    province_id_gte = Int()
+    province_id_lte = Int()
+    sales_representative_id = Int()
+    sales_representative_id_gte = Int()
+    sales_representative_id_lte = Int()
+    subzone_id = Int()
+    subzone_id_gte = Int()
+    subzone_id_lte = Int()
+    treatment_id = String()
+    treatment_id_contains = String()
+    street_type = String()
+    street_type_contains = String()
+    zone_id = Int()
+    zone_id_gte = Int()
+    zone_id_lte = Int()
+    user_dec1 = Float()
+    user_dec1_gte = Float()
+    user_dec1_lte = Float()
+    user_dec2 = Float()
+    user_dec2_gte = Float()
+    user_dec2_lte = Float()
+    user_dec3 = Float()
+    user_dec3_gte = Float()
+    user_dec3_lte = Float()
+    user_dec4 = Float()
+    user_dec4_gte = Float()
+    user_dec4_lte = Float()
+    user_dec5 = Float()
+    user_dec5_gte = Float()
+    user_dec5_lte = Float()
+    user_dec6 = Float()
+    user_dec6_gte = Float()
+    user_dec6_lte = Float()
+    street_name = String()
+    street_name_contains = String()
+    send_newsletter = Boolean()
+    user_edi1 = String()
+    user_edi1_contains = String()
+    user_edi2 = String()
+    user_edi2_contains = String()
+    user_fec1 = Date()
+    user_fec1_gte = Date()
+    user_fec1_lte = Date()
+    user_fec2 = Date()
+    user_fec2_gte = Date()
+    user_fec2_lte = Date()
+    user_fec3 = Date()
+    user_fec3_gte = Date()
+    user_fec3_lte = Date()
+    unique_id = Float()
+    unique_id_gte = Float()
+    unique_id_lte = Float()
+    name = String()
+    name_contains = String()
+    street_number = String()
+    street_number_contains = String()
+    notes = String()
+    notes_contains = String()
+    city = String()
+    city_contains = String()
+    postal_code = Int()
+    postal_code_gte = Int()
+    postal_code_lte = Int()
+    commercial_follow_up = String()
+    commercial_follow_up_contains = String()
+    business_name = String()
+    business_name_contains = String()
+    is_resident = Boolean()
+    is_pending_review = Boolean()
+    phone = String()
+    phone_contains = String()
+    web = String()
+    web_contains = String()
+
+
+class LegacyQuery(graphene.ObjectType):
+    """Consultas sobre las tablas heredadas"""
+
+    notes = legacy_list_field(Notes, NotesFilter)
+    notice_drafts = legacy_list_field(NoticeDrafts, NoticeDraftsFilter)
+    notice_status = legacy_list_field(NoticeStatus, NoticeStatusFilter)
+    commercial_action = legacy_list_field(CommercialAction, CommercialActionFilter)
+    notice_types = legacy_list_field(NoticeTypes, NoticeTypesFilter)
+    confirming = legacy_list_field(Confirming, ConfirmingFilter)
+    product_barcode = legacy_list_field(ProductBarcode, ProductBarcodeFilter)
+    product_branch = legacy_list_field(ProductBranch, ProductBranchFilter)
+    product_description = legacy_list_field(ProductDescription, ProductDescriptionFilter)
+    product_serial_number = legacy_list_field(ProductSerialNumber, ProductSerialNumberFilter)
+    product = legacy_list_field(Product, ProductFilter)
+    product_classification_languages = legacy_list_field(ProductClassificationLanguages, ProductClassificationLanguagesFilter)
+    product_by_classification = legacy_list_field(ProductByClassification, ProductByClassificationFilter)
+    product_classification = legacy_list_field(ProductClassification, ProductClassificationFilter)
+    product_classification_level_1 = legacy_list_field(ProductClassificationLevel1, ProductClassificationLevel1Filter)
+    product_classification_level_2 = legacy_list_field(ProductClassificationLevel2, ProductClassificationLevel2Filter)
+    product_classification_level_3 = legacy_list_field(ProductClassificationLevel3, ProductClassificationLevel3Filter)
+    product_classification_level_4 = legacy_list_field(ProductClassificationLevel4, ProductClassificationLevel4Filter)
+    product_classification_level_5 = legacy_list_field(ProductClassificationLevel5, ProductClassificationLevel5Filter)
+    product_classification_level_6 = legacy_list_field(ProductClassificationLevel6, ProductClassificationLevel6Filter)
+    product_classification_level_7 = legacy_list_field(ProductClassificationLevel7, ProductClassificationLevel7Filter)
+    product_classification_level_8 = legacy_list_field(ProductClassificationLevel8, ProductClassificationLevel8Filter)
+    product_classification_level_9 = legacy_list_field(ProductClassificationLevel9, ProductClassificationLevel9Filter)
+    product_brand = legacy_list_field(ProductBrand, ProductBrandFilter)
+    accounting_movements = legacy_list_field(AccountingMovements, AccountingMovementsFilter)
+    promissory_notes = legacy_list_field(PromissoryNotes, PromissoryNotesFilter)
+    remittances = legacy_list_field(Remittances, RemittancesFilter)
+    priorities = legacy_list_field(Priorities, PrioritiesFilter)
+    invoicenotification = legacy_list_field(Invoicenotification, InvoicenotificationFilter)
+    invoicenotification_lines = legacy_list_field(InvoicenotificationLines, InvoicenotificationLinesFilter)
+    deliverynotification_lines = legacy_list_field(DeliverynotificationLines, DeliverynotificationLinesFilter)
+    purchase_delivery_notes = legacy_list_field(PurchaseDeliveryNotes, PurchaseDeliveryNotesFilter)
+    purchase_orders = legacy_list_field(PurchaseOrders, PurchaseOrdersFilter)
+    purchase_order_taxes = legacy_list_field(PurchaseOrderTaxes, PurchaseOrderTaxesFilter)
+    purchase_order_lines = legacy_list_field(PurchaseOrderLines, PurchaseOrderLinesFilter)
+    links = legacy_list_field(Links, LinksFilter)
+    attached_file = legacy_list_field(AttachedFile, AttachedFileFilter)
+    calendars = legacy_list_field(Calendars, CalendarsFilter)
+    employees = legacy_list_field(Employees, EmployeesFilter)
+    working_days = legacy_list_field(WorkingDays, WorkingDaysFilter)
+    lines_working_days = legacy_list_field(LinesWorkingDays, LinesWorkingDaysFilter)
+    activity = legacy_list_field(Activity, ActivityFilter)
+    subactivity = legacy_list_field(Subactivity, SubactivityFilter)
+    banks = legacy_list_field(Banks, BanksFilter)
+    bank_movements_lines = legacy_list_field(BankMovementsLines, BankMovementsLinesFilter)
+    bank_movements = legacy_list_field(BankMovements, BankMovementsFilter)
+    customer_branch = legacy_list_field(CustomerBranch, CustomerBranchFilter)
+    customer = legacy_list_field(Customer, CustomerFilter)
+    delivery_conditions = legacy_list_field(DeliveryConditions, DeliveryConditionsFilter)
+    timekeeping = legacy_list_field(Timekeeping, TimekeepingFilter)
+    contact = legacy_list_field(Contact, ContactFilter)
+    gmdepartments = legacy_list_field(Gmdepartments, GmdepartmentsFilter)
+    customer_address = legacy_list_field(CustomerAddress, CustomerAddressFilter)
+    currencies = legacy_list_field(Currencies, CurrenciesFilter)
+    company_branch = legacy_list_field(CompanyBranch, CompanyBranchFilter)
+    payment_method = legacy_list_field(PaymentMethod, PaymentMethodFilter)
+    management_group = legacy_list_field(ManagementGroup, ManagementGroupFilter)
+    languages = legacy_list_field(Languages, LanguagesFilter)
+    country = legacy_list_field(Country, CountryFilter)
+    suppliers = legacy_list_field(Suppliers, SuppliersFilter)
+    province = legacy_list_field(Province, ProvinceFilter)
+    gmrefcli = legacy_list_field(Gmrefcli, GmrefcliFilter)
+    representative = legacy_list_field(Representative, RepresentativeFilter)
+    management_subgroup = legacy_list_field(ManagementSubgroup, ManagementSubgroupFilter)
+    bill_receivable = legacy_list_field(BillReceivable, BillReceivableFilter)
+    bill_payment = legacy_list_field(BillPayment, BillPaymentFilter)
+    timekeeping_type = legacy_list_field(TimekeepingType, TimekeepingTypeFilter)
+    vat = legacy_list_field(Vat, VatFilter)
+    carrier = legacy_list_field(Carrier, CarrierFilter)
+    addresses = legacy_list_field(Addresses, AddressesFilter)
+    work_activities = legacy_list_field(WorkActivities, WorkActivitiesFilter)
+    work_subactivities = legacy_list_field(WorkSubactivities, WorkSubactivitiesFilter)
+    structure_costs = legacy_list_field(StructureCosts, StructureCostsFilter)
+    cost_concepts = legacy_list_field(CostConcepts, CostConceptsFilter)
+    gofalind = legacy_list_field(Gofalind, GofalindFilter)
+    reason_refusals = legacy_list_field(ReasonRefusals, ReasonRefusalsFilter)
+    work_heads = legacy_list_field(WorkHeads, WorkHeadsFilter)
+    work_lines = legacy_list_field(WorkLines, WorkLinesFilter)
+    work_structures = legacy_list_field(WorkStructures, WorkStructuresFilter)
+    certification_lines = legacy_list_field(CertificationLines, CertificationLinesFilter)
+    certification_structures = legacy_list_field(CertificationStructures, CertificationStructuresFilter)
+    certification_heads = legacy_list_field(CertificationHeads, CertificationHeadsFilter)
+    work_status = legacy_list_field(WorkStatus, WorkStatusFilter)
+    work_taxes = legacy_list_field(WorkTaxes, WorkTaxesFilter)
+    preinvoices = legacy_list_field(Preinvoices, PreinvoicesFilter)
+    preinvoice_lines = legacy_list_field(PreinvoiceLines, PreinvoiceLinesFilter)
+    goobrpim = legacy_list_field(Goobrpim, GoobrpimFilter)
+    work_addresses = legacy_list_field(WorkAddresses, WorkAddressesFilter)
+    library_origins = legacy_list_field(LibraryOrigins, LibraryOriginsFilter)
+    deliveried_part_taxes = legacy_list_field(DeliveriedPartTaxes, DeliveriedPartTaxesFilter)
+    deliveried_parts = legacy_list_field(DeliveriedParts, DeliveriedPartsFilter)
+    deliveried_part_lines = legacy_list_field(DeliveriedPartLines, DeliveriedPartLinesFilter)
+    workingpart_taxes = legacy_list_field(WorkingpartTaxes, WorkingpartTaxesFilter)
+    workingdraft_lines = legacy_list_field(WorkingdraftLines, WorkingdraftLinesFilter)
+    workingpart_breakdowns = legacy_list_field(WorkingpartBreakdowns, WorkingpartBreakdownsFilter)
+    workingpart_hours = legacy_list_field(WorkingpartHours, WorkingpartHoursFilter)
+    workingpart_lines = legacy_list_field(WorkingpartLines, WorkingpartLinesFilter)
+    workingpart_locations = legacy_list_field(WorkingpartLocations, WorkingpartLocationsFilter)
+    workingdraft_heads = legacy_list_field(WorkingdraftHeads, WorkingdraftHeadsFilter)
+    workingparts = legacy_list_field(Workingparts, WorkingpartsFilter)
+    workingpart_template_heads = legacy_list_field(WorkingpartTemplateHeads, WorkingpartTemplateHeadsFilter)
+    workingpart_template_lines = legacy_list_field(WorkingpartTemplateLines, WorkingpartTemplateLinesFilter)
+    gopreimp = legacy_list_field(Gopreimp, GopreimpFilter)
+    budget_heads = legacy_list_field(BudgetHeads, BudgetHeadsFilter)
+    budget_lines = legacy_list_field(BudgetLines, BudgetLinesFilter)
+    budget_structures = legacy_list_field(BudgetStructures, BudgetStructuresFilter)
+    budget_actions = legacy_list_field(BudgetActions, BudgetActionsFilter)
+    budget_addresses = legacy_list_field(BudgetAddresses, BudgetAddressesFilter)
+    type_addresses = legacy_list_field(TypeAddresses, TypeAddressesFilter)
+    work_types = legacy_list_field(WorkTypes, WorkTypesFilter)
+    budget_types = legacy_list_field(BudgetTypes, BudgetTypesFilter)
+    working_types = legacy_list_field(WorkingTypes, WorkingTypesFilter)
+    work_shipments = legacy_list_field(WorkShipments, WorkShipmentsFilter)
+    work_shipment_lines = legacy_list_field(WorkShipmentLines, WorkShipmentLinesFilter)
+    workingparts_hours = legacy_list_field(WorkingpartsHours, WorkingpartsHoursFilter)
+    sales_delivery_note = legacy_list_field(SalesDeliveryNote, SalesDeliveryNoteFilter)
+    branch_delivery_note = legacy_list_field(BranchDeliveryNote, BranchDeliveryNoteFilter)
+    branch_delivery_line = legacy_list_field(BranchDeliveryLine, BranchDeliveryLineFilter)
+    sales_deliverynote_tax = legacy_list_field(SalesDeliverynoteTax, SalesDeliverynoteTaxFilter)
+    sales_document_line = legacy_list_field(SalesDocumentLine, SalesDocumentLineFilter)
+    sales_deliverynote_location = legacy_list_field(SalesDeliverynoteLocation, SalesDeliverynoteLocationFilter)
+    sales_invoice = legacy_list_field(SalesInvoice, SalesInvoiceFilter)
+    sales_invoice_tax = legacy_list_field(SalesInvoiceTax, SalesInvoiceTaxFilter)
+    sales_offer = legacy_list_field(SalesOffer, SalesOfferFilter)
+    sales_offer_tax = legacy_list_field(SalesOfferTax, SalesOfferTaxFilter)
+    sales_offer_line = legacy_list_field(SalesOfferLine, SalesOfferLineFilter)
+    sales_order = legacy_list_field(SalesOrder, SalesOrderFilter)
+    sales_order_tax = legacy_list_field(SalesOrderTax, SalesOrderTaxFilter)
+    sales_order_line = legacy_list_field(SalesOrderLine, SalesOrderLineFilter)
+    protocols = legacy_list_field(Protocols, ProtocolsFilter)
+    packing_unit = legacy_list_field(PackingUnit, PackingUnitFilter)
+    product_packing_unit = legacy_list_field(ProductPackingUnit, ProductPackingUnitFilter)
+    work_ratings = legacy_list_field(WorkRatings, WorkRatingsFilter)
+    pending = legacy_list_field(Pending, PendingFilter)
+    sales_pricing = legacy_list_field(SalesPricing, SalesPricingFilter)
+    hour_types = legacy_list_field(HourTypes, HourTypesFilter)
+    employee_types = legacy_list_field(EmployeeTypes, EmployeeTypesFilter)
+    potential_customer = legacy_list_field(PotentialCustomer, PotentialCustomerFilter)
@@ -1,3 +1,6 @@
-from .models import Customer, Product, Order, OrderItem, Invoice, Notice
+from .models import Customer, Product, Order, OrderItem, Invoice, Notice, CustomerDailySales, CustomerStats, SyncState
 
-__all__ = ["Customer", "Product", "Order", "OrderItem", "Invoice", "Notice"]
\ No newline at end of file
+# Registrar el mantenimiento incremental de las tablas resumen (after_flush)
+from app.core import rollups  # noqa: E402,F401
+
+__all__ = ["Customer", "Product", "Order", "OrderItem", "Invoice", "Notice", "CustomerDailySales", "CustomerStats", "SyncState"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -41,6 +41,11 @@ class Product(Base):
 class Order(Base):
     """Modelo de Pedido"""
     __tablename__ = "orders"
+    __table_args__ = (
+        # Paginación keyset por (created_at, order_id), global y por cliente
+        Index("ix_orders_created_at_order_id", "created_at", "order_id"),
+        Index("ix_orders_customer_id_created_at_order_id", "customer_id", "created_at", "order_id"),
+    )
     
     order_id = Column(Integer, primary_key=True, index=True)
     reference = Column(String(50))
@@ -75,6 +80,9 @@ class OrderItem(Base):
 class Invoice(Base):
     """Modelo de Factura"""
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("ix_invoices_date_invoice_id", "date", "invoice_id"),
+    )
     
     invoice_id = Column(Integer, primary_key=True, index=True)
     reference = Column(String(50))
@@ -93,6 +101,9 @@ class Invoice(Base):
 class Notice(Base):
     """Modelo de Aviso/Notificación"""
     __tablename__ = "notices"
+    __table_args__ = (
+        Index("ix_notices_created_date_notice_id", "created_date", "notice_id"),
+    )
     
     notice_id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, ForeignKey("customers.customer_id"))
@@ -107,4 +118,41 @@ class Notice(Base):
     resolved_date = Column(DateTime(timezone=True))
     
     # Relaciones
-    customer = relationship("Customer")
\ No newline at end of file
+    customer = relationship("Customer")
+
+# Tablas resumen (rollups) mantenidas por app/core/rollups.py
+class CustomerDailySales(Base):
+    """Ventas diarias por cliente y estado del pedido"""
+    __tablename__ = "customer_daily_sales"
+    
+    customer_id = Column(Integer, ForeignKey("customers.customer_id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String(20), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0)
+
+class CustomerStats(Base):
+    """Métricas acumuladas de un cliente (una fila por cliente)"""
+    __tablename__ = "customer_stats"
+    
+    customer_id = Column(Integer, ForeignKey("customers.customer_id"), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    order_total = Column(Float, nullable=False, default=0)
+    open_invoice_count = Column(Integer, nullable=False, default=0)
+    open_invoice_balance = Column(Float, nullable=False, default=0)
+    overdue_invoice_count = Column(Integer, nullable=False, default=0)  # exacto tras cada reconciliación
+    reconciled_at = Column(DateTime(timezone=True))
+
+class SyncState(Base):
+    """Estado de la sincronización incremental de una entidad de GoManage"""
+    __tablename__ = "sync_state"
+    
+    entity = Column(String(30), primary_key=True)
+    high_water_mark = Column(DateTime(timezone=True))   # mayor modified_at ya sincronizado
+    synced_at = Column(DateTime(timezone=True))         # inicio de la última sincronización completa
+    last_rows = Column(Integer, nullable=False, default=0)
+    last_pages = Column(Integer, nullable=False, default=0)
+    last_duration = Column(Float, nullable=False, default=0)  # segundos
+    total_rows = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    last_error_at = Column(DateTime(timezone=True))
@@ -0,0 +1,92 @@
+"""
+Repositorios de las entidades del schema GraphQL
+
+Los resolvers y los DataLoaders piden los datos a get_repository(entidad) y
+no saben de qué fuente vienen. DATA_SOURCES elige la fuente de cada entidad
+(``customers=gomanage,products=gomanage``); por defecto todas se leen de SQL
+(la copia local que mantiene sync_gomanage.py). Sólo las entidades que se
+sincronizan con GoManage (app.core.sync.ENTITIES) pueden leerse de la API.
+"""
+
+from typing import Dict, Optional
+from app.core.config import settings
+from app.core.gomanage import GoManageClient
+from app.core.sync import ENTITIES as GOMANAGE_ENTITIES
+from app.models.models import Customer, Invoice, Notice, Order, Product
+from app.repositories.base import Condition, Entity, Repository, contains, eq, gte, in_, sort_columns
+from app.repositories.gomanage import GoManageRepository
+from app.repositories.sql import SqlRepository, apply_conditions, load_columns
+
+ENTITIES = {
+    entity.name: entity
+    for entity in (
+        Entity("customers", Customer),
+        Entity("products", Product),
+        Entity("orders", Order),
+        Entity("invoices", Invoice),
+        Entity("notices", Notice),
+    )
+}
+
+SOURCES = ("sql", "gomanage")
+
+_repositories: Dict[str, Repository] = {}
+_client: Optional[GoManageClient] = None
+
+
+def parse_sources(value: str) -> Dict[str, str]:
+    """Fuente de cada entidad a partir de DATA_SOURCES ("entidad=fuente,...")"""
+    sources = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, source = item.partition("=")
+        name, source = name.strip(), source.strip()
+        if name not in ENTITIES:
+            raise ValueError(f"DATA_SOURCES: entidad desconocida {name!r}")
+        if source not in SOURCES:
+            raise ValueError(f"DATA_SOURCES: fuente desconocida {source!r} (válidas: {', '.join(SOURCES)})")
+        if source == "gomanage" and name not in GOMANAGE_ENTITIES:
+            raise ValueError(f"DATA_SOURCES: {name} no se puede leer de GoManage")
+        sources[name] = source
+    return sources
+
+
+def create_repository(name: str, source: str = "sql", client: Optional[GoManageClient] = None) -> Repository:
+    """Repositorio nuevo de una entidad para la fuente indicada"""
+    entity = ENTITIES[name]
+    if source == "gomanage":
+        return GoManageRepository(entity, client or GoManageClient(), GOMANAGE_ENTITIES[name].path)
+    return SqlRepository(entity)
+
+
+def get_repository(name: str) -> Repository:
+    """Repositorio de la entidad con la fuente configurada (uno por proceso)"""
+    repository = _repositories.get(name)
+    if repository is None:
+        global _client
+        source = parse_sources(settings.data_sources).get(name, "sql")
+        if source == "gomanage" and _client is None:
+            # Un único cliente (y pool de conexiones) para todas las entidades
+            _client = GoManageClient()
+        repository = _repositories[name] = create_repository(name, source, _client)
+    return repository
+
+
+def set_repository(repository: Repository):
+    """Sustituir el repositorio de una entidad (tests y benchmarks)"""
+    _repositories[repository.entity.name] = repository
+
+
+async def close_repositories():
+    """Cerrar el cliente de GoManage y olvidar los repositorios (al parar la aplicación)"""
+    global _client
+    _repositories.clear()
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+__all__ = [
+    "Condition", "Entity", "Repository", "SqlRepository", "GoManageRepository", "ENTITIES",
+    "apply_conditions", "load_columns", "contains", "eq", "gte", "in_", "sort_columns",
+    "create_repository", "get_repository", "set_repository", "close_repositories",
+]
@@ -0,0 +1,127 @@
+"""
+Interfaz común de los repositorios
+
+Un repositorio sirve una entidad (clientes, productos, ...) desde una fuente
+de datos. Los resolvers describen lo que quieren con condiciones y órdenes
+declarativos y cada implementación los traduce a su fuente (WHERE, ORDER BY
+y LIMIT en SQL; parámetros de consulta en la API de GoManage), de modo que el
+filtrado, la paginación y los lotes de los DataLoaders se escriben una vez y
+se ejecutan en la fuente en lugar de en Python.
+
+Los resultados son objetos de sólo lectura con los atributos del modelo
+SQLAlchemy de la entidad: filas de row_class en SQL (app/core/rows.py) e
+instancias transitorias del modelo si vienen de la API. Los tipos GraphQL,
+el cache de resultados y los cursores no dependen de la fuente. Con columns sólo se
+cargan esas columnas (las que pide la consulta GraphQL, ver
+app/schemas/selection.py); None las carga todas.
+"""
+
+import abc
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Operadores de Condition
+EQ = "eq"          # igual a value
+IN = "in"          # en la lista value
+GTE = "gte"        # mayor o igual que value
+SEARCH = "search"  # value contenido en alguno de los campos, sin tildes ni mayúsculas
+
+
+class Condition(NamedTuple):
+    """Filtro declarativo sobre uno o varios campos del modelo"""
+    op: str
+    fields: Tuple[str, ...]
+    value: Any
+
+
+def eq(field: str, value) -> Condition:
+    return Condition(EQ, (field,), value)
+
+
+def in_(field: str, values) -> Condition:
+    return Condition(IN, (field,), list(values))
+
+
+def gte(field: str, value) -> Condition:
+    return Condition(GTE, (field,), value)
+
+
+def contains(fields: Sequence[str], text: str) -> Condition:
+    return Condition(SEARCH, tuple(fields), text)
+
+
+class Entity(NamedTuple):
+    """Entidad servida por un repositorio"""
+    name: str
+    model: type
+
+    @property
+    def key(self) -> str:
+        return self.model.__table__.primary_key.columns[0].name
+
+
+def sort_columns(model, sort: Sequence[str]):
+    """Columnas de una ordenación ("campo" o "-campo") y si es descendente
+
+    La paginación keyset necesita que todas las columnas vayan en el mismo
+    sentido.
+    """
+    descending = {field.startswith("-") for field in sort}
+    if len(descending) != 1:
+        raise ValueError(f"Ordenación keyset con sentidos mezclados: {sort}")
+    return [getattr(model, field.lstrip("-")) for field in sort], descending.pop()
+
+
+class Repository(abc.ABC):
+    """Acceso de lectura a una entidad
+
+    Las implementaciones definen list() y page() (abstractos: una que no los
+    defina falla al instanciarse, no en la primera consulta); las búsquedas
+    por clave y por clave foránea (las de los DataLoaders) se construyen
+    sobre list() con una condición IN, así que también son una única
+    petición por lote.
+    """
+
+    source = None
+
+    def __init__(self, entity: Entity):
+        self.entity = entity
+        self.model = entity.model
+
+    @abc.abstractmethod
+    async def list(self, conditions: Iterable[Condition] = (), sort: Sequence[str] = (),
+                   limit: Optional[int] = None, columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """Filas que cumplen conditions, en el orden sort y como mucho limit"""
+
+    @abc.abstractmethod
+    async def page(self, conditions: Iterable[Condition], sort: Sequence[str], first: int,
+                   after: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Tuple[List[Any], bool]:
+        """Página keyset de first filas tras el cursor after y si hay más
+
+        Las columnas de sort se cargan siempre (forman el cursor).
+        """
+
+    def with_columns(self, columns, *required):
+        """columns más las imprescindibles (clave primaria y required)"""
+        if columns is None:
+            return None
+        names = [self.entity.key, *columns]
+        names.extend(name.lstrip("-") for name in required)
+        return list(dict.fromkeys(names))
+
+    async def get_many(self, keys, columns: Optional[Sequence[str]] = None) -> Dict[Any, Any]:
+        """Filas por clave primaria (las que no existen no aparecen)"""
+        key = self.entity.key
+        rows = await self.list([in_(key, keys)], columns=columns)
+        return {getattr(row, key): row for row in rows}
+
+    async def get(self, key, columns: Optional[Sequence[str]] = None):
+        return (await self.get_many([key], columns)).get(key)
+
+    async def group_by(self, field: str, keys, sort: Sequence[str] = (),
+                       columns: Optional[Sequence[str]] = None) -> Dict[Any, List[Any]]:
+        """Filas cuyo field está en keys, agrupadas por field (relaciones uno-a-muchos)"""
+        grouped = defaultdict(list)
+        for row in await self.list([in_(field, keys)], sort, columns=self.with_columns(columns, field)):
+            grouped[getattr(row, field)].append(row)
+        return grouped
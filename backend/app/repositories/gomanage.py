@@ -0,0 +1,89 @@
+"""
+Repositorio de la API de GoManage: las condiciones se traducen a parámetros
+
+Para leer en directo de GoManage en lugar de la copia local (DATA_SOURCES,
+ver app/repositories/__init__.py). Cada condición se envía a la API, que
+filtra, ordena y pagina (contrato en app/core/gomanage.py); aquí sólo se
+convierten los registros a instancias transitorias del modelo.
+"""
+
+import json
+from datetime import date, datetime
+from app.core.config import settings
+from app.core.sync import MODIFIED_FIELD, parse_timestamp, to_row
+from app.repositories.base import EQ, GTE, IN, SEARCH, Repository, sort_columns
+from app.schemas.pagination import MAX_PAGE_SIZE, decode_cursor
+
+
+def format_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def query_params(conditions, sort=(), columns=None):
+    """Parámetros de la API para conditions, sort y las columnas a devolver"""
+    params = {}
+    for condition in conditions:
+        field = condition.fields[0]
+        if condition.op == EQ:
+            params[field] = format_value(condition.value)
+        elif condition.op == IN:
+            params[f"{field}_in"] = ",".join(format_value(value) for value in condition.value)
+        elif condition.op == GTE:
+            params[f"{field}_gte"] = format_value(condition.value)
+        elif condition.op == SEARCH:
+            # GoManage busca en sus propios campos de texto
+            params["search"] = condition.value
+        else:
+            raise ValueError(f"Operador desconocido: {condition.op}")
+    if sort:
+        params["sort"] = ",".join(sort)
+    if columns is not None:
+        params["fields"] = ",".join(columns)
+    return params
+
+
+class GoManageRepository(Repository):
+    """Entidad leída de la API de GoManage con un GoManageClient compartido"""
+
+    source = "gomanage"
+
+    def __init__(self, entity, client, path: str):
+        super().__init__(entity)
+        self.client = client
+        self.path = path
+
+    def to_model(self, item):
+        table = self.model.__table__
+        return self.model(**to_row(table, item, parse_timestamp(item.get(MODIFIED_FIELD))))
+
+    async def list(self, conditions=(), sort=(), limit=None, columns=None):
+        params = query_params(conditions, sort, self.with_columns(columns))
+        page_size = min(limit or settings.sync_page_size, settings.sync_page_size)
+        rows = []
+        page = 1
+        while True:
+            data = await self.client.get(self.path, dict(params, page=page, page_size=page_size))
+            rows.extend(self.to_model(item) for item in data["items"])
+            if page >= (data.get("pages") or 1) or (limit is not None and len(rows) >= limit):
+                break
+            page += 1
+        return rows if limit is None else rows[:limit]
+
+    async def page(self, conditions, sort, first, after=None, columns=None):
+        first = max(0, min(first, MAX_PAGE_SIZE))
+        params = query_params(conditions, sort, self.with_columns(columns, *sort))
+        params.update(page=1, page_size=first + 1)
+        if after:
+            # Keyset: la API devuelve las filas posteriores a estos valores de sort
+            columns, _ = sort_columns(self.model, sort)
+            params["after"] = json.dumps([
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in decode_cursor(after, columns)
+            ])
+        data = await self.client.get(self.path, params)
+        rows = [self.to_model(item) for item in data["items"]]
+        return rows[:first], len(rows) > first
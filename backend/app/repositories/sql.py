@@ -0,0 +1,77 @@
+"""
+Repositorio SQL: las condiciones se traducen a WHERE sobre el modelo
+
+Es la fuente por defecto de todas las entidades (clientes, productos y
+facturas están en las tablas locales gracias a la sincronización con
+GoManage, ver app/core/sync.py). Las lecturas son select() de Core sobre
+las columnas pedidas y devuelven filas de sólo lectura (app/core/rows.py),
+no instancias del ORM.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+from app.core.database import run_session
+from app.core.rows import model_columns, row_class
+from app.repositories.base import EQ, GTE, IN, SEARCH, Repository, sort_columns
+from app.schemas.pagination import keyset, page_size, sort_order
+from app.schemas.search import contains_any
+
+
+def apply_conditions(query, model, conditions):
+    """Añadir a query (Query del ORM o select()) el WHERE de cada condición"""
+    for condition in conditions:
+        columns = [getattr(model, field) for field in condition.fields]
+        if condition.op == EQ:
+            query = query.filter(columns[0] == condition.value)
+        elif condition.op == IN:
+            query = query.filter(columns[0].in_(condition.value))
+        elif condition.op == GTE:
+            query = query.filter(columns[0] >= condition.value)
+        elif condition.op == SEARCH:
+            # Sin distinguir tildes: "sune" encuentra "SUÑE" (índices de trigramas en PostgreSQL)
+            query = query.filter(contains_any(columns, condition.value))
+        else:
+            raise ValueError(f"Operador desconocido: {condition.op}")
+    return query
+
+
+def load_columns(query, model, columns):
+    """Cargar sólo columns (nombres de atributo) en las instancias de una Query del ORM"""
+    if columns is None:
+        return query
+    return query.options(load_only(*[getattr(model, name) for name in columns]))
+
+
+class SqlRepository(Repository):
+    """Entidad leída de su tabla con las sesiones de run_session"""
+
+    source = "sql"
+
+    def select(self, conditions, columns=None):
+        """select() de las columnas pedidas y la clase de fila que las recibe"""
+        columns = tuple(self.with_columns(columns) or model_columns(self.model))
+        statement = select(*[getattr(self.model, name) for name in columns])
+        return apply_conditions(statement, self.model, conditions), row_class(self.model, columns)
+
+    @staticmethod
+    def fetch(session, statement, row):
+        return [row._make(values) for values in session.execute(statement)]
+
+    async def list(self, conditions=(), sort=(), limit=None, columns=None):
+        statement, row = self.select(conditions, columns)
+        if sort:
+            # Mismo orden que las conexiones keyset (NULL como el mayor valor)
+            statement = statement.order_by(*[
+                sort_order([getattr(self.model, field.lstrip("-"))], field.startswith("-"))[0] for field in sort
+            ])
+        if limit is not None:
+            statement = statement.limit(limit)
+        return await run_session(lambda session: self.fetch(session, statement, row))
+
+    async def page(self, conditions, sort, first, after=None, columns=None):
+        first = page_size(first)
+        sort_by, descending = sort_columns(self.model, sort)
+        statement, row = self.select(conditions, self.with_columns(columns, *sort))
+        statement = keyset(statement, sort_by, first, after, descending)
+        rows = await run_session(lambda session: self.fetch(session, statement, row))
+        return rows[:first], len(rows) > first
@@ -1,3 +1,9 @@
-from .graphql_schema import schema
+# El schema se construye en el primer acceso (ver graphql_schema.get_schema)
 
-__all__ = ["schema"]
\ No newline at end of file
+def __getattr__(name):
+    if name == "schema":
+        from .graphql_schema import get_schema
+        return get_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ["schema"]
@@ -0,0 +1,130 @@
+"""
+Política de cache HTTP de una consulta GraphQL
+
+Se recorre la selección de la operación y se anotan las entidades que toca
+cada tipo de objeto devuelto (Customer -> customers, StatsBucket -> orders,
+...). La respuesta completa se puede cachear durante el menor TTL de esas
+entidades (los cache_ttl_* de Settings; los agregados además caducan con
+cache_ttl_stats) y se etiqueta con ``entity:<nombre>``, las mismas etiquetas
+que invalidan las mutaciones y la sincronización con GoManage.
+
+Las consultas que no tocan ninguna entidad o que devuelven tipos sin
+política (cacheStats, poolStats, tablas heredadas) no se cachean.
+"""
+
+from typing import NamedTuple, Optional, Set, Tuple
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationType,
+    get_named_type,
+    is_interface_type,
+    is_object_type,
+)
+from graphql.utilities import get_operation_ast
+from app.core.config import settings
+
+# Atributo de Settings con el TTL de cada entidad
+ENTITY_TTLS = {
+    "customers": "cache_ttl_customers",
+    "products": "cache_ttl_products",
+    "orders": "cache_ttl_orders",
+    "invoices": "cache_ttl_invoices",
+    "notices": "cache_ttl_notices",
+}
+
+# Entidades de las que dependen los objetos de cada tipo
+TYPE_ENTITIES = {
+    "Customer": ("customers",),
+    "Product": ("products",),
+    "Order": ("orders",),
+    "OrderItem": ("orders",),
+    "Invoice": ("invoices",),
+    "Notice": ("notices",),
+    "CustomerStats": ("orders", "invoices"),
+    "StatsBucket": ("orders",),
+    "InvoiceStatsBucket": ("invoices",),
+}
+
+# Agregados: caducan también con cache_ttl_stats
+AGGREGATE_TYPES = {"CustomerStats", "StatsBucket", "InvoiceStatsBucket"}
+
+
+class CachePolicy(NamedTuple):
+    """Caducidad (segundos) y etiquetas de invalidación de una respuesta"""
+    max_age: int
+    tags: Tuple[str, ...]
+
+
+def is_structural(type_name: str) -> bool:
+    """Tipos que sólo envuelven a otros (conexiones Relay e introspección)"""
+    return type_name.endswith(("Connection", "Edge")) or type_name == "PageInfo" or type_name.startswith("__")
+
+
+class EntityCollector:
+    """Recorre la selección de una operación anotando los tipos de objeto devueltos"""
+
+    def __init__(self, schema, fragments):
+        self.schema = schema
+        self.fragments = fragments
+        self.types: Set[str] = set()
+        self.visited: Set[str] = set()
+
+    def selection_set(self, selection_set, parent_type):
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self.field(selection, parent_type)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is not None and name not in self.visited:
+                    self.visited.add(name)
+                    self.selection_set(fragment.selection_set, self.schema.get_type(fragment.type_condition.name.value))
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                self.selection_set(selection.selection_set, fragment_type)
+
+    def field(self, node, parent_type):
+        field_def = getattr(parent_type, "fields", {}).get(node.name.value)
+        if field_def is None:
+            return
+        named = get_named_type(field_def.type)
+        if is_object_type(named) or is_interface_type(named):
+            self.types.add(named.name)
+            if node.selection_set is not None:
+                self.selection_set(node.selection_set, named)
+
+
+def cache_policy(schema, document, operation_name: Optional[str] = None) -> Optional[CachePolicy]:
+    """Política de la operation_name de document, o None si no se puede cachear"""
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.QUERY:
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    collector = EntityCollector(schema, fragments)
+    collector.selection_set(operation.selection_set, schema.query_type)
+
+    entities = set()
+    ttls = []
+    for type_name in collector.types:
+        if is_structural(type_name):
+            continue
+        if type_name not in TYPE_ENTITIES:
+            return None
+        entities.update(TYPE_ENTITIES[type_name])
+        if type_name in AGGREGATE_TYPES:
+            ttls.append(settings.cache_ttl_stats)
+    if not entities:
+        return None
+
+    ttls.extend(getattr(settings, ENTITY_TTLS[entity]) for entity in entities)
+    return CachePolicy(max_age=min(ttls), tags=tuple(sorted(f"entity:{entity}" for entity in entities)))
@@ -0,0 +1,141 @@
+"""
+Análisis estático del coste de una consulta GraphQL
+
+Antes de ejecutar una operación se recorre su AST y se estima cuántos objetos
+va a cargar: cada campo que devuelve un objeto cuesta su peso multiplicado por
+el número de veces que se resuelve, y las listas multiplican a sus hijos por
+su tamaño (el argumento ``limit``/``first`` o DEFAULT_LIST_SIZE si la lista
+no tiene límite, como las relaciones de Customer). La profundidad es el número
+de niveles de campos anidados. Los campos de introspección no cuentan.
+"""
+
+from typing import Any, Dict, NamedTuple, Optional
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+    is_object_type,
+    is_interface_type,
+)
+from graphql.execution.values import get_argument_values
+from graphql.utilities import get_operation_ast
+from app.core.config import settings
+
+# Argumentos que fijan el tamaño de una lista (o de la página de una conexión)
+SIZE_ARGUMENTS = ("limit", "first")
+
+# Peso de los campos más caros que un objeto normal (Tipo.campo -> peso)
+FIELD_WEIGHTS = {
+    "Query.cacheStats": 5,
+    "Query.poolStats": 5,
+    "Mutations.createCustomer": 10,
+    "Mutations.createOrder": 10,
+    "Mutations.createOrders": 10,
+}
+
+
+class QueryCost(NamedTuple):
+    """Resultado del análisis de una operación"""
+    cost: int
+    depth: int
+
+
+class CostAnalyzer:
+    """Recorre la selección de una operación acumulando coste y profundidad"""
+
+    def __init__(self, schema, fragments, variable_values, default_list_size):
+        self.schema = schema
+        self.fragments = fragments
+        self.variable_values = variable_values
+        self.default_list_size = default_list_size
+
+    def selection_set(self, selection_set, parent_type, multiplier, page_size):
+        """Devolver (coste, profundidad) de una selección"""
+        cost = depth = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field_cost, field_depth = self.field(selection, parent_type, multiplier, page_size)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                field_cost, field_depth = self.selection_set(
+                    fragment.selection_set, self.schema.get_type(fragment.type_condition.name.value), multiplier, page_size
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                field_cost, field_depth = self.selection_set(selection.selection_set, fragment_type, multiplier, page_size)
+            else:
+                continue
+            cost += field_cost
+            depth = max(depth, field_depth)
+        return cost, depth
+
+    def field(self, node, parent_type, multiplier, page_size):
+        name = node.name.value
+        if name.startswith("__") or not (is_object_type(parent_type) or is_interface_type(parent_type)):
+            return 0, 0
+        field_def = parent_type.fields.get(name)
+        if field_def is None:
+            return 0, 0
+
+        size = self.size_argument(field_def, node)
+        return_type = get_nullable_type(field_def.type)
+        if is_list_type(return_type):
+            # Una lista sin límite propio hereda el tamaño de página de su conexión (edges)
+            count = size or page_size or self.default_list_size
+            page_size = None
+        else:
+            count = 1
+            page_size = size
+
+        named_type = get_named_type(return_type)
+        if not (is_object_type(named_type) or is_interface_type(named_type)):
+            return 0, 1
+
+        resolved = multiplier * count
+        weight = FIELD_WEIGHTS.get(f"{parent_type.name}.{name}", 1)
+        cost, depth = (0, 0)
+        if node.selection_set is not None:
+            cost, depth = self.selection_set(node.selection_set, named_type, resolved, page_size)
+        return weight * resolved + cost, depth + 1
+
+    def size_argument(self, field_def, node) -> Optional[int]:
+        try:
+            arguments = get_argument_values(field_def, node, self.variable_values)
+        except GraphQLError:
+            return None
+        for name in SIZE_ARGUMENTS:
+            value = arguments.get(name)
+            if isinstance(value, int):
+                return max(value, 0)
+        return None
+
+
+def analyze_query(schema, document, variable_values: Optional[Dict[str, Any]] = None,
+                  operation_name: Optional[str] = None) -> Optional[QueryCost]:
+    """Calcular el coste y la profundidad de la operación que se va a ejecutar
+
+    Devuelve None si el documento no identifica una única operación (la
+    ejecución ya devuelve ese error).
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return None
+    root_type = schema.get_root_type(operation.operation)
+    if root_type is None:
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    analyzer = CostAnalyzer(schema, fragments, variable_values or {}, settings.graphql_default_list_size)
+    cost, depth = analyzer.selection_set(operation.selection_set, root_type, 1, None)
+    return QueryCost(cost=cost, depth=depth)
@@ -1,41 +1,134 @@
+import asyncio
 import graphene
 import time
-from graphene import ObjectType, String, Int, Float, List, Field, Boolean, DateTime
+from functools import lru_cache
+from typing import Optional
+from graphene import ObjectType, String, Int, Float, List, Field, Boolean, DateTime, NonNull
 from graphene_sqlalchemy import SQLAlchemyObjectType
-from sqlalchemy.orm import sessionmaker
-from app.core.database import engine
-from app.models.models import Customer as CustomerModel, Product as ProductModel, Order as OrderModel, Invoice as InvoiceModel, Notice as NoticeModel
+from graphql import GraphQLError
+from app.core.cache import dump_rows, load_rows
+from app.core.config import settings
+from app.core.database import run_session, get_pool_stats
+from app.core.rows import row_model
+from app.models.models import Customer as CustomerModel, Product as ProductModel, Order as OrderModel, OrderItem as OrderItemModel, Invoice as InvoiceModel, Notice as NoticeModel, CustomerStats as CustomerStatsModel
+from app.repositories import apply_conditions, contains, eq, get_repository, gte, load_columns, sort_columns
+from app.schemas.loaders import projected_loader
+from app.schemas.order_batch import OrderOutcome, create_orders
+from app.schemas.pagination import build_connection
+from app.schemas.selection import selected_columns
+from app.schemas.search import ranked_search, typeahead
+from app.schemas.stats import invoice_stats, merge_buckets, order_stats, parse_date, split_range, utcnow
 import logging
 
 logger = logging.getLogger(__name__)
-Session = sessionmaker(bind=engine)
 
 # Tipos GraphQL basados en SQLAlchemy
-class Customer(SQLAlchemyObjectType):
+# Las relaciones se resuelven con los DataLoaders de la petición (ver loaders.py)
+class ModelType(SQLAlchemyObjectType):
+    """Tipo de un modelo que acepta también sus filas de sólo lectura (app/core/rows.py)"""
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def is_type_of(cls, root, info):
+        if row_model(root) is cls._meta.model:
+            return True
+        return super().is_type_of(root, info)
+
+class CustomerStats(ModelType):
+    """Métricas acumuladas del cliente (tabla resumen, ver app/core/rollups.py)"""
+    class Meta:
+        model = CustomerStatsModel
+        load_instance = True
+
+class Customer(ModelType):
     class Meta:
         model = CustomerModel
         load_instance = True
 
-class Product(SQLAlchemyObjectType):
+    stats = Field(CustomerStats)
+
+    async def resolve_stats(self, info):
+        stats = await projected_loader(info, 'stats_by_customer').load(self.customer_id)
+        if stats is None:
+            # Cliente sin pedidos ni facturas desde la última reconciliación
+            return CustomerStatsModel(customer_id=self.customer_id, order_count=0, order_total=0.0,
+                                      open_invoice_count=0, open_invoice_balance=0.0, overdue_invoice_count=0)
+        return stats
+
+    def resolve_orders(self, info):
+        return projected_loader(info, 'orders_by_customer').load(self.customer_id)
+
+    def resolve_invoices(self, info):
+        return projected_loader(info, 'invoices_by_customer').load(self.customer_id)
+
+class Product(ModelType):
     class Meta:
         model = ProductModel
         load_instance = True
 
-class Order(SQLAlchemyObjectType):
+class Order(ModelType):
     class Meta:
         model = OrderModel
         load_instance = True
 
-class Invoice(SQLAlchemyObjectType):
+    def resolve_customer(self, info):
+        if self.customer_id is None:
+            return None
+        return projected_loader(info, 'customer_by_id').load(self.customer_id)
+
+    def resolve_order_items(self, info):
+        return projected_loader(info, 'order_items_by_order').load(self.order_id)
+
+class OrderItem(ModelType):
+    class Meta:
+        model = OrderItemModel
+        load_instance = True
+
+    def resolve_order(self, info):
+        if self.order_id is None:
+            return None
+        return projected_loader(info, 'order_by_id').load(self.order_id)
+
+    def resolve_product(self, info):
+        if self.product_id is None:
+            return None
+        return projected_loader(info, 'product_by_id').load(self.product_id)
+
+class Invoice(ModelType):
     class Meta:
         model = InvoiceModel
         load_instance = True
 
-class Notice(SQLAlchemyObjectType):
+    def resolve_customer(self, info):
+        if self.customer_id is None:
+            return None
+        return projected_loader(info, 'customer_by_id').load(self.customer_id)
+
+class Notice(ModelType):
     class Meta:
         model = NoticeModel
         load_instance = True
 
+    def resolve_customer(self, info):
+        if self.customer_id is None:
+            return None
+        return projected_loader(info, 'customer_by_id').load(self.customer_id)
+
+class CacheTierStats(ObjectType):
+    """Contadores de un nivel del cache (L1 en memoria, L2 Redis)"""
+    hits = Int()
+    misses = Int()
+    evictions = Int()
+    size = Int()
+    max_items = Int()
+
+class CircuitBreakerStats(ObjectType):
+    """Estado del circuit breaker de Redis"""
+    state = String()
+    failures = Int()
+    times_opened = Int()
+
 class CacheStats(ObjectType):
     """Estadísticas del cache"""
     type = String()
@@ -44,6 +137,183 @@ class CacheStats(ObjectType):
     memory_usage = String()
     uptime = String()
     error = String()
+    l1 = Field(CacheTierStats)
+    l2 = Field(CacheTierStats)
+    circuit_breaker = Field(CircuitBreakerStats)
+
+class PoolLatencyBucket(ObjectType):
+    """Bucket acumulado del histograma de latencia de checkout"""
+    le = String()
+    count = Int()
+
+class PoolStats(ObjectType):
+    """Estadísticas de un pool de conexiones"""
+    engine = String()
+    pool_class = String()
+    pool_size = Int()
+    checked_out = Int()
+    checked_in = Int()
+    overflow = Int()
+    waiting = Int()
+    max_waiting = Int()
+    checkouts = Int()
+    timeouts = Int()
+    checkout_latency_avg_ms = Float()
+    checkout_latency_ms = List(PoolLatencyBucket)
+
+# Agregados para dashboards (ver stats.py)
+class OrderGroupBy(graphene.Enum):
+    """Claves de agrupación de orderStats"""
+    STATUS = "status"
+    CUSTOMER = "customer_id"
+    MONTH = "month"
+
+class InvoiceGroupBy(graphene.Enum):
+    """Claves de agrupación de invoiceStats"""
+    STATUS = "status"
+    CUSTOMER = "customer_id"
+    MONTH = "month"
+    DUE_BUCKET = "due_bucket"
+
+class StatsBucket(ObjectType):
+    """Un grupo del GROUP BY; las claves no agrupadas son null"""
+    status = String()
+    customer_id = Int()
+    month = String(description="Mes YYYY-MM")
+    count = Int()
+    total_amount = Float()
+    average_amount = Float()
+    min_amount = Float()
+    max_amount = Float()
+
+class InvoiceStatsBucket(StatsBucket):
+    due_bucket = String(description="Vencimiento: none, current, 1-30, 31-60, 61-90 o 90+ días")
+
+async def cached_stats(info, prefix, tags, group_by, date_from, date_to, fetch):
+    """Resolver un agregado con cache por tramo de fechas (invalidado por tags)
+
+    Cada mes cerrado se guarda en su propia clave (prefix:tramo); los que
+    faltan y los tramos abiertos se calculan juntos con fetch(session, ranges).
+    """
+    cache_manager = info.context.get('cache_manager')
+    closed, live = split_range(date_from, date_to)
+    cached = [None] * len(closed)
+    if cache_manager:
+        cached = await asyncio.gather(*[cache_manager.get(f"{prefix}:{date_range.key}", tags=tags) for date_range in closed])
+    missing = [date_range for date_range, buckets in zip(closed, cached) if buckets is None]
+    computed = await run_session(lambda session: fetch(session, missing + live)) if missing or live else []
+
+    if cache_manager and missing:
+        await asyncio.gather(*[
+            cache_manager.set(f"{prefix}:{date_range.key}", buckets, ttl=settings.cache_ttl_stats, tags=tags)
+            for date_range, buckets in zip(missing, computed)
+        ])
+    return merge_buckets([buckets for buckets in cached if buckets is not None] + computed, group_by)
+
+def group_keys(group_by):
+    # Los enums llegan como miembros o como valores según el origen del argumento
+    return [getattr(key, "value", key) for key in group_by or []]
+
+# Conexiones Relay (paginación por cursor)
+class CustomerConnection(graphene.relay.Connection):
+    class Meta:
+        node = Customer
+
+class ProductConnection(graphene.relay.Connection):
+    class Meta:
+        node = Product
+
+class OrderConnection(graphene.relay.Connection):
+    class Meta:
+        node = Order
+
+class InvoiceConnection(graphene.relay.Connection):
+    class Meta:
+        node = Invoice
+
+class NoticeConnection(graphene.relay.Connection):
+    class Meta:
+        node = Notice
+
+# Ordenación de listas y conexiones keyset (respaldada por los índices de
+# models.py, con la clave primaria para desempatar); "-" es descendente
+CUSTOMER_SORT = ["customer_id"]
+PRODUCT_SORT = ["product_id"]
+ORDER_SORT = ["-created_at", "-order_id"]
+INVOICE_SORT = ["-date", "-invoice_id"]
+NOTICE_SORT = ["-created_date", "-notice_id"]
+
+# Columnas de búsqueda, de más a menos relevante (ver search.py)
+CUSTOMER_SEARCH = [CustomerModel.business_name, CustomerModel.name, CustomerModel.vat_number, CustomerModel.email]
+PRODUCT_SEARCH = [ProductModel.reference, ProductModel.description]
+
+# Filtros compartidos por las listas, las conexiones y todas las fuentes de
+# datos: cada repositorio los traduce a su consulta (ver app/repositories)
+def customer_filters(search=None):
+    # Sin distinguir tildes: "sune" encuentra "SUÑE"
+    return [contains(["business_name", "vat_number", "email"], search)] if search else []
+
+def product_filters(search=None):
+    conditions = [eq("active", True)]
+    if search:
+        conditions.append(contains(["reference", "description"], search))
+    return conditions
+
+def order_filters(customer_id=None, status=None):
+    conditions = []
+    if customer_id:
+        conditions.append(eq("customer_id", customer_id))
+    if status:
+        conditions.append(eq("status", status))
+    return conditions
+
+def invoice_filters(from_date=None):
+    return [gte("date", from_date)] if from_date else []
+
+def notice_filters(status=None, priority=None):
+    conditions = []
+    if status:
+        conditions.append(eq("status", status))
+    if priority:
+        conditions.append(eq("priority", priority))
+    return conditions
+
+def filter_products(query, search=None):
+    """Productos activos (y que contienen search) sobre una consulta SQL"""
+    return apply_conditions(query, ProductModel, product_filters(search))
+
+async def cached_list(info, model, cache_key, ttl, tags, fetch):
+    """Resolver una lista con cache de resultados tipado
+
+    fetch(columns) es una corrutina que lee del repositorio de la entidad
+    sólo las columnas seleccionadas. Se guardan esas columnas (una variante
+    por selección de campos bajo la misma clave) y en un acierto no se
+    ejecuta ninguna consulta. Las mutaciones invalidan la entrada a través de
+    sus etiquetas (tags) y get_or_compute evita que varias peticiones
+    recalculen a la vez.
+    """
+    cache_manager = info.context.get('cache_manager')
+    columns = selected_columns(info, model)
+    
+    async def compute():
+        rows = await fetch(columns)
+        logger.info(f"💾 {cache_key}: {len(rows)} filas calculadas")
+        return dump_rows(rows, columns)
+    
+    if not cache_manager:
+        return await fetch(columns)
+    
+    payload = await cache_manager.get_or_compute(
+        cache_key, compute, ttl=ttl, variant=",".join(columns), tags=tags
+    )
+    return load_rows(model, payload)
+
+async def connection(info, connection_type, entity, conditions, sort, first, after):
+    """Resolver una conexión Relay con la paginación keyset del repositorio"""
+    repository = get_repository(entity)
+    columns = selected_columns(info, repository.model, ("edges", "node"))
+    rows, has_next = await repository.page(conditions, sort, first, after, columns)
+    return build_connection(connection_type, rows, sort_columns(repository.model, sort)[0], has_next, after)
 
 # Queries principales
 class Query(ObjectType):
@@ -52,217 +322,263 @@ class Query(ObjectType):
     # Clientes
     customers = List(Customer, limit=Int(default_value=100), search=String())
     customer = Field(Customer, customer_id=Int(required=True))
+    customers_connection = Field(CustomerConnection, first=Int(default_value=100), after=String(), search=String())
+    
+    # Búsqueda por relevancia y autocompletado
+    search_customers = List(Customer, text=String(required=True), limit=Int(default_value=20))
+    search_products = List(Product, text=String(required=True), limit=Int(default_value=20))
+    customer_typeahead = List(Customer, prefix=String(required=True), limit=Int(default_value=10))
+    product_typeahead = List(Product, prefix=String(required=True), limit=Int(default_value=10))
     
     # Productos
     products = List(Product, limit=Int(default_value=100), search=String())
     product = Field(Product, product_id=String(required=True))
+    products_connection = Field(ProductConnection, first=Int(default_value=100), after=String(), search=String())
     
     # Pedidos - FUNCIONALIDAD PRINCIPAL
     orders = List(Order, limit=Int(default_value=50), customer_id=Int(), status=String())
     order = Field(Order, order_id=Int(required=True))
     orders_by_customer = List(Order, customer_id=Int(required=True))
+    orders_connection = Field(OrderConnection, first=Int(default_value=50), after=String(), customer_id=Int(), status=String())
     
     # Facturas
     invoices = List(Invoice, limit=Int(default_value=50), from_date=String())
     invoice = Field(Invoice, invoice_id=Int(required=True))
+    invoices_connection = Field(InvoiceConnection, first=Int(default_value=50), after=String(), from_date=String())
     
     # Avisos
     notices = List(Notice, limit=Int(default_value=50), status=String(), priority=String())
     notice = Field(Notice, notice_id=Int(required=True))
+    notices_connection = Field(NoticeConnection, first=Int(default_value=50), after=String(), status=String(), priority=String())
+    
+    # Agregados (un único GROUP BY en la base de datos)
+    order_stats = List(
+        StatsBucket, group_by=List(NonNull(OrderGroupBy)), date_from=String(name="from"), date_to=String(name="to"), status=String()
+    )
+    invoice_stats = List(
+        InvoiceStatsBucket, group_by=List(NonNull(InvoiceGroupBy)), date_from=String(name="from"), date_to=String(name="to"), status=String()
+    )
     
     # Cache
     cache_stats = Field(CacheStats)
     
-    def resolve_customers(self, info, limit=100, search=None):
+    # Pool de conexiones
+    pool_stats = List(PoolStats)
+    
+    async def resolve_customers(self, info, limit=100, search=None):
         """Resolver para lista de clientes"""
         try:
-            session = Session()
-            query = session.query(CustomerModel)
-            
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    (CustomerModel.business_name.ilike(search_term)) |
-                    (CustomerModel.vat_number.ilike(search_term)) |
-                    (CustomerModel.email.ilike(search_term))
-                )
-            
-            customers = query.limit(limit).all()
-            session.close()
-            return customers
+            return await cached_list(
+                info, CustomerModel,
+                f"customers_{limit}_{search or 'all'}",
+                settings.cache_ttl_customers,
+                ["entity:customers"],
+                lambda columns: get_repository("customers").list(customer_filters(search), limit=limit, columns=columns)
+            )
             
         except Exception as e:
             logger.error(f"❌ Error obteniendo clientes: {e}")
             return []
     
-    def resolve_customer(self, info, customer_id):
+    async def resolve_customer(self, info, customer_id):
         """Resolver para cliente específico"""
         try:
-            session = Session()
-            customer = session.query(CustomerModel).filter(CustomerModel.customer_id == customer_id).first()
-            session.close()
-            return customer
+            return await get_repository("customers").get(customer_id, selected_columns(info, CustomerModel))
         except Exception as e:
             logger.error(f"❌ Error obteniendo cliente {customer_id}: {e}")
             return None
     
-    def resolve_products(self, info, limit=100, search=None):
+    async def resolve_search_customers(self, info, text, limit=20):
+        """Clientes que coinciden con text, ordenados por relevancia"""
+        columns = selected_columns(info, CustomerModel)
+        return await run_session(
+            lambda session: ranked_search(
+                load_columns(session.query(CustomerModel), CustomerModel, columns), CustomerModel, CUSTOMER_SEARCH, text, limit, session.get_bind().dialect.name
+            ).all()
+        )
+    
+    async def resolve_search_products(self, info, text, limit=20):
+        """Productos activos que coinciden con text, ordenados por relevancia"""
+        columns = selected_columns(info, ProductModel)
+        return await run_session(
+            lambda session: ranked_search(
+                filter_products(load_columns(session.query(ProductModel), ProductModel, columns)), ProductModel, PRODUCT_SEARCH, text, limit, session.get_bind().dialect.name
+            ).all()
+        )
+    
+    async def resolve_customer_typeahead(self, info, prefix, limit=10):
+        """Clientes cuya razón social empieza por prefix"""
+        columns = selected_columns(info, CustomerModel)
+        return await run_session(
+            lambda session: typeahead(
+                load_columns(session.query(CustomerModel), CustomerModel, columns), CustomerModel, CustomerModel.business_name, prefix, limit, session.get_bind().dialect.name
+            ).all()
+        )
+    
+    async def resolve_product_typeahead(self, info, prefix, limit=10):
+        """Productos activos cuya referencia empieza por prefix"""
+        columns = selected_columns(info, ProductModel)
+        return await run_session(
+            lambda session: typeahead(
+                filter_products(load_columns(session.query(ProductModel), ProductModel, columns)), ProductModel, ProductModel.reference, prefix, limit, session.get_bind().dialect.name
+            ).all()
+        )
+    
+    async def resolve_products(self, info, limit=100, search=None):
         """Resolver para lista de productos"""
         try:
-            session = Session()
-            query = session.query(ProductModel)
-            
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    (ProductModel.reference.ilike(search_term)) |
-                    (ProductModel.description.ilike(search_term))
-                )
-            
-            products = query.filter(ProductModel.active == True).limit(limit).all()
-            session.close()
-            return products
+            return await cached_list(
+                info, ProductModel,
+                f"products_{limit}_{search or 'all'}",
+                settings.cache_ttl_products,
+                ["entity:products"],
+                lambda columns: get_repository("products").list(product_filters(search), limit=limit, columns=columns)
+            )
             
         except Exception as e:
             logger.error(f"❌ Error obteniendo productos: {e}")
             return []
     
-    def resolve_product(self, info, product_id):
+    async def resolve_product(self, info, product_id):
         """Resolver para producto específico"""
         try:
-            session = Session()
-            product = session.query(ProductModel).filter(ProductModel.product_id == product_id).first()
-            session.close()
-            return product
+            return await get_repository("products").get(product_id, selected_columns(info, ProductModel))
         except Exception as e:
             logger.error(f"❌ Error obteniendo producto {product_id}: {e}")
             return None
     
-    def resolve_orders(self, info, limit=50, customer_id=None, status=None):
+    async def resolve_orders(self, info, limit=50, customer_id=None, status=None):
         """Resolver para lista de pedidos - FUNCIONALIDAD PRINCIPAL"""
         try:
-            cache_manager = info.context.get('cache_manager')
-            
-            # Crear clave de cache
-            cache_key = f"orders_{limit}_{customer_id or 'all'}_{status or 'all'}"
-            
-            # Intentar obtener del cache
-            if cache_manager:
-                cached_orders = cache_manager.get(cache_key)
-                if cached_orders:
-                    logger.info(f"✅ Pedidos obtenidos del cache: {len(cached_orders)}")
-                    return cached_orders
-            
-            session = Session()
-            query = session.query(OrderModel)
-            
-            if customer_id:
-                query = query.filter(OrderModel.customer_id == customer_id)
-            
-            if status:
-                query = query.filter(OrderModel.status == status)
-            
-            orders = query.order_by(OrderModel.created_at.desc()).limit(limit).all()
-            
-            # Guardar en cache por 30 minutos
-            if cache_manager and orders:
-                cache_manager.set(cache_key, orders, ttl=1800)
-                logger.info(f"💾 {len(orders)} pedidos guardados en cache")
-            
-            session.close()
-            return orders
+            return await cached_list(
+                info, OrderModel,
+                f"orders_{limit}_{customer_id or 'all'}_{status or 'all'}",
+                settings.cache_ttl_orders,
+                # Las listas de un cliente sólo dependen de sus propios pedidos
+                [f"customer:{customer_id}"] if customer_id else ["entity:orders"],
+                lambda columns: get_repository("orders").list(order_filters(customer_id, status), ORDER_SORT, limit, columns)
+            )
             
         except Exception as e:
             logger.error(f"❌ Error obteniendo pedidos: {e}")
             return []
     
-    def resolve_order(self, info, order_id):
+    async def resolve_order(self, info, order_id):
         """Resolver para pedido específico"""
         try:
-            session = Session()
-            order = session.query(OrderModel).filter(OrderModel.order_id == order_id).first()
-            session.close()
-            return order
+            return await get_repository("orders").get(order_id, selected_columns(info, OrderModel))
         except Exception as e:
             logger.error(f"❌ Error obteniendo pedido {order_id}: {e}")
             return None
     
-    def resolve_orders_by_customer(self, info, customer_id):
+    async def resolve_orders_by_customer(self, info, customer_id):
         """Resolver para pedidos de un cliente específico"""
         try:
-            session = Session()
-            orders = session.query(OrderModel).filter(OrderModel.customer_id == customer_id).order_by(OrderModel.created_at.desc()).all()
-            session.close()
-            return orders
+            return await get_repository("orders").list(
+                order_filters(customer_id), ORDER_SORT, columns=selected_columns(info, OrderModel)
+            )
         except Exception as e:
             logger.error(f"❌ Error obteniendo pedidos del cliente {customer_id}: {e}")
             return []
     
-    def resolve_invoices(self, info, limit=50, from_date=None):
+    async def resolve_invoices(self, info, limit=50, from_date=None):
         """Resolver para lista de facturas"""
         try:
-            session = Session()
-            query = session.query(InvoiceModel)
-            
-            if from_date:
-                query = query.filter(InvoiceModel.date >= from_date)
-            
-            invoices = query.order_by(InvoiceModel.date.desc()).limit(limit).all()
-            session.close()
-            return invoices
+            return await cached_list(
+                info, InvoiceModel,
+                f"invoices_{limit}_{from_date or 'all'}",
+                settings.cache_ttl_invoices,
+                ["entity:invoices"],
+                lambda columns: get_repository("invoices").list(invoice_filters(from_date), INVOICE_SORT, limit, columns)
+            )
             
         except Exception as e:
             logger.error(f"❌ Error obteniendo facturas: {e}")
             return []
     
-    def resolve_invoice(self, info, invoice_id):
+    async def resolve_invoice(self, info, invoice_id):
         """Resolver para factura específica"""
         try:
-            session = Session()
-            invoice = session.query(InvoiceModel).filter(InvoiceModel.invoice_id == invoice_id).first()
-            session.close()
-            return invoice
+            return await get_repository("invoices").get(invoice_id, selected_columns(info, InvoiceModel))
         except Exception as e:
             logger.error(f"❌ Error obteniendo factura {invoice_id}: {e}")
             return None
     
-    def resolve_notices(self, info, limit=50, status=None, priority=None):
+    async def resolve_notices(self, info, limit=50, status=None, priority=None):
         """Resolver para lista de avisos"""
         try:
-            session = Session()
-            query = session.query(NoticeModel)
-            
-            if status:
-                query = query.filter(NoticeModel.status == status)
-            
-            if priority:
-                query = query.filter(NoticeModel.priority == priority)
-            
-            notices = query.order_by(NoticeModel.created_date.desc()).limit(limit).all()
-            session.close()
-            return notices
+            return await cached_list(
+                info, NoticeModel,
+                f"notices_{limit}_{status or 'all'}_{priority or 'all'}",
+                settings.cache_ttl_notices,
+                ["entity:notices"],
+                lambda columns: get_repository("notices").list(notice_filters(status, priority), NOTICE_SORT, limit, columns)
+            )
             
         except Exception as e:
             logger.error(f"❌ Error obteniendo avisos: {e}")
             return []
     
-    def resolve_notice(self, info, notice_id):
+    async def resolve_notice(self, info, notice_id):
         """Resolver para aviso específico"""
         try:
-            session = Session()
-            notice = session.query(NoticeModel).filter(NoticeModel.notice_id == notice_id).first()
-            session.close()
-            return notice
+            return await get_repository("notices").get(notice_id, selected_columns(info, NoticeModel))
         except Exception as e:
             logger.error(f"❌ Error obteniendo aviso {notice_id}: {e}")
             return None
     
-    def resolve_cache_stats(self, info):
+    async def resolve_order_stats(self, info, group_by=None, date_from=None, date_to=None, status=None):
+        """Resolver de pedidos agregados (cuenta, suma y media de total_amount)"""
+        keys = group_keys(group_by)
+        start, end = parse_date(date_from, "from"), parse_date(date_to, "to")
+        return await cached_stats(
+            info,
+            f"order_stats:{','.join(keys) or 'all'}_{status or 'all'}",
+            ["entity:orders"],
+            keys, start, end,
+            lambda session, ranges: order_stats(session, keys, ranges, status)
+        )
+    
+    async def resolve_invoice_stats(self, info, group_by=None, date_from=None, date_to=None, status=None):
+        """Resolver de facturas agregadas (cuenta, suma y media de amount)"""
+        keys = group_keys(group_by)
+        start, end = parse_date(date_from, "from"), parse_date(date_to, "to")
+        # Los tramos de vencimiento dependen del día (UTC) en que se calculan
+        today = utcnow().date()
+        return await cached_stats(
+            info,
+            f"invoice_stats:{','.join(keys) or 'all'}_{status or 'all'}_{today.isoformat()}",
+            ["entity:invoices"],
+            keys, start, end,
+            lambda session, ranges: invoice_stats(session, keys, today, ranges, status)
+        )
+    
+    async def resolve_customers_connection(self, info, first=100, after=None, search=None):
+        """Resolver paginado (keyset) para clientes"""
+        return await connection(info, CustomerConnection, "customers", customer_filters(search), CUSTOMER_SORT, first, after)
+    
+    async def resolve_products_connection(self, info, first=100, after=None, search=None):
+        """Resolver paginado (keyset) para productos"""
+        return await connection(info, ProductConnection, "products", product_filters(search), PRODUCT_SORT, first, after)
+    
+    async def resolve_orders_connection(self, info, first=50, after=None, customer_id=None, status=None):
+        """Resolver paginado (keyset) para pedidos, del más reciente al más antiguo"""
+        return await connection(info, OrderConnection, "orders", order_filters(customer_id, status), ORDER_SORT, first, after)
+    
+    async def resolve_invoices_connection(self, info, first=50, after=None, from_date=None):
+        """Resolver paginado (keyset) para facturas"""
+        return await connection(info, InvoiceConnection, "invoices", invoice_filters(from_date), INVOICE_SORT, first, after)
+    
+    async def resolve_notices_connection(self, info, first=50, after=None, status=None, priority=None):
+        """Resolver paginado (keyset) para avisos"""
+        return await connection(info, NoticeConnection, "notices", notice_filters(status, priority), NOTICE_SORT, first, after)
+    
+    async def resolve_cache_stats(self, info):
         """Resolver para estadísticas del cache"""
         try:
             cache_manager = info.context.get('cache_manager')
             if cache_manager:
-                return cache_manager.get_stats()
+                return await cache_manager.get_stats()
             else:
                 return {
                     "type": "None",
@@ -277,6 +593,10 @@ class Query(ObjectType):
                 "error": str(e)
             }
 
+    def resolve_pool_stats(self, info):
+        """Resolver para estadísticas del pool de conexiones"""
+        return [dict(stats, engine=name) for name, stats in get_pool_stats().items()]
+
 # Mutaciones
 class CreateCustomer(graphene.Mutation):
     """Mutación para crear cliente"""
@@ -297,43 +617,45 @@ class CreateCustomer(graphene.Mutation):
     success = Boolean()
     message = String()
     
-    def mutate(self, info, business_name, vat_number, **kwargs):
+    async def mutate(self, info, business_name, vat_number, **kwargs):
         try:
-            session = Session()
+            def create_customer(session):
+                # Verificar si ya existe
+                existing = session.query(CustomerModel).filter(CustomerModel.vat_number == vat_number).first()
+                if existing:
+                    return None
+                
+                # Crear nuevo cliente
+                customer = CustomerModel(
+                    business_name=business_name,
+                    vat_number=vat_number,
+                    name=kwargs.get('name', business_name),
+                    email=kwargs.get('email', ''),
+                    street_name=kwargs.get('street_name', ''),
+                    postal_code=kwargs.get('postal_code'),
+                    city=kwargs.get('city', ''),
+                    province_id=kwargs.get('province_id'),
+                    country_id=kwargs.get('country_id', 'ES'),
+                    phone=kwargs.get('phone', '')
+                )
+                
+                session.add(customer)
+                session.commit()
+                session.refresh(customer)
+                return customer
             
-            # Verificar si ya existe
-            existing = session.query(CustomerModel).filter(CustomerModel.vat_number == vat_number).first()
-            if existing:
-                session.close()
+            customer = await run_session(create_customer)
+            if customer is None:
                 return CreateCustomer(
                     success=False,
                     message=f"Ya existe un cliente con CIF {vat_number}"
                 )
             
-            # Crear nuevo cliente
-            customer = CustomerModel(
-                business_name=business_name,
-                vat_number=vat_number,
-                name=kwargs.get('name', business_name),
-                email=kwargs.get('email', ''),
-                street_name=kwargs.get('street_name', ''),
-                postal_code=kwargs.get('postal_code'),
-                city=kwargs.get('city', ''),
-                province_id=kwargs.get('province_id'),
-                country_id=kwargs.get('country_id', 'ES'),
-                phone=kwargs.get('phone', '')
-            )
-            
-            session.add(customer)
-            session.commit()
-            session.refresh(customer)
-            
-            # Limpiar cache
+            # Invalidar todas las listas de clientes
             cache_manager = info.context.get('cache_manager')
             if cache_manager:
-                cache_manager.delete('customers_100_all')
+                await cache_manager.invalidate_tags("entity:customers")
             
-            session.close()
             return CreateCustomer(
                 customer=customer,
                 success=True,
@@ -361,39 +683,40 @@ class CreateOrder(graphene.Mutation):
     success = Boolean()
     message = String()
     
-    def mutate(self, info, customer_id, total_amount, **kwargs):
+    async def mutate(self, info, customer_id, total_amount, **kwargs):
         try:
-            session = Session()
+            def create_order(session):
+                # Verificar que existe el cliente
+                customer = session.query(CustomerModel).filter(CustomerModel.customer_id == customer_id).first()
+                if not customer:
+                    return None
+                
+                # Crear nuevo pedido
+                order = OrderModel(
+                    customer_id=customer_id,
+                    reference=kwargs.get('reference', f"ORD-{customer_id}-{int(time.time())}"),
+                    total_amount=total_amount,
+                    status=kwargs.get('status', 'pending'),
+                    notes=kwargs.get('notes', '')
+                )
+                
+                session.add(order)
+                session.commit()
+                session.refresh(order)
+                return order
             
-            # Verificar que existe el cliente
-            customer = session.query(CustomerModel).filter(CustomerModel.customer_id == customer_id).first()
-            if not customer:
-                session.close()
+            order = await run_session(create_order)
+            if order is None:
                 return CreateOrder(
                     success=False,
                     message=f"No existe cliente con ID {customer_id}"
                 )
             
-            # Crear nuevo pedido
-            order = OrderModel(
-                customer_id=customer_id,
-                reference=kwargs.get('reference', f"ORD-{customer_id}-{int(time.time())}"),
-                total_amount=total_amount,
-                status=kwargs.get('status', 'pending'),
-                notes=kwargs.get('notes', '')
-            )
-            
-            session.add(order)
-            session.commit()
-            session.refresh(order)
-            
-            # Limpiar cache de pedidos
+            # Invalidar las listas de pedidos (globales y del cliente)
             cache_manager = info.context.get('cache_manager')
             if cache_manager:
-                cache_manager.delete('orders_50_all_all')
-                cache_manager.delete(f'orders_50_{customer_id}_all')
+                await cache_manager.invalidate_tags("entity:orders", f"customer:{customer_id}")
             
-            session.close()
             return CreateOrder(
                 order=order,
                 success=True,
@@ -407,10 +730,105 @@ class CreateOrder(graphene.Mutation):
                 message=f"Error: {str(e)}"
             )
 
+class OrderItemInput(graphene.InputObjectType):
+    """Línea de un pedido; sin unit_price se usa el precio del producto"""
+    product_id = String(required=True)
+    quantity = Int(required=True)
+    unit_price = Float()
+
+class OrderInput(graphene.InputObjectType):
+    """Pedido de createOrders; los importes se calculan a partir de las líneas"""
+    customer_id = Int(required=True)
+    reference = String()
+    status = String()
+    notes = String()
+    order_date = DateTime()
+    items = List(NonNull(OrderItemInput), required=True)
+
+class OrderResult(ObjectType):
+    """Resultado de una entrada de createOrders (index es su posición en input)"""
+    index = Int()
+    success = Boolean()
+    message = String()
+    order = Field(Order)
+
+class CreateOrders(graphene.Mutation):
+    """Alta de pedidos por lotes con sus líneas en una única transacción
+
+    Las entradas no válidas se devuelven con su error y no impiden el alta del
+    resto; un error de la base de datos anula el lote completo.
+    """
+    
+    class Arguments:
+        input = List(NonNull(OrderInput), required=True)
+    
+    results = List(NonNull(OrderResult))
+    created = Int()
+    failed = Int()
+    
+    async def mutate(self, info, input):
+        inputs = [dict(order, items=[dict(item) for item in order.items]) for order in input]
+        try:
+            outcomes = await run_session(lambda session: create_orders(session, inputs))
+        except GraphQLError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error creando pedidos: {e}")
+            outcomes = [OrderOutcome(index, None, f"Error: {str(e)}") for index in range(len(inputs))]
+        
+        created = [outcome.order for outcome in outcomes if outcome.order is not None]
+        cache_manager = info.context.get('cache_manager')
+        if cache_manager and created:
+            customer_tags = {f"customer:{order.customer_id}" for order in created}
+            await cache_manager.invalidate_tags("entity:orders", *sorted(customer_tags))
+        
+        return CreateOrders(
+            results=[
+                OrderResult(index=outcome.index, success=outcome.order is not None,
+                            message=outcome.message, order=outcome.order)
+                for outcome in outcomes
+            ],
+            created=len(created),
+            failed=len(outcomes) - len(created),
+        )
+
 class Mutations(ObjectType):
     """Mutaciones disponibles"""
     create_customer = CreateCustomer.Field()
     create_order = CreateOrder.Field()
+    create_orders = CreateOrders.Field()
+
+# Tablas del diccionario heredado (código generado por app/codegen/generate.py)
+def build_schema(legacy: Optional[bool] = None) -> graphene.Schema:
+    """Construir el schema GraphQL
+
+    Las tablas heredadas (app/generated) sólo se importan si están activadas:
+    sus modelos y tipos tardan varios segundos en cargarse.
+    """
+    if legacy is None:
+        legacy = settings.legacy_schema_enabled
+    
+    query = Query
+    if legacy:
+        from app.generated.legacy_schema import LegacyQuery
+        
+        class LegacyEnabledQuery(Query):
+            class Meta:
+                name = "Query"
+            
+            legacy = Field(LegacyQuery, description="Tablas del sistema heredado", resolver=lambda root, info: LegacyQuery())
+        
+        query = LegacyEnabledQuery
+    
+    return graphene.Schema(query=query, mutation=Mutations)
+
+@lru_cache(maxsize=None)
+def get_schema() -> graphene.Schema:
+    """Schema principal, construido una vez por proceso en el primer uso"""
+    return build_schema()
 
-# Schema principal
-schema = graphene.Schema(query=Query, mutation=Mutations)
\ No newline at end of file
+def __getattr__(name):
+    # `schema` se mantiene como atributo del módulo pero ya no se construye al importar
+    if name == "schema":
+        return get_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,52 @@
+"""
+Soporte en tiempo de ejecución de los tipos generados del diccionario heredado
+
+Las listas de app/generated/legacy_schema.py se resuelven todas igual: una
+consulta sobre el modelo con los filtros recibidos y un límite de filas. Cada
+campo del filtro es una columna (igualdad) o una columna con sufijo:
+``_contains`` (texto), ``_gte`` y ``_lte`` (números y fechas). Sólo se
+cargan las columnas que pide la consulta: algunas tablas tienen más de cien.
+"""
+
+from graphene import Int, List
+from app.core.database import run_session
+from app.repositories import load_columns
+from app.schemas.pagination import MAX_PAGE_SIZE
+from app.schemas.selection import selected_columns
+
+FILTER_OPERATORS = {
+    "_contains": lambda column, value: column.ilike(f"%{value}%"),
+    "_gte": lambda column, value: column >= value,
+    "_lte": lambda column, value: column <= value,
+}
+
+
+def apply_filters(query, model, filters):
+    """Aplicar a query los filtros de un input Legacy*Filter"""
+    for name, value in (filters or {}).items():
+        if value is None:
+            continue
+        column = getattr(model, name, None)
+        operator = None
+        if column is None:
+            for suffix, build in FILTER_OPERATORS.items():
+                if name.endswith(suffix):
+                    column = getattr(model, name[:-len(suffix)])
+                    operator = build
+                    break
+        query = query.filter(operator(column, value) if operator else column == value)
+    return query
+
+
+def legacy_list_field(object_type, filter_type):
+    """Campo de lista (con limit y filter) para una tabla heredada"""
+    model = object_type._meta.model
+
+    async def resolve(root, info, limit=100, filter=None):
+        limit = max(0, min(limit, MAX_PAGE_SIZE))
+        columns = selected_columns(info, model)
+        return await run_session(
+            lambda session: apply_filters(load_columns(session.query(model), model, columns), model, filter).limit(limit).all()
+        )
+
+    return List(object_type, limit=Int(default_value=100), filter=filter_type(), resolver=resolve)
@@ -0,0 +1,152 @@
+"""
+DataLoaders por petición para resolver relaciones sin consultas N+1
+
+Cada relación del schema tiene su propio loader, indexado por clave foránea.
+Todas las claves pedidas en un mismo nivel de la consulta GraphQL se agrupan
+en una única consulta ``IN (...)``. Las entidades se cargan a través de su
+repositorio (``IN`` en SQL, ``campo_in`` en GoManage); las tablas que sólo
+existen en local (líneas de pedido, rollups) se consultan directamente.
+
+projected_loader() devuelve la variante de un loader que carga sólo las
+columnas que pide la consulta (una por selección de campos).
+"""
+
+from collections import defaultdict
+from aiodataloader import DataLoader
+from sqlalchemy.orm import load_only
+from app.core.database import run_session
+from app.models.models import (
+    OrderItem as OrderItemModel,
+    CustomerStats as CustomerStatsModel,
+)
+from app.repositories import ENTITIES, get_repository
+from app.schemas.selection import selected_columns
+
+
+def _query(session, model, column, keys, columns):
+    query = session.query(model).filter(column.in_(keys))
+    if columns is not None:
+        names = dict.fromkeys([*[c.key for c in model.__table__.primary_key.columns], column.key, *columns])
+        query = query.options(load_only(*[getattr(model, name) for name in names]))
+    return query
+
+
+class ModelByKeyLoader(DataLoader):
+    """Carga una instancia por clave (relaciones muchos-a-uno)"""
+
+    def __init__(self, model, column, columns=None):
+        super().__init__()
+        self.model = model
+        self.column = column
+        self.columns = columns
+
+    def projected(self, columns):
+        return ModelByKeyLoader(self.model, self.column, columns)
+
+    async def batch_load_fn(self, keys):
+        rows = await run_session(
+            lambda session: _query(session, self.model, self.column, keys, self.columns).all()
+        )
+
+        by_key = {getattr(row, self.column.key): row for row in rows}
+        return [by_key.get(key) for key in keys]
+
+
+class ModelsByForeignKeyLoader(DataLoader):
+    """Carga la lista de instancias que apuntan a cada clave (relaciones uno-a-muchos)"""
+
+    def __init__(self, model, column, order_by=None, columns=None):
+        super().__init__()
+        self.model = model
+        self.column = column
+        self.order_by = order_by
+        self.columns = columns
+
+    def projected(self, columns):
+        return ModelsByForeignKeyLoader(self.model, self.column, self.order_by, columns)
+
+    async def batch_load_fn(self, keys):
+        def query_rows(session):
+            query = _query(session, self.model, self.column, keys, self.columns)
+            if self.order_by is not None:
+                query = query.order_by(self.order_by)
+            return query.all()
+
+        rows = await run_session(query_rows)
+
+        grouped = defaultdict(list)
+        for row in rows:
+            grouped[getattr(row, self.column.key)].append(row)
+        return [grouped.get(key, []) for key in keys]
+
+
+class RepositoryByKeyLoader(DataLoader):
+    """Carga una entidad por clave primaria desde su repositorio"""
+
+    def __init__(self, entity, columns=None):
+        super().__init__()
+        self.entity = entity
+        self.model = ENTITIES[entity].model
+        self.columns = columns
+
+    def projected(self, columns):
+        return RepositoryByKeyLoader(self.entity, columns)
+
+    async def batch_load_fn(self, keys):
+        by_key = await get_repository(self.entity).get_many(keys, self.columns)
+        return [by_key.get(key) for key in keys]
+
+
+class RepositoryByForeignKeyLoader(DataLoader):
+    """Carga las filas de una entidad que apuntan a cada clave desde su repositorio"""
+
+    def __init__(self, entity, field, sort=(), columns=None):
+        super().__init__()
+        self.entity = entity
+        self.model = ENTITIES[entity].model
+        self.field = field
+        self.sort = sort
+        self.columns = columns
+
+    def projected(self, columns):
+        return RepositoryByForeignKeyLoader(self.entity, self.field, self.sort, columns)
+
+    async def batch_load_fn(self, keys):
+        grouped = await get_repository(self.entity).group_by(self.field, keys, self.sort, self.columns)
+        return [grouped.get(key, []) for key in keys]
+
+
+def create_loaders():
+    """Crear un juego nuevo de loaders (uno por petición)"""
+    return {
+        'customer_by_id': RepositoryByKeyLoader("customers"),
+        'product_by_id': RepositoryByKeyLoader("products"),
+        'order_by_id': RepositoryByKeyLoader("orders"),
+        'order_items_by_order': ModelsByForeignKeyLoader(OrderItemModel, OrderItemModel.order_id, order_by=OrderItemModel.item_id),
+        'orders_by_customer': RepositoryByForeignKeyLoader("orders", "customer_id", ["-created_at", "-order_id"]),
+        'invoices_by_customer': RepositoryByForeignKeyLoader("invoices", "customer_id", ["-date", "-invoice_id"]),
+        'stats_by_customer': ModelByKeyLoader(CustomerStatsModel, CustomerStatsModel.customer_id),
+    }
+
+
+def get_loaders(info):
+    """Obtener los loaders de la petición actual (los crea si el contexto no los trae)"""
+    context = info.context
+    loaders = context.get('loaders')
+    if loaders is None:
+        loaders = context['loaders'] = create_loaders()
+    return loaders
+
+
+def projected_loader(info, name):
+    """Loader name de la petición que carga sólo las columnas que pide info
+
+    Los objetos de una misma lista comparten selección, así que siguen
+    agrupándose en una única consulta por nivel.
+    """
+    loaders = get_loaders(info)
+    columns = tuple(selected_columns(info, loaders[name].model))
+    loader = loaders.get((name, columns))
+    if loader is None:
+        loader = loaders[(name, columns)] = loaders[name].projected(list(columns))
+    return loader
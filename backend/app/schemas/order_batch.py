@@ -0,0 +1,133 @@
+"""
+Alta de pedidos por lotes (mutación createOrders)
+
+Un lote se valida con una consulta de clientes y otra de productos para todas
+las entradas, los importes se calculan en el servidor (precio del producto si
+la línea no trae unit_price) y las entradas válidas se insertan juntas con
+``INSERT ... RETURNING`` (insertmanyvalues: pocas sentencias para miles de
+filas) en una única transacción. Las entradas con errores se devuelven con
+su mensaje sin impedir el alta del resto.
+"""
+
+import time
+from typing import List, NamedTuple, Optional
+from graphql import GraphQLError
+from sqlalchemy import insert
+from app.core.rollups import RollupDelta, apply_delta
+from app.models.models import Customer as CustomerModel, Order as OrderModel, OrderItem as OrderItemModel, Product as ProductModel
+
+# Máximo de pedidos por llamada
+MAX_BATCH_ORDERS = 1000
+
+
+class OrderOutcome(NamedTuple):
+    """Resultado de una entrada del lote"""
+    index: int
+    order: Optional[OrderModel]
+    message: str
+
+
+def validate_inputs(inputs, customer_ids, products):
+    """Errores por entrada (índice -> mensaje) con los clientes y productos existentes"""
+    errors = {}
+    for index, order in enumerate(inputs):
+        items = order.get("items") or []
+        if order["customer_id"] not in customer_ids:
+            errors[index] = f"No existe cliente con ID {order['customer_id']}"
+        elif not items:
+            errors[index] = "El pedido no tiene líneas"
+        else:
+            for item in items:
+                product = products.get(item["product_id"])
+                if product is None:
+                    errors[index] = f"No existe producto activo con ID {item['product_id']}"
+                elif item["quantity"] <= 0:
+                    errors[index] = f"Cantidad no válida para {item['product_id']}: {item['quantity']}"
+                elif item.get("unit_price") is None and product.price is None:
+                    errors[index] = f"El producto {item['product_id']} no tiene precio"
+                else:
+                    continue
+                break
+    return errors
+
+
+def line_values(item, products):
+    """Columnas de una línea con sus importes calculados"""
+    unit_price = item.get("unit_price")
+    if unit_price is None:
+        unit_price = products[item["product_id"]].price
+    return {
+        "product_id": item["product_id"],
+        "quantity": item["quantity"],
+        "unit_price": unit_price,
+        "total_price": round(unit_price * item["quantity"], 2),
+    }
+
+
+def create_orders(session, inputs) -> List[OrderOutcome]:
+    """Validar e insertar un lote de pedidos con sus líneas; hace commit"""
+    if len(inputs) > MAX_BATCH_ORDERS:
+        raise GraphQLError(f"Máximo {MAX_BATCH_ORDERS} pedidos por lote, recibidos {len(inputs)}")
+    customer_ids = {order["customer_id"] for order in inputs}
+    product_ids = {item["product_id"] for order in inputs for item in order.get("items") or []}
+    existing_customers = {
+        row.customer_id for row in
+        session.query(CustomerModel.customer_id).filter(CustomerModel.customer_id.in_(customer_ids))
+    }
+    products = {
+        row.product_id: row for row in
+        session.query(ProductModel.product_id, ProductModel.price)
+        .filter(ProductModel.product_id.in_(product_ids), ProductModel.active == True)
+    } if product_ids else {}
+
+    errors = validate_inputs(inputs, existing_customers, products)
+    valid = [index for index in range(len(inputs)) if index not in errors]
+    outcomes = {index: OrderOutcome(index, None, message) for index, message in errors.items()}
+    if not valid:
+        return [outcomes[index] for index in range(len(inputs))]
+
+    stamp = int(time.time())
+    lines = {index: [line_values(item, products) for item in inputs[index]["items"]] for index in valid}
+    headers = []
+    for index in valid:
+        order = inputs[index]
+        headers.append({
+            "customer_id": order["customer_id"],
+            "reference": order.get("reference") or f"ORD-{order['customer_id']}-{stamp}-{index}",
+            "order_date": order.get("order_date"),
+            "total_amount": round(sum(line["total_price"] for line in lines[index]), 2),
+            "status": order.get("status") or "pending",
+            "notes": order.get("notes") or "",
+        })
+
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLite no admite sort_by_parameter_order sin volver a una sentencia
+        # por fila; bajo su bloqueo de escritura los IDs crecen en el orden de
+        # VALUES, así que basta con ordenar por la clave primaria
+        created = sorted(
+            session.scalars(insert(OrderModel).returning(OrderModel), headers).all(),
+            key=lambda order: order.order_id,
+        )
+    else:
+        created = session.scalars(
+            insert(OrderModel).returning(OrderModel, sort_by_parameter_order=True), headers
+        ).all()
+    session.execute(insert(OrderItemModel), [
+        dict(line, order_id=order.order_id)
+        for index, order in zip(valid, created) for line in lines[index]
+    ])
+
+    # Las inserciones en bloque no pasan por el flush: rollups a mano
+    delta = RollupDelta()
+    for order in created:
+        delta.add_order(order.customer_id, order.order_date, order.status, order.total_amount, order.created_at, 1)
+    apply_delta(session.connection(), delta)
+    # RETURNING ya trajo todas las columnas: se separan de la sesión para que
+    # el commit no las expire y no haga falta refrescarlas una a una
+    for order in created:
+        session.expunge(order)
+    session.commit()
+
+    for index, order in zip(valid, created):
+        outcomes[index] = OrderOutcome(index, order, "Pedido creado exitosamente")
+    return [outcomes[index] for index in range(len(inputs))]
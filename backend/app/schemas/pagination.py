@@ -0,0 +1,119 @@
+"""
+Paginación por cursor (keyset) para las conexiones estilo Relay
+
+El cursor codifica los valores de las columnas de ordenación de la última fila
+devuelta; la página siguiente se obtiene con un predicado de fila
+``(col1, col2) < (v1, v2)`` que aprovecha los índices compuestos, en lugar de
+OFFSET, de modo que la página N cuesta lo mismo que la primera.
+
+Las columnas de ordenación que admiten NULL (Invoice.date, Order.created_at,
+...) ordenan los NULL como el mayor valor, igual que los índices B-tree de
+PostgreSQL: primero en orden descendente y al final en ascendente. Con un
+NULL en el cursor la comparación de filas daría NULL y se perderían esas
+filas, así que el predicado trata aparte ese caso (ver after_cursor).
+"""
+
+import base64
+import json
+from datetime import datetime
+from graphql import GraphQLError
+from graphene.relay import PageInfo
+from sqlalchemy import DateTime, and_, false, literal, or_, tuple_
+
+# Máximo de filas por página
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(row, sort_columns):
+    """Codificar los valores de ordenación de una fila como cursor opaco"""
+    values = []
+    for column in sort_columns:
+        value = getattr(row, column.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, sort_columns):
+    """Decodificar un cursor a los valores tipados de las columnas de ordenación"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(sort_columns):
+            raise ValueError(cursor)
+        return [
+            datetime.fromisoformat(value) if value is not None and isinstance(column.type, DateTime) else value
+            for value, column in zip(values, sort_columns)
+        ]
+    except (ValueError, TypeError) as e:
+        raise GraphQLError(f"Cursor inválido: {cursor}") from e
+
+
+def page_size(first):
+    return max(0, min(first, MAX_PAGE_SIZE))
+
+
+def is_nullable(column) -> bool:
+    return getattr(column.expression, "nullable", False)
+
+
+def sort_order(sort_columns, descending=True):
+    """ORDER BY de sort_columns con los NULL como el mayor valor"""
+    order = []
+    for column in sort_columns:
+        if descending:
+            order.append(column.desc().nulls_first() if is_nullable(column) else column.desc())
+        else:
+            order.append(column.asc().nulls_last() if is_nullable(column) else column.asc())
+    return order
+
+
+def after_cursor(sort_columns, values, descending=True):
+    """Predicado de las filas posteriores a values en el orden de sort_order
+
+    Sin NULL posibles es la comparación de filas ``(col1, col2) < (v1, v2)``.
+    Si la primera columna admite NULL: con valor en el cursor las filas NULL
+    van antes en descendente (la comparación ya las excluye) y después en
+    ascendente; con NULL en el cursor se sigue dentro de las filas NULL por
+    el resto de columnas y, en descendente, después vienen todas las demás.
+    """
+    column, value = sort_columns[0], values[0]
+    if value is not None and not any(is_nullable(rest) for rest in sort_columns[1:]):
+        key = tuple_(*sort_columns)
+        bound = tuple_(*[literal(value, column.type) for value, column in zip(values, sort_columns)])
+        if descending:
+            return key < bound
+        return or_(key > bound, column.is_(None)) if is_nullable(column) else key > bound
+
+    rest = after_cursor(sort_columns[1:], values[1:], descending) if len(sort_columns) > 1 else false()
+    if value is None:
+        within = and_(column.is_(None), rest)
+        return or_(column.is_not(None), within) if descending else within
+    bound = literal(value, column.type)
+    before = column < bound if descending else or_(column > bound, column.is_(None))
+    return or_(before, and_(column == bound, rest))
+
+
+def keyset(query, sort_columns, first, after=None, descending=True):
+    """Aplicar orden, predicado keyset y límite a query (Query del ORM o select())
+
+    Se pide una fila más que first: si llega, existe una página siguiente.
+    """
+    if after:
+        query = query.filter(after_cursor(sort_columns, decode_cursor(after, sort_columns), descending))
+    return query.order_by(*sort_order(sort_columns, descending)).limit(first + 1)
+
+
+def build_connection(connection_type, rows, sort_columns, has_next_page, after=None):
+    """Construir la conexión Relay (edges + pageInfo) para una página"""
+    edges = [
+        connection_type.Edge(node=row, cursor=encode_cursor(row, sort_columns))
+        for row in rows
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            has_previous_page=after is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
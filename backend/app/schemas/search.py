@@ -0,0 +1,101 @@
+"""
+Búsqueda de clientes y productos
+
+En PostgreSQL la búsqueda usa las columnas ``search_vector`` (tsvector con la
+configuración ``spanish_unaccent``) y los índices GIN de pg_trgm creados por
+la migración 0003, sobre el texto normalizado con ``immutable_unaccent(lower(...))``,
+de modo que "sune" encuentra "SUÑE" y "tecnologia" encuentra "TECNOLOGÍA".
+Los resultados se ordenan por relevancia (ts_rank_cd más similitud de
+trigramas). En SQLite (desarrollo y tests) immutable_unaccent es una función
+de Python (ver app/core/database.py) y la relevancia se aproxima según dónde
+aparece el término.
+
+El autocompletado (typeahead) busca por prefijo sobre una expresión con
+índice B-tree en orden "C", que se recorre ya ordenado y se corta en el
+límite: su coste no depende del tamaño de la tabla.
+"""
+
+from sqlalchemy import case, func, literal, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from app.core.database import strip_accents
+
+SEARCH_CONFIG = "spanish_unaccent"
+
+# Máximo de resultados de búsqueda y de sugerencias
+MAX_SEARCH_RESULTS = 100
+MAX_TYPEAHEAD_RESULTS = 20
+
+
+def normalize(term):
+    return strip_accents(term.strip())
+
+
+def escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def unaccented(column):
+    """Expresión normalizada de una columna (la misma que indexa la migración)"""
+    return func.immutable_unaccent(func.lower(column))
+
+
+def contains_any(columns, term):
+    """Alguna de las columnas contiene term, sin distinguir tildes ni mayúsculas
+
+    En PostgreSQL la usan los índices de trigramas, así que el filtro
+    ``search`` de las listas ya no recorre la tabla entera.
+    """
+    pattern = f"%{escape_like(normalize(term))}%"
+    return or_(*[unaccented(column).like(pattern, escape="\\") for column in columns])
+
+
+def _rank_postgresql(model, columns, text):
+    tsquery = func.websearch_to_tsquery(literal(SEARCH_CONFIG, REGCONFIG), text)
+    vector = literal_column(f"{model.__tablename__}.search_vector")
+    similarity = func.greatest(*[func.word_similarity(text, unaccented(column)) for column in columns])
+    match = or_(
+        vector.op("@@")(tsquery),
+        *[literal(text).op("<%")(unaccented(column)) for column in columns],
+        contains_any(columns, text),
+    )
+    return match, func.ts_rank_cd(vector, tsquery) + similarity
+
+
+def _rank_fallback(columns, text):
+    pattern = escape_like(text)
+    rank = 0
+    # Las primeras columnas pesan más: nombre antes que email o CIF
+    for weight, column in enumerate(reversed(columns), start=1):
+        expression = unaccented(column)
+        rank = rank + weight * case(
+            (expression == text, 4),
+            (expression.like(f"{pattern}%", escape="\\"), 3),
+            (expression.like(f"% {pattern}%", escape="\\"), 2),
+            (expression.like(f"%{pattern}%", escape="\\"), 1),
+            else_=0,
+        )
+    return contains_any(columns, text), rank
+
+
+def ranked_search(query, model, columns, term, limit, dialect):
+    """Filtrar query por term y ordenar por relevancia (columns en orden de peso)"""
+    text = normalize(term)
+    if dialect == "postgresql":
+        match, rank = _rank_postgresql(model, columns, text)
+    else:
+        match, rank = _rank_fallback(columns, text)
+    primary_key = model.__mapper__.primary_key[0]
+    limit = max(0, min(limit, MAX_SEARCH_RESULTS))
+    return query.filter(match).order_by(rank.desc(), primary_key).limit(limit)
+
+
+def typeahead(query, model, column, prefix, limit, dialect):
+    """Filas cuya columna empieza por prefix, en orden alfabético"""
+    expression = unaccented(column)
+    if dialect == "postgresql":
+        # Orden de bytes: el del índice ix_<tabla>_<columna>_prefix
+        expression = expression.collate("C")
+    pattern = escape_like(normalize(prefix)) + "%"
+    primary_key = model.__mapper__.primary_key[0]
+    limit = max(0, min(limit, MAX_TYPEAHEAD_RESULTS))
+    return query.filter(expression.like(pattern, escape="\\")).order_by(expression, primary_key).limit(limit)
@@ -0,0 +1,75 @@
+"""
+Utilidades para inspeccionar la selección de campos de una consulta GraphQL
+
+Los resolvers cargan sólo las columnas que pide la consulta (load_only en
+SQL, ``fields`` en GoManage, ver app/repositories): una lista de IDs y
+estados no lee los Text como Order.notes ni las 100+ columnas de las tablas
+heredadas.
+"""
+
+from graphene.utils.str_converters import to_camel_case
+from graphql.language.ast import FieldNode, FragmentSpreadNode, InlineFragmentNode
+from sqlalchemy import inspect
+
+
+def _collect_fields(selection_set, fragments, names):
+    if selection_set is None:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            names.add(selection.name.value)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                _collect_fields(fragment.selection_set, fragments, names)
+        elif isinstance(selection, InlineFragmentNode):
+            _collect_fields(selection.selection_set, fragments, names)
+
+
+def _child_selection_sets(selection_set, fragments, name, found):
+    """Selecciones de los campos llamados name dentro de selection_set"""
+    if selection_set is None:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value == name and selection.selection_set is not None:
+                found.append(selection.selection_set)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                _child_selection_sets(fragment.selection_set, fragments, name, found)
+        elif isinstance(selection, InlineFragmentNode):
+            _child_selection_sets(selection.selection_set, fragments, name, found)
+
+
+def selected_fields(info, path=()):
+    """Nombres GraphQL de los campos pedidos bajo el campo que se está resolviendo
+
+    path baja por campos intermedios, p. ej. ``("edges", "node")`` en las
+    conexiones Relay.
+    """
+    selection_sets = [field_node.selection_set for field_node in info.field_nodes]
+    for name in path:
+        found = []
+        for selection_set in selection_sets:
+            _child_selection_sets(selection_set, info.fragments, name, found)
+        selection_sets = found
+    names = set()
+    for selection_set in selection_sets:
+        _collect_fields(selection_set, info.fragments, names)
+    return names
+
+
+def selected_columns(info, model, path=()):
+    """Columnas del modelo que pide la consulta
+
+    Incluye siempre la clave primaria y las claves foráneas, que necesitan los
+    DataLoaders para resolver las relaciones.
+    """
+    names = selected_fields(info, path)
+    columns = []
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        if column.primary_key or column.foreign_keys or to_camel_case(attr.key) in names:
+            columns.append(attr.key)
+    return columns
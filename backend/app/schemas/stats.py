@@ -0,0 +1,233 @@
+"""
+Agregados de pedidos y facturas para los dashboards
+
+Cada consulta de estadísticas es un único ``SELECT ... GROUP BY`` sobre la
+tabla, de modo que el cliente recibe un bucket por combinación de claves
+(estado, cliente, mes, antigüedad de la deuda) con su número de filas, suma
+y media en lugar de descargar las filas y sumarlas él mismo.
+
+El rango [from, to) se parte en tramos de fechas (split_range): los meses
+completos ya cerrados se cachean cada uno por separado, de modo que dos
+rangos que se solapan comparten sus meses y mover ``to`` sólo recalcula el
+tramo nuevo; el mes en curso y los trozos de mes de los extremos se calculan
+siempre. La consulta agrupa además por tramo (una columna CASE) para
+calcular todos los tramos pendientes a la vez, y merge_buckets suma los
+resultados de cada tramo. Todas las fechas son UTC con zona horaria, para
+que PostgreSQL no las desplace según la zona de la sesión.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional, Tuple
+from graphql import GraphQLError
+from sqlalchemy import and_, case, func, or_, true
+from app.models.models import Invoice as InvoiceModel, Order as OrderModel
+
+# Tramos de antigüedad de las facturas vencidas: (días desde el vencimiento, etiqueta)
+DUE_BUCKETS = [(30, "1-30"), (60, "31-60"), (90, "61-90")]
+DUE_BUCKET_CURRENT = "current"
+DUE_BUCKET_OVERDUE = "90+"
+DUE_BUCKET_NONE = "none"
+
+
+def utcnow():
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """value en UTC; las fechas sin zona se interpretan como UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def parse_date(value, argument):
+    """Fecha ISO (YYYY-MM-DD o fecha y hora) de un argumento de la consulta, en UTC"""
+    if value is None:
+        return None
+    try:
+        return as_utc(datetime.fromisoformat(value))
+    except ValueError as e:
+        raise GraphQLError(f"Fecha inválida en {argument}: {value}") from e
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value: datetime) -> datetime:
+    return month_start(month_start(value) + timedelta(days=32))
+
+
+class DateRange(NamedTuple):
+    """Tramo [start, end) de fechas; None es un extremo abierto"""
+    start: Optional[datetime]
+    end: Optional[datetime]
+    # Incluir también las filas sin fecha (sólo sin from ni to)
+    nulls: bool = False
+
+    @property
+    def key(self) -> str:
+        bounds = [bound.isoformat() if bound is not None else "" for bound in (self.start, self.end)]
+        return "_".join(bounds) + ("_null" if self.nulls else "")
+
+    def condition(self, column):
+        bounds = []
+        if self.start is not None:
+            bounds.append(column >= self.start)
+        if self.end is not None:
+            bounds.append(column < self.end)
+        condition = and_(*bounds) if bounds else true()
+        return or_(condition, column.is_(None)) if self.nulls else condition
+
+
+def split_range(date_from=None, date_to=None, now=None) -> Tuple[List[DateRange], List[DateRange]]:
+    """Tramos cerrados (cacheables) y abiertos de [date_from, date_to)
+
+    Cerrados son los meses completos que terminan antes del mes en curso y,
+    sin date_from, todo lo anterior a ellos en un único tramo. Abiertos son
+    el mes en curso (o lo que quede tras el último mes cerrado) y el trozo
+    de mes inicial si date_from no cae en día 1.
+    """
+    open_start = month_start(now or utcnow())
+    if date_from is not None and date_to is not None and date_to <= date_from:
+        return [], [DateRange(date_from, date_to)]
+
+    closed_end = open_start if date_to is None else min(month_start(date_to), open_start)
+    closed, live = [], []
+    if date_from is None:
+        closed.append(DateRange(None, closed_end, nulls=date_to is None))
+        cursor = closed_end
+    else:
+        cursor = date_from if date_from == month_start(date_from) else next_month(date_from)
+        if cursor >= closed_end:
+            return [], [DateRange(date_from, date_to)]
+        if cursor > date_from:
+            live.append(DateRange(date_from, cursor))
+        while cursor < closed_end:
+            closed.append(DateRange(cursor, next_month(cursor)))
+            cursor = next_month(cursor)
+    if date_to is None or cursor < date_to:
+        live.append(DateRange(cursor, date_to))
+    return closed, live
+
+
+def month_of(column, dialect):
+    """Mes (YYYY-MM) en UTC de una columna de fecha, en SQL del dialecto"""
+    if dialect == "postgresql":
+        return func.to_char(func.timezone("UTC", column), "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def due_bucket_of(column, today: date):
+    """Tramo de antigüedad de una fecha de vencimiento respecto a today
+
+    Los límites se calculan aquí y se pasan como parámetros, así que la
+    expresión es igual en todos los dialectos.
+    """
+    start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
+    whens = [(column.is_(None), DUE_BUCKET_NONE), (column >= start, DUE_BUCKET_CURRENT)]
+    whens += [(column >= start - timedelta(days=days), label) for days, label in DUE_BUCKETS]
+    return case(*whens, else_=DUE_BUCKET_OVERDUE)
+
+
+def aggregate(session, model, amount, keys, group_by, filters, date_column, ranges):
+    """Ejecutar el GROUP BY y devolver, para cada tramo de ranges, un dict por bucket
+
+    keys asocia cada clave de agrupación con su expresión SQL; las claves no
+    pedidas quedan a None en el resultado. Cada bucket lleva además
+    amount_count (filas con importe) para poder combinar medias.
+    """
+    unknown = [key for key in group_by if key not in keys]
+    if unknown:
+        raise GraphQLError(f"No se puede agrupar por {', '.join(unknown)}")
+    results = [[] for _ in ranges]
+    if not ranges:
+        return results
+
+    conditions = [date_range.condition(date_column) for date_range in ranges]
+    range_index = case(*[(condition, index) for index, condition in enumerate(conditions)]).label("range_index")
+    columns = [keys[key].label(key) for key in group_by]
+    query = session.query(
+        range_index,
+        *columns,
+        func.count().label("count"),
+        func.count(amount).label("amount_count"),
+        func.sum(amount).label("total_amount"),
+        func.min(amount).label("min_amount"),
+        func.max(amount).label("max_amount"),
+    ).select_from(model).filter(*filters, or_(*conditions))
+    query = query.group_by(range_index, *columns).order_by(range_index, *columns)
+
+    for row in query.all():
+        bucket = dict.fromkeys(keys)
+        bucket.update(row._asdict())
+        results[bucket.pop("range_index")].append(bucket)
+    return results
+
+
+def _combine(first, second, function):
+    if first is None or second is None:
+        return second if first is None else first
+    return function(first, second)
+
+
+def merge_buckets(results, group_by):
+    """Sumar los buckets de varios tramos con las mismas claves de agrupación"""
+    merged = {}
+    for buckets in results:
+        for bucket in buckets:
+            key = tuple(bucket[name] for name in group_by)
+            total = merged.get(key)
+            if total is None:
+                merged[key] = dict(bucket)
+                continue
+            total["count"] += bucket["count"]
+            total["amount_count"] += bucket["amount_count"]
+            total["total_amount"] = _combine(total["total_amount"], bucket["total_amount"], lambda a, b: a + b)
+            total["min_amount"] = _combine(total["min_amount"], bucket["min_amount"], min)
+            total["max_amount"] = _combine(total["max_amount"], bucket["max_amount"], max)
+
+    if not merged and not group_by:
+        # Sin agrupar siempre hay un bucket, aunque no haya filas
+        merged[()] = dict(count=0, amount_count=0, total_amount=None, min_amount=None, max_amount=None)
+    buckets = []
+    for key in sorted(merged, key=lambda key: [(value is None, value) for value in key]):
+        bucket = merged[key]
+        amount_count = bucket.pop("amount_count")
+        bucket["average_amount"] = float(bucket["total_amount"]) / amount_count if amount_count else None
+        buckets.append(bucket)
+    return buckets
+
+
+def order_stats(session, group_by=(), ranges=(DateRange(None, None, nulls=True),), status=None):
+    """Pedidos agrupados por estado, cliente y/o mes, por tramo de ranges
+
+    El mes y los tramos usan la fecha del pedido o, si no la tiene, la de
+    creación.
+    """
+    dialect = session.get_bind().dialect.name
+    order_date = func.coalesce(OrderModel.order_date, OrderModel.created_at)
+    keys = {
+        "status": OrderModel.status,
+        "customer_id": OrderModel.customer_id,
+        "month": month_of(order_date, dialect),
+    }
+    filters = []
+    if status:
+        filters.append(OrderModel.status == status)
+    return aggregate(session, OrderModel, OrderModel.total_amount, keys, group_by, filters, order_date, ranges)
+
+
+def invoice_stats(session, group_by=(), today=None, ranges=(DateRange(None, None, nulls=True),), status=None):
+    """Facturas agrupadas por estado, cliente, mes y/o tramo de vencimiento, por tramo de ranges"""
+    dialect = session.get_bind().dialect.name
+    keys = {
+        "status": InvoiceModel.status,
+        "customer_id": InvoiceModel.customer_id,
+        "month": month_of(InvoiceModel.date, dialect),
+        "due_bucket": due_bucket_of(InvoiceModel.due_date, today or utcnow().date()),
+    }
+    filters = []
+    if status:
+        filters.append(InvoiceModel.status == status)
+    return aggregate(session, InvoiceModel, InvoiceModel.amount, keys, group_by, filters, InvoiceModel.date, ranges)
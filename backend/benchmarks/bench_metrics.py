@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark del coste de las métricas (METRICS_ENABLED)
+
+Ejecuta las mismas peticiones GraphQL de extremo a extremo (middleware ASGI,
+ejecución, resolvers y SQL contra una SQLite temporal con datos sintéticos)
+con las métricas activadas y desactivadas en rondas emparejadas (orden ABBA,
+sin recolector de basura durante cada ronda). El sobrecoste es la media de la
+diferencia relativa de cada pareja con su intervalo de confianza del 95 %;
+con --control las dos mitades de cada pareja van sin métricas y el resultado
+es el ruido de la máquina. El cache de Redis no interviene: todas las
+peticiones llegan a la base de datos. El objetivo es un sobrecoste < 2 %.
+
+Uso (desde backend/):
+    python benchmarks/bench_metrics.py [--rounds 60] [--requests 20] [--control]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+import logging  # noqa: E402
+import httpx  # noqa: E402
+import main  # noqa: E402
+from app.core.bulk import load_tables  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, engine  # noqa: E402
+from app.core.synthetic import SyntheticDataset  # noqa: E402
+
+QUERIES = {
+    "orders": "query Orders { orders(limit: 50) { orderId reference totalAmount status customer { businessName } } }",
+    "customers": "query Customers { customers(limit: 20) { customerId businessName stats { orderCount orderTotal } } }",
+    "connection": "query Page { ordersConnection(first: 50) { edges { node { orderId reference } } pageInfo { hasNextPage } } }",
+}
+
+
+async def run_round(client, query, requests):
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.post("/graphql/", json={"query": query})
+        assert response.status_code == 200 and "errors" not in response.json(), response.text
+    elapsed = time.perf_counter() - started
+    gc.enable()
+    return elapsed / requests * 1000
+
+
+async def compare(query, rounds, requests, control=False):
+    """Parejas (sin, con métricas) de ms por petición, una por ronda"""
+    transport = httpx.ASGITransport(app=main.app)
+    pairs = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await run_round(client, query, requests)  # calentamiento
+        for round_ in range(rounds):
+            timings = {}
+            # Orden ABBA para que la deriva de la máquina no favorezca a ninguno
+            for enabled in ((False, True) if round_ % 2 == 0 else (True, False)):
+                settings.metrics_enabled = enabled and not control
+                timings[enabled] = await run_round(client, query, requests)
+            pairs.append((timings[False], timings[True]))
+    settings.metrics_enabled = True
+    return pairs
+
+
+def overhead(pairs):
+    """Sobrecoste medio (%) de las parejas y semiamplitud de su IC del 95 %"""
+    ratios = [(on - off) / off * 100 for off, on in pairs]
+    return statistics.mean(ratios), 1.96 * statistics.stdev(ratios) / len(ratios) ** 0.5
+
+
+def main_benchmark(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=60)
+    parser.add_argument("--requests", type=int, default=20, help="peticiones por ronda")
+    parser.add_argument("--orders", type=int, default=5000, help="pedidos sintéticos")
+    parser.add_argument("--control", action="store_true", help="sin métricas en las dos mitades (mide el ruido)")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    load_tables(engine, SyntheticDataset(orders=args.orders).tables())
+    # Sin Redis: todas las peticiones ejecutan resolvers y SQL
+    main.cache_manager = None
+
+    print(f"ms por petición, mediana de {args.rounds} rondas de {args.requests} peticiones"
+          + (" (control: sin métricas en los dos lados)" if args.control else "") + "\n")
+    print(f"{'consulta':<14}{'sin métricas':>14}{'con métricas':>14}{'sobrecoste':>20}")
+    all_pairs = []
+    for name, query in QUERIES.items():
+        pairs = asyncio.run(compare(query, args.rounds, args.requests, args.control))
+        all_pairs.extend(pairs)
+        mean, margin = overhead(pairs)
+        off = statistics.median(pair[0] for pair in pairs)
+        on = statistics.median(pair[1] for pair in pairs)
+        print(f"{name:<14}{off:>14.3f}{on:>14.3f}{mean:>11.2f}% ± {margin:.2f}%")
+
+    mean, margin = overhead(all_pairs)
+    print(f"\n{'total':<14}{'':>28}{mean:>11.2f}% ± {margin:.2f}%")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark de contrato de los repositorios (SQL frente a la API de GoManage)
+
+Ejecuta la misma mezcla de consultas GraphQL (búsqueda, detalle con
+relaciones, listas filtradas y paginación keyset) con los repositorios SQL y
+con los de GoManage, comprueba que las dos fuentes devuelven lo mismo y
+mide la latencia (p50/p95) y las peticiones a la fuente (sentencias SQL o
+llamadas HTTP) de cada consulta. Sin cache de resultados: se mide la fuente.
+
+Por defecto usa una base SQLite temporal y una API de GoManage en memoria
+(FakeGoManage de conftest.py) con los mismos datos sintéticos; --latency
+simula la latencia de red de cada llamada a la API.
+
+Uso (desde backend/):
+    python benchmarks/bench_repositories.py --rows 2000 --iterations 50
+    python benchmarks/bench_repositories.py --latency 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='bench_repositories_'), 'bench.db')}")
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from app import repositories  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.gomanage import GoManageClient  # noqa: E402
+from app.models.models import Customer, Invoice, Product  # noqa: E402
+from app.repositories import create_repository, set_repository  # noqa: E402
+from app.schemas.graphql_schema import build_schema  # noqa: E402
+from app.schemas.loaders import create_loaders  # noqa: E402
+from conftest import FakeGoManage  # noqa: E402
+
+QUERIES = {
+    "search": '{ customers(search: "norte", limit: 20) { customerId businessName } }',
+    "detail": "{ customer(customerId: 7) { businessName invoices { invoiceId amount } } }",
+    "products": '{ products(search: "tornillo", limit: 50) { productId reference price } }',
+    "invoices": '{ invoices(fromDate: "2026-01-05", limit: 50) { invoiceId amount customer { businessName } } }',
+    "page": "{ invoicesConnection(first: 25) { edges { node { invoiceId } } pageInfo { endCursor } } }",
+}
+
+START = datetime(2026, 1, 1)
+WORDS = ["NORTE", "SUR", "CENTRAL", "LEVANTE", "ATLÁNTICO"]
+
+
+def dataset(rows):
+    """Clientes, productos y facturas sintéticos deterministas"""
+    customers = [
+        dict(customer_id=i, business_name=f"DISTRIBUCIONES {WORDS[i % len(WORDS)]} {i} SL",
+             vat_number=f"B{i:08d}", email=f"cliente{i}@example.com")
+        for i in range(1, rows + 1)
+    ]
+    products = [
+        dict(product_id=f"P{i:06d}", reference=f"{'TORNILLO' if i % 3 else 'TUERCA'} M{i % 12}",
+             description="Pieza de ferretería", price=round(0.05 * i, 2), stock=i % 100, active=i % 7 != 0)
+        for i in range(1, rows + 1)
+    ]
+    invoices = [
+        dict(invoice_id=i, reference=f"F-{i}", customer_id=1 + i % rows, amount=float(i % 1000),
+             status="pending", date=START + timedelta(hours=i))
+        for i in range(1, 3 * rows + 1)
+    ]
+    return {"customers": customers, "products": products, "invoices": invoices}
+
+
+def seed(data):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    for model, name in ((Customer, "customers"), (Product, "products"), (Invoice, "invoices")):
+        session.bulk_insert_mappings(model, data[name])
+    session.commit()
+    session.close()
+
+    fake = FakeGoManage()
+    for name, key in (("customers", "customer_id"), ("products", "product_id"), ("invoices", "invoice_id")):
+        for row in data[name]:
+            record = {field: value.isoformat() if isinstance(value, datetime) else value for field, value in row.items()}
+            fake.put(name, row[key], modified_at="2026-01-01T00:00:00+00:00", **record)
+    return fake
+
+
+class LatencyTransport(httpx.ASGITransport):
+    """ASGITransport con una espera fija por petición (latencia de red simulada)"""
+
+    def __init__(self, app, latency):
+        super().__init__(app=app)
+        self.latency = latency
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self.latency)
+        return await super().handle_async_request(request)
+
+
+async def measure(schema, iterations, counter):
+    results, timings, calls = {}, {}, {}
+    for name, query in QUERIES.items():
+        samples = []
+        for _ in range(iterations):
+            before = counter()
+            started = time.perf_counter()
+            result = await schema.execute_async(query, context_value={"loaders": create_loaders()})
+            samples.append((time.perf_counter() - started) * 1000)
+            calls[name] = counter() - before
+        if result.errors:
+            raise RuntimeError(f"{name}: {result.errors}")
+        samples.sort()
+        results[name] = result.data
+        timings[name] = (statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))])
+    return results, timings, calls
+
+
+async def run(args):
+    fake = seed(dataset(args.rows))
+    schema = build_schema()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(1))
+    repositories._repositories.clear()
+    sql = await measure(schema, args.iterations, lambda: len(statements))
+
+    client = GoManageClient(base_url="http://gomanage.test", transport=LatencyTransport(fake.app, args.latency / 1000))
+    for name in ("customers", "products", "invoices"):
+        set_repository(create_repository(name, "gomanage", client))
+    try:
+        api = await measure(schema, args.iterations, lambda: client.requests)
+    finally:
+        repositories._repositories.clear()
+        await client.aclose()
+    return sql, api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="clientes y productos sintéticos (facturas: el triple)")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, help="latencia simulada por llamada a la API (ms)")
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    (sql_results, sql_timings, sql_calls), (api_results, api_timings, api_calls) = asyncio.run(run(args))
+
+    print(f"{args.rows} clientes/productos, {3 * args.rows} facturas, {args.iterations} iteraciones, "
+          f"latencia API {args.latency:.0f} ms\n")
+    print(f"{'consulta':<10}{'SQL p50':>10}{'SQL p95':>10}{'sent.':>7}{'API p50':>10}{'API p95':>10}{'llam.':>7}  contrato")
+    mismatches = 0
+    for name in QUERIES:
+        same = sql_results[name] == api_results[name]
+        mismatches += not same
+        print(f"{name:<10}{sql_timings[name][0]:>10.2f}{sql_timings[name][1]:>10.2f}{sql_calls[name]:>7}"
+              f"{api_timings[name][0]:>10.2f}{api_timings[name][1]:>10.2f}{api_calls[name]:>7}  {'ok' if same else 'DISTINTO'}")
+    print("\nTiempos en ms; sent./llam.: sentencias SQL o llamadas HTTP por consulta")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
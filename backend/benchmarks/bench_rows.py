@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark de las filas de sólo lectura frente a las instancias del ORM
+
+Resuelve ``orders(limit: 1000)`` con el repositorio SQL actual (select() de
+Core y filas de app/core/rows.py) y con el camino anterior (Query del ORM
+con load_only, instancias en el identity map de la sesión), sin cache de
+resultados, y mide para cada uno:
+
+- latencia p50/p95 de la lectura del repositorio y de la consulta GraphQL
+  completa (lectura, DataLoader de customer y serialización);
+- memoria: pico de tracemalloc durante la lectura y bytes que siguen vivos
+  mientras el resolver conserva la lista.
+
+Por defecto usa una base SQLite temporal con datos sintéticos.
+
+Uso (desde backend/):
+    python benchmarks/bench_rows.py --orders 20000 --iterations 50
+    python benchmarks/bench_rows.py --limit 5000
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='bench_rows_'), 'bench.db')}")
+
+from app import repositories  # noqa: E402
+from app.core.database import Base, SessionLocal, engine, run_session  # noqa: E402
+from app.models.models import Customer, Order  # noqa: E402
+from app.repositories import ENTITIES, SqlRepository, apply_conditions, load_columns, set_repository  # noqa: E402
+from app.schemas.graphql_schema import ORDER_SORT, build_schema  # noqa: E402
+from app.schemas.loaders import create_loaders  # noqa: E402
+
+COLUMNS = ["order_id", "reference", "status", "total_amount", "created_at", "customer_id"]
+QUERY = "{ orders(limit: %d) { orderId reference status totalAmount createdAt customer { businessName } } }"
+
+
+class OrmRepository(SqlRepository):
+    """Repositorio SQL con el camino anterior: instancias del ORM con load_only"""
+
+    async def list(self, conditions=(), sort=(), limit=None, columns=None):
+        def fetch(session):
+            query = load_columns(session.query(self.model), self.model, self.with_columns(columns))
+            query = apply_conditions(query, self.model, conditions)
+            if sort:
+                query = query.order_by(*[
+                    getattr(self.model, field[1:]).desc() if field.startswith("-") else getattr(self.model, field)
+                    for field in sort
+                ])
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
+
+        return await run_session(fetch)
+
+
+def seed(orders):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customers = max(1, orders // 20)
+    session.bulk_insert_mappings(Customer, [
+        dict(customer_id=i, business_name=f"CLIENTE {i} SL", vat_number=f"B{i:08d}") for i in range(1, customers + 1)
+    ])
+    start = datetime(2026, 1, 1)
+    session.bulk_insert_mappings(Order, [
+        dict(order_id=i, reference=f"ORD-{i}", customer_id=1 + i % customers, total_amount=float(i % 1000),
+             status="pending", notes="Entregar por la mañana", created_at=start + timedelta(minutes=i))
+        for i in range(1, orders + 1)
+    ])
+    session.commit()
+    session.close()
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+async def timed(call, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return percentiles(samples)
+
+
+async def memory(call):
+    """Pico de la llamada y bytes retenidos por su resultado"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = await call()
+    gc.collect()
+    retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+async def measure(repository, schema, args):
+    set_repository(repository)
+    query = QUERY % args.limit
+    fetch = lambda: repository.list((), ORDER_SORT, args.limit, COLUMNS)
+
+    async def execute():
+        result = await schema.execute_async(query, context_value={"loaders": create_loaders()})
+        if result.errors:
+            raise RuntimeError(result.errors)
+        return result.data
+
+    try:
+        data = await execute()
+        return {
+            "data": data,
+            "list": await timed(fetch, args.iterations),
+            "graphql": await timed(execute, args.iterations),
+            "memory": await memory(fetch),
+        }
+    finally:
+        repositories._repositories.clear()
+
+
+async def run(args):
+    seed(args.orders)
+    schema = build_schema()
+    return (
+        await measure(OrmRepository(ENTITIES["orders"]), schema, args),
+        await measure(SqlRepository(ENTITIES["orders"]), schema, args),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=10000, help="pedidos sintéticos (clientes: uno por cada 20)")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    orm, rows = asyncio.run(run(args))
+
+    print(f"orders(limit: {args.limit}) sobre {args.orders} pedidos, {args.iterations} iteraciones\n")
+    print(f"{'camino':<8}{'lista p50':>11}{'lista p95':>11}{'GraphQL p50':>13}{'GraphQL p95':>13}{'pico KiB':>10}{'retenido KiB':>14}")
+    for name, result in (("ORM", orm), ("filas", rows)):
+        peak, retained = result["memory"]
+        print(f"{name:<8}{result['list'][0]:>11.2f}{result['list'][1]:>11.2f}"
+              f"{result['graphql'][0]:>13.2f}{result['graphql'][1]:>13.2f}{peak / 1024:>10.0f}{retained / 1024:>14.0f}")
+    same = orm["data"] == rows["data"]
+    print(f"\nTiempos en ms; mismo resultado GraphQL: {'sí' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
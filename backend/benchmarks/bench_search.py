@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la búsqueda de productos
+
+Mide la latencia (p50/p95/p99) del autocompletado por prefijo y de la
+búsqueda por relevancia contra DATABASE_URL. El objetivo en PostgreSQL con
+la migración 0003 aplicada es < 10 ms en el autocompletado con 1M de
+productos. Con --products N carga antes N productos sintéticos si la tabla
+está vacía.
+
+Uso (desde backend/):
+    python benchmarks/bench_search.py --products 1000000
+    python benchmarks/bench_search.py --iterations 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.bulk import load_table  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.migrations import upgrade_database  # noqa: E402
+from app.core.synthetic import PRODUCT_WORDS, SyntheticDataset  # noqa: E402
+from app.models.models import Product  # noqa: E402
+from app.schemas.graphql_schema import PRODUCT_SEARCH, filter_products  # noqa: E402
+from app.schemas.search import ranked_search, typeahead  # noqa: E402
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))]
+    return statistics.median(samples), pick(0.95), pick(0.99)
+
+
+def measure(session, build, terms):
+    samples = []
+    for term in terms:
+        started = time.perf_counter()
+        build(session, term).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return percentiles(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=0, help="productos sintéticos a cargar si la tabla está vacía")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    upgrade_database()
+    session = SessionLocal()
+    total = session.query(Product).count()
+    if total == 0 and args.products:
+        dataset = SyntheticDataset(orders=1, products=args.products, seed=args.seed)
+        total = load_table(engine, "products", dataset.products())
+    dialect = engine.dialect.name
+
+    rng = random.Random(args.seed)
+    prefixes = [f"REF-{rng.randint(1, max(total, 1)):06d}"[:rng.randint(5, 9)] for _ in range(args.iterations)]
+    words = [rng.choice(PRODUCT_WORDS).lower() for _ in range(args.iterations)]
+
+    base = lambda s: filter_products(s.query(Product))
+    results = {
+        "typeahead": measure(session, lambda s, term: typeahead(base(s), Product, Product.reference, term, 10, dialect), prefixes),
+        "search": measure(session, lambda s, term: ranked_search(base(s), Product, PRODUCT_SEARCH, term, 20, dialect), words),
+    }
+    session.close()
+
+    print(f"{total} productos en {dialect}, {args.iterations} consultas\n")
+    print(f"{'consulta':<12}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}")
+    for name, (p50, p95, p99) in results.items():
+        print(f"{name:<12}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
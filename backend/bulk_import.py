@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Importación masiva de datos (COPY en PostgreSQL, lotes en SQLite)
+
+Ejemplos:
+    # Cargar <tabla>.csv / <tabla>.jsonl de un directorio
+    python bulk_import.py --dir datos/
+
+    # Generar y cargar 1.000.000 de pedidos sintéticos (deterministas por semilla)
+    python bulk_import.py --synthetic 1000000 --seed 42
+
+    # Generar los ficheros sin cargarlos
+    python bulk_import.py --synthetic 100000 --export datos/ --format jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from app.core.bulk import BATCH_SIZE, TABLES, copy_value, load_tables, read_records
+from app.core.database import engine
+from app.core.migrations import upgrade_database
+from app.core.rollups import reconcile
+from app.core.synthetic import SyntheticDataset
+
+
+def find_sources(directory):
+    """{tabla: registros} de los ficheros <tabla>.csv o <tabla>.jsonl del directorio"""
+    sources = {}
+    for name in TABLES:
+        for extension in ("csv", "jsonl"):
+            path = os.path.join(directory, f"{name}.{extension}")
+            if os.path.exists(path):
+                sources[name] = read_records(path)
+                break
+    return sources
+
+
+def export_tables(tables, directory, file_format="csv"):
+    """Escribir cada tabla en <directorio>/<tabla>.<formato>; devuelve {tabla: filas}"""
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    for name, records in tables.items():
+        path = os.path.join(directory, f"{name}.{file_format}")
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = None
+            for record in records:
+                if file_format == "jsonl":
+                    f.write(json.dumps({key: value.isoformat() if isinstance(value, datetime) else value
+                                        for key, value in record.items()}, ensure_ascii=False) + "\n")
+                else:
+                    if writer is None:
+                        writer = csv.DictWriter(f, fieldnames=list(record))
+                        writer.writeheader()
+                    writer.writerow({key: copy_value(value) for key, value in record.items()})
+                count += 1
+        counts[name] = count
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importación masiva de datos")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--dir", help="directorio con <tabla>.csv o <tabla>.jsonl")
+    source.add_argument("--synthetic", type=int, metavar="PEDIDOS", help="generar N pedidos sintéticos")
+    parser.add_argument("--seed", type=int, default=42, help="semilla de los datos sintéticos")
+    parser.add_argument("--export", metavar="DIR", help="escribir los datos sintéticos en DIR en lugar de cargarlos")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="formato de --export")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="filas por lote (bases sin COPY)")
+    parser.add_argument("--keep-indexes", action="store_true", help="no reconstruir índices en tablas vacías")
+    args = parser.parse_args(argv)
+
+    if args.dir:
+        tables = find_sources(args.dir)
+        if not tables:
+            print(f"❌ No hay ficheros de datos en {args.dir}")
+            return 1
+    else:
+        tables = SyntheticDataset(orders=args.synthetic, seed=args.seed).tables()
+
+    started = time.perf_counter()
+    if args.export:
+        counts = export_tables(tables, args.export, args.format)
+    else:
+        upgrade_database()
+        counts = load_tables(engine, tables, batch_size=args.batch_size, rebuild_indexes=not args.keep_indexes)
+        # COPY no pasa por el ORM: recalcular las tablas resumen
+        with engine.begin() as connection:
+            reconcile(connection)
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    for name, count in counts.items():
+        print(f"   {name}: {count}")
+    print(f"✅ {total} filas en {elapsed:.1f} s ({total / elapsed if elapsed else 0:.0f} filas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Configuración común de pytest
+
+Los tests usan una base de datos SQLite temporal; DATABASE_URL se fija antes
+de importar la aplicación porque el engine se crea al importar app.core.database.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import pytest
+
+_test_dir = tempfile.mkdtemp(prefix="docu_api_tests_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_test_dir, 'test.db')}")
+
+# test_graphql.py es un script contra un servidor en marcha, no un test de pytest
+collect_ignore = ["test_graphql.py"]
+
+
+class FakeRedis:
+    """Redis (cliente asyncio) en memoria con los comandos que usa CacheManager
+
+    Con down = True todos los comandos fallan con ConnectionError, como un
+    Redis caído.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.subscribers = {}
+        self.calls = 0
+        self.down = False
+
+    def __getattribute__(self, name):
+        # Contar los comandos enviados (para comprobar aciertos del L1)
+        if name not in ("data", "subscribers", "calls", "down", "__dict__", "__class__"):
+            object.__setattr__(self, "calls", object.__getattribute__(self, "calls") + 1)
+        return object.__getattribute__(self, name)
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("Redis no disponible")
+
+    async def ping(self):
+        self._check()
+        return True
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, nx=False, ex=None):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self._check()
+        self.data[key] = value
+
+    async def hget(self, key, field):
+        self._check()
+        return self.data.get(key, {}).get(field)
+
+    async def hset(self, key, field, value):
+        self._check()
+        self.data.setdefault(key, {})[field] = value
+
+    async def expire(self, key, ttl):
+        self._check()
+        return key in self.data
+
+    async def incr(self, key):
+        self._check()
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self)
+
+    async def publish(self, channel, message):
+        self._check()
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+
+    async def eval(self, script, numkeys, *args):
+        # Único script que usa la aplicación: el token bucket de presupuesto
+        from app.core.cache import TOKEN_BUCKET_SCRIPT
+        assert script == TOKEN_BUCKET_SCRIPT
+        self._check()
+        key, capacity, rate, cost = args[0], float(args[1]), float(args[2]), float(args[3])
+        now = time.time()
+        bucket = self.data.get(key, {})
+        tokens = float(bucket.get("tokens", capacity))
+        ts = float(bucket.get("ts", now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        allowed = 0
+        if tokens >= cost:
+            tokens -= cost
+            allowed = 1
+        self.data[key] = {"tokens": str(tokens), "ts": str(now)}
+        return [allowed, str(tokens)]
+
+    async def dbsize(self):
+        self._check()
+        return len(self.data)
+
+    async def info(self):
+        self._check()
+        return {}
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args) for name, args in self.commands]
+
+
+class FakePubSub:
+    """Suscripción con una cola por suscriptor"""
+
+    def __init__(self, client):
+        self.client = client
+        self.queue = asyncio.Queue()
+        self.channels = []
+
+    async def subscribe(self, *channels):
+        self.client._check()
+        for channel in channels:
+            self.client.subscribers.setdefault(channel, []).append(self.queue)
+            self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        for channel in self.channels:
+            self.client.subscribers[channel].remove(self.queue)
+        self.channels = []
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """CacheManager de la aplicación respaldado por FakeRedis"""
+    import main
+    from app.core.cache import CacheManager
+
+    cache_manager = CacheManager(client=FakeRedis())
+    monkeypatch.setattr(main, "cache_manager", cache_manager)
+    return cache_manager
+
+
+class FakeGoManage:
+    """API de GoManage en memoria (aplicación ASGI) para los tests de sincronización
+
+    Sigue el contrato de app/core/gomanage.py: ``GET /{entidad}`` con
+    modified_since, page y page_size y los filtros de los repositorios
+    (campo, campo_in, campo_gte, search, sort, after y fields). failures es el número
+    de respuestas 503 que se devuelven antes de volver a responder.
+    """
+
+    # Campos en los que busca search
+    SEARCH_FIELDS = {
+        "customers": ("business_name", "vat_number", "email"),
+        "products": ("reference", "description"),
+    }
+    PAGING = ("modified_since", "page", "page_size", "sort", "after", "search", "fields")
+
+    def __init__(self):
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+
+        self.records = {}
+        self.requests = []
+        self.failures = 0
+        self.app = Starlette(routes=[Route("/{entity}", self.list)])
+
+    def put(self, entity, key, **record):
+        """Crear o sustituir un registro (debe traer modified_at)"""
+        self.records.setdefault(entity, {})[key] = record
+
+    async def list(self, request):
+        from datetime import datetime
+        from starlette.responses import JSONResponse
+
+        entity = request.path_params["entity"]
+        params = request.query_params
+        self.requests.append((entity, dict(params)))
+        if self.failures:
+            self.failures -= 1
+            return JSONResponse({"error": "unavailable"}, status_code=503)
+
+        records = list(self.records.get(entity, {}).values())
+        if "modified_since" in params:
+            since = datetime.fromisoformat(params["modified_since"])
+            records = [record for record in records if datetime.fromisoformat(record["modified_at"]) >= since]
+        records = [record for record in records if self.matches(entity, record, params)]
+
+        sort = params["sort"].split(",") if "sort" in params else ["modified_at"]
+        fields = [field.lstrip("-") for field in sort]
+        descending = sort[0].startswith("-")
+        key = lambda record: tuple(self.comparable(record.get(field)) for field in fields)
+        records.sort(key=key, reverse=descending)
+        if "after" in params:
+            bound = tuple(self.comparable(value) for value in json.loads(params["after"]))
+            records = [record for record in records if (key(record) < bound if descending else key(record) > bound)]
+        page, page_size = int(params.get("page", 1)), int(params.get("page_size", 100))
+        items = records[(page - 1) * page_size:page * page_size]
+        if "fields" in params:
+            fields = params["fields"].split(",")
+            items = [{field: record.get(field) for field in fields} for record in items]
+        return JSONResponse({
+            "items": items,
+            "page": page,
+            "pages": max(1, -(-len(records) // page_size)),
+            "total": len(records),
+        })
+
+    @staticmethod
+    def text(value):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def comparable(value):
+        # Los None al principio; números y textos ISO se comparan por su valor
+        return (value is not None, value if isinstance(value, (int, float)) else FakeGoManage.text(value))
+
+    def matches(self, entity, record, params):
+        from app.core.database import strip_accents
+
+        for name, value in params.items():
+            if name == "search":
+                fields = self.SEARCH_FIELDS.get(entity, ())
+                if not any(strip_accents(value) in strip_accents(self.text(record.get(field))) for field in fields):
+                    return False
+            elif name in self.PAGING:
+                continue
+            elif name.endswith("_in"):
+                if self.text(record.get(name[:-3])) not in value.split(","):
+                    return False
+            elif name.endswith("_gte"):
+                if record.get(name[:-4]) is None or self.text(record.get(name[:-4])) < value:
+                    return False
+            elif self.text(record.get(name)) != value:
+                return False
+        return True
@@ -1,21 +1,58 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from starlette_graphene3 import GraphQLApp, make_playground_handler
-from app.core.database import engine, Base
-from app.core.cache import CacheManager
-from app.schemas.graphql_schema import schema
+from starlette_graphene3 import make_playground_handler
+from app.core.database import engine, get_pool_stats, run_session
+from app.api.export import router as export_router
+from app.api.graphql_app import CachedGraphQLApp
+from app.core.cache import cache_manager
+from app.core.config import settings
+from app.core import metrics
+from app.core.sync import sync_status
+from app.repositories import close_repositories
+from app.schemas.graphql_schema import get_schema
+from app.schemas.loaders import create_loaders
 import logging
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Crear tablas
-Base.metadata.create_all(bind=engine)
+async def refresh_sync_gauges():
+    """Releer sync_state para los gauges de /metrics (un fallo conserva la lectura anterior)"""
+    try:
+        metrics.sync_status_gauges.update(await run_session(sync_status))
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo leer el estado de la sincronización: {e}")
+
+async def watch_sync_status():
+    while True:
+        await asyncio.sleep(settings.metrics_sync_refresh)
+        await refresh_sync_gauges()
+
+# Arranque y parada: nada de trabajo al importar el módulo. Las tablas se
+# crean con las migraciones de Alembic antes de arrancar (start.py)
+@asynccontextmanager
+async def lifespan(app):
+    # Cache compartida (cliente Redis asíncrono con pool de conexiones)
+    await cache_manager.start()
+    # Construir el schema antes de la primera petición
+    graphql_app.schema
+    # Estado de la sincronización para /metrics, fuera del scrape (sin
+    # consultas al arrancar: la primera lectura llega tras METRICS_SYNC_REFRESH)
+    sync_watcher = asyncio.create_task(watch_sync_status())
+    yield
+    sync_watcher.cancel()
+    await cache_manager.close()
+    # Cliente HTTP de las entidades que se leen de GoManage (DATA_SOURCES)
+    await close_repositories()
 
 # Crear aplicación FastAPI
 app = FastAPI(
+    lifespan=lifespan,
     title="Docu API - Sistema de Gestión de Avisos y Pedidos",
     description="API GraphQL completa para gestión de avisos, clientes, productos, pedidos y facturas",
     version="2.0.0"
@@ -30,25 +67,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Inicializar cache
-cache_manager = CacheManager()
+# Latencia, código de estado y SQL de cada petición (expuestos en /metrics)
+app.add_middleware(metrics.MetricsMiddleware)
 
-# Contexto para GraphQL
-def get_context():
+# Contexto para GraphQL (los DataLoaders son por petición)
+def get_context(request):
     return {
+        'request': request,
         'cache_manager': cache_manager,
-        'db': engine
+        'db': engine,
+        'loaders': create_loaders()
     }
 
-# Configurar GraphQL
-graphql_app = GraphQLApp(
-    schema=schema,
+# Configurar GraphQL (schema construido al arrancar, documentos validados en cache + persisted queries).
+# Un GET con query se ejecuta y se cachea con ETag/Cache-Control; sin query muestra el playground
+graphql_app = CachedGraphQLApp(
+    schema=get_schema,
     context_value=get_context,
     on_get=make_playground_handler()
 )
 
 app.mount("/graphql", graphql_app)
 
+# Exportación masiva en streaming (NDJSON, CSV, Parquet)
+app.include_router(export_router)
+
 @app.get("/")
 async def root():
     return {
@@ -69,7 +112,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    cache_status = "connected" if cache_manager.connected else "disconnected"
+    cache_status = "connected" if await cache_manager.ping() else "disconnected"
     return {
         "status": "healthy",
         "database": "connected",
@@ -81,20 +124,35 @@ async def health_check():
 async def get_stats():
     """Endpoint para obtener estadísticas del sistema"""
     try:
-        cache_stats = cache_manager.get_stats()
+        cache_stats = await cache_manager.get_stats()
         return {
             "system": "Docu API",
             "version": "2.0.0",
             "cache": cache_stats,
+            "database_pool": get_pool_stats(),
+            "graphql_documents": graphql_app.documents.stats(),
+            "sync": await run_session(sync_status),
             "endpoints": {
                 "graphql": "/graphql",
                 "health": "/health",
-                "stats": "/stats"
+                "stats": "/stats",
+                "metrics": "/metrics",
+                "export": "/export/invoices, /export/orders"
             }
         }
     except Exception as e:
         return {"error": str(e)}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Métricas de rendimiento en formato Prometheus"""
+    body = (
+        metrics.registry.render()
+        + metrics.render_pool_stats(get_pool_stats())
+        + metrics.sync_status_gauges.render()
+    )
+    return PlainTextResponse(body, media_type=metrics.CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
@@ -0,0 +1,67 @@
+"""
+Entorno de Alembic
+
+Usa el engine y los modelos de la aplicación, así que las migraciones se
+ejecutan contra DATABASE_URL.
+"""
+
+from logging.config import fileConfig
+from alembic import context
+from app.core.database import Base, DATABASE_URL, engine
+import app.models.models  # noqa: F401  registrar las tablas en Base.metadata
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Ignorar en autogenerate los objetos de búsqueda creados con SQL (0003)"""
+    if reflected and compare_to is None:
+        if type_ == "column" and name == "search_vector":
+            return False
+        if type_ == "index" and name.endswith(("_trgm", "_prefix", "_search_vector")):
+            return False
+    return True
+
+
+def run_migrations_offline():
+    """Generar el SQL sin conectarse (alembic upgrade head --sql)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_object=include_object,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=DATABASE_URL.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+    with engine.connect() as connection:
+        _run(connection)
+
+
+def _run(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,145 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 08:08:01.441345
+
+Tablas de app/models/models.py tal y como las creaba Base.metadata.create_all.
+Las bases creadas así se marcan con esta revisión (ver app/core/migrations.py).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customers',
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('business_name', sa.String(length=100), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('email', sa.String(length=60), nullable=True),
+    sa.Column('vat_number', sa.String(length=18), nullable=True),
+    sa.Column('street_name', sa.String(length=55), nullable=True),
+    sa.Column('postal_code', sa.Integer(), nullable=True),
+    sa.Column('city', sa.String(length=30), nullable=True),
+    sa.Column('province_id', sa.Integer(), nullable=True),
+    sa.Column('country_id', sa.String(length=2), nullable=True),
+    sa.Column('phone', sa.String(length=18), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('customer_id'),
+    sa.UniqueConstraint('vat_number')
+    )
+    op.create_index(op.f('ix_customers_customer_id'), 'customers', ['customer_id'], unique=False)
+
+    op.create_table('products',
+    sa.Column('product_id', sa.String(length=24), nullable=False),
+    sa.Column('reference', sa.String(length=50), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.Column('stock', sa.Integer(), nullable=True),
+    sa.Column('active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('product_id')
+    )
+    op.create_index(op.f('ix_products_product_id'), 'products', ['product_id'], unique=False)
+
+    op.create_table('invoices',
+    sa.Column('invoice_id', sa.Integer(), nullable=False),
+    sa.Column('reference', sa.String(length=50), nullable=True),
+    sa.Column('customer_id', sa.Integer(), nullable=True),
+    sa.Column('customer_name', sa.String(length=100), nullable=True),
+    sa.Column('amount', sa.Float(), nullable=True),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ),
+    sa.PrimaryKeyConstraint('invoice_id')
+    )
+    op.create_index('ix_invoices_date_invoice_id', 'invoices', ['date', 'invoice_id'], unique=False)
+    op.create_index(op.f('ix_invoices_invoice_id'), 'invoices', ['invoice_id'], unique=False)
+
+    op.create_table('notices',
+    sa.Column('notice_id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=True),
+    sa.Column('title', sa.String(length=100), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('priority', sa.String(length=10), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('assigned_to', sa.String(length=50), nullable=True),
+    sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('resolution', sa.Text(), nullable=True),
+    sa.Column('resolved_date', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ),
+    sa.PrimaryKeyConstraint('notice_id')
+    )
+    op.create_index('ix_notices_created_date_notice_id', 'notices', ['created_date', 'notice_id'], unique=False)
+    op.create_index(op.f('ix_notices_notice_id'), 'notices', ['notice_id'], unique=False)
+
+    op.create_table('orders',
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('reference', sa.String(length=50), nullable=True),
+    sa.Column('customer_id', sa.Integer(), nullable=True),
+    sa.Column('order_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('delivery_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('total_amount', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_index('ix_orders_created_at_order_id', 'orders', ['created_at', 'order_id'], unique=False)
+    op.create_index('ix_orders_customer_id_created_at_order_id', 'orders', ['customer_id', 'created_at', 'order_id'], unique=False)
+    op.create_index(op.f('ix_orders_order_id'), 'orders', ['order_id'], unique=False)
+
+    op.create_table('order_items',
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=True),
+    sa.Column('product_id', sa.String(length=24), nullable=True),
+    sa.Column('quantity', sa.Integer(), nullable=True),
+    sa.Column('unit_price', sa.Float(), nullable=True),
+    sa.Column('total_price', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.order_id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.product_id'], ),
+    sa.PrimaryKeyConstraint('item_id')
+    )
+    op.create_index(op.f('ix_order_items_item_id'), 'order_items', ['item_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_order_items_item_id'), table_name='order_items')
+    op.drop_table('order_items')
+
+    op.drop_index(op.f('ix_orders_order_id'), table_name='orders')
+    op.drop_index('ix_orders_customer_id_created_at_order_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_order_id', table_name='orders')
+    op.drop_table('orders')
+
+    op.drop_index(op.f('ix_notices_notice_id'), table_name='notices')
+    op.drop_index('ix_notices_created_date_notice_id', table_name='notices')
+    op.drop_table('notices')
+
+    op.drop_index(op.f('ix_invoices_invoice_id'), table_name='invoices')
+    op.drop_index('ix_invoices_date_invoice_id', table_name='invoices')
+    op.drop_table('invoices')
+
+    op.drop_index(op.f('ix_products_product_id'), table_name='products')
+    op.drop_table('products')
+
+    op.drop_index(op.f('ix_customers_customer_id'), table_name='customers')
+    op.drop_table('customers')
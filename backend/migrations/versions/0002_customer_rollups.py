@@ -0,0 +1,49 @@
+"""customer rollups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 08:14:33.749640
+
+Tablas resumen de app/core/rollups.py. Se crean vacías: python reconcile_rollups.py
+las rellena con los pedidos y facturas existentes.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('customer_daily_sales',
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ),
+    sa.PrimaryKeyConstraint('customer_id', 'day', 'status')
+    )
+    op.create_table('customer_stats',
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('order_total', sa.Float(), nullable=False),
+    sa.Column('open_invoice_count', sa.Integer(), nullable=False),
+    sa.Column('open_invoice_balance', sa.Float(), nullable=False),
+    sa.Column('overdue_invoice_count', sa.Integer(), nullable=False),
+    sa.Column('reconciled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.customer_id'], ),
+    sa.PrimaryKeyConstraint('customer_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('customer_stats')
+    op.drop_table('customer_daily_sales')
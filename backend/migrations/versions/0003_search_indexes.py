@@ -0,0 +1,76 @@
+"""search indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 09:02:11.204518
+
+Búsqueda de texto de clientes y productos (app/schemas/search.py), sólo en
+PostgreSQL: extensiones pg_trgm y unaccent, configuración spanish_unaccent,
+columnas search_vector generadas e índices GIN de trigramas y de prefijo.
+En SQLite no hace nada (la búsqueda usa su alternativa local).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (tabla, columnas con peso para search_vector, columnas con índice de trigramas, columna de autocompletado)
+SEARCH_TABLES = [
+    ('customers', [('business_name', 'A'), ('name', 'B'), ('city', 'C')], ['business_name', 'vat_number', 'email'], 'business_name'),
+    ('products', [('reference', 'A'), ('description', 'B')], ['reference', 'description'], 'reference'),
+]
+
+
+def unaccented(column):
+    return f"immutable_unaccent(lower({column}))"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() no es IMMUTABLE y no se puede usar en índices; esta envoltura sí
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """)
+    op.execute("CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish)")
+    op.execute("""
+        ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+        ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem
+    """)
+
+    for table, weighted, trigram, prefix in SEARCH_TABLES:
+        vector = " || ".join(
+            f"setweight(to_tsvector('spanish_unaccent'::regconfig, coalesce({column}, '')), '{weight}')"
+            for column, weight in weighted
+        )
+        op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED")
+        op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)")
+        for column in trigram:
+            op.execute(f"CREATE INDEX ix_{table}_{column}_trgm ON {table} USING gin ({unaccented(column)} gin_trgm_ops)")
+        op.execute(f'CREATE INDEX ix_{table}_{prefix}_prefix ON {table} (({unaccented(prefix)}) COLLATE "C")')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, _, trigram, prefix in SEARCH_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{prefix}_prefix")
+        for column in trigram:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm")
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS spanish_unaccent")
+    op.execute("DROP FUNCTION IF EXISTS immutable_unaccent(text)")
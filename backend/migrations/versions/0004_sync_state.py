@@ -0,0 +1,40 @@
+"""sync state
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 09:02:11.418305
+
+Marcas de sincronización incremental desde GoManage (app/core/sync.py). La
+primera ejecución de sync_gomanage.py con la tabla vacía copia todo.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_state',
+    sa.Column('entity', sa.String(length=30), nullable=False),
+    sa.Column('high_water_mark', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('synced_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_rows', sa.Integer(), nullable=False),
+    sa.Column('last_pages', sa.Integer(), nullable=False),
+    sa.Column('last_duration', sa.Float(), nullable=False),
+    sa.Column('total_rows', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('last_error_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('entity')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_state')
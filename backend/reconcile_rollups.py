@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Reconciliación de las tablas resumen (rollups) de clientes
+
+Recalcula customer_daily_sales y customer_stats desde pedidos y facturas.
+Pensado para ejecutarse periódicamente (cron de Render) y tras cargas
+masivas; entre ejecuciones las tablas se mantienen de forma incremental.
+
+    python reconcile_rollups.py
+"""
+
+import sys
+import time
+from app.core.database import engine
+from app.core.rollups import reconcile
+
+
+def main():
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        counts = reconcile(connection)
+    elapsed = time.perf_counter() - started
+    for name, count in counts.items():
+        print(f"   {name}: {count}")
+    print(f"✅ Rollups reconciliados en {elapsed:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,9 @@ Configura la base de datos y inicia la aplicación
 import os
 import sys
 import logging
-from sqlalchemy import create_engine, text
-from app.core.database import Base, engine
+from sqlalchemy import text
+from app.core.database import engine
+from app.core.migrations import upgrade_database
 from app.core.config import settings
 
 logging.basicConfig(level=logging.INFO)
@@ -19,9 +20,9 @@ def setup_database():
     try:
         logger.info("🔧 Configurando base de datos...")
         
-        # Crear todas las tablas
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Tablas creadas exitosamente")
+        # Aplicar migraciones pendientes (antes de importar la aplicación)
+        upgrade_database()
+        logger.info("✅ Migraciones aplicadas")
         
         # Verificar conexión
         with engine.connect() as conn:
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Sincronización incremental de GoManage a la base de datos local
+
+Copia clientes, productos y facturas modificados desde la última ejecución
+(marca de agua en sync_state) e invalida el cache de las entidades con
+cambios. Pensado para ejecutarse cada pocos minutos (cron de Render).
+
+    python sync_gomanage.py                       # todas las entidades
+    python sync_gomanage.py --entity customers    # sólo clientes
+    python sync_gomanage.py --full                # ignorar la marca y copiarlo todo
+"""
+
+import argparse
+import asyncio
+import sys
+from app.core.cache import cache_manager
+from app.core.gomanage import GoManageError
+from app.core.sync import ENTITIES, run_sync
+
+
+async def sync(names, full):
+    try:
+        return await run_sync(names, full=full, cache_manager=cache_manager)
+    finally:
+        await cache_manager.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--entity", action="append", choices=list(ENTITIES),
+                        help="Entidad a sincronizar (se puede repetir; por defecto todas)")
+    parser.add_argument("--full", action="store_true", help="Copiar todos los registros, no sólo los modificados")
+    args = parser.parse_args(argv)
+
+    try:
+        reports = asyncio.run(sync(args.entity, args.full))
+    except GoManageError as e:
+        print(f"❌ {e}")
+        return 1
+    for report in reports:
+        mark = report.high_water_mark.isoformat() if report.high_water_mark else "-"
+        print(f"   {report.entity}: {report.rows} filas, {report.pages} páginas, "
+              f"{report.duration:.1f} s ({report.rows_per_second:.0f} filas/s), marca {mark}")
+    print(f"✅ Sincronización completada: {sum(report.rows for report in reports)} filas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Tests del modo asíncrono (DATABASE_ASYNC): mismos resultados que el camino síncrono
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Order
+from main import app
+
+QUERY = "{ orders(limit: 10) { orderId reference customer { businessName } } }"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="TECNOLOGÍA AVANZADA SA", vat_number="A87654321")
+    session.add(customer)
+    session.flush()
+    session.add_all([Order(reference=f"ORD-{i}", customer_id=customer.customer_id, total_amount=50.0) for i in range(5)])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def post(query):
+    with TestClient(app) as client:
+        body = client.post("/graphql", json={"query": query}).json()
+    assert "errors" not in body, body
+    return body["data"]
+
+
+def test_async_mode_matches_sync_mode(monkeypatch):
+    sync_data = post(QUERY)
+
+    monkeypatch.setattr(settings, "database_async", True)
+    async_data = post(QUERY)
+
+    assert len(async_data["orders"]) == 5
+    assert async_data == sync_data
+
+
+def test_create_order_in_async_mode(monkeypatch):
+    monkeypatch.setattr(settings, "database_async", True)
+    data = post('mutation { createOrder(customerId: 1, totalAmount: 10.5, reference: "ASYNC-1") { success order { reference } } }')
+
+    assert data["createOrder"]["success"] is True
+    assert data["createOrder"]["order"]["reference"] == "ASYNC-1"
@@ -0,0 +1,95 @@
+"""
+Tests de la carga masiva y del generador de datos sintéticos
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, inspect, select
+from app.core.bulk import CopyStream, load_table, load_tables
+from app.core.database import Base
+from app.core.synthetic import SyntheticDataset
+from app.models.models import Customer, Order, OrderItem, Product, Invoice
+from bulk_import import export_tables, find_sources
+
+
+@pytest.fixture
+def bulk_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def count(engine, model):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(model)).scalar()
+
+
+def test_synthetic_data_is_deterministic():
+    first = SyntheticDataset(orders=200, seed=7)
+    again = SyntheticDataset(orders=200, seed=7)
+    other = SyntheticDataset(orders=200, seed=8)
+
+    assert list(first.order_items()) == list(again.order_items())
+    assert list(first.invoices()) == list(again.invoices())
+    assert list(first.orders()) != list(other.orders())
+
+
+def test_synthetic_dataset_loads_with_consistent_keys(bulk_engine):
+    dataset = SyntheticDataset(orders=500, seed=1)
+
+    counts = load_tables(bulk_engine, dataset.tables(), batch_size=100)
+
+    assert counts["orders"] == count(bulk_engine, Order) == 500
+    assert counts["order_items"] == count(bulk_engine, OrderItem) > 500
+    assert counts["invoices"] == count(bulk_engine, Invoice)
+    with bulk_engine.connect() as conn:
+        orphans = conn.execute(
+            select(func.count()).select_from(OrderItem)
+            .outerjoin(Product, OrderItem.product_id == Product.product_id)
+            .where(Product.product_id.is_(None))
+        ).scalar()
+        assert orphans == 0
+        assert conn.execute(select(func.max(Order.customer_id))).scalar() <= count(bulk_engine, Customer)
+
+    # Los índices eliminados para la carga se han reconstruido
+    index_names = {index["name"] for index in inspect(bulk_engine).get_indexes("orders")}
+    assert "ix_orders_created_at_order_id" in index_names
+
+
+@pytest.mark.parametrize("file_format", ["csv", "jsonl"])
+def test_exported_files_round_trip(bulk_engine, tmp_path, file_format):
+    dataset = SyntheticDataset(orders=50, seed=3)
+    export_tables(dataset.tables(), str(tmp_path / "datos"), file_format)
+
+    load_tables(bulk_engine, find_sources(str(tmp_path / "datos")))
+
+    with bulk_engine.connect() as conn:
+        loaded = conn.execute(select(Order).order_by(Order.order_id)).mappings().all()
+        products = conn.execute(select(Product.product_id, Product.active).order_by(Product.product_id)).all()
+    expected = list(dataset.orders())
+    assert [row["created_at"] for row in loaded] == [order["created_at"] for order in expected]
+    assert [row["total_amount"] for row in loaded] == [order["total_amount"] for order in expected]
+    assert products == [(product["product_id"], product["active"]) for product in dataset.products()]
+
+
+def test_unknown_columns_are_rejected(bulk_engine):
+    with pytest.raises(ValueError):
+        load_table(bulk_engine, "customers", [{"customer_id": 1, "business_name": "X", "no_existe": 1}])
+
+
+def test_copy_stream_produces_csv_in_chunks():
+    records = [
+        {"product_id": "P1", "description": 'Con "comillas", y comas', "active": True, "stock": None},
+        {"product_id": "P2", "description": "Línea\nnueva", "active": False, "stock": 3},
+    ]
+    stream = CopyStream(records, ["product_id", "description", "active", "stock"])
+
+    chunks = []
+    while True:
+        chunk = stream.read(7)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    assert b"".join(chunks).decode("utf-8") == 'P1,"Con ""comillas"", y comas",true,\nP2,"Línea\nnueva",false,3\n'
+    assert stream.count == 2
@@ -0,0 +1,136 @@
+"""
+Tests de CacheManager.get_or_compute: single-flight, stale-while-revalidate y
+expiración anticipada
+"""
+
+import asyncio
+import time
+from app.core.cache import CacheManager, LOCK_PREFIX
+from app.core.config import settings
+from conftest import FakeRedis
+
+
+class Counter:
+    def __init__(self, value="calculado", delay=0.05):
+        self.calls = 0
+        self.value = value
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def test_concurrent_misses_compute_once():
+    cache_manager = CacheManager(client=FakeRedis())
+    compute = Counter()
+
+    async def scenario():
+        return await asyncio.gather(*[cache_manager.get_or_compute("orders_50_all_all", compute, ttl=60) for _ in range(20)])
+
+    results = asyncio.run(scenario())
+
+    assert compute.calls == 1
+    assert results == ["calculado"] * 20
+
+
+def test_expired_value_is_served_while_another_worker_recomputes():
+    redis_client = FakeRedis()
+    worker_a = CacheManager(client=redis_client)
+    worker_b = CacheManager(client=redis_client)
+    asyncio.run(worker_a.set("clave", {"v": "anterior", "x": time.time() - 1, "d": 0.01}, ttl=60))
+    # worker_a tiene el lock de recálculo
+    asyncio.run(redis_client.set(f"{LOCK_PREFIX}clave#", worker_a.instance_id, nx=True))
+    compute = Counter("nuevo")
+
+    value = asyncio.run(worker_b.get_or_compute("clave", compute, ttl=60))
+
+    assert value == "anterior"
+    assert compute.calls == 0
+
+
+def test_expired_value_is_recomputed_by_lock_holder():
+    cache_manager = CacheManager(client=FakeRedis())
+    asyncio.run(cache_manager.set("clave", {"v": "anterior", "x": time.time() - 1, "d": 0.01}, ttl=60))
+    compute = Counter("nuevo")
+
+    assert asyncio.run(cache_manager.get_or_compute("clave", compute, ttl=60)) == "nuevo"
+    assert asyncio.run(cache_manager.get_or_compute("clave", compute, ttl=60)) == "nuevo"
+    assert compute.calls == 1
+
+
+def test_miss_waits_for_other_worker_instead_of_recomputing():
+    redis_client = FakeRedis()
+    worker_a = CacheManager(client=redis_client)
+    worker_b = CacheManager(client=redis_client)
+    asyncio.run(redis_client.set(f"{LOCK_PREFIX}clave#", worker_a.instance_id, nx=True))
+    compute = Counter("de b")
+
+    async def scenario():
+        async def worker_a_finishes():
+            await asyncio.sleep(0.1)
+            await worker_a.set("clave", {"v": "de a", "x": time.time() + 60, "d": 0.1}, ttl=60)
+
+        value, _ = await asyncio.gather(worker_b.get_or_compute("clave", compute, ttl=60), worker_a_finishes())
+        return value
+
+    assert asyncio.run(scenario()) == "de a"
+    assert compute.calls == 0
+
+
+def test_miss_waits_for_a_slow_lock_holder():
+    redis_client = FakeRedis()
+    worker_a = CacheManager(client=redis_client)
+    worker_b = CacheManager(client=redis_client)
+    lock_key = f"{LOCK_PREFIX}clave#"
+    asyncio.run(redis_client.set(lock_key, worker_a.instance_id, nx=True))
+    compute = Counter("de b")
+
+    async def scenario():
+        async def worker_a_finishes():
+            # Origen lento: más que los 2 s que esperaba antes un fallo completo
+            await asyncio.sleep(2.2)
+            await worker_a.set("clave", {"v": "de a", "x": time.time() + 60, "d": 2.2}, ttl=60)
+            await worker_a._release_lock(lock_key)
+
+        value, _ = await asyncio.gather(worker_b.get_or_compute("clave", compute, ttl=60), worker_a_finishes())
+        return value
+
+    assert asyncio.run(scenario()) == "de a"
+    assert compute.calls == 0
+
+
+def test_miss_computes_when_the_lock_holder_gives_up(monkeypatch):
+    redis_client = FakeRedis()
+    worker_a = CacheManager(client=redis_client)
+    worker_b = CacheManager(client=redis_client)
+    lock_key = f"{LOCK_PREFIX}clave#"
+    asyncio.run(redis_client.set(lock_key, worker_a.instance_id, nx=True))
+
+    async def scenario():
+        async def worker_a_fails():
+            await asyncio.sleep(0.1)
+            await worker_a._release_lock(lock_key)
+
+        value, _ = await asyncio.gather(worker_b.get_or_compute("clave", Counter("de b"), ttl=60), worker_a_fails())
+        return value
+
+    assert asyncio.run(scenario()) == "de b"
+
+    # Lock de un worker caído: se calcula cuando caduca
+    monkeypatch.setattr(settings, "cache_lock_ttl", 0.2)
+    asyncio.run(redis_client.set(f"{LOCK_PREFIX}otra#", worker_a.instance_id, nx=True))
+    started = time.monotonic()
+    assert asyncio.run(worker_b.get_or_compute("otra", Counter("de b"), ttl=60)) == "de b"
+    assert time.monotonic() - started >= 0.2
+
+
+def test_probabilistic_early_expiration():
+    cache_manager = CacheManager(client=FakeRedis())
+    # Falta 1 s para caducar, pero el cálculo cuesta 10 s: con beta alto se recalcula
+    asyncio.run(cache_manager.set("clave", {"v": "anterior", "x": time.time() + 1, "d": 10.0}, ttl=60))
+    compute = Counter("nuevo", delay=0)
+
+    assert asyncio.run(cache_manager.get_or_compute("clave", compute, ttl=60, beta=1000)) == "nuevo"
+    assert compute.calls == 1
@@ -0,0 +1,154 @@
+"""
+Tests del cache en dos niveles: L1 en memoria delante de Redis
+"""
+
+import asyncio
+import time
+from fastapi.testclient import TestClient
+import main
+from app.core.cache import CacheManager, LocalCache
+from conftest import FakePipeline, FakeRedis
+
+
+def make_manager(client, **kwargs):
+    return CacheManager(client=client, local_cache=LocalCache(**kwargs))
+
+
+def test_l1_hit_does_not_touch_redis():
+    redis_client = FakeRedis()
+    cache_manager = make_manager(redis_client)
+
+    async def scenario():
+        await cache_manager.start()
+        await cache_manager.set("products_100_all", {"c": ["product_id"], "r": [["P1"]]}, ttl=60, variant="product_id", tags=["entity:products"])
+        calls = redis_client.calls
+        value = await cache_manager.get("products_100_all", variant="product_id", tags=["entity:products"])
+        assert redis_client.calls == calls
+        stats = await cache_manager.get_stats()
+        await cache_manager.close()
+        return value, stats
+
+    value, stats = asyncio.run(scenario())
+
+    assert value == {"c": ["product_id"], "r": [["P1"]]}
+    assert stats["l1"]["hits"] == 2  # versión de la etiqueta + valor
+
+
+def test_l1_is_off_until_subscribed():
+    redis_client = FakeRedis()
+    cache_manager = make_manager(redis_client)
+
+    async def scenario():
+        await cache_manager.set("clave", 1)
+        calls = redis_client.calls
+        assert await cache_manager.get("clave") == 1
+        return redis_client.calls - calls
+
+    assert asyncio.run(scenario()) > 0
+    assert cache_manager.local.stats()["size"] == 0
+
+
+def test_invalidation_reaches_other_workers():
+    redis_client = FakeRedis()
+    worker_a = make_manager(redis_client)
+    worker_b = make_manager(redis_client)
+
+    async def scenario():
+        await worker_a.start()
+        await worker_b.start()
+        await worker_b.set("orders_50_all_all", ["pedido"], ttl=60, tags=["entity:orders"])
+        assert await worker_b.get("orders_50_all_all", tags=["entity:orders"]) == ["pedido"]
+
+        await worker_a.invalidate_tags("entity:orders")
+        await asyncio.sleep(0.05)  # entrega del mensaje pub/sub
+
+        value = await worker_b.get("orders_50_all_all", tags=["entity:orders"])
+        await worker_a.close()
+        await worker_b.close()
+        return value
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_reads_during_invalidation_do_not_restore_old_versions():
+    redis_client = FakeRedis()
+    cache_manager = make_manager(redis_client)
+    pipeline = redis_client.pipeline
+
+    class SlowPipeline(FakePipeline):
+        async def execute(self):
+            # Una petición concurrente del mismo worker lee la versión antes del INCR
+            await cache_manager.get("orders_50_all_all", tags=["entity:orders"])
+            return await super().execute()
+
+    async def scenario():
+        await cache_manager.start()
+        await cache_manager.set("orders_50_all_all", ["pedido"], ttl=60, tags=["entity:orders"])
+        redis_client.pipeline = lambda: SlowPipeline(redis_client)
+        await cache_manager.invalidate_tags("entity:orders")
+        await asyncio.sleep(0.05)  # entrega del mensaje pub/sub (propio, se ignora)
+        redis_client.pipeline = pipeline
+        value = await cache_manager.get("orders_50_all_all", tags=["entity:orders"])
+        await cache_manager.close()
+        return value
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_deleted_keys_are_dropped_from_every_l1():
+    redis_client = FakeRedis()
+    worker_a = make_manager(redis_client)
+    worker_b = make_manager(redis_client)
+
+    async def scenario():
+        await worker_a.start()
+        await worker_b.start()
+        await worker_b.set("clave", 1, variant="x")
+
+        await worker_a.delete("clave")
+        await asyncio.sleep(0.05)
+
+        value = await worker_b.get("clave", variant="x")
+        await worker_a.close()
+        await worker_b.close()
+        return value
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_l1_is_bounded_by_size_and_ttl():
+    local = LocalCache(max_items=2, ttl=60)
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+
+    assert local.get("b") == (False, None)
+    assert local.get("a") == (True, 1)
+    assert local.stats()["evictions"] == 1
+
+    local.set("d", 4, ttl=0)
+    time.sleep(0.01)
+    assert local.get("d") == (False, None)
+
+
+def test_tier_counters_in_graphql(monkeypatch):
+    cache_manager = make_manager(FakeRedis())
+    monkeypatch.setattr(main, "cache_manager", cache_manager)
+
+    async def scenario():
+        await cache_manager.set("k", 1)
+        await cache_manager.get("k")
+        cache_manager.local.clear()
+        await cache_manager.get("k")
+        await cache_manager.get("no-existe")
+
+    # El arranque de la aplicación suscribe el L1; el escenario corre en su event loop
+    with TestClient(main.app) as client:
+        client.portal.call(scenario)
+        body = client.post("/graphql", json={"query": "{ cacheStats { connected l1 { hits misses evictions size } l2 { hits misses } circuitBreaker { state } } }"}).json()
+
+    stats = body["data"]["cacheStats"]
+    assert stats["l1"] == {"hits": 1, "misses": 2, "evictions": 0, "size": 1}
+    assert stats["l2"] == {"hits": 1, "misses": 1}
+    assert stats["circuitBreaker"] == {"state": "closed"}
@@ -0,0 +1,76 @@
+"""
+Tests de los DataLoaders: el número de sentencias SQL de una consulta anidada
+no depende del número de pedidos devueltos
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Product, Order, OrderItem
+from main import app
+
+ORDERS_QUERY = """
+query ($limit: Int) {
+    orders(limit: $limit) {
+        orderId
+        customer { businessName }
+        orderItems { product { reference } }
+    }
+}
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customers = [Customer(business_name=f"CLIENTE {i} SL", vat_number=f"B000000{i:02d}") for i in range(5)]
+    products = [Product(product_id=f"PROD{i:03d}", reference=f"REF-{i:03d}", price=10.0 * (i + 1)) for i in range(5)]
+    session.add_all(customers + products)
+    session.flush()
+    for i in range(40):
+        order = Order(reference=f"ORD-{i}", customer_id=customers[i % 5].customer_id, total_amount=100.0)
+        session.add(order)
+        session.flush()
+        for product in products[: (i % 3) + 1]:
+            session.add(OrderItem(order_id=order.order_id, product_id=product.product_id, quantity=1, unit_price=product.price, total_price=product.price))
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def run_counting_statements(limit):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with TestClient(app) as client:
+            response = client.post("/graphql", json={"query": ORDERS_QUERY, "variables": {"limit": limit}})
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    body = response.json()
+    assert "errors" not in body, body
+    return body["data"]["orders"], statements
+
+
+def test_nested_relationships_are_resolved():
+    orders, _ = run_counting_statements(10)
+    assert len(orders) == 10
+    for order in orders:
+        assert order["customer"]["businessName"].startswith("CLIENTE")
+        assert order["orderItems"]
+        assert all(item["product"]["reference"].startswith("REF-") for item in order["orderItems"])
+
+
+def test_statement_count_is_constant_regardless_of_limit():
+    _, few = run_counting_statements(2)
+    _, many = run_counting_statements(40)
+
+    # pedidos + clientes + items + productos: una consulta por nivel
+    assert len(few) == len(many) == 4
@@ -0,0 +1,132 @@
+"""
+Tests de la exportación en streaming de facturas y pedidos
+"""
+
+import csv
+import io
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+import main
+from app.core import export
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Invoice, Order, OrderItem, Product
+
+BASE = datetime(2025, 1, 1)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customers = [Customer(business_name=f"CLIENTE {i}", vat_number=f"B9300000{i}") for i in range(2)]
+    session.add_all(customers)
+    session.add(Product(product_id="P1", reference="REF-1", price=10.0))
+    session.flush()
+    session.add_all([
+        Invoice(reference=f"FAC-{i}", customer_id=customers[i % 2].customer_id, amount=10.0 * i,
+                status="paid" if i % 3 == 0 else "pending", date=BASE + timedelta(days=i))
+        for i in range(120)
+    ])
+    orders = [Order(reference=f"ORD-{i}", customer_id=customers[0].customer_id, total_amount=20.0, status="pending",
+                    order_date=BASE + timedelta(days=i)) for i in range(3)]
+    session.add_all(orders)
+    session.flush()
+    session.add_all([
+        OrderItem(order_id=orders[0].order_id, product_id="P1", quantity=1, unit_price=10.0, total_price=10.0),
+        OrderItem(order_id=orders[0].order_id, product_id="P1", quantity=1, unit_price=10.0, total_price=10.0),
+        OrderItem(order_id=orders[1].order_id, product_id="P1", quantity=2, unit_price=10.0, total_price=20.0),
+    ])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_invoices_ndjson_with_filters():
+    with TestClient(main.app) as client:
+        response = client.get("/export/invoices", params={"from_date": "2025-02-01", "to_date": "2025-03-01", "status": "pending"})
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-length" not in response.headers
+    assert response.headers["content-disposition"] == 'attachment; filename="invoices.ndjson"'
+    assert [row["reference"] for row in rows] == [f"FAC-{i}" for i in range(31, 59) if i % 3 != 0]
+    assert rows[0]["date"].startswith("2025-02-01")
+
+
+def test_invoices_csv_is_chunked(monkeypatch):
+    monkeypatch.setattr(export, "YIELD_PER", 10)
+    monkeypatch.setattr(export, "CHUNK_SIZE", 256)
+
+    chunks = list(export.export_chunks(engine, "invoices", "csv"))
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+
+    assert len(chunks) > 10
+    assert len(rows) == 120
+    assert rows[1]["reference"] == "FAC-1" and rows[1]["amount"] == "10.0"
+
+
+def test_orders_nest_their_items_in_ndjson_and_repeat_them_in_csv(monkeypatch):
+    # Lotes pequeños: un pedido cuyas líneas caen en dos lotes sigue siendo una fila
+    monkeypatch.setattr(export, "YIELD_PER", 1)
+    with TestClient(main.app) as client:
+        ndjson = client.get("/export/orders").text
+        flat = client.get("/export/orders", params={"format": "csv"}).text
+
+    orders = [json.loads(line) for line in ndjson.splitlines()]
+    assert [(order["reference"], len(order["items"])) for order in orders] == [("ORD-0", 2), ("ORD-1", 1), ("ORD-2", 0)]
+    assert orders[1]["items"][0]["quantity"] == 2
+    rows = list(csv.DictReader(io.StringIO(flat)))
+    assert [(row["reference"], row["item_quantity"]) for row in rows] == [("ORD-0", "1"), ("ORD-0", "1"), ("ORD-1", "2"), ("ORD-2", "")]
+
+
+def test_date_filters_use_created_at_when_order_date_is_null():
+    session = SessionLocal()
+    created = Order(reference="ORD-API", customer_id=1, total_amount=5.0, status="pending",
+                    created_at=BASE + timedelta(days=10))
+    session.add(created)
+    session.commit()
+    try:
+        with TestClient(main.app) as client:
+            ndjson = client.get("/export/orders", params={"from_date": "2025-01-02", "to_date": "2025-02-01"}).text
+        assert [json.loads(line)["reference"] for line in ndjson.splitlines()] == ["ORD-1", "ORD-2", "ORD-API"]
+    finally:
+        session.delete(created)
+        session.commit()
+        session.close()
+
+
+def test_invoices_parquet():
+    pq = pytest.importorskip("pyarrow.parquet")
+    with TestClient(main.app) as client:
+        response = client.get("/export/invoices", params={"format": "parquet", "customer_id": 1})
+
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 60
+    assert table.schema.field("amount").type == "double"
+    assert table.column("reference").to_pylist()[:2] == ["FAC-0", "FAC-2"]
+
+
+def test_invalid_arguments_are_rejected():
+    with TestClient(main.app) as client:
+        assert client.get("/export/invoices", params={"format": "xlsx"}).status_code == 422
+        assert client.get("/export/invoices", params={"from_date": "ayer"}).status_code == 400
+
+
+def test_memory_does_not_grow_with_the_number_of_rows(monkeypatch):
+    monkeypatch.setattr(export, "YIELD_PER", 20)
+
+    def peak(limit):
+        statement = export.invoice_query().limit(limit)
+        tracemalloc.start()
+        for _ in export.ndjson_chunks(export.stream_batches(engine, statement)):
+            pass
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_bytes
+
+    peak(20)  # calentar la caché de sentencias
+    assert peak(120) < peak(20) * 1.5 + 64 * 1024
@@ -0,0 +1,201 @@
+"""
+Tests de la sincronización incremental con GoManage contra una API falsa
+(FakeGoManage): carga inicial paginada, cambios desde la marca de agua,
+rollups de facturas, reintentos y lag/rendimiento en /stats y /metrics
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import main
+from app.core import gomanage
+from app.core.database import Base, engine, SessionLocal
+from app.core.gomanage import GoManageClient, GoManageError
+from app.core.sync import ENTITIES, run_sync, sync_status
+from app.models.models import Customer, CustomerStats, Invoice, Product, SyncState
+from conftest import FakeGoManage
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+FUTURE = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+
+
+def at(minutes):
+    return (START + timedelta(minutes=minutes)).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def tables(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(gomanage, "RETRY_BACKOFF", 0)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def api():
+    fake = FakeGoManage()
+    for i in range(25):
+        fake.put("customers", i + 1, customer_id=i + 1, business_name=f"CLIENTE {i}",
+                 vat_number=f"B9600{i:04d}", modified_at=at(i), ignored_field="x")
+    for i in range(7):
+        fake.put("products", f"P{i}", product_id=f"P{i}", reference=f"REF-{i}",
+                 price=str(i + 0.5), active=True, modified_at=at(i))
+    for i in range(5):
+        fake.put("invoices", i + 1, invoice_id=i + 1, invoice_number=f"F-{i}", customer_id=1,
+                 amount=100.0, status="pending", due_date=FUTURE, modified_at=at(i))
+    return fake
+
+
+def sync(fake, **options):
+    async def scenario():
+        client = GoManageClient(base_url="http://gomanage.test", transport=httpx.ASGITransport(app=fake.app))
+        async with client:
+            return await run_sync(client=client, page_size=10, batch_size=8, **options)
+    return asyncio.run(scenario())
+
+
+def open_balance(customer_id):
+    session = SessionLocal()
+    try:
+        stats = session.get(CustomerStats, customer_id)
+        return (stats.open_invoice_count, stats.open_invoice_balance) if stats else (0, 0.0)
+    finally:
+        session.close()
+
+
+def test_initial_sync_copies_every_page(api):
+    reports = sync(api)
+
+    assert [(report.entity, report.rows, report.pages) for report in reports] == [
+        ("customers", 25, 3), ("products", 7, 1), ("invoices", 5, 1)
+    ]
+    session = SessionLocal()
+    try:
+        assert session.query(Customer).count() == 25
+        assert session.get(Product, "P3").price == 3.5
+        state = session.get(SyncState, "customers")
+        assert state.high_water_mark.replace(tzinfo=timezone.utc) == START + timedelta(minutes=24)
+        assert (state.last_rows, state.last_pages, state.total_rows) == (25, 3, 25)
+    finally:
+        session.close()
+    assert open_balance(1) == (5, 500.0)
+
+
+def test_incremental_sync_fetches_only_changes(api):
+    sync(api)
+    api.requests.clear()
+    api.put("customers", 3, customer_id=3, business_name="CLIENTE RENOMBRADO",
+            vat_number="B96000002", modified_at=at(100))
+    api.put("invoices", 2, invoice_id=2, invoice_number="F-1", customer_id=1,
+            amount=100.0, status="paid", due_date=FUTURE, modified_at=at(100))
+    api.put("invoices", 6, invoice_id=6, invoice_number="F-5", customer_id=2,
+            amount=40.0, status="pending", due_date=FUTURE, modified_at=at(101))
+
+    reports = {report.entity: report for report in sync(api, overlap=0)}
+
+    # Los cambios más el último registro de la marca (modified_since es inclusivo)
+    assert {entity: report.rows for entity, report in reports.items()} == {"customers": 2, "products": 1, "invoices": 3}
+    # Una sola página por entidad, filtrada desde la marca de agua
+    assert len(api.requests) == 3
+    assert all(params["modified_since"] for _, params in api.requests)
+    session = SessionLocal()
+    try:
+        assert session.get(Customer, 3).business_name == "CLIENTE RENOMBRADO"
+    finally:
+        session.close()
+    assert open_balance(1) == (4, 400.0)
+    assert open_balance(2) == (1, 40.0)
+
+
+def test_records_changed_while_paging_are_not_lost(api):
+    app = api.app
+
+    async def changing(scope, receive, send):
+        await app(scope, receive, send)
+        if scope["path"] == "/customers" and len(api.requests) == 1:
+            # El cliente 1 (ya leído) cambia: pasa al final y desplaza a los demás una posición
+            api.put("customers", 1, customer_id=1, business_name="CLIENTE 0 EDITADO",
+                    vat_number="B96000000", modified_at=at(200))
+
+    api.app = changing
+    report, = sync(api, names=["customers"])
+
+    assert report.pages == 3
+    session = SessionLocal()
+    try:
+        assert session.query(Customer).count() == 25
+        assert session.get(Customer, 1).business_name == "CLIENTE 0 EDITADO"
+        assert session.get(SyncState, "customers").high_water_mark.replace(tzinfo=timezone.utc) == START + timedelta(minutes=200)
+    finally:
+        session.close()
+
+
+def test_overlap_rereads_without_duplicating_rollups(api):
+    sync(api)
+    reports = {report.entity: report for report in sync(api, overlap=3600)}
+
+    assert reports["invoices"].rows == 5
+    assert open_balance(1) == (5, 500.0)
+
+
+def test_older_versions_never_overwrite_newer_rows(api):
+    sync(api)
+    session = SessionLocal()
+    session.get(Customer, 1).business_name = "EDITADO EN LOCAL"
+    session.get(Customer, 1).updated_at = START + timedelta(days=1)
+    session.commit()
+    session.close()
+
+    sync(api, full=True)
+
+    session = SessionLocal()
+    try:
+        assert session.get(Customer, 1).business_name == "EDITADO EN LOCAL"
+        assert session.get(Customer, 2).business_name == "CLIENTE 1"
+    finally:
+        session.close()
+
+
+def test_retries_unavailable_responses_and_records_errors(api):
+    api.failures = 2
+    reports = sync(api)
+    assert reports[0].rows == 25
+
+    api.failures = 10
+    with pytest.raises(GoManageError):
+        sync(api, names=["products"])
+    session = SessionLocal()
+    try:
+        state = session.get(SyncState, "products")
+        assert "503" in state.last_error
+        assert state.last_rows == 7
+    finally:
+        session.close()
+
+
+def test_unknown_entity_is_rejected(api):
+    with pytest.raises(ValueError):
+        sync(api, names=["suppliers"])
+    assert set(ENTITIES) == {"customers", "products", "invoices"}
+
+
+def test_lag_and_throughput_are_reported(api, fake_cache):
+    sync(api)
+    session = SessionLocal()
+    try:
+        synced_at = session.get(SyncState, "customers").synced_at.replace(tzinfo=timezone.utc)
+        status = {item["entity"]: item for item in sync_status(session, now=synced_at + timedelta(seconds=90))}
+    finally:
+        session.close()
+    assert status["customers"]["lag_seconds"] == 90
+    assert status["customers"]["last_rows"] == 25
+    assert status["customers"]["rows_per_second"] > 0
+
+    with TestClient(main.app) as client:
+        stats = client.get("/stats").json()
+        body = client.get("/metrics").text
+    assert [item["entity"] for item in stats["sync"]] == ["customers", "invoices", "products"]
+    assert 'gomanage_sync_last_rows{entity="customers"} 25' in body
+    assert 'gomanage_sync_lag_seconds{entity="invoices"}' in body
@@ -4,12 +4,100 @@ Script de prueba para verificar que la API GraphQL funciona correctamente
 Incluye pruebas específicas para la funcionalidad de pedidos (MCP)
 """
 
-import requests
 import json
 import sys
 
+# Consultas del script (también las usa benchmarks/bench_graphql_documents.py)
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+    __schema {
+        types {
+            name
+            kind
+        }
+    }
+}
+"""
+
+CUSTOMERS_QUERY = """
+query GetCustomers {
+    customers(limit: 5) {
+        customerId
+        businessName
+        vatNumber
+        email
+        city
+    }
+}
+"""
+
+PRODUCTS_QUERY = """
+query GetProducts {
+    products(limit: 5) {
+        productId
+        reference
+        description
+        price
+        stock
+        active
+    }
+}
+"""
+
+ORDERS_QUERY = """
+query GetOrders {
+    orders(limit: 10) {
+        orderId
+        reference
+        customer {
+            businessName
+            email
+        }
+        totalAmount
+        status
+        orderDate
+        notes
+    }
+}
+"""
+
+CREATE_ORDER_MUTATION = """
+mutation CreateTestOrder {
+    createOrder(
+        customerId: 1
+        totalAmount: 999.99
+        reference: "TEST-ORDER-001"
+        status: "pending"
+        notes: "Pedido de prueba desde script de testing"
+    ) {
+        success
+        message
+        order {
+            orderId
+            reference
+            totalAmount
+            status
+        }
+    }
+}
+"""
+
+CACHE_STATS_QUERY = """
+query GetCacheStats {
+    cacheStats {
+        type
+        connected
+        keys
+        memoryUsage
+        uptime
+        error
+    }
+}
+"""
+
 def test_graphql_endpoint(base_url="http://localhost:8000"):
     """Probar el endpoint GraphQL"""
+    import requests
     
     graphql_url = f"{base_url}/graphql"
     
@@ -33,18 +121,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 2: Schema introspection
     print("\n2️⃣ Verificando schema GraphQL...")
-    introspection_query = {
-        "query": """
-        query IntrospectionQuery {
-            __schema {
-                types {
-                    name
-                    kind
-                }
-            }
-        }
-        """
-    }
+    introspection_query = {"query": INTROSPECTION_QUERY}
     
     try:
         response = requests.post(graphql_url, json=introspection_query)
@@ -66,19 +143,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 3: Consultar clientes
     print("\n3️⃣ Probando consulta de clientes...")
-    customers_query = {
-        "query": """
-        query GetCustomers {
-            customers(limit: 5) {
-                customerId
-                businessName
-                vatNumber
-                email
-                city
-            }
-        }
-        """
-    }
+    customers_query = {"query": CUSTOMERS_QUERY}
     
     try:
         response = requests.post(graphql_url, json=customers_query)
@@ -99,20 +164,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 4: Consultar productos
     print("\n4️⃣ Probando consulta de productos...")
-    products_query = {
-        "query": """
-        query GetProducts {
-            products(limit: 5) {
-                productId
-                reference
-                description
-                price
-                stock
-                active
-            }
-        }
-        """
-    }
+    products_query = {"query": PRODUCTS_QUERY}
     
     try:
         response = requests.post(graphql_url, json=products_query)
@@ -132,24 +184,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 5: Consultar pedidos (FUNCIONALIDAD PRINCIPAL)
     print("\n5️⃣ Probando consulta de pedidos (FUNCIONALIDAD PRINCIPAL)...")
-    orders_query = {
-        "query": """
-        query GetOrders {
-            orders(limit: 10) {
-                orderId
-                reference
-                customer {
-                    businessName
-                    email
-                }
-                totalAmount
-                status
-                orderDate
-                notes
-            }
-        }
-        """
-    }
+    orders_query = {"query": ORDERS_QUERY}
     
     try:
         response = requests.post(graphql_url, json=orders_query)
@@ -172,28 +207,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 6: Crear un pedido nuevo
     print("\n6️⃣ Probando creación de pedido...")
-    create_order_mutation = {
-        "query": """
-        mutation CreateTestOrder {
-            createOrder(
-                customerId: 1
-                totalAmount: 999.99
-                reference: "TEST-ORDER-001"
-                status: "pending"
-                notes: "Pedido de prueba desde script de testing"
-            ) {
-                success
-                message
-                order {
-                    orderId
-                    reference
-                    totalAmount
-                    status
-                }
-            }
-        }
-        """
-    }
+    create_order_mutation = {"query": CREATE_ORDER_MUTATION}
     
     try:
         response = requests.post(graphql_url, json=create_order_mutation)
@@ -217,20 +231,7 @@ def test_graphql_endpoint(base_url="http://localhost:8000"):
     
     # Test 7: Estadísticas del cache
     print("\n7️⃣ Probando estadísticas del cache...")
-    cache_query = {
-        "query": """
-        query GetCacheStats {
-            cacheStats {
-                type
-                connected
-                keys
-                memoryUsage
-                uptime
-                error
-            }
-        }
-        """
-    }
+    cache_query = {"query": CACHE_STATS_QUERY}
     
     try:
         response = requests.post(graphql_url, json=cache_query)
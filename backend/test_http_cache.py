@@ -0,0 +1,149 @@
+"""
+Tests del cache HTTP de las consultas GraphQL por GET: respuestas completas
+en Redis, ETag/If-None-Match, Cache-Control según el TTL de las entidades y
+rechazo de las mutaciones
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+from graphql import parse
+from sqlalchemy import event
+import main
+from app.api.graphql_app import query_hash
+from app.core.config import settings
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Order
+from app.schemas.cache_policy import cache_policy
+from app.schemas.graphql_schema import get_schema
+
+ORDERS = "{ orders(limit: 5) { orderId reference customer { businessName } } }"
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    main.graphql_app.documents.clear()
+    main.graphql_app.policies.clear()
+    session = SessionLocal()
+    customer = Customer(business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B95000001")
+    session.add(customer)
+    session.flush()
+    session.add_all([Order(reference=f"ORD-{i}", customer_id=customer.customer_id, status="pending") for i in range(3)])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_get_query_is_cached_with_etag_and_ttl(fake_cache):
+    with TestClient(main.app) as client:
+        statements = []
+
+        def capture(*args):
+            statements.append(args[2])
+
+        event.listen(engine, "before_cursor_execute", capture)
+        first = client.get("/graphql", params={"query": ORDERS})
+        executed = len(statements)
+        # Mismo documento con otro formato: misma entrada normalizada
+        second = client.get("/graphql", params={"query": " ".join(ORDERS.split()).replace("{ ", "{\n  ")})
+        not_modified = client.get("/graphql", params={"query": ORDERS}, headers={"If-None-Match": first.headers["etag"]})
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert first.status_code == 200
+    assert len(first.json()["data"]["orders"]) == 3
+    assert first.headers["cache-control"].startswith(f"public, max-age={settings.cache_ttl_orders}")
+    assert second.content == first.content and second.headers["etag"] == first.headers["etag"]
+    assert len(statements) == executed
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == first.headers["etag"]
+
+
+def test_mutations_invalidate_cached_responses(fake_cache):
+    query = "{ customers { businessName } }"
+    mutation = 'mutation { createCustomer(businessName: "FERRETERÍA CENTRAL", vatNumber: "B10000003") { success } }'
+    with TestClient(main.app) as client:
+        before = client.get("/graphql", params={"query": query})
+        assert client.post("/graphql", json={"query": mutation}).json()["data"]["createCustomer"]["success"]
+        after = client.get("/graphql", params={"query": query}, headers={"If-None-Match": before.headers["etag"]})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert len(after.json()["data"]["customers"]) == 2
+
+
+def test_mutations_and_uncacheable_queries_over_get(fake_cache):
+    mutation = 'mutation { createCustomer(businessName: "X", vatNumber: "B1") { success } }'
+    with TestClient(main.app) as client:
+        rejected = client.get("/graphql", params={"query": mutation})
+        stats = client.get("/graphql", params={"query": "{ cacheStats { connected } }"})
+        invalid = client.get("/graphql", params={"query": "{ orders { missing } }"})
+        playground = client.get("/graphql", headers={"Accept": "text/html"})
+
+    assert rejected.status_code == 405 and rejected.headers["allow"] == "POST"
+    assert rejected.json()["errors"][0]["extensions"]["code"] == "METHOD_NOT_ALLOWED"
+    assert stats.status_code == 200 and stats.headers["cache-control"] == "no-store"
+    assert "etag" not in stats.headers
+    assert invalid.headers["cache-control"] == "no-store" and invalid.json()["errors"]
+    assert playground.headers["content-type"].startswith("text/html")
+
+
+def test_persisted_hash_and_auth_scope(fake_cache):
+    digest = query_hash(ORDERS)
+    extensions = json.dumps({"persistedQuery": {"version": 1, "sha256Hash": digest}})
+    with TestClient(main.app) as client:
+        missing = client.get("/graphql", params={"extensions": extensions}).json()
+        client.post("/graphql", json={"query": ORDERS, "extensions": json.loads(extensions)})
+        public = client.get("/graphql", params={"extensions": extensions})
+        private = client.get("/graphql", params={"extensions": extensions}, headers={settings.api_key_header: "secreta"})
+
+    assert missing["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert public.json()["data"] == private.json()["data"]
+    assert private.headers["cache-control"].startswith("private, ")
+    assert public.headers["vary"] == private.headers["vary"] == settings.api_key_header
+    responses = [key for key in fake_cache.client.data if "graphql_response:" in key]
+    assert len(responses) == 2
+
+
+def test_cache_hits_are_charged_a_nominal_cost(fake_cache, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_cost_refill_rate", 0.001)
+    monkeypatch.setattr(settings, "graphql_cached_response_cost", 1)
+    with TestClient(main.app) as client:
+        computed = client.get("/graphql", params={"query": ORDERS})
+        cost = computed.json()["extensions"]["cost"]["requested"]
+        hit = client.get("/graphql", params={"query": ORDERS}, headers={"If-None-Match": computed.headers["etag"]})
+        # Un acierto que ya no cabe en el presupuesto se rechaza como cualquier consulta
+        monkeypatch.setattr(settings, "graphql_cached_response_cost", settings.graphql_cost_bucket_capacity)
+        rejected = client.get("/graphql", params={"query": ORDERS})
+
+    assert hit.status_code == 304
+    assert rejected.status_code == 429 and rejected.headers["cache-control"] == "no-store"
+    assert rejected.json()["errors"][0]["extensions"]["code"] == "BUDGET_EXCEEDED"
+    remaining = rejected.json()["extensions"]["cost"]["remaining"]
+    assert settings.graphql_cost_bucket_capacity - cost - 1 <= remaining < settings.graphql_cost_bucket_capacity - cost
+
+
+def test_post_body_must_be_a_json_object(fake_cache):
+    with TestClient(main.app) as client:
+        form = client.post("/graphql", data={"query": ORDERS})
+        invalid = client.post("/graphql", content=b"{", headers={"Content-Type": "application/json"})
+        scalar = client.post("/graphql", json="{ orders { orderId } }")
+
+    assert form.status_code == invalid.status_code == scalar.status_code == 400
+    assert form.json()["errors"] == ["Content-type must be application/json"]
+    assert invalid.json()["errors"] == ["Request body is not a valid JSON"]
+
+
+def test_cache_policy_uses_the_shortest_ttl():
+    schema = get_schema().graphql_schema
+
+    detail = cache_policy(schema, parse("{ customer(customerId: 1) { orders { orderId } invoices { amount } } }"))
+    stats = cache_policy(schema, parse("{ orderStats { count } }"))
+    page = cache_policy(schema, parse("query Page { noticesConnection(first: 5) { edges { node { title } } } }"), "Page")
+
+    assert detail.tags == ("entity:customers", "entity:invoices", "entity:orders")
+    assert detail.max_age == min(settings.cache_ttl_customers, settings.cache_ttl_orders, settings.cache_ttl_invoices)
+    assert stats == (min(settings.cache_ttl_stats, settings.cache_ttl_orders), ("entity:orders",))
+    assert page == (settings.cache_ttl_notices, ("entity:notices",))
+    assert cache_policy(schema, parse("{ poolStats { engine } }")) is None
@@ -0,0 +1,92 @@
+"""
+Tests del generador de modelos y tipos a partir del diccionario heredado
+"""
+
+import asyncio
+import os
+from datetime import date
+import pytest
+from app.codegen.dictionary import column_type, parse_dictionary
+from app.codegen.generate import DICTIONARY_PATH, OUTPUT_DIR, is_current
+from app.core.database import SessionLocal, engine
+
+HEADER = "Tabla BD,Descripcion Tabla,Tag Tabla GraphQL,Campo BD,Tag Campo GraphQL,Tipo Dato,Formato,Campo personalizado de usuario,Etiqueta,Ayuda\r\n"
+
+
+@pytest.mark.parametrize("data_type, display_format, expected", [
+    ("character", "x(100)", "String(100)"),
+    ("character", "X(24)", "String(24)"),
+    ("character", "x", "String(1)"),
+    ("character", "99:99", "String(5)"),
+    ("character", "", "Text"),
+    ("decimal", "->>,>>>,>>9.999", "Numeric(11, 3)"),
+    ("decimal", ">>>,>>9.9<<", "Numeric(9, 3)"),
+    ("decimal", "-z,zzz,zzz,zz9.99", "Numeric(12, 2)"),
+    ("decimal", "", "Numeric"),
+    ("integer", ">>9", "Integer"),
+    ("integer", "99999999999", "BigInteger"),
+    ("int64", "99999999999999901696", "BigInteger"),
+    ("logical", "Si/No", "Boolean"),
+    ("date", "99/99/9999", "Date"),
+    ("datetime", "99/99/9999 HH:MM:SS", "DateTime"),
+])
+def test_progress_formats_map_to_sized_columns(data_type, display_format, expected):
+    assert column_type(data_type, display_format) == expected
+
+
+def test_quoted_and_multiline_records():
+    text = HEADER + (
+        '"atconav,Control de Avisos,notes,act_tmt,activity,decimal,""->>,>>>,>>9.999"",no,Actividad,Actividad"\r\n'
+        'atconav,Control de Avisos,notes,obs_avis,notes,character,x(800),no,Observaciones,"Texto\r\nen dos líneas"\r\n'
+        'atconav,Control de Avisos,notes,est_avis,notice_status,integer,>9,no,Estado,\r\n'
+        'atconav,Control de Avisos,notes,est2_avis,notice_status,integer,>9,no,Estado 2,\r\n'
+        'atconav,Control de Avisos,notes,Id_unico,unique_id,int64,,no,Id,\r\n'
+        'tipo-op,Tipos de operación,operation-types,tipo-op,pre-invoice,logical,si/no,yes,Tipo,\r\n'
+    )
+
+    notes, operations = parse_dictionary(text)
+
+    assert [field.attribute for field in notes.fields] == [
+        "activity", "notes", "notice_status", "notice_status_est2_avis", "unique_id"
+    ]
+    assert notes.fields[0].column_type == "Numeric(11, 3)"
+    assert notes.fields[1].help.splitlines() == ["Texto", "en dos líneas"]
+    assert notes.primary_key == ["unique_id"]
+    assert (operations.class_name, operations.fields[0].attribute) == ("OperationTypes", "pre_invoice")
+    assert operations.fields[0].user_defined
+    # Sin identificador: la identidad es la fila completa
+    assert operations.primary_key == ["pre_invoice"]
+
+
+@pytest.mark.skipif(not os.path.exists(DICTIONARY_PATH), reason="diccionario no disponible")
+def test_generated_files_are_up_to_date():
+    assert is_current(DICTIONARY_PATH, OUTPUT_DIR)
+
+
+def test_generated_models_and_schema_query_legacy_tables():
+    from app.generated.legacy_models import AttachedFile, SalesOrder
+    from app.schemas.graphql_schema import build_schema
+
+    assert SalesOrder.__table__.name == "gvpccab"
+    assert SalesOrder.__table__.c["cod_cli"].type.__class__.__name__ == "Integer"
+    assert AttachedFile.__table__.c["des_pgd"].type.length == 200
+
+    AttachedFile.__table__.create(bind=engine, checkfirst=True)
+    session = SessionLocal()
+    session.add_all([
+        AttachedFile(unique_id=1, description="Plano de la obra", date=date(2025, 1, 10), file_name="plano.pdf"),
+        AttachedFile(unique_id=2, description="Factura escaneada", date=date(2025, 2, 1), file_name="factura.pdf"),
+    ])
+    session.commit()
+    session.close()
+
+    schema = build_schema(legacy=True)
+    try:
+        result = asyncio.run(schema.execute_async(
+            '{ legacy { attachedFile(filter: {descriptionContains: "obra", dateGte: "2025-01-01"}) { uniqueId fileName date } } }'
+        ))
+    finally:
+        AttachedFile.__table__.drop(bind=engine)
+
+    assert result.errors is None
+    assert result.data == {"legacy": {"attachedFile": [{"uniqueId": 1.0, "fileName": "plano.pdf", "date": "2025-01-10"}]}}
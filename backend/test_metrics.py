@@ -0,0 +1,157 @@
+"""
+Tests de las métricas de rendimiento: histogramas por petición, operación y
+resolver, SQL por petición, cache por prefijo y el endpoint /metrics
+"""
+
+import asyncio
+import re
+import time
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+import main
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Order
+
+QUERY = "query RecentOrders { orders(limit: 10) { orderId reference customer { businessName } } }"
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customers = [Customer(business_name=f"CLIENTE {i}", vat_number=f"B9400000{i}") for i in range(2)]
+    session.add_all(customers)
+    session.flush()
+    session.add_all([Order(reference=f"ORD-{i}", customer_id=customers[i % 2].customer_id, total_amount=10.0) for i in range(4)])
+    session.commit()
+    session.close()
+    metrics.registry.clear()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def sample(text, name, **labels):
+    """Valor de una muestra de /metrics (None si no existe)"""
+    for line in text.splitlines():
+        match = re.match(r"^([a-zA-Z_:]+)(?:\{(.*)\})? (\S+)$", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if found == {key: str(value) for key, value in labels.items()}:
+            return float(match.group(3))
+    return None
+
+
+def test_metrics_endpoint_reports_requests_sql_and_resolvers(fake_cache):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestClient(main.app) as client:
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            assert "errors" not in client.post("/graphql/", json={"query": QUERY}).json()
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert sample(text, "http_requests_total", method="POST", route="/graphql", status=200) == 1
+    assert sample(text, "http_request_duration_seconds_count", method="POST", route="/graphql") == 1
+    assert sample(text, "http_request_duration_seconds_bucket", method="POST", route="/graphql", le="+Inf") == 1
+    assert sample(text, "http_request_sql_statements_sum", route="/graphql") == len(statements) == 2
+    assert sample(text, "sql_statement_duration_seconds_count", statement="SELECT") >= 2
+    assert sample(text, "graphql_operation_duration_seconds_count", type="query", operation="RecentOrders") == 1
+    assert sample(text, "graphql_resolver_duration_seconds_count", field="Query.orders") == 1
+    assert sample(text, "graphql_resolver_duration_seconds_count", field="Order.customer") == 4
+    # Los campos que sólo leen un atributo no se miden
+    assert sample(text, "graphql_resolver_duration_seconds_count", field="Order.reference") is None
+    assert 'db_pool_checkouts_total{pool="sync"}' in text
+
+
+def test_cache_requests_are_counted_by_prefix(fake_cache):
+    with TestClient(main.app) as client:
+        client.post("/graphql/", json={"query": QUERY})
+        client.post("/graphql/", json={"query": QUERY})
+        text = client.get("/metrics").text
+
+    assert sample(text, "cache_requests_total", prefix="orders", result="miss") == 1
+    assert sample(text, "cache_requests_total", prefix="orders", result="l2_hit") == 1
+
+
+def test_nothing_is_recorded_when_disabled(fake_cache, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    with TestClient(main.app) as client:
+        client.post("/graphql/", json={"query": QUERY})
+
+    assert metrics.HTTP_DURATION.count("POST", "/graphql") == 0
+    assert metrics.GRAPHQL_RESOLVERS.count("Query.orders") == 0
+    assert metrics.CACHE_REQUESTS.value("orders", "miss") == 0
+
+
+def test_failed_statements_do_not_leak_start_times():
+    with engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM tabla_inexistente"))
+        assert connection.info.get("metrics_started") == []
+        connection.execute(text("SELECT 1"))
+        assert connection.info["metrics_started"] == []
+
+    assert metrics.SQL_DURATION.count("SELECT") == 1
+
+
+def test_scrape_does_not_query_sync_state(fake_cache):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestClient(main.app) as client:
+        metrics.sync_status_gauges.update(
+            [{"entity": "customers", "lag_seconds": 10.0, "last_rows": 25, "last_duration": 1.0, "rows_per_second": 25.0}],
+            read_at=time.time() - 5,
+        )
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            text = client.get("/metrics").text
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+    assert statements == []
+    assert sample(text, "gomanage_sync_last_rows", entity="customers") == 25
+    # El lag sigue creciendo entre lecturas de sync_state
+    assert 15 <= sample(text, "gomanage_sync_lag_seconds", entity="customers") < 20
+
+    # La relectura de fondo sustituye la lectura anterior
+    asyncio.run(main.refresh_sync_gauges())
+    assert metrics.sync_status_gauges.status == []
+
+
+def test_histogram_renders_cumulative_buckets_and_limits_label_sets(monkeypatch):
+    histogram = metrics.Histogram("demo_seconds", "Demo", ("name",), buckets=[0.1, 1])
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, 'a"b')
+    lines = histogram.render()
+
+    assert lines[:2] == ["# HELP demo_seconds Demo", "# TYPE demo_seconds histogram"]
+    assert lines[2:] == [
+        'demo_seconds_bucket{name="a\\"b",le="0.1"} 2',
+        'demo_seconds_bucket{name="a\\"b",le="1.0"} 3',
+        'demo_seconds_bucket{name="a\\"b",le="+Inf"} 4',
+        'demo_seconds_sum{name="a\\"b"} 3.65',
+        'demo_seconds_count{name="a\\"b"} 4',
+    ]
+
+    monkeypatch.setattr(metrics, "MAX_LABEL_SETS", 2)
+    counter = metrics.Counter("demo_total", "Demo", ("operation",))
+    for name in ("a", "b", "c", "d", "a"):
+        counter.inc(name)
+    assert (counter.value("a"), counter.value("b"), counter.value(metrics.OVERFLOW_LABEL)) == (2, 1, 2)
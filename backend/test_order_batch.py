@@ -0,0 +1,131 @@
+"""
+Tests de la mutación createOrders: validación por entrada, importes
+calculados en el servidor e inserción en bloque en una transacción
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, CustomerStats, Order, OrderItem, Product
+from app.schemas.order_batch import MAX_BATCH_ORDERS
+
+MUTATION = """
+mutation ($input: [OrderInput!]!) {
+  createOrders(input: $input) {
+    created failed
+    results { index success message order { orderId reference totalAmount customerId } }
+  }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="SUMINISTROS DEL NORTE SL", vat_number="B93000001")
+    session.add_all([
+        customer,
+        Product(product_id="PROD1", description="Licencia", price=10.0, active=True),
+        Product(product_id="PROD2", description="Soporte", price=2.5, active=True),
+        Product(product_id="OLD", description="Retirado", price=1.0, active=False),
+    ])
+    session.commit()
+    customer_id = customer.customer_id
+    session.close()
+    yield customer_id
+    Base.metadata.drop_all(bind=engine)
+
+
+def create(orders):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestClient(main.app) as client:
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            body = client.post("/graphql", json={"query": MUTATION, "variables": {"input": orders}}).json()
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    return body, statements
+
+
+def test_valid_orders_are_created_and_invalid_ones_reported(fake_cache, tables):
+    customer_id = tables
+    body, _ = create([
+        {"customerId": customer_id, "reference": "LOTE-1", "items": [
+            {"productId": "PROD1", "quantity": 3},
+            {"productId": "PROD2", "quantity": 2, "unitPrice": 2.0},
+        ]},
+        {"customerId": 999, "items": [{"productId": "PROD1", "quantity": 1}]},
+        {"customerId": customer_id, "items": [{"productId": "OLD", "quantity": 1}]},
+        {"customerId": customer_id, "items": [{"productId": "PROD1", "quantity": 0}]},
+        {"customerId": customer_id, "items": []},
+        {"customerId": customer_id, "items": [{"productId": "PROD2", "quantity": 4}]},
+    ])
+
+    data = body["data"]["createOrders"]
+    assert (data["created"], data["failed"]) == (2, 4)
+    results = data["results"]
+    assert [result["index"] for result in results] == list(range(6))
+    assert [result["success"] for result in results] == [True, False, False, False, False, True]
+    assert results[1]["message"] == "No existe cliente con ID 999"
+    assert "OLD" in results[2]["message"]
+    assert results[0]["order"]["reference"] == "LOTE-1"
+    assert results[0]["order"]["totalAmount"] == 34.0
+    assert results[5]["order"]["totalAmount"] == 10.0
+
+    session = SessionLocal()
+    try:
+        lines = {
+            (item.order_id, item.product_id): (item.quantity, item.unit_price, item.total_price)
+            for item in session.query(OrderItem)
+        }
+        first_id = int(results[0]["order"]["orderId"])
+        assert lines[(first_id, "PROD1")] == (3, 10.0, 30.0)
+        assert lines[(first_id, "PROD2")] == (2, 2.0, 4.0)
+        assert len(lines) == 3
+        # Las tablas resumen incluyen los pedidos insertados en bloque
+        stats = session.get(CustomerStats, customer_id)
+        assert (stats.order_count, stats.order_total) == (2, 44.0)
+    finally:
+        session.close()
+
+
+def test_batch_uses_a_fixed_number_of_statements(fake_cache, tables):
+    customer_id = tables
+    orders = [
+        {"customerId": customer_id, "items": [{"productId": "PROD1", "quantity": i + 1}, {"productId": "PROD2", "quantity": 1}]}
+        for i in range(50)
+    ]
+    body, statements = create(orders)
+
+    assert body["data"]["createOrders"]["created"] == 50
+    writes = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    reads = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    # Pedidos, líneas y las dos tablas resumen; una consulta de clientes y otra de productos
+    assert len(writes) <= 4
+    assert len(reads) == 2
+
+    session = SessionLocal()
+    try:
+        assert session.query(Order).count() == 50
+        assert session.query(OrderItem).count() == 100
+    finally:
+        session.close()
+
+
+def test_oversized_batch_is_rejected(fake_cache, tables):
+    orders = [{"customerId": tables, "items": [{"productId": "PROD1", "quantity": 1}]}] * (MAX_BATCH_ORDERS + 1)
+    body, _ = create(orders)
+
+    assert "Máximo" in body["errors"][0]["message"]
+    session = SessionLocal()
+    try:
+        assert session.query(Order).count() == 0
+    finally:
+        session.close()
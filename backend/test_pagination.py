@@ -0,0 +1,148 @@
+"""
+Tests de la paginación keyset (conexiones Relay)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Invoice, Order
+from app.repositories import get_repository, sort_columns
+from app.schemas.pagination import encode_cursor
+from main import app
+
+ORDERS_PAGE = """
+query ($first: Int, $after: String) {
+    ordersConnection(first: $first, after: $after) {
+        edges { cursor node { orderId createdAt } }
+        pageInfo { hasNextPage hasPreviousPage endCursor }
+    }
+}
+"""
+
+INVOICES_PAGE = """
+query ($first: Int, $after: String) {
+    invoicesConnection(first: $first, after: $after) {
+        edges { node { invoiceId } }
+        pageInfo { hasNextPage endCursor }
+    }
+}
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B12345678")
+    session.add(customer)
+    session.flush()
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    # Varios pedidos comparten created_at para comprobar el desempate por order_id
+    session.add_all([
+        Order(reference=f"ORD-{i}", customer_id=customer.customer_id, total_amount=10.0, created_at=base + timedelta(hours=i // 3))
+        for i in range(25)
+    ])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def fetch_page(client, first, after=None):
+    body = client.post("/graphql", json={"query": ORDERS_PAGE, "variables": {"first": first, "after": after}}).json()
+    assert "errors" not in body, body
+    return body["data"]["ordersConnection"]
+
+
+def test_walks_every_order_exactly_once_in_order():
+    seen = []
+    after = None
+    with TestClient(app) as client:
+        while True:
+            page = fetch_page(client, 7, after)
+            seen.extend(edge["node"] for edge in page["edges"])
+            assert page["pageInfo"]["hasPreviousPage"] is (after is not None)
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+    ids = [int(node["orderId"]) for node in seen]
+    assert len(ids) == len(set(ids)) == 25
+    keys = [(node["createdAt"], int(node["orderId"])) for node in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_next_page_uses_keyset_predicate_not_offset():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement.upper(), parameters))
+
+    with TestClient(app) as client:
+        first_page = fetch_page(client, 5)
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            fetch_page(client, 5, first_page["pageInfo"]["endCursor"])
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    assert "(ORDERS.CREATED_AT, ORDERS.ORDER_ID) <" in statement
+    # SQLite siempre emite "LIMIT ? OFFSET ?"; el offset debe ser 0
+    if statement.rstrip().endswith("OFFSET ?"):
+        assert parameters[-1] == 0
+
+
+def test_invalid_cursor_is_reported():
+    with TestClient(app) as client:
+        body = client.post("/graphql", json={"query": ORDERS_PAGE, "variables": {"first": 5, "after": "no-es-un-cursor"}}).json()
+    assert body["errors"][0]["message"].startswith("Cursor inválido")
+
+
+@pytest.fixture
+def invoices():
+    session = SessionLocal()
+    # Tres de cinco facturas sin fecha: el cursor de la última página llena lleva NULL
+    dates = [None, datetime(2025, 3, 1), None, datetime(2025, 3, 2), None]
+    session.add_all([Invoice(invoice_id=i, reference=f"F-{i}", amount=10.0, date=date) for i, date in enumerate(dates, 1)])
+    session.commit()
+    session.close()
+    yield
+    session = SessionLocal()
+    session.query(Invoice).delete()
+    session.commit()
+    session.close()
+
+
+def test_pages_across_null_sort_values(invoices):
+    ids = []
+    after = None
+    with TestClient(app) as client:
+        while True:
+            body = client.post("/graphql", json={"query": INVOICES_PAGE, "variables": {"first": 2, "after": after}}).json()
+            assert "errors" not in body, body
+            page = body["data"]["invoicesConnection"]
+            ids.extend(int(edge["node"]["invoiceId"]) for edge in page["edges"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+    # Descendente: primero las facturas sin fecha (NULL es el mayor valor)
+    assert ids == [5, 3, 1, 4, 2]
+
+    # Ascendente: las facturas sin fecha al final
+    repository = get_repository("invoices")
+    columns, _ = sort_columns(Invoice, ["date", "invoice_id"])
+    ascending = []
+    after = None
+    while True:
+        rows, has_next = asyncio.run(repository.page((), ["date", "invoice_id"], 2, after, ["invoice_id"]))
+        ascending.extend(row.invoice_id for row in rows)
+        if not has_next:
+            break
+        after = encode_cursor(rows[-1], columns)
+    assert ascending == [2, 4, 1, 3, 5]
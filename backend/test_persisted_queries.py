@@ -0,0 +1,73 @@
+"""
+Tests de persisted queries automáticas (APQ) y del cache de documentos
+GraphQL ya parseados y validados
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import main
+from app.api import graphql_app as graphql_app_module
+from app.api.graphql_app import APQ_PREFIX, query_hash
+from app.core.database import Base, engine
+
+QUERY = "query GetProducts { products(limit: 5) { productId reference } }"
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(bind=engine)
+    main.graphql_app.documents.clear()
+    yield
+
+
+def apq(digest, query=None):
+    body = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": digest}}}
+    if query is not None:
+        body["query"] = query
+    return body
+
+
+def test_unknown_hash_asks_for_the_query_and_then_registers_it(fake_cache):
+    digest = query_hash(QUERY)
+
+    with TestClient(main.app) as client:
+        missing = client.post("/graphql", json=apq(digest)).json()
+        registered = client.post("/graphql", json=apq(digest, QUERY)).json()
+        main.graphql_app.documents.clear()  # otro worker: sólo conoce Redis
+        by_hash = client.post("/graphql", json=apq(digest)).json()
+
+    assert missing["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert registered["data"] == {"products": []}
+    assert by_hash["data"] == registered["data"]
+    assert f"{APQ_PREFIX}{digest}" in fake_cache.client.data
+
+
+def test_hash_must_match_query(fake_cache):
+    with TestClient(main.app) as client:
+        response = client.post("/graphql", json=apq("0" * 64, QUERY))
+
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["extensions"]["code"] == "INVALID_SHA256"
+
+
+def test_repeated_query_is_parsed_and_validated_once(fake_cache, monkeypatch):
+    parsed = []
+    parse = graphql_app_module.parse
+    monkeypatch.setattr(graphql_app_module, "parse", lambda query: parsed.append(query) or parse(query))
+    hits = main.graphql_app.documents.hits
+
+    with TestClient(main.app) as client:
+        for _ in range(3):
+            assert client.post("/graphql", json={"query": QUERY}).json()["data"] == {"products": []}
+
+    assert parsed == [QUERY]
+    assert main.graphql_app.documents.hits - hits == 2
+
+
+def test_invalid_documents_are_not_cached(fake_cache):
+    with TestClient(main.app) as client:
+        body = client.post("/graphql", json={"query": "{ products { noExiste } }"}).json()
+
+    assert body["data"] is None
+    assert "noExiste" in body["errors"][0]["message"]
+    assert main.graphql_app.documents.stats()["size"] == 0
@@ -0,0 +1,60 @@
+"""
+Test de carga del pool de conexiones: 200 peticiones GraphQL concurrentes
+sin errores "QueuePool limit ... reached"
+"""
+
+import asyncio
+import httpx
+import pytest
+from app.core.config import settings
+from app.core.database import Base, engine, SessionLocal, get_async_engine, get_pool_stats
+from app.models.models import Customer, Order
+from main import app
+
+CONCURRENT_REQUESTS = 200
+QUERY = "{ orders(limit: 5) { orderId customer { businessName } } }"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="DISTRIBUCIONES LÓPEZ SL", vat_number="B11223344")
+    session.add(customer)
+    session.flush()
+    session.add_all([Order(reference=f"ORD-{i}", customer_id=customer.customer_id, total_amount=75.0) for i in range(10)])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+async def fire_requests():
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", follow_redirects=True) as client:
+            return await asyncio.gather(
+                *[client.post("/graphql", json={"query": QUERY}) for _ in range(CONCURRENT_REQUESTS)],
+                return_exceptions=True
+            )
+    finally:
+        await get_async_engine().dispose()
+
+
+def test_concurrent_requests_do_not_exhaust_pool(monkeypatch):
+    monkeypatch.setattr(settings, "database_async", True)
+
+    responses = asyncio.run(fire_requests())
+
+    errors = [r for r in responses if isinstance(r, Exception)]
+    assert not errors, errors[:3]
+    for response in responses:
+        body = response.json()
+        assert response.status_code == 200
+        assert "errors" not in body, body
+        assert len(body["data"]["orders"]) == 5
+
+    stats = get_pool_stats()["async"]
+    assert stats["timeouts"] == 0
+    assert stats["checkouts"] >= CONCURRENT_REQUESTS
+    assert stats["checkout_latency_ms"][-1]["count"] == stats["checkouts"]
@@ -0,0 +1,117 @@
+"""
+Tests de la proyección de columnas: el SELECT de cada resolver lleva sólo
+las columnas que pide la consulta GraphQL (más la clave primaria, las claves
+foráneas y las columnas del cursor)
+"""
+
+import asyncio
+import re
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Notice, Order, Product
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B95000001", email="info@sune.es")
+    session.add(customer)
+    session.flush()
+    session.add_all([
+        Order(reference=f"ORD-{i}", customer_id=customer.customer_id, total_amount=10.0 * i, status="pending",
+              notes="x" * 2000, created_at=datetime(2026, 1, 1) + timedelta(hours=i))
+        for i in range(5)
+    ])
+    session.add(Product(product_id="P1", reference="TORNILLO M6", description="y" * 2000, price=0.1, active=True))
+    session.add(Notice(customer_id=customer.customer_id, title="Avería", description="z" * 2000, resolution="r" * 2000))
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def select_columns(statements, table):
+    """Columnas (table.columna) del SELECT ... FROM table de cada sentencia"""
+    found = []
+    for statement in statements:
+        match = re.match(rf"SELECT (.*?)\s+FROM {table}\b", statement, re.S)
+        if match:
+            found.append(set(re.findall(rf'\b{table}\."?(\w+)', match.group(1))))
+    return found
+
+
+def run(query):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestClient(main.app) as client:
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            body = client.post("/graphql", json={"query": query}).json()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+    assert "errors" not in body, body
+    return body["data"], statements
+
+
+def test_list_selects_only_requested_columns(fake_cache):
+    data, statements = run("{ orders(limit: 3) { orderId status } }")
+
+    assert [order["status"] for order in data["orders"]] == ["pending"] * 3
+    # La clave foránea se carga siempre (la necesita el DataLoader de customer)
+    assert select_columns(statements, "orders") == [{"order_id", "status", "customer_id"}]
+
+
+def test_connection_adds_cursor_columns(fake_cache):
+    _, statements = run("{ ordersConnection(first: 2) { edges { cursor node { reference } } } }")
+
+    assert select_columns(statements, "orders") == [{"order_id", "reference", "customer_id", "created_at"}]
+
+
+def test_relations_and_single_objects_are_projected(fake_cache):
+    data, statements = run("""
+        { customer(customerId: 1) { businessName orders { orderId totalAmount } }
+          product(productId: "P1") { reference }
+          notices { title customer { email } } }
+    """)
+
+    assert data["product"] == {"reference": "TORNILLO M6"}
+    assert len(data["customer"]["orders"]) == 5
+    assert select_columns(statements, "orders") == [{"order_id", "total_amount", "customer_id"}]
+    assert select_columns(statements, "products") == [{"product_id", "reference"}]
+    assert select_columns(statements, "notices") == [{"notice_id", "title", "customer_id"}]
+    assert sorted(map(sorted, select_columns(statements, "customers"))) == [
+        ["business_name", "customer_id"], ["customer_id", "email"]
+    ]
+    # Ninguna consulta lee los Text que no se han pedido
+    assert not any(re.search(r"\.(notes|description|resolution)\b", statement) for statement in statements)
+
+
+def test_legacy_tables_load_only_selected_columns():
+    from app.generated.legacy_models import BudgetHeads
+    from app.schemas.graphql_schema import build_schema
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    BudgetHeads.__table__.create(bind=engine, checkfirst=True)
+    schema = build_schema(legacy=True)
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        result = asyncio.run(schema.execute_async("{ legacy { budgetHeads(limit: 5) { uniqueId grossAmount } } }"))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        BudgetHeads.__table__.drop(bind=engine)
+
+    assert result.errors is None
+    assert len(BudgetHeads.__table__.columns) > 100
+    assert select_columns(statements, "gopresuc") == [{"Id_unico", "bru_pre"}]
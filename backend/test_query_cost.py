@@ -0,0 +1,112 @@
+"""
+Tests del análisis de coste de las consultas GraphQL y del presupuesto por
+cliente
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from graphql import parse
+from sqlalchemy import event
+import main
+from app.core.config import settings
+from app.core.database import Base, engine
+from app.schemas.cost import analyze_query
+from app.schemas.graphql_schema import schema
+
+ABUSIVE_QUERY = """
+{
+  customers(limit: 100000) {
+    orders { orderItems { product { productId description } } }
+    invoices { invoiceId amount }
+  }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(bind=engine)
+    main.graphql_app.documents.clear()
+
+
+def cost_of(query, variables=None):
+    return analyze_query(schema.graphql_schema, parse(query), variables)
+
+
+def test_lists_multiply_their_children_by_limit():
+    assert cost_of("{ orders(limit: 10) { orderId customer { businessName } } }") == (20, 3)
+
+
+def test_relationship_lists_use_default_size():
+    # 3 clientes + 3 * 20 pedidos estimados
+    assert cost_of("{ customers(limit: 3) { orders { orderId } } }").cost == 3 + 3 * settings.graphql_default_list_size
+
+
+def test_connection_page_size_applies_to_edges():
+    query = "{ ordersConnection(first: 50) { edges { node { orderId customer { email } } } pageInfo { hasNextPage } } }"
+    # conexión + 50 edges + 50 nodos + 50 clientes + pageInfo
+    assert cost_of(query) == (152, 5)
+
+
+def test_variables_and_fragments_are_resolved():
+    query = """
+    query Pedidos($n: Int) { orders(limit: $n) { ...Pedido } }
+    fragment Pedido on Order { customer { email } orderItems { itemId } }
+    """
+    assert cost_of(query, {"n": 4}).cost == 4 + 4 + 4 * settings.graphql_default_list_size
+
+
+def test_introspection_is_free():
+    assert cost_of("{ __schema { types { name fields { name type { name } } } } }") == (0, 0)
+
+
+def test_expensive_query_is_rejected_before_execution(fake_cache):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with TestClient(main.app) as client:
+            body = client.post("/graphql", json={"query": ABUSIVE_QUERY}).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert body["data"] is None
+    assert body["errors"][0]["extensions"]["code"] == "QUERY_TOO_COMPLEX"
+    assert body["extensions"]["cost"]["requested"] > settings.graphql_max_cost
+    assert statements == []
+
+
+def test_deep_query_is_rejected(fake_cache, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_max_depth", 3)
+
+    with TestClient(main.app) as client:
+        body = client.post("/graphql", json={"query": "{ orders(limit: 1) { customer { orders { orderId } } } }"}).json()
+
+    assert body["errors"][0]["extensions"]["code"] == "QUERY_TOO_DEEP"
+
+
+def test_cost_is_reported_in_extensions(fake_cache):
+    with TestClient(main.app) as client:
+        body = client.post("/graphql", json={"query": "{ orders(limit: 10) { orderId customer { email } } }"}).json()
+
+    assert body["data"] == {"orders": []}
+    assert body["extensions"]["cost"]["requested"] == 20
+    assert body["extensions"]["cost"]["remaining"] == settings.graphql_cost_bucket_capacity - 20
+
+
+def test_budget_is_tracked_per_api_key(fake_cache, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_cost_bucket_capacity", 30)
+    monkeypatch.setattr(settings, "graphql_cost_refill_rate", 1)
+    query = {"query": "{ orders(limit: 10) { orderId customer { email } } }"}
+
+    with TestClient(main.app) as client:
+        first = client.post("/graphql", json=query, headers={"X-API-Key": "panel"})
+        second = client.post("/graphql", json=query, headers={"X-API-Key": "panel"})
+        other = client.post("/graphql", json=query, headers={"X-API-Key": "otro"})
+
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert second.json()["errors"][0]["extensions"]["code"] == "BUDGET_EXCEEDED"
+    assert int(second.headers["Retry-After"]) >= 10
+    assert other.status_code == 200
+    assert not any("panel" in key for key in fake_cache.client.data)
@@ -0,0 +1,89 @@
+"""
+Tests del cliente Redis con circuit breaker: con Redis caído las consultas van
+directamente a la base de datos y el cache se recupera solo
+"""
+
+import asyncio
+import time
+from fastapi.testclient import TestClient
+import main
+from app.core.cache import CacheManager, CircuitBreaker
+from conftest import FakeRedis
+
+
+def make_manager(redis_client, failures=3, reset=30):
+    cache_manager = CacheManager(client=redis_client)
+    cache_manager.breaker = CircuitBreaker(failure_threshold=failures, reset_timeout=reset)
+    return cache_manager
+
+
+def test_breaker_opens_after_consecutive_failures():
+    redis_client = FakeRedis()
+    redis_client.down = True
+    cache_manager = make_manager(redis_client)
+
+    async def scenario():
+        for _ in range(3):
+            assert await cache_manager.get("clave") is None
+        calls = redis_client.calls
+        # Con el circuito abierto no se llama a Redis
+        assert await cache_manager.get("clave") is None
+        assert await cache_manager.set("clave", 1) is False
+        return redis_client.calls - calls
+
+    assert asyncio.run(scenario()) == 0
+    assert cache_manager.breaker.state == CircuitBreaker.OPEN
+    assert not cache_manager.connected
+
+
+def test_half_open_probe_closes_breaker_when_redis_recovers():
+    redis_client = FakeRedis()
+    redis_client.down = True
+    cache_manager = make_manager(redis_client, failures=1, reset=0.05)
+
+    async def scenario():
+        await cache_manager.get("clave")
+        assert cache_manager.breaker.state == CircuitBreaker.OPEN
+
+        # La prueba en semiabierto falla: vuelve a abrirse
+        await asyncio.sleep(0.06)
+        await cache_manager.get("clave")
+        assert cache_manager.breaker.state == CircuitBreaker.OPEN
+
+        redis_client.down = False
+        await asyncio.sleep(0.06)
+        assert await cache_manager.set("clave", 1) is True
+        return await cache_manager.get("clave")
+
+    assert asyncio.run(scenario()) == 1
+    assert cache_manager.breaker.state == CircuitBreaker.CLOSED
+    assert cache_manager.breaker.times_opened == 2
+
+
+def test_get_or_compute_falls_back_to_compute_when_redis_is_down():
+    redis_client = FakeRedis()
+    redis_client.down = True
+    cache_manager = make_manager(redis_client)
+    calls = []
+
+    async def compute():
+        calls.append(time.time())
+        return "de la base de datos"
+
+    async def scenario():
+        return [await cache_manager.get_or_compute("clave", compute, ttl=60) for _ in range(5)]
+
+    assert asyncio.run(scenario()) == ["de la base de datos"] * 5
+    assert len(calls) == 5
+
+
+def test_queries_are_served_from_database_while_redis_is_down(fake_cache):
+    fake_cache.client.down = True
+
+    with TestClient(main.app) as client:
+        health = client.get("/health").json()
+        body = client.post("/graphql", json={"query": "{ customers { customerId } cacheStats { connected circuitBreaker { state failures } } }"}).json()
+
+    assert health["cache"] == "disconnected"
+    assert "errors" not in body
+    assert body["data"]["cacheStats"]["connected"] is False
@@ -0,0 +1,161 @@
+"""
+Tests de los repositorios: la misma consulta GraphQL contra SQL y contra la
+API de GoManage (FakeGoManage) devuelve lo mismo, y los filtros, el orden,
+la paginación y los lotes de los DataLoaders se envían a la fuente
+"""
+
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import main
+from app import repositories
+from app.core.database import Base, engine, SessionLocal
+from app.core.gomanage import GoManageClient
+from app.models.models import Customer, Invoice, Product
+from app.repositories import ENTITIES, Repository, create_repository, parse_sources, set_repository
+from conftest import FakeGoManage
+
+START = datetime(2026, 2, 1)
+
+CUSTOMERS = [
+    dict(customer_id=1, business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B10000001", email="info@sune.es"),
+    dict(customer_id=2, business_name="SUNEXT TECNOLOGÍA SA", vat_number="B10000002", email="hola@sunext.es"),
+    dict(customer_id=3, business_name="FERRETERÍA CENTRAL", vat_number="B10000003", email="central@ferreteria.es"),
+]
+PRODUCTS = [
+    dict(product_id="P1", reference="TORNILLO M6", description="Tornillo de acero", price=0.1, stock=100, active=True),
+    dict(product_id="P2", reference="TORNILLO M8", description="Tornillo descatalogado", price=0.2, stock=0, active=False),
+    dict(product_id="P3", reference="TUERCA M6", description="Tuerca para tornillo", price=0.05, stock=50, active=True),
+]
+INVOICES = [
+    dict(invoice_id=i, reference=f"F-{i}", customer_id=1 + i % 3, amount=100.0 * i, status="pending",
+         date=START + timedelta(days=i // 2))
+    for i in range(1, 9)
+]
+
+QUERIES = {
+    "search": '{ customers(search: "sune") { customerId businessName } }',
+    "customer_with_invoices": "{ customer(customerId: 2) { businessName invoices { invoiceId amount } } }",
+    "active_products": '{ products(search: "tornillo") { productId reference } }',
+    "recent_invoices": '{ invoices(fromDate: "2026-02-03", limit: 5) { invoiceId date customer { businessName } } }',
+}
+
+INVOICES_PAGE = """
+query ($after: String) {
+    invoicesConnection(first: 3, after: $after) {
+        edges { node { invoiceId date } }
+        pageInfo { hasNextPage endCursor }
+    }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    session.add_all([Customer(**row) for row in CUSTOMERS])
+    session.add_all([Product(**row) for row in PRODUCTS])
+    session.add_all([Invoice(**row) for row in INVOICES])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def api():
+    fake = FakeGoManage()
+    for entity, key, rows in (("customers", "customer_id", CUSTOMERS), ("products", "product_id", PRODUCTS),
+                              ("invoices", "invoice_id", INVOICES)):
+        for row in rows:
+            record = {name: value.isoformat() if isinstance(value, datetime) else value for name, value in row.items()}
+            fake.put(entity, row[key], modified_at="2026-01-01T00:00:00+00:00", **record)
+    return fake
+
+
+@pytest.fixture
+def use_gomanage(api):
+    yield read_from(api)
+    repositories._repositories.clear()
+
+
+def read_from(api):
+    """Leer clientes, productos y facturas de la API falsa"""
+    client = GoManageClient(base_url="http://gomanage.test", transport=httpx.ASGITransport(app=api.app))
+    for name in ("customers", "products", "invoices"):
+        set_repository(create_repository(name, "gomanage", client))
+    return api
+
+
+def run(queries, fake_cache):
+    fake_cache.client.data.clear()
+    with TestClient(main.app) as client:
+        results = {}
+        for name, query in queries.items():
+            body = client.post("/graphql", json={"query": query}).json()
+            assert "errors" not in body, body
+            results[name] = body["data"]
+        pages, after = [], None
+        while True:
+            body = client.post("/graphql", json={"query": INVOICES_PAGE, "variables": {"after": after}}).json()
+            assert "errors" not in body, body
+            connection = body["data"]["invoicesConnection"]
+            pages.append([edge["node"] for edge in connection["edges"]])
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+            after = connection["pageInfo"]["endCursor"]
+    return results, pages
+
+
+def test_both_backends_return_the_same_results(fake_cache, api):
+    expected = run(QUERIES, fake_cache)
+    try:
+        read_from(api)
+        assert run(QUERIES, fake_cache) == expected
+    finally:
+        repositories._repositories.clear()
+
+    results, pages = expected
+    assert [c["customerId"] for c in results["search"]["customers"]] == ["1", "2"]
+    assert [p["productId"] for p in results["active_products"]["products"]] == ["P1", "P3"]
+    assert [[int(node["invoiceId"]) for node in page] for page in pages] == [[8, 7, 6], [5, 4, 3], [2, 1]]
+
+
+def test_filters_sort_and_batches_are_pushed_to_the_api(fake_cache, use_gomanage):
+    run({"search": QUERIES["search"], "recent_invoices": QUERIES["recent_invoices"]}, fake_cache)
+
+    requests = use_gomanage.requests
+    assert ("customers", {
+        "search": "sune", "fields": "customer_id,business_name", "page": "1", "page_size": "100"
+    }) in requests
+    assert ("invoices", {
+        "date_gte": "2026-02-03", "sort": "-date,-invoice_id", "fields": "invoice_id,customer_id,date", "page": "1", "page_size": "5"
+    }) in requests
+    # Los clientes de las cinco facturas se piden en un único lote
+    batches = [params for entity, params in requests if entity == "customers" and "customer_id_in" in params]
+    assert len(batches) == 1
+    assert sorted(batches[0]["customer_id_in"].split(",")) == ["1", "2", "3"]
+    # Las páginas siguientes se piden con el cursor keyset, nunca el listado entero
+    pages = [params for entity, params in requests if entity == "invoices" and "after" in params]
+    assert [params["page_size"] for params in pages] == ["4", "4"]
+
+
+def test_data_sources_setting_is_validated():
+    assert parse_sources("customers=gomanage, invoices=sql") == {"customers": "gomanage", "invoices": "sql"}
+    assert parse_sources("") == {}
+    with pytest.raises(ValueError):
+        parse_sources("orders=gomanage")
+    with pytest.raises(ValueError):
+        parse_sources("customers=mysql")
+
+
+def test_backends_must_implement_list_and_page():
+    class ListOnly(Repository):
+        async def list(self, conditions=(), sort=(), limit=None, columns=None):
+            return []
+
+    # Falla al crearlo, no en la primera consulta que pagine
+    with pytest.raises(TypeError, match="page"):
+        ListOnly(ENTITIES["customers"])
@@ -0,0 +1,129 @@
+"""
+Tests del cache de resultados: un acierto devuelve los mismos datos que un
+fallo sin ejecutar SQL
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Product, Order, Invoice, Notice
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    base = datetime(2025, 3, 1, 9, 30, 0)
+    customers = [Customer(business_name=f"CLIENTE {i}", vat_number=f"B9000000{i}", email=f"c{i}@ejemplo.es", created_at=base) for i in range(3)]
+    session.add_all(customers)
+    session.flush()
+    session.add_all([Product(product_id=f"P{i}", reference=f"REF-{i}", description="Producto", price=9.5, active=True) for i in range(3)])
+    session.add_all([
+        Order(reference=f"ORD-{i}", customer_id=customers[i % 3].customer_id, total_amount=100.0 + i,
+              status="pending", order_date=base + timedelta(days=i), created_at=base + timedelta(hours=i))
+        for i in range(8)
+    ])
+    session.add_all([Invoice(reference=f"FAC-{i}", customer_id=customers[0].customer_id, amount=50.0, date=base + timedelta(days=i)) for i in range(3)])
+    session.add_all([Notice(customer_id=customers[1].customer_id, title=f"Aviso {i}", created_date=base + timedelta(days=i)) for i in range(3)])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def run(query):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with TestClient(main.app) as client:
+            body = client.post("/graphql", json={"query": query}).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert "errors" not in body, body
+    return body["data"], len(statements)
+
+
+@pytest.mark.parametrize("query", [
+    "{ customers(limit: 10) { customerId businessName email createdAt } }",
+    "{ products(limit: 10) { productId reference price active } }",
+    "{ orders(limit: 10) { orderId reference totalAmount status orderDate createdAt customerId } }",
+    "{ invoices(limit: 10) { invoiceId reference amount date } }",
+    "{ notices(limit: 10) { noticeId title createdDate } }",
+])
+def test_hit_returns_same_data_without_sql(fake_cache, query):
+    miss_data, miss_statements = run(query)
+    hit_data, hit_statements = run(query)
+
+    assert miss_statements == 1
+    assert hit_statements == 0
+    assert hit_data == miss_data
+
+
+def test_cached_rows_keep_foreign_keys_for_relationships(fake_cache):
+    query = "{ orders(limit: 5) { reference customer { businessName } } }"
+    miss_data, _ = run(query)
+    hit_data, hit_statements = run(query)
+
+    assert hit_data == miss_data
+    # Sólo la carga de clientes del DataLoader
+    assert hit_statements == 1
+
+
+def test_each_field_selection_is_cached_separately(fake_cache):
+    run("{ orders(limit: 5) { orderId } }")
+    data, statements = run("{ orders(limit: 5) { orderId notes } }")
+
+    assert statements == 1
+    assert set(data["orders"][0]) == {"orderId", "notes"}
+
+
+def test_mutation_invalidates_cached_orders(fake_cache):
+    run("{ orders(limit: 50) { orderId } }")
+    run('mutation { createOrder(customerId: 1, totalAmount: 1.0) { success } }')
+    data, statements = run("{ orders(limit: 50) { orderId } }")
+
+    assert statements == 1
+    assert len(data["orders"]) == 9
+
+
+def test_order_mutation_invalidates_every_dependent_list(fake_cache):
+    queries = [
+        "{ orders(limit: 50) { orderId } }",
+        "{ orders(limit: 7) { orderId } }",
+        '{ orders(limit: 50, status: "pending") { orderId } }',
+        "{ orders(limit: 50, customerId: 2) { orderId } }",
+    ]
+    for query in queries:
+        run(query)
+
+    run('mutation { createOrder(customerId: 2, totalAmount: 3.0, status: "pending") { success } }')
+
+    for query in queries:
+        _, statements = run(query)
+        assert statements == 1, query
+
+
+def test_order_mutation_keeps_other_customers_cached(fake_cache):
+    run("{ orders(limit: 50, customerId: 3) { orderId } }")
+    run('mutation { createOrder(customerId: 2, totalAmount: 3.0) { success } }')
+
+    _, statements = run("{ orders(limit: 50, customerId: 3) { orderId } }")
+    assert statements == 0
+
+
+def test_customer_mutation_invalidates_customer_lists(fake_cache):
+    run("{ customers(limit: 20) { customerId } }")
+    run("{ customers(limit: 20, search: \"CLIENTE\") { customerId } }")
+    run('mutation { createCustomer(businessName: "NUEVO SL", vatNumber: "B55555555") { success } }')
+
+    _, statements = run("{ customers(limit: 20) { customerId } }")
+    assert statements == 1
+    _, statements = run("{ customers(limit: 20, search: \"CLIENTE\") { customerId } }")
+    assert statements == 1
@@ -0,0 +1,165 @@
+"""
+Tests de las tablas resumen de clientes: mantenimiento incremental en cada
+flush, reconciliación y lectura de Customer.stats
+"""
+
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.core.rollups import reconcile
+from app.models.models import Customer, CustomerDailySales, CustomerStats, Invoice, Order
+
+PAST = datetime.now(timezone.utc) - timedelta(days=10)
+FUTURE = datetime.now(timezone.utc) + timedelta(days=10)
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    session.add_all([Customer(business_name=f"CLIENTE {i}", vat_number=f"B9200000{i}") for i in range(2)])
+    session.commit()
+    ids = [customer.customer_id for customer in session.query(Customer).order_by(Customer.customer_id)]
+    session.close()
+    yield ids
+    Base.metadata.drop_all(bind=engine)
+
+
+def snapshot():
+    session = SessionLocal()
+    try:
+        daily = {
+            (row.customer_id, row.day, row.status): (row.order_count, row.total_amount)
+            for row in session.query(CustomerDailySales) if row.order_count
+        }
+        stats = {
+            row.customer_id: (row.order_count, row.order_total, row.open_invoice_count, row.open_invoice_balance, row.overdue_invoice_count)
+            for row in session.query(CustomerStats) if any((row.order_count, row.open_invoice_count))
+        }
+        return daily, stats
+    finally:
+        session.close()
+
+
+def test_orders_and_invoices_update_rollups_in_the_same_transaction(tables):
+    first, second = tables
+    session = SessionLocal()
+    order = Order(customer_id=first, total_amount=100.0, status="pending", order_date=datetime(2025, 5, 1, 10))
+    session.add_all([
+        order,
+        Order(customer_id=first, total_amount=50.0, status="pending", order_date=datetime(2025, 5, 1, 18)),
+        Invoice(customer_id=first, amount=80.0, status="pending", due_date=PAST),
+        Invoice(customer_id=first, amount=20.0, status="pending", due_date=FUTURE),
+        Invoice(customer_id=second, amount=999.0, status="paid", due_date=PAST),
+    ])
+    session.commit()
+
+    daily, stats = snapshot()
+    assert daily == {(first, date(2025, 5, 1), "pending"): (2, 150.0)}
+    assert stats == {first: (2, 150.0, 2, 100.0, 1)}
+
+    # Cambiar estado e importe mueve la contribución entre filas
+    order.status = "delivered"
+    order.total_amount = 120.0
+    session.commit()
+    daily, stats = snapshot()
+    assert daily == {
+        (first, date(2025, 5, 1), "pending"): (1, 50.0),
+        (first, date(2025, 5, 1), "delivered"): (1, 120.0),
+    }
+    assert stats[first][:2] == (2, 170.0)
+
+    # Pagar una factura y borrar un pedido
+    overdue = session.query(Invoice).filter(Invoice.amount == 80.0).one()
+    overdue.status = "paid"
+    session.delete(order)
+    session.commit()
+    session.close()
+    assert snapshot()[1] == {first: (1, 50.0, 1, 20.0, 0)}
+
+
+def test_rollbacks_do_not_leak_into_rollups(tables):
+    first, _ = tables
+    session = SessionLocal()
+    session.add(Order(customer_id=first, total_amount=10.0, status="pending"))
+    session.flush()
+    session.rollback()
+    session.close()
+
+    assert snapshot() == ({}, {})
+
+
+def test_reconcile_matches_incremental_state_and_fixes_drift(tables):
+    first, second = tables
+    session = SessionLocal()
+    session.add_all([
+        Order(customer_id=first, total_amount=10.0, status="pending", order_date=datetime(2025, 1, 1)),
+        Order(customer_id=second, total_amount=30.0, status="shipped", order_date=datetime(2025, 1, 2)),
+        Invoice(customer_id=second, amount=40.0, status="overdue", due_date=PAST),
+    ])
+    session.commit()
+    session.close()
+    incremental = snapshot()
+
+    with engine.begin() as connection:
+        reconcile(connection)
+    assert snapshot() == incremental
+
+    # Filas cargadas sin el ORM (como COPY en bulk_import.py)
+    with engine.begin() as connection:
+        connection.execute(insert(Order.__table__).values(customer_id=first, total_amount=5.0, status="pending", order_date=datetime(2025, 1, 1)))
+    assert snapshot() == incremental
+    with engine.begin() as connection:
+        counts = reconcile(connection)
+
+    daily, stats = snapshot()
+    assert counts == {"customer_daily_sales": 2, "customer_stats": 2}
+    assert daily[(first, date(2025, 1, 1), "pending")] == (2, 15.0)
+    assert stats[first][:2] == (2, 15.0)
+
+
+def test_orders_without_order_date_use_created_at(tables):
+    first, _ = tables
+    session = SessionLocal()
+    order = Order(customer_id=first, total_amount=25.0, status="pending", created_at=datetime(2025, 3, 1, 9))
+    session.add(order)
+    session.commit()
+    assert snapshot()[0] == {(first, date(2025, 3, 1), "pending"): (1, 25.0)}
+
+    # Al modificarlo se resta y se suma en el día de creación, no en el de hoy
+    order.status = "shipped"
+    session.commit()
+    session.close()
+    incremental = snapshot()
+    assert incremental[0] == {(first, date(2025, 3, 1), "shipped"): (1, 25.0)}
+
+    with engine.begin() as connection:
+        reconcile(connection)
+    assert snapshot() == incremental
+
+
+def test_customer_stats_are_read_with_one_query(fake_cache, tables):
+    first, second = tables
+    query = "{ customers(limit: 10) { customerId stats { orderCount orderTotal openInvoiceBalance } } }"
+    mutation = f"mutation {{ createOrder(customerId: {first}, totalAmount: 25.5) {{ success }} }}"
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestClient(main.app) as client:
+        assert client.post("/graphql", json={"query": mutation}).json()["data"]["createOrder"]["success"]
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            body = client.post("/graphql", json={"query": query}).json()
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+    assert body["data"]["customers"] == [
+        {"customerId": str(first), "stats": {"orderCount": 1, "orderTotal": 25.5, "openInvoiceBalance": 0.0}},
+        {"customerId": str(second), "stats": {"orderCount": 0, "orderTotal": 0.0, "openInvoiceBalance": 0.0}},
+    ]
+    assert len([s for s in statements if "customer_stats" in s]) == 1
@@ -0,0 +1,84 @@
+"""
+Tests de las filas de sólo lectura: los resolvers de listas leen con
+select() de Core y devuelven tuplas con nombre en lugar de instancias del ORM
+"""
+
+import asyncio
+import json
+from datetime import date, datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+import main
+from app.core.cache import dump_rows, load_rows
+from app.core.database import Base, engine, SessionLocal
+from app.core.rows import row_class, row_model
+from app.models.models import Customer, CustomerDailySales, Order
+from app.repositories import get_repository
+from app.schemas.graphql_schema import ORDER_SORT
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customer = Customer(business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B95000001")
+    session.add(customer)
+    session.flush()
+    session.add_all([
+        Order(reference=f"ORD-{i}", customer_id=customer.customer_id, total_amount=10.0 * i, status="pending",
+              created_at=datetime(2026, 1, 1) + timedelta(hours=i))
+        for i in range(5)
+    ])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_repository_returns_read_only_rows():
+    repository = get_repository("orders")
+    rows = asyncio.run(repository.list((), ORDER_SORT, 3, ["order_id", "created_at"]))
+
+    assert [row.created_at.hour for row in rows] == [4, 3, 2]
+    assert all(row_model(row) is Order for row in rows)
+    # Tuplas sin __dict__ ni estado del ORM: no hay nada que asociar a una sesión
+    assert not hasattr(rows[0], "__dict__")
+    assert rows[0]._fields == ("order_id", "created_at")
+    with pytest.raises(AttributeError):
+        rows[0].status = "paid"
+
+    page, has_next = asyncio.run(repository.page((), ORDER_SORT, 2, columns=["reference"]))
+    assert [row.reference for row in page] == ["ORD-4", "ORD-3"] and has_next
+
+
+def test_cached_rows_round_trip_without_touching_the_payload():
+    row = row_class(Order, ("order_id", "created_at"))
+    payload = dump_rows([row(1, datetime(2026, 1, 1, 12))], ["order_id", "created_at"])
+
+    for _ in range(2):
+        loaded = load_rows(Order, payload)
+        assert loaded == [row(1, datetime(2026, 1, 1, 12))]
+        assert type(loaded[0]) is row
+    assert payload["r"] == [[1, "2026-01-01T12:00:00"]]
+
+
+def test_cached_rows_keep_date_columns():
+    columns = ["customer_id", "day", "order_count"]
+    row = row_class(CustomerDailySales, tuple(columns))
+    # Como en Redis: el payload tiene que pasar por JSON
+    payload = json.loads(json.dumps(dump_rows([row(1, date(2026, 1, 1), 3)], columns)))
+
+    assert payload["r"] == [[1, "2026-01-01", 3]]
+    assert load_rows(CustomerDailySales, payload) == [row(1, date(2026, 1, 1), 3)]
+
+
+def test_graphql_resolves_rows_on_miss_and_hit(fake_cache):
+    query = "{ orders(limit: 3) { orderId reference customer { businessName } } }"
+    with TestClient(main.app) as client:
+        bodies = [client.post("/graphql", json={"query": query}).json() for _ in range(2)]
+
+    assert bodies[0] == bodies[1]
+    assert "errors" not in bodies[0], bodies[0]
+    orders = bodies[0]["data"]["orders"]
+    assert [order["reference"] for order in orders] == ["ORD-4", "ORD-3", "ORD-2"]
+    assert orders[0]["customer"] == {"businessName": "SUÑE SOLUCIONES INTEGRALES SL"}
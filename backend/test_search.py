@@ -0,0 +1,85 @@
+"""
+Tests de la búsqueda de clientes y productos (alternativa local en SQLite y
+SQL generado para PostgreSQL)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Product
+from app.schemas.graphql_schema import CUSTOMER_SEARCH, PRODUCT_SEARCH
+from app.schemas.search import ranked_search, typeahead
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    session.add_all([
+        Customer(business_name="SUÑE SOLUCIONES INTEGRALES SL", vat_number="B12345678", email="info@sune.es"),
+        Customer(business_name="TECNOLOGÍA AVANZADA SA", vat_number="A87654321", email="contacto@tecnologia.es"),
+        Customer(business_name="DISTRIBUCIONES NORTE SL", vat_number="B11111111", email="ventas@tecnologia-norte.es"),
+        Customer(business_name="SUMINISTROS 100% SL", vat_number="B22222222", email="info@suministros.es"),
+    ])
+    session.add_all([
+        Product(product_id="P1", reference="LED-100", description="Panel LED empotrable", active=True),
+        Product(product_id="P2", reference="LED-200", description="Tira LED de iluminación", active=True),
+        Product(product_id="P3", reference="LAM-10", description="Lámpara colgante con LED", active=True),
+        Product(product_id="P4", reference="LED-300", description="Descatalogado", active=False),
+    ])
+    session.commit()
+    session.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def run(query):
+    with TestClient(main.app) as client:
+        body = client.post("/graphql", json={"query": query}).json()
+    assert "errors" not in body, body
+    return body["data"]
+
+
+def test_list_search_ignores_accents_and_case():
+    data = run('{ customers(search: "sune") { businessName } products(search: "lampara") { reference } }')
+
+    assert data["customers"] == [{"businessName": "SUÑE SOLUCIONES INTEGRALES SL"}]
+    assert data["products"] == [{"reference": "LAM-10"}]
+
+
+def test_search_ranks_name_matches_before_email_matches():
+    data = run('{ searchCustomers(text: "Tecnologia") { businessName } searchProducts(text: "led") { reference } }')
+
+    assert [row["businessName"] for row in data["searchCustomers"]] == ["TECNOLOGÍA AVANZADA SA", "DISTRIBUCIONES NORTE SL"]
+    # Referencia antes que descripción; los inactivos no aparecen
+    assert [row["reference"] for row in data["searchProducts"]] == ["LED-100", "LED-200", "LAM-10"]
+
+
+def test_typeahead_matches_prefixes_in_order():
+    data = run('{ customerTypeahead(prefix: "su") { businessName } productTypeahead(prefix: "led", limit: 1) { reference } }')
+
+    assert [row["businessName"] for row in data["customerTypeahead"]] == ["SUMINISTROS 100% SL", "SUÑE SOLUCIONES INTEGRALES SL"]
+    assert data["productTypeahead"] == [{"reference": "LED-100"}]
+
+
+def test_like_wildcards_in_the_term_are_literal():
+    data = run('{ customers(search: "100%") { businessName } customerTypeahead(prefix: "_") { businessName } }')
+
+    assert data["customers"] == [{"businessName": "SUMINISTROS 100% SL"}]
+    assert data["customerTypeahead"] == []
+
+
+def test_postgresql_uses_full_text_and_trigram_indexes():
+    search = ranked_search(Query(Customer), Customer, CUSTOMER_SEARCH, "Suñe", 20, "postgresql")
+    prefix = typeahead(Query(Product), Product, PRODUCT_SEARCH[0], "led", 10, "postgresql")
+
+    search_sql = str(search.statement.compile(dialect=postgresql.dialect()))
+    prefix_sql = str(prefix.statement.compile(dialect=postgresql.dialect()))
+
+    assert "customers.search_vector @@ websearch_to_tsquery" in search_sql
+    assert "ts_rank_cd" in search_sql and "<%" in search_sql
+    assert "immutable_unaccent(lower(customers.business_name))" in search_sql
+    assert '(immutable_unaccent(lower(products.reference)) COLLATE "C") LIKE' in prefix_sql
@@ -0,0 +1,155 @@
+"""
+Tests de los agregados orderStats/invoiceStats: un único GROUP BY, cache por
+mes cerrado hasta que una mutación lo invalida y fechas en UTC
+"""
+
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+import main
+from app.core.database import Base, engine, SessionLocal
+from app.models.models import Customer, Order, Invoice
+from app.schemas.stats import DateRange, parse_date, split_range
+
+TODAY = datetime.combine(date.today(), datetime.min.time())
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    customers = [Customer(business_name=f"CLIENTE {i}", vat_number=f"B9100000{i}") for i in range(2)]
+    session.add_all(customers)
+    session.flush()
+    first, second = customers[0].customer_id, customers[1].customer_id
+    session.add_all([
+        Order(reference="ORD-1", customer_id=first, total_amount=100.0, status="pending", order_date=datetime(2025, 1, 10)),
+        Order(reference="ORD-2", customer_id=first, total_amount=300.0, status="pending", order_date=datetime(2025, 1, 20)),
+        Order(reference="ORD-3", customer_id=second, total_amount=50.0, status="delivered", order_date=datetime(2025, 2, 3)),
+        Order(reference="ORD-4", customer_id=second, total_amount=70.0, status="pending", order_date=datetime(2025, 3, 1)),
+    ])
+    session.add_all([
+        Invoice(reference="FAC-1", customer_id=first, amount=100.0, status="pending", date=datetime(2025, 1, 1), due_date=TODAY + timedelta(days=5)),
+        Invoice(reference="FAC-2", customer_id=first, amount=200.0, status="pending", date=datetime(2025, 1, 1), due_date=TODAY - timedelta(days=10)),
+        Invoice(reference="FAC-3", customer_id=second, amount=300.0, status="overdue", date=datetime(2025, 1, 1), due_date=TODAY - timedelta(days=45)),
+        Invoice(reference="FAC-4", customer_id=second, amount=400.0, status="overdue", date=datetime(2025, 1, 1), due_date=TODAY - timedelta(days=200)),
+        Invoice(reference="FAC-5", customer_id=second, amount=500.0, status="paid", date=datetime(2025, 1, 1)),
+    ])
+    session.commit()
+    session.close()
+    yield first, second
+    Base.metadata.drop_all(bind=engine)
+
+
+def run(client, query):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        body = client.post("/graphql", json={"query": query}).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert "errors" not in body, body
+    return body["data"], statements
+
+
+def test_order_stats_by_status_and_month_in_one_query(fake_cache):
+    query = '{ orderStats(groupBy: [STATUS, MONTH], from: "2025-01-01", to: "2025-03-01") { status month customerId count totalAmount averageAmount } }'
+
+    with TestClient(main.app) as client:
+        data, statements = run(client, query)
+
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+    assert data["orderStats"] == [
+        {"status": "delivered", "month": "2025-02", "customerId": None, "count": 1, "totalAmount": 50.0, "averageAmount": 50.0},
+        {"status": "pending", "month": "2025-01", "customerId": None, "count": 2, "totalAmount": 400.0, "averageAmount": 200.0},
+    ]
+
+
+def test_order_stats_without_group_by_returns_totals(fake_cache, seed):
+    first, second = seed
+    with TestClient(main.app) as client:
+        totals, _ = run(client, "{ orderStats { count totalAmount minAmount maxAmount } }")
+        by_customer, _ = run(client, "{ orderStats(groupBy: [CUSTOMER]) { customerId count } }")
+
+    assert totals["orderStats"] == [{"count": 4, "totalAmount": 520.0, "minAmount": 50.0, "maxAmount": 300.0}]
+    assert by_customer["orderStats"] == [{"customerId": first, "count": 2}, {"customerId": second, "count": 2}]
+
+
+def test_invoice_stats_by_due_bucket(fake_cache):
+    with TestClient(main.app) as client:
+        data, _ = run(client, "{ invoiceStats(groupBy: [DUE_BUCKET]) { dueBucket count totalAmount } }")
+
+    assert sorted((b["dueBucket"], b["count"], b["totalAmount"]) for b in data["invoiceStats"]) == [
+        ("1-30", 1, 200.0), ("31-60", 1, 300.0), ("90+", 1, 400.0), ("current", 1, 100.0), ("none", 1, 500.0)
+    ]
+
+
+def test_stats_are_cached_until_an_order_is_created(fake_cache, seed):
+    first, _ = seed
+    query = "{ orderStats(groupBy: [STATUS]) { status count } }"
+    mutation = f'mutation {{ createOrder(customerId: {first}, totalAmount: 10.0) {{ success }} }}'
+
+    with TestClient(main.app) as client:
+        before, _ = run(client, query)
+        cached, hit_statements = run(client, query)
+        client.post("/graphql", json={"query": mutation})
+        after, _ = run(client, query)
+
+    assert cached == before
+    # Los meses cerrados salen del cache: sólo se calcula el mes en curso
+    assert len(hit_statements) == 1
+    assert after["orderStats"] == [{"status": "delivered", "count": 1}, {"status": "pending", "count": 4}]
+
+
+def test_invalid_dates_are_reported():
+    with TestClient(main.app) as client:
+        body = client.post("/graphql", json={"query": '{ orderStats(from: "ayer") { count } }'}).json()
+
+    assert "Fecha inválida" in body["errors"][0]["message"]
+
+
+def test_closed_months_are_cached_one_by_one(fake_cache):
+    def query(date_from, date_to):
+        return f'{{ orderStats(from: "{date_from}", to: "{date_to}") {{ count totalAmount }} }}'
+
+    def cached_months():
+        return len([key for key in fake_cache.client.data if "order_stats:" in key])
+
+    with TestClient(main.app) as client:
+        january, statements = run(client, query("2025-01-01", "2025-02-01"))
+        assert len(statements) == 1 and cached_months() == 1
+        # Rango que se solapa: enero sale del cache y sólo se calculan febrero y marzo
+        quarter, statements = run(client, query("2025-01-01", "2025-04-01"))
+        assert len(statements) == 1 and cached_months() == 3
+        february, statements = run(client, query("2025-02-01", "2025-03-01"))
+        assert statements == []
+        # Trozo de mes al principio: se calcula, no se cachea
+        partial, statements = run(client, query("2025-01-15", "2025-03-01"))
+        assert len(statements) == 1 and cached_months() == 3
+
+    assert january["orderStats"] == [{"count": 2, "totalAmount": 400.0}]
+    assert quarter["orderStats"] == [{"count": 4, "totalAmount": 520.0}]
+    assert february["orderStats"] == [{"count": 1, "totalAmount": 50.0}]
+    assert partial["orderStats"] == [{"count": 2, "totalAmount": 350.0}]
+
+
+def test_ranges_are_split_in_utc_months():
+    now = datetime(2025, 6, 15, 10, tzinfo=timezone.utc)
+    june = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+    assert split_range(None, None, now) == ([DateRange(None, june, nulls=True)], [DateRange(june, None)])
+    closed, live = split_range(parse_date("2025-04-10", "from"), parse_date("2025-07-01", "to"), now)
+    assert [date_range.start.month for date_range in closed] == [5]
+    assert live == [
+        DateRange(datetime(2025, 4, 10, tzinfo=timezone.utc), datetime(2025, 5, 1, tzinfo=timezone.utc)),
+        DateRange(june, datetime(2025, 7, 1, tzinfo=timezone.utc)),
+    ]
+    # Las fechas con zona se pasan a UTC; las que no la tienen se toman como UTC
+    assert parse_date("2025-01-01T02:00:00+02:00", "from") == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert parse_date("2025-01-01", "from").tzinfo == timezone.utc